@@ -0,0 +1 @@
+"""Benchmarks of the store, view computation, rendering and audio hot paths."""
@@ -0,0 +1,123 @@
+# ruff: noqa: T201
+"""Run the benchmarks, save their results and compare them with a baseline.
+
+Results are written as JSON with ``--json``; a result file saved on the base
+branch is the baseline a later run is compared with by ``--compare``, which
+exits with 1 if any benchmark's median got slower than ``--threshold`` allows.
+Compare results from the same machine only.
+
+Run::
+
+    uv run python -m tests.benchmarks
+    uv run python -m tests.benchmarks -k view --rounds 30
+    uv run python -m tests.benchmarks --json baseline.json
+    uv run python -m tests.benchmarks --json current.json --compare baseline.json
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import traceback
+from pathlib import Path
+
+from tests.benchmarks import (  # noqa: F401
+    bench_audio,
+    bench_notifications,
+    bench_render,
+    bench_serialization,
+    bench_store,
+    bench_view,
+    bench_vosk,
+    bench_wake_words,
+)
+from tests.benchmarks.harness import (
+    BENCHMARKS,
+    REGRESSION_THRESHOLD,
+    ROUNDS,
+    compare,
+    load_medians,
+    run,
+    to_document,
+)
+
+
+def main() -> int:
+    """Run the selected benchmarks and return the exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-k',
+        dest='filter',
+        default='',
+        help='run only benchmarks whose id contains this',
+    )
+    parser.add_argument('--rounds', type=int, default=ROUNDS)
+    parser.add_argument('--json', type=Path, help='write the results here')
+    parser.add_argument('--compare', type=Path, help='baseline result file')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD)
+    arguments = parser.parse_args()
+
+    baseline = load_medians(arguments.compare) if arguments.compare else None
+    results = []
+    print(f'{"benchmark":<52} {"median µs":>12} {"± stddev":>10} {"rate":>18}')
+    for benchmark in BENCHMARKS:
+        if arguments.filter not in benchmark.id:
+            continue
+        result = run(benchmark, rounds=arguments.rounds)
+        results.append(result)
+        print(
+            f'{result.id:<52} {result.median_us:>12.1f}'
+            f' {result.stddev_us:>10.1f}'
+            f' {result.items_per_second:>12,.0f} {result.unit}/s'
+            + ('' if result.size_bytes is None else f' {result.size_bytes:>12,} B'),
+        )
+
+    if arguments.json:
+        arguments.json.write_text(json.dumps(to_document(results), indent=2) + '\n')
+
+    if baseline is None:
+        return 0
+    comparisons = compare(baseline, results)
+    regressions = [
+        comparison
+        for comparison in comparisons
+        if comparison.is_regression(arguments.threshold)
+    ]
+    print(f'\n{"benchmark":<52} {"baseline µs":>12} {"current µs":>12} {"ratio":>7}')
+    for comparison in comparisons:
+        flag = ' REGRESSION' if comparison in regressions else ''
+        print(
+            f'{comparison.id:<52} {comparison.baseline_us:>12.1f}'
+            f' {comparison.current_us:>12.1f} {comparison.ratio:>7.2f}{flag}',
+        )
+    if regressions:
+        print(
+            f'\n{len(regressions)} benchmark(s) slower than the baseline by more'
+            f' than {arguments.threshold:.0%}',
+        )
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    # The fixtures import the app's store module, which starts the scheduler
+    # and side effect threads of the app's own store; nothing here finishes
+    # that store, so every way out - `--help`, bad arguments, a failing
+    # benchmark, Ctrl-C - leaves without waiting for them.
+    code = 1
+    try:
+        code = main()
+    except SystemExit as exception:
+        if isinstance(exception.code, int) or exception.code is None:
+            code = exception.code or 0
+        else:
+            print(exception.code, file=sys.stderr)
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
@@ -0,0 +1,92 @@
+"""Conversion, gating and capture of microphone chunks for speech recognition."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.fixtures import (
+    AUDIO_CHANNELS,
+    AUDIO_CHUNK_FRAMES,
+    AUDIO_RATE,
+    audio_chunk,
+)
+from tests.benchmarks.harness import benchmark
+from tests.service_loader import SERVICES_ROOT, load_service_modules
+from ubo_app.constants import (
+    SPEECH_RECOGNITION_FRAME_RATE,
+    SPEECH_RECOGNITION_SAMPLE_WIDTH,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Lengths of the utterance a chunk is appended to, in seconds.
+UTTERANCE_SECONDS = (1, 10, 60, 120)
+_RECOGNITION_CHUNK = bytes(
+    SPEECH_RECOGNITION_FRAME_RATE // 20 * SPEECH_RECOGNITION_SAMPLE_WIDTH,
+)
+
+
+@benchmark('audio', items=AUDIO_CHUNK_FRAMES, unit='frame')
+def bench_downmix_and_resample() -> Callable[[], object]:
+    """Downmix and resample a 50 ms stereo chunk, as `AudioManager` does."""
+    (sample_conversion,) = load_service_modules(
+        SERVICES_ROOT / '000-audio',
+        'sample_conversion',
+    )
+    chunk = audio_chunk()
+    return lambda: sample_conversion.to_speech_recognition_sample(
+        chunk,
+        channels=AUDIO_CHANNELS,
+        rate=AUDIO_RATE,
+    )
+
+
+@benchmark('audio', items=SPEECH_RECOGNITION_FRAME_RATE // 20, unit='frame')
+def bench_voice_activity_gate() -> Callable[[], object]:
+    """Pass a 50 ms recognition chunk through the voice-activity gate."""
+    (sample_conversion,) = load_service_modules(
+        SERVICES_ROOT / '000-audio',
+        'sample_conversion',
+    )
+    (voice_activity,) = load_service_modules(
+        SERVICES_ROOT / '090-speech-recognition',
+        'voice_activity',
+    )
+    chunk = sample_conversion.to_speech_recognition_sample(
+        audio_chunk(),
+        channels=AUDIO_CHANNELS,
+        rate=AUDIO_RATE,
+    )
+    gate = voice_activity.VoiceActivityGate()
+    return lambda: gate.update(chunk)
+
+
+def _append_to_utterance(seconds: int) -> Callable[[], object]:
+    """Append a 50 ms chunk to an utterance `seconds` long, trimming its start."""
+    (utterance_buffer,) = load_service_modules(
+        SERVICES_ROOT / '090-speech-recognition',
+        'utterance_buffer',
+    )
+    buffer = utterance_buffer.UtteranceBuffer(max_seconds=seconds)
+    for _ in range(seconds * 20):
+        buffer.append(_RECOGNITION_CHUNK)
+    return lambda: buffer.append(_RECOGNITION_CHUNK)
+
+
+def _concatenate_to_utterance(seconds: int) -> Callable[[], object]:
+    """Append the same chunk by concatenating `bytes`, as recognitions did."""
+    audio = bytes(
+        seconds * SPEECH_RECOGNITION_FRAME_RATE * SPEECH_RECOGNITION_SAMPLE_WIDTH,
+    )
+    return lambda: audio + _RECOGNITION_CHUNK
+
+
+for _seconds in UTTERANCE_SECONDS:
+    benchmark('audio', name=f'utterance_append_{_seconds}s')(
+        functools.partial(_append_to_utterance, _seconds),
+    )
+    benchmark('audio', name=f'utterance_concatenate_{_seconds}s')(
+        functools.partial(_concatenate_to_utterance, _seconds),
+    )
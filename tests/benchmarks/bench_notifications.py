@@ -0,0 +1,66 @@
+"""The notifications reducer with many pending notifications.
+
+Each operation is timed with 10 to 500 pending notifications: notifications
+are kept by id in a persistent map with their aggregates maintained, so what an
+add, a progress report or a clear costs should not grow with how many are
+pending.
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.fixtures import NOTIFICATIONS, notifications, service_reducers
+from tests.benchmarks.harness import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PENDING = (10, 100, NOTIFICATIONS, 500)
+
+
+def _add(count: int) -> Callable[[], object]:
+    """Add a notification in front of `count` pending ones."""
+    from ubo_app.store.services.notifications import (
+        Notification,
+        NotificationsAddAction,
+    )
+
+    reducer = service_reducers()['notifications']
+    state = notifications(count)
+    action = NotificationsAddAction(
+        notification=Notification(id='new', title='New', content='Arrived'),
+    )
+    return lambda: reducer(state, action)
+
+
+def _report_progress(count: int) -> Callable[[], object]:
+    """Replace the progress of the notification in the middle of `count`."""
+    from ubo_app.store.services.notifications import NotificationsAddAction
+
+    reducer = service_reducers()['notifications']
+    state = notifications(count)
+    # Every fifth notification reports progress; this one is halfway down.
+    middle = state.notifications[f'notification-{count // 2 // 5 * 5}']
+    action = NotificationsAddAction(notification=replace(middle, progress=0.75))
+    return lambda: reducer(state, action)
+
+
+def _clear_by_id(count: int) -> Callable[[], object]:
+    """Clear the notification in the middle of `count` by its id."""
+    from ubo_app.store.services.notifications import NotificationsClearByIdAction
+
+    reducer = service_reducers()['notifications']
+    state = notifications(count)
+    action = NotificationsClearByIdAction(id=f'notification-{count // 2}')
+    return lambda: reducer(state, action)
+
+
+for _count in PENDING:
+    for _setup in (_add, _report_progress, _clear_by_id):
+        benchmark(
+            'notifications',
+            name=f'{_setup.__name__.lstrip("_")}_{_count}',
+        )(functools.partial(_setup, _count))
@@ -0,0 +1,47 @@
+"""Conversion of rendered frames for the display and for frame streams."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from tests.benchmarks.harness import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+WIDTH = HEIGHT = 240
+
+
+def _frame() -> np.ndarray:
+    return np.random.default_rng(0).integers(
+        0,
+        256,
+        (HEIGHT, WIDTH, 3),
+        dtype=np.uint8,
+    )
+
+
+@benchmark('render', items=WIDTH * HEIGHT, unit='pixel')
+def bench_rgb565() -> Callable[[], object]:
+    """Pack a full screen for the display, as `render_on_display` does."""
+    from ubo_app.display import rgb565_bytes
+
+    frame = _frame()
+    return lambda: rgb565_bytes(frame)
+
+
+@benchmark('render', items=WIDTH * HEIGHT, unit='pixel')
+def bench_frame_stream_chunks() -> Callable[[], object]:
+    """Downsample and chunk a full screen for a low-resolution frame stream."""
+    from ubo_app.utils.frame_stream import low_res_chunk_events
+
+    data = _frame().tobytes()
+    return lambda: low_res_chunk_events(
+        'bench',
+        data,
+        WIDTH,
+        HEIGHT,
+        force=True,
+    )
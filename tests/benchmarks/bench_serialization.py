@@ -0,0 +1,128 @@
+"""Saving and loading the persistent store and recordings."""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import TYPE_CHECKING, Any
+
+import dill
+
+from tests.benchmarks.bench_store import _batch
+from tests.benchmarks.fixtures import service_store
+from tests.benchmarks.harness import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ubo_app.store.main import UboStore
+
+# Slices that services persist, or that the state snapshot saves.
+PERSISTED_SLICES = (
+    'assistant',
+    'audio',
+    'ip',
+    'settings',
+    'speech_synthesis',
+    'ssh',
+    'users',
+    'wifi',
+)
+RECORDING_ACTIONS = 1000
+
+
+def _persisted(store: UboStore) -> dict[str, Any]:
+    state = store._state  # noqa: SLF001
+    return {key: getattr(state, key) for key in PERSISTED_SLICES}
+
+
+def _recording() -> list[object]:
+    # Without the audio samples, which are rarely recorded and would make the
+    # benchmark one of base64 encoding.
+    batch = [
+        action
+        for action in _batch()
+        if type(action).__name__ != 'AudioReportSampleAction'
+    ]
+    return [batch[index % len(batch)] for index in range(RECORDING_ACTIONS)]
+
+
+def _with_dill_tags(data: Any) -> Any:  # noqa: ANN401
+    """Return `data` tagged the way files were before type tags."""
+    from ubo_app.utils.serializer import resolve_type_tag
+
+    if isinstance(data, list):
+        return [_with_dill_tags(item) for item in data]
+    if isinstance(data, dict):
+        tagged = {key: _with_dill_tags(value) for key, value in data.items()}
+        if isinstance(tag := data.get('_type'), str) and tag not in ('bytes', 'set'):
+            tagged['_type'] = base64.b64encode(
+                dill.dumps(resolve_type_tag(tag)),
+            ).decode('utf-8')
+        return tagged
+    return data
+
+
+def _save(value: object) -> Callable[[], str]:
+    from ubo_app.store.main import UboStore
+
+    return lambda: json.dumps(UboStore.serialize_value(value), indent=2)
+
+
+def _load(store: UboStore, text: str) -> Callable[[], object]:
+    return lambda: store.load_object(json.loads(text))
+
+
+def _load_by_key(store: UboStore, text: str) -> Callable[[], object]:
+    # The persistent store's keys are read one by one, each a separate object.
+    return lambda: {
+        key: store.load_object(value) for key, value in json.loads(text).items()
+    }
+
+
+@benchmark('serialization')
+def bench_save_persistent_store() -> tuple[Callable[[], object], int]:
+    """Serialize the slices services persist, as the persistent store does."""
+    save = _save(_persisted(service_store()))
+    return save, len(save())
+
+
+@benchmark('serialization')
+def bench_load_persistent_store() -> tuple[Callable[[], object], int]:
+    """Load the persisted slices back."""
+    store = service_store()
+    text = _save(_persisted(store))()
+    return _load_by_key(store, text), len(text)
+
+
+@benchmark('serialization')
+def bench_load_persistent_store_with_dill_tags() -> tuple[Callable[[], object], int]:
+    """Load the persisted slices from a file written before type tags."""
+    store = service_store()
+    text = json.dumps(_with_dill_tags(json.loads(_save(_persisted(store))())), indent=2)
+    return _load_by_key(store, text), len(text)
+
+
+@benchmark('serialization', items=RECORDING_ACTIONS, unit='action')
+def bench_save_recording() -> tuple[Callable[[], object], int]:
+    """Serialize a recording of `RECORDING_ACTIONS` actions."""
+    save = _save(_recording())
+    return save, len(save())
+
+
+@benchmark('serialization', items=RECORDING_ACTIONS, unit='action')
+def bench_load_recording() -> tuple[Callable[[], object], int]:
+    """Load a recording of `RECORDING_ACTIONS` actions back, as replaying does."""
+    from ubo_app.store.main import store
+
+    text = _save(_recording())()
+    return _load(store, text), len(text)
+
+
+@benchmark('serialization', items=RECORDING_ACTIONS, unit='action')
+def bench_load_recording_with_dill_tags() -> tuple[Callable[[], object], int]:
+    """Load a recording written before type tags."""
+    from ubo_app.store.main import store
+
+    text = json.dumps(_with_dill_tags(json.loads(_save(_recording())())), indent=2)
+    return _load(store, text), len(text)
@@ -0,0 +1,98 @@
+"""Dispatch throughput of a store with every service's reducer."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.fixtures import (
+    AUDIO_CHANNELS,
+    AUDIO_RATE,
+    audio_chunk,
+    service_store,
+)
+from tests.benchmarks.harness import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BATCH = 100
+AUTORUNS = 200
+
+
+def _batch() -> list[object]:
+    """Return a batch of what services report most, none of it accumulating."""
+    from ubo_app.store.services.audio import AudioReportSampleAction, AudioSample
+    from ubo_app.store.services.notifications import (
+        Notification,
+        NotificationsAddAction,
+    )
+    from ubo_app.store.services.sensors import Sensor, SensorsReportReadingAction
+    from ubo_app.store.services.system import SystemMetricsUpdateAction
+    from ubo_app.store.status_icons.types import StatusIconsRegisterAction
+
+    chunk = audio_chunk()
+    batch: list[object] = []
+    for index in range(BATCH // 5):
+        batch += [
+            AudioReportSampleAction(
+                timestamp=time.time(),
+                sample_speech_recognition=chunk[: len(chunk) // 6],
+                sample=AudioSample(
+                    data=chunk,
+                    channels=AUDIO_CHANNELS,
+                    rate=AUDIO_RATE,
+                    width=2,
+                ),
+            ),
+            SensorsReportReadingAction(
+                sensor=Sensor.TEMPERATURE,
+                reading=20 + index / 10,
+                timestamp=time.time(),
+            ),
+            SystemMetricsUpdateAction(cpu_percent=index, ram_percent=50),
+            StatusIconsRegisterAction(id='bench', icon='󰖩', service='bench'),
+            NotificationsAddAction(
+                notification=Notification(
+                    id='bench',
+                    title='Benchmark',
+                    content=f'Step {index}',
+                    progress=index / BATCH,
+                ),
+            ),
+        ]
+    return batch
+
+
+def _dispatch_batch(*, autoruns: int) -> Callable[[], object]:
+    from redux import AutorunOptions
+
+    store = service_store()
+    state = store._state  # noqa: SLF001
+    slices = [name for name in vars(state) if name != 'combine_reducers_id']
+    # The store's options leave `autorun_class` at redux's synchronous one, so
+    # reactions are timed with the dispatch rather than left to threads.
+    for index in range(autoruns):
+        key = slices[index % len(slices)]
+        store.autorun(
+            lambda state, key=key: getattr(state, key),
+            options=AutorunOptions(initial_call=False),
+        )(lambda value: value)
+    batch = _batch()
+
+    def dispatch_batch() -> None:
+        store.dispatch(*batch)
+
+    return dispatch_batch
+
+
+@benchmark('store', items=BATCH, unit='action')
+def bench_dispatch() -> Callable[[], object]:
+    """Reduce a batch of reports through every reducer and middleware."""
+    return _dispatch_batch(autoruns=0)
+
+
+@benchmark('store', items=BATCH, unit='action')
+def bench_dispatch_with_autoruns() -> Callable[[], object]:
+    """Reduce the same batch with `AUTORUNS` autoruns selecting state slices."""
+    return _dispatch_batch(autoruns=AUTORUNS)
@@ -0,0 +1,81 @@
+"""View and status bar computation on a busy state."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.fixtures import NOTIFICATIONS, busy_state, service_store
+from tests.benchmarks.harness import benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ubo_app.store.main import RootState
+
+
+def _state() -> RootState:
+    return busy_state(service_store())
+
+
+@benchmark('view')
+def bench_home() -> Callable[[], object]:
+    """Compute the home menu with a full notification list and menus loaded."""
+    from ubo_app.store.core.view_computation import compute_view_from_root_state
+
+    state = _state()
+    state = replace(state, main=replace(state.main, stack=state.main.stack[:1]))
+    return lambda: compute_view_from_root_state(state)
+
+
+@benchmark('view')
+def bench_deep_menu() -> Callable[[], object]:
+    """Compute a dynamic menu three levels deep."""
+    from ubo_app.store.core.view_computation import compute_view_from_root_state
+
+    state = _state()
+    return lambda: compute_view_from_root_state(state)
+
+
+@benchmark('view')
+def bench_notification_on_top() -> Callable[[], object]:
+    """Compute a notification pushed over the deep menu."""
+    from ubo_app.store.core.types import NotificationStackItem
+    from ubo_app.store.core.view_computation import compute_view_from_root_state
+    from ubo_app.store.services.notifications import NotificationDisplayType
+
+    state = _state()
+    notification = replace(
+        state.notifications.notifications[f'notification-{NOTIFICATIONS - 1}'],
+        display_type=NotificationDisplayType.STICKY,
+    )
+    state = replace(
+        state,
+        main=replace(
+            state.main,
+            stack=(
+                *state.main.stack,
+                NotificationStackItem(
+                    id='bench-3',
+                    notification_id=notification.id,
+                ),
+            ),
+        ),
+        notifications=replace(
+            state.notifications,
+            notifications=state.notifications.notifications.set(
+                notification.id,
+                notification,
+            ),
+        ),
+    )
+    return lambda: compute_view_from_root_state(state)
+
+
+@benchmark('view')
+def bench_status_bar() -> Callable[[], object]:
+    """Compute the status bar with a dozen icons and pending notifications."""
+    from ubo_app.store.core.view_computation import compute_status_bar_data
+
+    state = _state()
+    return lambda: compute_status_bar_data(state)
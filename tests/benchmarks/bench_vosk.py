@@ -0,0 +1,82 @@
+"""Vosk's switch from wake phrases to free speech, up to its first partial result.
+
+A wake word switches the recognition loop's grammar, and the next chunk's
+partial result is the first the user sees of the command. Timed with the
+recognizers kept warm per grammar, as the loop does, and with a recognizer
+built for the switch, as it did before. Needs `vosk` and the default model,
+which a device downloads, and is only timed where they are installed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.fixtures import AUDIO_CHANNELS, AUDIO_RATE, audio_chunk
+from tests.benchmarks.harness import benchmark
+from tests.service_loader import SERVICES_ROOT, load_service_modules
+from ubo_app.engines.vosk_catalog import DEFAULT_VOSK_MODEL_ID, model_path_for
+from ubo_app.engines.vosk_recognizers import RecognizerPool, make_recognizer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from vosk import Model
+
+WAKE_PHRASES = ('okay ubo', 'hey ubo', '[unk]')
+
+
+def _model() -> Model:
+    from vosk import Model, SetLogLevel
+
+    SetLogLevel(-1)
+    return Model(model_path=Path(str(model_path_for(DEFAULT_VOSK_MODEL_ID))).as_posix())
+
+
+def _chunk() -> bytes:
+    (sample_conversion,) = load_service_modules(
+        SERVICES_ROOT / '000-audio',
+        'sample_conversion',
+    )
+    return sample_conversion.to_speech_recognition_sample(
+        audio_chunk(),
+        channels=AUDIO_CHANNELS,
+        rate=AUDIO_RATE,
+    )
+
+
+def bench_wake_to_first_partial() -> Callable[[], object]:
+    """Hear a chunk for the wake phrases, then one of free speech."""
+    recognizers = RecognizerPool(_model())
+    recognizers.prepare(WAKE_PHRASES, ())
+    chunk = _chunk()
+
+    def wake_to_first_partial() -> object:
+        recognizers.accept(WAKE_PHRASES, chunk)
+        return recognizers.accept((), chunk)
+
+    return wake_to_first_partial
+
+
+def bench_wake_to_first_partial_rebuilt() -> Callable[[], object]:
+    """Do the same, building the free-speech recognizer on the switch."""
+    model = _model()
+    wake = make_recognizer(model, WAKE_PHRASES)
+    chunk = _chunk()
+
+    def wake_to_first_partial() -> object:
+        wake.AcceptWaveform(chunk)
+        speech = make_recognizer(model, ())
+        speech.AcceptWaveform(chunk)
+        return speech.PartialResult()
+
+    return wake_to_first_partial
+
+
+if (
+    importlib.util.find_spec('vosk') is not None
+    and Path(str(model_path_for(DEFAULT_VOSK_MODEL_ID))).exists()
+):
+    benchmark('vosk')(bench_wake_to_first_partial)
+    benchmark('vosk')(bench_wake_to_first_partial_rebuilt)
@@ -0,0 +1,103 @@
+"""Wake-word detection with 1, 3 and 6 active wake phrases.
+
+Every model reads the features of a shared front end, so each active phrase
+should add only the cost of its classifier head. microWakeWord runs on the
+models `pymicro_wakeword` bundles; openWakeWord needs the feature models and
+wake-word models a device downloads, and is only timed where they are on disk.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import io
+import itertools
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from tests.benchmarks.harness import benchmark
+from tests.service_loader import SERVICES_ROOT, load_service_modules
+from ubo_app.constants import DATA_PATH, SPEECH_RECOGNITION_FRAME_RATE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PHRASES = (1, 3, 6)
+MICROWAKEWORD_CHUNK_FRAMES = SPEECH_RECOGNITION_FRAME_RATE // 20
+OPENWAKEWORD_CHUNK_FRAMES = 1280
+
+
+def _speech_chunk(frames: int) -> bytes:
+    """Voice-like noise at -30 dBFS, so models past their VAD gate run too."""
+    generator = np.random.default_rng(0)
+    samples = generator.normal(0, 32768 * 10 ** (-30 / 20), frames)
+    return samples.astype(np.int16).tobytes()
+
+
+def _microwakeword(phrases: int) -> Callable[[], object]:
+    """Feed a 50 ms chunk to the shared frontend and `phrases` models."""
+    from pymicro_wakeword import MicroWakeWord, Model
+
+    (wake_features,) = load_service_modules(
+        SERVICES_ROOT / '090-speech-recognition',
+        'wake_features',
+    )
+    front_end = wake_features.MicroWakeWordFrontEnd()
+    # Loading a model prints its config.
+    with contextlib.redirect_stdout(io.StringIO()):
+        models = [
+            MicroWakeWord.from_builtin(model)
+            for model in itertools.islice(itertools.cycle(Model), phrases)
+        ]
+    chunk = _speech_chunk(MICROWAKEWORD_CHUNK_FRAMES)
+
+    def detect() -> None:
+        for index in front_end.push(chunk):
+            frame = front_end.frame(index)
+            for model in models:
+                model.process_streaming(frame)
+
+    return detect
+
+
+def _openwakeword(phrases: int) -> Callable[[], object]:
+    """Feed an 80 ms frame to the shared front end and `phrases` heads."""
+    (openwakeword_engine,) = load_service_modules(
+        SERVICES_ROOT / '090-speech-recognition',
+        'openwakeword_engine',
+    )
+    front_end = openwakeword_engine._load_front_end()  # noqa: SLF001
+    heads = [
+        openwakeword_engine._load_head(stem)  # noqa: SLF001
+        for stem in itertools.islice(
+            itertools.cycle(openwakeword_engine.scan_models()),
+            phrases,
+        )
+    ]
+    audio = np.frombuffer(_speech_chunk(OPENWAKEWORD_CHUNK_FRAMES), dtype=np.int16)
+
+    def detect() -> None:
+        for index in front_end.push(audio):
+            for head in heads:
+                head.score(front_end.embeddings, index)
+
+    return detect
+
+
+_OPENWAKEWORD_MODELS = DATA_PATH / 'openwakeword' / 'models'
+
+for _phrases in PHRASES:
+    benchmark(
+        'wake_words',
+        name=f'microwakeword_{_phrases}',
+        items=MICROWAKEWORD_CHUNK_FRAMES,
+        unit='frame',
+    )(functools.partial(_microwakeword, _phrases))
+    if (_OPENWAKEWORD_MODELS / 'melspectrogram.onnx').exists():
+        benchmark(
+            'wake_words',
+            name=f'openwakeword_{_phrases}',
+            items=OPENWAKEWORD_CHUNK_FRAMES,
+            unit='frame',
+        )(functools.partial(_openwakeword, _phrases))
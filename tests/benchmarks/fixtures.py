@@ -0,0 +1,206 @@
+"""Realistic inputs for the benchmarks: a store with every service's reducer.
+
+The store is a `UboStore` of its own, not the app's: it has the same reducers
+and middlewares, but runs synchronously in the calling thread, so a dispatch
+returns once every action it led to is reduced and the time measured is the
+store's alone.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from tests.service_loader import SERVICES_ROOT, load_service_modules
+
+if TYPE_CHECKING:
+    from redux import ReducerType
+
+    from ubo_app.store.main import RootState, UboStore
+    from ubo_app.store.services.notifications import NotificationsState
+
+_SERVICE_ID = re.compile(r"service_id='(\w+)'")
+
+MENUS = 60
+MENU_ITEMS = 24
+NOTIFICATIONS = 200
+STATUS_ICONS = 12
+# What the microphone hands the audio service every 50 ms.
+AUDIO_RATE = 48_000
+AUDIO_CHANNELS = 2
+AUDIO_CHUNK_FRAMES = AUDIO_RATE // 20
+
+
+@functools.cache
+def service_reducers() -> dict[str, ReducerType]:
+    """Return the reducer of every service that has one, by service id."""
+    reducers: dict[str, ReducerType] = {}
+    for directory in sorted(SERVICES_ROOT.iterdir()):
+        if not (directory / 'reducer.py').is_file():
+            continue
+        match = _SERVICE_ID.search((directory / 'ubo_handle.py').read_text())
+        if match is None:
+            continue
+        (module,) = load_service_modules(directory, 'reducer')
+        reducers[match.group(1)] = module.reducer
+    return reducers
+
+
+def service_store() -> UboStore:
+    """Return a store with the core's and every service's reducer, initialized."""
+    from redux import InitAction, StoreOptions, combine_reducers
+
+    from ubo_app.store.core.dynamic_menus_reducer import (
+        reducer as dynamic_menus_reducer,
+    )
+    from ubo_app.store.core.reducer import reducer as main_reducer
+    from ubo_app.store.input.reducer import reducer as input_reducer
+    from ubo_app.store.main import (
+        RootState,
+        UboAction,
+        UboEvent,
+        UboStore,
+        action_middleware,
+        event_middleware,
+    )
+    from ubo_app.store.settings.reducer import reducer as settings_reducer
+    from ubo_app.store.status_icons.reducer import reducer as status_icons_reducer
+    from ubo_app.store.update_manager.reducer import (
+        reducer as update_manager_reducer,
+    )
+
+    reducer, _ = combine_reducers(
+        state_type=RootState,
+        action_type=UboAction,  # pyright: ignore [reportArgumentType]
+        event_type=UboEvent,  # pyright: ignore [reportArgumentType]
+        main=main_reducer,
+        settings=settings_reducer,
+        status_icons=status_icons_reducer,
+        update_manager=update_manager_reducer,
+        dynamic_menus=dynamic_menus_reducer,
+        input=input_reducer,
+        **service_reducers(),
+    )
+    store = UboStore(
+        reducer,
+        StoreOptions(
+            side_effect_threads=0,
+            action_middlewares=[action_middleware],
+            event_middlewares=[event_middleware],
+        ),
+    )
+    store.dispatch(InitAction())
+    return store
+
+
+def audio_chunk() -> bytes:
+    """Return 50 ms of stereo speech-like noise as the microphone reports it."""
+    generator = np.random.default_rng(0)
+    return (
+        generator.normal(0, 3000, AUDIO_CHUNK_FRAMES * AUDIO_CHANNELS)
+        .clip(-32768, 32767)
+        .astype(np.int16)
+        .tobytes()
+    )
+
+
+def notifications(count: int = NOTIFICATIONS) -> NotificationsState:
+    """Return `count` pending notifications, every fifth one reporting progress."""
+    from ubo_app.store.services.notifications import (
+        Importance,
+        Notification,
+        NotificationDisplayType,
+        NotificationsState,
+    )
+    from ubo_app.utils.persistent_map import PersistentMap
+
+    pending = {
+        f'notification-{index}': Notification(
+            id=f'notification-{index}',
+            title=f'Notification {index}',
+            content='Something happened that the user may want to know about.',
+            importance=list(Importance)[index % len(Importance)],
+            display_type=NotificationDisplayType.BACKGROUND,
+            progress=index / count if index % 5 == 0 else None,
+            timestamp=1_700_000_000 + index,
+        )
+        for index in range(count)
+    }
+    progress = {
+        id: notification.progress
+        for id, notification in pending.items()
+        if notification.progress is not None
+    }
+    return NotificationsState(
+        notifications=PersistentMap(pending),
+        unread_count=len(pending),
+        progress=sum(progress.values()),
+        progress_ids=tuple(progress),
+    )
+
+
+def busy_state(store: UboStore) -> RootState:
+    """Return the store's state with large menus, notifications and icons.
+
+    The stack is three menus deep, on the last of `MENUS` dynamic menus.
+    """
+    from ubo_app.store.core.stack_ops import create_root_stack_item
+    from ubo_app.store.core.types import (
+        DynamicMenuData,
+        MenuItemData,
+        MenuStackItem,
+    )
+    from ubo_app.store.status_icons.types import IconState
+
+    state = store._state  # noqa: SLF001
+    assert state is not None
+    menus = {
+        f'bench:menu-{menu}': DynamicMenuData(
+            menu_id=f'bench:menu-{menu}',
+            title=f'Menu {menu}',
+            heading='Heading' if menu % 2 else None,
+            items=tuple(
+                MenuItemData(
+                    key=f'item-{item}',
+                    label=f'Item {item}',
+                    icon='󰖩',
+                    action_id=f'bench:action-{menu}-{item}',
+                )
+                for item in range(MENU_ITEMS)
+            ),
+        )
+        for menu in range(MENUS)
+    }
+    return replace(
+        state,
+        main=replace(
+            state.main,
+            stack=(
+                *create_root_stack_item(),
+                MenuStackItem(id='bench-1', menu_key='main'),
+                MenuStackItem(id='bench-2', menu_key=f'bench:menu-{MENUS - 1}'),
+            ),
+        ),
+        dynamic_menus=replace(
+            state.dynamic_menus,
+            menus={**state.dynamic_menus.menus, **menus},
+        ),
+        notifications=notifications(),
+        status_icons=replace(
+            state.status_icons,
+            icons=[
+                IconState(
+                    id=f'icon-{index}',
+                    symbol='󰖩',
+                    color='white',
+                    priority=index,
+                    service_id='bench',
+                )
+                for index in range(STATUS_ICONS)
+            ],
+        ),
+    )
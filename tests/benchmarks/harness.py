@@ -0,0 +1,210 @@
+"""Timing, result files and baseline comparison for the benchmark suite.
+
+A benchmark is a setup function registered with `benchmark`: it builds its
+fixtures and returns the function to time, or, for benchmarks of encodings,
+that function and the size in bytes of what it encodes to. The function runs
+in rounds, each long enough (`MIN_ROUND_TIME`) for the clock to resolve it; the
+median of the rounds is what results are compared by, as it shrugs off the odd
+round the machine was busy for.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    Setup = Callable[[], Callable[[], object] | tuple[Callable[[], object], int]]
+
+# Bump when the result file changes shape.
+RESULTS_VERSION = 1
+ROUNDS = 15
+WARMUP_ROUNDS = 2
+MIN_ROUND_TIME = 0.02
+# A benchmark whose median grew by more than this fraction is a regression.
+REGRESSION_THRESHOLD = 0.2
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A registered benchmark; `items` is the work one call does, for rates."""
+
+    group: str
+    name: str
+    setup: Setup
+    items: int = 1
+    unit: str = 'call'
+
+    @property
+    def id(self) -> str:
+        """Return the name results are stored and compared under."""
+        return f'{self.group}/{self.name}'
+
+
+@dataclass(frozen=True)
+class Result:
+    """Per-call timings of one benchmark, in microseconds."""
+
+    id: str
+    rounds: int
+    iterations: int
+    min_us: float
+    median_us: float
+    mean_us: float
+    stddev_us: float
+    items: int
+    unit: str
+    size_bytes: int | None = None
+
+    @property
+    def items_per_second(self) -> float:
+        """Return how many `unit`s a second the median call gets through."""
+        return self.items / self.median_us * 1_000_000 if self.median_us else 0.0
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """One benchmark's median against the baseline's."""
+
+    id: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def ratio(self) -> float:
+        """Return the current median over the baseline one."""
+        return self.current_us / self.baseline_us
+
+    def is_regression(self, threshold: float) -> bool:
+        """Return whether the benchmark got slower by more than `threshold`."""
+        return self.ratio > 1 + threshold
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(
+    group: str,
+    *,
+    name: str | None = None,
+    items: int = 1,
+    unit: str = 'call',
+) -> Callable[[Setup], Setup]:
+    """Register the decorated setup function as a benchmark of `group`."""
+
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS.append(
+            Benchmark(
+                group=group,
+                name=name or setup.__name__.removeprefix('bench_'),
+                setup=setup,
+                items=items,
+                unit=unit,
+            ),
+        )
+        return setup
+
+    return decorator
+
+
+def _calibrate(function: Callable[[], object]) -> int:
+    iterations = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        if time.perf_counter() - start >= MIN_ROUND_TIME:
+            return iterations
+        iterations *= 2
+
+
+def run(benchmark: Benchmark, *, rounds: int = ROUNDS) -> Result:
+    """Time `benchmark` over `rounds` rounds."""
+    fixture = benchmark.setup()
+    function, size_bytes = fixture if isinstance(fixture, tuple) else (fixture, None)
+    iterations = _calibrate(function)
+    timings: list[float] = []
+    gc.collect()
+    for round_ in range(WARMUP_ROUNDS + rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        elapsed = (time.perf_counter() - start) / iterations * 1_000_000
+        if round_ >= WARMUP_ROUNDS:
+            timings.append(elapsed)
+    return Result(
+        id=benchmark.id,
+        rounds=rounds,
+        iterations=iterations,
+        min_us=min(timings),
+        median_us=statistics.median(timings),
+        mean_us=statistics.fmean(timings),
+        stddev_us=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        items=benchmark.items,
+        unit=benchmark.unit,
+        size_bytes=size_bytes,
+    )
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def to_document(results: Iterable[Result]) -> dict[str, Any]:
+    """Return `results` with what they were measured on, ready for JSON."""
+    return {
+        'version': RESULTS_VERSION,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': _commit(),
+        'machine': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+        },
+        'benchmarks': [asdict(result) for result in results],
+    }
+
+
+def load_medians(path: Path) -> dict[str, float]:
+    """Read the median of every benchmark in a result file."""
+    document = json.loads(path.read_text())
+    if document.get('version') != RESULTS_VERSION:
+        msg = f'{path} is not a version {RESULTS_VERSION} result file'
+        raise ValueError(msg)
+    return {entry['id']: entry['median_us'] for entry in document['benchmarks']}
+
+
+def compare(
+    baseline: dict[str, float],
+    results: Iterable[Result],
+) -> list[Comparison]:
+    """Pair every result with its baseline; benchmarks new since are left out."""
+    return [
+        Comparison(
+            id=result.id,
+            baseline_us=baseline[result.id],
+            current_us=result.median_us,
+        )
+        for result in results
+        if baseline.get(result.id)
+    ]
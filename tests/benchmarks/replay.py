@@ -0,0 +1,93 @@
+# ruff: noqa: T201
+"""Replay a recorded session against the app's store, headless, and report.
+
+Sessions are recorded on a device with ``UBO_SESSION_RECORDING=true``, see
+ubo_app/utils/session_recording.py. The replay runs on the app's own store,
+with every service's reducer registered and the view autoruns live but no
+service running, so what it measures is the store and the view computation:
+store throughput, autorun runs and the latency from a replayed action to the
+view update it leads to. ``--speed 0`` replays as fast as the store takes it.
+
+Run::
+
+    uv run python -m tests.benchmarks.replay session.ubosession
+    uv run python -m tests.benchmarks.replay session.ubosession --speed 0
+    uv run python -m tests.benchmarks.replay session.ubosession --json report.json
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import traceback
+from pathlib import Path
+
+
+def main() -> int:
+    """Replay the session and print its report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('session', type=Path)
+    parser.add_argument(
+        '--speed',
+        type=float,
+        default=1.0,
+        help='multiple of the recorded pace, 0 for as fast as possible',
+    )
+    parser.add_argument('--json', type=Path, help='write the report here')
+    arguments = parser.parse_args()
+
+    from redux import CombineReducerRegisterAction
+
+    from ubo_app.service import start_event_loop_thread, worker_thread
+
+    start_event_loop_thread(asyncio.new_event_loop())
+
+    from tests.benchmarks.fixtures import service_reducers
+    from ubo_app.store.core.menu_event_handlers import setup_menu_event_handlers
+    from ubo_app.store.core.view_computation import release_view_autorun
+    from ubo_app.store.main import root_reducer_id, store
+    from ubo_app.utils.session_recording import replay_session
+
+    for key, reducer in service_reducers().items():
+        store.dispatch(
+            CombineReducerRegisterAction(
+                combine_reducers_id=root_reducer_id,
+                key=key,
+                reducer=reducer,
+            ),
+        )
+    setup_menu_event_handlers()
+    release_view_autorun()
+
+    report = asyncio.run_coroutine_threadsafe(
+        replay_session(store, arguments.session, speed=arguments.speed or None),
+        worker_thread.loop,
+    ).result()
+    document = report.as_dict()
+    print(json.dumps(document, indent=2))
+    if arguments.json:
+        arguments.json.write_text(json.dumps(document, indent=2) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    # The app's store runs scheduler and side effect threads nothing here
+    # finishes, so every way out leaves without waiting for them.
+    code = 1
+    try:
+        code = main()
+    except SystemExit as exception:
+        if isinstance(exception.code, int) or exception.code is None:
+            code = exception.code or 0
+        else:
+            print(exception.code, file=sys.stderr)
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
@@ -0,0 +1,65 @@
+"""Tests for the benchmark harness's results and baseline comparison."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.benchmarks.harness import (
+    RESULTS_VERSION,
+    Benchmark,
+    compare,
+    load_medians,
+    run,
+    to_document,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_results_round_trip_and_regressions_are_flagged(tmp_path: Path) -> None:
+    """A saved run is a baseline; slower medians past the threshold regress."""
+    result = run(
+        Benchmark(group='test', name='sum', setup=lambda: lambda: sum(range(100))),
+        rounds=3,
+    )
+    assert result.id == 'test/sum'
+    assert result.rounds == 3
+    assert 0 < result.min_us <= result.median_us
+
+    path = tmp_path / 'baseline.json'
+    path.write_text(json.dumps(to_document([result])))
+    baseline = load_medians(path)
+    assert baseline == {'test/sum': result.median_us}
+
+    (same,) = compare(baseline, [result])
+    assert same.ratio == 1
+    assert not same.is_regression(0.2)
+
+    slower = {'test/sum': result.median_us / 1.5}
+    (comparison,) = compare(slower, [result])
+    assert comparison.is_regression(0.2)
+    assert not comparison.is_regression(0.6)
+    # Benchmarks the baseline does not have are not compared.
+    assert compare({}, [result]) == []
+
+
+def test_encoding_benchmarks_report_their_size() -> None:
+    """A setup returning a size along with its function records it."""
+    encoded = b'0' * 100
+    result = run(
+        Benchmark(group='test', name='copy', setup=lambda: (encoded.hex, 200)),
+        rounds=2,
+    )
+    assert result.size_bytes == 200
+
+
+def test_result_files_of_another_version_are_rejected(tmp_path: Path) -> None:
+    """Comparing against a file of another shape fails loudly."""
+    path = tmp_path / 'baseline.json'
+    path.write_text(json.dumps({'version': RESULTS_VERSION + 1, 'benchmarks': []}))
+    with pytest.raises(ValueError, match='result file'):
+        load_medians(path)
@@ -45,7 +45,7 @@ def _snapshot_selector(state: RootState) -> dict:
                     n.content.replace(TEST_DIR.as_posix(), '<TEST>'),
                 ),
             }
-            for n in state.notifications.notifications
+            for n in state.notifications.notifications.values()
         ]
     fs_state: FileSystemState | None = None
     if hasattr(state, 'file_system'):
@@ -249,7 +249,7 @@ async def test_move_copy_remove(  # noqa: C901
         state = store._state  # noqa: SLF001
         assert state is not None
         assert any(
-            n.title == 'Moved' for n in state.notifications.notifications
+            n.title == 'Moved' for n in state.notifications.notifications.values()
         )
 
     await check_move_done()
@@ -330,7 +330,7 @@ async def test_move_copy_remove(  # noqa: C901
         state = store._state  # noqa: SLF001
         assert state is not None
         assert any(
-            n.title == 'Copied' for n in state.notifications.notifications
+            n.title == 'Copied' for n in state.notifications.notifications.values()
         )
 
     await check_copy_done()
@@ -414,7 +414,7 @@ async def test_move_copy_remove(  # noqa: C901
         state = store._state  # noqa: SLF001
         assert state is not None
         assert any(
-            n.title == 'Removed' for n in state.notifications.notifications
+            n.title == 'Removed' for n in state.notifications.notifications.values()
         )
 
     await check_removed_notif()
@@ -53,7 +53,7 @@ def _notification_ids_on_stack(state: RootState) -> set[str]:
 
 
 def _notification_ids_in_list(state: RootState) -> list[str]:
-    return [n.id for n in state.notifications.notifications]
+    return list(state.notifications.notifications)
 
 
 def _normalize_notifications(state: RootState) -> dict[str, Any]:
@@ -0,0 +1,153 @@
+# ruff: noqa: T201
+r"""Benchmark gRPC-Web subscription latency: native gateway vs Envoy.
+
+A local fake client opens a ``SubscribeStore`` stream on
+``state.notifications.unread_count`` and then dispatches
+``NotificationsAddAction``s through the same endpoint, timing each dispatch
+until the subscription delivers the changed count. Point it at a running
+ubo-core once through the in-process gateway (``UBO_GRPC_WEB_NATIVE=1``, web-UI
+port) and once through Envoy to compare the two hops. With ``--pid`` it also
+reports the resident memory of the processes serving the endpoint (the core,
+and for the Envoy setup the envoy process as well).
+
+Run::
+
+    uv run python tests/grpc/bench_grpc_web.py --url http://localhost:4321/grpc
+    uv run python tests/grpc/bench_grpc_web.py --url http://localhost:50052/grpc \
+        --pid "$(pgrep -f ubo-core)" --pid "$(pgrep -x envoy)"
+
+Each dispatch leaves an unread notification behind; clear them from the
+notifications menu afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import struct
+import time
+from pathlib import Path
+
+import httpx
+from ubo_bindings.store.v1 import (
+    DispatchActionRequest,
+    SubscribeStoreRequest,
+    SubscribeStoreResponse,
+)
+from ubo_bindings.ubo.v1 import Action, Notification, NotificationsAddAction
+
+_HEADERS = {
+    'content-type': 'application/grpc-web+proto',
+    'accept': 'application/grpc-web+proto',
+    'x-grpc-web': '1',
+}
+_SERVICE = '/store.v1.StoreService'
+_HEADER_SIZE = 5
+
+
+def _frame(payload: bytes) -> bytes:
+    return struct.pack('>BI', 0, len(payload)) + payload
+
+
+def _rss_kib(pid: int) -> int:
+    for line in Path(f'/proc/{pid}/status').read_text().splitlines():
+        if line.startswith('VmRSS:'):
+            return int(line.split()[1])
+    return 0
+
+
+async def _subscribe(
+    http: httpx.AsyncClient,
+    url: str,
+    values: asyncio.Queue[tuple[float, bytes]],
+) -> None:
+    request = SubscribeStoreRequest(selectors=['state.notifications.unread_count'])
+    async with http.stream(
+        'POST',
+        f'{url}{_SERVICE}/SubscribeStore',
+        content=_frame(bytes(request)),
+        headers=_HEADERS,
+    ) as response:
+        response.raise_for_status()
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes():
+            buffer.extend(chunk)
+            while len(buffer) >= _HEADER_SIZE:
+                flag, length = struct.unpack('>BI', buffer[:_HEADER_SIZE])
+                if len(buffer) < _HEADER_SIZE + length:
+                    break
+                payload = bytes(buffer[_HEADER_SIZE : _HEADER_SIZE + length])
+                del buffer[: _HEADER_SIZE + length]
+                if flag & 0x80:
+                    return
+                message = SubscribeStoreResponse().parse(payload)
+                await values.put((time.perf_counter(), message.results[0].value))
+
+
+async def _dispatch(http: httpx.AsyncClient, url: str, index: int) -> None:
+    request = DispatchActionRequest(
+        action=Action(
+            notifications_add_action=NotificationsAddAction(
+                notification=Notification(
+                    id=f'bench-grpc-web-{index}',
+                    title='gRPC-Web benchmark',
+                    content=f'#{index}',
+                ),
+            ),
+        ),
+    )
+    response = await http.post(
+        f'{url}{_SERVICE}/DispatchAction',
+        content=_frame(bytes(request)),
+        headers=_HEADERS,
+    )
+    response.raise_for_status()
+
+
+async def _run(url: str, iterations: int, pids: list[int]) -> None:
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(connect=5.0, read=None, write=5.0, pool=5.0),
+    ) as http:
+        values: asyncio.Queue[tuple[float, bytes]] = asyncio.Queue()
+        subscription = asyncio.create_task(_subscribe(http, url, values))
+        # The initial snapshot arrives on subscribe; it is not a measurement.
+        await asyncio.wait_for(values.get(), timeout=10)
+
+        rss_before = {pid: _rss_kib(pid) for pid in pids}
+        latencies: list[float] = []
+        for index in range(iterations):
+            start = time.perf_counter()
+            await _dispatch(http, url, index)
+            delivered_at, _ = await asyncio.wait_for(values.get(), timeout=10)
+            latencies.append((delivered_at - start) * 1e3)
+        rss_after = {pid: _rss_kib(pid) for pid in pids}
+
+        subscription.cancel()
+
+    latencies.sort()
+    print(f'endpoint: {url}')
+    print(f'  iterations       {iterations:8d}')
+    print(f'  mean             {statistics.fmean(latencies):8.2f} ms')
+    print(f'  p50              {latencies[len(latencies) // 2]:8.2f} ms')
+    print(f'  p95              {latencies[int(len(latencies) * 0.95)]:8.2f} ms')
+    print(f'  max              {latencies[-1]:8.2f} ms')
+    for pid in pids:
+        print(
+            f'  rss pid {pid:<8d} {rss_before[pid]:8d} KiB -> {rss_after[pid]:8d} KiB',
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--url', required=True, help='gRPC-Web base URL')
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument(
+        '--pid',
+        type=int,
+        action='append',
+        default=[],
+        help='process whose RSS to report (repeatable)',
+    )
+    arguments = parser.parse_args()
+    asyncio.run(_run(arguments.url, arguments.iterations, arguments.pid))
@@ -0,0 +1,697 @@
+# ruff: noqa: T201
+r"""Load and soak a running core with many simulated gRPC and tcp-lite clients.
+
+Each simulated client holds the streams one kind of real client does (see
+`PROFILES`): web UIs, the Kivy GUI and the assistant over gRPC, ESP32 LVGL
+satellites over tcp-lite. Dispatchers meanwhile update a sticky notification
+of their own at ``--rate`` a second, so it is on screen and in the current
+view, its content carrying a marker with the dispatch's sequence number and
+time. Every subscriber looks
+for markers in what it receives, which gives the latency from dispatch to
+delivery on the store path (``subscribe_store``, latest-wins, so skipped
+updates are expected) and the event path (``subscribe_event``, where a skipped
+sequence number is an event the core dropped at ``SUBSCRIPTION_QUEUE_SIZE``).
+
+With ``--pid`` the core's CPU, resident memory, open files and threads are
+sampled, and a soak run (``--duration`` in hours rather than seconds, with
+``--reconnect-every`` to churn subscriptions) reports their trend after the
+warm-up; a growing resident set, or files and threads not given back once the
+clients left, is reported as a leak and exits with 1. ``--log`` counts the
+core's own "queue full" warnings in its log file over the run.
+
+Run::
+
+    uv run python tests/grpc/load.py --clients web=4,gui=1,lvgl=2,assistant=1
+    uv run python tests/grpc/load.py --dispatchers 4 --rate 50 --slow 2 \
+        --pid "$(pgrep -f ubo-core)" --log ubo-app.log
+    uv run python tests/grpc/load.py --duration 14400 --reconnect-every 600 \
+        --pid "$(pgrep -f ubo-core)" --json soak.json
+
+Dispatchers clear their notifications when the run ends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from grpclib.client import Channel
+from ubo_bindings.store.v1 import (
+    DispatchActionRequest,
+    StoreServiceStub,
+    SubscribeEventRequest,
+    SubscribeEventResponse,
+    SubscribeStoreRequest,
+    SubscribeStoreResponse,
+)
+from ubo_bindings.ubo.v1 import (
+    Action,
+    ApplicationScrollEvent,
+    AudioReportSampleEvent,
+    DisplayRenderEvent,
+    Event,
+    FrameStreamDataEvent,
+    MenuChooseByIndexEvent,
+    Notification,
+    NotificationDisplayType,
+    NotificationsAddAction,
+    NotificationsClearByIdAction,
+    NotificationsDisplayEvent,
+)
+
+from ubo_app.constants import GRPC_LISTEN_PORT, MCU_LISTEN_PORT
+from ubo_app.store.tracing import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Sequence
+
+    import betterproto
+
+# Terminated, since the protobuf tag after it may well be an ASCII digit.
+_MARKER = re.compile(rb'ubo-load:(\d+):(\d+):(\d+);')
+_EVENTS = {
+    'application_scroll_event': ApplicationScrollEvent,
+    'audio_report_sample_event': AudioReportSampleEvent,
+    'display_render_event': DisplayRenderEvent,
+    'frame_stream_data_event': FrameStreamDataEvent,
+    'menu_choose_by_index_event': MenuChooseByIndexEvent,
+    'notifications_display_event': NotificationsDisplayEvent,
+}
+_QUEUE_FULL = 'Subscription event queue full'
+_CLOCK_TICKS = os.sysconf('SC_CLK_TCK')
+
+
+@dataclass(frozen=True)
+class Profile:
+    """The streams one kind of client holds."""
+
+    transport: str
+    selectors: tuple[str, ...] = ()
+    events: tuple[str, ...] = ()
+
+
+# After what the real clients subscribe to.
+PROFILES = {
+    'web': Profile(
+        transport='grpc',
+        selectors=(
+            'state.main.current_view',
+            'state.main.status_bar',
+            'state.notifications.unread_count',
+        ),
+        events=('notifications_display_event',),
+    ),
+    'gui': Profile(
+        transport='grpc',
+        selectors=('state.main.current_view', 'state.main.status_bar'),
+        events=(
+            'application_scroll_event',
+            'menu_choose_by_index_event',
+            'notifications_display_event',
+        ),
+    ),
+    'lvgl': Profile(
+        transport='tcp-lite',
+        selectors=(
+            'state.main.current_view',
+            'state.main.status_bar',
+            'state.display.is_blanked',
+        ),
+        events=(
+            'application_scroll_event',
+            'menu_choose_by_index_event',
+            'frame_stream_data_event',
+        ),
+    ),
+    'assistant': Profile(
+        transport='grpc',
+        events=(
+            'audio_report_sample_event',
+            'display_render_event',
+            'notifications_display_event',
+        ),
+    ),
+}
+
+
+@dataclass
+class Stats:
+    """What the simulated clients saw; latencies in µs."""
+
+    latency: dict[str, LatencyHistogram] = field(
+        default_factory=lambda: {
+            'store': LatencyHistogram(),
+            'event': LatencyHistogram(),
+            'dispatch': LatencyHistogram(),
+        },
+    )
+    messages: Counter[str] = field(default_factory=Counter)
+    bytes: Counter[str] = field(default_factory=Counter)
+    # Probe events the core dropped on the way to a subscriber.
+    dropped_events: int = 0
+    dispatch_errors: int = 0
+    stream_errors: int = 0
+    reconnects: int = 0
+
+
+class MarkerTracker:
+    """Finds dispatch markers in what one subscription receives."""
+
+    def __init__(self, stats: Stats, path: str) -> None:
+        """Record into `stats` under `path`, ``store`` or ``event``."""
+        self.stats = stats
+        self.path = path
+        self.last_sequence: dict[int, int] = {}
+
+    def received(self, payload: bytes, *, at: int) -> None:
+        """Account for one message received at `at`, in ns."""
+        self.stats.messages[self.path] += 1
+        self.stats.bytes[self.path] += len(payload)
+        for match in _MARKER.finditer(payload):
+            dispatcher, sequence, sent_at = map(int, match.groups())
+            last = self.last_sequence.get(dispatcher)
+            if last is not None and sequence <= last:
+                continue
+            if self.path == 'event' and last is not None:
+                self.stats.dropped_events += sequence - last - 1
+            self.last_sequence[dispatcher] = sequence
+            self.stats.latency[self.path].record((at - sent_at) // 1000)
+
+
+def _probe(dispatcher: int, sequence: int) -> Action:
+    return Action(
+        notifications_add_action=NotificationsAddAction(
+            notification=Notification(
+                id=f'ubo-load-{dispatcher}',
+                title=f'Load test {dispatcher}',
+                content=f'ubo-load:{dispatcher}:{sequence}:{time.monotonic_ns()};',
+                display_type=NotificationDisplayType.STICKY,
+                progress=sequence % 100 / 100,
+                blink=False,
+                show_dismiss_action=False,
+            ),
+        ),
+    )
+
+
+def _clear(dispatcher: int) -> Action:
+    return Action(
+        notifications_clear_by_id_action=NotificationsClearByIdAction(
+            id=f'ubo-load-{dispatcher}',
+        ),
+    )
+
+
+class Transport:
+    """Opens streams and dispatches over gRPC or tcp-lite."""
+
+    def __init__(self, kind: str, host: str, *, grpc_port: int, mcu_port: int) -> None:
+        """Connect to `host` over `kind`, ``grpc`` or ``tcp-lite``."""
+        self.kind = kind
+        self.host = host
+        self.grpc_port = grpc_port
+        self.mcu_port = mcu_port
+        self._channel: Channel | None = None
+
+    def _stub(self) -> StoreServiceStub:
+        if self._channel is None:
+            self._channel = Channel(self.host, self.grpc_port)
+        return StoreServiceStub(self._channel)
+
+    def close(self) -> None:
+        """Close the gRPC channel, if one was opened."""
+        if self._channel is not None:
+            self._channel.close()
+            self._channel = None
+
+    async def _tcp_lite(
+        self,
+        rpc: str,
+        request: betterproto.Message,
+    ) -> AsyncIterator[bytes]:
+        # Importing the codec imports the app's store, so only when needed.
+        from ubo_app.rpc import mcu_server
+        from ubo_app.rpc.mcu_server import _encode_frame, _read_frame
+
+        message_type = getattr(mcu_server, f'{rpc.upper()}_REQUEST')
+        reader, writer = await asyncio.open_connection(self.host, self.mcu_port)
+        try:
+            writer.write(_encode_frame(message_type, bytes(request)))
+            await writer.drain()
+            while True:
+                try:
+                    _, payload = await _read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    return
+                yield payload
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError, OSError):
+                await writer.wait_closed()
+
+    async def dispatch(self, action: Action) -> None:
+        """Dispatch `action` and wait for the core to acknowledge it."""
+        request = DispatchActionRequest(action=action)
+        if self.kind == 'grpc':
+            await self._stub().dispatch_action(request)
+            return
+        async for _ in self._tcp_lite('dispatch_action', request):
+            return
+
+    def subscribe_store(self, selectors: Sequence[str]) -> AsyncIterator[bytes]:
+        """Stream the raw store responses for `selectors`."""
+        request = SubscribeStoreRequest(selectors=list(selectors))
+        if self.kind == 'grpc':
+            return _serialized(self._stub().subscribe_store(request))
+        return self._tcp_lite('subscribe_store', request)
+
+    def subscribe_event(self, events: Sequence[str]) -> AsyncIterator[bytes]:
+        """Stream the raw event responses for the `events` fields."""
+        request = SubscribeEventRequest(
+            events=[Event(**{name: _EVENTS[name]()}) for name in events],
+        )
+        if self.kind == 'grpc':
+            return _serialized(self._stub().subscribe_event(request))
+        return self._tcp_lite('subscribe_event', request)
+
+
+async def _serialized(
+    responses: AsyncIterator[SubscribeStoreResponse | SubscribeEventResponse],
+) -> AsyncIterator[bytes]:
+    async for response in responses:
+        yield bytes(response)
+
+
+@dataclass(frozen=True)
+class Options:
+    """How the load is shaped."""
+
+    host: str
+    grpc_port: int
+    mcu_port: int
+    rate: float
+    dispatch_transport: str
+    slow_delay: float
+    reconnect_every: float
+
+
+async def _consume(
+    stream: Callable[[], AsyncIterator[bytes]],
+    tracker: MarkerTracker,
+    *,
+    delay: float,
+    reconnect_every: float,
+) -> None:
+    stats = tracker.stats
+    while True:
+        deadline = time.monotonic() + reconnect_every if reconnect_every else None
+        try:
+            async for payload in stream():
+                tracker.received(payload, at=time.monotonic_ns())
+                if delay:
+                    await asyncio.sleep(delay)
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # noqa: BLE001
+            stats.stream_errors += 1
+            await asyncio.sleep(1)
+        stats.reconnects += 1
+        # Sequence numbers carry on across the reconnection, but what was
+        # dispatched meanwhile was never meant for this subscription.
+        tracker.last_sequence.clear()
+
+
+async def _client(
+    profile: Profile,
+    options: Options,
+    stats: Stats,
+    *,
+    slow: bool,
+) -> None:
+    transport = Transport(
+        profile.transport,
+        options.host,
+        grpc_port=options.grpc_port,
+        mcu_port=options.mcu_port,
+    )
+    delay = options.slow_delay if slow else 0
+    streams = []
+    if profile.selectors:
+        streams.append(
+            _consume(
+                lambda: transport.subscribe_store(profile.selectors),
+                MarkerTracker(stats, 'store'),
+                delay=delay,
+                reconnect_every=options.reconnect_every,
+            ),
+        )
+    if profile.events:
+        streams.append(
+            _consume(
+                lambda: transport.subscribe_event(profile.events),
+                MarkerTracker(stats, 'event'),
+                delay=delay,
+                reconnect_every=options.reconnect_every,
+            ),
+        )
+    try:
+        await asyncio.gather(*streams)
+    finally:
+        transport.close()
+
+
+async def _dispatcher(index: int, options: Options, stats: Stats) -> None:
+    transport = Transport(
+        options.dispatch_transport,
+        options.host,
+        grpc_port=options.grpc_port,
+        mcu_port=options.mcu_port,
+    )
+    interval = 1 / options.rate
+    due = time.monotonic()
+    sequence = 0
+    try:
+        while True:
+            due += interval
+            started_at = time.monotonic_ns()
+            try:
+                await transport.dispatch(_probe(index, sequence))
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                stats.dispatch_errors += 1
+            else:
+                stats.latency['dispatch'].record(
+                    (time.monotonic_ns() - started_at) // 1000,
+                )
+            sequence += 1
+            # Behind schedule, the next one goes at once; bursts do not pile up.
+            await asyncio.sleep(max(due - time.monotonic(), 0))
+            due = max(due, time.monotonic() - interval)
+    finally:
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(transport.dispatch(_clear(index)), timeout=5)
+        transport.close()
+
+
+@dataclass(frozen=True)
+class Sample:
+    """One reading of the core process."""
+
+    at: float
+    cpu_seconds: float
+    rss_kib: int
+    threads: int
+    files: int
+
+
+def sample_process(pid: int) -> Sample:
+    """Read the core's CPU time, resident memory, threads and open files."""
+    # The command name in field 2 may hold spaces; count from its closing paren.
+    fields = Path(f'/proc/{pid}/stat').read_text().rpartition(')')[2].split()
+    status = {
+        key: value.split()[0]
+        for key, _, value in (
+            line.partition(':')
+            for line in Path(f'/proc/{pid}/status').read_text().splitlines()
+        )
+        if value.strip()
+    }
+    try:
+        files = sum(1 for _ in Path(f'/proc/{pid}/fd').iterdir())
+    except PermissionError:
+        files = 0
+    return Sample(
+        at=time.monotonic(),
+        cpu_seconds=(int(fields[11]) + int(fields[12])) / _CLOCK_TICKS,
+        rss_kib=int(status.get('VmRSS', 0)),
+        threads=int(status.get('Threads', 0)),
+        files=files,
+    )
+
+
+def trend_per_hour(samples: Sequence[Sample], metric: str) -> float:
+    """Return the least-squares growth of `metric` per hour over `samples`."""
+    if len(samples) < 3:
+        return 0.0
+    slope, _ = statistics.linear_regression(
+        [sample.at for sample in samples],
+        [float(getattr(sample, metric)) for sample in samples],
+    )
+    return slope * 3600
+
+
+def _summary(histogram: LatencyHistogram) -> dict[str, float]:
+    return {
+        key: value / 1000 if key != 'count' else value
+        for key, value in histogram.summary().items()
+    }
+
+
+def _status_line(elapsed: float, stats: Stats, sample: Sample | None) -> str:
+    store = stats.latency['store']
+    event = stats.latency['event']
+    line = (
+        f'{elapsed:8.0f}s  store p50 {store.percentile(50) / 1000:7.1f} ms'
+        f' p99 {store.percentile(99) / 1000:7.1f} ms'
+        f'  event p50 {event.percentile(50) / 1000:7.1f} ms'
+        f' p99 {event.percentile(99) / 1000:7.1f} ms'
+        f'  dropped {stats.dropped_events:6d}'
+        f'  errors {stats.dispatch_errors + stats.stream_errors:4d}'
+    )
+    if sample is not None:
+        line += (
+            f'  rss {sample.rss_kib:8d} KiB  threads {sample.threads:4d}'
+            f'  files {sample.files:4d}'
+        )
+    return line
+
+
+def _log_size(path: Path | None) -> int:
+    return path.stat().st_size if path is not None and path.exists() else 0
+
+
+def _count_queue_full(path: Path | None, offset: int) -> int | None:
+    if path is None or not path.exists():
+        return None
+    with path.open('rb') as file:
+        file.seek(offset)
+        return sum(_QUEUE_FULL.encode() in line for line in file)
+
+
+def parse_clients(spec: str) -> list[str]:
+    """Expand ``web=4,lvgl=2`` into one profile name per client."""
+    clients: list[str] = []
+    for part in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, count = part.partition('=')
+        if name not in PROFILES:
+            msg = f'Unknown client profile {name!r}, expected one of {sorted(PROFILES)}'
+            raise ValueError(msg)
+        clients.extend([name] * int(count or 1))
+    return clients
+
+
+async def _run(arguments: argparse.Namespace) -> dict[str, Any]:
+    options = Options(
+        host=arguments.host,
+        grpc_port=arguments.grpc_port,
+        mcu_port=arguments.mcu_port,
+        rate=arguments.rate,
+        dispatch_transport=arguments.dispatch_transport,
+        slow_delay=arguments.slow_delay / 1000,
+        reconnect_every=arguments.reconnect_every,
+    )
+    clients = parse_clients(arguments.clients)
+    stats = Stats()
+    pid: int | None = arguments.pid
+    baseline = sample_process(pid) if pid else None
+    log_offset = _log_size(arguments.log)
+
+    tasks = [
+        asyncio.create_task(
+            _client(PROFILES[name], options, stats, slow=index < arguments.slow),
+        )
+        for index, name in enumerate(clients)
+    ]
+    # Let the subscriptions settle before the probes start.
+    await asyncio.sleep(1)
+    tasks += [
+        asyncio.create_task(_dispatcher(index, options, stats))
+        for index in range(arguments.dispatchers)
+    ]
+
+    samples: list[Sample] = []
+    started_at = time.monotonic()
+    next_report = started_at + arguments.report_interval
+    while (now := time.monotonic()) - started_at < arguments.duration:
+        sample = sample_process(pid) if pid else None
+        if sample is not None:
+            samples.append(sample)
+        if now >= next_report:
+            print(_status_line(now - started_at, stats, sample), flush=True)
+            next_report += arguments.report_interval
+        await asyncio.sleep(
+            min(arguments.sample_interval, arguments.duration - (now - started_at)),
+        )
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.monotonic() - started_at
+
+    report: dict[str, Any] = {
+        'clients': dict(Counter(clients)),
+        'dispatchers': arguments.dispatchers,
+        'rate': arguments.rate,
+        'duration': elapsed,
+        'latency_ms': {
+            path: _summary(histogram) for path, histogram in stats.latency.items()
+        },
+        'messages': dict(stats.messages),
+        'messages_per_second': {
+            path: count / elapsed for path, count in stats.messages.items()
+        },
+        'bytes': dict(stats.bytes),
+        'dropped_events': stats.dropped_events,
+        'queue_full_warnings': _count_queue_full(arguments.log, log_offset),
+        'dispatch_errors': stats.dispatch_errors,
+        'stream_errors': stats.stream_errors,
+        'reconnects': stats.reconnects,
+        'leaks': [],
+    }
+    if pid and baseline is not None and samples:
+        # What the clients held is given back once they are gone.
+        await asyncio.sleep(arguments.settle)
+        after = sample_process(pid)
+        steady = [
+            sample for sample in samples if sample.at - started_at >= arguments.warmup
+        ]
+        first, last = samples[0], samples[-1]
+        report['process'] = {
+            'cpu_percent': (last.cpu_seconds - first.cpu_seconds)
+            / max(last.at - first.at, 1e-9)
+            * 100,
+            'rss_kib': {
+                'baseline': baseline.rss_kib,
+                'peak': max(sample.rss_kib for sample in samples),
+                'after': after.rss_kib,
+            },
+            'rss_kib_per_hour': trend_per_hour(steady, 'rss_kib'),
+            'threads': {'baseline': baseline.threads, 'after': after.threads},
+            'files': {'baseline': baseline.files, 'after': after.files},
+        }
+        if (
+            len(steady) >= arguments.min_trend_samples
+            and report['process']['rss_kib_per_hour'] > arguments.leak_threshold
+        ):
+            report['leaks'].append('rss')
+        for metric in ('threads', 'files'):
+            if getattr(after, metric) - getattr(baseline, metric) > arguments.tolerance:
+                report['leaks'].append(metric)
+    return report
+
+
+def main() -> int:
+    """Run the load and print its report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--grpc-port', type=int, default=GRPC_LISTEN_PORT)
+    parser.add_argument('--mcu-port', type=int, default=MCU_LISTEN_PORT)
+    parser.add_argument(
+        '--clients',
+        default='web=4,gui=1,lvgl=2,assistant=1',
+        help=f'profile=count, comma-separated; profiles: {", ".join(PROFILES)}',
+    )
+    parser.add_argument('--dispatchers', type=int, default=2)
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=20,
+        help='dispatches a second, per dispatcher',
+    )
+    parser.add_argument(
+        '--dispatch-transport',
+        choices=('grpc', 'tcp-lite'),
+        default='grpc',
+    )
+    parser.add_argument(
+        '--slow',
+        type=int,
+        default=0,
+        help='how many of the clients read slowly',
+    )
+    parser.add_argument(
+        '--slow-delay',
+        type=float,
+        default=50,
+        help='ms a slow client takes per message',
+    )
+    parser.add_argument(
+        '--reconnect-every',
+        type=float,
+        default=0,
+        help='seconds before a client drops and reopens a stream, 0 for never',
+    )
+    parser.add_argument('--duration', type=float, default=60, help='seconds')
+    parser.add_argument('--pid', type=int, help='the core process, to sample')
+    parser.add_argument('--log', type=Path, help="the core's log file")
+    parser.add_argument('--sample-interval', type=float, default=5)
+    parser.add_argument('--report-interval', type=float, default=10)
+    parser.add_argument(
+        '--warmup',
+        type=float,
+        default=60,
+        help='seconds left out of the trends',
+    )
+    parser.add_argument(
+        '--settle',
+        type=float,
+        default=5,
+        help='seconds to wait after the clients left before the last sample',
+    )
+    parser.add_argument(
+        '--leak-threshold',
+        type=float,
+        default=4096,
+        help='KiB an hour the resident set may grow by',
+    )
+    parser.add_argument('--min-trend-samples', type=int, default=30)
+    parser.add_argument(
+        '--tolerance',
+        type=int,
+        default=4,
+        help='threads or files the core may hold on to after the run',
+    )
+    parser.add_argument('--json', type=Path, help='write the report here')
+    arguments = parser.parse_args()
+
+    report = asyncio.run(_run(arguments))
+    document = json.dumps(report, indent=2)
+    print(document)
+    if arguments.json:
+        arguments.json.write_text(document + '\n')
+    if report['leaks']:
+        print(f'Leak suspected: {", ".join(report["leaks"])}', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    code = main()
+    # With tcp-lite clients the app's store is imported, whose scheduler and
+    # side effect threads nothing here finishes.
+    sys.stdout.flush()
+    os._exit(code)
@@ -0,0 +1,339 @@
+"""Reference client of tcp-lite's session mode, for tests.
+
+Speaks the protocol ``ubo_app/rpc/mcu_server.py`` describes the way firmware
+should: one connection for every stream, dispatches batched when there are
+several, credits granted back as responses are consumed rather than as they
+arrive, pings answered, and a reconnect that resumes the session's
+subscriptions, or opens them again when the core no longer has it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Generic, Self, TypeVar
+
+from ubo_bindings.store.v1 import (
+    DispatchActionResponse,
+    SubscribeEventResponse,
+    SubscribeStoreResponse,
+)
+
+from ubo_app.rpc.mcu_server import (
+    CREDIT,
+    DISPATCH_ACTION_REQUEST,
+    DISPATCH_ACTION_RESPONSE,
+    DISPATCH_BATCH_REQUEST,
+    ERROR,
+    FRAME_COMPRESSED,
+    PING,
+    PONG,
+    SESSION_ACCEPT,
+    SESSION_OPEN,
+    SESSION_RESUMED,
+    SESSION_ZLIB,
+    STREAM_CLOSE,
+    SUBSCRIBE_EVENT_REQUEST,
+    SUBSCRIBE_STORE_REQUEST,
+    _decode_batch,
+    _decode_handshake,
+    _encode_batch,
+    _encode_frame,
+    _encode_handshake,
+    _encode_session_frame,
+    _encode_varint,
+    _read_frame,
+    _read_session_frame,
+)
+
+if TYPE_CHECKING:
+    import betterproto
+    from ubo_bindings.store.v1 import (
+        DispatchActionRequest,
+        SubscribeEventRequest,
+        SubscribeStoreRequest,
+    )
+
+Response = TypeVar('Response', SubscribeStoreResponse, SubscribeEventResponse)
+
+
+class McuError(Exception):
+    """The core rejected a request with an ``ERROR`` frame."""
+
+
+class Subscription(Generic[Response]):
+    """Responses of one subscription stream, in the order they came."""
+
+    def __init__(
+        self,
+        session: McuSession,
+        stream_id: int,
+        request: tuple[int, bytes],
+        response_type: type[Response],
+    ) -> None:
+        """Wait for responses on `stream_id` of `session`."""
+        self.stream_id = stream_id
+        self.request = request
+        self._session = session
+        self._response_type = response_type
+        self._queue: asyncio.Queue[bytes | McuError | None] = asyncio.Queue()
+        self._consumed = 0
+
+    def __aiter__(self) -> Subscription[Response]:
+        """Iterate over the responses."""
+        return self
+
+    async def __anext__(self) -> Response:
+        """Wait for the next response, granting credits back as they are read."""
+        item = await self._queue.get()
+        if item is None:
+            raise StopAsyncIteration
+        if isinstance(item, McuError):
+            raise item
+        self._consumed += 1
+        # Half the window at a time, so the core rarely waits for a credit.
+        if self._consumed >= max(self._session.credit_window // 2, 1):
+            # Without a connection there is no one to grant to; a resume
+            # starts the stream's credits over.
+            with contextlib.suppress(ConnectionError):
+                await self._session.send(
+                    CREDIT,
+                    self.stream_id,
+                    _encode_varint(self._consumed),
+                )
+            self._consumed = 0
+        return self._response_type().parse(item)
+
+    def received(self, payload: bytes | McuError | None) -> None:
+        """Queue a response, a rejection or, with `None`, the stream's end."""
+        self._queue.put_nowait(payload)
+
+    def restart(self) -> None:
+        """Forget consumption counted against a connection that is gone."""
+        self._consumed = 0
+
+    async def close(self) -> None:
+        """Close the stream; the core stops sending to it."""
+        self._session.subscriptions.pop(self.stream_id, None)
+        self._queue.put_nowait(None)
+        with contextlib.suppress(ConnectionError):
+            await self._session.send(STREAM_CLOSE, self.stream_id, b'')
+
+
+class McuSession:
+    """A session with the core's tcp-lite listener, over one connection."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        credit_window: int = 8,
+        compress: bool = True,
+    ) -> None:
+        """Talk to `host`:`port`, `credit_window` responses ahead per stream."""
+        self.host = host
+        self.port = port
+        self.credit_window = credit_window
+        self.compress = compress
+        self.token = b''
+        self.resumed = False
+        self.heartbeat_interval = 0.0
+        self.pings = 0
+        self.compressed_frames = 0
+        self.subscriptions: dict[int, Subscription] = {}
+        self._next_stream_id = 1
+        self._pending: dict[int, asyncio.Future[tuple[int, bytes]]] = {}
+        self._writer: asyncio.StreamWriter | None = None
+        self._reading: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> Self:
+        """Open the session."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Close the connection."""
+        await self.close()
+
+    async def open(self) -> bool:
+        """Connect, resuming the session if the core still has it.
+
+        Returns whether it was resumed. If it was not, the subscriptions of
+        the earlier connection are opened again, on their stream ids.
+
+        """
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(
+            _encode_frame(
+                SESSION_OPEN,
+                _encode_handshake(
+                    SESSION_ZLIB if self.compress else 0,
+                    self.credit_window,
+                    self.token,
+                ),
+            ),
+        )
+        await writer.drain()
+        message_type, payload = await _read_frame(reader)
+        if message_type != SESSION_ACCEPT:
+            writer.close()
+            raise McuError(payload.decode(errors='replace'))
+        _, flags, heartbeat_ms, self.token = _decode_handshake(payload)
+        self.resumed = bool(flags & SESSION_RESUMED)
+        self.heartbeat_interval = heartbeat_ms / 1000
+        self._writer = writer
+        self._reading = asyncio.create_task(self._read(reader))
+        for stream_id, subscription in self.subscriptions.items():
+            subscription.restart()
+            if not self.resumed:
+                message_type, request = subscription.request
+                await self.send(message_type, stream_id, request)
+        return self.resumed
+
+    async def close(self) -> None:
+        """Close the connection; the core keeps the session for a resume."""
+        if self._writer is not None:
+            self._writer.close()
+            with contextlib.suppress(ConnectionError, OSError):
+                await self._writer.wait_closed()
+        if self._reading is not None:
+            await self._reading
+
+    def abort(self) -> None:
+        """Drop the connection abruptly, as a Wi-Fi dropout would."""
+        if self._writer is not None:
+            self._writer.transport.abort()
+
+    async def send(self, message_type: int, stream_id: int, payload: bytes) -> None:
+        """Write one session frame."""
+        if self._writer is None or self._writer.is_closing():
+            msg = 'Not connected'
+            raise ConnectionError(msg)
+        self._writer.write(_encode_session_frame(message_type, stream_id, payload))
+        await self._writer.drain()
+
+    def _stream_id(self) -> int:
+        stream_id = self._next_stream_id
+        self._next_stream_id += 1
+        return stream_id
+
+    async def request(
+        self,
+        message_type: int,
+        payload: bytes,
+    ) -> tuple[int, bytes]:
+        """Send a request on a new stream; return the type and payload answered."""
+        stream_id = self._stream_id()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[stream_id] = future
+        try:
+            await self.send(message_type, stream_id, payload)
+            return await future
+        finally:
+            self._pending.pop(stream_id, None)
+
+    async def dispatch(
+        self,
+        *requests: DispatchActionRequest,
+    ) -> list[DispatchActionResponse]:
+        """Dispatch `requests` in order, in one frame when there are several."""
+        if len(requests) == 1:
+            message_type, payload = await self.request(
+                DISPATCH_ACTION_REQUEST,
+                bytes(requests[0]),
+            )
+        else:
+            message_type, payload = await self.request(
+                DISPATCH_BATCH_REQUEST,
+                _encode_batch(bytes(request) for request in requests),
+            )
+        payloads = (
+            [payload]
+            if message_type == DISPATCH_ACTION_RESPONSE
+            else _decode_batch(payload)
+        )
+        return [DispatchActionResponse().parse(item) for item in payloads]
+
+    async def ping(self) -> None:
+        """Wait for the core to answer a ping."""
+        await self.request(PING, b'')
+
+    async def _subscribe(
+        self,
+        message_type: int,
+        request: betterproto.Message,
+        response_type: type[Response],
+    ) -> Subscription[Response]:
+        stream_id = self._stream_id()
+        subscription = Subscription(
+            self,
+            stream_id,
+            (message_type, bytes(request)),
+            response_type,
+        )
+        self.subscriptions[stream_id] = subscription
+        await self.send(message_type, stream_id, bytes(request))
+        return subscription
+
+    async def subscribe_store(
+        self,
+        request: SubscribeStoreRequest,
+    ) -> Subscription[SubscribeStoreResponse]:
+        """Open a store subscription on a stream of its own."""
+        return await self._subscribe(
+            SUBSCRIBE_STORE_REQUEST,
+            request,
+            SubscribeStoreResponse,
+        )
+
+    async def subscribe_event(
+        self,
+        request: SubscribeEventRequest,
+    ) -> Subscription[SubscribeEventResponse]:
+        """Open an event subscription on a stream of its own."""
+        return await self._subscribe(
+            SUBSCRIBE_EVENT_REQUEST,
+            request,
+            SubscribeEventResponse,
+        )
+
+    def _received(self, message_type: int, stream_id: int, payload: bytes) -> None:
+        pending = self._pending.get(stream_id)
+        subscription = self.subscriptions.get(stream_id)
+        if message_type == ERROR:
+            error = McuError(payload.decode(errors='replace'))
+            if pending is not None:
+                pending.set_exception(error)
+            elif subscription is not None:
+                self.subscriptions.pop(stream_id)
+                subscription.received(error)
+        elif pending is not None:
+            pending.set_result((message_type, payload))
+        elif subscription is not None:
+            if message_type == STREAM_CLOSE:
+                self.subscriptions.pop(stream_id)
+                subscription.received(None)
+            else:
+                subscription.received(payload)
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                message_type, flags, stream_id, payload = await _read_session_frame(
+                    reader,
+                )
+                if flags & FRAME_COMPRESSED:
+                    self.compressed_frames += 1
+                if message_type == PING:
+                    self.pings += 1
+                    await self.send(PONG, stream_id, payload)
+                else:
+                    self._received(message_type, stream_id, payload)
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            pass
+        finally:
+            # Subscriptions wait for a resume; requests in flight are lost.
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError('Connection lost'))
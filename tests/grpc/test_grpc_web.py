@@ -0,0 +1,156 @@
+"""Unit tests for the in-process gRPC-Web gateway.
+
+Codec and response-stream tests only — no HTTP server and no store. The frames
+are checked with the LVGL client's own parser logic (flag, big-endian length,
+CRLF trailer block) so the gateway stays byte-compatible with what Envoy emits.
+"""
+
+from __future__ import annotations
+
+import base64
+import struct
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ubo_app.rpc import grpc_web
+from ubo_app.rpc.grpc_web import (
+    DATA_FLAG,
+    STATUS_INVALID_ARGUMENT,
+    STATUS_OK,
+    STATUS_UNIMPLEMENTED,
+    TRAILER_FLAG,
+    GrpcWebRequestError,
+    decode_request,
+    encode_frame,
+    encode_trailers,
+    is_text_content_type,
+    stream_response,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+def _parse_frames(data: bytes) -> list[tuple[int, bytes]]:
+    frames: list[tuple[int, bytes]] = []
+    while data:
+        flag, length = struct.unpack('>BI', data[:5])
+        frames.append((flag, data[5 : 5 + length]))
+        data = data[5 + length :]
+    return frames
+
+
+def _trailer_status(payload: bytes) -> int:
+    lines = dict(
+        line.split(':', 1) for line in payload.decode('ascii').split('\r\n') if line
+    )
+    return int(lines['grpc-status'])
+
+
+async def _collect(iterator: AsyncIterator[bytes]) -> bytes:
+    return b''.join([chunk async for chunk in iterator])
+
+
+def test_encode_frame_layout() -> None:
+    """A data frame is ``[flag][4-byte big-endian length][payload]``."""
+    assert encode_frame(DATA_FLAG, b'abc') == b'\x00\x00\x00\x00\x03abc'
+
+
+def test_trailers_are_a_crlf_header_block() -> None:
+    """The trailer frame carries ``grpc-status`` and a percent-encoded message."""
+    [(flag, payload)] = _parse_frames(encode_trailers(13, 'bad thing'))
+    assert flag == TRAILER_FLAG
+    assert payload == b'grpc-status:13\r\ngrpc-message:bad%20thing\r\n'
+
+
+def test_text_content_type_detection() -> None:
+    """Only the ``-text`` variants are treated as base64."""
+    assert is_text_content_type('application/grpc-web-text')
+    assert is_text_content_type('application/grpc-web-text+proto')
+    assert not is_text_content_type('application/grpc-web+proto')
+    assert not is_text_content_type(None)
+
+
+@pytest.mark.parametrize('is_text', [False, True])
+def test_decode_request_roundtrip(*, is_text: bool) -> None:
+    """The single request frame decodes back to its payload in both variants."""
+    body = encode_frame(DATA_FLAG, b'payload')
+    if is_text:
+        body = base64.b64encode(body)
+    assert decode_request(body, is_text=is_text) == b'payload'
+
+
+@pytest.mark.parametrize(
+    'body',
+    [
+        b'\x00\x00',
+        encode_trailers(0),
+        b'\x00\x00\x00\x00\x09short',
+        b'\x00\xff\xff\xff\xff',
+    ],
+    ids=['short-header', 'trailer-first', 'truncated', 'oversized'],
+)
+def test_decode_request_rejects_malformed_bodies(body: bytes) -> None:
+    """Malformed request bodies raise instead of being half-parsed."""
+    with pytest.raises(GrpcWebRequestError):
+        decode_request(body, is_text=False)
+
+
+async def test_unknown_method_is_unimplemented() -> None:
+    """An unknown RPC ends with a single UNIMPLEMENTED trailer."""
+    body = await _collect(stream_response('Nope', b'', is_text=False))
+    [(flag, payload)] = _parse_frames(body)
+    assert flag == TRAILER_FLAG
+    assert _trailer_status(payload) == STATUS_UNIMPLEMENTED
+
+
+async def test_malformed_protobuf_is_invalid_argument() -> None:
+    """A payload that is not a valid request message becomes INVALID_ARGUMENT."""
+    # A length prefix whose varint never terminates.
+    payload = b'\x0a' + b'\xff' * 10
+    body = await _collect(stream_response('SubscribeStore', payload, is_text=False))
+    [(flag, payload)] = _parse_frames(body)
+    assert flag == TRAILER_FLAG
+    assert _trailer_status(payload) == STATUS_INVALID_ARGUMENT
+
+
+class _FakeResponse:
+    def __init__(self, value: bytes) -> None:
+        self.value = value
+
+    def SerializeToString(self) -> bytes:  # noqa: N802
+        return self.value
+
+
+@pytest.mark.parametrize('is_text', [False, True])
+async def test_stream_frames_responses_then_trailers(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    is_text: bool,
+) -> None:
+    """Each response becomes a data frame, followed by an OK trailer."""
+    closed: list[bool] = []
+
+    class FakeStoreService:
+        async def subscribe_store(self, _: object) -> AsyncIterator[_FakeResponse]:
+            try:
+                yield _FakeResponse(b'one')
+                yield _FakeResponse(b'two')
+            finally:
+                closed.append(True)
+
+    monkeypatch.setattr(grpc_web, 'StoreService', FakeStoreService)
+
+    chunks = [
+        chunk async for chunk in stream_response('SubscribeStore', b'', is_text=is_text)
+    ]
+    if is_text:
+        # Every frame is its own padded base64 segment.
+        chunks = [base64.b64decode(chunk) for chunk in chunks]
+    frames = _parse_frames(b''.join(chunks))
+
+    assert frames[:2] == [(DATA_FLAG, b'one'), (DATA_FLAG, b'two')]
+    assert frames[2][0] == TRAILER_FLAG
+    assert _trailer_status(frames[2][1]) == STATUS_OK
+    assert closed == [True]
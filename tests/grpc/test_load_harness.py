@@ -0,0 +1,78 @@
+"""Unit tests for the load and soak harness's bookkeeping.
+
+No core and no sockets: the marker tracking, profile parsing and trend fitting
+that the harness's report is built from.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.grpc.load import (
+    PROFILES,
+    MarkerTracker,
+    Sample,
+    Stats,
+    parse_clients,
+    trend_per_hour,
+)
+
+
+def _marker(dispatcher: int, sequence: int, sent_at: int) -> bytes:
+    # Followed by a protobuf tag that reads as an ASCII digit.
+    return f'\x12\x08ubo-load:{dispatcher}:{sequence}:{sent_at};0\x01'.encode()
+
+
+def test_event_path_counts_skipped_sequences_as_dropped() -> None:
+    """A gap in a dispatcher's sequence on an event stream is a drop."""
+    stats = Stats()
+    tracker = MarkerTracker(stats, 'event')
+
+    tracker.received(_marker(0, 5, 1_000_000), at=3_000_000)
+    tracker.received(_marker(0, 6, 2_000_000) + _marker(1, 0, 2_000_000), at=4_000_000)
+    tracker.received(_marker(0, 9, 3_000_000), at=4_000_000)
+    # Seen before, so neither a latency sample nor a gap.
+    tracker.received(_marker(0, 9, 3_000_000), at=9_000_000)
+
+    assert stats.dropped_events == 2
+    assert stats.messages['event'] == 4
+    assert stats.latency['event'].count == 4
+    assert stats.latency['event'].min == 1000
+    assert stats.latency['event'].max == 2000
+
+
+def test_store_path_coalescing_is_not_a_drop() -> None:
+    """The store stream is latest-wins, so skipped sequences are expected."""
+    stats = Stats()
+    tracker = MarkerTracker(stats, 'store')
+
+    tracker.received(_marker(0, 1, 0), at=500_000)
+    tracker.received(_marker(0, 7, 0), at=700_000)
+    tracker.received(b'no marker here', at=800_000)
+
+    assert stats.dropped_events == 0
+    assert stats.latency['store'].count == 2
+    assert stats.messages['store'] == 3
+    assert stats.bytes['store'] > 0
+
+
+def test_parse_clients() -> None:
+    """Client mixes expand to one profile per client."""
+    assert parse_clients('web=2, lvgl,assistant=0') == ['web', 'web', 'lvgl']
+    assert {PROFILES[name].transport for name in parse_clients('lvgl=1')} == {
+        'tcp-lite',
+    }
+    with pytest.raises(ValueError, match='Unknown client profile'):
+        parse_clients('kiosk=1')
+
+
+def test_trend_per_hour() -> None:
+    """The fitted growth is per hour, and flat for too few samples."""
+    samples = [
+        Sample(at=seconds, cpu_seconds=0, rss_kib=1000 + seconds, threads=8, files=20)
+        for seconds in range(0, 600, 10)
+    ]
+
+    assert trend_per_hour(samples, 'rss_kib') == pytest.approx(3600)
+    assert trend_per_hour(samples, 'threads') == pytest.approx(0)
+    assert trend_per_hour(samples[:2], 'rss_kib') == 0
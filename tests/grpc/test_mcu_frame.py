@@ -8,22 +8,41 @@ stay byte-compatible.
 from __future__ import annotations
 
 import asyncio
+import zlib
 
 import pytest
 
+from ubo_app.rpc import mcu_server
 from ubo_app.rpc.mcu_server import (
+    CREDIT,
     DISPATCH_ACTION_REQUEST,
     DISPATCH_ACTION_RESPONSE,
+    DISPATCH_BATCH_REQUEST,
+    DISPATCH_BATCH_RESPONSE,
     ERROR,
+    FRAME_COMPRESSED,
     MAX_FRAME_SIZE,
     PING,
+    PONG,
+    SESSION_ACCEPT,
+    SESSION_OPEN,
+    SESSION_RESUMED,
+    SESSION_VERSION,
+    SESSION_ZLIB,
+    STREAM_CLOSE,
     SUBSCRIBE_EVENT_REQUEST,
     SUBSCRIBE_EVENT_RESPONSE,
     SUBSCRIBE_STORE_REQUEST,
     SUBSCRIBE_STORE_RESPONSE,
+    _decode_batch,
+    _decode_handshake,
+    _encode_batch,
     _encode_frame,
+    _encode_handshake,
+    _encode_session_frame,
     _encode_varint,
     _read_frame,
+    _read_session_frame,
     _read_varint,
 )
 
@@ -34,6 +53,13 @@ ALL_MESSAGE_TYPES = [
     SUBSCRIBE_STORE_RESPONSE,
     SUBSCRIBE_EVENT_REQUEST,
     SUBSCRIBE_EVENT_RESPONSE,
+    SESSION_OPEN,
+    SESSION_ACCEPT,
+    DISPATCH_BATCH_REQUEST,
+    DISPATCH_BATCH_RESPONSE,
+    CREDIT,
+    STREAM_CLOSE,
+    PONG,
     ERROR,
     PING,
 ]
@@ -58,8 +84,17 @@ def test_message_type_constants_are_stable() -> None:
     assert SUBSCRIBE_STORE_RESPONSE == 0x04
     assert SUBSCRIBE_EVENT_REQUEST == 0x05
     assert SUBSCRIBE_EVENT_RESPONSE == 0x06
+    assert SESSION_OPEN == 0x10
+    assert SESSION_ACCEPT == 0x11
+    assert DISPATCH_BATCH_REQUEST == 0x12
+    assert DISPATCH_BATCH_RESPONSE == 0x13
+    assert CREDIT == 0x14
+    assert STREAM_CLOSE == 0x15
+    assert PONG == 0x7D
     assert ERROR == 0x7E
     assert PING == 0x7F
+    assert (SESSION_VERSION, SESSION_ZLIB, SESSION_RESUMED) == (1, 0x01, 0x02)
+    assert FRAME_COMPRESSED == 0x01
 
 
 @pytest.mark.parametrize('value', VARINT_BOUNDARIES)
@@ -173,3 +208,79 @@ async def test_read_varint_rejects_non_terminating() -> None:
 
     with pytest.raises(ValueError, match='non-terminating'):
         await _read_varint(reader)
+
+
+@pytest.mark.parametrize('stream_id', [0, 1, 127, 128, 16384])
+async def test_session_frame_roundtrip(stream_id: int) -> None:
+    """A session frame carries its stream id between flags and length."""
+    frame = _encode_session_frame(SUBSCRIBE_STORE_RESPONSE, stream_id, b'state')
+
+    assert frame[:2] == bytes((SUBSCRIBE_STORE_RESPONSE, 0))
+    assert await _read_session_frame(_make_reader(frame)) == (
+        SUBSCRIBE_STORE_RESPONSE,
+        0,
+        stream_id,
+        b'state',
+    )
+
+
+async def test_session_frame_is_inflated_when_compressed() -> None:
+    """A ``FRAME_COMPRESSED`` payload is read back inflated."""
+    payload = bytes(4096)
+    frame = _encode_session_frame(
+        SUBSCRIBE_EVENT_RESPONSE,
+        3,
+        zlib.compress(payload),
+        flags=FRAME_COMPRESSED,
+    )
+
+    _, flags, _, read_payload = await _read_session_frame(_make_reader(frame))
+
+    assert flags == FRAME_COMPRESSED
+    assert read_payload == payload
+
+
+async def test_session_frame_rejects_inflating_past_the_cap(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A small compressed frame cannot inflate past the frame cap."""
+    monkeypatch.setattr(mcu_server, 'MAX_FRAME_SIZE', 1024)
+    frame = _encode_session_frame(
+        SUBSCRIBE_EVENT_RESPONSE,
+        3,
+        zlib.compress(bytes(1025)),
+        flags=FRAME_COMPRESSED,
+    )
+
+    with pytest.raises(ValueError, match='Inflated frame exceeds maximum'):
+        await _read_session_frame(_make_reader(frame))
+
+
+def test_batch_roundtrip() -> None:
+    """A batch splits back into its payloads, empty ones included."""
+    payloads = [b'press', b'', bytes(200), b'release']
+
+    assert _decode_batch(_encode_batch(payloads)) == payloads
+    assert _decode_batch(b'') == []
+    with pytest.raises(ValueError, match='Truncated batch item'):
+        _decode_batch(_encode_batch([b'press'])[:-1])
+
+
+def test_handshake_roundtrip() -> None:
+    """A handshake carries the version, flags, value and an optional token."""
+    token = bytes(range(16))
+
+    assert _decode_handshake(_encode_handshake(SESSION_ZLIB, 8)) == (
+        SESSION_VERSION,
+        SESSION_ZLIB,
+        8,
+        b'',
+    )
+    assert _decode_handshake(_encode_handshake(0, 5000, token)) == (
+        SESSION_VERSION,
+        0,
+        5000,
+        token,
+    )
+    with pytest.raises(ValueError, match='Truncated varint'):
+        _decode_handshake(_encode_varint(SESSION_VERSION))
@@ -0,0 +1,346 @@
+"""Tests for tcp-lite's session mode, through the reference client.
+
+The listener runs on a loopback port with ``StoreService`` replaced by a fake
+core, whose store subscriptions send what a test feeds them and count what
+they were asked for, so streams, credits and resumes are visible without
+booting the app.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import pytest
+from betterproto.lib.google.protobuf import Any
+from ubo_bindings.store.v1 import (
+    DispatchActionRequest,
+    DispatchActionResponse,
+    SubscribeEventRequest,
+    SubscribeStoreRequest,
+    SubscribeStoreResponse,
+)
+from ubo_bindings.ubo.v1 import Action, NotificationsClearByIdAction
+
+from tests.grpc.mcu_client import McuError, McuSession
+from ubo_app.rpc import mcu_server
+from ubo_app.rpc.mcu_server import (
+    DISPATCH_ACTION_REQUEST,
+    DISPATCH_ACTION_RESPONSE,
+    ERROR,
+    SESSION_ACCEPT,
+    SESSION_OPEN,
+    _encode_frame,
+    _encode_handshake,
+    _encode_varint,
+    _handle_connection,
+    _read_frame,
+    _read_session_frame,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+HOST = '127.0.0.1'
+# Fed to a subscription, it makes its generator raise.
+BROKEN = b'broken'
+
+
+class _FakeCore:
+    """Stands in for ``StoreService``."""
+
+    def __init__(self) -> None:
+        self.dispatched: list[str] = []
+        self.values: defaultdict[str, asyncio.Queue[bytes]] = defaultdict(
+            asyncio.Queue,
+        )
+        self.subscribed: list[str] = []
+        self.pulled = 0
+
+    async def dispatch_action(
+        self,
+        request: DispatchActionRequest,
+    ) -> DispatchActionResponse:
+        self.dispatched.append(request.action.notifications_clear_by_id_action.id)
+        return DispatchActionResponse()
+
+    async def subscribe_store(
+        self,
+        request: SubscribeStoreRequest,
+    ) -> AsyncIterator[SubscribeStoreResponse]:
+        (selector,) = request.selectors
+        self.subscribed.append(selector)
+        try:
+            while True:
+                value = await self.values[selector].get()
+                self.pulled += 1
+                if value == BROKEN:
+                    msg = 'Selector broke'
+                    raise RuntimeError(msg)
+                yield SubscribeStoreResponse(results=[Any(value=value)])
+        finally:
+            self.subscribed.remove(selector)
+
+    async def subscribe_event(
+        self,
+        _request: SubscribeEventRequest,
+    ) -> AsyncIterator[SubscribeStoreResponse]:
+        # Like the real one, with no events to subscribe to.
+        for _ in ():
+            yield SubscribeStoreResponse()
+
+
+@pytest.fixture
+def core(monkeypatch: pytest.MonkeyPatch) -> _FakeCore:
+    """Serve sessions from a fake core, with no sessions from other tests."""
+    core = _FakeCore()
+    monkeypatch.setattr(mcu_server, 'StoreService', lambda: core)
+    monkeypatch.setattr(mcu_server, '_sessions', {})
+    return core
+
+
+@pytest.fixture
+async def port(core: _FakeCore) -> AsyncIterator[int]:
+    """Listen on a free loopback port."""
+    del core
+    server = await asyncio.start_server(_handle_connection, HOST, 0)
+    async with server:
+        yield server.sockets[0].getsockname()[1]
+
+
+def _request(action_id: str) -> DispatchActionRequest:
+    return DispatchActionRequest(
+        action=Action(
+            notifications_clear_by_id_action=NotificationsClearByIdAction(
+                id=action_id,
+            ),
+        ),
+    )
+
+
+def _subscribe(selector: str) -> SubscribeStoreRequest:
+    return SubscribeStoreRequest(selectors=[selector])
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    async with asyncio.timeout(2):
+        while not condition():  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+
+async def _read_until_closed(reader: asyncio.StreamReader) -> None:
+    while True:
+        await _read_session_frame(reader)
+
+
+async def test_streams_share_one_connection(core: _FakeCore, port: int) -> None:
+    """Subscriptions and dispatches are streams of the same connection."""
+    async with McuSession(HOST, port) as session:
+        view = await session.subscribe_store(_subscribe('view'))
+        status = await session.subscribe_store(_subscribe('status'))
+        events = await session.subscribe_event(SubscribeEventRequest())
+        core.values['status'].put_nowait(b'idle')
+        core.values['view'].put_nowait(b'menu')
+
+        assert (await anext(view)).results[0].value == b'menu'
+        assert (await anext(status)).results[0].value == b'idle'
+        # The core ended the event stream, having nothing to send on it.
+        assert [response async for response in events] == []
+        assert await session.dispatch(_request('key')) == [DispatchActionResponse()]
+        assert core.dispatched == ['key']
+        assert sorted(core.subscribed) == ['status', 'view']
+
+
+async def test_batched_dispatches_keep_their_order(
+    core: _FakeCore,
+    port: int,
+) -> None:
+    """A batch is dispatched in order and answered with one response each."""
+    async with McuSession(HOST, port) as session:
+        responses = await session.dispatch(
+            *(_request(f'key-{index}') for index in range(5)),
+        )
+
+    assert responses == [DispatchActionResponse()] * 5
+    assert core.dispatched == [f'key-{index}' for index in range(5)]
+
+
+async def test_subscription_waits_for_credits(core: _FakeCore, port: int) -> None:
+    """A stream sends no more responses than its client granted credits for."""
+    async with McuSession(HOST, port, credit_window=2) as session:
+        view = await session.subscribe_store(_subscribe('view'))
+        for index in range(6):
+            core.values['view'].put_nowait(bytes([index]))
+
+        await _until(lambda: core.pulled == 2)
+        await asyncio.sleep(0.1)
+        assert core.pulled == 2
+
+        assert (await anext(view)).results[0].value == b'\x00'
+        await _until(lambda: core.pulled == 3)
+        assert [(await anext(view)).results[0].value for _ in range(5)] == [
+            bytes([index]) for index in range(1, 6)
+        ]
+
+
+@pytest.mark.parametrize('compress', [True, False])
+async def test_large_responses_are_compressed_when_asked(
+    core: _FakeCore,
+    port: int,
+    *,
+    compress: bool,
+) -> None:
+    """Past the threshold, responses are compressed for a client that asked."""
+    frame = bytes(100_000)
+    async with McuSession(HOST, port, compress=compress) as session:
+        view = await session.subscribe_store(_subscribe('view'))
+        core.values['view'].put_nowait(frame)
+        core.values['view'].put_nowait(b'small')
+
+        assert (await anext(view)).results[0].value == frame
+        assert (await anext(view)).results[0].value == b'small'
+        assert session.compressed_frames == int(compress)
+
+
+async def test_silent_clients_are_dropped(
+    monkeypatch: pytest.MonkeyPatch,
+    port: int,
+) -> None:
+    """A client answering pings stays; one heard nothing from is dropped."""
+    monkeypatch.setattr(mcu_server, 'HEARTBEAT_INTERVAL', 0.02)
+    monkeypatch.setattr(mcu_server, 'HEARTBEAT_TIMEOUT', 0.1)
+    async with McuSession(HOST, port) as session:
+        await asyncio.sleep(0.3)
+        assert session.pings >= 3
+        await session.ping()
+
+        reader, writer = await asyncio.open_connection(HOST, port)
+        writer.write(_encode_frame(SESSION_OPEN, _encode_handshake(0, 8)))
+        message_type, _ = await _read_frame(reader)
+        assert message_type == SESSION_ACCEPT
+        async with asyncio.timeout(2):
+            with pytest.raises(asyncio.IncompleteReadError):
+                await _read_until_closed(reader)
+        writer.close()
+
+
+async def test_a_reconnect_resumes_the_session(core: _FakeCore, port: int) -> None:
+    """Within the window, a reconnect gets its subscriptions back as they were."""
+    session = McuSession(HOST, port)
+    assert not await session.open()
+    view = await session.subscribe_store(_subscribe('view'))
+    await _until(lambda: core.subscribed == ['view'])
+
+    session.abort()
+    await _until(lambda: core.subscribed == [])
+    assert await session.open()
+    await _until(lambda: core.subscribed == ['view'])
+    core.values['view'].put_nowait(b'back')
+
+    assert (await anext(view)).results[0].value == b'back'
+    await session.close()
+
+
+async def test_an_expired_session_is_subscribed_again(
+    monkeypatch: pytest.MonkeyPatch,
+    core: _FakeCore,
+    port: int,
+) -> None:
+    """Past the window the session is new; the client opens its streams again."""
+    monkeypatch.setattr(mcu_server, 'RESUME_WINDOW', 0)
+    session = McuSession(HOST, port)
+    await session.open()
+    view = await session.subscribe_store(_subscribe('view'))
+    await _until(lambda: core.subscribed == ['view'])
+
+    session.abort()
+    await _until(lambda: core.subscribed == [])
+    assert not await session.open()
+    core.values['view'].put_nowait(b'again')
+
+    assert (await anext(view)).results[0].value == b'again'
+    assert core.subscribed == ['view']
+    await session.close()
+
+
+async def test_a_resume_takes_over_a_half_open_connection(
+    core: _FakeCore,
+    port: int,
+) -> None:
+    """The session's old connection is dropped, so no stream is served twice."""
+    stale = McuSession(HOST, port)
+    await stale.open()
+    await stale.subscribe_store(_subscribe('view'))
+    await _until(lambda: core.subscribed == ['view'])
+
+    session = McuSession(HOST, port)
+    session.token = stale.token
+    assert await session.open()
+
+    async with asyncio.timeout(2):
+        await stale.close()
+    await _until(lambda: core.subscribed == ['view'])
+    await session.close()
+
+
+async def test_a_bad_request_fails_only_its_stream(
+    core: _FakeCore,
+    port: int,
+) -> None:
+    """An unknown type or a stream id in use is rejected; the session goes on."""
+    async with McuSession(HOST, port) as session:
+        with pytest.raises(McuError, match='Unknown message type 0x33'):
+            await session.request(0x33, b'')
+        view = await session.subscribe_store(_subscribe('view'))
+        await _until(lambda: core.subscribed == ['view'])
+        await session.send(0x03, view.stream_id, bytes(_subscribe('status')))
+        with pytest.raises(McuError, match=f'Stream {view.stream_id} is not'):
+            await anext(view)
+
+        assert await session.dispatch(_request('key')) == [DispatchActionResponse()]
+
+
+async def test_a_failing_subscription_is_closed_with_an_error(
+    core: _FakeCore,
+    port: int,
+) -> None:
+    """A subscription that raises is reported and forgotten, not resumed."""
+    async with McuSession(HOST, port) as session:
+        view = await session.subscribe_store(_subscribe('view'))
+        status = await session.subscribe_store(_subscribe('status'))
+        core.values['view'].put_nowait(BROKEN)
+
+        with pytest.raises(McuError, match='Selector broke'):
+            await anext(view)
+        assert core.subscribed == ['status']
+        assert list(mcu_server._sessions[session.token].subscriptions) == [  # noqa: SLF001
+            status.stream_id,
+        ]
+        core.values['status'].put_nowait(b'idle')
+        assert (await anext(status)).results[0].value == b'idle'
+
+
+async def test_one_shot_connections_are_served_as_before(
+    core: _FakeCore,
+    port: int,
+) -> None:
+    """A first frame other than ``SESSION_OPEN`` is one RPC, then a close."""
+    reader, writer = await asyncio.open_connection(HOST, port)
+    writer.write(_encode_frame(DISPATCH_ACTION_REQUEST, bytes(_request('key'))))
+
+    assert await _read_frame(reader) == (DISPATCH_ACTION_RESPONSE, b'')
+    assert await reader.read() == b''
+    assert core.dispatched == ['key']
+    writer.close()
+
+
+async def test_unknown_session_version_is_refused(port: int) -> None:
+    """A client of a later session version gets an ``ERROR`` and a close."""
+    reader, writer = await asyncio.open_connection(HOST, port)
+    payload = _encode_varint(2) + _encode_varint(0) + _encode_varint(8)
+    writer.write(_encode_frame(SESSION_OPEN, payload))
+
+    assert await _read_frame(reader) == (ERROR, b'Unsupported session version 2')
+    assert await reader.read() == b''
+    writer.close()
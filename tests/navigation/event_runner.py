@@ -143,7 +143,7 @@ class NavigationEventRunner(ReducerRunner):
     ) -> None:
         """Initialize state, fake store, and production event routes."""
         super().__init__(state, dynamic_menus, path_mappings)
-        self.notifications = NotificationsState(notifications=(), unread_count=0)
+        self.notifications = NotificationsState(notifications={}, unread_count=0)
         self.dispatched_actions: list[BaseAction] = []
         self._store = _RunnerStore(self)
         self.handlers = _load_menu_event_handlers(self._store)
@@ -191,14 +191,14 @@ class NavigationEventRunner(ReducerRunner):
 
     def set_notifications(self, *notifications: Notification) -> None:
         """Replace backing notifications and recompute the visible view."""
-        normalized = tuple(
-            self._normalize_notification(notification)
+        normalized = {
+            notification.id: self._normalize_notification(notification)
             for notification in notifications
-        )
+        }
         self.notifications = replace(
             self.notifications,
             notifications=normalized,
-            unread_count=sum(not item.is_read for item in normalized),
+            unread_count=sum(not item.is_read for item in normalized.values()),
         )
         self._sync_current_view()
 
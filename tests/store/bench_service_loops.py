@@ -0,0 +1,130 @@
+# ruff: noqa: T201
+"""Benchmark a thread and a loop per service against shared service loops.
+
+Starts ``--services`` idle services, each with a task that wakes up every
+``--period`` seconds, the way most services poll, first on a thread and event
+loop each, as `UboServiceThread` runs them, then on ``--pool-size`` shared
+loops, as `ubo_app.utils.loop_pool` runs them. Each model runs in its own
+process and reports:
+
+- the resident memory the services added,
+- the process's thread count,
+- the context switches per second of all its threads while idle, which is
+  how often they woke up (Linux only).
+
+Run::
+
+    uv run python tests/store/bench_service_loops.py
+    uv run python tests/store/bench_service_loops.py --services 40 --pool-size 2
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import psutil
+
+
+def _poll(loop: asyncio.AbstractEventLoop, period: float) -> None:
+    loop.call_later(period, _poll, loop, period)
+
+
+def _start_dedicated(services: int, period: float) -> None:
+    for _ in range(services):
+        loop = asyncio.new_event_loop()
+        loop.call_soon(_poll, loop, period)
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+
+
+def _start_shared(services: int, period: float, pool_size: int) -> None:
+    from ubo_app.utils.loop_pool import LoopPool
+
+    pool = LoopPool(pool_size)
+    for index in range(services):
+        loop = pool.assign(f'service-{index}').loop
+        loop.call_soon_threadsafe(_poll, loop, period)
+
+
+def _context_switches() -> int:
+    # psutil reports the main thread's only; every thread's are wanted.
+    switches = 0
+    for task in Path('/proc/self/task').iterdir():
+        try:
+            status = (task / 'status').read_text()
+        except OSError:
+            continue
+        for line in status.splitlines():
+            if 'ctxt_switches:' in line:
+                switches += int(line.rpartition(':')[2])
+    return switches
+
+
+def _measure(arguments: argparse.Namespace) -> dict[str, float]:
+    process = psutil.Process()
+    # Import what both models need before the baseline, so only the services
+    # themselves are measured.
+    import ubo_app.utils.loop_pool  # noqa: F401
+
+    baseline = process.memory_info().rss
+    if arguments.mode == 'dedicated':
+        _start_dedicated(arguments.services, arguments.period)
+    else:
+        _start_shared(arguments.services, arguments.period, arguments.pool_size)
+    time.sleep(1)
+
+    switches = _context_switches()
+    time.sleep(arguments.duration)
+    switches = _context_switches() - switches
+    return {
+        'rss_kib': (process.memory_info().rss - baseline) / 1024,
+        'threads': process.num_threads(),
+        'wakeups_per_second': switches / arguments.duration,
+    }
+
+
+def main() -> None:
+    """Run every model in a process of its own and compare them."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--services', type=int, default=30)
+    parser.add_argument('--pool-size', type=int, default=2)
+    parser.add_argument('--period', type=float, default=1.0)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--mode', choices=('dedicated', 'shared'))
+    arguments = parser.parse_args()
+
+    if arguments.mode:
+        print(json.dumps(_measure(arguments)))
+        return
+
+    print(
+        f'{arguments.services} idle services polling every {arguments.period} s, '
+        f'measured over {arguments.duration} s',
+    )
+    print(f'{"model":<22} {"RSS added KiB":>14} {"threads":>8} {"wakeups/s":>10}')
+    for mode, label in (
+        ('dedicated', 'thread per service'),
+        ('shared', f'{arguments.pool_size} shared loops'),
+    ):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, __file__, *sys.argv[1:], '--mode', mode],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        print(
+            f'{label:<22} {result["rss_kib"]:>14.0f} {result["threads"]:>8}'
+            f' {result["wakeups_per_second"]:>10.1f}',
+        )
+
+
+if __name__ == '__main__':
+    main()
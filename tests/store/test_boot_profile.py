@@ -0,0 +1,183 @@
+"""Tests for the boot profiler and the imports it attributes to services."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ubo_app import service_thread as service_module
+from ubo_app.utils import boot_profile
+from ubo_app.utils.boot_profile import BootProfiler
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class _Clock:
+    """Microseconds the test moves by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Drive the profiler's clock from the test."""
+    clock = _Clock()
+    monkeypatch.setattr(boot_profile, 'now', clock)
+    return clock
+
+
+@pytest.fixture
+def profiler(clock: _Clock) -> BootProfiler:
+    """Return an enabled profiler whose origin is 0."""
+    profiler = BootProfiler()
+    profiler.enabled = True
+    profiler.reset()
+    assert profiler.origin == clock.now
+    return profiler
+
+
+def test_phases_and_marks_make_a_timeline(
+    profiler: BootProfiler,
+    clock: _Clock,
+) -> None:
+    """Each service gets its row; the marks are listed in order."""
+    profiler.begin('000-audio', 'initiate')
+    clock.now = 2_000
+    profiler.end('000-audio', 'initiate')
+    profiler.begin('000-audio', 'setup', service_id='audio')
+    clock.now = 10_000
+    with profiler.phase('000-audio', 'barrier'):
+        clock.now = 40_000
+    profiler.mark('reducers registered')
+    clock.now = 50_000
+    profiler.end('000-audio', 'setup')
+    profiler.mark('reducers registered')
+
+    (audio,) = profiler.services()
+    assert audio.service_id == 'audio'
+    assert audio.duration('initiate') == 2_000
+    assert audio.duration('barrier') == 30_000
+    assert audio.duration('setup') == 48_000
+    assert audio.ready_at == 50_000
+    assert profiler.marks() == {'reducers registered': 40_000}
+
+    header, row, mark = profiler.timeline(width=10).splitlines()
+    assert header.split()[:6] == [
+        'service',
+        'initiate',
+        'imports',
+        'wait',
+        'barrier',
+        'setup',
+    ]
+    assert row.split()[:7] == ['000-audio', '2.0', '0.0', '0.0', '30.0', '48.0', '50.0']
+    assert row.endswith('|i#======##|')
+    assert mark == 'reducers registered at 40.0 ms'
+
+
+def test_nested_imports_count_their_own_time_once(
+    profiler: BootProfiler,
+    clock: _Clock,
+) -> None:
+    """A parent's own time excludes the children it imported."""
+    with profiler.importing('090-web-ui', 'server'):
+        clock.now += 1_000
+        with profiler.importing('090-web-ui', 'quart'):
+            clock.now += 7_000
+        clock.now += 2_000
+
+    (web_ui,) = profiler.services()
+    assert [(module.name, module.own, module.total) for module in web_ui.imports] == [
+        ('quart', 7_000, 7_000),
+        ('server', 3_000, 10_000),
+    ]
+    assert web_ui.import_time == 10_000
+    assert 'slowest imports' in profiler.timeline()
+
+
+def test_boot_completes_with_the_last_expected_service(
+    profiler: BootProfiler,
+) -> None:
+    """Failed services settle too; unknown ones do not complete the boot."""
+    profiler.expect(['000-audio', '080-docker'])
+
+    assert profiler.settled('000-audio') is False
+    assert profiler.settled('999-unknown') is False
+    assert profiler.settled('080-docker') is True
+    assert profiler.settled('080-docker') is False
+    assert 'boot complete' in profiler.marks()
+
+
+def test_chrome_trace_has_a_track_per_service(profiler: BootProfiler) -> None:
+    """Phases and imports are complete events on the service's own track."""
+    with profiler.phase('000-audio', 'setup'), profiler.importing('000-audio', 'x'):
+        pass
+    profiler.mark('first frame')
+
+    events = profiler.chrome_trace()['traceEvents']
+
+    assert [(event['ph'], event['name']) for event in events] == [
+        ('M', 'thread_name'),
+        ('X', 'setup'),
+        ('X', 'x'),
+        ('i', 'first frame'),
+    ]
+
+
+def test_a_disabled_profiler_records_nothing(clock: _Clock) -> None:
+    """The hooks are no-ops until enabled."""
+    profiler = BootProfiler()
+
+    profiler.begin('000-audio', 'setup')
+    with profiler.importing('000-audio', 'x'):
+        clock.now += 1
+    profiler.mark('first frame')
+
+    assert profiler.services() == []
+    assert profiler.marks() == {}
+
+
+@pytest.fixture
+def third_party_module(tmp_path: Path) -> Iterator[str]:
+    """Put a module outside any service on `sys.path`."""
+    (tmp_path / 'boot_profile_sample.py').write_text('VALUE = 42\n')
+    sys.path.insert(0, tmp_path.as_posix())
+    yield 'boot_profile_sample'
+    sys.path.remove(tmp_path.as_posix())
+    sys.modules.pop('boot_profile_sample', None)
+
+
+def test_third_party_imports_are_attributed_to_the_service(
+    monkeypatch: pytest.MonkeyPatch,
+    profiler: BootProfiler,
+    third_party_module: str,
+) -> None:
+    """The loader is timed, then handed back to the module it loaded."""
+    monkeypatch.setattr(service_module, 'boot_profiler', profiler)
+
+    spec = service_module._find_profiled_spec(  # noqa: SLF001
+        third_party_module,
+        None,
+        None,
+        '090-demo',
+    )
+    assert spec is not None
+    assert isinstance(spec.loader, service_module.ProfiledLoader)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.VALUE == 42
+    assert not isinstance(module.__loader__, service_module.ProfiledLoader)
+    assert module.__spec__ is not None
+    assert module.__spec__.loader is module.__loader__
+    (demo,) = profiler.services()
+    assert [module.name for module in demo.imports] == [third_party_module]
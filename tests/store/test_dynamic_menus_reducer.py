@@ -163,6 +163,21 @@ class TestUpdateDynamicMenuAction:
         assert _get_events(result) == []
 
 
+    def test_versions_track_each_menu(self) -> None:
+        """Verify an update bumps only the updated menu's version."""
+        state = _init_state()
+        state = _get_state(reducer(state, UpdateDynamicMenuAction(menu_id='a')))
+        state = _get_state(reducer(state, UpdateDynamicMenuAction(menu_id='b')))
+        assert state.versions == {'a': 1, 'b': 2}
+
+        state = _get_state(reducer(state, UpdateDynamicMenuAction(
+            menu_id='b',
+            title='B',
+        )))
+        assert state.versions == {'a': 1, 'b': 3}
+        assert state.version == 3
+
+
 class TestClearDynamicMenuAction:
     """Tests for clearing dynamic menus."""
 
@@ -194,6 +209,15 @@ class TestClearDynamicMenuAction:
         assert isinstance(events[0], DynamicMenuChangedEvent)
         assert events[0].menu_id == 'wifi:connections'
 
+    def test_clear_drops_menu_version(self) -> None:
+        """Verify a cleared menu no longer has a version."""
+        state = _init_state()
+        state = _get_state(reducer(state, UpdateDynamicMenuAction(menu_id='a')))
+        state = _get_state(reducer(state, UpdateDynamicMenuAction(menu_id='b')))
+        state = _get_state(reducer(state, ClearDynamicMenuAction(menu_id='a')))
+
+        assert state.versions == {'b': 2}
+
     def test_clear_nonexistent_returns_state(self) -> None:
         """Verify clearing a nonexistent menu returns unchanged state."""
         state = _init_state()
@@ -139,6 +139,51 @@ class TestReceivedCodeDispatch:
             for action in actions
         )
 
+    def test_a_held_bound_button_fires_once(self) -> None:
+        """Repeats of a bound code do not fire its action again."""
+        protocol, scancode = _L1_PRESS
+        state = InfraredState(
+            should_receive_keypad_actions=True,
+            registered_devices=[
+                InfraredDevice(
+                    name='TV Power',
+                    protocol=protocol,
+                    scancode=scancode,
+                    bound_action_key='assistant:toggle',
+                ),
+            ],
+        )
+
+        result = reducer(
+            state,
+            InfraredHandleReceivedCodeAction(
+                protocol=protocol,
+                scancode=scancode,
+                repeat=True,
+            ),
+        )
+
+        assert result is state
+
+    def test_a_held_keypad_button_keeps_pressing(self) -> None:
+        """Repeats of a keypad code replay the press, so holding scrolls."""
+        protocol, scancode = _L1_PRESS
+        state = InfraredState(should_receive_keypad_actions=True)
+
+        result = reducer(
+            state,
+            InfraredHandleReceivedCodeAction(
+                protocol=protocol,
+                scancode=scancode,
+                repeat=True,
+            ),
+        )
+
+        assert isinstance(result, CompleteReducerResult)
+        assert any(
+            isinstance(action, KeypadKeyPressAction) for action in result.actions or ()
+        )
+
     def test_old_assistant_scancode_is_inert(self) -> None:
         """A former hardcoded assistant code now does nothing without a binding."""
         state = InfraredState(should_receive_keypad_actions=True)
@@ -503,6 +548,24 @@ class TestInfraredReducerBranches:
 
         assert result.registration_signal_counts == {'necx:0x9': 1}
 
+    def test_registration_ignores_repeats(self) -> None:
+        """Holding the button counts as one signal, not five."""
+        state = InfraredState(
+            is_registering_device=True,
+            registration_signal_counts={'necx:0x9': 1},
+        )
+
+        result = reducer(
+            state,
+            _ir('InfraredHandleReceivedCodeAction')(
+                protocol='necx',
+                scancode='0x9',
+                repeat=True,
+            ),
+        )
+
+        assert result is state
+
     def test_back_and_home_cancel_registration(self) -> None:
         """BACK or HOME during registration blanks the ring and stops it."""
         key_enum = _ir('Key')
@@ -0,0 +1,281 @@
+"""Tests for the system manager's infrared receiver and the app side of it.
+
+The receiver reads `struct lirc_scancode` records from a non-blocking file
+descriptor. `ReplayDevice` is a pipe that takes the kernel's place, so the real
+reader, suppressor and event-loop plumbing run here exactly as they do against
+``/dev/lircN``. Timestamps are nanoseconds, as the kernel gives them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.service_loader import load_service_modules
+from ubo_app.store.services.infrared import InfraredHandleReceivedCodeAction
+from ubo_app.store.tracing import LatencyHistogram
+from ubo_app.system.system_manager import rc_receiver
+from ubo_app.utils.infrared import InfraredCode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+(setup,) = load_service_modules(
+    Path(__file__).resolve().parents[2] / 'ubo_app' / 'services' / '090-infrared',
+    'setup',
+)
+
+NEC = rc_receiver.RC_PROTOCOL_NAMES.index('nec')
+IMON = rc_receiver.RC_PROTOCOL_NAMES.index('imon')
+MS = 1_000_000
+
+
+def _frame(
+    at_ms: float,
+    scancode: int = 0x1A,
+    *,
+    protocol: int = NEC,
+    is_repeat: bool = False,
+) -> rc_receiver.ScancodeFrame:
+    return rc_receiver.ScancodeFrame(
+        timestamp=int(at_ms * MS),
+        protocol=protocol,
+        scancode=scancode,
+        is_repeat=is_repeat,
+    )
+
+
+def _feed(*frames: rc_receiver.ScancodeFrame) -> list[InfraredCode]:
+    suppressor = rc_receiver.RepeatSuppressor()
+    return [code for frame in frames if (code := suppressor.feed(frame)) is not None]
+
+
+@pytest.fixture
+def device() -> Iterator[rc_receiver.ReplayDevice]:
+    """Stand in for the receiver's lirc device."""
+    replay = rc_receiver.ReplayDevice()
+    yield replay
+    replay.close()
+
+
+# --------------------------------------------------------------------------
+# Records
+# --------------------------------------------------------------------------
+
+
+def test_a_frame_round_trips_through_the_kernel_layout() -> None:
+    """24 bytes, with the repeat flag in the flags word."""
+    frame = _frame(5, 0xBF10, is_repeat=True)
+
+    packed = frame.pack()
+
+    assert len(packed) == rc_receiver.LIRC_SCANCODE.size == 24
+    assert rc_receiver.ScancodeFrame.unpack(packed) == frame
+
+
+def test_protocols_are_spelled_as_ir_keytable_spells_them() -> None:
+    """Devices registered from `ir-keytable` output must still match."""
+    necx = rc_receiver.RC_PROTOCOL_NAMES.index('necx')
+
+    assert _frame(0, protocol=necx).protocol_name == 'necx'
+    assert _frame(0, protocol=999).protocol_name == 'unknown'
+
+
+def test_a_code_round_trips_through_a_socket_line() -> None:
+    """What the system manager yields is what the app parses."""
+    code = InfraredCode(protocol='nec', scancode='0x1a', timestamp=42, repeat=True)
+
+    assert InfraredCode.from_line(code.to_line()) == code
+    with pytest.raises(ValueError, match='Not an infrared code'):
+        InfraredCode.from_line('nec:0x1a')
+
+
+# --------------------------------------------------------------------------
+# `RepeatSuppressor`
+# --------------------------------------------------------------------------
+
+
+def test_one_press_is_one_code() -> None:
+    """A retransmitted key-down within the hold gap is the same press."""
+    codes = _feed(_frame(0), _frame(100), _frame(200))
+
+    assert codes == [InfraredCode('nec', '0x1a', 0, repeat=False)]
+
+
+def test_a_held_button_repeats_at_the_repeat_interval() -> None:
+    """NEC repeat frames every 110 ms become a repeat every 300 ms or so."""
+    frames = [_frame(0)] + [_frame(110 * n, is_repeat=True) for n in range(1, 8)]
+
+    codes = _feed(*frames)
+
+    assert [(code.timestamp // MS, code.repeat) for code in codes] == [
+        (0, False),
+        (330, True),
+        (660, True),
+    ]
+
+
+def test_a_pause_makes_the_next_frame_a_new_press() -> None:
+    """Once the hold gap passes, the same code is pressed anew."""
+    codes = _feed(_frame(0), _frame(400))
+
+    assert [code.repeat for code in codes] == [False, False]
+
+
+def test_a_different_code_is_a_new_press_at_once() -> None:
+    """Pressing another button is never taken for a hold."""
+    codes = _feed(_frame(0, 0x1A), _frame(50, 0x1C))
+
+    assert [(code.scancode, code.repeat) for code in codes] == [
+        ('0x1a', False),
+        ('0x1c', False),
+    ]
+
+
+def test_imon_noise_is_dropped() -> None:
+    """Scancodes with almost no zero bits are the receiver's noise."""
+    codes = _feed(_frame(0, 0x7FFFFFFF, protocol=IMON), _frame(1, 0x1A, protocol=IMON))
+
+    assert [code.scancode for code in codes] == ['0x1a']
+
+
+# --------------------------------------------------------------------------
+# `receive_codes` against a replayed device
+# --------------------------------------------------------------------------
+
+
+async def test_frames_on_the_device_reach_the_app_as_codes(
+    device: rc_receiver.ReplayDevice,
+) -> None:
+    """Frames are read as soon as they arrive, and suppressed in-process."""
+    received: asyncio.Queue[InfraredCode] = asyncio.Queue()
+    stop = asyncio.Event()
+    task = asyncio.create_task(
+        rc_receiver.receive_codes(
+            device.fd,
+            rc_receiver.RepeatSuppressor(),
+            received.put_nowait,
+            stop,
+        ),
+    )
+
+    device.send(_frame(0), _frame(110, is_repeat=True), _frame(120, 0x1C))
+    codes = [await asyncio.wait_for(received.get(), timeout=5) for _ in range(2)]
+    stop.set()
+    await asyncio.wait_for(task, timeout=5)
+
+    assert [code.scancode for code in codes] == ['0x1a', '0x1c']
+    assert received.empty()
+
+
+def test_a_frame_split_across_reads_is_reassembled(
+    device: rc_receiver.ReplayDevice,
+) -> None:
+    """A short read keeps its bytes for the next one."""
+    reader = rc_receiver.ScancodeReader(device.fd)
+    packed = _frame(0).pack()
+
+    device.write(packed[:10])
+    assert reader.read() == []
+    device.write(packed[10:])
+
+    assert reader.read() == [_frame(0)]
+
+
+async def test_an_unplugged_device_ends_the_receiver(
+    device: rc_receiver.ReplayDevice,
+) -> None:
+    """The system manager learns the receiver is gone instead of hanging."""
+    device.unplug()
+
+    with pytest.raises(EOFError):
+        await asyncio.wait_for(
+            rc_receiver.receive_codes(
+                device.fd,
+                rc_receiver.RepeatSuppressor(),
+                lambda _code: None,
+                asyncio.Event(),
+            ),
+            timeout=5,
+        )
+
+
+# --------------------------------------------------------------------------
+# The app side: key-to-action latency
+# --------------------------------------------------------------------------
+
+
+async def test_key_to_action_latency_is_measured(
+    device: rc_receiver.ReplayDevice,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """From the kernel's decode to the store dispatch, on the kernel's clock."""
+    dispatched: list[object] = []
+    latency = LatencyHistogram()
+    monkeypatch.setattr(setup.store, 'dispatch', dispatched.append)
+    monkeypatch.setattr(setup, 'RECEIVE_LATENCY', latency)
+    monkeypatch.setattr(setup, '_publish_received', lambda *_args: None)
+    done = asyncio.Event()
+    stop = asyncio.Event()
+
+    def deliver(code: InfraredCode) -> None:
+        setup._handle_received(code.to_line())  # noqa: SLF001
+        done.set()
+
+    task = asyncio.create_task(
+        rc_receiver.receive_codes(
+            device.fd,
+            rc_receiver.RepeatSuppressor(),
+            deliver,
+            stop,
+        ),
+    )
+    device.send(
+        rc_receiver.ScancodeFrame(
+            timestamp=time.monotonic_ns(),
+            protocol=NEC,
+            scancode=0x1A,
+        ),
+    )
+    await asyncio.wait_for(done.wait(), timeout=5)
+    stop.set()
+    await asyncio.wait_for(task, timeout=5)
+
+    assert dispatched == [
+        InfraredHandleReceivedCodeAction(protocol='nec', scancode='0x1a'),
+    ]
+    assert latency.count == 1
+    assert 0 < latency.max < 1_000_000
+
+
+def test_a_malformed_line_is_skipped(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A stray line from an older system manager dispatches nothing."""
+    dispatched: list[object] = []
+    monkeypatch.setattr(setup.store, 'dispatch', dispatched.append)
+
+    setup._handle_received('nec:0x1a')  # noqa: SLF001
+
+    assert dispatched == []
+
+
+def test_repeats_are_not_reported_to_home_assistant(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Home Assistant's event entity fires once per press."""
+    published: list[tuple[str, str]] = []
+    monkeypatch.setattr(setup.store, 'dispatch', lambda _action: None)
+    monkeypatch.setattr(
+        setup,
+        '_publish_received',
+        lambda protocol, scancode: published.append((protocol, scancode)),
+    )
+
+    for repeat in (False, True, True):
+        code = InfraredCode('nec', '0x1a', time.monotonic_ns(), repeat=repeat)
+        setup._handle_received(code.to_line())  # noqa: SLF001
+
+    assert published == [('nec', '0x1a')]
@@ -0,0 +1,247 @@
+"""Tests for the keypad engine, driven by a simulated AW9523.
+
+Most tests call `poll` and `expire` directly with a clock the test owns, so
+hold timeouts and debounce windows are exact. One runs the engine thread for
+real, fed by the simulated chip's interrupt line.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from tests.service_loader import load_service_modules
+from ubo_app.store.services.audio import AudioSetMuteStatusAction
+from ubo_app.store.services.keypad import (
+    Key,
+    KeypadKeyHoldAction,
+    KeypadKeyPressAction,
+    KeypadKeyReleaseAction,
+    KeypadKeyUnholdAction,
+)
+
+if TYPE_CHECKING:
+    from redux import BaseAction
+
+(engine_module,) = load_service_modules(
+    Path(__file__).resolve().parents[2] / 'ubo_app' / 'services' / '000-keypad',
+    'engine',
+)
+
+MS = 1_000_000
+L1, L2 = 0, 1
+
+
+class _Harness:
+    """An engine on a simulated chip, with a clock the test moves."""
+
+    def __init__(self, *, debounce: float = 0.0, dispatch_ms: int = 0) -> None:
+        self.now = 0
+        self.actions: list[BaseAction] = []
+        self.chip = engine_module.SimulatedAW9523()
+        self.engine = engine_module.KeypadEngine(
+            self.chip,
+            self._dispatch,
+            debounce=debounce,
+            clock=lambda: self.now,
+        )
+        self.engine.reset(self.chip.inputs)
+        self.chip.on_interrupt = lambda: self.engine.poll(self.now)
+        self._dispatch_ns = dispatch_ms * MS
+
+    def _dispatch(self, action: BaseAction) -> None:
+        self.actions.append(action)
+        self.now += self._dispatch_ns
+
+    def at(self, ms: float) -> _Harness:
+        self.now = int(ms * MS)
+        self.engine.expire(self.now)
+        return self
+
+    def kinds(self) -> list[tuple[str, Any]]:
+        return [
+            (type(action).__name__, getattr(action, 'key', None))
+            for action in self.actions
+        ]
+
+
+def test_keys_pressed_in_one_interrupt_are_all_decoded() -> None:
+    """Each changed bit is its own press, and each sees the whole chord."""
+    harness = _Harness()
+
+    harness.chip.press(L1, L2)
+
+    assert harness.kinds() == [
+        ('KeypadKeyPressAction', Key.L1),
+        ('KeypadKeyPressAction', Key.L2),
+    ]
+    assert all(action.pressed_keys == (Key.L1, Key.L2) for action in harness.actions)
+
+
+def test_a_short_press_is_press_then_release() -> None:
+    """Released before the hold timeout, no hold is reported or left pending."""
+    harness = _Harness()
+
+    harness.chip.press(L1)
+    harness.at(200).chip.release(L1)
+    harness.at(1000)
+
+    assert harness.kinds() == [
+        ('KeypadKeyPressAction', Key.L1),
+        ('KeypadKeyReleaseAction', Key.L1),
+    ]
+    assert harness.actions[-1].pressed_keys == ()
+
+
+def test_a_long_press_holds_then_unholds() -> None:
+    """The timer wheel fires the hold at the timeout, without a thread per key."""
+    harness = _Harness()
+
+    harness.chip.press(L1)
+    harness.at(499)
+    assert len(harness.actions) == 1
+    harness.at(500)
+    harness.at(800).chip.release(L1)
+
+    assert harness.kinds() == [
+        ('KeypadKeyPressAction', Key.L1),
+        ('KeypadKeyHoldAction', Key.L1),
+        ('KeypadKeyUnholdAction', Key.L1),
+        ('KeypadKeyReleaseAction', Key.L1),
+    ]
+    hold = harness.actions[1]
+    assert isinstance(hold, KeypadKeyHoldAction)
+    assert hold.held_keys == (Key.L1,)
+    assert harness.actions[3].held_keys == ()
+
+
+def test_a_held_key_is_reported_with_a_second_press() -> None:
+    """Chords like hold-L1-press-L2 see the held key."""
+    harness = _Harness()
+
+    harness.chip.press(L1)
+    harness.at(600).chip.press(L2)
+
+    press = harness.actions[-1]
+    assert isinstance(press, KeypadKeyPressAction)
+    assert press.key is Key.L2
+    assert press.held_keys == (Key.L1,)
+
+
+def test_bounces_inside_the_window_are_ignored() -> None:
+    """The first edge is reported at once; its chatter is not."""
+    harness = _Harness(debounce=0.02)
+
+    harness.chip.press(L1)
+    harness.at(2).chip.release(L1)
+    harness.at(4).chip.press(L1)
+    harness.at(30)
+
+    assert harness.kinds() == [('KeypadKeyPressAction', Key.L1)]
+
+
+def test_a_bounce_that_ends_released_is_reported_when_the_window_closes() -> None:
+    """A tap shorter than the window is not lost, only reported late."""
+    harness = _Harness(debounce=0.02)
+
+    harness.chip.press(L1)
+    harness.at(5).chip.release(L1)
+    assert len(harness.actions) == 1
+    harness.at(20)
+
+    assert harness.kinds() == [
+        ('KeypadKeyPressAction', Key.L1),
+        ('KeypadKeyReleaseAction', Key.L1),
+    ]
+
+
+def test_the_mic_switch_mutes_and_unmutes() -> None:
+    """Bit 7 is the mute switch, not a key."""
+    harness = _Harness()
+
+    harness.chip.press(engine_module.MIC_INDEX)
+    harness.at(10).chip.release(engine_module.MIC_INDEX)
+
+    assert [
+        action.is_mute
+        for action in harness.actions
+        if isinstance(action, AudioSetMuteStatusAction)
+    ] == [True, False]
+
+
+def test_key_to_action_latency_is_measured_per_action_type() -> None:
+    """From the edge to the dispatch returning; from the deadline for a hold."""
+    harness = _Harness(dispatch_ms=3)
+
+    harness.chip.press(L1)
+    harness.at(500)
+    harness.at(700).chip.release(L1)
+
+    summary = harness.engine.latency_summary()
+    assert summary['press']['max'] == 3000
+    assert summary['hold']['max'] == 3000
+    assert summary['unhold']['count'] == 1
+    # The release waited behind the unhold dispatched before it.
+    assert summary['release']['max'] == 6000
+
+
+def test_the_timer_wheel_keeps_timers_beyond_one_turn() -> None:
+    """A deadline several turns out waits in its bucket for the right turn."""
+    wheel = engine_module.TimerWheel(tick=10, slots=4)
+    fired: list[int] = []
+    wheel.schedule(95, fired.append)
+    cancelled = wheel.schedule(50, fired.append)
+    wheel.schedule(15, fired.append)
+    wheel.cancel(cancelled)
+
+    for now in range(0, 120, 5):
+        wheel.advance(now)
+
+    assert fired == [15, 95]
+    assert len(wheel) == 0
+
+
+def test_a_late_deadline_still_fires_on_the_next_advance() -> None:
+    """Scheduling behind the wheel does not wait a whole turn."""
+    wheel = engine_module.TimerWheel(tick=10, slots=4)
+    fired: list[int] = []
+    wheel.advance(100)
+
+    wheel.schedule(60, fired.append)
+    wheel.advance(101)
+
+    assert fired == [60]
+
+
+@pytest.mark.timeout(10)
+def test_the_engine_thread_serves_the_interrupt_line() -> None:
+    """The interrupt only queues the edge; the engine thread does the rest."""
+    chip = engine_module.SimulatedAW9523()
+    released = threading.Event()
+    actions: list[BaseAction] = []
+
+    def dispatch(action: BaseAction) -> None:
+        actions.append(action)
+        if isinstance(action, KeypadKeyReleaseAction):
+            released.set()
+
+    engine = engine_module.KeypadEngine(chip, dispatch, hold_timeout=0.05)
+    chip.on_interrupt = engine.notify_edge
+    engine.start(chip.inputs)
+    try:
+        chip.press(L1)
+        assert not released.wait(0.15)
+        chip.release(L1)
+        assert released.wait(5)
+    finally:
+        engine.stop()
+
+    assert [type(action) for action in actions] == [
+        KeypadKeyPressAction,
+        KeypadKeyHoldAction,
+        KeypadKeyUnholdAction,
+        KeypadKeyReleaseAction,
+    ]
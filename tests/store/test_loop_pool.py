@@ -0,0 +1,244 @@
+"""Tests for services sharing event loops instead of a thread each."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from ubo_app import service_thread as service_module
+from ubo_app.service_thread import UboServiceThread
+from ubo_app.store.settings.types import SettingsServiceSetStatusAction
+from ubo_app.utils import loop_pool as loop_pool_module
+from ubo_app.utils.loop_pool import LoopPool, SharedLoop
+from ubo_app.utils.service import get_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterator
+    from pathlib import Path
+
+
+class _RecordingStore:
+    """Store double recording dispatched actions."""
+
+    def __init__(self) -> None:
+        self.actions: list[object] = []
+
+    def dispatch(self, *actions: object) -> None:
+        """Record dispatched actions."""
+        self.actions.extend(actions)
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> _RecordingStore:
+    """Stand in for the store and the D-Bus bookkeeping services touch."""
+    store = _RecordingStore()
+    fake_main = ModuleType('ubo_app.store.main')
+    fake_main.store = store  # type: ignore[attr-defined]
+    bus_provider = ModuleType('ubo_app.utils.bus_provider')
+    bus_provider.system_buses = {}  # type: ignore[attr-defined]
+    bus_provider.user_buses = {}  # type: ignore[attr-defined]
+    from ubo_app import utils
+
+    monkeypatch.setitem(sys.modules, 'ubo_app.store.main', fake_main)
+    monkeypatch.setitem(sys.modules, 'ubo_app.utils.bus_provider', bus_provider)
+    monkeypatch.setattr(utils, 'bus_provider', bus_provider, raising=False)
+    monkeypatch.setattr(service_module, 'DISABLED_SERVICES', [])
+    monkeypatch.setattr(service_module, 'ENABLED_SERVICES', [])
+    return store
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> Iterator[LoopPool]:
+    """Give the services a pool of one loop."""
+    pool = LoopPool(1)
+    monkeypatch.setattr(service_module, 'loop_pool', pool)
+    yield pool
+    pool.stop()
+
+
+def _shared_service(
+    tmp_path: Path,
+    service_id: str,
+    setup: Callable[[], Coroutine[None, None, None]],
+) -> UboServiceThread:
+    service = UboServiceThread(tmp_path / f'090-{service_id}')
+    service.register(
+        service_id=service_id,
+        label=service_id.title(),
+        setup=setup,
+        shares_loop=True,
+    )
+    return service
+
+
+async def test_stopping_a_shared_service_cancels_only_its_tasks(
+    store: _RecordingStore,
+    pool: LoopPool,
+    tmp_path: Path,
+) -> None:
+    """Both services run on one thread, yet each stops on its own."""
+    seen: dict[str, tuple[str, UboServiceThread]] = {}
+    cancelled: list[str] = []
+    ready = {'alpha': threading.Event(), 'beta': threading.Event()}
+
+    def setup_of(service_id: str) -> Callable[[], Coroutine[None, None, None]]:
+        async def work() -> None:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(service_id)
+                raise
+
+        async def setup() -> None:
+            seen[service_id] = (threading.current_thread().name, get_service())
+            asyncio.get_running_loop().create_task(work())
+            ready[service_id].set()
+
+        return setup
+
+    alpha = _shared_service(tmp_path, 'alpha', setup_of('alpha'))
+    beta = _shared_service(tmp_path, 'beta', setup_of('beta'))
+    assert alpha.runs_on_shared_loop
+    alpha.start()
+    beta.start()
+    for event in ready.values():
+        assert await asyncio.to_thread(event.wait, 5)
+
+    assert alpha.shared_loop is beta.shared_loop
+    assert alpha.ident is None
+    assert seen == {
+        'alpha': ('shared-loop-0', alpha),
+        'beta': ('shared-loop-0', beta),
+    }
+    assert alpha.is_alive()
+
+    alpha.stop()
+    await asyncio.to_thread(alpha.join, 5)
+
+    assert not alpha.is_alive()
+    assert beta.is_alive()
+    assert cancelled == ['alpha']
+    assert (
+        SettingsServiceSetStatusAction(service_id='alpha', is_active=False)
+        in store.actions
+    )
+    assert pool.lag_summary().keys() == {'shared-loop-0'}
+
+    beta.stop()
+    await asyncio.to_thread(beta.join, 5)
+
+    assert cancelled == ['alpha', 'beta']
+    assert cast('SharedLoop', beta.shared_loop).services == set()
+
+
+@pytest.mark.usefixtures('pool')
+async def test_killing_a_shared_service_leaves_the_thread_alone(
+    store: _RecordingStore,
+    tmp_path: Path,
+) -> None:
+    """A service that will not stop is abandoned, not interrupted."""
+    ready = threading.Event()
+
+    async def stubborn() -> None:
+        while True:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                continue
+
+    async def setup() -> None:
+        asyncio.get_running_loop().create_task(stubborn())
+        ready.set()
+
+    service = _shared_service(tmp_path, 'alpha', setup)
+    service.start()
+    assert await asyncio.to_thread(ready.wait, 5)
+    shared_loop = cast('SharedLoop', service.shared_loop)
+
+    service.kill()
+    await asyncio.to_thread(service.join, 5)
+
+    assert not service.is_alive()
+    assert shared_loop.is_alive()
+    assert shared_loop.services == set()
+    assert (
+        SettingsServiceSetStatusAction(service_id='alpha', is_active=False)
+        in store.actions
+    )
+
+
+def test_a_blocked_shared_loop_reports_its_lag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The probe notices a callback holding the loop."""
+    monkeypatch.setattr(loop_pool_module, 'LAG_PROBE_INTERVAL', 0.01)
+    shared_loop = SharedLoop(0)
+    shared_loop.start()
+    try:
+        shared_loop.loop.call_soon_threadsafe(time.sleep, 0.2)
+        deadline = time.monotonic() + 5
+        while shared_loop.lag.max < 150_000 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        shared_loop.stop()
+        shared_loop.join(timeout=1)
+
+    assert shared_loop.lag.max >= 150_000
+
+
+def test_the_pool_spreads_services_over_its_loops() -> None:
+    """Loops start as needed, then the least busy one takes the next service."""
+    pool = LoopPool(2)
+    try:
+        first = pool.assign('alpha')
+        second = pool.assign('beta')
+        third = pool.assign('gamma')
+        pool.release(first, 'alpha')
+        fourth = pool.assign('delta')
+    finally:
+        pool.stop()
+
+    assert first is not second
+    assert third is first
+    assert fourth is first
+    assert first.services == {'gamma', 'delta'}
+
+
+def test_shared_services_stay_out_of_the_reducer_barrier(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Only services on their own thread meet at the barrier."""
+    from ubo_app.store.core import view_computation
+
+    released: list[str] = []
+    monkeypatch.setattr(view_computation, 'suppress_view_autorun', lambda: None)
+    monkeypatch.setattr(
+        view_computation,
+        'release_view_autorun',
+        lambda: released.append('release'),
+    )
+    monkeypatch.setattr(service_module, 'loop_pool', LoopPool(1))
+    shared = UboServiceThread(tmp_path / '090-shared')
+    shared.service_id = 'shared'
+    shared.shares_loop = True
+    own = UboServiceThread(tmp_path / '090-own')
+    own.service_id = 'own'
+
+    service_module._setup_reducer_barrier([shared, own])  # noqa: SLF001
+
+    assert shared._reducer_barrier is None  # noqa: SLF001
+    barrier = own._reducer_barrier  # noqa: SLF001
+    assert barrier is not None
+    assert barrier.parties == 1
+    assert released == []
+
+    service_module._setup_reducer_barrier([shared])  # noqa: SLF001
+
+    assert released == ['release']
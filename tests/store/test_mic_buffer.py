@@ -143,3 +143,27 @@ def test_dump_creates_output_dir_lazily(
     assert path is not None
     assert output_dir.is_dir()
     assert path.parent == output_dir
+
+
+def test_lead_in_returns_recent_speech_recognition_audio(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """lead_in() joins the last seconds of speech-recognition samples in order."""
+    mod = _load_mic_buffer(monkeypatch)
+    buf = mod.MicBuffer(duration_seconds=5.0, output_dir=tmp_path)
+
+    assert buf.lead_in(1.0) == b''
+
+    buf.add(0.0, _make_sample(b'\x00\x00'), b'a')
+    buf.add(0.5, _make_sample(b'\x00\x00'), b'b')
+    buf.add(1.0, _make_sample(b'\x00\x00'))  # No recognition copy to keep.
+    buf.add(1.5, _make_sample(b'\x00\x00'), b'c')
+
+    assert buf.lead_in(0.0) == b'c'
+    assert buf.lead_in(1.0) == b'bc'
+    assert buf.lead_in(10.0) == b'abc'
+
+    # Pruned with the rest of the window.
+    buf.add(6.0, _make_sample(b'\x00\x00'), b'd')
+    assert buf.lead_in(10.0) == b'cd'
@@ -0,0 +1,314 @@
+"""Tests for the MQTT bridge's outbound path: coalescing and pipelining.
+
+`OutboundQueue` is pure and tested directly. The pump is tested against a real
+`aiomqtt.Client` talking to `_Broker`, a minimal MQTT 3.1.1 broker on a local
+socket in this process. It speaks just enough of the protocol for one client
+to connect and publish, and it can hold back its acknowledgements. That is the
+one thing a slow broker does that matters here, and no fake client can show
+what paho actually writes to the wire while acknowledgements are pending.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import aiomqtt
+import pytest
+
+from tests.service_loader import load_service_modules
+from ubo_app.store.services.mqtt import MqttPublishEvent
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+client, outbound = load_service_modules(
+    Path(__file__).resolve().parents[2] / 'ubo_app' / 'services' / '050-mqtt',
+    'client',
+    'outbound',
+)
+
+_CONNECT, _PUBLISH, _PINGREQ, _DISCONNECT = 1, 3, 12, 14
+_PUBACK = 0x40
+
+
+class Received(NamedTuple):
+    """One publish as the broker saw it."""
+
+    topic: str
+    payload: bytes
+    qos: int
+    retain: bool
+
+
+class _Broker:
+    """Accept a client; record its publishes; optionally hold back the acks."""
+
+    def __init__(self) -> None:
+        self.received: list[Received] = []
+        self.acknowledged = 0
+        self.arrived = asyncio.Condition()
+        self._held: list[bytes] = []
+        self._is_holding = False
+        self._writer: asyncio.StreamWriter | None = None
+
+    def hold_acks(self) -> None:
+        """Stop acknowledging publishes, as a broker that has fallen behind."""
+        self._is_holding = True
+
+    async def release_acks(self) -> None:
+        """Send every held acknowledgement and go back to acking at once."""
+        self._is_holding = False
+        held, self._held = self._held, []
+        for packet in held:
+            await self._send(packet)
+
+    async def wait_for(self, count: int) -> None:
+        """Wait until `count` publishes have arrived."""
+        async with asyncio.timeout(5), self.arrived:
+            await self.arrived.wait_for(lambda: len(self.received) >= count)
+
+    async def _send(self, packet: bytes) -> None:
+        assert self._writer is not None
+        if packet[0] == _PUBACK:
+            self.acknowledged += 1
+        self._writer.write(packet)
+        await self._writer.drain()
+
+    async def _read_packet(self, reader: asyncio.StreamReader) -> tuple[int, bytes]:
+        header = (await reader.readexactly(1))[0]
+        length, shift = 0, 0
+        while True:
+            byte = (await reader.readexactly(1))[0]
+            length |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                break
+        return header, await reader.readexactly(length)
+
+    async def _publish(self, flags: int, body: bytes) -> None:
+        qos = (flags >> 1) & 0x03
+        (topic_length,) = struct.unpack_from('!H', body)
+        offset = 2 + topic_length
+        topic = body[2:offset].decode()
+        packet_id = b''
+        if qos:
+            packet_id = body[offset : offset + 2]
+            offset += 2
+        async with self.arrived:
+            self.received.append(
+                Received(topic, body[offset:], qos, retain=bool(flags & 0x01)),
+            )
+            self.arrived.notify_all()
+        if not qos:
+            return
+        # QoS 1 only: nothing in these tests publishes at 2.
+        ack = bytes((_PUBACK, 2)) + packet_id
+        if self._is_holding:
+            self._held.append(ack)
+        else:
+            await self._send(ack)
+
+    async def serve(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self._writer = writer
+        try:
+            while True:
+                header, body = await self._read_packet(reader)
+                kind = header >> 4
+                if kind == _CONNECT:
+                    await self._send(b'\x20\x02\x00\x00')
+                elif kind == _PUBLISH:
+                    await self._publish(header & 0x0F, body)
+                elif kind == _PINGREQ:
+                    await self._send(b'\xd0\x00')
+                elif kind == _DISCONNECT:
+                    return
+        except asyncio.IncompleteReadError:
+            return
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def broker() -> AsyncIterator[tuple[_Broker, int]]:
+    """Run a `_Broker` on an ephemeral loopback port."""
+    instance = _Broker()
+    server = await asyncio.start_server(instance.serve, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield instance, port
+
+
+@pytest.fixture
+async def pump(
+    broker: tuple[_Broker, int],
+) -> AsyncIterator[outbound.OutboundQueue]:
+    """Connect a real client to the broker and run the bridge's pump on it."""
+    _, port = broker
+    queue = outbound.OutboundQueue(maxsize=64)
+    async with aiomqtt.Client(hostname='127.0.0.1', port=port) as mqtt_client:
+        task = asyncio.create_task(client._pump(mqtt_client, 'pod', queue))  # noqa: SLF001
+        try:
+            yield queue
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+def _event(
+    payload: str,
+    *,
+    channel: str = 'sensor/state',
+    qos: int = 0,
+    retain: bool = False,
+    coalesce: bool = False,
+) -> MqttPublishEvent:
+    return MqttPublishEvent(
+        channel=channel,
+        payload=payload,
+        qos=qos,
+        retain=retain,
+        coalesce=coalesce,
+    )
+
+
+def _drain(queue: outbound.OutboundQueue) -> list[str]:
+    payloads: list[str] = []
+    while not queue.empty():
+        payloads.append(queue.get_nowait().payload)
+    return payloads
+
+
+# --------------------------------------------------------------------------
+# `OutboundQueue`
+# --------------------------------------------------------------------------
+
+
+def test_state_is_replaced_in_place_by_a_newer_value() -> None:
+    """The newest reading goes out, in the slot the first one took."""
+    queue = outbound.OutboundQueue(maxsize=8)
+    queue.put_nowait(_event('1', coalesce=True))
+    queue.put_nowait(_event('ir', channel='infrared/received'))
+    queue.put_nowait(_event('2', coalesce=True))
+    queue.put_nowait(_event('3', coalesce=True))
+
+    assert _drain(queue) == ['3', 'ir']
+    assert queue.coalesced == 2
+
+
+def test_events_and_acknowledged_publishes_are_never_coalesced() -> None:
+    """Two infrared codes are two button presses; QoS 1 asked for delivery."""
+    queue = outbound.OutboundQueue(maxsize=8)
+    queue.put_nowait(_event('a', channel='infrared/received'))
+    queue.put_nowait(_event('b', channel='infrared/received'))
+    queue.put_nowait(_event('c', qos=1, coalesce=True))
+    queue.put_nowait(_event('d', qos=1, coalesce=True))
+
+    assert _drain(queue) == ['a', 'b', 'c', 'd']
+
+
+def test_a_retained_and_a_live_value_keep_separate_slots() -> None:
+    """The slot key is `(channel, retain)`, so one cannot erase the other."""
+    queue = outbound.OutboundQueue(maxsize=8)
+    queue.put_nowait(_event('live', coalesce=True))
+    queue.put_nowait(_event('kept', retain=True, coalesce=True))
+
+    assert _drain(queue) == ['live', 'kept']
+
+
+def test_a_replacement_fits_a_full_queue() -> None:
+    """Only a publish that needs a new slot can overflow."""
+    queue = outbound.OutboundQueue(maxsize=1)
+    queue.put_nowait(_event('1', coalesce=True))
+    queue.put_nowait(_event('2', coalesce=True))
+
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(_event('ir', channel='infrared/received'))
+    assert _drain(queue) == ['2']
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+async def test_get_waits_for_a_publish() -> None:
+    """The pump blocks on an empty queue rather than spinning."""
+    queue = outbound.OutboundQueue(maxsize=8)
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not getter.done()
+
+    queue.put_nowait(_event('1'))
+
+    assert (await asyncio.wait_for(getter, timeout=5)).payload == '1'
+
+
+def test_enqueue_coalesces_through_the_live_queue(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The bridge's entry point feeds the coalescing queue, not a FIFO."""
+    queue = outbound.OutboundQueue(maxsize=8)
+    monkeypatch.setattr(client, '_queue', queue)
+
+    client.enqueue(_event('1', coalesce=True))
+    client.enqueue(_event('2', coalesce=True))
+
+    assert _drain(queue) == ['2']
+
+
+# --------------------------------------------------------------------------
+# `_pump` against a local broker
+# --------------------------------------------------------------------------
+
+
+async def test_publishes_are_pipelined_not_acknowledged_one_by_one(
+    broker: tuple[_Broker, int],
+    pump: outbound.OutboundQueue,
+) -> None:
+    """Every QoS 1 publish is on the wire before the first is acknowledged."""
+    server, _ = broker
+    server.hold_acks()
+
+    for payload in ('1', '2', '3'):
+        pump.put_nowait(_event(payload, channel='events', qos=1))
+    await server.wait_for(3)
+
+    assert server.acknowledged == 0
+    assert [message.payload for message in server.received] == [b'1', b'2', b'3']
+    assert {message.topic for message in server.received} == {'ubo/pod/events'}
+    await server.release_acks()
+
+
+async def test_a_slow_broker_gets_fresh_state_not_stale(
+    broker: tuple[_Broker, int],
+    pump: outbound.OutboundQueue,
+) -> None:
+    """Behind a full window, readings wait where a newer one replaces them.
+
+    A FIFO would have delivered all five readings, oldest first — or, once
+    full, dropped the newest and delivered only stale ones.
+    """
+    server, _ = broker
+    server.hold_acks()
+    window = client.OUTBOUND_MAX_IN_FLIGHT
+    for index in range(window):
+        pump.put_nowait(_event(str(index), channel='events', qos=1))
+    await server.wait_for(window)
+
+    for reading in range(5):
+        pump.put_nowait(_event(f'reading {reading}', coalesce=True))
+    pump.put_nowait(_event('ir', channel='infrared/received'))
+    await asyncio.sleep(0.1)
+    assert len(server.received) == window
+
+    await server.release_acks()
+    await server.wait_for(window + 2)
+
+    assert [message.payload for message in server.received[window:]] == [
+        b'reading 4',
+        b'ir',
+    ]
@@ -147,7 +147,7 @@ def _two_sticky_setup(
 
 def _by_id(notif_state: NotificationsState, notification_id: str) -> object:
     """Return the live ``Notification`` instance (identity matters to clear)."""
-    return next(n for n in notif_state.notifications if n.id == notification_id)
+    return notif_state.notifications[notification_id]
 
 
 def _notification_ids_on_stack(main_state: MainState) -> set[str]:
@@ -207,7 +207,7 @@ def test_dismiss_top_keeps_other(monkeypatch: pytest.MonkeyPatch) -> None:
     main_state, notif_state = _dismiss(ns, main_state, notif_state, top, blind_pop=True)
 
     assert _notification_ids_on_stack(main_state) == {'notif-A'}
-    assert [n.id for n in notif_state.notifications] == ['notif-A']
+    assert list(notif_state.notifications) == ['notif-A']
 
 
 def test_blind_pop_dismisses_wrong_notification(
@@ -233,7 +233,7 @@ def test_blind_pop_dismisses_wrong_notification(
     # Bug: B's overlay was popped too, even though A was dismissed.
     assert _notification_ids_on_stack(main_state) == set()
     # A is correctly gone from the list, but B's overlay is orphaned off-stack.
-    assert [n.id for n in notif_state.notifications] == ['notif-B']
+    assert list(notif_state.notifications) == ['notif-B']
 
 
 def test_keyed_pop_only_preserves_other(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -255,7 +255,7 @@ def test_keyed_pop_only_preserves_other(monkeypatch: pytest.MonkeyPatch) -> None
     )
 
     assert _notification_ids_on_stack(main_state) == {'notif-B'}
-    assert [n.id for n in notif_state.notifications] == ['notif-B']
+    assert list(notif_state.notifications) == ['notif-B']
 
 
 def test_clear_all_removes_every_notification_and_pops_each(
@@ -274,7 +274,7 @@ def test_clear_all_removes_every_notification_and_pops_each(
     clear_all = ns.reducer.__globals__['NotificationsClearAllAction']
     result = ns.reducer(state, clear_all())
 
-    assert result.state.notifications == []
+    assert result.state.notifications == {}
     assert result.state.unread_count == 0
     # Each cleared notification is popped off the stack by id and announced.
     assert {action.notification_id for action in result.actions} == {
@@ -310,7 +310,7 @@ def test_re_adding_same_notification_does_not_duplicate(
     result = ns.reducer(state, ns.NotificationsAddAction(notification=notification))
 
     assert result.state is state
-    assert [n.id for n in result.state.notifications] == ['notif-A']
+    assert list(result.state.notifications) == ['notif-A']
 
 
 def test_display_action_emits_indexed_display_event(
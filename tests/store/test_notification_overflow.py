@@ -71,7 +71,7 @@ def _make_state_with_notification(
     from unittest.mock import MagicMock
 
     state = MagicMock()
-    state.notifications.notifications = [notification]
+    state.notifications.notifications = {notification.id: notification}
     return cast('RootState', state)
 
 
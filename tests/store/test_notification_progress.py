@@ -0,0 +1,292 @@
+"""Tests for coalesced progress-notification updates.
+
+Two halves:
+
+* ``ProgressNotificationChannel`` (``ubo_app/utils/progress_notification.py``)
+  rate-limits, thresholds and coalesces ``NotificationsAddAction`` dispatches
+  per notification id, always delivering the last value and never flushing
+  after a ``discard``.
+* The notifications reducer keeps ``unread_count``/``progress``/``progress_ids``
+  in step with an add, an in-place replacement or a clear by adjusting them by
+  the notification's share, and falls back to a sum over the progress
+  notifications when that share is indeterminate (NaN).
+
+Class-identity discipline mirrors ``test_notification_dismiss_stack.py``:
+integration tests earlier in the suite wipe ``sys.modules``, so the reducer is
+exec'd from file against a freshly-reloaded store-types module generation.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import math
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ubo_app.store.services.notifications import NotificationsState
+
+
+SERVICE_PATH = Path(__file__).parents[2] / 'ubo_app/services/010-notifications'
+
+
+def _load_reducer(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    monkeypatch.syspath_prepend(SERVICE_PATH.as_posix())
+
+    from ubo_app.store.services import notifications as module
+
+    module = importlib.reload(module)
+
+    spec = importlib.util.spec_from_file_location(
+        'notifications_service_reducer',
+        SERVICE_PATH / 'reducer.py',
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    reducer_module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = reducer_module
+    spec.loader.exec_module(reducer_module)
+
+    return SimpleNamespace(
+        reducer=reducer_module.reducer,
+        Notification=module.Notification,
+        NotificationsAddAction=module.NotificationsAddAction,
+        NotificationsClearByIdAction=module.NotificationsClearByIdAction,
+        NotificationsState=module.NotificationsState,
+    )
+
+
+def _channel(
+    monkeypatch: pytest.MonkeyPatch,
+    clock: list[float],
+    **kwargs: float,
+) -> tuple[object, Mock, list[tuple[Callable[[], None], float]]]:
+    from ubo_app.utils import progress_notification
+
+    dispatch = Mock()
+    monkeypatch.setattr(progress_notification.store, 'dispatch', dispatch)
+    monkeypatch.setattr(progress_notification.time, 'monotonic', lambda: clock[0])
+    scheduled: list[tuple[Callable[[], None], float]] = []
+    channel = progress_notification.ProgressNotificationChannel(
+        schedule=lambda callback, delay: scheduled.append((callback, delay)),
+        **kwargs,
+    )
+    return channel, dispatch, scheduled
+
+
+def _notification(progress: float | None, id: str = 'download') -> object:
+    from ubo_app.store.services.notifications import Notification
+
+    return Notification(id=id, title='Downloading', content='', progress=progress)
+
+
+def _dispatched_progress(dispatch: Mock) -> list[float | None]:
+    return [call.args[0].notification.progress for call in dispatch.call_args_list]
+
+
+def test_first_and_terminal_reports_go_out_immediately(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The first report and a completed one bypass the rate limit."""
+    clock = [100.0]
+    channel, dispatch, scheduled = _channel(monkeypatch, clock, min_interval=10)
+
+    channel.report(_notification(0.0))
+    channel.report(_notification(1.0))
+
+    assert _dispatched_progress(dispatch) == [0.0, 1.0]
+    assert scheduled == []
+
+
+def test_small_moves_wait_an_interval(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Updates below ``min_delta`` are held, so the latest value still goes out."""
+    clock = [100.0]
+    channel, dispatch, scheduled = _channel(
+        monkeypatch,
+        clock,
+        min_interval=0.25,
+        min_delta=0.05,
+    )
+
+    channel.report(_notification(0.10))
+    clock[0] += 1
+    channel.report(_notification(0.12))
+    channel.report(_notification(0.14))
+    assert _dispatched_progress(dispatch) == [0.10]
+    assert [delay for _, delay in scheduled] == [0.25]
+
+    clock[0] += 0.25
+    scheduled[0][0]()
+
+    assert _dispatched_progress(dispatch) == [0.10, 0.14]
+    assert channel.coalesced == 1
+    assert len(scheduled) == 1
+
+
+def test_updates_inside_the_interval_coalesce_to_the_last_value(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A burst inside the interval is flushed once, with its latest value."""
+    clock = [100.0]
+    channel, dispatch, scheduled = _channel(
+        monkeypatch,
+        clock,
+        min_interval=0.25,
+        min_delta=0,
+    )
+
+    channel.report(_notification(0.1))
+    channel.report(_notification(0.1, id='upload'))
+    clock[0] += 0.1
+    for value in (0.2, 0.3, 0.4):
+        channel.report(_notification(value))
+    channel.report(_notification(0.2, id='upload'))
+    # One flush for both ids.
+    assert [delay for _, delay in scheduled] == [pytest.approx(0.15)]
+
+    clock[0] += 0.15
+    scheduled[0][0]()
+
+    assert _dispatched_progress(dispatch) == [0.1, 0.1, 0.4, 0.2]
+    assert channel.dispatched == 4
+    assert channel.coalesced == 2
+    assert len(scheduled) == 1
+
+
+def test_dispatch_happens_outside_the_lock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """What a dispatch sets off may report progress itself, and goes out after."""
+    clock = [100.0]
+    channel, dispatch, _ = _channel(monkeypatch, clock)
+
+    def report_again(action: object) -> None:
+        if action.notification.id == 'download':
+            channel.report(_notification(0.5, id='upload'))
+
+    dispatch.side_effect = report_again
+    thread = threading.Thread(target=channel.report, args=(_notification(0.1),))
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    ids = [call.args[0].notification.id for call in dispatch.call_args_list]
+    assert ids == ['download', 'upload']
+
+
+def test_discard_cancels_the_pending_flush(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A discarded id never flushes, so a cleared notification stays cleared."""
+    clock = [100.0]
+    channel, dispatch, scheduled = _channel(monkeypatch, clock, min_interval=0.01)
+
+    channel.report(_notification(0.1))
+    channel.report(_notification(0.5))
+    channel.discard('download')
+    clock[0] += 1
+    scheduled[0][0]()
+
+    assert _dispatched_progress(dispatch) == [0.1]
+
+
+def test_reducer_adjusts_aggregates_in_place(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Replacing a notification shifts unread/progress by its share only."""
+    ns = _load_reducer(monkeypatch)
+    state: NotificationsState = ns.NotificationsState(
+        notifications={
+            'other': ns.Notification(id='other', title='', content='', is_read=True),
+        },
+        unread_count=0,
+    )
+
+    for value in (0.0, 0.25, 0.5):
+        state = ns.reducer(
+            state,
+            ns.NotificationsAddAction(
+                notification=ns.Notification(
+                    id='download',
+                    title='',
+                    content='',
+                    progress=value,
+                    progress_weight=2,
+                ),
+            ),
+        ).state
+
+    assert list(state.notifications) == ['download', 'other']
+    assert state.unread_count == 1
+    assert state.progress == 1.0
+
+    state = ns.reducer(state, ns.NotificationsClearByIdAction(id='download')).state
+    assert state.unread_count == 0
+    assert state.progress is None
+
+
+def test_reducer_recovers_from_indeterminate_progress(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A NaN share replaced by a real value yields a finite total again."""
+    ns = _load_reducer(monkeypatch)
+    state: NotificationsState = ns.NotificationsState(notifications={}, unread_count=0)
+
+    for value in (math.nan, 0.5):
+        state = ns.reducer(
+            state,
+            ns.NotificationsAddAction(
+                notification=ns.Notification(
+                    id='upload',
+                    title='',
+                    content='',
+                    progress=value,
+                ),
+            ),
+        ).state
+
+    assert state.progress == 0.5
+
+
+def test_reducer_tracks_progress_notifications(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Progress ids follow notifications gaining, losing and clearing progress."""
+    ns = _load_reducer(monkeypatch)
+    state: NotificationsState = ns.NotificationsState(notifications={}, unread_count=0)
+
+    def add(id: str, progress: float | None) -> NotificationsState:
+        return ns.reducer(
+            state,
+            ns.NotificationsAddAction(
+                notification=ns.Notification(
+                    id=id,
+                    title='',
+                    content='',
+                    progress=progress,
+                ),
+            ),
+        ).state
+
+    state = add('download', 0.5)
+    state = add('message', None)
+    state = add('upload', 0.25)
+    assert list(state.notifications) == ['upload', 'message', 'download']
+    assert state.progress_ids == ('upload', 'download')
+    assert state.progress == 0.75
+    assert state.unread_count == 3
+
+    state = add('download', None)
+    assert list(state.notifications) == ['upload', 'message', 'download']
+    assert state.progress_ids == ('upload',)
+    assert state.progress == 0.25
+
+    state = ns.reducer(state, ns.NotificationsClearByIdAction(id='upload')).state
+    assert state.progress_ids == ()
+    assert state.progress is None
+    assert state.unread_count == 2
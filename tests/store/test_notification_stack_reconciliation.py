@@ -251,26 +251,26 @@ def test_is_background_notification_filters_overlay_visibility(
 
     state = SimpleNamespace(
         notifications=SimpleNamespace(
-            notifications=[
-                ns.Notification(
+            notifications={
+                'bg': ns.Notification(
                     id='bg',
                     title='x',
                     content='',
                     display_type=ns.NotificationDisplayType.BACKGROUND,
                 ),
-                ns.Notification(
+                'sticky': ns.Notification(
                     id='sticky',
                     title='x',
                     content='',
                     display_type=ns.NotificationDisplayType.STICKY,
                 ),
-                ns.Notification(
+                'flash': ns.Notification(
                     id='flash',
                     title='x',
                     content='',
                     display_type=ns.NotificationDisplayType.FLASH,
                 ),
-            ],
+            },
         ),
     )
 
@@ -90,7 +90,8 @@ async def test_run_survives_malformed_chunk(
 
     engine = module.OpenWakeWordEngine()
     engine.triggers = (WakeTrigger(id='trigger-id', value='hey_test'),)
-    engine._model = object()  # noqa: SLF001
+    engine._front_end = object()  # noqa: SLF001
+    engine._heads = {'hey_test': object()}  # noqa: SLF001
 
     await engine.input_queue.put(5)
     await engine.input_queue.put(b'ab')
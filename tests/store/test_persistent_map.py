@@ -0,0 +1,90 @@
+"""Tests for the persistent map the notifications are kept in."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ubo_app.utils.persistent_map import PersistentMap
+
+
+class _Key:
+    """A key of few hashes, so that keys collide."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return self.value % 7
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Key) and other.value == self.value
+
+    def __repr__(self) -> str:
+        return f'_Key({self.value})'
+
+
+def test_updates_leave_the_original_alone() -> None:
+    """`set` and `delete` return new maps; new keys come first."""
+    original = PersistentMap([('a', 1), ('b', 2)])
+
+    added = original.set('c', 3)
+    replaced = added.set('a', 10)
+    removed = replaced.delete('b')
+
+    assert list(original.items()) == [('a', 1), ('b', 2)]
+    assert list(added.items()) == [('c', 3), ('a', 1), ('b', 2)]
+    assert list(replaced.items()) == [('c', 3), ('a', 10), ('b', 2)]
+    assert list(removed.items()) == [('c', 3), ('a', 10)]
+    assert removed.get('b') is None
+    assert 'b' not in removed
+    with pytest.raises(KeyError):
+        removed.delete('b')
+
+
+@pytest.mark.parametrize('key', [str, _Key])
+def test_behaves_like_a_dict(key: type) -> None:
+    """Random updates, colliding keys included, match a dict kept alongside."""
+    generator = random.Random(0)  # noqa: S311
+    reference: dict[object, float] = {}
+    order: list[object] = []
+    persistent: PersistentMap[object, float] = PersistentMap()
+
+    for _ in range(3000):
+        item = key(generator.randrange(200))
+        if item in reference and generator.random() < 0.4:
+            persistent = persistent.delete(item)
+            del reference[item]
+            order.remove(item)
+        else:
+            value = generator.random()
+            persistent = persistent.set(item, value)
+            if item not in reference:
+                order.insert(0, item)
+            reference[item] = value
+
+        assert len(persistent) == len(reference)
+
+    assert list(persistent) == order
+    assert persistent == reference
+    assert persistent == PersistentMap((item, reference[item]) for item in order)
+
+
+def test_versions_share_what_they_did_not_change() -> None:
+    """An update copies the path to its key and keeps the rest of the trie."""
+    original = PersistentMap((f'notification-{index}', index) for index in range(500))
+
+    updated = original.set('notification-250', -1)
+
+    shared = sum(
+        first is second
+        for first, second in zip(
+            original._root,  # noqa: SLF001
+            updated._root,  # noqa: SLF001
+            strict=True,
+        )
+    )
+    assert shared == len(original._root) - 1  # noqa: SLF001
+    assert updated != original
+    assert updated.set('notification-250', 250) == original
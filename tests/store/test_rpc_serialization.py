@@ -147,6 +147,39 @@ def test_expected_enum_rejects_primitive_value() -> None:
         unchecked_build_message('web_dashboard', expected_type=v1.InputMethod)
 
 
+def test_unset_optional_enum_builds_as_unset_field() -> None:
+    """An optional enum left as ``None`` stays unset rather than failing."""
+    from ubo_app.store.services.notifications import Notification
+
+    message = build_message(Notification(title='t', content='c'))
+
+    assert isinstance(message, v1.Notification)
+    assert message.chime is None
+    assert rebuild_object(message).chime is None
+
+
+def test_notifications_roundtrip_keeps_ids_and_order() -> None:
+    """The id-keyed notifications map comes back keyed and newest first."""
+    from ubo_app.store.services.notifications import Notification, NotificationsState
+    from ubo_app.utils.persistent_map import PersistentMap
+
+    newer = Notification(id='newer', title='Newer', content='', progress=0.5)
+    older = Notification(id='older', title='Older', content='')
+    value = NotificationsState(
+        notifications=PersistentMap({newer.id: newer, older.id: older}),
+        unread_count=2,
+        progress=0.5,
+        progress_ids=(newer.id,),
+    )
+
+    rebuilt = cast('NotificationsState', _roundtrip(value))
+
+    assert list(rebuilt.notifications) == ['newer', 'older']
+    assert rebuilt.notifications['older'].title == 'Older'
+    assert list(rebuilt.progress_ids) == ['newer']
+    assert rebuilt.unread_count == 2
+
+
 def test_extra_data_rejects_unsupported_nested_value() -> None:
     """Unsupported values inside BasicType maps fail clearly."""
     unsupported = cast('BasicType', object())
@@ -1,10 +1,10 @@
 """Tests for the hardware-facing half of the sensors service.
 
 `_apply`/`_activate` decide which driver instances exist, `read_sensors` feeds
-the store, and `_monitor_sensors` is the 1 Hz loop that publishes. All of it is
-exercised here with stubbed drivers — no bus — because the interesting failures
-(a driver that raises, a poll that blows its deadline) are exactly the ones
-that cannot be waited for on real hardware.
+the store what changed, and `_monitor_sensors` is the 1 Hz loop that publishes.
+All of it is exercised here with stubbed drivers — no bus — because the
+interesting failures (a driver that raises, a poll that blows its deadline) are
+exactly the ones that cannot be waited for on real hardware.
 """
 
 from __future__ import annotations
@@ -63,6 +63,7 @@ def _clean_registries(monkeypatch: pytest.MonkeyPatch) -> None:
     setup.ACTIVE_SENSORS.clear()
     setup.LEGACY_SENSORS.clear()
     monkeypatch.setattr(setup, '_i2c', Fake())
+    monkeypatch.setattr(setup, 'SAMPLER', setup.SensorSampler())
 
 
 @pytest.fixture
@@ -237,19 +238,12 @@ def test_read_sensors_feeds_only_builtins_into_the_legacy_slots(
 
     assert setup.read_sensors() == readings
 
-    per_device = [
-        action.device_id
-        for action in dispatched
-        if type(action).__name__ == 'SensorsReportDeviceReadingsAction'
+    (action,) = dispatched
+    assert sorted(device.device_id for device in action.devices) == [
+        'pct2075_0x48',
+        'sht4x_0x44',
     ]
-    assert sorted(per_device) == ['pct2075_0x48', 'sht4x_0x44']
-
-    legacy = {
-        action.sensor: action.reading
-        for action in dispatched
-        if type(action).__name__ == 'SensorsReportReadingAction'
-    }
-    assert legacy == {Sensor.TEMPERATURE: 21.5, Sensor.LIGHT: 0.0}
+    assert (action.temperature, action.light) == (21.5, 0.0)
 
 
 def test_read_sensors_attaches_registry_metadata_to_each_reading(
@@ -301,12 +295,9 @@ def test_read_sensors_attaches_registry_metadata_to_each_reading(
 
     setup.read_sensors()
 
-    action = next(
-        action
-        for action in dispatched
-        if type(action).__name__ == 'SensorsReportDeviceReadingsAction'
-    )
-    entities = {entity.key: entity for entity in action.entities}
+    (action,) = dispatched
+    (device,) = action.devices
+    entities = {entity.key: entity for entity in device.entities}
 
     assert entities['temperature'].value == 22.4
     assert entities['temperature'].name == 'Temperature'
@@ -327,12 +318,54 @@ def test_read_sensors_reports_zero_for_an_absent_builtin(
     """Exactly as before the device registry: off-device the legacy slots are 0.0."""
     assert setup.read_sensors() == {}
 
-    legacy = {
-        action.sensor: action.reading
-        for action in dispatched
-        if type(action).__name__ == 'SensorsReportReadingAction'
-    }
-    assert legacy == {Sensor.TEMPERATURE: 0.0, Sensor.LIGHT: 0.0}
+    (action,) = dispatched
+    assert action.devices == ()
+    assert (action.temperature, action.light) == (0.0, 0.0)
+
+
+def test_an_unchanged_tick_dispatches_nothing(
+    monkeypatch: pytest.MonkeyPatch,
+    dispatched: list[Any],
+) -> None:
+    """Ten sensors holding still must not cost ten actions a second."""
+    sensor = _active('sht4x', 0x44)
+    setup.ACTIVE_SENSORS[sensor.device_id] = sensor
+    readings = {'temperature': 21.0}
+    monkeypatch.setattr(setup, 'poll_entities', lambda *_, **__: dict(readings))
+
+    assert setup.read_sensors() == {'sht4x_0x44': {'temperature': 21.0}}
+    assert len(dispatched) == 1
+
+    assert setup.read_sensors() == {}
+    assert len(dispatched) == 1
+
+    readings['temperature'] = 22.0
+    assert setup.read_sensors() == {'sht4x_0x44': {'temperature': 22.0}}
+    (device,) = dispatched[-1].devices
+    assert [entity.value for entity in device.entities] == [22.0]
+    # The legacy slots did not change, so they are not re-sent.
+    assert (dispatched[-1].temperature, dispatched[-1].light) == (None, None)
+
+
+def test_a_forced_report_resends_everything(
+    monkeypatch: pytest.MonkeyPatch,
+    dispatched: list[Any],
+) -> None:
+    """After a re-scan the store's devices have no readings to merge into."""
+    sensor = _active('sht4x', 0x44)
+    setup.ACTIVE_SENSORS[sensor.device_id] = sensor
+    monkeypatch.setattr(
+        setup,
+        'poll_entities',
+        lambda *_, **__: {'temperature': 21.0},
+    )
+
+    setup.read_sensors()
+    setup.SAMPLER.force_report()
+
+    assert setup.read_sensors() == {'sht4x_0x44': {'temperature': 21.0}}
+    assert len(dispatched) == 2
+    assert (dispatched[-1].temperature, dispatched[-1].light) == (0.0, 0.0)
 
 
 # --------------------------------------------------------------------------
@@ -380,6 +413,8 @@ async def test_a_device_with_nothing_to_say_is_not_published(
         if type(action).__name__ == 'MqttPublishAction'
     ]
     assert [action.channel for action in publishes] == ['bme280_0x76/state']
+    # Readings are state: a newer one replaces it while it waits for the broker.
+    assert all(action.coalesce for action in publishes)
 
 
 @pytest.mark.usefixtures('_fast_poll')
@@ -176,6 +176,47 @@ def test_readings_update_only_the_named_device() -> None:
     assert state.devices[first.id].status is types.SensorStatus.ACTIVE
 
 
+def test_batched_readings_merge_into_what_each_device_already_has() -> None:
+    """A tick carries only what moved; everything else keeps its last reading."""
+    device = _device(definition_id='bme280', address=0x76)
+    state = reducer(_state(), types.SensorsScanCompletedAction(devices=(device,)))
+    temperature = types.SensorEntityReading(key='temperature', value=22.0)
+    humidity = types.SensorEntityReading(key='humidity', value=40.0)
+    state = reducer(
+        state,
+        types.SensorsReportReadingsAction(
+            timestamp=0.0,
+            devices=(
+                types.SensorDeviceReadings(
+                    device_id=device.id,
+                    entities=(temperature, humidity),
+                ),
+            ),
+            temperature=22.0,
+            light=0.0,
+        ),
+    )
+
+    moved = types.SensorEntityReading(key='humidity', value=45.0)
+    state = reducer(
+        state,
+        types.SensorsReportReadingsAction(
+            timestamp=1.0,
+            devices=(
+                types.SensorDeviceReadings(device_id=device.id, entities=(moved,)),
+                # Raced a re-scan that dropped it.
+                types.SensorDeviceReadings(device_id='ghost_0x44', entities=()),
+            ),
+        ),
+    )
+
+    assert state.devices[device.id].entities == (temperature, moved)
+    assert set(state.devices) == {device.id}
+    # Unchanged legacy slots arrive as `None` and keep their value.
+    assert state.temperature.value == 22.0
+    assert state.light.value == 0.0
+
+
 def test_readings_for_an_unknown_device_are_ignored() -> None:
     """A reading racing a re-scan that dropped its device is a no-op, not a crash."""
     state = reducer(
@@ -643,6 +643,73 @@ def test_an_invalid_min_read_interval_drops_only_its_own_definition(
     assert [definition.id for definition in definitions] == ['sht4x']
 
 
+def _entity_with(**fields: Any) -> dict[str, Any]:  # noqa: ANN401
+    return _definition(
+        entities=[
+            {
+                'key': 'temperature',
+                'attribute': 'temperature',
+                'name': 'Temperature',
+                **fields,
+            },
+        ],
+    )
+
+
+def test_report_policy_defaults_and_overrides_are_carried_through() -> None:
+    """An entity with no policy reports on change, with a 60 s heartbeat."""
+    (definition,) = registry.parse_registry({'sensors': [_entity_with()]})
+    (entity,) = definition.entities
+
+    assert entity.deadband is None
+    assert entity.min_report_interval == 0.0
+    assert entity.max_report_interval == registry.MAX_REPORT_INTERVAL
+
+    (definition,) = registry.parse_registry(
+        {
+            'sensors': [
+                _entity_with(
+                    deadband=0.2,
+                    min_report_interval=2,
+                    max_report_interval=30,
+                ),
+            ],
+        },
+    )
+    (entity,) = definition.entities
+
+    assert entity.deadband == 0.2
+    assert entity.min_report_interval == 2.0
+    assert entity.max_report_interval == 30.0
+
+
+@pytest.mark.parametrize(
+    'fields',
+    [
+        pytest.param({'deadband': -1}, id='negative-deadband'),
+        pytest.param({'deadband': True}, id='bool-deadband'),
+        pytest.param({'min_report_interval': '1'}, id='string-min'),
+        pytest.param(
+            {'min_report_interval': 10, 'max_report_interval': 5},
+            id='min-above-max',
+        ),
+        # Past Home Assistant's `expire_after`, a still sensor would flap.
+        pytest.param({'max_report_interval': 120}, id='max-above-ceiling'),
+    ],
+)
+def test_an_invalid_report_policy_drops_only_its_own_definition(
+    fields: dict[str, Any],
+) -> None:
+    """A bad policy must not cost the user every other sensor."""
+    good = _definition(id='sht4x', addresses=['0x44'], probe=None)
+
+    definitions = registry.parse_registry(
+        {'sensors': [_entity_with(**fields), good]},
+    )
+
+    assert [definition.id for definition in definitions] == ['sht4x']
+
+
 def test_the_scd4x_is_not_polled_faster_than_it_measures() -> None:
     """The bundled definition, not a synthetic one: this is the whole point.
 
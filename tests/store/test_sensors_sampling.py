@@ -0,0 +1,142 @@
+"""Tests for which readings the sensors poll loop reports.
+
+The loop reads every second; `SensorSampler` is what keeps an unmoving sensor
+from costing a store action, an MQTT payload and a Home Assistant recorder row
+each time. Deadband, minimum and maximum interval are judged against the last
+*reported* value and time, with a monotonic `now` the tests supply directly.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests.service_loader import load_service_modules
+
+ha, registry, sampling = load_service_modules(
+    Path(__file__).resolve().parents[2] / 'ubo_app' / 'services' / '040-sensors',
+    'ha',
+    'registry',
+    'sampling',
+)
+
+
+def _entity(**overrides: Any) -> Any:  # noqa: ANN401
+    return registry.EntityDefinition(
+        key='temperature',
+        attribute='temperature',
+        name='Temperature',
+        **overrides,
+    )
+
+
+def _changes(
+    sampler: Any,  # noqa: ANN401
+    entity: Any,  # noqa: ANN401
+    value: float | None,
+    now: float,
+) -> dict[str, float | None]:
+    return sampler.changes('sht4x_0x44', (entity,), {entity.key: value}, now=now)
+
+
+def test_a_reading_is_reported_the_first_time_it_is_seen() -> None:
+    """Nothing has been reported yet, so there is nothing to compare against."""
+    sampler = sampling.SensorSampler()
+
+    assert _changes(sampler, _entity(), 21.0, now=0) == {'temperature': 21.0}
+
+
+def test_a_move_inside_the_deadband_is_not_reported() -> None:
+    """Only a move past the deadband counts as a change."""
+    sampler = sampling.SensorSampler()
+    entity = _entity(deadband=0.5)
+    _changes(sampler, entity, 21.0, now=0)
+
+    assert _changes(sampler, entity, 21.4, now=1) == {}
+    assert _changes(sampler, entity, 21.6, now=2) == {'temperature': 21.6}
+
+
+def test_drift_is_measured_from_the_last_reported_value() -> None:
+    """Sub-deadband steps add up instead of disappearing one at a time."""
+    sampler = sampling.SensorSampler()
+    entity = _entity(deadband=0.5)
+    _changes(sampler, entity, 21.0, now=0)
+
+    assert _changes(sampler, entity, 21.3, now=1) == {}
+    assert _changes(sampler, entity, 21.6, now=2) == {'temperature': 21.6}
+
+
+def test_the_default_deadband_is_half_the_last_displayed_digit() -> None:
+    """A move the display cannot show is not worth a report."""
+    assert sampling.effective_deadband(
+        _entity(suggested_display_precision=1),
+    ) == pytest.approx(0.05)
+    assert sampling.effective_deadband(_entity(suggested_display_precision=0)) == 0.5
+    assert sampling.effective_deadband(_entity()) == 0.0
+    explicit = _entity(suggested_display_precision=1, deadband=2.0)
+    assert sampling.effective_deadband(explicit) == 2.0
+
+
+def test_losing_or_regaining_a_reading_is_always_reported() -> None:
+    """`None` is how a consumer learns an entity stopped answering."""
+    sampler = sampling.SensorSampler()
+    entity = _entity(deadband=100.0)
+    _changes(sampler, entity, 21.0, now=0)
+
+    assert _changes(sampler, entity, None, now=1) == {'temperature': None}
+    assert _changes(sampler, entity, None, now=2) == {}
+    assert _changes(sampler, entity, 21.0, now=3) == {'temperature': 21.0}
+
+
+def test_the_minimum_interval_holds_back_a_change() -> None:
+    """However far it moves, an entity is not reported more often than this."""
+    sampler = sampling.SensorSampler()
+    entity = _entity(min_report_interval=5.0)
+    _changes(sampler, entity, 21.0, now=0)
+
+    assert _changes(sampler, entity, 30.0, now=4) == {}
+    assert _changes(sampler, entity, 30.0, now=5) == {'temperature': 30.0}
+
+
+def test_the_maximum_interval_reports_an_unchanged_reading() -> None:
+    """The heartbeat that stops a still sensor expiring in Home Assistant."""
+    sampler = sampling.SensorSampler()
+    entity = _entity(max_report_interval=10.0)
+    _changes(sampler, entity, 21.0, now=0)
+
+    assert _changes(sampler, entity, 21.0, now=9) == {}
+    assert _changes(sampler, entity, 21.0, now=10) == {'temperature': 21.0}
+
+
+def test_the_heartbeat_beats_home_assistant_expiry() -> None:
+    """A heartbeat slower than `expire_after` would flap every still sensor."""
+    assert registry.MAX_REPORT_INTERVAL < ha.EXPIRE_AFTER
+    assert _entity().max_report_interval == registry.MAX_REPORT_INTERVAL
+
+
+def test_a_forced_report_resends_everything() -> None:
+    """Re-scans, Home Assistant restarts and unit changes all need a resend."""
+    sampler = sampling.SensorSampler()
+    entity = _entity()
+    _changes(sampler, entity, 21.0, now=0)
+    assert sampler.legacy_changes({'temperature': 21.0}) == {'temperature': 21.0}
+
+    sampler.force_report()
+    sampler.start_tick(['sht4x_0x44'])
+
+    assert _changes(sampler, entity, 21.0, now=1) == {'temperature': 21.0}
+    assert sampler.legacy_changes({'temperature': 21.0}) == {'temperature': 21.0}
+
+
+def test_a_device_that_went_away_is_forgotten() -> None:
+    """A sensor re-plugged after a re-scan reports from scratch."""
+    sampler = sampling.SensorSampler()
+    entity = _entity()
+    _changes(sampler, entity, 21.0, now=0)
+
+    sampler.start_tick([])
+
+    assert sampler.reported('sht4x_0x44') == {}
+    assert _changes(sampler, entity, 21.0, now=1) == {'temperature': 21.0}
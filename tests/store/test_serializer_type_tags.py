@@ -0,0 +1,71 @@
+"""Tests for the type tags serialized objects name their class with."""
+
+from __future__ import annotations
+
+import base64
+import datetime as dt
+import json
+import sys
+import types
+from typing import TYPE_CHECKING
+
+import dill
+
+from ubo_app.utils.serializer import field_types, resolve_type_tag, type_tag
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_store_types_are_tagged_with_their_registry_name() -> None:
+    """Registered classes are tagged by name, everything else by import path."""
+    from ubo_app.store.services.audio import AudioOutput, AudioOutputVolume
+    from ubo_app.store.services.notifications import Notification
+
+    assert type_tag(Notification) == 'Notification'
+    assert resolve_type_tag('Notification') is Notification
+
+    assert type_tag(dt.timezone) == 'datetime:timezone'
+    assert resolve_type_tag('datetime:timezone') is dt.timezone
+    assert field_types(AudioOutputVolume)['output'] is AudioOutput
+
+
+def test_classes_of_service_modules_round_trip(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A service module's name has a colon of its own, before the class's."""
+    module = types.ModuleType('/x/services/040-sensors:registry')
+
+    class Outer:
+        class Inner:
+            pass
+
+    for class_, qualname in ((Outer, 'Outer'), (Outer.Inner, 'Outer.Inner')):
+        class_.__module__ = module.__name__
+        class_.__qualname__ = qualname
+    module.Outer = Outer  # pyright: ignore[reportAttributeAccessIssue]
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    assert type_tag(Outer) == '/x/services/040-sensors:registry:Outer'
+    assert resolve_type_tag(type_tag(Outer)) is Outer
+    assert resolve_type_tag(type_tag(Outer.Inner)) is Outer.Inner
+
+
+def test_tagged_and_legacy_dill_objects_load() -> None:
+    """Objects tagged with a pickled class, as older files are, still load."""
+    from ubo_app.store.main import store
+    from ubo_app.store.services.notifications import Importance, Notification
+
+    notification = Notification(
+        id='id',
+        title='Title',
+        content='Content',
+        importance=Importance.HIGH,
+        timestamp=0,
+    )
+    serialized = json.loads(json.dumps(store.serialize_value(notification)))
+    assert serialized['_type'] == 'Notification'
+    assert store.load_object(json.loads(json.dumps(serialized))) == notification
+
+    serialized['_type'] = base64.b64encode(dill.dumps(Notification)).decode()
+    assert store.load_object(serialized) == notification
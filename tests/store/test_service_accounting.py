@@ -0,0 +1,255 @@
+"""Tests for attributing the core process's CPU time and memory to services."""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ubo_app.utils.service_accounting import (
+    CORE,
+    ServiceAccountant,
+    attribute_allocations,
+    read_thread_times,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from types import ModuleType
+
+
+class _Process:
+    """Thread times, owners and a clock the test sets by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.times: dict[int, float] = {}
+        self.owners: dict[int, str] = {}
+
+    def accountant(self) -> ServiceAccountant:
+        return ServiceAccountant(
+            read_times=lambda: dict(self.times),
+            owners=lambda: dict(self.owners),
+            code=dict,
+            clock=lambda: self.now,
+        )
+
+
+def test_cpu_is_split_by_thread_owner() -> None:
+    """Percentages cover the interval; seconds cover each thread's lifetime."""
+    process = _Process()
+    process.times = {1: 5.0, 2: 1.0, 3: 0.5}
+    process.owners = {2: 'audio', 3: 'audio'}
+    accountant = process.accountant()
+
+    first = accountant.sample()
+    assert list(first) == ['audio', CORE]
+    assert first['audio'].cpu_percent == 0.0
+    assert first['audio'].cpu_seconds == 1.5
+    assert first['audio'].threads == 2
+
+    process.now = 10.0
+    process.times = {1: 6.0, 2: 3.0, 3: 0.5}
+    second = accountant.sample()
+
+    assert second['audio'].cpu_percent == 20.0
+    assert second['audio'].cpu_seconds == 3.5
+    assert second[CORE].cpu_percent == 10.0
+    assert second[CORE].allocated_bytes is None
+
+
+def test_ended_and_reused_threads_keep_their_cpu_time() -> None:
+    """A service's total does not drop when its workers exit."""
+    process = _Process()
+    process.times = {1: 1.0, 2: 2.0}
+    process.owners = {1: 'docker', 2: 'docker'}
+    accountant = process.accountant()
+    accountant.sample()
+
+    process.now = 1.0
+    # Thread 2 exited and its id went to a new `core` thread.
+    process.times = {1: 1.5, 2: 0.25}
+    process.owners = {1: 'docker'}
+    usage = accountant.sample()
+
+    assert usage['docker'].cpu_seconds == 3.5
+    assert usage['docker'].threads == 1
+    assert usage['docker'].cpu_percent == 50.0
+    assert usage[CORE].cpu_seconds == 0.25
+    assert usage[CORE].cpu_percent == 25.0
+
+    process.now = 2.0
+    process.times = {}
+    usage = accountant.sample()
+
+    assert usage['docker'].cpu_seconds == 3.5
+    assert usage['docker'].threads == 0
+    assert usage['docker'].cpu_percent == 0.0
+
+
+def test_a_thread_changing_owner_charges_the_new_one_from_then_on() -> None:
+    """A live thread taken over by another owner is not counted twice."""
+    process = _Process()
+    process.times = {1: 2.0}
+    process.owners = {1: 'docker'}
+    accountant = process.accountant()
+    accountant.sample()
+
+    process.now = 1.0
+    process.times = {1: 2.5}
+    process.owners = {1: 'wifi'}
+    usage = accountant.sample()
+
+    assert usage['docker'].cpu_seconds == 2.0
+    assert usage['docker'].threads == 0
+    assert usage['wifi'].cpu_seconds == 0.5
+    assert usage['wifi'].cpu_percent == 50.0
+
+    process.now = 2.0
+    process.times = {1: 3.0}
+    process.owners = {1: 'audio'}
+    usage = accountant.sample()
+
+    assert usage['docker'].cpu_seconds == 2.0
+    assert usage['wifi'].cpu_seconds == 0.5
+    assert usage['audio'].cpu_seconds == 0.5
+
+    process.now = 3.0
+    process.times = {}
+    usage = accountant.sample()
+
+    assert sum(owner.cpu_seconds for owner in usage.values()) == 3.0
+
+
+def test_real_threads_are_charged_their_own_cpu_time() -> None:
+    """A busy service thread is told apart from an idle one in this process."""
+    started = threading.Barrier(3)
+    done = threading.Event()
+
+    def busy() -> None:
+        started.wait()
+        deadline = time.thread_time() + 0.2
+        while time.thread_time() < deadline:
+            pass
+        done.wait()
+
+    def idle() -> None:
+        started.wait()
+        done.wait()
+
+    threads = {
+        'busy': threading.Thread(target=busy),
+        'idle': threading.Thread(target=idle),
+    }
+    for thread in threads.values():
+        thread.start()
+    started.wait()
+    accountant = ServiceAccountant(
+        owners=lambda: {
+            thread.native_id: service_id
+            for service_id, thread in threads.items()
+            if thread.native_id is not None
+        },
+        code=dict,
+    )
+    try:
+        accountant.sample()
+        while threads['busy'].native_id not in _spent(0.15):
+            time.sleep(0.01)
+        usage = accountant.sample()
+    finally:
+        done.set()
+        for thread in threads.values():
+            thread.join()
+
+    assert usage['busy'].threads == 1
+    assert usage['busy'].cpu_seconds >= 0.15
+    assert usage['busy'].cpu_percent > 0
+    assert usage['idle'].cpu_seconds < 0.05
+
+
+def _spent(seconds: float) -> set[int]:
+    return {tid for tid, cpu in read_thread_times().items() if cpu >= seconds}
+
+
+@pytest.fixture
+def tracing() -> Iterator[None]:
+    """Trace allocations for the test, deep enough to see through a helper."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(16)
+    yield
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+def _load(path: Path, name: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.usefixtures('tracing')
+def test_allocations_go_to_the_nearest_service_on_the_stack(tmp_path: Path) -> None:
+    """Memory a shared helper allocates is charged to the service calling it."""
+    (tmp_path / 'helper.py').write_text(
+        'def allocate(count):\n    return [bytearray(1024) for _ in range(count)]\n',
+    )
+    helper = _load(tmp_path / 'helper.py', 'accounting_helper')
+    services = {}
+    for name, count in (('alpha', 200), ('beta', 50)):
+        directory = tmp_path / f'090-{name}'
+        directory.mkdir()
+        (directory / 'setup.py').write_text(
+            'def setup(helper, count):\n    return helper.allocate(count)\n',
+        )
+        services[name] = (
+            _load(directory / 'setup.py', f'accounting_{name}'),
+            count,
+        )
+
+    kept = [module.setup(helper, count) for module, count in services.values()]
+    kept.append(helper.allocate(20))
+    allocations = attribute_allocations(
+        tracemalloc.take_snapshot(),
+        {name: (f'{(tmp_path / f"090-{name}").as_posix()}/',) for name in services},
+    )
+
+    alpha_bytes, alpha_blocks = allocations['alpha']
+    beta_bytes, beta_blocks = allocations['beta']
+    assert alpha_blocks >= 200
+    assert beta_blocks >= 50
+    assert 200 * 1024 <= alpha_bytes < 300 * 1024
+    assert 50 * 1024 <= beta_bytes < 100 * 1024
+    assert allocations[CORE][0] >= 20 * 1024
+    assert len(kept) == 3
+
+
+@pytest.mark.usefixtures('tracing')
+def test_samples_include_allocations_while_tracing(tmp_path: Path) -> None:
+    """With tracemalloc on, every owner reports its live bytes."""
+    directory = tmp_path / '090-alpha'
+    directory.mkdir()
+    (directory / 'setup.py').write_text('DATA = [bytearray(4096) for _ in range(8)]\n')
+    code = {'alpha': (f'{directory.as_posix()}/',)}
+    module = _load(directory / 'setup.py', 'accounting_alpha_data')
+
+    usage = ServiceAccountant(
+        read_times=dict,
+        owners=dict,
+        code=lambda: code,
+    ).sample()
+
+    assert usage['alpha'].threads == 0
+    assert usage['alpha'].allocated_bytes is not None
+    assert usage['alpha'].allocated_bytes >= 8 * 4096
+    assert usage[CORE].allocated_bytes is not None
+    assert len(module.DATA) == 8
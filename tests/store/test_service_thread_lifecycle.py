@@ -326,6 +326,8 @@ def test_reducer_barrier_suppresses_then_releases_view_updates(
             self.timeout = timeout
 
     class _Service:
+        runs_on_shared_loop = False
+
         def __init__(self, service_id: str) -> None:
             self.service_id = service_id
 
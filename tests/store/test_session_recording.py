@@ -0,0 +1,128 @@
+"""Tests for recording store sessions and replaying them as benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from redux import CompleteReducerResult, InitAction, StoreOptions
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ubo_app.store.main import UboStore
+
+# Gap between the recorded key presses, in seconds.
+GAP = 0.1
+PRESSES = 3
+
+
+def _reducer(state: int | None, action: object) -> object:
+    from ubo_app.store.core.types import ReportReplayingDoneAction
+    from ubo_app.store.services.keypad import KeypadAction
+
+    if state is None:
+        return 0
+    if isinstance(action, KeypadAction):
+        # Derived by the store itself, so recorded as such and not replayed.
+        return CompleteReducerResult(
+            state=state + 1,
+            actions=[ReportReplayingDoneAction()],
+        )
+    return state
+
+
+def _store() -> UboStore:
+    from ubo_app.store.main import UboStore
+
+    store = UboStore(_reducer, StoreOptions(side_effect_threads=0))
+    store.dispatch(InitAction())
+    return store
+
+
+def _record(path: Path) -> None:
+    from ubo_app.store.services.keypad import Key, KeypadKeyPressAction
+    from ubo_app.utils.session_recording import SessionRecorder
+
+    store = _store()
+    recorder = SessionRecorder(store)
+    recorder.start(path)
+    for index in range(PRESSES):
+        if index:
+            time.sleep(GAP)
+        store.dispatch(KeypadKeyPressAction(key=Key.L1, pressed_keys=(Key.L1,)))
+    recorder.stop()
+
+
+def test_session_log_keeps_timing_and_provenance(tmp_path: Path) -> None:
+    """Records come back in order, with their offsets and origins."""
+    from ubo_app.utils.session_recording import (
+        EntryKind,
+        Origin,
+        SessionRecorder,
+        read_session,
+    )
+
+    path = tmp_path / 'session.ubosession'
+    _record(path)
+
+    entries = list(read_session(path))
+    assert [(entry.type_name, entry.origin) for entry in entries] == [
+        ('KeypadKeyPressAction', Origin.DISPATCH),
+        ('ReportReplayingDoneAction', Origin.STORE),
+    ] * PRESSES
+    assert all(entry.kind is EntryKind.ACTION for entry in entries)
+    presses = [entry for entry in entries if entry.origin is Origin.DISPATCH]
+    assert presses[0].data['key'] == 'L1'
+    for previous, entry in itertools.pairwise(presses):
+        assert entry.offset - previous.offset >= GAP * 1_000_000_000
+
+    (tmp_path / 'other.json').write_text('[]')
+    with pytest.raises(ValueError, match='not a session log'):
+        list(read_session(tmp_path / 'other.json'))
+    with pytest.raises(ValueError, match='Unknown session recording streams'):
+        SessionRecorder(_store()).start(tmp_path / 'x.ubosession', streams=['video'])
+
+
+@pytest.mark.parametrize('speed', [1.0, 2.0, None])
+def test_replay_keeps_the_recorded_pace(
+    tmp_path: Path,
+    speed: float | None,
+) -> None:
+    """Replayed actions wait for their recorded times, scaled by `speed`."""
+    from ubo_app.utils.session_recording import Origin, read_session, replay_session
+
+    path = tmp_path / 'session.ubosession'
+    _record(path)
+    due = [
+        entry.offset / 1_000_000_000 / speed if speed else 0
+        for entry in read_session(path)
+        if entry.origin is Origin.DISPATCH
+    ]
+
+    store = _store()
+    delays: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+        await asyncio.sleep(0)
+
+    report = asyncio.run(
+        replay_session(store, path, speed=speed, settle=0.05, sleep=sleep),
+    )
+
+    # Nothing actually waits, so each action asks for the time from the start
+    # of the replay to its own, less what the replay took so far; the first
+    # one may be due already.
+    assert len(delays) in (PRESSES - 1, PRESSES)
+    for expected, delay in zip(due[-len(delays) :], delays, strict=True):
+        assert expected - GAP / 2 <= delay <= expected, (due, delays)
+    assert store._state == PRESSES  # noqa: SLF001
+    assert report.actions_replayed == PRESSES
+    assert report.actions_reduced >= 2 * PRESSES
+    assert report.recorded_duration >= GAP * (PRESSES - 1)
+    assert report.throughput > 0
+    assert report.as_dict()['throughput'] == report.throughput
@@ -0,0 +1,202 @@
+"""Tests for the speech-recognition service's shared model manager.
+
+``ModelManager`` (``090-speech-recognition/model_manager.py``) hands out one
+instance per key, counts its users, keeps released models cached while idle and
+evicts idle ones least recently used first once their resident size exceeds the
+budget. Resident size is measured from ``/proc/self/statm``; the tests replace
+that probe with a scripted one so each load has a known size.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    import pytest
+
+
+SERVICE_PATH = Path(__file__).parents[2] / 'ubo_app/services/090-speech-recognition'
+MIB = 2**20
+
+
+def _load(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    monkeypatch.syspath_prepend(SERVICE_PATH.as_posix())
+    spec = importlib.util.spec_from_file_location(
+        'speech_recognition_model_manager',
+        SERVICE_PATH / 'model_manager.py',
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _manager(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    budget: int,
+    sizes: dict[str, int],
+) -> SimpleNamespace:
+    """Return a manager whose loads grow RSS by ``sizes[key]`` MiB each."""
+    module = _load(monkeypatch)
+    resident = [100 * MIB]
+    monkeypatch.setattr(module, '_resident_bytes', lambda: resident[0])
+    on_change = Mock()
+    manager = module.ModelManager(budget_bytes=budget * MIB, on_change=on_change)
+    closed: list[str] = []
+
+    def acquire(key: str) -> object:
+        def loader() -> object:
+            resident[0] += sizes[key] * MIB
+            return SimpleNamespace(key=key)
+
+        return manager.acquire(
+            key,
+            loader,
+            engine='test',
+            close=lambda model: closed.append(model.key),
+        )
+
+    return SimpleNamespace(
+        manager=manager,
+        acquire=acquire,
+        on_change=on_change,
+        closed=closed,
+    )
+
+
+def test_shares_one_instance_and_keeps_idle_models_cached(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A second acquire reuses the model; releasing it does not unload it."""
+    ns = _manager(monkeypatch, budget=100, sizes={'a': 10})
+    manager, acquire, closed = ns.manager, ns.acquire, ns.closed
+
+    first = acquire('a')
+    second = acquire('a')
+    assert first is second
+    assert manager.snapshot()[0].users == 2
+
+    manager.release('a')
+    manager.release('a')
+    assert manager.peek('a') is first
+    assert manager.snapshot()[0].users == 0
+    assert manager.resident_bytes == 10 * MIB
+    assert closed == []
+
+
+def test_evicts_least_recently_used_idle_model(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Past the budget the idle model unused the longest goes first."""
+    ns = _manager(monkeypatch, budget=50, sizes={'a': 20, 'b': 20, 'c': 20})
+    manager, acquire, closed = ns.manager, ns.acquire, ns.closed
+
+    acquire('a')
+    acquire('b')
+    manager.release('a')
+    manager.release('b')
+    acquire('c')
+
+    assert closed == ['a']
+    assert manager.peek('a') is None
+    assert [model.key for model in manager.snapshot()] == ['c', 'b']
+
+
+def test_models_in_use_are_never_evicted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Held models survive even when they alone exceed the budget."""
+    ns = _manager(monkeypatch, budget=30, sizes={'a': 20, 'b': 20})
+    manager, acquire, closed = ns.manager, ns.acquire, ns.closed
+
+    acquire('a')
+    acquire('b')
+    assert closed == []
+    assert manager.resident_bytes == 40 * MIB
+
+    manager.release('a')
+    assert closed == ['a']
+
+
+def test_not_ready_model_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A loader returning None is retried on the next acquire."""
+    module = _load(monkeypatch)
+    manager = module.ModelManager(budget_bytes=MIB)
+    calls: list[int] = []
+
+    def loader() -> object | None:
+        calls.append(1)
+        return None if len(calls) == 1 else object()
+
+    assert manager.acquire('m', loader, engine='vosk') is None
+    assert manager.snapshot() == ()
+    assert manager.acquire('m', loader, engine='vosk') is not None
+    assert len(calls) == 2
+
+
+def test_publishes_load_time_and_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every change reports the resident models to the store callback."""
+    ns = _manager(monkeypatch, budget=100, sizes={'a': 12})
+    manager, acquire, on_change = ns.manager, ns.acquire, ns.on_change
+
+    acquire('a')
+    manager.release('a')
+
+    assert on_change.call_count == 2
+    (info,) = on_change.call_args.args[0]
+    assert info.key == 'a'
+    assert info.engine == 'test'
+    assert info.resident_bytes == 12 * MIB
+    assert info.load_seconds >= 0
+    assert info.users == 0
+
+
+def test_loads_without_holding_the_manager(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Other keys stay usable during a load; the same key waits and shares it."""
+    module = _load(monkeypatch)
+    manager = module.ModelManager(budget_bytes=100 * MIB)
+    cached = manager.acquire('cached', object, engine='vosk')
+    started = threading.Event()
+    finish = threading.Event()
+    loads: list[object] = []
+
+    def slow_loader() -> object:
+        started.set()
+        assert finish.wait(timeout=5)
+        loads.append(object())
+        return loads[-1]
+
+    results: list[object] = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                manager.acquire('slow', slow_loader, engine='vosk'),
+            ),
+        )
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    assert started.wait(timeout=5)
+
+    assert manager.acquire('cached', object, engine='vosk') is cached
+    manager.release('cached')
+    assert [info.key for info in manager.snapshot()] == ['cached']
+
+    finish.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert len(loads) == 1
+    assert results == [loads[0], loads[0]]
+    assert {info.key: info.users for info in manager.snapshot()}['slow'] == 2
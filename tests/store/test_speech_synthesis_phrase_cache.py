@@ -0,0 +1,143 @@
+"""Tests for the screen reader's on-disk phrase cache.
+
+``PhraseCache`` keeps the PCM of already-synthesized phrases keyed by engine,
+voice and normalized text, evicts least-recently-used entries past its byte
+budget, and credits each hit with the synthesis time it saved. The service
+pre-warms it with the labels of the menu on screen, one synthesis at a time.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from ubo_app.store.services.audio import AudioSample
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    import pytest
+
+
+SERVICE_PATH = Path(__file__).parents[2] / 'ubo_app/services/010-speech-synthesis'
+
+
+def _load(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    monkeypatch.syspath_prepend(SERVICE_PATH.as_posix())
+    spec = importlib.util.spec_from_file_location(
+        'speech_synthesis_phrase_cache',
+        SERVICE_PATH / 'phrase_cache.py',
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _sample(data: bytes) -> AudioSample:
+    return AudioSample(data=data, channels=1, rate=22050, width=2)
+
+
+def test_key_ignores_whitespace_but_not_voice(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Spacing differences share a key; another voice or engine does not."""
+    module = _load(monkeypatch)
+    key = module.phrase_key('piper', 'amy', 'Download  complete\n')
+    assert key == module.phrase_key('piper', 'amy', ' Download complete')
+    assert key != module.phrase_key('piper', 'lessac', 'Download complete')
+    assert key != module.phrase_key('kokoro', 'amy', 'Download complete')
+
+
+def test_roundtrip_and_stats(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """A stored phrase reads back intact and its synthesis time counts as saved."""
+    module = _load(monkeypatch)
+    cache = module.PhraseCache(tmp_path)
+    key = module.phrase_key('piper', 'amy', 'Settings')
+
+    assert cache.get(key) is None
+    cache.put(key, _sample(b'\x01\x02' * 100), 0.75)
+    cached = cache.get(key)
+
+    assert cached is not None
+    assert cached.sample == _sample(b'\x01\x02' * 100)
+    assert cached.synthesis_seconds == 0.75
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_ratio == 0.5
+    assert cache.stats.saved_seconds == 0.75
+
+    # A fresh instance (next boot) indexes the same directory.
+    assert key in module.PhraseCache(tmp_path)
+
+
+def test_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Past the byte budget the entry unused the longest is dropped first."""
+    module = _load(monkeypatch)
+    entry_size = module._HEADER.size + 100  # noqa: SLF001
+    cache = module.PhraseCache(tmp_path, max_bytes=entry_size * 2)
+
+    cache.put('a', _sample(bytes(100)), 0.1)
+    cache.put('b', _sample(bytes(100)), 0.1)
+    assert cache.get('a') is not None
+    cache.put('c', _sample(bytes(100)), 0.1)
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.size == entry_size * 2
+    assert not (tmp_path / 'b.pcm').exists()
+
+
+def test_corrupt_entry_is_dropped(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """An unreadable file counts as a miss and is removed."""
+    module = _load(monkeypatch)
+    (tmp_path / 'broken.pcm').write_bytes(b'nope')
+    cache = module.PhraseCache(tmp_path)
+
+    assert cache.get('broken') is None
+    assert 'broken' not in cache
+    assert not (tmp_path / 'broken.pcm').exists()
+
+
+def test_evicted_prewarm_is_queued_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reads pushing the pre-warm synthesis out do not stall pre-warming."""
+    monkeypatch.syspath_prepend(SERVICE_PATH.as_posix())
+    spec = importlib.util.spec_from_file_location(
+        'speech_synthesis_setup',
+        SERVICE_PATH / 'setup.py',
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    setup = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = setup
+    spec.loader.exec_module(setup)
+    dispatch = Mock()
+    monkeypatch.setattr(setup.store, 'dispatch', dispatch)
+    monkeypatch.setattr(setup, '_preferred_tts_provider', lambda: None)
+    monkeypatch.setattr(setup, '_phrase_cache', {})
+
+    setup._prewarm_queue.extend([('Wi-Fi', 'wifi'), ('Audio', 'audio')])  # noqa: SLF001
+    setup._prewarm_next()  # noqa: SLF001
+    for index in range(setup._MAX_PENDING_SYNTHESES):  # noqa: SLF001
+        setup._request_synthesis(f'read {index}', f'read-{index}', None)  # noqa: SLF001
+
+    texts = [call.args[0].text for call in dispatch.call_args_list]
+    assert texts[0] == 'Wi-Fi'
+    assert texts[-1] == 'Wi-Fi'
+    pending = setup._pending_syntheses.values()  # noqa: SLF001
+    assert [entry.key for entry in pending if entry.is_prewarm] == ['wifi']
+    assert list(setup._prewarm_queue) == [('Audio', 'audio')]  # noqa: SLF001
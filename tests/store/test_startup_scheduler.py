@@ -0,0 +1,198 @@
+"""Tests for dependency-aware, lazy-aware service startup."""
+
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, cast
+
+from ubo_app import service_thread as service_module
+from ubo_app.store.settings.types import SettingsStartServiceEvent
+from ubo_app.utils.startup_scheduler import StartupScheduler, StartupSpec
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+    from ubo_app.service_thread import UboServiceThread
+
+
+class _Scheduled:
+    """A scheduler over `specs` that records what it starts."""
+
+    def __init__(self, *specs: StartupSpec) -> None:
+        self.started: list[str] = []
+        self.scheduler = StartupScheduler(specs, self.started.append)
+
+    def request_all(self) -> list[str]:
+        """Request every service, as the start events do; return those let go."""
+        return [
+            spec
+            for spec in self.scheduler._order  # noqa: SLF001
+            if self.scheduler.request(spec)
+        ]
+
+
+def test_lazy_services_start_after_the_first_frame() -> None:
+    """The first wave goes at once; lazy services are held until the frame."""
+    scheduled = _Scheduled(
+        StartupSpec('display'),
+        StartupSpec('docker', is_lazy=True),
+        StartupSpec('wifi'),
+    )
+
+    assert scheduled.scheduler.first_wave == ('display', 'wifi')
+    assert scheduled.request_all() == ['display', 'wifi']
+
+    scheduled.scheduler.service_ready('display')
+    assert scheduled.started == []
+    scheduled.scheduler.first_frame()
+    scheduled.scheduler.first_frame()
+
+    assert scheduled.started == ['docker']
+
+
+def test_a_service_starts_once_its_dependencies_are_ready() -> None:
+    """Readiness of one dependency is not enough; a failed one still counts."""
+    scheduled = _Scheduled(
+        StartupSpec('audio'),
+        StartupSpec('keypad'),
+        StartupSpec('assistant', depends_on=('audio', 'keypad')),
+    )
+
+    assert scheduled.request_all() == ['audio', 'keypad']
+    scheduled.scheduler.service_ready('audio')
+    assert scheduled.started == []
+    # `service_ready` is also what a service whose setup raised reports.
+    scheduled.scheduler.service_ready('keypad')
+
+    assert scheduled.started == ['assistant']
+    assert scheduled.scheduler.request('assistant') is True
+
+
+def test_a_lazy_dependency_makes_its_dependents_wait_for_it() -> None:
+    """Depending on a lazy service means starting after the first frame too."""
+    scheduled = _Scheduled(
+        StartupSpec('audio'),
+        StartupSpec('docker', is_lazy=True),
+        StartupSpec('web_ui', depends_on=('docker',)),
+    )
+
+    assert scheduled.scheduler.first_wave == ('audio',)
+    assert scheduled.request_all() == ['audio']
+    scheduled.scheduler.first_frame()
+    assert scheduled.started == ['docker']
+    scheduled.scheduler.service_ready('docker')
+
+    assert scheduled.started == ['docker', 'web_ui']
+
+
+def test_unknown_dependencies_and_cycles_are_ignored() -> None:
+    """A service never waits for something that will not start, or for itself."""
+    scheduled = _Scheduled(
+        StartupSpec('wyoming', depends_on=('not-installed', 'wyoming')),
+        StartupSpec('first', depends_on=('second',)),
+        StartupSpec('second', depends_on=('first',)),
+        StartupSpec('third', depends_on=('second',)),
+    )
+
+    assert scheduled.scheduler.first_wave == ('wyoming', 'first', 'second')
+    assert scheduled.request_all() == ['wyoming', 'first', 'second']
+    scheduled.scheduler.service_ready('second')
+
+    assert scheduled.started == ['third']
+
+
+def test_services_outside_the_boot_are_never_held() -> None:
+    """A restart or a service started by hand after boot is not gated."""
+    scheduled = _Scheduled(StartupSpec('docker', is_lazy=True))
+
+    assert scheduled.scheduler.request('vscode') is True
+    assert scheduled.scheduler.request('docker') is False
+
+
+async def test_load_services_schedules_the_boot(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Only the first wave meets at the barrier; lazy start events wait."""
+    services_path = tmp_path / 'services'
+    for name in ('000-audio', '080-docker', '090-wyoming'):
+        (services_path / name).mkdir(parents=True)
+    started: list[str] = []
+    barrier_services: list[str] = []
+    declared = {
+        'audio': ((), False),
+        'docker': ((), True),
+        'wyoming': (('audio',), True),
+    }
+
+    class _LoadedService:
+        is_started = False
+
+        def __init__(self, path: Path, **_: object) -> None:
+            self.path = path
+            self.name = path.name
+            self.service_id = path.name.split('-', maxsplit=1)[1]
+            self.label = self.service_id
+            self.is_enabled = True
+            self.should_auto_restart = False
+            self.depends_on, self.is_lazy = declared[self.service_id]
+
+        def initiate(self) -> None:
+            service_module.SERVICES_BY_PATH[self.path] = cast('UboServiceThread', self)
+            service_module.SERVICE_PATHS_BY_ID[self.service_id] = self.path
+
+        def is_alive(self) -> bool:
+            return False
+
+        def start(self) -> None:
+            started.append(self.service_id)
+
+    fake_main = ModuleType('ubo_app.store.main')
+    fake_main.store = type(  # type: ignore[attr-defined]
+        'Store',
+        (),
+        {
+            'subscribe_event': lambda *_args: None,
+            'dispatch': lambda *_args: None,
+        },
+    )()
+    from ubo_app.utils import persistent_store
+
+    monkeypatch.setitem(sys.modules, 'ubo_app.store.main', fake_main)
+    monkeypatch.setattr(service_module, 'ROOT_PATH', tmp_path)
+    monkeypatch.setattr(service_module, 'SERVICES_PATH', [])
+    monkeypatch.setattr(service_module, 'SERVICES_BY_PATH', {})
+    monkeypatch.setattr(service_module, 'SERVICE_PATHS_BY_ID', {})
+    monkeypatch.setattr(service_module, '_scheduler', [None])
+    monkeypatch.setattr(service_module, 'UboServiceThread', _LoadedService)
+    monkeypatch.setattr(
+        service_module,
+        '_setup_reducer_barrier',
+        lambda services: barrier_services.extend(
+            service.service_id for service in services
+        ),
+    )
+    monkeypatch.setattr(
+        persistent_store,
+        'read_from_persistent_store',
+        lambda *_args, **_kwargs: [],
+    )
+
+    service_module.load_services(schedule=True)
+    for service_id in ('audio', 'docker', 'wyoming'):
+        await service_module.start(SettingsStartServiceEvent(service_id=service_id))
+
+    assert barrier_services == ['audio']
+    assert started == ['audio']
+
+    scheduler = service_module._scheduler[0]  # noqa: SLF001
+    assert scheduler is not None
+    service_module._first_frame(scheduler)  # noqa: SLF001
+    assert started == ['audio', 'docker']
+    for service_id in ('audio', 'docker'):
+        scheduler.service_ready(service_id)
+
+    assert started == ['audio', 'docker', 'wyoming']
@@ -0,0 +1,241 @@
+"""Tests for saving slices of the state and restoring them on boot."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from immutable import Immutable
+from redux import CompleteReducerResult
+
+from ubo_app.store.core.types import ReportProvisionalSlicesAction
+from ubo_app.utils.state_snapshot import SNAPSHOT_VERSION, StateSnapshot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _Network(Immutable):
+    ssid: str | None = None
+
+
+class _Other(Immutable):
+    value: int = 0
+
+
+class _Connect(Immutable):
+    ssid: str
+
+
+class _Tick(Immutable): ...
+
+
+class _Link(Immutable):
+    ssid: str | None = None
+    strength: int = 0
+
+
+class _Strength(Immutable):
+    strength: int
+
+
+class _RootState(Immutable):
+    wifi: _Network | None = None
+    ssh: _Network | None = None
+
+
+def _reducer(state: _Network | None, action: object) -> object:
+    if state is None:
+        return CompleteReducerResult(state=_Network(), actions=[_Tick()])
+    if isinstance(action, _Connect):
+        return _Network(ssid=action.ssid)
+    return state
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+
+def _snapshot(
+    path: Path,
+    clock: _Clock,
+    state: list[object],
+    **kwargs: Any,  # noqa: ANN401
+) -> StateSnapshot:
+    return StateSnapshot(
+        path=path,
+        slices={'wifi', 'ssh'},
+        enabled=True,
+        stale_timeout=10,
+        serialize=lambda value: {'ssid': value.ssid},
+        load=lambda data: _Network(**data),
+        read_state=lambda: state[0],
+        clock=clock,
+        **kwargs,
+    )
+
+
+def _write(path: Path, **slices: object) -> None:
+    path.write_text(
+        json.dumps({'version': SNAPSHOT_VERSION, 'payload': slices}),
+    )
+
+
+def test_saved_slices_come_back_provisional_until_confirmed(tmp_path: Path) -> None:
+    """A restored slice is stale until its reducer returns a state of its own."""
+    path = tmp_path / 'snapshot.json'
+    clock = _Clock()
+    state: list[object] = [_RootState(wifi=_Network(ssid='home'), ssh=None)]
+    _snapshot(path, clock, state).save()
+    assert json.loads(path.read_text()) == {
+        'version': SNAPSHOT_VERSION,
+        'payload': {'wifi': {'ssid': 'home'}},
+    }
+
+    snapshot = _snapshot(path, clock, state)
+    snapshot.load()
+    snapshot.expect(['wifi', 'keypad'])
+    reducer = snapshot.wrap('wifi', _reducer)
+    assert snapshot.wrap('keypad', _reducer) is _reducer
+
+    clock.now = 1_000
+    initial = reducer(None, object())
+    assert isinstance(initial, CompleteReducerResult)
+    assert initial.state == _Network(ssid='home')
+    assert initial.actions == [
+        _Tick(),
+        ReportProvisionalSlicesAction(slices=('wifi',)),
+    ]
+    assert snapshot.stale == {'wifi'}
+    assert reducer(initial.state, _Tick()) is initial.state
+
+    clock.now = 2_000
+    snapshot.view_released()
+    clock.now = 5_000
+    settled = reducer(initial.state, _Connect(ssid='home'))
+    assert isinstance(settled, CompleteReducerResult)
+    assert settled.state == _Network(ssid='home')
+    assert settled.actions == [ReportProvisionalSlicesAction(slices=())]
+
+    assert snapshot.stale == set()
+    # The restored value was right, so the screen was from the first view.
+    assert snapshot.first_correct_screen == 2.0
+
+
+def test_without_restore_the_screen_is_correct_once_the_service_reports(
+    tmp_path: Path,
+) -> None:
+    """The same measure with restoring off is the baseline to compare with."""
+    path = tmp_path / 'snapshot.json'
+    _write(path, wifi={'ssid': 'home'})
+    clock = _Clock()
+    snapshot = _snapshot(path, clock, [_RootState()], restore=False)
+    snapshot.load()
+    snapshot.expect(['wifi'])
+    reducer = snapshot.wrap('wifi', _reducer)
+
+    clock.now = 1_000
+    initial = reducer(None, object())
+    assert isinstance(initial, CompleteReducerResult)
+    assert initial.state == _Network()
+    assert snapshot.stale == set()
+    clock.now = 2_000
+    snapshot.view_released()
+    assert snapshot.first_correct_screen is None
+
+    clock.now = 5_000
+    reducer(initial.state, _Connect(ssid='home'))
+    assert snapshot.first_correct_screen == 5.0
+
+
+def test_a_slice_nobody_confirms_falls_back_to_the_initial_state(
+    tmp_path: Path,
+) -> None:
+    """Past the stale timeout the reducer's own initial state takes over."""
+    path = tmp_path / 'snapshot.json'
+    _write(path, wifi={'ssid': 'gone'}, ssh={'ssid': 'kept'})
+    clock = _Clock()
+    state: list[object] = [_RootState(wifi=_Network(ssid='new'), ssh=_Network())]
+    snapshot = _snapshot(path, clock, state)
+    snapshot.load()
+    reducer = snapshot.wrap('ssh', _reducer)
+    restored = reducer(None, object())
+    assert isinstance(restored, CompleteReducerResult)
+    assert snapshot.stale == {'ssh'}
+
+    # A stale slice keeps its saved data; the others are saved as they are.
+    snapshot.save()
+    assert json.loads(path.read_text())['payload'] == {
+        'wifi': {'ssid': 'new'},
+        'ssh': {'ssid': 'kept'},
+    }
+
+    clock.now = 10_000_000
+    expired = reducer(restored.state, _Tick())
+    assert isinstance(expired, CompleteReducerResult)
+    assert expired.state == _Network()
+    assert expired.actions == [ReportProvisionalSlicesAction(slices=())]
+    assert snapshot.stale == set()
+
+
+def test_the_first_report_settles_the_whole_slice(tmp_path: Path) -> None:
+    """Staleness is per slice: fields the action did not touch settle too."""
+    path = tmp_path / 'snapshot.json'
+    _write(path, wifi={'ssid': 'home', 'strength': 3})
+
+    def reducer_(state: _Link | None, action: object) -> _Link:
+        if state is None:
+            return _Link()
+        if isinstance(action, _Strength):
+            return _Link(ssid=state.ssid, strength=action.strength)
+        return state
+
+    snapshot = StateSnapshot(
+        path=path,
+        slices={'wifi'},
+        enabled=True,
+        load=lambda data: _Link(**data),
+        clock=_Clock(),
+    )
+    snapshot.load()
+    reducer = snapshot.wrap('wifi', reducer_)
+    restored = reducer(None, object())
+    assert isinstance(restored, CompleteReducerResult)
+    assert restored.state == _Link(ssid='home', strength=3)
+
+    settled = reducer(restored.state, _Strength(strength=1))
+
+    assert isinstance(settled, CompleteReducerResult)
+    assert settled.state == _Link(ssid='home', strength=1)
+    assert settled.actions == [ReportProvisionalSlicesAction(slices=())]
+    assert snapshot.stale == set()
+
+
+def test_unusable_snapshots_are_ignored(tmp_path: Path) -> None:
+    """Another version of the encoding or a slice of another type is dropped."""
+    path = tmp_path / 'snapshot.json'
+    path.write_text(json.dumps({'version': 0, 'payload': {'wifi': {}}}))
+    clock = _Clock()
+    snapshot = _snapshot(path, clock, [_RootState()])
+    snapshot.load()
+    result = snapshot.wrap('wifi', _reducer)(None, object())
+    assert isinstance(result, CompleteReducerResult)
+    assert result.state == _Network()
+
+    _write(path, wifi={'ssid': 'home'})
+    snapshot = StateSnapshot(
+        path=path,
+        slices={'wifi'},
+        enabled=True,
+        load=lambda data: _Other(value=len(data)),
+        clock=clock,
+    )
+    snapshot.load()
+    result = snapshot.wrap('wifi', _reducer)(None, object())
+    assert isinstance(result, CompleteReducerResult)
+    assert result.state == _Network()
+    assert snapshot.stale == set()
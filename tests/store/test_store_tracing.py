@@ -0,0 +1,216 @@
+"""Tests for opt-in store tracing (``ubo_app/store/tracing.py``).
+
+The histogram keeps HDR-style log-linear buckets, so its percentiles must stay
+within 1% of the recorded values; the tracer attributes action, handler and
+autorun timings and exports them as Chrome-trace JSON. The last test drives a
+real action through ``UboStore.run`` into a service's event handler.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pytest
+    from ubo_handle import (  # pyright: ignore [reportMissingModuleSource]
+        ReducerRegistrar,
+    )
+
+    from tests.fixtures import AppContext, LoadServices
+    from ubo_app.utils.types import Subscriptions
+
+
+def test_histogram_percentiles_are_within_one_percent() -> None:
+    """Percentiles of a wide uniform spread land within the bucket precision."""
+    from ubo_app.store.tracing import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    for value in range(1, 100_001):
+        histogram.record(value)
+
+    assert histogram.count == 100_000
+    assert histogram.min == 1
+    assert histogram.max == 100_000
+    for percentile, expected in ((50, 50_000), (90, 90_000), (99, 99_000)):
+        assert abs(histogram.percentile(percentile) - expected) <= expected / 100
+
+
+def test_histogram_small_values_are_exact() -> None:
+    """Durations below 128 µs get one bucket each."""
+    from ubo_app.store.tracing import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    for value in (3, 3, 7, 120):
+        histogram.record(value)
+
+    assert histogram.percentile(50) == 3
+    assert histogram.percentile(75) == 7
+    assert histogram.percentile(100) == 120
+
+
+def test_tracer_attributes_autoruns_to_the_running_action() -> None:
+    """Reactions scheduled during an action's listeners name that action."""
+    from ubo_app.store.tracing import StoreTracer, now
+
+    class PingAction: ...
+
+    tracer = StoreTracer()
+    tracer.set_enabled(True)
+    action = PingAction()
+
+    tracer.action_dispatched(action)
+    dequeued_at = tracer.action_dequeued(action)
+    reduced_at = tracer.action_reduced(action, dequeued_at)
+    woken_by = tracer.autorun_woken()
+    tracer.action_listeners_done(action, reduced_at)
+    tracer.autorun_finished(autorun='sync', woken_by=woken_by, started_at=now())
+
+    assert woken_by == 'PingAction'
+    assert tracer.autorun_woken() is None
+    assert set(tracer.histograms()) == {
+        'autorun:sync',
+        'listeners:PingAction',
+        'queue:PingAction',
+        'reduce:PingAction',
+    }
+
+    trace = tracer.chrome_trace()
+    json.dumps(trace)
+    listeners = next(
+        span
+        for span in trace['traceEvents']
+        if span.get('name') == 'listeners PingAction'
+    )
+    assert listeners['ph'] == 'X'
+    assert listeners['args'] == {'autoruns_woken': 1}
+    track_names = {
+        span['args']['name'] for span in trace['traceEvents'] if span['ph'] == 'M'
+    }
+    assert track_names == {'store queue', 'store', 'autoruns'}
+    assert trace['otherData']['histograms']['reduce:PingAction']['count'] == 1
+
+
+async def test_store_run_traces_actions_and_service_handlers(
+    app_context: AppContext,
+    load_services: LoadServices,
+) -> None:
+    """A dispatched action is traced through its reducer to a service handler."""
+    import asyncio
+    from pathlib import Path
+
+    from immutable import Immutable
+    from redux import (
+        BaseAction,
+        CompleteReducerResult,
+        InitAction,
+        InitializationActionError,
+        ReducerResult,
+    )
+
+    from ubo_app.service_thread import (
+        SERVICE_PATHS_BY_ID,
+        SERVICES_BY_PATH,
+        UboServiceThread,
+    )
+    from ubo_app.store.core.types import MainAction, MainEvent
+
+    class TracedEvent(MainEvent): ...
+
+    class TracedAction(MainAction): ...
+
+    class TracedState(Immutable): ...
+
+    app_context.set_app()
+
+    from ubo_app.store.main import store
+    from ubo_app.store.tracing import store_tracer
+
+    loop = asyncio.get_event_loop()
+    handled = asyncio.Event()
+
+    def on_traced_event() -> None:
+        loop.call_soon_threadsafe(handled.set)
+
+    def reducer(
+        state: TracedState | None,
+        action: BaseAction,
+    ) -> ReducerResult[TracedState, None, TracedEvent]:
+        if state is None:
+            if isinstance(action, InitAction):
+                return TracedState()
+            raise InitializationActionError(action)
+        if isinstance(action, TracedAction):
+            return CompleteReducerResult(state=state, events=[TracedEvent()])
+        return state
+
+    def service_setup(register_reducer: ReducerRegistrar) -> Subscriptions:
+        register_reducer(reducer)
+        return [store.subscribe_event(TracedEvent, on_traced_event)]
+
+    service_thread = UboServiceThread(path=Path('/ubo-services/traced'))
+    service_thread.register(
+        service_id='traced',
+        label='Traced Service',
+        setup=service_setup,
+    )
+    SERVICES_BY_PATH[service_thread.path] = service_thread
+    SERVICE_PATHS_BY_ID[service_thread.service_id] = service_thread.path
+
+    unload_waiter = await load_services(service_ids=['traced'], run_async=True)
+    store_tracer.reset()
+    store_tracer.set_enabled(True)
+    try:
+        store.dispatch(TracedAction())
+        await asyncio.wait_for(handled.wait(), timeout=30)
+        # The handler's span is recorded right after it returns.
+        for _ in range(100):
+            histograms = store_tracer.histograms()
+            if any(metric.startswith('handler:') for metric in histograms):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        store_tracer.set_enabled(False)
+        await unload_waiter()
+
+    assert histograms['queue:TracedAction']['count'] == 1
+    assert histograms['reduce:TracedAction']['count'] == 1
+    assert histograms['listeners:TracedAction']['count'] == 1
+    handler_metric = next(
+        metric for metric in histograms if metric.startswith('handler:TracedEvent:')
+    )
+    assert handler_metric.endswith('on_traced_event')
+    tracks = {
+        span['args']['name']
+        for span in store_tracer.chrome_trace()['traceEvents']
+        if span['ph'] == 'M'
+    }
+    assert 'traced' in tracks
+
+
+def test_written_trace_is_served_by_download_token(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """A trace is fetched with its token; the store never carries it."""
+    from ubo_app.store.settings.types import SettingsStoreTraceEvent
+    from ubo_app.store.tracing import StoreTracer, write_trace
+    from ubo_app.utils.file_download import consume_download, get_pending_downloads
+
+    tracer = StoreTracer()
+    tracer.set_enabled(True)
+    tracer.action_dispatched('PingAction')
+    monkeypatch.chdir(tmp_path)
+
+    path, token = write_trace(tracer)
+
+    assert path == 'traces/ubo-trace-000.json'
+    assert write_trace(tracer)[0] == 'traces/ubo-trace-001.json'
+    # Not pushed to the web UI's browsers, only served to who has the token.
+    assert get_pending_downloads() == []
+    download = consume_download(token)
+    assert download is not None
+    assert download.file_path == path
+    assert json.loads(Path(path).read_text()) == tracer.chrome_trace()
+    assert set(SettingsStoreTraceEvent.__annotations__) == {'path', 'download_token'}
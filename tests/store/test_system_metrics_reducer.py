@@ -156,6 +156,29 @@ def test_storage_update_leaves_the_fast_fields_alone() -> None:
     assert state.boot_time == 1700000000.0
 
 
+def test_service_usage_update_replaces_the_sample() -> None:
+    """Each sample replaces the last; services that ended drop out."""
+    state = reducer(
+        _state(),
+        types.SystemServiceUsageUpdateAction(
+            usage={
+                'audio': types.ServiceUsage(cpu_percent=3.0, threads=2),
+                'core': types.ServiceUsage(cpu_percent=1.0, threads=4),
+            },
+        ),
+    )
+    state = reducer(
+        state,
+        types.SystemServiceUsageUpdateAction(
+            usage={'core': types.ServiceUsage(cpu_percent=2.0, threads=3)},
+        ),
+    )
+
+    assert state.service_usage == {
+        'core': types.ServiceUsage(cpu_percent=2.0, threads=3),
+    }
+
+
 def test_unknown_action_returns_the_same_state() -> None:
     """An action the slice doesn't own passes through unchanged."""
     state = _state()
@@ -0,0 +1,99 @@
+"""Tests for ``UtteranceBuffer``, the audio of an ongoing recognition."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.service_loader import SERVICES_ROOT, load_service_modules
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+RATE = 16_000
+
+
+@pytest.fixture(scope='module')
+def utterance_buffer() -> ModuleType:
+    """Load the buffer's module from the speech-recognition service."""
+    (module,) = load_service_modules(
+        SERVICES_ROOT / '090-speech-recognition',
+        'utterance_buffer',
+    )
+    return module
+
+
+def _chunk(value: int, samples: int = 800) -> bytes:
+    return value.to_bytes(2, 'little') * samples
+
+
+def test_appends_are_kept_as_they_came(utterance_buffer: ModuleType) -> None:
+    """Chunks are held uncopied and joined once, when the audio is viewed."""
+    buffer = utterance_buffer.UtteranceBuffer()
+    chunks = [_chunk(value) for value in range(3)]
+    for chunk in chunks:
+        buffer.append(chunk)
+    buffer.append(b'')
+
+    assert len(buffer) == 4800
+    assert buffer.duration == pytest.approx(0.15)
+    assert [view.obj for view in buffer.chunks()] == chunks
+    view = buffer.view()
+    assert view.readonly
+    assert view == b''.join(chunks)
+    assert buffer.view() is view
+    assert bytes(buffer) == b''.join(chunks)
+
+    buffer.append(bytearray(_chunk(3)))
+    assert buffer.view() == b''.join([*chunks, _chunk(3)])
+
+
+def test_oldest_audio_is_trimmed_past_the_maximum(
+    utterance_buffer: ModuleType,
+) -> None:
+    """Past ``max_seconds`` the start goes, in whole samples, mid-chunk too."""
+    buffer = utterance_buffer.UtteranceBuffer(max_seconds=0.1)
+    for value in range(5):
+        buffer.append(_chunk(value))
+
+    assert buffer.duration == pytest.approx(0.1)
+    assert bytes(buffer) == _chunk(3) + _chunk(4)
+
+    buffer.append(_chunk(5, samples=401))
+    assert len(buffer) == 3200
+    assert bytes(buffer) == _chunk(3, samples=399) + _chunk(4) + _chunk(5, 401)
+
+
+def test_spool_moves_to_disk_past_its_memory(
+    utterance_buffer: ModuleType,
+) -> None:
+    """A long recording is spooled to a file, chunk by chunk."""
+    buffer = utterance_buffer.UtteranceBuffer()
+    for value in range(20):
+        buffer.append(_chunk(value))
+
+    with buffer.spool(max_memory_bytes=10_000) as spool:
+        assert spool._rolled  # noqa: SLF001
+        assert spool.read() == b''.join(_chunk(value) for value in range(20))
+    with buffer.spool() as spool:
+        assert not spool._rolled  # noqa: SLF001
+
+
+def test_recognition_keeps_the_end_of_a_long_utterance(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``append_voice`` fills the buffer, up to ``MAX_UTTERANCE_SECONDS``."""
+    utterance_buffer, mixin = load_service_modules(
+        SERVICES_ROOT / '090-speech-recognition',
+        'utterance_buffer',
+        'abstraction.speech_recognition_mixin',
+    )
+    monkeypatch.setattr(mixin, 'MAX_UTTERANCE_SECONDS', 1)
+    recognition = mixin.Recognition('vosk')
+    for value in range(30):
+        recognition.append_voice(_chunk(value))
+
+    assert isinstance(recognition.audio, utterance_buffer.UtteranceBuffer)
+    assert recognition.audio.duration == 1
+    assert bytes(recognition.audio)[:2] == _chunk(10)[:2]
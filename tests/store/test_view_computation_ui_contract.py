@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import math
+import re
 import sys
+from pathlib import Path
 from types import ModuleType, SimpleNamespace
 from typing import TYPE_CHECKING, cast
 
 import pytest
 
+import ubo_app
 from ubo_app.store.core import view_computation
 from ubo_app.store.core.stack_ops import create_root_stack_item
 from ubo_app.store.core.types import (
@@ -47,7 +50,7 @@ from ubo_app.store.services.sensors import SensorsState, SensorState
 
 if TYPE_CHECKING:
     from ubo_app.store.core.types import StackItemType
-    from ubo_app.store.main import RootState
+    from ubo_app.store.main import RootState, UboStore
 
 
 @pytest.fixture(autouse=True)
@@ -156,7 +159,7 @@ def test_background_notification_does_not_steal_visible_view() -> None:
         _root(
             main,
             notifications=NotificationsState(
-                notifications=(background,),
+                notifications={background.id: background},
                 unread_count=1,
             ),
         ),
@@ -214,7 +217,7 @@ def test_missing_notification_reveals_underlying_view_and_has_safe_fallback() ->
     )
 
     view = compute_view_from_root_state(
-        _root(main, notifications=NotificationsState(notifications=(), unread_count=0)),
+        _root(main, notifications=NotificationsState(notifications={}, unread_count=0)),
     )
 
     assert isinstance(view, HomeViewData)
@@ -243,8 +246,10 @@ def test_compute_status_bar_data_collects_ui_state(
     state = _root(
         MainState(is_recording=True, is_replaying=True),
         notifications=NotificationsState(
-            notifications=(progress, measured),
+            notifications={progress.id: progress, measured.id: measured},
             unread_count=2,
+            progress=math.nan,
+            progress_ids=(progress.id, measured.id),
         ),
         status_icons=SimpleNamespace(
             icons=(SimpleNamespace(symbol='wifi', color='blue'),),
@@ -285,3 +290,112 @@ def test_compute_status_bar_ignores_malformed_icon_source() -> None:
     )
 
     assert status.icons == ()
+
+
+def test_view_is_recomputed_only_for_what_is_on_screen() -> None:
+    """Off-screen menu updates and status-bar ticks reuse the memoized view."""
+    from ubo_app.store.core.types import DynamicMenuData, MenuStackItem
+
+    stage = view_computation._MemoizedStage(  # noqa: SLF001
+        view_computation._view_key,  # noqa: SLF001
+        compute_view_from_root_state,
+    )
+    main = MainState(
+        stack=(
+            *create_root_stack_item(),
+            MenuStackItem(id='wifi', menu_key='wifi:connections'),
+        ),
+    )
+    wifi = DynamicMenuData(menu_id='wifi:connections', title='Wi-Fi')
+    audio = DynamicMenuData(menu_id='audio:devices', title='Audio')
+    menus = {'wifi:connections': wifi, 'audio:devices': audio}
+
+    def state(versions: dict[str, int], temperature: float) -> RootState:
+        return cast(
+            'RootState',
+            SimpleNamespace(
+                main=main,
+                dynamic_menus=DynamicMenusState(menus=menus, versions=versions),
+                sensors=SensorsState(
+                    temperature=SensorState(value=temperature),
+                    light=SensorState(),
+                ),
+            ),
+        )
+
+    first = state({'wifi:connections': 1, 'audio:devices': 2}, 20)
+    off_screen = state({'wifi:connections': 1, 'audio:devices': 3}, 21)
+    on_screen = state({'wifi:connections': 4, 'audio:devices': 3}, 21)
+
+    status_bar_key = view_computation._status_bar_key  # noqa: SLF001
+    view = stage(first)
+    assert stage(off_screen) is view
+    assert status_bar_key(off_screen) != status_bar_key(first)
+    assert stage(on_screen) == view
+    assert (stage.computed, stage.avoided) == (2, 1)
+    assert set(view_computation.get_view_computation_stats()) == {
+        'view',
+        'status_bar',
+    }
+
+
+def test_status_bar_key_reads_the_hostname_once_per_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The key, computed per action, leaves the syscall and notifications be."""
+    calls: list[float] = []
+    now = [100.0]
+    monkeypatch.setattr(
+        'ubo_app.store.core.view_computation.socket.gethostname',
+        lambda: calls.append(now[0]) or 'ubo-test',
+    )
+    monkeypatch.setattr(
+        'ubo_app.store.core.view_computation.time.monotonic',
+        lambda: now[0],
+    )
+    monkeypatch.setattr(
+        view_computation,
+        '_hostname_cache',
+        [(-math.inf, '')],
+    )
+    notifications = NotificationsState(notifications={}, unread_count=0)
+    state = _root(MainState(), notifications=notifications)
+    status_bar_key = view_computation._status_bar_key  # noqa: SLF001
+
+    first = status_bar_key(state)
+    for _ in range(100):
+        assert status_bar_key(state) == first
+    now[0] += view_computation.HOSTNAME_TTL
+    status_bar_key(state)
+
+    assert calls == [100.0, 100.0 + view_computation.HOSTNAME_TTL]
+    assert first[1] is notifications
+
+
+def test_first_view_is_computed_without_held_back_slices() -> None:
+    """Slices of lazy and dependent services may be registered after it."""
+    from ubo_app.store.core.types import UpdateCurrentViewAction
+
+    held_back = {
+        match.group(1)
+        for handle in Path(ubo_app.__file__).parent.glob('services/*/ubo_handle.py')
+        if re.search(r'\b(is_lazy=True|depends_on=)', text := handle.read_text())
+        and (match := re.search(r"service_id='([^']+)'", text))
+    }
+    assert {'docker', 'mcp', 'vscode', 'wyoming'} <= held_back
+    state = _root(
+        MainState(stack=create_root_stack_item()),
+        notifications=NotificationsState(),
+        sensors=SensorsState(),
+    )
+    assert not any(hasattr(state, slice_) for slice_ in held_back)
+    dispatched: list[object] = []
+
+    view_computation._dispatch_view_update(  # noqa: SLF001
+        state,
+        cast('UboStore', SimpleNamespace(dispatch=dispatched.append)),
+    )
+
+    (action,) = dispatched
+    assert isinstance(action, UpdateCurrentViewAction)
+    assert action.view == compute_view_from_root_state(state)
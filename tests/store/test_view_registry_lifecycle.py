@@ -14,12 +14,10 @@ from ubo_app.store.core.view_registry import (
     get_category_icon,
     get_home_view_data,
     get_menu_id_for_path,
-    get_registered_dependencies,
     get_registered_status_bar_dependencies,
     register_apps_menu_title,
     register_category_icon,
     register_home_view_data_provider,
-    register_menu_content_dependency,
     register_path_menu_matcher,
     register_status_bar_dependency,
 )
@@ -80,23 +78,12 @@ def test_dependency_selectors_isolate_provider_errors() -> None:
         'status:broken',
         lambda state: cast('Any', state).missing,
     )
-    unregister_menu_ok = register_menu_content_dependency(
-        'menu:ok',
-        lambda state: cast('Any', state).value * 2,
-    )
-    unregister_menu_broken = register_menu_content_dependency(
-        'menu:broken',
-        lambda _state: {}['missing'],
-    )
     try:
         state = cast('RootState', SimpleNamespace(value=3))
         assert get_registered_status_bar_dependencies(state) == (3, None)
-        assert get_registered_dependencies(state) == (6, None)
     finally:
         unregister_status_ok()
         unregister_status_broken()
-        unregister_menu_ok()
-        unregister_menu_broken()
 
 
 def test_view_metadata_registrations_cleanup_to_defaults() -> None:
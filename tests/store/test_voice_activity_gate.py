@@ -0,0 +1,240 @@
+"""Recall and duty cycle of the voice-activity gate over a synthetic corpus.
+
+Each scene is background noise with utterances laid over it: a breathy onset
+well below the voiced part, then syllables of a harmonic voice. The scenes go
+through the real ``EnginesManager._queue_chunk`` to stand-in engines that note
+which stretch of the stream they were handed. An engine counts an utterance
+as heard when it got all of it, with its ``LEAD_IN`` before and ``TRAIL``
+after (enough for Vosk to end it), so recall is compared against an ungated
+engine for every pre-roll the real engines declare.
+"""
+
+from __future__ import annotations
+
+import math
+import zlib
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import pytest
+
+from tests.service_loader import SERVICES_ROOT, load_service_modules
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
+
+RATE = 16_000
+CHUNK_SECONDS = 0.05
+CHUNK = int(RATE * CHUNK_SECONDS)
+# Audio each engine needs ahead of an utterance: Vosk a quiet moment before
+# the first phone, the wake-word models most of their window ahead of the word.
+LEAD_IN = {'ungated': 1.0, 'vosk': 0.25, 'openwakeword': 1.0, 'microwakeword': 0.75}
+TRAIL = 0.5
+
+
+class Scene(NamedTuple):
+    """Background and utterance levels, in dBFS, with when they change."""
+
+    name: str
+    seconds: float
+    background: float
+    speech: float
+    starts: tuple[float, ...]
+    background_after: tuple[float, float] | None = None
+
+
+SCENES = (
+    Scene('quiet room', 24, background=-65, speech=-30, starts=(3, 8, 13, 19)),
+    Scene('fan', 24, background=-45, speech=-33, starts=(3, 8, 13, 19)),
+    Scene('soft speaker', 24, background=-62, speech=-56, starts=(3, 8, 13, 19)),
+    Scene(
+        'fan turns on',
+        40,
+        background=-65,
+        speech=-33,
+        starts=(26, 32),
+        background_after=(8, -45),
+    ),
+)
+
+
+def _at_level(signal: np.ndarray, level: float) -> np.ndarray:
+    rms = math.sqrt(float(np.mean(signal**2)))
+    return signal * (32768 * 10 ** (level / 20) / rms)
+
+
+def _utterance(generator: np.random.Generator, level: float) -> np.ndarray:
+    """About a second of speech: a breathy onset, then three syllables."""
+    onset = _at_level(generator.normal(0, 1, int(RATE * 0.08)), level - 15)
+    time = np.arange(int(RATE * 0.9)) / RATE
+    pitch = 120 + 40 * np.sin(2 * np.pi * 1.3 * time + generator.uniform(0, 6))
+    phase = 2 * np.pi * np.cumsum(pitch) / RATE
+    voice = sum(np.sin(harmonic * phase) / harmonic for harmonic in range(1, 8))
+    envelope = np.sin(np.pi * 3.3 * time) ** 2
+    return np.concatenate([onset, _at_level(voice * envelope, level)])
+
+
+def _render(scene: Scene) -> tuple[bytes, list[tuple[float, float]]]:
+    generator = np.random.default_rng(zlib.crc32(scene.name.encode()))
+    audio = _at_level(
+        generator.normal(0, 1, int(RATE * scene.seconds)),
+        scene.background,
+    )
+    if scene.background_after:
+        at, level = scene.background_after
+        tail = audio[int(RATE * at) :]
+        audio[int(RATE * at) :] = tail * 10 ** ((level - scene.background) / 20)
+    spans: list[tuple[float, float]] = []
+    for start in scene.starts:
+        utterance = _utterance(generator, scene.speech)
+        index = int(RATE * start)
+        audio[index : index + utterance.size] += utterance
+        spans.append((start, start + utterance.size / RATE))
+    pcm = audio.clip(-32768, 32767).astype(np.int16).tobytes()
+    return pcm, spans
+
+
+class _Engine:
+    """Notes the stretches of the stream it is handed."""
+
+    def __init__(self, clock: list[float], pre_roll_seconds: float | None) -> None:
+        self.clock = clock
+        self.pre_roll_seconds = pre_roll_seconds
+        self.heard: list[tuple[float, float]] = []
+
+    def hears_silence(self) -> bool:
+        return self.pre_roll_seconds is None
+
+    async def queue_audio_chunk(self, chunk: bytes) -> None:
+        end = self.clock[0]
+        start = end - len(chunk) / (2 * RATE)
+        if self.heard and abs(self.heard[-1][1] - start) < 1e-6:
+            self.heard[-1] = (self.heard[-1][0], end)
+        else:
+            self.heard.append((start, end))
+
+    def recall(self, spans: list[tuple[float, float]], lead_in: float) -> float:
+        found = sum(
+            any(
+                start <= begin - lead_in + 1e-6 and end + TRAIL <= stop + 1e-6
+                for start, stop in self.heard
+            )
+            for begin, end in spans
+        )
+        return found / len(spans)
+
+
+@pytest.fixture(scope='module')
+def modules() -> tuple[ModuleType, ...]:
+    """Load the manager and the modules it gates engines with."""
+    return load_service_modules(
+        SERVICES_ROOT / '090-speech-recognition',
+        'engines_manager',
+        'mic_buffer',
+        'voice_activity',
+        'vosk_engine',
+        'openwakeword_engine',
+        'microwakeword_engine',
+    )
+
+
+async def _play(
+    modules: tuple[ModuleType, ...],
+    scene: Scene,
+    tmp_path: Path,
+) -> tuple[dict[str, _Engine], object, list[tuple[float, float]]]:
+    from ubo_app.store.services.audio import AudioReportSampleEvent, AudioSample
+    from ubo_app.store.services.speech_recognition import WakeWordEngineName
+
+    (engines_manager, mic_buffer, voice_activity, vosk, openwakeword, micro) = modules
+    clock = [0.0]
+    engines = {
+        'ungated': _Engine(clock, None),
+        'vosk': _Engine(clock, vosk.VoskEngine.pre_roll_seconds),
+        'openwakeword': _Engine(
+            clock,
+            openwakeword.OpenWakeWordEngine.pre_roll_seconds,
+        ),
+        'microwakeword': _Engine(clock, micro.MicroWakeWordEngine.pre_roll_seconds),
+    }
+    manager = object.__new__(engines_manager.EnginesManager)
+    manager.mic_buffer = mic_buffer.MicBuffer(duration_seconds=5.0, output_dir=tmp_path)
+    manager.voice_activity = voice_activity.VoiceActivityGate()
+    manager._speech_engine = engines['vosk']
+    manager._wake_engines = {
+        WakeWordEngineName.VOSK: engines['vosk'],
+        WakeWordEngineName.OPENWAKEWORD: engines['openwakeword'],
+        WakeWordEngineName.MICROWAKEWORD: engines['microwakeword'],
+        'ungated': engines['ungated'],
+    }
+    manager._enabled_engines = set(manager._wake_engines)
+
+    pcm, spans = _render(scene)
+    for offset in range(0, len(pcm), 2 * CHUNK):
+        chunk = pcm[offset : offset + 2 * CHUNK]
+        timestamp = offset / (2 * RATE)
+        clock[0] = timestamp + CHUNK_SECONDS
+        await manager._queue_chunk(
+            AudioReportSampleEvent(
+                timestamp=timestamp,
+                sample_speech_recognition=chunk,
+                sample=AudioSample(data=chunk, channels=1, rate=RATE, width=2),
+            ),
+        )
+    return engines, manager.voice_activity, spans
+
+
+@pytest.mark.parametrize('scene', SCENES, ids=[scene.name for scene in SCENES])
+async def test_gate_keeps_recall(
+    modules: tuple[ModuleType, ...],
+    scene: Scene,
+    tmp_path: Path,
+) -> None:
+    """Every engine still hears every utterance with its lead-in and trail."""
+    engines, gate, spans = await _play(modules, scene, tmp_path)
+
+    recall = {
+        name: engine.recall(spans, LEAD_IN[name]) for name, engine in engines.items()
+    }
+    assert recall == dict.fromkeys(engines, 1.0), recall
+    # Utterances and their hangover, plus the fan's first seconds; the rest of
+    # the scene is silence no gated engine had to process.
+    assert gate.duty_cycle < 0.5, gate.duty_cycle  # pyright: ignore[reportAttributeAccessIssue]
+
+
+async def test_gate_stays_closed_in_a_quiet_room(
+    modules: tuple[ModuleType, ...],
+    tmp_path: Path,
+) -> None:
+    """A minute of room tone reaches no gated engine."""
+    scene = Scene('room tone', 60, background=-65, speech=-30, starts=())
+    engines, gate, _ = await _play(modules, scene, tmp_path)
+
+    assert gate.duty_cycle == 0  # pyright: ignore[reportAttributeAccessIssue]
+    assert engines['ungated'].heard == [pytest.approx((0, 60))]
+    assert all(not engines[name].heard for name in ('vosk', 'openwakeword'))
+
+
+def test_gate_follows_a_rising_noise_floor(modules: tuple[ModuleType, ...]) -> None:
+    """A step in the background opens the gate, which closes once it adapts."""
+    voice_activity = modules[2]
+    gate = voice_activity.VoiceActivityGate(hangover_seconds=0.5)
+    generator = np.random.default_rng(0)
+
+    def chunk(level: float) -> bytes:
+        samples = _at_level(generator.normal(0, 1, CHUNK), level)
+        return samples.astype(np.int16).tobytes()
+
+    quiet = [gate.update(chunk(-65)) for _ in range(40)]
+    assert not any(activity.is_open for activity in quiet)
+
+    loud = [gate.update(chunk(-45)) for _ in range(400)]
+    assert loud[0].opened
+    closed_after = next(
+        index for index, activity in enumerate(loud) if not activity.is_open
+    )
+    # 20 dB at 1 dB/s less the 9 dB margin, plus the hangover.
+    assert 10 <= closed_after * CHUNK_SECONDS <= 13
+    assert not any(activity.is_open for activity in loud[closed_after:])
+    assert voice_activity.level_db(b'') == voice_activity.level_db(bytes(CHUNK * 2))
@@ -73,7 +73,7 @@ async def test_reconcile_waits_then_self_heals_when_model_appears(
     )
     state = module._RecognizerState(  # noqa: SLF001
         model=None,
-        recognizer=None,
+        recognizers=None,
         loaded_model_id=None,
         phrases=None,
         retry_at=0.0,
@@ -82,7 +82,7 @@ async def test_reconcile_waits_then_self_heals_when_model_appears(
     # Model not downloaded yet: engine stays unloaded, no crash, and
     # ``loaded_model_id`` does NOT advance so the model keeps being retried.
     state = await module.VoskEngine._reconcile(engine, state)  # noqa: SLF001
-    assert state.recognizer is None
+    assert state.recognizers is None
     assert state.loaded_model_id is None
 
     # Download lands on disk: the next reconcile builds the recognizer with no
@@ -91,7 +91,7 @@ async def test_reconcile_waits_then_self_heals_when_model_appears(
     (tmp_path / 'm1').mkdir()
     state = state._replace(retry_at=0.0)
     state = await module.VoskEngine._reconcile(engine, state)  # noqa: SLF001
-    assert state.recognizer is not None
+    assert state.recognizers is not None
     assert state.model is not None
     assert state.loaded_model_id == 'm1'
 
@@ -114,7 +114,7 @@ async def test_reconcile_keeps_waiting_while_model_absent(
         # the load (instead of being throttled out).
         state = state._replace(retry_at=0.0)
         state = await module.VoskEngine._reconcile(engine, state)  # noqa: SLF001
-        assert state.recognizer is None
+        assert state.recognizers is None
         assert state.loaded_model_id is None
 
 
@@ -135,10 +135,10 @@ async def test_reconcile_retries_switched_model_without_abandoning_it(
     engine = SimpleNamespace(grammar_lock=asyncio.Lock(), _phrases=None)
 
     # Start with model 'a' already loaded; the user then selects 'b' (absent).
-    previous_recognizer = SimpleNamespace(kind='recognizer-a')
+    previous_recognizers = SimpleNamespace(kind='recognizers-a')
     state = module._RecognizerState(  # noqa: SLF001
         model=SimpleNamespace(kind='model-a'),
-        recognizer=previous_recognizer,
+        recognizers=previous_recognizers,
         loaded_model_id='a',
         phrases=None,
         retry_at=0.0,
@@ -149,14 +149,14 @@ async def test_reconcile_retries_switched_model_without_abandoning_it(
     # loaded_model_id (so 'b' keeps being retried).
     state = state._replace(retry_at=0.0)
     state = await module.VoskEngine._reconcile(engine, state)  # noqa: SLF001
-    assert state.recognizer is previous_recognizer
+    assert state.recognizers is previous_recognizers
     assert state.loaded_model_id == 'a'
 
     # 'b' finishes downloading: the retry loads it.
     (tmp_path / 'b').mkdir()
     state = state._replace(retry_at=0.0)
     state = await module.VoskEngine._reconcile(engine, state)  # noqa: SLF001
-    assert state.recognizer is not previous_recognizer
+    assert state.recognizers is not previous_recognizers
     assert state.loaded_model_id == 'b'
 
 
@@ -198,9 +198,15 @@ async def test_run_survives_malformed_chunk(
     _install_fake_vosk(monkeypatch)
 
     fake_recognizer = _FakeRecognizer()
+    monkeypatch.setattr(
+        sys.modules['vosk'],
+        'KaldiRecognizer',
+        lambda *_args: fake_recognizer,
+    )
+    model = SimpleNamespace(kind='model')
     state = module._RecognizerState(  # noqa: SLF001
-        model=SimpleNamespace(kind='model'),
-        recognizer=fake_recognizer,
+        model=model,
+        recognizers=module.RecognizerPool(model),
         loaded_model_id='m1',
         phrases=None,
         retry_at=0.0,
@@ -0,0 +1,124 @@
+"""Tests for the per-grammar Vosk recognizer pool.
+
+A stand-in ``vosk`` module builds recognizers that count their builds and
+resets and replay scripted results, so the pool is tested without Kaldi.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import types
+
+import pytest
+
+from ubo_app.engines.vosk_recognizers import RecognitionStep, RecognizerPool
+
+WAKE = ('okay ubo', '[unk]')
+COMMAND = ('yes', 'no', '[unk]')
+
+
+class _FakeRecognizer:
+    """Replays the partial and final texts a test scripts for it."""
+
+    def __init__(self, _model: object, _rate: int, grammar: str | None = None) -> None:
+        self.grammar = tuple(json.loads(grammar)) if grammar else ()
+        self.resets = 0
+        self.partial = ''
+        self.partials: list[str] = []
+        self.finals: list[str] = []
+
+    def Reset(self) -> None:  # noqa: N802
+        self.resets += 1
+
+    def AcceptWaveform(self, _data: bytes) -> bool:  # noqa: N802
+        if self.partials:
+            self.partial = self.partials.pop(0)
+            return False
+        return bool(self.finals)
+
+    def PartialResult(self) -> str:  # noqa: N802
+        return json.dumps({'partial': self.partial})
+
+    def FinalResult(self) -> str:  # noqa: N802
+        self.partial = ''
+        return json.dumps({'text': self.finals.pop(0)})
+
+
+@pytest.fixture
+def built(monkeypatch: pytest.MonkeyPatch) -> list[_FakeRecognizer]:
+    """Install the stand-in ``vosk``; return every recognizer it builds."""
+    recognizers: list[_FakeRecognizer] = []
+
+    def build(*args: object) -> _FakeRecognizer:
+        recognizer = _FakeRecognizer(*args)  # pyright: ignore[reportArgumentType]
+        recognizer.partials = ['']
+        recognizers.append(recognizer)
+        return recognizer
+
+    fake = types.ModuleType('vosk')
+    fake.KaldiRecognizer = build  # pyright: ignore[reportAttributeAccessIssue]
+    monkeypatch.setitem(sys.modules, 'vosk', fake)
+    return recognizers
+
+
+def test_switching_grammar_resets_a_prepared_recognizer(
+    built: list[_FakeRecognizer],
+) -> None:
+    """A wake word's switch to free speech reuses its recognizer, reset."""
+    pool = RecognizerPool(object())
+    pool.prepare(WAKE, ())
+    wake, speech = built
+
+    for _ in range(3):
+        pool.accept(WAKE, b'x')
+        pool.accept(None, b'x')
+        pool.accept((), b'x')
+
+    assert len(built) == 2
+    assert (wake.grammar, speech.grammar) == (WAKE, ())
+    # Every switch back resets, staying on a grammar doesn't.
+    assert (wake.resets, speech.resets) == (3, 3)
+
+
+def test_pool_evicts_the_least_recently_used_grammar(
+    built: list[_FakeRecognizer],
+) -> None:
+    """Past its capacity the pool forgets the grammar used longest ago."""
+    pool = RecognizerPool(object(), capacity=2)
+    pool.accept(WAKE, b'x')
+    pool.accept(COMMAND, b'x')
+    pool.accept(WAKE, b'x')
+    pool.accept((), b'x')
+
+    assert pool.grammars == (WAKE, ())
+    pool.accept(COMMAND, b'x')
+    assert [recognizer.grammar for recognizer in built] == [
+        WAKE,
+        COMMAND,
+        (),
+        COMMAND,
+    ]
+
+
+def test_partial_results_are_reported_when_they_change(
+    built: list[_FakeRecognizer],
+) -> None:
+    """Unchanged partials are skipped; a completed utterance is final."""
+    pool = RecognizerPool(object())
+    pool.prepare(())
+    (recognizer,) = built
+    recognizer.partials = ['', 'turn', 'turn', 'turn on', 'turn on']
+    recognizer.finals = ['turn on the light']
+
+    steps = [pool.accept((), b'x') for _ in range(7)]
+
+    assert steps == [
+        RecognitionStep(),
+        RecognitionStep(partial='turn'),
+        RecognitionStep(),
+        RecognitionStep(partial='turn on'),
+        RecognitionStep(),
+        RecognitionStep(final='turn on the light'),
+        RecognitionStep(),
+    ]
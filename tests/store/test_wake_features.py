@@ -0,0 +1,182 @@
+"""Tests for the shared wake-word feature front ends.
+
+The openWakeWord front end is driven with stand-ins for its feature models and
+VAD (their ``.onnx`` files are downloaded on the device); microWakeWord's runs
+for real, on the frontend ``pymicro_wakeword`` ships.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from tests.service_loader import SERVICES_ROOT, load_service_modules
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+FRAME = 1280
+
+
+@pytest.fixture(scope='module')
+def modules() -> tuple[ModuleType, ...]:
+    """Load the front ends and the engine that consumes them."""
+    return load_service_modules(
+        SERVICES_ROOT / '090-speech-recognition',
+        'wake_features',
+        'openwakeword_engine',
+    )
+
+
+class _Features:
+    """Stands in for openWakeWord's ``AudioFeatures``: one embedding a frame."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, _audio: np.ndarray) -> None:
+        self.calls += 1
+
+    def get_features(self, frames: int) -> np.ndarray:
+        return np.full((1, frames, 96), self.calls, dtype=np.float32)
+
+
+class _Vad:
+    """Scores each frame by its first sample, so tests place speech exactly."""
+
+    def predict(self, frame: np.ndarray, frame_size: int) -> float:
+        assert frame_size == 640
+        return float(frame[0])
+
+
+def _open_wake_word_front_end(wake_features: ModuleType, *, vad: bool) -> object:
+    front_end = object.__new__(wake_features.OpenWakeWordFrontEnd)
+    front_end._features = _Features()
+    front_end._noise_suppression = None
+    front_end._vad = None
+    front_end.vad_threshold = 0.0
+    front_end.embeddings = wake_features.FeatureRing(64, 96)
+    front_end.speech = wake_features.FeatureRing(64, 1)
+    if vad:
+        front_end.enable_vad(_Vad(), 0.5)
+    return front_end
+
+
+def _speech_at(frames: int, voiced: set[int]) -> np.ndarray:
+    audio = np.zeros((frames, FRAME), dtype=np.int16)
+    for index in voiced:
+        audio[index, 0] = 1
+    return audio.reshape(-1)
+
+
+def test_ring_keeps_the_latest_frames(modules: tuple[ModuleType, ...]) -> None:
+    """Windows read across the wrap; evicted or future frames are refused."""
+    wake_features = modules[0]
+    ring = wake_features.FeatureRing(4, 2)
+
+    indices = [ring.append(np.full(2, value)) for value in range(6)]
+
+    assert indices == list(range(6))
+    assert (ring.start, ring.end) == (2, 6)
+    assert ring.window(3, 6)[:, 0].tolist() == [3, 4, 5]
+    assert ring.window(2, 4)[:, 0].tolist() == [2, 3]
+    for count, end in ((3, 4), (1, 7), (5, 6)):
+        with pytest.raises(IndexError):
+            ring.window(count, end)
+
+
+def test_open_wake_word_front_end_runs_the_models_once_per_push(
+    modules: tuple[ModuleType, ...],
+) -> None:
+    """All whole frames of a push go through the models in one call."""
+    wake_features = modules[0]
+    front_end = _open_wake_word_front_end(wake_features, vad=False)
+
+    first = front_end.push(np.zeros(FRAME * 3 + 100, dtype=np.int16))
+    second = front_end.push(np.zeros(FRAME, dtype=np.int16))
+    empty = front_end.push(np.zeros(FRAME - 1, dtype=np.int16))
+
+    assert (first, second, empty) == (range(3), range(3, 4), range(4, 4))
+    assert front_end._features.calls == 2  # noqa: SLF001
+    assert front_end.embeddings.window(4, 4)[:, 0].tolist() == [1, 1, 1, 2]
+    assert not front_end.is_warm(4)
+    assert front_end.is_warm(5)
+    assert front_end.speech_likely(4)
+
+
+def test_open_wake_word_front_end_gates_on_speech_before_the_frame(
+    modules: tuple[ModuleType, ...],
+) -> None:
+    """Only speech 4 to 6 frames back counts, as openWakeWord scores it."""
+    wake_features = modules[0]
+    front_end = _open_wake_word_front_end(wake_features, vad=True)
+
+    front_end.push(_speech_at(20, {10}))
+
+    likely = [index for index in range(20) if front_end.speech_likely(index)]
+    assert likely == [14, 15, 16]
+
+
+class _Head:
+    """Scores frames from a table, noting which it was asked about."""
+
+    def __init__(self, scores: dict[int, float]) -> None:
+        self.scores = scores
+        self.scored: list[int] = []
+
+    def score(self, _embeddings: object, index: int) -> float:
+        self.scored.append(index)
+        return self.scores.get(index, 0.0)
+
+
+def test_engine_scores_every_head_on_the_shared_frames(
+    modules: tuple[ModuleType, ...],
+) -> None:
+    """Heads share the front end's frames and fire on their own sensitivity."""
+    wake_features, openwakeword_engine = modules
+    engine = object.__new__(openwakeword_engine.OpenWakeWordEngine)
+    engine._front_end = _open_wake_word_front_end(wake_features, vad=False)
+    engine._heads = {
+        'hey_one': _Head({7: 0.6, 9: 0.9}),
+        'hey_two': _Head({7: 0.9, 8: 0.6}),
+        'hey_three': _Head({8: 0.99}),
+    }
+    engine._stem_to_id = {'hey_one': 'one', 'hey_two': 'two'}
+    engine._stem_to_sensitivity = {'hey_one': 0.5, 'hey_two': 0.3}
+
+    fired = engine._detect(np.zeros(FRAME * 10, dtype=np.int16))
+
+    # Frame 7 fires the first head over threshold and skips the rest; the
+    # untriggered third head scores but never fires.
+    assert fired == ['one', 'one']
+    heads = engine._heads
+    assert heads['hey_one'].scored == [5, 6, 7, 8, 9]
+    assert heads['hey_two'].scored == [5, 6, 8]
+    assert heads['hey_three'].scored == [5, 6, 8]
+
+
+def test_micro_wake_word_front_end_matches_the_frontend(
+    modules: tuple[ModuleType, ...],
+) -> None:
+    """Frames are the frontend's own, however the audio is chunked."""
+    pymicro_wakeword = pytest.importorskip('pymicro_wakeword')
+    wake_features = modules[0]
+    generator = np.random.default_rng(0)
+    audio = generator.normal(0, 1000, 16_000).astype(np.int16).tobytes()
+    expected = list(pymicro_wakeword.MicroWakeWordFeatures().process_streaming(audio))
+
+    front_end = wake_features.MicroWakeWordFrontEnd()
+    indices = [
+        index
+        for offset in range(0, len(audio), 1600)
+        for index in front_end.push(audio[offset : offset + 1600])
+    ]
+
+    assert indices == list(range(len(expected)))
+    # The ring keeps the last 128 frames.
+    for index in indices[-100:]:
+        frame = front_end.frame(index)
+        assert frame.shape == (1, 1, 40)
+        np.testing.assert_array_equal(frame, expected[index])
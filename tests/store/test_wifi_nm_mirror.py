@@ -0,0 +1,389 @@
+"""Tests for the Wi-Fi service's NetworkManager mirror (``nm_mirror``).
+
+A fake NetworkManager - the device, access point, active connection and
+settings objects the mirror reads - is served on a private ``dbus-daemon``.
+The mirror must populate itself from it, then follow its signals, and
+``wifi_manager.get_connections`` must answer from memory once it has synced.
+
+``sdbus`` is only present on the device (and in the Docker test image), and
+the private bus needs ``dbus-daemon``; the module is skipped without either.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+pytest.importorskip('sdbus_async.networkmanager')
+
+from sdbus import (
+    DbusInterfaceCommonAsync,
+    dbus_method_async_override,
+    dbus_property_async_override,
+    sd_bus_open_user,
+)
+from sdbus.dbus_proxy_async_property import DbusPropertyAsync
+from sdbus_async.networkmanager.interfaces_devices import (
+    NetworkManagerDeviceInterfaceAsync,
+    NetworkManagerDeviceWirelessInterfaceAsync,
+)
+from sdbus_async.networkmanager.interfaces_other import (
+    NetworkManagerAccessPointInterfaceAsync,
+    NetworkManagerConnectionActiveInterfaceAsync,
+    NetworkManagerInterfaceAsync,
+    NetworkManagerSettingsConnectionInterfaceAsync,
+    NetworkManagerSettingsInterfaceAsync,
+)
+
+from ubo_app.store.services.wifi import ConnectionState
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+
+    from sdbus import SdBus
+
+_service_dir = str(
+    Path(__file__).resolve().parents[2] / 'ubo_app' / 'services' / '030-wifi',
+)
+if _service_dir not in sys.path:
+    sys.path.insert(0, _service_dir)
+
+import nm_mirror  # type: ignore[import-not-found]  # noqa: E402
+import wifi_manager  # type: ignore[import-not-found]  # noqa: E402
+
+NM = 'org.freedesktop.NetworkManager'
+DEVICE_PATH = '/org/freedesktop/NetworkManager/Devices/1'
+ACTIVE_PATH = '/org/freedesktop/NetworkManager/ActiveConnection/1'
+WIFI_DEVICE_TYPE = 2
+DEVICE_ACTIVATED = 100
+ACTIVE_CONNECTION_ACTIVATED = 2
+ACTIVE_CONNECTION_DEACTIVATING = 3
+
+_BUS_CONFIG = """<busconfig>
+  <type>session</type>
+  <auth>EXTERNAL</auth>
+  <listen>unix:path={socket_path}</listen>
+  <policy context="default">
+    <allow send_destination="*" eavesdrop="true"/>
+    <allow eavesdrop="true"/>
+    <allow own="*"/>
+  </policy>
+</busconfig>
+"""
+
+
+def _zero(signature: str) -> object:
+    """Return an empty value of D-Bus type ``signature``."""
+    if signature == 'ay':
+        return b''
+    if signature.startswith('a{'):
+        return {}
+    if signature.startswith('a'):
+        return []
+    if signature == '(uu)':
+        return (0, 0)
+    return {'o': '/', 's': '', 'b': False}.get(signature, 0)
+
+
+def _fake(interface: type[Any]) -> type[Any]:
+    """Subclass ``interface`` with every property served from ``values``.
+
+    sdbus allows one class per interface name, so the fakes override the
+    ``sdbus_async.networkmanager`` interfaces; properties nobody sets read as
+    empty so ``GetAll`` succeeds as it does on a real NetworkManager.
+    """
+    namespace: dict[str, Any] = {}
+    for attr, member in vars(interface).items():
+        if isinstance(member, DbusPropertyAsync):
+
+            def getter(
+                self: _FakeObject,
+                attr: str = attr,
+                signature: str = member.property_signature,
+            ) -> object:
+                return self.values.get(attr, _zero(signature))
+
+            namespace[attr] = dbus_property_async_override()(getter)
+    return type(f'Fake{interface.__name__}', (interface,), namespace)
+
+
+class _FakeObject:
+    values: dict[str, Any]
+
+    def change(self, interface: type[Any], attr: str, value: object) -> None:
+        """Set a property and emit ``PropertiesChanged`` like NetworkManager."""
+        self.values[attr] = value
+        member = vars(interface)[attr]
+        cast('Any', self).properties_changed.emit(
+            (
+                member.interface_name,
+                {member.property_name: (member.property_signature, value)},
+                [],
+            ),
+        )
+
+
+class _FakeNetworkManager(_FakeObject, _fake(NetworkManagerInterfaceAsync)):
+    def __init__(self, devices: list[str]) -> None:
+        super().__init__()
+        self.values = {'devices': devices}
+
+    @dbus_method_async_override()
+    async def get_devices(self) -> list[str]:
+        return self.values['devices']
+
+
+class _FakeWifiDevice(
+    _FakeObject,
+    _fake(NetworkManagerDeviceInterfaceAsync),
+    _fake(NetworkManagerDeviceWirelessInterfaceAsync),
+):
+    def __init__(self) -> None:
+        super().__init__()
+        self.values = {
+            'device_type': WIFI_DEVICE_TYPE,
+            'state': DEVICE_ACTIVATED,
+            'active_connection': ACTIVE_PATH,
+            'access_points': [],
+        }
+
+
+class _FakeAccessPoint(_FakeObject, _fake(NetworkManagerAccessPointInterfaceAsync)):
+    def __init__(self, ssid: str, strength: int) -> None:
+        super().__init__()
+        self.values = {'ssid': ssid.encode(), 'strength': strength}
+
+
+class _FakeActiveConnection(
+    _FakeObject,
+    _fake(NetworkManagerConnectionActiveInterfaceAsync),
+):
+    def __init__(self, connection: str) -> None:
+        super().__init__()
+        self.values = {
+            'connection': connection,
+            'state': ACTIVE_CONNECTION_ACTIVATED,
+        }
+
+
+class _FakeSettings(_FakeObject, _fake(NetworkManagerSettingsInterfaceAsync)):
+    def __init__(self) -> None:
+        super().__init__()
+        self.values = {'connections': []}
+
+
+class _FakeConnection(
+    _FakeObject,
+    _fake(NetworkManagerSettingsConnectionInterfaceAsync),
+):
+    def __init__(self, ssid: str | None) -> None:
+        super().__init__()
+        self.values = {}
+        self.ssid = ssid
+        self.reads = 0
+
+    @dbus_method_async_override()
+    async def get_settings(self) -> dict[str, dict[str, tuple[str, Any]]]:
+        self.reads += 1
+        if self.ssid is None:
+            return {'connection': {'type': ('s', '802-3-ethernet')}}
+        return {
+            'connection': {'type': ('s', '802-11-wireless')},
+            '802-11-wireless': {'ssid': ('ay', self.ssid.encode())},
+        }
+
+
+class _FakeNetwork:
+    """Owner of the fake objects, with helpers that mimic NetworkManager."""
+
+    def __init__(self, bus: SdBus) -> None:
+        self.bus = bus
+        self.device = _FakeWifiDevice()
+        self.settings = _FakeSettings()
+        self.access_points: dict[str, _FakeAccessPoint] = {}
+        self.connections: dict[str, _FakeConnection] = {}
+        self.active_connection: _FakeActiveConnection | None = None
+        # Exported objects are only weakly referenced by sdbus.
+        self._exports: list[tuple[DbusInterfaceCommonAsync, object]] = []
+
+    def export(self, obj: DbusInterfaceCommonAsync, path: str) -> None:
+        self._exports.append((obj, obj.export_to_dbus(path, self.bus)))
+
+    def add_access_point(self, index: int, ssid: str, strength: int) -> str:
+        path = f'/org/freedesktop/NetworkManager/AccessPoint/{index}'
+        self.access_points[path] = _FakeAccessPoint(ssid, strength)
+        self.export(self.access_points[path], path)
+        self.device.values['access_points'].append(path)
+        return path
+
+    def add_connection(self, index: int, ssid: str | None) -> str:
+        path = f'/org/freedesktop/NetworkManager/Settings/{index}'
+        self.connections[path] = _FakeConnection(ssid)
+        self.export(self.connections[path], path)
+        self.settings.values['connections'].append(path)
+        return path
+
+
+@pytest.fixture
+def session_bus_address(tmp_path: Path) -> Iterator[str]:
+    """Run a private ``dbus-daemon`` and return its address."""
+    dbus_daemon = shutil.which('dbus-daemon')
+    if dbus_daemon is None:
+        pytest.skip('dbus-daemon is not available')
+    config = tmp_path / 'bus.conf'
+    socket_path = tmp_path / 'bus.socket'
+    config.write_text(_BUS_CONFIG.format(socket_path=socket_path))
+    process = subprocess.Popen(  # noqa: S603
+        [dbus_daemon, f'--config-file={config}', '--nofork', '--nopidfile'],
+    )
+    try:
+        for _ in range(100):
+            if socket_path.exists():
+                break
+            time.sleep(0.05)
+        yield f'unix:path={socket_path}'
+    finally:
+        process.terminate()
+        process.wait()
+
+
+@pytest.fixture
+async def network(
+    session_bus_address: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> _FakeNetwork:
+    """Serve a fake NetworkManager with two networks in range and three saved."""
+    monkeypatch.setenv('DBUS_SESSION_BUS_ADDRESS', session_bus_address)
+    bus = sd_bus_open_user()
+    network = _FakeNetwork(bus)
+
+    network.add_access_point(1, 'Home', 40)
+    network.add_access_point(2, 'Home', 80)
+    network.add_access_point(3, 'Cafe', 70)
+    home = network.add_connection(1, 'Home')
+    network.add_connection(2, None)
+    network.add_connection(3, 'Office')
+    network.active_connection = _FakeActiveConnection(home)
+
+    network.export(
+        _FakeNetworkManager([DEVICE_PATH]),
+        '/org/freedesktop/NetworkManager',
+    )
+    network.export(network.device, DEVICE_PATH)
+    network.export(network.active_connection, ACTIVE_PATH)
+    network.export(network.settings, '/org/freedesktop/NetworkManager/Settings')
+    await bus.request_name_async(NM, 0)
+    return network
+
+
+@pytest.fixture
+async def mirror(
+    network: _FakeNetwork,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[nm_mirror.NetworkManagerMirror]:
+    """Start the service's mirror on a separate connection to the fake."""
+    del network
+    instance = nm_mirror.network_manager_mirror
+    assert await instance.start(bus=sd_bus_open_user())
+
+    # From here on ``wifi_manager`` must not talk to NetworkManager itself.
+    def no_bus() -> None:
+        msg = 'get_connections should be answered by the mirror'
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(wifi_manager, 'get_system_bus', no_bus)
+    yield instance
+    instance.stop()
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    async def wait() -> None:
+        # The mirror applies signals on its own tasks; poll until it caught up.
+        while not condition():  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait(), timeout=5)
+
+
+def _summary(connections: list[Any]) -> list[tuple[str, int, ConnectionState]]:
+    return [(c.ssid, c.signal_strength, c.state) for c in connections]
+
+
+async def test_populates_from_network_manager(
+    network: _FakeNetwork,
+    mirror: nm_mirror.NetworkManagerMirror,
+) -> None:
+    """One read per saved connection; the list is served from memory."""
+    assert all(connection.reads == 1 for connection in network.connections.values())
+    assert _summary(await wifi_manager.get_connections()) == [
+        ('Home', 80, ConnectionState.CONNECTED),
+        ('Office', 0, ConnectionState.DISCONNECTED),
+    ]
+    assert mirror.device_state == DEVICE_ACTIVATED
+
+
+async def test_follows_access_point_signals(
+    network: _FakeNetwork,
+    mirror: nm_mirror.NetworkManagerMirror,
+) -> None:
+    """Strength changes and added/removed access points reach the mirror."""
+    strongest_home = '/org/freedesktop/NetworkManager/AccessPoint/2'
+
+    network.access_points[strongest_home].change(
+        NetworkManagerAccessPointInterfaceAsync,
+        'strength',
+        20,
+    )
+    await _until(lambda: mirror.strength_by_ssid()['Home'] == 40)
+
+    office = network.add_access_point(4, 'Office', 55)
+    network.device.access_point_added.emit(office)
+    await _until(lambda: 'Office' in mirror.strength_by_ssid())
+
+    network.device.access_point_removed.emit(strongest_home)
+    await _until(lambda: strongest_home not in mirror.access_points)
+
+    assert _summary(await wifi_manager.get_connections()) == [
+        ('Home', 40, ConnectionState.CONNECTED),
+        ('Office', 55, ConnectionState.DISCONNECTED),
+    ]
+
+
+async def test_follows_connection_signals(
+    network: _FakeNetwork,
+    mirror: nm_mirror.NetworkManagerMirror,
+) -> None:
+    """Saved connections and the active connection's state stay current."""
+    cafe = network.add_connection(4, 'Cafe')
+    network.settings.new_connection.emit(cafe)
+    await _until(lambda: 'Cafe' in mirror.saved_ssids)
+
+    office = '/org/freedesktop/NetworkManager/Settings/3'
+    network.settings.connection_removed.emit(office)
+    await _until(lambda: 'Office' not in mirror.saved_ssids)
+
+    network.connections[cafe].ssid = 'Cafe 5G'
+    network.connections[cafe].updated.emit(None)
+    await _until(lambda: 'Cafe 5G' in mirror.saved_ssids)
+
+    assert network.active_connection is not None
+    network.active_connection.change(
+        NetworkManagerConnectionActiveInterfaceAsync,
+        'state',
+        ACTIVE_CONNECTION_DEACTIVATING,
+    )
+    await _until(
+        lambda: mirror.active_connection_state == ACTIVE_CONNECTION_DEACTIVATING,
+    )
+
+    assert _summary(await wifi_manager.get_connections()) == [
+        ('Home', 80, ConnectionState.DISCONNECTED),
+        ('Cafe 5G', 0, ConnectionState.DISCONNECTED),
+    ]
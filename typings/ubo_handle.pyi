@@ -1,4 +1,4 @@
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Sequence
 from typing import Protocol, TypeAlias
 
 from redux import ReducerType
@@ -24,4 +24,7 @@ def register(
     setup: SetupFunction,
     binary_path: str | None = None,
     binary_env_provider: Callable[[], dict[str, str]] | None = None,
+    depends_on: Sequence[str] = (),
+    is_lazy: bool = False,
+    shares_loop: bool = False,
 ) -> None: ...
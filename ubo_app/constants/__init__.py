@@ -23,6 +23,13 @@ DEBUG_DOCKER = str_to_bool(os.environ.get('UBO_DEBUG_DOCKER', 'False'))
 DEBUG_TEST_UUID = str_to_bool(os.environ.get('UBO_DEBUG_TEST_UUID', 'False'))
 DEBUG_MENU = str_to_bool(os.environ.get('UBO_DEBUG_MENU', 'False'))
 DEBUG_SCHEDULER = str_to_bool(os.environ.get('UBO_DEBUG_SCHEDULER', 'False'))
+DEBUG_STORE_TRACING = str_to_bool(
+    os.environ.get('UBO_DEBUG_STORE_TRACING', 'False'),
+)
+DEBUG_BOOT_PROFILE = str_to_bool(os.environ.get('UBO_DEBUG_BOOT_PROFILE', 'False'))
+DEBUG_SERVICE_MEMORY = str_to_bool(
+    os.environ.get('UBO_DEBUG_SERVICE_MEMORY', 'False'),
+)
 LOG_LEVEL = os.environ.get('UBO_LOG_LEVEL', 'INFO')
 GUI_LOG_LEVEL = os.environ.get('UBO_GUI_LOG_LEVEL', 'INFO')
 SERVICES_PATH = (
@@ -43,6 +50,12 @@ GRPC_LISTEN_PORT = int(os.environ.get('UBO_GRPC_LISTEN_PORT', '50051'))
 GRPC_ENVOY_LISTEN_ADDRESS = os.environ.get('UBO_GRPC_ENVOY_LISTEN_ADDRESS', '0.0.0.0')  # noqa: S104
 GRPC_ENVOY_LISTEN_PORT = int(os.environ.get('UBO_GRPC_ENVOY_LISTEN_PORT', '50052'))
 
+# Serve gRPC-Web in-process from the web-UI server (``/grpc/...`` on
+# WEB_UI_LISTEN_PORT) instead of through the Envoy container. The browser and the
+# LVGL web client then talk to the core directly, without the proxy hop or a
+# Docker dependency. See ubo_app/rpc/grpc_web.py.
+GRPC_WEB_NATIVE = str_to_bool(os.environ.get('UBO_GRPC_WEB_NATIVE', 'False'))
+
 # Port of the Envoy raw TCP-proxy listener that forwards native gRPC traffic to
 # the loopback-only core server, exposing it to the LAN when the user enables the
 # "gRPC Access" setting. See ubo_app/services/080-docker/apps/envoy.py.
@@ -86,6 +99,23 @@ SERVICES_LOOP_GRACE_PERIOD = float(
 SUBPROCESS_TERMINATE_GRACE_PERIOD = float(
     os.environ.get('UBO_SUBPROCESS_TERMINATE_GRACE_PERIOD', '5.0'),
 )
+# How often CPU time (and, with UBO_DEBUG_SERVICE_MEMORY, allocations) is
+# attributed to services, in seconds. See ubo_app/utils/service_accounting.py.
+SERVICE_USAGE_INTERVAL = float(os.environ.get('UBO_SERVICE_USAGE_INTERVAL', '10'))
+# Start boot services in dependency order, and the ones registered as lazy only
+# once the first view is out. See ubo_app/utils/startup_scheduler.py.
+STARTUP_SCHEDULER = str_to_bool(os.environ.get('UBO_STARTUP_SCHEDULER', 'False'))
+# How long after the first view lazy services wait before starting, in seconds,
+# so the client can draw it before they compete for the CPU.
+LAZY_SERVICES_DELAY = float(os.environ.get('UBO_LAZY_SERVICES_DELAY', '1.0'))
+# Services registered with `shares_loop=True` run on this many event loops shared
+# between them instead of a thread each; 0 keeps every service on its own
+# thread. See ubo_app/utils/loop_pool.py.
+SERVICE_LOOP_POOL_SIZE = int(os.environ.get('UBO_SERVICE_LOOP_POOL_SIZE', '0'))
+# A shared loop running a due callback this late, in seconds, is logged.
+SERVICE_LOOP_LAG_THRESHOLD = float(
+    os.environ.get('UBO_SERVICE_LOOP_LAG_THRESHOLD', '0.1'),
+)
 MAIN_LOOP_GRACE_PERIOD = int(os.environ.get('UBO_MAIN_LOOP_GRACE_PERIOD', '1'))
 STORE_GRACE_PERIOD = int(os.environ.get('UBO_STORE_GRACE_PERIOD', '1'))
 
@@ -115,8 +145,36 @@ DATA_PATH = Path(
 # directory exists unconditionally — service_thread.py spawns binaries with
 # cwd=DATA_PATH, and a missing cwd fails create_subprocess_exec outright.
 DATA_PATH.mkdir(parents=True, exist_ok=True)
+# Save the slices of the state listed in ubo_app/utils/state_snapshot.py every
+# `STATE_SNAPSHOT_INTERVAL` seconds and, with `STATE_SNAPSHOT_RESTORE`, put them
+# back on boot as provisional state until their services confirm or replace it.
+STATE_SNAPSHOT = str_to_bool(os.environ.get('UBO_STATE_SNAPSHOT', 'False'))
+STATE_SNAPSHOT_RESTORE = str_to_bool(
+    os.environ.get('UBO_STATE_SNAPSHOT_RESTORE', 'True'),
+)
+STATE_SNAPSHOT_PATH = CACHE_PATH / 'state-snapshot.json'
+STATE_SNAPSHOT_INTERVAL = float(os.environ.get('UBO_STATE_SNAPSHOT_INTERVAL', '60'))
+# A restored slice its service has not touched this many seconds after
+# registering its reducer is dropped for the one the reducer starts with.
+STATE_SNAPSHOT_STALE_TIMEOUT = float(
+    os.environ.get('UBO_STATE_SNAPSHOT_STALE_TIMEOUT', '30'),
+)
+# Record every action and event with its timing and provenance into a session
+# log under `SESSION_RECORDING_PATH`, to replay it as a benchmark later, see
+# ubo_app/utils/session_recording.py. The high-rate streams, "audio" and
+# "sensors", are recorded only when listed, comma-separated.
+SESSION_RECORDING = str_to_bool(os.environ.get('UBO_SESSION_RECORDING', 'False'))
+SESSION_RECORDING_STREAMS = tuple(
+    stream.strip()
+    for stream in os.environ.get('UBO_SESSION_RECORDING_STREAMS', '').split(',')
+    if stream.strip()
+)
+SESSION_RECORDING_PATH = DATA_PATH / 'sessions'
 
 DISPLAY_BAUDRATE = int(os.environ.get('UBO_DISPLAY_BAUDRATE', '60_000_000'))
+# How long a keypad input is locked after an accepted edge, in milliseconds.
+# The edge itself is reported at once; 0 disables the debounce.
+KEYPAD_DEBOUNCE_MS = float(os.environ.get('UBO_KEYPAD_DEBOUNCE_MS', '20'))
 WIDTH = 240
 HEIGHT = 240
 BYTES_PER_PIXEL = 2
@@ -161,5 +219,15 @@ TEST_INVESTIGATION_MODE = str_to_bool(
 
 SPEECH_RECOGNITION_FRAME_RATE = 16_000
 SPEECH_RECOGNITION_SAMPLE_WIDTH = 2
+# Resident memory the speech-recognition models may hold together before idle
+# ones are evicted, in MiB. Models in use are never evicted.
+SPEECH_RECOGNITION_MODEL_MEMORY_BUDGET = int(
+    os.environ.get('UBO_SPEECH_RECOGNITION_MODEL_MEMORY_BUDGET', '512'),
+)
+# Decode speech with Vosk in a worker process, off the app's GIL. The worker
+# loads its own copy of the model, so this costs its memory a second time.
+SPEECH_RECOGNITION_VOSK_WORKER_PROCESS = str_to_bool(
+    os.environ.get('UBO_SPEECH_RECOGNITION_VOSK_WORKER_PROCESS', 'False'),
+)
 
 DISPLAY_BLANK_TIMEOUT = 15.0  # seconds
@@ -152,22 +152,23 @@ class Display:
 display = Display()
 
 
+def rgb565_bytes(data: np.ndarray) -> bytes:
+    """Pack an RGB888 region into the big-endian RGB565 the ST7789 takes."""
+    data = data.astype(np.uint16)
+    color = (
+        ((data[:, :, 0] & 0xF8) << 8)
+        | ((data[:, :, 1] & 0xFC) << 3)
+        | (data[:, :, 2] >> 3)
+    ).copy()
+    return color.astype(np.uint16).view(np.uint8).reshape(-1, 2)[:, ::-1].tobytes()
+
+
 def render_on_display(*, regions: list[Region]) -> None:
     """Transfer data to the display via SPI controller."""
     from ubo_app.store.main import store
 
-
     for region in regions:
         rectangle = region['rectangle']
-        data = region['data'].astype(np.uint16)
-        color = (
-            ((data[:, :, 0] & 0xF8) << 8)
-            | ((data[:, :, 1] & 0xFC) << 3)
-            | (data[:, :, 2] >> 3)
-        ).copy()
-        data_bytes = (
-            color.astype(np.uint16).view(np.uint8).reshape(-1, 2)[:, ::-1].tobytes()
-        )
         display.render_block(
             rectangle=(
                 rectangle[1],
@@ -175,7 +176,7 @@ def render_on_display(*, regions: list[Region]) -> None:
                 rectangle[3] - 1,
                 rectangle[2] - 1,
             ),
-            data_bytes=data_bytes,
+            data_bytes=rgb565_bytes(region['data']),
         )
 
     from kivy.metrics import dp
@@ -39,6 +39,7 @@ from ubo_app.store.services.notifications import (
 )
 from ubo_app.utils.async_ import create_task
 from ubo_app.utils.download import download_file
+from ubo_app.utils.progress_notification import discard_progress, report_progress
 from ubo_app.utils.zip_latest import zip_latest
 
 if TYPE_CHECKING:
@@ -118,20 +119,18 @@ class KokoroEngine(NeedsSetupMixin, AIProviderMixin):
         """Update the BACKGROUND download-progress notification."""
         entry = voice_for(voice_id)
         speaker = entry.speaker if entry is not None else voice_id
-        store.dispatch(
-            NotificationsAddAction(
-                notification=Notification(
-                    id=KOKORO_DOWNLOAD_PROGRESS_NOTIFICATION_ID,
-                    title='Downloading',
-                    content=f'Kokoro models (voice: {speaker})',
-                    display_type=NotificationDisplayType.BACKGROUND,
-                    color=INFO_COLOR,
-                    icon='󰇚',
-                    blink=False,
-                    progress=progress,
-                    show_dismiss_action=False,
-                    dismiss_on_close=False,
-                ),
+        report_progress(
+            Notification(
+                id=KOKORO_DOWNLOAD_PROGRESS_NOTIFICATION_ID,
+                title='Downloading',
+                content=f'Kokoro models (voice: {speaker})',
+                display_type=NotificationDisplayType.BACKGROUND,
+                color=INFO_COLOR,
+                icon='󰇚',
+                blink=False,
+                progress=progress,
+                show_dismiss_action=False,
+                dismiss_on_close=False,
             ),
         )
 
@@ -139,6 +138,7 @@ class KokoroEngine(NeedsSetupMixin, AIProviderMixin):
         """Dispatch the terminal FLASH 'download complete' notification."""
         entry = voice_for(voice_id)
         speaker = entry.speaker if entry is not None else voice_id
+        discard_progress(KOKORO_DOWNLOAD_PROGRESS_NOTIFICATION_ID)
         store.dispatch(
             NotificationsClearByIdAction(id=KOKORO_DOWNLOAD_PROGRESS_NOTIFICATION_ID),
             NotificationsAddAction(
@@ -158,6 +158,7 @@ class KokoroEngine(NeedsSetupMixin, AIProviderMixin):
         )
 
     def _handle_error(self) -> None:
+        discard_progress(KOKORO_DOWNLOAD_PROGRESS_NOTIFICATION_ID)
         store.dispatch(
             NotificationsClearByIdAction(id=KOKORO_DOWNLOAD_PROGRESS_NOTIFICATION_ID),
             NotificationsAddAction(
@@ -43,6 +43,7 @@ from ubo_app.store.services.notifications import (
 )
 from ubo_app.utils.async_ import create_task
 from ubo_app.utils.download import download_file
+from ubo_app.utils.progress_notification import discard_progress, report_progress
 from ubo_app.utils.zip_latest import zip_latest
 
 if TYPE_CHECKING:
@@ -169,20 +170,18 @@ class PiperEngine(NeedsSetupMixin, AIProviderMixin):
         """
         entry = voice_for(voice_id)
         speaker = entry.speaker if entry is not None else voice_id
-        store.dispatch(
-            NotificationsAddAction(
-                notification=Notification(
-                    id=PIPER_DOWNLOAD_PROGRESS_NOTIFICATION_ID,
-                    title='Downloading',
-                    content=f'Piper voice: {speaker}',
-                    display_type=NotificationDisplayType.BACKGROUND,
-                    color=INFO_COLOR,
-                    icon='󰇚',
-                    blink=False,
-                    progress=progress,
-                    show_dismiss_action=False,
-                    dismiss_on_close=False,
-                ),
+        report_progress(
+            Notification(
+                id=PIPER_DOWNLOAD_PROGRESS_NOTIFICATION_ID,
+                title='Downloading',
+                content=f'Piper voice: {speaker}',
+                display_type=NotificationDisplayType.BACKGROUND,
+                color=INFO_COLOR,
+                icon='󰇚',
+                blink=False,
+                progress=progress,
+                show_dismiss_action=False,
+                dismiss_on_close=False,
             ),
         )
 
@@ -198,6 +197,7 @@ class PiperEngine(NeedsSetupMixin, AIProviderMixin):
         """
         entry = voice_for(voice_id)
         speaker = entry.speaker if entry is not None else voice_id
+        discard_progress(PIPER_DOWNLOAD_PROGRESS_NOTIFICATION_ID)
         store.dispatch(
             NotificationsClearByIdAction(id=PIPER_DOWNLOAD_PROGRESS_NOTIFICATION_ID),
             NotificationsAddAction(
@@ -217,6 +217,7 @@ class PiperEngine(NeedsSetupMixin, AIProviderMixin):
         )
 
     def _handle_error(self, voice_id: str) -> None:
+        discard_progress(PIPER_DOWNLOAD_PROGRESS_NOTIFICATION_ID)
         store.dispatch(
             NotificationsClearByIdAction(id=PIPER_DOWNLOAD_PROGRESS_NOTIFICATION_ID),
             NotificationsAddAction(
@@ -0,0 +1,171 @@
+"""Vosk recognizers kept warm per grammar, in this process or a worker process.
+
+Building a ``KaldiRecognizer`` compiles its grammar, and the recognition loop
+switches grammar right after a wake word: from the wake phrases to free speech
+or to the phrases a command expects. :class:`RecognizerPool` keeps a recognizer
+per grammar it has seen and resets it when it is switched back to, so the
+switch costs a reset instead of a build. It also only decodes a partial result
+when its text changed since the last chunk.
+
+:class:`RecognizerWorker` runs a pool in a worker process, so decoding does not
+hold the app's GIL; it loads its own copy of the model.
+
+Both are here rather than in the speech-recognition service because a worker
+process can only import a function by a module name it can find.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
+
+from ubo_app.constants import SPEECH_RECOGNITION_FRAME_RATE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from vosk import KaldiRecognizer, Model
+
+# Wake phrases, free speech and a couple of command grammars.
+_POOL_CAPACITY = 4
+
+# The pool of the worker process, built by its initializer.
+_worker_pool: RecognizerPool | None = None
+
+
+class RecognitionStep(NamedTuple):
+    """What one chunk of audio produced."""
+
+    final: str | None = None
+    """Text of an utterance the chunk completed."""
+    partial: str | None = None
+    """Text of the utterance so far, only when it changed."""
+
+
+def _grammar(phrases: Iterable[str] | None) -> tuple[str, ...]:
+    # No phrases and an empty list both mean free speech.
+    return tuple(phrases or ())
+
+
+def make_recognizer(model: Model, phrases: Iterable[str] | None) -> KaldiRecognizer:
+    """Build a recognizer for *model*, limited to *phrases* when provided."""
+    from vosk import KaldiRecognizer
+
+    grammar = _grammar(phrases)
+    return KaldiRecognizer(
+        model,
+        SPEECH_RECOGNITION_FRAME_RATE,
+        *([json.dumps(grammar)] if grammar else []),
+    )
+
+
+class RecognizerPool:
+    """Recognizers of one model, by grammar, the least recently used evicted."""
+
+    def __init__(self, model: Model, *, capacity: int = _POOL_CAPACITY) -> None:
+        """Start with no recognizer; they are built as grammars are used."""
+        self.model = model
+        self._capacity = capacity
+        self._recognizers: OrderedDict[tuple[str, ...], KaldiRecognizer] = OrderedDict()
+        self._grammar: tuple[str, ...] | None = None
+        self._partial: str | None = None
+
+    @property
+    def grammars(self) -> tuple[tuple[str, ...], ...]:
+        """Grammars with a recognizer, the least recently used first."""
+        return tuple(self._recognizers)
+
+    def prepare(self, *grammars: Iterable[str] | None) -> None:
+        """Build recognizers for *grammars* ahead of their first chunk."""
+        for phrases in grammars:
+            grammar = _grammar(phrases)
+            if grammar not in self._recognizers:
+                self._keep(grammar, make_recognizer(self.model, grammar))
+
+    def _keep(self, grammar: tuple[str, ...], recognizer: KaldiRecognizer) -> None:
+        self._recognizers[grammar] = recognizer
+        self._recognizers.move_to_end(grammar)
+        while len(self._recognizers) > self._capacity:
+            evicted, _ = self._recognizers.popitem(last=False)
+            if evicted == self._grammar:
+                self._grammar = None
+
+    def _switch(self, phrases: Iterable[str] | None) -> KaldiRecognizer:
+        grammar = _grammar(phrases)
+        if grammar == self._grammar:
+            return self._recognizers[grammar]
+        recognizer = self._recognizers.get(grammar)
+        if recognizer is None:
+            recognizer = make_recognizer(self.model, grammar)
+        else:
+            # Whatever it heard the last time its grammar was active is stale.
+            recognizer.Reset()
+        self._keep(grammar, recognizer)
+        self._grammar = grammar
+        self._partial = None
+        return recognizer
+
+    def accept(self, phrases: Iterable[str] | None, chunk: bytes) -> RecognitionStep:
+        """Feed *chunk* to the recognizer of *phrases*; return what it made of it.
+
+        Raises:
+            TypeError: If *chunk* is not bytes-like.
+
+        """
+        recognizer = self._switch(phrases)
+        if recognizer.AcceptWaveform(chunk):
+            self._partial = None
+            text = json.loads(recognizer.FinalResult()).get('text')
+            return RecognitionStep(final=text or None)
+        partial = recognizer.PartialResult()
+        # Mostly unchanged from the previous chunk, so compare before decoding.
+        if partial == self._partial:
+            return RecognitionStep()
+        self._partial = partial
+        return RecognitionStep(partial=json.loads(partial).get('partial') or None)
+
+
+def _start_worker(model_path: str, grammars: list[tuple[str, ...]]) -> None:
+    from vosk import Model
+
+    global _worker_pool  # noqa: PLW0603
+    _worker_pool = RecognizerPool(Model(model_path=model_path))
+    _worker_pool.prepare(*grammars)
+
+
+def _accept_in_worker(phrases: tuple[str, ...], chunk: bytes) -> RecognitionStep:
+    assert _worker_pool is not None  # noqa: S101
+    return _worker_pool.accept(phrases, chunk)
+
+
+class RecognizerWorker:
+    """A :class:`RecognizerPool` in a worker process, called like one."""
+
+    def __init__(self, model_path: Path, *grammars: Iterable[str] | None) -> None:
+        """Start the worker, which loads the model and prepares *grammars*."""
+        self._executor = ProcessPoolExecutor(
+            max_workers=1,
+            # Forking a process with the app's threads could copy a held lock.
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_start_worker,
+            initargs=(
+                model_path.as_posix(),
+                [_grammar(phrases) for phrases in grammars],
+            ),
+        )
+
+    def accept(self, phrases: Iterable[str] | None, chunk: bytes) -> RecognitionStep:
+        """Run :meth:`RecognizerPool.accept` in the worker and wait for it."""
+        return self._executor.submit(
+            _accept_in_worker,
+            _grammar(phrases),
+            chunk,
+        ).result()
+
+    def close(self) -> None:
+        """Stop the worker without waiting for it."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import dotenv
 
@@ -11,6 +12,9 @@ from ubo_app.logger import setup_loggers
 from ubo_app.setup_headless import setup_headless
 from ubo_app.utils.error_handlers import setup_error_handling
 
+if TYPE_CHECKING:
+    from ubo_app.utils.session_recording import SessionRecorder
+
 dotenv.load_dotenv(Path(__file__).parent / '.dev.env')
 dotenv.load_dotenv(Path(__file__).parent / '.env')
 
@@ -39,13 +43,39 @@ def _raise_open_file_limit() -> None:
             resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
 
 
-def main() -> None:
+def _start_session_recording() -> SessionRecorder:
+    """Record the session if ``UBO_SESSION_RECORDING`` is set."""
+    import time
+
+    from ubo_app.constants import (
+        SESSION_RECORDING,
+        SESSION_RECORDING_PATH,
+        SESSION_RECORDING_STREAMS,
+    )
+    from ubo_app.store.main import store
+    from ubo_app.utils.session_recording import SessionRecorder
+
+    recorder = SessionRecorder(store)
+    if SESSION_RECORDING:
+        recorder.start(
+            SESSION_RECORDING_PATH / time.strftime('session-%Y%m%d-%H%M%S.ubosession'),
+            streams=SESSION_RECORDING_STREAMS,
+        )
+    return recorder
+
+
+def main() -> None:  # noqa: PLR0915
     """Start the headless core (no Kivy/GUI dependencies)."""
     _raise_open_file_limit()
     logger_cleanups = setup_loggers()
 
     setup_error_handling()
 
+    from ubo_app.utils.service_accounting import start_memory_tracing
+
+    # Before anything a service could allocate is imported.
+    start_memory_tracing()
+
     from ubo_app.service_thread import load_services, stop_services
 
     setup_headless()
@@ -67,11 +97,21 @@ def main() -> None:
 
         worker_thread.run_coroutine(mcu_serve())
 
+    # Before the services load, so a replay boots them the same way.
+    session_recorder = _start_session_recording()
+
     load_services()
 
+    from ubo_app.constants import STATE_SNAPSHOT
+    from ubo_app.utils.state_snapshot import state_snapshot
+
+    if STATE_SNAPSHOT:
+        worker_thread.run_coroutine(state_snapshot.run())
+
     from ubo_app.side_effects import setup_side_effects
 
-    subscriptions = [*setup_side_effects()]
+    # The recording stops with the cleanups, after the services are joined.
+    subscriptions = [*setup_side_effects(), session_recorder.stop]
 
     from ubo_app.store.core.menu_event_handlers import setup_menu_event_handlers
 
@@ -95,11 +135,17 @@ def main() -> None:
     finally:
         from ubo_app.service_thread import SERVICES_BY_PATH
 
+        # Before the services stop and their slices go with them.
+        state_snapshot.save()
         stop_services()
 
         for service in list(SERVICES_BY_PATH.values()):
             service.join()
 
+        from ubo_app.utils.loop_pool import loop_pool
+
+        loop_pool.stop()
+
         for cleanup in subscriptions:
             cleanup()
 
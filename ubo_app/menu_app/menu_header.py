@@ -1,7 +1,6 @@
 # ruff: noqa: D100, D101, D102
 from __future__ import annotations
 
-import math
 from functools import cached_property
 from typing import TYPE_CHECKING
 
@@ -13,82 +12,17 @@ from kivy.uix.label import Label
 from kivy.uix.relativelayout import RelativeLayout
 from redux import AutorunOptions
 from ubo_gui.app import UboApp
-from ubo_gui.progress_ring import ProgressRingWidget
-from ubo_gui.spinner import SpinnerWidget
 
 from ubo_app.store.main import store
 
 if TYPE_CHECKING:
     from kivy.uix.widget import Widget
 
-    from ubo_app.store.services.notifications import Notification
-
 
 class MenuAppHeader(UboApp):
-    notification_widgets: dict[str, tuple[Notification, Widget]]
+    notification_widgets: dict[str, tuple[object, Widget]]
     progress_layout: BoxLayout
 
-    @mainthread
-    def set_notification_widgets(
-        self: MenuAppHeader,
-        notifications: list[Notification],
-    ) -> None:
-        for notification in notifications:
-            if notification.progress is None:
-                if notification.id in self.notification_widgets:
-                    self.progress_layout.remove_widget(
-                        self.notification_widgets[notification.id][1],
-                    )
-                    del self.notification_widgets[notification.id]
-            elif math.isnan(notification.progress):
-                if notification.id not in self.notification_widgets or not isinstance(
-                    widget := self.notification_widgets[notification.id][1],
-                    SpinnerWidget,
-                ):
-                    [_, widget] = self.notification_widgets[notification.id] = (
-                        notification,
-                        SpinnerWidget(
-                            font_size=dp(16),
-                            size_hint=(None, None),
-                            pos_hint={'center_y': 0.5},
-                            height=dp(16),
-                            width=dp(16),
-                        ),
-                    )
-                widget.color = notification.color
-            else:
-                if notification.id not in self.notification_widgets or not isinstance(
-                    widget := self.notification_widgets[notification.id][1],
-                    ProgressRingWidget,
-                ):
-                    [_, widget] = self.notification_widgets[notification.id] = (
-                        notification,
-                        ProgressRingWidget(
-                            background_color=(0.3, 0.3, 0.3, 1),
-                            height=dp(16),
-                            band_width=dp(7),
-                            size_hint=(None, None),
-                            pos_hint={'center_y': 0.5},
-                        ),
-                    )
-                widget.progress = notification.progress
-                widget.color = notification.color
-
-        for id in set(self.notification_widgets) - {
-            notification.id for notification in notifications
-        }:
-            del self.notification_widgets[id]
-
-        self.progress_layout.clear_widgets()
-
-        for item in sorted(
-            self.notification_widgets.values(),
-            key=lambda item: item[0].timestamp,
-        ):
-            self.progress_layout.add_widget(item[1])
-
-        self.progress_layout.width = self.progress_layout.minimum_width
-
     @mainthread
     def handle_is_header_visible_change(
         self: MenuAppHeader,
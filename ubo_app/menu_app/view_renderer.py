@@ -27,7 +27,7 @@ from ubo_app.store.core.types import (
 from ubo_app.store.main import store
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Mapping
 
     from kivy.uix.widget import Widget
     from ubo_gui.menu.menu_widget import MenuWidget
@@ -93,26 +93,26 @@ def _view_to_dict(view: ViewData) -> dict:
 
 @store.with_state(lambda state: state.notifications.notifications)
 def _get_notification_info(
-    notifications: Sequence[Notification],
+    notifications: Mapping[str, Notification],
     notification_id: str,
 ) -> dict | None:
     """Look up notification details from the notifications state."""
     try:
-        for notification in notifications:
-            if notification.id == notification_id:
-                result = {
-                    'title': notification.title,
-                    'content': notification.content,
-                    'icon': notification.icon,
-                    'color': notification.color,
-                    'importance': str(notification.importance),
-                    'sender': notification.sender,
-                    'is_read': notification.is_read,
-                }
-                # Include extra_information text if available
-                if notification.extra_information:
-                    result['extra_information'] = notification.extra_information.text
-                return result
+        notification = notifications.get(notification_id)
+        if notification is not None:
+            result = {
+                'title': notification.title,
+                'content': notification.content,
+                'icon': notification.icon,
+                'color': notification.color,
+                'importance': str(notification.importance),
+                'sender': notification.sender,
+                'is_read': notification.is_read,
+            }
+            # Include extra_information text if available
+            if notification.extra_information:
+                result['extra_information'] = notification.extra_information.text
+            return result
     except (AttributeError, TypeError):
         pass
     return None
@@ -375,6 +375,7 @@ CLASS_REGISTRY: dict[str, str] = {
     'LightDMClearEnabledStateAction': 'ubo_app.store.services.lightdm',
     'LightDMState': 'ubo_app.store.services.lightdm',
     'LightDMUpdateStateAction': 'ubo_app.store.services.lightdm',
+    'LoadedModelInfo': 'ubo_app.store.services.speech_recognition',
     'LocalOverlayGoBackEvent': 'ubo_app.store.core.types.events',
     'LocalizationAction': 'ubo_app.store.services.localization',
     'LocalizationEvent': 'ubo_app.store.services.localization',
@@ -534,6 +535,7 @@ CLASS_REGISTRY: dict[str, str] = {
     'ScreenshotDataEvent': 'ubo_app.store.core.types.events',
     'ScreenshotEvent': 'ubo_app.store.core.types.events',
     'Sensor': 'ubo_app.store.services.sensors',
+    'SensorDeviceReadings': 'ubo_app.store.services.sensors',
     'SensorDeviceState': 'ubo_app.store.services.sensors',
     'SensorEntityReading': 'ubo_app.store.services.sensors',
     'SensorState': 'ubo_app.store.services.sensors',
@@ -542,19 +544,24 @@ CLASS_REGISTRY: dict[str, str] = {
     'SensorsEvent': 'ubo_app.store.services.sensors',
     'SensorsReportDeviceReadingsAction': 'ubo_app.store.services.sensors',
     'SensorsReportReadingAction': 'ubo_app.store.services.sensors',
+    'SensorsReportReadingsAction': 'ubo_app.store.services.sensors',
     'SensorsScanAction': 'ubo_app.store.services.sensors',
     'SensorsScanCompletedAction': 'ubo_app.store.services.sensors',
     'SensorsScanEvent': 'ubo_app.store.services.sensors',
     'SensorsState': 'ubo_app.store.services.sensors',
     'ServiceState': 'ubo_app.store.settings.types',
+    'ServiceUsage': 'ubo_app.store.services.system',
     'ServicesStatus': 'ubo_app.store.settings.types',
     'SetAreEnclosuresVisibleAction': 'ubo_app.store.core.types.actions',
     'SetLocalOverlayOpenAction': 'ubo_app.store.core.types.actions',
     'SettingsAction': 'ubo_app.store.settings.types',
     'SettingsCategory': 'ubo_app.store.core.types.enums',
     'SettingsClearServiceErrorsAction': 'ubo_app.store.settings.types',
+    'SettingsDumpStoreTraceAction': 'ubo_app.store.settings.types',
+    'SettingsDumpStoreTraceEvent': 'ubo_app.store.settings.types',
     'SettingsEvent': 'ubo_app.store.settings.types',
     'SettingsReportServiceErrorAction': 'ubo_app.store.settings.types',
+    'SettingsReportStoreTraceAction': 'ubo_app.store.settings.types',
     'SettingsServiceAction': 'ubo_app.store.settings.types',
     'SettingsServiceEvent': 'ubo_app.store.settings.types',
     'SettingsServiceSetIsEnabledAction': 'ubo_app.store.settings.types',
@@ -567,10 +574,12 @@ CLASS_REGISTRY: dict[str, str] = {
     'SettingsState': 'ubo_app.store.settings.types',
     'SettingsStopServiceAction': 'ubo_app.store.settings.types',
     'SettingsStopServiceEvent': 'ubo_app.store.settings.types',
+    'SettingsStoreTraceEvent': 'ubo_app.store.settings.types',
     'SettingsToggleAssistantDebugAction': 'ubo_app.store.settings.types',
     'SettingsToggleBetaVersionsAction': 'ubo_app.store.settings.types',
     'SettingsToggleGrpcRemoteAccessAction': 'ubo_app.store.settings.types',
     'SettingsTogglePdbSignalAction': 'ubo_app.store.settings.types',
+    'SettingsToggleStoreTracingAction': 'ubo_app.store.settings.types',
     'SettingsToggleTcpLiteAction': 'ubo_app.store.settings.types',
     'SettingsToggleVisualDebugAction': 'ubo_app.store.settings.types',
     'SilenceTimeoutStopReason': 'ubo_app.store.services.assistant',
@@ -593,6 +602,7 @@ CLASS_REGISTRY: dict[str, str] = {
     'SpeechRecognitionSetAssistantEnabledAction': 'ubo_app.store.services.speech_recognition',
     'SpeechRecognitionSetAssistantListeningAction': 'ubo_app.store.services.speech_recognition',
     'SpeechRecognitionSetConversationEndPhrasesAction': 'ubo_app.store.services.speech_recognition',
+    'SpeechRecognitionSetLoadedModelsAction': 'ubo_app.store.services.speech_recognition',
     'SpeechRecognitionSetWakeModeEnabledAction': 'ubo_app.store.services.speech_recognition',
     'SpeechRecognitionState': 'ubo_app.store.services.speech_recognition',
     'SpeechRecognitionStatus': 'ubo_app.store.services.speech_recognition',
@@ -636,6 +646,7 @@ CLASS_REGISTRY: dict[str, str] = {
     'SystemEvent': 'ubo_app.store.services.system',
     'SystemMetricsUpdateAction': 'ubo_app.store.services.system',
     'SystemPrompt': 'ubo_app.store.services.assistant',
+    'SystemServiceUsageUpdateAction': 'ubo_app.store.services.system',
     'SystemState': 'ubo_app.store.services.system',
     'SystemStorageUpdateAction': 'ubo_app.store.services.system',
     'TailscaleAction': 'ubo_app.store.services.tailscale',
@@ -0,0 +1,217 @@
+"""In-process gRPC-Web gateway for the store service.
+
+Serves the same ``DispatchAction``/``SubscribeStore``/``SubscribeEvent`` RPCs as
+the grpclib server in ``ubo_app/rpc/server.py`` over plain HTTP/1.1, so the web
+UI and the LVGL ``WebUboRPCClient`` can reach the store without the Envoy
+container sitting in between. The handlers call :class:`StoreService` directly,
+so the messages on the wire are built by exactly the same code as on the native
+gRPC and tcp-lite paths; only the framing differs.
+
+Wire format (identical to Envoy's ``grpc_web`` filter and to
+``ubo_lvgl_gui_client/grpc_web_frame.py``)::
+
+    [1 byte flag][4 bytes big-endian length][payload]
+
+A ``0x00`` flag marks a data frame carrying a serialized protobuf message; a
+``0x80`` flag marks the single trailer frame that ends every response, whose
+payload is a CRLF-separated ``grpc-status``/``grpc-message`` header block. The
+``-text`` content types carry the same frames base64-encoded. Each frame is
+encoded on its own, so a text-mode stream is a concatenation of padded base64
+segments — the form grpc-web clients are required to accept.
+
+``SecretsService`` is intentionally never exposed on this path, same as on
+tcp-lite.
+"""
+
+from __future__ import annotations
+
+import base64
+import struct
+from typing import TYPE_CHECKING, cast
+from urllib.parse import quote
+
+from ubo_app.logger import logger
+from ubo_app.rpc.store_service import StoreService
+from ubo_bindings.store.v1 import (
+    DispatchActionRequest,
+    SubscribeEventRequest,
+    SubscribeStoreRequest,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator
+
+    import betterproto
+    from quart import Quart, Response
+
+DATA_FLAG = 0x00
+TRAILER_FLAG = 0x80
+HEADER_SIZE = 5
+
+CONTENT_TYPE_BINARY = 'application/grpc-web+proto'
+CONTENT_TYPE_TEXT = 'application/grpc-web-text+proto'
+
+# Route prefix, matching the ``/grpc/`` prefix Envoy's route config strips, so
+# clients only need a different base URL to switch between the two.
+ROUTE_PREFIX = '/grpc'
+SERVICE_NAME = 'store.v1.StoreService'
+
+# Same cap as tcp-lite's ``MAX_FRAME_SIZE`` and ``UBO_GRPC_WEB_MAX_FRAME`` on
+# the C side.
+MAX_REQUEST_SIZE = 1 << 20
+
+# grpc status codes used by this gateway.
+STATUS_OK = 0
+STATUS_INVALID_ARGUMENT = 3
+STATUS_UNIMPLEMENTED = 12
+STATUS_INTERNAL = 13
+
+_CORS_HEADERS = {
+    'access-control-allow-origin': '*',
+    'access-control-allow-methods': 'POST, OPTIONS',
+    'access-control-allow-headers': (
+        'content-type, authorization, x-user-agent, x-grpc-web, grpc-timeout'
+    ),
+    'access-control-expose-headers': 'grpc-status, grpc-message',
+}
+
+
+class GrpcWebRequestError(ValueError):
+    """A gRPC-Web request body could not be decoded."""
+
+
+def encode_frame(flag: int, payload: bytes) -> bytes:
+    """Wrap ``payload`` in a single ``[flag][length][payload]`` frame."""
+    return struct.pack('>BI', flag, len(payload)) + payload
+
+
+def encode_trailers(status: int, message: str = '') -> bytes:
+    """Build the trailer frame that terminates every gRPC-Web response."""
+    block = f'grpc-status:{status}\r\n'
+    if message:
+        block += f'grpc-message:{quote(message)}\r\n'
+    return encode_frame(TRAILER_FLAG, block.encode('ascii'))
+
+
+def is_text_content_type(content_type: str | None) -> bool:
+    """Return whether a request/response uses the base64 ``-text`` variant."""
+    return bool(content_type) and 'grpc-web-text' in cast('str', content_type)
+
+
+def decode_request(body: bytes, *, is_text: bool) -> bytes:
+    """Return the protobuf payload of the single data frame in ``body``."""
+    if is_text:
+        try:
+            body = base64.b64decode(body, validate=False)
+        except ValueError as exception:
+            msg = 'Malformed base64 request body'
+            raise GrpcWebRequestError(msg) from exception
+    if len(body) < HEADER_SIZE:
+        msg = 'Request body is shorter than a frame header'
+        raise GrpcWebRequestError(msg)
+    flag, length = struct.unpack('>BI', body[:HEADER_SIZE])
+    if flag & TRAILER_FLAG:
+        msg = 'Request body starts with a trailer frame'
+        raise GrpcWebRequestError(msg)
+    if length > MAX_REQUEST_SIZE or HEADER_SIZE + length > len(body):
+        msg = f'Invalid request frame length {length}'
+        raise GrpcWebRequestError(msg)
+    return body[HEADER_SIZE : HEADER_SIZE + length]
+
+
+def _responses(
+    method: str,
+    payload: bytes,
+) -> AsyncIterator[betterproto.Message]:
+    """Run ``method`` on a :class:`StoreService` and yield its responses."""
+    service = StoreService()
+    if method == 'DispatchAction':
+        request = DispatchActionRequest().parse(payload)
+
+        async def unary() -> AsyncIterator[betterproto.Message]:
+            yield await service.dispatch_action(request)
+
+        return unary()
+    if method == 'SubscribeStore':
+        return service.subscribe_store(SubscribeStoreRequest().parse(payload))
+    if method == 'SubscribeEvent':
+        return service.subscribe_event(SubscribeEventRequest().parse(payload))
+    msg = f'Unknown method {method}'
+    raise KeyError(msg)
+
+
+async def stream_response(
+    method: str,
+    payload: bytes,
+    *,
+    is_text: bool,
+) -> AsyncIterator[bytes]:
+    """Yield the framed body of one gRPC-Web call, ending with its trailers."""
+
+    def wrap(frame: bytes) -> bytes:
+        return base64.b64encode(frame) if is_text else frame
+
+    try:
+        responses = cast(
+            'AsyncGenerator[betterproto.Message, None]',
+            _responses(method, payload),
+        )
+    except KeyError:
+        yield wrap(encode_trailers(STATUS_UNIMPLEMENTED, f'Unknown method {method}'))
+        return
+    except Exception:
+        logger.warning('Malformed gRPC-Web request', exc_info=True)
+        yield wrap(encode_trailers(STATUS_INVALID_ARGUMENT, 'Malformed request'))
+        return
+
+    status, message = STATUS_OK, ''
+    try:
+        async for response in responses:
+            yield wrap(encode_frame(DATA_FLAG, response.SerializeToString()))
+    except Exception:
+        logger.exception(
+            'gRPC-Web call failed',
+            extra={'method': method},
+        )
+        status, message = STATUS_INTERNAL, 'Internal error'
+    finally:
+        # Close the generator synchronously so the store autorun/event
+        # subscription is released on disconnect rather than on asyncgen GC.
+        await responses.aclose()
+    yield wrap(encode_trailers(status, message))
+
+
+def register_grpc_web_routes(app: Quart) -> None:
+    """Mount the store service's gRPC-Web endpoints on a Quart app."""
+    from quart import Response, request
+
+    @app.route(
+        f'{ROUTE_PREFIX}/{SERVICE_NAME}/<method>',
+        methods=['POST', 'OPTIONS'],
+    )
+    async def grpc_web(method: str) -> Response:
+        if request.method == 'OPTIONS':
+            return Response('', status=204, headers=_CORS_HEADERS)
+
+        is_text = is_text_content_type(request.content_type)
+        content_type = CONTENT_TYPE_TEXT if is_text else CONTENT_TYPE_BINARY
+        body = await request.get_data(cache=False, as_text=False)
+        try:
+            payload = decode_request(cast('bytes', body), is_text=is_text)
+        except GrpcWebRequestError as exception:
+            frame = encode_trailers(STATUS_INVALID_ARGUMENT, str(exception))
+            return Response(
+                base64.b64encode(frame) if is_text else frame,
+                content_type=content_type,
+                headers=_CORS_HEADERS,
+            )
+
+        response = Response(
+            stream_response(method, payload, is_text=is_text),
+            content_type=content_type,
+            headers=_CORS_HEADERS,
+        )
+        # Server streams are long-lived; Quart's default response timeout would
+        # otherwise cut every subscription after a minute.
+        response.timeout = None
+        return response
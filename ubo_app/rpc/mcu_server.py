@@ -11,10 +11,31 @@ Wire format per frame::
     [1 byte message_type][varint length][protobuf payload]
 
 ``message_type`` is a hand-defined enum with no shared source of truth: the
-constants below MUST stay byte-identical to the future C header
-``ubo_lvgl/client/tcp_lite_frame.h`` (a later phase — it does not exist yet).
-This is the same manual-sync caveat that applies to the curated proto oneof
-tags described in ``.claude/skills/lvgl-maintenance/SKILL.md``.
+constants below MUST stay byte-identical to the C header
+``ubo_lvgl/client/tcp_lite_frame.h``. This is the same manual-sync caveat that
+applies to the curated proto oneof tags described in
+``.claude/skills/lvgl-maintenance/SKILL.md``.
+
+A connection serves one RPC ("one-shot") unless its first frame is
+``SESSION_OPEN``, which the server answers with ``SESSION_ACCEPT``. From then
+on the connection stays open and every frame, both ways, carries a stream id::
+
+    [1 byte message_type][1 byte flags][varint stream_id][varint length][payload]
+
+The client picks the stream ids, one per request, and may have many
+subscriptions open while it dispatches. Either side may ``PING`` on any stream
+and is answered with a ``PONG`` on it; the server's own pings use stream 0.
+``DISPATCH_BATCH_REQUEST`` dispatches several actions in order with one frame.
+A subscription only sends while its stream has credits, one a response, which
+the client grants with ``CREDIT`` as it consumes them, and ends with
+``STREAM_CLOSE``, or ``ERROR`` if it failed. Large subscription responses,
+display renders and camera frames in practice, are zlib-compressed
+(``FRAME_COMPRESSED``) when the client asked for it. The server pings every
+``HEARTBEAT_INTERVAL`` and drops a connection it heard nothing from for
+``HEARTBEAT_TIMEOUT``; a client that reconnects within ``RESUME_WINDOW`` with
+its session's token gets its subscriptions back, on the same stream ids. Old
+firmware never sends ``SESSION_OPEN`` and is served as before, and a new client
+that gets no ``SESSION_ACCEPT`` from an old core can fall back to one-shot.
 
 Phase 1 is plaintext and unauthenticated by explicit decision — no Noise, no
 encryption. The listener binds ``0.0.0.0`` directly in-process, following the
@@ -25,7 +46,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import secrets
 import socket
+import zlib
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, cast
 
 from ubo_app.constants import MCU_LISTEN_ADDRESS, MCU_LISTEN_PORT
@@ -39,7 +63,7 @@ from ubo_bindings.store.v1 import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Iterable
 
     import betterproto
 
@@ -51,12 +75,36 @@ SUBSCRIBE_STORE_REQUEST = 0x03
 SUBSCRIBE_STORE_RESPONSE = 0x04
 SUBSCRIBE_EVENT_REQUEST = 0x05
 SUBSCRIBE_EVENT_RESPONSE = 0x06
-ERROR = 0x7E  # reserved
-PING = 0x7F  # reserved (future keepalive)
+SESSION_OPEN = 0x10
+SESSION_ACCEPT = 0x11
+DISPATCH_BATCH_REQUEST = 0x12
+DISPATCH_BATCH_RESPONSE = 0x13
+CREDIT = 0x14
+STREAM_CLOSE = 0x15
+PONG = 0x7D
+ERROR = 0x7E
+PING = 0x7F
+
+SESSION_VERSION = 1
+# ``SESSION_OPEN``/``SESSION_ACCEPT`` flags.
+SESSION_ZLIB = 0x01
+SESSION_RESUMED = 0x02
+# Session frame flags.
+FRAME_COMPRESSED = 0x01
 
 # Same cap/rationale as ``UBO_GRPC_WEB_MAX_FRAME`` on the C side.
 MAX_FRAME_SIZE = 1 << 20
 
+# Smaller subscription responses are not worth a zlib stream on the MCU side.
+COMPRESSION_MIN_SIZE = 512
+HEARTBEAT_INTERVAL = 5.0
+HEARTBEAT_TIMEOUT = 15.0
+RESUME_WINDOW = 30.0
+# Detached sessions kept for a resume, and streams open on one connection.
+MAX_SESSIONS = 4
+MAX_STREAMS = 32
+_TOKEN_SIZE = 16
+
 # Poison a varint whose continuation bit is still set past this many shifted
 # bits — a malformed, non-terminating length header.
 _VARINT_MAX_SHIFT = 64
@@ -86,6 +134,92 @@ def _encode_frame(message_type: int, payload: bytes) -> bytes:
     return bytes((message_type,)) + _encode_varint(len(payload)) + payload
 
 
+def _decode_varint(data: bytes, offset: int = 0) -> tuple[int, int]:
+    """Decode the varint at ``offset``; return it and the offset past it."""
+    result = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            msg = 'Truncated varint'
+            raise ValueError(msg)
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+        if shift >= _VARINT_MAX_SHIFT:
+            msg = 'Varint too long (non-terminating)'
+            raise ValueError(msg)
+
+
+def _encode_session_frame(
+    message_type: int,
+    stream_id: int,
+    payload: bytes,
+    *,
+    flags: int = 0,
+) -> bytes:
+    """Frame a payload as ``[type][flags][varint stream_id][varint len][payload]``."""
+    return (
+        bytes((message_type, flags))
+        + _encode_varint(stream_id)
+        + _encode_varint(len(payload))
+        + payload
+    )
+
+
+def _encode_handshake(flags: int, value: int, token: bytes = b'') -> bytes:
+    """Encode ``SESSION_OPEN``/``SESSION_ACCEPT``: version, flags, value, token.
+
+    ``value`` is the credits each stream starts with in ``SESSION_OPEN``, 0 for
+    no flow control, and the heartbeat interval in ms in ``SESSION_ACCEPT``.
+    """
+    return (
+        _encode_varint(SESSION_VERSION)
+        + _encode_varint(flags)
+        + _encode_varint(value)
+        + token
+    )
+
+
+def _decode_handshake(payload: bytes) -> tuple[int, int, int, bytes]:
+    """Decode a handshake into its version, flags, value and token."""
+    version, offset = _decode_varint(payload)
+    flags, offset = _decode_varint(payload, offset)
+    value, offset = _decode_varint(payload, offset)
+    return version, flags, value, payload[offset:]
+
+
+def _encode_batch(payloads: Iterable[bytes]) -> bytes:
+    """Concatenate payloads, each prefixed with its varint length."""
+    return b''.join(_encode_varint(len(payload)) + payload for payload in payloads)
+
+
+def _decode_batch(data: bytes) -> list[bytes]:
+    """Split a batch back into its payloads."""
+    payloads: list[bytes] = []
+    offset = 0
+    while offset < len(data):
+        length, offset = _decode_varint(data, offset)
+        if offset + length > len(data):
+            msg = 'Truncated batch item'
+            raise ValueError(msg)
+        payloads.append(data[offset : offset + length])
+        offset += length
+    return payloads
+
+
+def _inflate(payload: bytes) -> bytes:
+    """Decompress a ``FRAME_COMPRESSED`` payload, up to ``MAX_FRAME_SIZE``."""
+    decompressor = zlib.decompressobj()
+    data = decompressor.decompress(payload, MAX_FRAME_SIZE)
+    if decompressor.unconsumed_tail:
+        msg = f'Inflated frame exceeds maximum {MAX_FRAME_SIZE}'
+        raise ValueError(msg)
+    return data
+
+
 async def _read_exact(reader: asyncio.StreamReader, count: int) -> bytes:
     """Read exactly ``count`` bytes, transparently handling partial reads."""
     return await reader.readexactly(count)
@@ -117,6 +251,22 @@ async def _read_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
     return message_type, payload
 
 
+async def _read_session_frame(
+    reader: asyncio.StreamReader,
+) -> tuple[int, int, int, bytes]:
+    """Read one session frame: its type, flags, stream id and inflated payload."""
+    message_type, flags = await _read_exact(reader, 2)
+    stream_id = await _read_varint(reader)
+    length = await _read_varint(reader)
+    if length > MAX_FRAME_SIZE:
+        msg = f'Frame length {length} exceeds maximum {MAX_FRAME_SIZE}'
+        raise ValueError(msg)
+    payload = await _read_exact(reader, length)
+    if flags & FRAME_COMPRESSED:
+        payload = _inflate(payload)
+    return message_type, flags, stream_id, payload
+
+
 async def _write_message(
     writer: asyncio.StreamWriter,
     message_type: int,
@@ -174,6 +324,318 @@ async def _serve_subscribe_event(
         await agen.aclose()
 
 
+class _Credits:
+    """Responses a stream may still send; unlimited when it started with none."""
+
+    def __init__(self, initial: int) -> None:
+        self._unlimited = initial == 0
+        self._available = initial
+        self._granted = asyncio.Event()
+
+    async def take(self) -> None:
+        """Wait for a credit and spend it."""
+        if self._unlimited:
+            return
+        while not self._available:
+            self._granted.clear()
+            await self._granted.wait()
+        self._available -= 1
+
+    def grant(self, count: int) -> None:
+        """Add ``count`` credits."""
+        self._available += count
+        self._granted.set()
+
+
+@dataclass(eq=False)
+class _Session:
+    """What a session keeps across its connections, for a resume."""
+
+    token: bytes
+    compress: bool
+    credits: int
+    subscriptions: dict[int, tuple[int, bytes]] = field(default_factory=dict)
+    connection: _SessionConnection | None = None
+    expires_at: float = 0.0
+
+
+_sessions: dict[bytes, _Session] = {}
+
+
+class _SessionConnection:
+    """One connection of a session: its streams and its heartbeat."""
+
+    def __init__(
+        self,
+        session: _Session,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.session = session
+        self.closed = asyncio.Event()
+        self._reader = reader
+        self._writer = writer
+        self._streams: dict[int, tuple[asyncio.Task[None], _Credits]] = {}
+
+    async def _send(
+        self,
+        message_type: int,
+        stream_id: int,
+        payload: bytes,
+        *,
+        compress: bool = False,
+    ) -> None:
+        flags = 0
+        if compress and self.session.compress and len(payload) >= COMPRESSION_MIN_SIZE:
+            deflated = zlib.compress(payload, 1)
+            if len(deflated) < len(payload):
+                payload, flags = deflated, FRAME_COMPRESSED
+        self._writer.write(
+            _encode_session_frame(message_type, stream_id, payload, flags=flags),
+        )
+        await self._writer.drain()
+
+    def _open_stream(self, stream_id: int, message_type: int, payload: bytes) -> None:
+        if message_type == SUBSCRIBE_STORE_REQUEST:
+            agen = StoreService().subscribe_store(
+                SubscribeStoreRequest().parse(payload),
+            )
+            response_type = SUBSCRIBE_STORE_RESPONSE
+        else:
+            agen = StoreService().subscribe_event(
+                SubscribeEventRequest().parse(payload),
+            )
+            response_type = SUBSCRIBE_EVENT_RESPONSE
+        stream_credits = _Credits(self.session.credits)
+        task = asyncio.create_task(
+            self._serve_stream(
+                stream_id,
+                response_type,
+                cast('AsyncGenerator[betterproto.Message, None]', agen),
+                stream_credits,
+            ),
+        )
+        self._streams[stream_id] = (task, stream_credits)
+        self.session.subscriptions[stream_id] = (message_type, payload)
+
+    async def _serve_stream(
+        self,
+        stream_id: int,
+        response_type: int,
+        agen: AsyncGenerator[betterproto.Message, None],
+        stream_credits: _Credits,
+    ) -> None:
+        try:
+            while True:
+                # Waiting before pulling keeps the store's latest-wins
+                # coalescing for a client that is behind.
+                await stream_credits.take()
+                try:
+                    response = await agen.__anext__()
+                except StopAsyncIteration:
+                    break
+                await self._send(
+                    response_type,
+                    stream_id,
+                    response.SerializeToString(),
+                    compress=True,
+                )
+            end, payload = STREAM_CLOSE, b''
+        except (ConnectionError, OSError):
+            logger.debug('MCU stream lost its connection', exc_info=True)
+            return
+        except Exception as exception:
+            # Neither served nor resumed again: the client is told it failed.
+            logger.warning(
+                'MCU session stream failed',
+                extra={'stream_id': stream_id},
+                exc_info=True,
+            )
+            end, payload = ERROR, str(exception).encode()
+        finally:
+            # Synchronous unsubscription, as in the one-shot handlers.
+            await agen.aclose()
+        self._streams.pop(stream_id, None)
+        self.session.subscriptions.pop(stream_id, None)
+        with contextlib.suppress(ConnectionError, OSError):
+            await self._send(end, stream_id, payload)
+
+    def _close_stream(self, stream_id: int) -> None:
+        stream = self._streams.pop(stream_id, None)
+        if stream is not None:
+            stream[0].cancel()
+        self.session.subscriptions.pop(stream_id, None)
+
+    async def _dispatch(self, payload: bytes) -> bytes:
+        response = await StoreService().dispatch_action(
+            DispatchActionRequest().parse(payload),
+        )
+        return response.SerializeToString()
+
+    async def _serve_dispatch(
+        self,
+        message_type: int,
+        stream_id: int,
+        payload: bytes,
+    ) -> None:
+        if message_type == DISPATCH_ACTION_REQUEST:
+            response = await self._dispatch(payload)
+            await self._send(DISPATCH_ACTION_RESPONSE, stream_id, response)
+            return
+        # In order, as a satellite sends key presses and releases.
+        responses = [
+            await self._dispatch(request) for request in _decode_batch(payload)
+        ]
+        await self._send(DISPATCH_BATCH_RESPONSE, stream_id, _encode_batch(responses))
+
+    async def _handle(self, message_type: int, stream_id: int, payload: bytes) -> None:
+        if message_type == PING:
+            await self._send(PONG, stream_id, payload)
+        elif message_type == PONG:
+            pass  # Hearing it is all the heartbeat needs.
+        elif message_type in (DISPATCH_ACTION_REQUEST, DISPATCH_BATCH_REQUEST):
+            await self._serve_dispatch(message_type, stream_id, payload)
+        elif message_type in (SUBSCRIBE_STORE_REQUEST, SUBSCRIBE_EVENT_REQUEST):
+            if stream_id == 0 or stream_id in self._streams:
+                msg = f'Stream {stream_id} is not available'
+                raise ValueError(msg)
+            if len(self._streams) >= MAX_STREAMS:
+                msg = f'More than {MAX_STREAMS} open streams'
+                raise ValueError(msg)
+            self._open_stream(stream_id, message_type, payload)
+        elif message_type == CREDIT:
+            stream = self._streams.get(stream_id)
+            if stream is not None:
+                stream[1].grant(_decode_varint(payload)[0])
+        elif message_type == STREAM_CLOSE:
+            self._close_stream(stream_id)
+        else:
+            msg = f'Unknown message type {message_type:#04x}'
+            raise ValueError(msg)
+
+    async def _heartbeat(self) -> None:
+        with contextlib.suppress(ConnectionError, OSError):
+            while True:
+                await asyncio.sleep(HEARTBEAT_INTERVAL)
+                await self._send(PING, 0, b'')
+
+    async def serve(self) -> None:
+        """Serve frames until the client goes away or falls silent."""
+        for stream_id, (message_type, payload) in list(
+            self.session.subscriptions.items(),
+        ):
+            self._open_stream(stream_id, message_type, payload)
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            while True:
+                message_type, _, stream_id, payload = await asyncio.wait_for(
+                    _read_session_frame(self._reader),
+                    HEARTBEAT_TIMEOUT,
+                )
+                try:
+                    await self._handle(message_type, stream_id, payload)
+                except (ConnectionError, OSError):
+                    raise
+                except Exception as exception:
+                    # The framing is intact, so a bad request only fails its
+                    # own stream.
+                    logger.warning(
+                        'Rejecting MCU session frame',
+                        extra={'message_type': message_type, 'stream_id': stream_id},
+                        exc_info=True,
+                    )
+                    await self._send(ERROR, stream_id, str(exception).encode())
+        finally:
+            heartbeat.cancel()
+            tasks = [task for task, _ in self._streams.values()]
+            self._streams.clear()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(heartbeat, *tasks, return_exceptions=True)
+
+    async def abort(self) -> None:
+        """Drop the connection, for its session to move to a newer one."""
+        self._writer.transport.abort()
+        await self.closed.wait()
+
+
+async def _attach_session(
+    token: bytes,
+    *,
+    compress: bool,
+    initial_credits: int,
+) -> tuple[_Session, bool]:
+    """Find the session of ``token``, or start one; tell which it was."""
+    now = asyncio.get_running_loop().time()
+    for key, session in list(_sessions.items()):
+        if session.connection is None and session.expires_at <= now:
+            del _sessions[key]
+    session = _sessions.get(token) if token else None
+    if session is not None:
+        if session.connection is not None:
+            # A half-open connection the client already gave up on.
+            await session.connection.abort()
+        session.compress, session.credits = compress, initial_credits
+        return session, True
+    detached = sorted(
+        (session for session in _sessions.values() if session.connection is None),
+        key=lambda session: session.expires_at,
+    )
+    for session in detached[: max(len(_sessions) - MAX_SESSIONS + 1, 0)]:
+        del _sessions[session.token]
+    session = _Session(
+        token=secrets.token_bytes(_TOKEN_SIZE),
+        compress=compress,
+        credits=initial_credits,
+    )
+    _sessions[session.token] = session
+    return session, False
+
+
+async def _serve_session(
+    payload: bytes,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """Serve a persistent, multiplexed connection, resuming its session."""
+    version, flags, initial_credits, token = _decode_handshake(payload)
+    if version != SESSION_VERSION:
+        writer.write(
+            _encode_frame(ERROR, f'Unsupported session version {version}'.encode()),
+        )
+        await writer.drain()
+        return
+    session, resumed = await _attach_session(
+        token,
+        compress=bool(flags & SESSION_ZLIB),
+        initial_credits=initial_credits,
+    )
+    connection = _SessionConnection(session, reader, writer)
+    session.connection = connection
+    logger.info(
+        'MCU session opened',
+        extra={'resumed': resumed, 'subscriptions': len(session.subscriptions)},
+    )
+    try:
+        writer.write(
+            _encode_frame(
+                SESSION_ACCEPT,
+                _encode_handshake(
+                    (flags & SESSION_ZLIB) | (SESSION_RESUMED if resumed else 0),
+                    int(HEARTBEAT_INTERVAL * 1000),
+                    session.token,
+                ),
+            ),
+        )
+        await writer.drain()
+        await connection.serve()
+    finally:
+        connection.closed.set()
+        if session.connection is connection:
+            session.connection = None
+            session.expires_at = asyncio.get_running_loop().time() + RESUME_WINDOW
+
+
 async def _handle_connection(
     reader: asyncio.StreamReader,
     writer: asyncio.StreamWriter,
@@ -194,6 +656,8 @@ async def _handle_connection(
             await _serve_subscribe_store(payload, writer)
         elif message_type == SUBSCRIBE_EVENT_REQUEST:
             await _serve_subscribe_event(payload, writer)
+        elif message_type == SESSION_OPEN:
+            await _serve_session(payload, reader, writer)
         else:
             logger.warning(
                 'Unknown MCU message type',
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import dataclasses
 import functools
+from collections.abc import Mapping
 from enum import Enum
 from typing import TYPE_CHECKING, Protocol, TypeAlias, TypeVar, cast, overload
 
@@ -228,6 +229,10 @@ def build_message(  # noqa: C901, PLR0912
         (expected_type and issubclass(expected_type, betterproto.Enum))
         or isinstance(object_, Enum)
     ) and not isinstance(object_, list | tuple):
+        if object_ is None:
+            # An optional enum left unset, e.g. `Notification.chime`; the
+            # field stays unset and rebuilds as `None`.
+            return cast('ReturnType', None)
         if not isinstance(object_, Enum):
             msg = f'Expected an Enum, got {type(object_)}'
             raise ValueError(msg)
@@ -237,10 +242,7 @@ def build_message(  # noqa: C901, PLR0912
         # This handles StrEnum -> string proto field case
         if not issubclass(expected_type, betterproto.Enum):
             return object_.value
-        return getattr(
-            expected_type,
-            cast('str', 'UNSPECIFIED' if object_ is None else object_.name),
-        )
+        return getattr(expected_type, object_.name)
 
     if isinstance(object_, int | float | str | bytes | bool | None):
         return cast('ReturnType', object_)
@@ -269,7 +271,7 @@ def build_message(  # noqa: C901, PLR0912
             ]
         return [build_message(item) for item in object_]
 
-    if isinstance(object_, dict):
+    if isinstance(object_, Mapping):
         # Handle dict types - check if expected_type is a wrapper with 'items' field
         if expected_type and hasattr(expected_type, '_betterproto'):
             field_names = expected_type._betterproto.sorted_field_names
@@ -294,9 +296,12 @@ def build_message(  # noqa: C901, PLR0912
                     return cast('T', expected_type(items=converted))  # type: ignore[call-arg]
                 # Simple dict wrapper (e.g. StdioMcpConfigEnvDict with str values)
                 wrapper_cls = cast('type[DictWrapperMessage]', expected_type)
-                return cast('T', _build_dict_wrapper_message(wrapper_cls, object_))
-        # Otherwise return as-is (for map fields)
-        return cast('ReturnType', object_)
+                return cast(
+                    'T',
+                    _build_dict_wrapper_message(wrapper_cls, dict(object_)),
+                )
+        # Otherwise return as a dict (for map fields)
+        return cast('ReturnType', dict(object_))
 
     keys = object_.__dataclass_fields__.keys()
 
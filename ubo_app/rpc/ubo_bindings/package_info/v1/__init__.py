@@ -0,0 +1,8 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: package_info/v1/package_info.proto
+# plugin: python-betterproto
+# This file has been @generated
+
+from dataclasses import dataclass
+
+import betterproto
@@ -0,0 +1,9736 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: ubo/v1/ubo.proto
+# plugin: python-betterproto
+# This file has been @generated
+import builtins
+from dataclasses import dataclass
+
+import betterproto
+
+
+class SettingsCategory(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_CORE_DOT_TYPES_DOT_ENUMS_UNSPECIFIED = 0
+    NETWORK = 1
+    REMOTE = 2
+    SYSTEM = 3
+    HARDWARE = 4
+    ASSISTANT = 5
+    DOCKER = 6
+    ACCESSIBILITY = 7
+    LOCALIZATION = 8
+
+
+class MenuScrollDirection(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_CORE_DOT_TYPES_DOT_ENUMS_UNSPECIFIED = 0
+    UP = 1
+    DOWN = 2
+
+
+class InputMethod(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_INPUT_DOT_TYPES_UNSPECIFIED = 0
+    CAMERA = 1
+    WEB_DASHBOARD = 2
+    PATH_SELECTOR = 3
+
+
+class InputFieldType(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_INPUT_DOT_TYPES_UNSPECIFIED = 0
+    LONG = 1
+    TEXT = 2
+    PASSWORD = 3
+    NUMBER = 4
+    CHECKBOX = 5
+    COLOR = 6
+    SELECT = 7
+    FILE = 8
+    DATE = 9
+    TIME = 10
+    RANGE = 11
+
+
+class ServicesStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SETTINGS_DOT_TYPES_UNSPECIFIED = 0
+    LOADING = 1
+    READY = 2
+
+
+class UpdateStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_UPDATE_MANAGER_DOT_TYPES_UNSPECIFIED = 0
+    CHECKING = 1
+    FAILED_TO_CHECK = 2
+    UP_TO_DATE = 3
+    OUTDATED = 4
+    UPDATING = 5
+
+
+class AssistantSttName(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_ASSISTANT_UNSPECIFIED = 0
+    VOSK = 1
+    MOONSHINE = 2
+    GOOGLE_SEGMENTED = 3
+    GOOGLE = 4
+    OPENAI = 5
+    DEEPGRAM = 6
+    ASSEMBLYAI = 7
+    VENICE = 8
+    MISTRAL = 9
+    ELEVENLABS = 10
+
+
+class AssistantLlmName(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_ASSISTANT_UNSPECIFIED = 0
+    OLLAMA = 1
+    OLLAMA_ONPREM = 2
+    GOOGLE = 3
+    OPENAI = 4
+    GROK = 5
+    CEREBRAS = 6
+    ANTHROPIC = 7
+    QWEN = 8
+    DEEPSEEK = 9
+    OPENROUTER = 10
+    MISTRAL = 11
+    VENICE = 12
+    GENERIC = 13
+
+
+class AssistantTtsName(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_ASSISTANT_UNSPECIFIED = 0
+    PIPER = 1
+    KOKORO = 2
+    GOOGLE = 3
+    OPENAI = 4
+    ELEVENLABS = 5
+    RIME = 6
+    VENICE = 7
+    DEEPGRAM = 8
+    MISTRAL = 9
+
+
+class AssistantImageGeneratorName(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_ASSISTANT_UNSPECIFIED = 0
+    GOOGLE = 1
+    OPENAI = 2
+    VENICE = 3
+
+
+class AssistantPipelineStage(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_ASSISTANT_UNSPECIFIED = 0
+    STT = 1
+    LLM = 2
+    TTS = 3
+
+
+class AssistantTurnCompletionMode(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_ASSISTANT_UNSPECIFIED = 0
+    SILENCE = 1
+    MANUAL = 2
+
+
+class AudioDevice(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_AUDIO_UNSPECIFIED = 0
+    INPUT = 1
+    OUTPUT = 2
+
+
+class AudioOutput(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_AUDIO_UNSPECIFIED = 0
+    UBO_SPEAKERS = 1
+    LINEOUT = 2
+    HDMI_1 = 3
+    HDMI_2 = 4
+
+
+class AudioSequenceSource(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_AUDIO_UNSPECIFIED = 0
+    OTHER = 1
+    ASSISTANT_LIVE = 2
+
+
+class CameraSourceKind(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_CAMERA_UNSPECIFIED = 0
+    LOCAL = 1
+    REMOTE = 2
+
+
+class ChatRole(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_CHAT_UNSPECIFIED = 0
+    USER = 1
+    ASSISTANT = 2
+
+
+class ChatMessageKind(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_CHAT_UNSPECIFIED = 0
+    TEXT = 1
+    AUDIO = 2
+
+
+class DisplayBlankTimeout(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_DISPLAY_UNSPECIFIED = 0
+    ONE_MINUTE = 1
+    FIVE_MINUTES = 2
+    TEN_MINUTES = 3
+    THIRTY_MINUTES = 4
+    ONE_HOUR = 5
+    OFF = 6
+
+
+class DockerStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_DOCKER_UNSPECIFIED = 0
+    UNKNOWN = 1
+    NOT_INSTALLED = 2
+    INSTALLING = 3
+    NOT_RUNNING = 4
+    RUNNING = 5
+    ERROR = 6
+
+
+class DockerItemStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_DOCKER_UNSPECIFIED = 0
+    NOT_AVAILABLE = 1
+    FETCHING = 2
+    AVAILABLE = 3
+    CREATED = 4
+    STARTING = 5
+    RUNNING = 6
+    ERROR = 7
+    PROCESSING = 8
+
+
+class DockerItemHealth(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_DOCKER_UNSPECIFIED = 0
+    OK = 1
+    RECOVERED = 2
+    CRASH_LOOPING = 3
+
+
+class NetState(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_ETHERNET_UNSPECIFIED = 0
+    CONNECTED = 1
+    DISCONNECTED = 2
+    PENDING = 3
+    NEEDS_ATTENTION = 4
+    UNKNOWN = 5
+
+
+class Key(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_KEYPAD_UNSPECIFIED = 0
+    BACK = 1
+    HOME = 2
+    UP = 3
+    DOWN = 4
+    L1 = 5
+    L2 = 6
+    L3 = 7
+
+
+class KioskPortRole(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_KIOSK_UNSPECIFIED = 0
+    BROWSER = 1
+    TERMINAL = 2
+    OFF = 3
+
+
+class LanguageCode(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_LOCALIZATION_UNSPECIFIED = 0
+    EN = 1
+    DE = 2
+    ES = 3
+    FR = 4
+    IT = 5
+    PT = 6
+    NL = 7
+    ZH = 8
+
+
+class LocationSource(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_LOCALIZATION_UNSPECIFIED = 0
+    IP = 1
+    MANUAL = 2
+
+
+class UnitSystem(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_LOCALIZATION_UNSPECIFIED = 0
+    AUTO = 1
+    METRIC = 2
+    US = 3
+
+
+class McpServerType(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_MCP_UNSPECIFIED = 0
+    STDIO = 1
+    SSE = 2
+
+
+class McpServerStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_MCP_UNSPECIFIED = 0
+    UNKNOWN = 1
+    CHECKING = 2
+    HEALTHY = 3
+    FAILED = 4
+
+
+class MqttConnectionStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_MQTT_UNSPECIFIED = 0
+    DISABLED = 1
+    CONNECTING = 2
+    CONNECTED = 3
+    ERROR = 4
+
+
+class MqttBrokerSource(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_MQTT_UNSPECIFIED = 0
+    BUNDLED = 1
+    EXTERNAL = 2
+
+
+class Importance(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_NOTIFICATIONS_UNSPECIFIED = 0
+    CRITICAL = 1
+    HIGH = 2
+    MEDIUM = 3
+    LOW = 4
+
+
+class NotificationDisplayType(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_NOTIFICATIONS_UNSPECIFIED = 0
+    NOT_SET = 1
+    BACKGROUND = 2
+    FLASH = 3
+    STICKY = 4
+
+
+class Chime(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_NOTIFICATIONS_UNSPECIFIED = 0
+    ADD = 1
+    DONE = 2
+    FAILURE = 3
+    VOLUME_CHANGE = 4
+
+
+class Sensor(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_SENSORS_UNSPECIFIED = 0
+    TEMPERATURE = 1
+    LIGHT = 2
+
+
+class SensorStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_SENSORS_UNSPECIFIED = 0
+    ACTIVE = 1
+    ERROR = 2
+    UNSUPPORTED = 3
+    AMBIGUOUS = 4
+
+
+class WakeMode(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_SPEECH_RECOGNITION_UNSPECIFIED = 0
+    INTENTS = 1
+    QUICK_CHAT = 2
+    CONVERSATION = 3
+    STOP_TALKING = 4
+    HOME_ASSISTANT = 5
+
+
+class WakeWordEngineName(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_SPEECH_RECOGNITION_UNSPECIFIED = 0
+    VOSK = 1
+    OPENWAKEWORD = 2
+    MICROWAKEWORD = 3
+
+
+class WakeWordModelStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_SPEECH_RECOGNITION_UNSPECIFIED = 0
+    NOT_AVAILABLE = 1
+    DOWNLOADING = 2
+    AVAILABLE = 3
+    ERROR = 4
+
+
+class SpeechRecognitionStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_SPEECH_RECOGNITION_UNSPECIFIED = 0
+    IDLE = 1
+    INTENTS_WAITING = 2
+    ASSISTANT_WAITING = 3
+
+
+class SpeechRecognitionEngineName(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_SPEECH_RECOGNITION_UNSPECIFIED = 0
+    VOSK = 1
+
+
+class SpeechSynthesisEngineName(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_SPEECH_SYNTHESIS_UNSPECIFIED = 0
+    PIPER = 1
+    PICOVOICE = 2
+
+
+class WebUiInputCommand(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_WEB_UI_UNSPECIFIED = 0
+    UP = 1
+    DOWN = 2
+    LEFT = 3
+    RIGHT = 4
+    SELECT = 5
+    BACK = 6
+    HOME = 7
+
+
+class WiFiType(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_WIFI_UNSPECIFIED = 0
+    WEP = 1
+    WPA = 2
+    WPA2 = 3
+    NOPASS = 4
+
+
+class ConnectionState(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_WIFI_UNSPECIFIED = 0
+    CONNECTED = 1
+    CONNECTING = 2
+    DISCONNECTED = 3
+    UNKNOWN = 4
+
+
+class WyomingAccessPolicyKind(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_WYOMING_UNSPECIFIED = 0
+    DOCKER = 1
+    NETWORK = 2
+
+
+class WyomingSatelliteStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_WYOMING_UNSPECIFIED = 0
+    STOPPED = 1
+    LISTENING = 2
+    CONNECTED = 3
+    STREAMING = 4
+    PLAYING = 5
+    PAUSED = 6
+
+
+class WyomingEnginesStatus(betterproto.Enum):
+    UBO_APP_DOT_STORE_DOT_SERVICES_DOT_WYOMING_UNSPECIFIED = 0
+    STOPPED = 1
+    LISTENING = 2
+    BUSY = 3
+
+
+@dataclass(eq=False, repr=False)
+class BaseMenu(betterproto.Message):
+    meta_field_package_name_ubo_gui_dot_menu_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    title: str = betterproto.string_field(2)
+    items: "list[Item]" = betterproto.message_field(3)
+    placeholder: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class HeadedMenu(betterproto.Message):
+    meta_field_package_name_ubo_gui_dot_menu_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    heading: str = betterproto.string_field(2)
+    sub_heading: str = betterproto.string_field(3)
+    title: str = betterproto.string_field(4)
+    items: "list[Item]" = betterproto.message_field(5)
+    placeholder: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class HeadlessMenu(betterproto.Message):
+    meta_field_package_name_ubo_gui_dot_menu_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    title: str = betterproto.string_field(2)
+    items: "list[Item]" = betterproto.message_field(3)
+    placeholder: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class Item(betterproto.Message):
+    meta_field_package_name_ubo_gui_dot_menu_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    key: "str | None" = betterproto.string_field(2, optional=True)
+    label: "str | None" = betterproto.string_field(3, optional=True)
+    color: "str | None" = betterproto.string_field(4, optional=True)
+    background_color: "str | None" = betterproto.string_field(5, optional=True)
+    icon: "str | None" = betterproto.string_field(6, optional=True)
+    is_short: "bool | None" = betterproto.bool_field(7, optional=True)
+    opacity: "float | None" = betterproto.float_field(8, optional=True)
+    progress: "float | None" = betterproto.float_field(9, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ActionItem(betterproto.Message):
+    meta_field_package_name_ubo_gui_dot_menu_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    key: "str | None" = betterproto.string_field(2, optional=True)
+    label: "str | None" = betterproto.string_field(3, optional=True)
+    color: "str | None" = betterproto.string_field(4, optional=True)
+    background_color: "str | None" = betterproto.string_field(5, optional=True)
+    icon: "str | None" = betterproto.string_field(6, optional=True)
+    is_short: "bool | None" = betterproto.bool_field(7, optional=True)
+    opacity: "float | None" = betterproto.float_field(8, optional=True)
+    progress: "float | None" = betterproto.float_field(9, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationItem(betterproto.Message):
+    meta_field_package_name_ubo_gui_dot_menu_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    application: "ApplicationItemApplication" = betterproto.message_field(2)
+    key: "str | None" = betterproto.string_field(3, optional=True)
+    label: "str | None" = betterproto.string_field(4, optional=True)
+    color: "str | None" = betterproto.string_field(5, optional=True)
+    background_color: "str | None" = betterproto.string_field(6, optional=True)
+    icon: "str | None" = betterproto.string_field(7, optional=True)
+    is_short: "bool | None" = betterproto.bool_field(8, optional=True)
+    opacity: "float | None" = betterproto.float_field(9, optional=True)
+    progress: "float | None" = betterproto.float_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationItemApplication(betterproto.Message):
+    string: str = betterproto.string_field(1, group="application")
+
+
+@dataclass(eq=False, repr=False)
+class SubMenuItem(betterproto.Message):
+    meta_field_package_name_ubo_gui_dot_menu_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    sub_menu: "Menu" = betterproto.message_field(2)
+    key: "str | None" = betterproto.string_field(3, optional=True)
+    label: "str | None" = betterproto.string_field(4, optional=True)
+    color: "str | None" = betterproto.string_field(5, optional=True)
+    background_color: "str | None" = betterproto.string_field(6, optional=True)
+    icon: "str | None" = betterproto.string_field(7, optional=True)
+    is_short: "bool | None" = betterproto.bool_field(8, optional=True)
+    opacity: "float | None" = betterproto.float_field(9, optional=True)
+    progress: "float | None" = betterproto.float_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class Menu(betterproto.Message):
+    headed_menu: "HeadedMenu" = betterproto.message_field(1, group="menu")
+    headless_menu: "HeadlessMenu" = betterproto.message_field(2, group="menu")
+
+
+@dataclass(eq=False, repr=False)
+class MenuStackItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_stack_items: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    menu_key: str = betterproto.string_field(3)
+    page_index: "int | None" = betterproto.int64_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationStackItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_stack_items: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    application_id: str = betterproto.string_field(3)
+    initialization_args: "ApplicationStackItemInitializationArgs | None" = (
+        betterproto.message_field(4, optional=True)
+    )
+    initialization_kwargs: "ApplicationStackItemInitializationKwargsDict | None" = (
+        betterproto.message_field(5, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationStackItemInitializationArgs(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationStackItemInitializationKwargsValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationStackItemInitializationKwargsValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(
+        1, group="initialization_kwargs_value"
+    )
+    list: "ApplicationStackItemInitializationKwargsValue2" = betterproto.message_field(
+        2, group="initialization_kwargs_value"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationStackItemInitializationKwargsDict(betterproto.Message):
+    items: "dict[str, ApplicationStackItemInitializationKwargsValue]" = (
+        betterproto.map_field(1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class RenderStackItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_stack_items: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    kind: str = betterproto.string_field(3)
+    title: "str | None" = betterproto.string_field(4, optional=True)
+    props: "RenderStackItemPropsDict | None" = betterproto.message_field(
+        5, optional=True
+    )
+    items: "RenderStackItemItems | None" = betterproto.message_field(6, optional=True)
+    stream_id: "str | None" = betterproto.string_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RenderStackItemPropsValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class RenderStackItemPropsValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(1, group="props_value")
+    list: "RenderStackItemPropsValue2" = betterproto.message_field(
+        2, group="props_value"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class RenderStackItemPropsDict(betterproto.Message):
+    items: "dict[str, RenderStackItemPropsValue]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class RenderStackItemItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ChatStackItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_stack_items: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    session_id: "str | None" = betterproto.string_field(3, optional=True)
+    scroll_offset: "int | None" = betterproto.int64_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationStackItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_stack_items: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    notification_id: str = betterproto.string_field(3)
+    page_index: "int | None" = betterproto.int64_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InstructionStackItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_stack_items: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    title: "str | None" = betterproto.string_field(3, optional=True)
+    instruction: "str | None" = betterproto.string_field(4, optional=True)
+    icon: "str | None" = betterproto.string_field(5, optional=True)
+    spinner: "bool | None" = betterproto.bool_field(6, optional=True)
+    timeout_seconds: "int | None" = betterproto.int64_field(7, optional=True)
+    progress_text: "str | None" = betterproto.string_field(8, optional=True)
+    footer_text: "str | None" = betterproto.string_field(9, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class PromptStackItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_stack_items: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    title: "str | None" = betterproto.string_field(3, optional=True)
+    prompt: "str | None" = betterproto.string_field(4, optional=True)
+    icon: "str | None" = betterproto.string_field(5, optional=True)
+    items: "PromptStackItemItems | None" = betterproto.message_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class PromptStackItemItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class StackItemType(betterproto.Message):
+    application_stack_item: "ApplicationStackItem" = betterproto.message_field(
+        1, group="stack_item_type"
+    )
+    chat_stack_item: "ChatStackItem" = betterproto.message_field(
+        2, group="stack_item_type"
+    )
+    instruction_stack_item: "InstructionStackItem" = betterproto.message_field(
+        3, group="stack_item_type"
+    )
+    menu_stack_item: "MenuStackItem" = betterproto.message_field(
+        4, group="stack_item_type"
+    )
+    notification_stack_item: "NotificationStackItem" = betterproto.message_field(
+        5, group="stack_item_type"
+    )
+    prompt_stack_item: "PromptStackItem" = betterproto.message_field(
+        6, group="stack_item_type"
+    )
+    render_stack_item: "RenderStackItem" = betterproto.message_field(
+        7, group="stack_item_type"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DynamicMenuData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_dynamic_menus: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    menu_id: str = betterproto.string_field(2)
+    title: "str | None" = betterproto.string_field(3, optional=True)
+    heading: "str | None" = betterproto.string_field(4, optional=True)
+    sub_heading: "str | None" = betterproto.string_field(5, optional=True)
+    items: "DynamicMenuDataItems | None" = betterproto.message_field(6, optional=True)
+    placeholder: "str | None" = betterproto.string_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DynamicMenuDataItemsItem(betterproto.Message):
+    items: "MenuItemData | None" = betterproto.message_field(1, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DynamicMenuDataItems(betterproto.Message):
+    items: "list[DynamicMenuDataItemsItem]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class DynamicMenusState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_dynamic_menus: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    menus: "DynamicMenusStateMenusDict | None" = betterproto.message_field(
+        2, optional=True
+    )
+    version: "int | None" = betterproto.int64_field(3, optional=True)
+    versions: "DynamicMenusStateVersionsDict | None" = betterproto.message_field(
+        4, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DynamicMenusStateMenusDict(betterproto.Message):
+    items: "dict[str, DynamicMenuData]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DynamicMenusStateVersionsDict(betterproto.Message):
+    items: "dict[str, int]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_INT64
+    )
+
+
+@dataclass(eq=False, repr=False)
+class StatusIconData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_status_bar: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    symbol: str = betterproto.string_field(2)
+    color: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ProgressNotificationData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_status_bar: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    progress: "float | None" = betterproto.float_field(3, optional=True)
+    color: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class StatusBarData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_status_bar: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    title: "str | None" = betterproto.string_field(2, optional=True)
+    is_recording: "bool | None" = betterproto.bool_field(3, optional=True)
+    is_replaying: "bool | None" = betterproto.bool_field(4, optional=True)
+    is_recording_audio: "bool | None" = betterproto.bool_field(5, optional=True)
+    progress_notifications: "StatusBarDataProgressNotifications | None" = (
+        betterproto.message_field(6, optional=True)
+    )
+    clock: "str | None" = betterproto.string_field(7, optional=True)
+    temperature: "float | None" = betterproto.float_field(8, optional=True)
+    light_level: "float | None" = betterproto.float_field(9, optional=True)
+    icons: "StatusBarDataIcons | None" = betterproto.message_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StatusBarDataProgressNotifications(betterproto.Message):
+    items: "list[ProgressNotificationData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class StatusBarDataIcons(betterproto.Message):
+    items: "list[StatusIconData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class MenuItemData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    key: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    icon: str = betterproto.string_field(4)
+    color: "str | None" = betterproto.string_field(5, optional=True)
+    is_short: "bool | None" = betterproto.bool_field(6, optional=True)
+    action_id: "str | None" = betterproto.string_field(7, optional=True)
+    background_color: "str | None" = betterproto.string_field(8, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class HomeViewData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    type: "str | None" = betterproto.string_field(2, optional=True)
+    show_status_bar: "bool | None" = betterproto.bool_field(3, optional=True)
+    menu_items: "HomeViewDataMenuItems | None" = betterproto.message_field(
+        4, optional=True
+    )
+    cpu_percent: "float | None" = betterproto.float_field(5, optional=True)
+    ram_percent: "float | None" = betterproto.float_field(6, optional=True)
+    volume_level: "float | None" = betterproto.float_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class HomeViewDataMenuItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class MenuViewData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    type: "str | None" = betterproto.string_field(2, optional=True)
+    show_status_bar: "bool | None" = betterproto.bool_field(3, optional=True)
+    title: "str | None" = betterproto.string_field(4, optional=True)
+    heading: "str | None" = betterproto.string_field(5, optional=True)
+    sub_heading: "str | None" = betterproto.string_field(6, optional=True)
+    items: "MenuViewDataItems | None" = betterproto.message_field(7, optional=True)
+    placeholder: "str | None" = betterproto.string_field(8, optional=True)
+    page_index: "int | None" = betterproto.int64_field(9, optional=True)
+    total_pages: "int | None" = betterproto.int64_field(10, optional=True)
+    stack_depth: "int | None" = betterproto.int64_field(11, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MenuViewDataItemsItem(betterproto.Message):
+    items: "MenuItemData | None" = betterproto.message_field(1, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MenuViewDataItems(betterproto.Message):
+    items: "list[MenuViewDataItemsItem]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationViewData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    type: "str | None" = betterproto.string_field(2, optional=True)
+    show_status_bar: "bool | None" = betterproto.bool_field(3, optional=True)
+    application_id: "str | None" = betterproto.string_field(4, optional=True)
+    extra_data: "ApplicationViewDataExtraDataDict | None" = betterproto.message_field(
+        5, optional=True
+    )
+    stack_depth: "int | None" = betterproto.int64_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationViewDataExtraDataValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationViewDataExtraDataValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(1, group="extra_data_value")
+    list: "ApplicationViewDataExtraDataValue2" = betterproto.message_field(
+        2, group="extra_data_value"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationViewDataExtraDataDict(betterproto.Message):
+    items: "dict[str, ApplicationViewDataExtraDataValue]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class RenderViewData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    type: "str | None" = betterproto.string_field(2, optional=True)
+    show_status_bar: "bool | None" = betterproto.bool_field(3, optional=True)
+    kind: "str | None" = betterproto.string_field(4, optional=True)
+    title: "str | None" = betterproto.string_field(5, optional=True)
+    props: "RenderViewDataPropsDict | None" = betterproto.message_field(
+        6, optional=True
+    )
+    items: "RenderViewDataItems | None" = betterproto.message_field(7, optional=True)
+    stream_id: "str | None" = betterproto.string_field(8, optional=True)
+    stack_depth: "int | None" = betterproto.int64_field(9, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RenderViewDataPropsValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class RenderViewDataPropsValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(1, group="props_value")
+    list: "RenderViewDataPropsValue2" = betterproto.message_field(
+        2, group="props_value"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class RenderViewDataPropsDict(betterproto.Message):
+    items: "dict[str, RenderViewDataPropsValue]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class RenderViewDataItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ChatBubbleData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    message_id: "str | None" = betterproto.string_field(2, optional=True)
+    role: "str | None" = betterproto.string_field(3, optional=True)
+    alignment: "str | None" = betterproto.string_field(4, optional=True)
+    kind: "str | None" = betterproto.string_field(5, optional=True)
+    text: "str | None" = betterproto.string_field(6, optional=True)
+    color: "str | None" = betterproto.string_field(7, optional=True)
+    background_color: "str | None" = betterproto.string_field(8, optional=True)
+    pointer_key: "str | None" = betterproto.string_field(9, optional=True)
+    is_playing: "bool | None" = betterproto.bool_field(10, optional=True)
+    waveform: "ChatBubbleDataWaveform | None" = betterproto.message_field(
+        11, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ChatBubbleDataWaveform(betterproto.Message):
+    items: "list[float]" = betterproto.float_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ChatViewData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    type: "str | None" = betterproto.string_field(2, optional=True)
+    show_status_bar: "bool | None" = betterproto.bool_field(3, optional=True)
+    bubbles: "ChatViewDataBubbles | None" = betterproto.message_field(4, optional=True)
+    items: "ChatViewDataItems | None" = betterproto.message_field(5, optional=True)
+    scroll_offset: "int | None" = betterproto.int64_field(6, optional=True)
+    total_bubbles: "int | None" = betterproto.int64_field(7, optional=True)
+    stack_depth: "int | None" = betterproto.int64_field(8, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ChatViewDataBubbles(betterproto.Message):
+    items: "list[ChatBubbleData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ChatViewDataItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationViewData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    type: "str | None" = betterproto.string_field(2, optional=True)
+    show_status_bar: "bool | None" = betterproto.bool_field(3, optional=True)
+    notification_id: "str | None" = betterproto.string_field(4, optional=True)
+    title: "str | None" = betterproto.string_field(5, optional=True)
+    content: "str | None" = betterproto.string_field(6, optional=True)
+    icon: "str | None" = betterproto.string_field(7, optional=True)
+    color: "str | None" = betterproto.string_field(8, optional=True)
+    items: "NotificationViewDataItems | None" = betterproto.message_field(
+        9, optional=True
+    )
+    extra_information: "str | None" = betterproto.string_field(10, optional=True)
+    page_index: "int | None" = betterproto.int64_field(11, optional=True)
+    total_pages: "int | None" = betterproto.int64_field(12, optional=True)
+    stack_depth: "int | None" = betterproto.int64_field(13, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationViewDataItemsItem(betterproto.Message):
+    items: "MenuItemData | None" = betterproto.message_field(1, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationViewDataItems(betterproto.Message):
+    items: "list[NotificationViewDataItemsItem]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class InstructionViewData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    type: "str | None" = betterproto.string_field(2, optional=True)
+    show_status_bar: "bool | None" = betterproto.bool_field(3, optional=True)
+    title: "str | None" = betterproto.string_field(4, optional=True)
+    instruction: "str | None" = betterproto.string_field(5, optional=True)
+    icon: "str | None" = betterproto.string_field(6, optional=True)
+    spinner: "bool | None" = betterproto.bool_field(7, optional=True)
+    timeout_seconds: "int | None" = betterproto.int64_field(8, optional=True)
+    progress_text: "str | None" = betterproto.string_field(9, optional=True)
+    footer_text: "str | None" = betterproto.string_field(10, optional=True)
+    stack_depth: "int | None" = betterproto.int64_field(11, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class PromptViewData(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_view_data: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    type: "str | None" = betterproto.string_field(2, optional=True)
+    show_status_bar: "bool | None" = betterproto.bool_field(3, optional=True)
+    title: "str | None" = betterproto.string_field(4, optional=True)
+    prompt: "str | None" = betterproto.string_field(5, optional=True)
+    icon: "str | None" = betterproto.string_field(6, optional=True)
+    items: "PromptViewDataItems | None" = betterproto.message_field(7, optional=True)
+    stack_depth: "int | None" = betterproto.int64_field(8, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class PromptViewDataItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ViewData(betterproto.Message):
+    application_view_data: "ApplicationViewData" = betterproto.message_field(
+        1, group="view_data"
+    )
+    chat_view_data: "ChatViewData" = betterproto.message_field(2, group="view_data")
+    home_view_data: "HomeViewData" = betterproto.message_field(3, group="view_data")
+    instruction_view_data: "InstructionViewData" = betterproto.message_field(
+        4, group="view_data"
+    )
+    menu_view_data: "MenuViewData" = betterproto.message_field(5, group="view_data")
+    notification_view_data: "NotificationViewData" = betterproto.message_field(
+        6, group="view_data"
+    )
+    prompt_view_data: "PromptViewData" = betterproto.message_field(7, group="view_data")
+    render_view_data: "RenderViewData" = betterproto.message_field(8, group="view_data")
+
+
+@dataclass(eq=False, repr=False)
+class RegisteredAppEntry(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_state: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    key: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    icon: str = betterproto.string_field(4)
+    action_id: "str | None" = betterproto.string_field(5, optional=True)
+    color: "str | None" = betterproto.string_field(6, optional=True)
+    background_color: "str | None" = betterproto.string_field(7, optional=True)
+    priority: "int | None" = betterproto.int64_field(8, optional=True)
+    category: "str | None" = betterproto.string_field(9, optional=True)
+    app_category: "str | None" = betterproto.string_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MainState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_state: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    stack: "MainStateStack | None" = betterproto.message_field(2, optional=True)
+    path: "MainStatePath | None" = betterproto.message_field(3, optional=True)
+    is_header_visible: "bool | None" = betterproto.bool_field(4, optional=True)
+    is_footer_visible: "bool | None" = betterproto.bool_field(5, optional=True)
+    apps_items_priorities: "MainStateAppsItemsPrioritiesDict | None" = (
+        betterproto.message_field(6, optional=True)
+    )
+    settings_items_priorities: "MainStateSettingsItemsPrioritiesDict | None" = (
+        betterproto.message_field(7, optional=True)
+    )
+    registered_apps: "MainStateRegisteredAppsDict | None" = betterproto.message_field(
+        8, optional=True
+    )
+    is_recording: "bool | None" = betterproto.bool_field(9, optional=True)
+    is_replaying: "bool | None" = betterproto.bool_field(10, optional=True)
+    recorded_sequence: "MainStateRecordedSequence | None" = betterproto.message_field(
+        11, optional=True
+    )
+    current_view: "ViewData | None" = betterproto.message_field(12, optional=True)
+    status_bar: "StatusBarData | None" = betterproto.message_field(13, optional=True)
+    is_local_overlay_open: "bool | None" = betterproto.bool_field(14, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MainStateStack(betterproto.Message):
+    items: "list[StackItemType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class MainStatePath(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class MainStateAppsItemsPrioritiesDict(betterproto.Message):
+    items: "dict[str, int]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_INT64
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MainStateSettingsItemsPrioritiesDict(betterproto.Message):
+    items: "dict[str, int]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_INT64
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MainStateRegisteredAppsDict(betterproto.Message):
+    items: "dict[str, RegisteredAppEntry]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MainStateRecordedSequence(betterproto.Message):
+    items: "list[KeypadAction]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class MainAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateLightDmState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_active: bool = betterproto.bool_field(2)
+    is_enable: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class RegisterAppAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    label: str = betterproto.string_field(2)
+    icon: "str | None" = betterproto.string_field(3, optional=True)
+    action_id: "str | None" = betterproto.string_field(4, optional=True)
+    color: "str | None" = betterproto.string_field(5, optional=True)
+    background_color: "str | None" = betterproto.string_field(6, optional=True)
+    service: "str | None" = betterproto.string_field(7, optional=True)
+    key: "str | None" = betterproto.string_field(8, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RegisterRegularAppAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    priority: "int | None" = betterproto.int64_field(2, optional=True)
+    app_category: "str | None" = betterproto.string_field(3, optional=True)
+    label: str = betterproto.string_field(4)
+    icon: "str | None" = betterproto.string_field(5, optional=True)
+    action_id: "str | None" = betterproto.string_field(6, optional=True)
+    color: "str | None" = betterproto.string_field(7, optional=True)
+    background_color: "str | None" = betterproto.string_field(8, optional=True)
+    service: "str | None" = betterproto.string_field(9, optional=True)
+    key: "str | None" = betterproto.string_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateRegisteredAppAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    icon: "str | None" = betterproto.string_field(2, optional=True)
+    color: "str | None" = betterproto.string_field(3, optional=True)
+    background_color: "str | None" = betterproto.string_field(4, optional=True)
+    service: "str | None" = betterproto.string_field(5, optional=True)
+    key: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DeregisterRegularAppAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    service: "str | None" = betterproto.string_field(2, optional=True)
+    key: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RegisterSettingAppAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    category: "SettingsCategory" = betterproto.enum_field(2)
+    priority: "int | None" = betterproto.int64_field(3, optional=True)
+    label: str = betterproto.string_field(4)
+    icon: "str | None" = betterproto.string_field(5, optional=True)
+    action_id: "str | None" = betterproto.string_field(6, optional=True)
+    color: "str | None" = betterproto.string_field(7, optional=True)
+    background_color: "str | None" = betterproto.string_field(8, optional=True)
+    service: "str | None" = betterproto.string_field(9, optional=True)
+    key: "str | None" = betterproto.string_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class PowerAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class PowerOffAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RebootAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SetLocalOverlayOpenAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_open: "bool | None" = betterproto.bool_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SetAreEnclosuresVisibleAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_header_visible: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_footer_visible: "bool | None" = betterproto.bool_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MenuAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MenuGoBackAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MenuGoHomeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MenuChooseByIconAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    icon: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MenuChooseByLabelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    label: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MenuChooseByIndexAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    index: int = betterproto.int64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MenuScrollAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    direction: "MenuScrollDirection" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StackAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushMenuAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    menu_key: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushApplicationAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    application_id: str = betterproto.string_field(2)
+    initialization_args: "StackPushApplicationActionInitializationArgs | None" = (
+        betterproto.message_field(3, optional=True)
+    )
+    initialization_kwargs: (
+        "StackPushApplicationActionInitializationKwargsDict | None"
+    ) = betterproto.message_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushApplicationActionInitializationArgs(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushApplicationActionInitializationKwargsValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushApplicationActionInitializationKwargsValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(
+        1, group="initialization_kwargs_value"
+    )
+    list: "StackPushApplicationActionInitializationKwargsValue2" = (
+        betterproto.message_field(2, group="initialization_kwargs_value")
+    )
+
+
+@dataclass(eq=False, repr=False)
+class StackPushApplicationActionInitializationKwargsDict(betterproto.Message):
+    items: "dict[str, StackPushApplicationActionInitializationKwargsValue]" = (
+        betterproto.map_field(1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class StackPushRenderAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    kind: str = betterproto.string_field(2)
+    title: "str | None" = betterproto.string_field(3, optional=True)
+    props: "StackPushRenderActionPropsDict | None" = betterproto.message_field(
+        4, optional=True
+    )
+    items: "StackPushRenderActionItems | None" = betterproto.message_field(
+        5, optional=True
+    )
+    stream_id: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushRenderActionPropsValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushRenderActionPropsValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(1, group="props_value")
+    list: "StackPushRenderActionPropsValue2" = betterproto.message_field(
+        2, group="props_value"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class StackPushRenderActionPropsDict(betterproto.Message):
+    items: "dict[str, StackPushRenderActionPropsValue]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class StackPushRenderActionItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushNotificationAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    notification_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StackPopNotificationAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    notification_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushChatAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    session_id: "str | None" = betterproto.string_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StackPopChatAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StackPopAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    count: "int | None" = betterproto.int64_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StackPopToRootAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StackPopItemAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    item_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StackSetPageIndexAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    page_index: int = betterproto.int64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateApplicationKwargsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    application_id: str = betterproto.string_field(2)
+    kwargs: "UpdateApplicationKwargsActionKwargsDict | None" = (
+        betterproto.message_field(3, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UpdateApplicationKwargsActionKwargsValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateApplicationKwargsActionKwargsValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(1, group="kwargs_value")
+    list: "UpdateApplicationKwargsActionKwargsValue2" = betterproto.message_field(
+        2, group="kwargs_value"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UpdateApplicationKwargsActionKwargsDict(betterproto.Message):
+    items: "dict[str, UpdateApplicationKwargsActionKwargsValue]" = (
+        betterproto.map_field(1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UpdateRenderPropsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    kind: "str | None" = betterproto.string_field(2, optional=True)
+    stream_id: "str | None" = betterproto.string_field(3, optional=True)
+    next_kind: "str | None" = betterproto.string_field(4, optional=True)
+    title: "str | None" = betterproto.string_field(5, optional=True)
+    props: "UpdateRenderPropsActionPropsDict | None" = betterproto.message_field(
+        6, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UpdateRenderPropsActionPropsValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateRenderPropsActionPropsValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(1, group="props_value")
+    list: "UpdateRenderPropsActionPropsValue2" = betterproto.message_field(
+        2, group="props_value"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UpdateRenderPropsActionPropsDict(betterproto.Message):
+    items: "dict[str, UpdateRenderPropsActionPropsValue]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UpdatePromptAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    title: "str | None" = betterproto.string_field(2, optional=True)
+    prompt: "str | None" = betterproto.string_field(3, optional=True)
+    icon: "str | None" = betterproto.string_field(4, optional=True)
+    items: "UpdatePromptActionItems | None" = betterproto.message_field(
+        5, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UpdatePromptActionItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class DynamicMenuAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateDynamicMenuAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    menu_id: str = betterproto.string_field(2)
+    title: "str | None" = betterproto.string_field(3, optional=True)
+    heading: "str | None" = betterproto.string_field(4, optional=True)
+    sub_heading: "str | None" = betterproto.string_field(5, optional=True)
+    items: "UpdateDynamicMenuActionItems | None" = betterproto.message_field(
+        6, optional=True
+    )
+    placeholder: "str | None" = betterproto.string_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateDynamicMenuActionItemsItem(betterproto.Message):
+    items: "MenuItemData | None" = betterproto.message_field(1, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateDynamicMenuActionItems(betterproto.Message):
+    items: "list[UpdateDynamicMenuActionItemsItem]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ClearDynamicMenuAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    menu_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ExecuteMenuActionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    action_id: str = betterproto.string_field(2)
+    menu_key: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class OpenApplicationAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    application_id: str = betterproto.string_field(2)
+    initialization_args: "OpenApplicationActionInitializationArgs | None" = (
+        betterproto.message_field(3, optional=True)
+    )
+    initialization_kwargs: "OpenApplicationActionInitializationKwargsDict | None" = (
+        betterproto.message_field(4, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class OpenApplicationActionInitializationArgs(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class OpenApplicationActionInitializationKwargsValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class OpenApplicationActionInitializationKwargsValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(
+        1, group="initialization_kwargs_value"
+    )
+    list: "OpenApplicationActionInitializationKwargsValue2" = betterproto.message_field(
+        2, group="initialization_kwargs_value"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class OpenApplicationActionInitializationKwargsDict(betterproto.Message):
+    items: "dict[str, OpenApplicationActionInitializationKwargsValue]" = (
+        betterproto.map_field(1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class OpenRenderAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    kind: str = betterproto.string_field(2)
+    title: "str | None" = betterproto.string_field(3, optional=True)
+    props: "OpenRenderActionPropsDict | None" = betterproto.message_field(
+        4, optional=True
+    )
+    items: "OpenRenderActionItems | None" = betterproto.message_field(5, optional=True)
+    stream_id: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class OpenRenderActionPropsValue2(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class OpenRenderActionPropsValue(betterproto.Message):
+    basic_type: "BasicType" = betterproto.message_field(1, group="props_value")
+    list: "OpenRenderActionPropsValue2" = betterproto.message_field(
+        2, group="props_value"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class OpenRenderActionPropsDict(betterproto.Message):
+    items: "dict[str, OpenRenderActionPropsValue]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class OpenRenderActionItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class CloseApplicationAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    application_instance_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushInstructionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    title: "str | None" = betterproto.string_field(2, optional=True)
+    instruction: "str | None" = betterproto.string_field(3, optional=True)
+    icon: "str | None" = betterproto.string_field(4, optional=True)
+    spinner: "bool | None" = betterproto.bool_field(5, optional=True)
+    timeout_seconds: "int | None" = betterproto.int64_field(6, optional=True)
+    footer_text: "str | None" = betterproto.string_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class CloseInstructionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    instruction_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateInstructionProgressAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    instruction_id: str = betterproto.string_field(2)
+    progress_text: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StackPushPromptAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    title: "str | None" = betterproto.string_field(2, optional=True)
+    prompt: "str | None" = betterproto.string_field(3, optional=True)
+    icon: "str | None" = betterproto.string_field(4, optional=True)
+    items: "StackPushPromptActionItems | None" = betterproto.message_field(
+        5, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class StackPushPromptActionItems(betterproto.Message):
+    items: "list[MenuItemData]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateCurrentViewAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    view: "ViewData" = betterproto.message_field(2)
+    status_bar: "StatusBarData | None" = betterproto.message_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ToggleRecordingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ReplayRecordedSequenceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ReportReplayingDoneAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class TakeScreenshotAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ScreenshotDataAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_actions: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    data: bytes = betterproto.bytes_field(2)
+    hash: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class MainEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InitEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MenuEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MenuChooseByIconEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    icon: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MenuChooseByLabelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    label: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MenuChooseByIndexEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    index: int = betterproto.int64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StackChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    stack: "list[StackItemType]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StackPageIndexChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    page_index: int = betterproto.int64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ViewChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    view: "ViewData" = betterproto.message_field(2)
+    status_bar: "StatusBarData | None" = betterproto.message_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DynamicMenuChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    menu_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class PowerEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class PowerOffEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RebootEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ScreenshotEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SnapshotEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StoreRecordedSequenceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    recorded_sequence: "list[KeypadAction]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ExecuteMenuActionEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    action_id: str = betterproto.string_field(2)
+    menu_key: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ReplayRecordedSequenceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ApplicationScrollEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    direction: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class LocalOverlayGoBackEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FrameStreamDataEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    stream_id: str = betterproto.string_field(2)
+    data: bytes = betterproto.bytes_field(3)
+    width: int = betterproto.int64_field(4)
+    height: int = betterproto.int64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class FrameStreamChunkEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    stream_id: str = betterproto.string_field(2)
+    data: bytes = betterproto.bytes_field(3)
+    width: int = betterproto.int64_field(4)
+    height: int = betterproto.int64_field(5)
+    row_offset: int = betterproto.int64_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ScreenshotDataEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_core_dot_types_dot_events: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    data: bytes = betterproto.bytes_field(2)
+    hash: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class UboDispatchItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_ubo_actions: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    key: "str | None" = betterproto.string_field(2, optional=True)
+    label: "str | None" = betterproto.string_field(3, optional=True)
+    icon: "str | None" = betterproto.string_field(4, optional=True)
+    color: "str | None" = betterproto.string_field(5, optional=True)
+    background_color: "str | None" = betterproto.string_field(6, optional=True)
+    is_short: "bool | None" = betterproto.bool_field(7, optional=True)
+    store_action: "UboDispatchItemStoreAction | None" = betterproto.message_field(
+        8, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UboDispatchItemStoreAction2(betterproto.Message):
+    items: "list[Action]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class UboDispatchItemStoreAction(betterproto.Message):
+    ubo_action: "Action" = betterproto.message_field(1, group="store_action")
+    list: "UboDispatchItemStoreAction2" = betterproto.message_field(
+        2, group="store_action"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UboApplicationItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_ubo_actions: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    application_id: str = betterproto.string_field(2)
+    key: "str | None" = betterproto.string_field(3, optional=True)
+    label: "str | None" = betterproto.string_field(4, optional=True)
+    icon: "str | None" = betterproto.string_field(5, optional=True)
+    color: "str | None" = betterproto.string_field(6, optional=True)
+    background_color: "str | None" = betterproto.string_field(7, optional=True)
+    is_short: "bool | None" = betterproto.bool_field(8, optional=True)
+    initialization_args: "UboApplicationItemInitializationArgs | None" = (
+        betterproto.message_field(9, optional=True)
+    )
+    initialization_kwargs: "UboApplicationItemInitializationKwargsDict | None" = (
+        betterproto.message_field(10, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UboApplicationItemInitializationArgs(betterproto.Message):
+    items: "list[BasicType]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class UboApplicationItemInitializationKwargsDict(betterproto.Message):
+    items: "dict[str, BasicType]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class BasicType(betterproto.Message):
+    bool: builtins.bool = betterproto.bool_field(1, group="basic_type")
+    bytes: builtins.bytes = betterproto.bytes_field(2, group="basic_type")
+    float: builtins.float = betterproto.float_field(3, group="basic_type")
+    int64: int = betterproto.int64_field(4, group="basic_type")
+    string: str = betterproto.string_field(5, group="basic_type")
+
+
+@dataclass(eq=False, repr=False)
+class InputResult(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    data: "dict[str, str]" = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    files: "dict[str, bytes]" = betterproto.map_field(
+        3, betterproto.TYPE_STRING, betterproto.TYPE_BYTES
+    )
+    method: "InputMethod" = betterproto.enum_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class InputFieldDescription(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    name: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    type: "InputFieldType" = betterproto.enum_field(4)
+    description: "str | None" = betterproto.string_field(5, optional=True)
+    title: "str | None" = betterproto.string_field(6, optional=True)
+    file_mimetype: "str | None" = betterproto.string_field(7, optional=True)
+    pattern: "str | None" = betterproto.string_field(8, optional=True)
+    default_value: "str | None" = betterproto.string_field(9, optional=True)
+    options: "InputFieldDescriptionOptions | None" = betterproto.message_field(
+        10, optional=True
+    )
+    required: "bool | None" = betterproto.bool_field(11, optional=True)
+    help: "str | None" = betterproto.string_field(12, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InputFieldDescriptionOptions(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class InputDescription(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    input_method: "InputMethod" = betterproto.enum_field(2)
+    id: "str | None" = betterproto.string_field(3, optional=True)
+    title: "str | None" = betterproto.string_field(4, optional=True)
+    prompt: "str | None" = betterproto.string_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WebUiInputDescription(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    input_method: "InputMethod | None" = betterproto.enum_field(2, optional=True)
+    fields: "WebUiInputDescriptionFields | None" = betterproto.message_field(
+        3, optional=True
+    )
+    id: "str | None" = betterproto.string_field(4, optional=True)
+    title: "str | None" = betterproto.string_field(5, optional=True)
+    prompt: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WebUiInputDescriptionFields(betterproto.Message):
+    items: "list[InputFieldDescription]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class QrCodeInputDescription(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    input_method: "InputMethod | None" = betterproto.enum_field(2, optional=True)
+    instructions: "ReadableInformation | None" = betterproto.message_field(
+        3, optional=True
+    )
+    pattern: "str | None" = betterproto.string_field(4, optional=True)
+    id: "str | None" = betterproto.string_field(5, optional=True)
+    title: "str | None" = betterproto.string_field(6, optional=True)
+    prompt: "str | None" = betterproto.string_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class PathInputDescription(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    input_method: "InputMethod | None" = betterproto.enum_field(2, optional=True)
+    selector_config: "PathSelectorConfig" = betterproto.message_field(3)
+    id: "str | None" = betterproto.string_field(4, optional=True)
+    title: "str | None" = betterproto.string_field(5, optional=True)
+    prompt: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InputAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class InputDemandAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    description: "AvailableInputDescription" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class InputResolveAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class InputCancelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class InputProvideAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    value: str = betterproto.string_field(2)
+    result: "InputResult | None" = betterproto.message_field(3, optional=True)
+    id: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class InputResolveEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class InputCancelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class InputProvideEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_input_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    value: str = betterproto.string_field(2)
+    result: "InputResult | None" = betterproto.message_field(3, optional=True)
+    id: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AvailableInputDescription(betterproto.Message):
+    path_input_description: "PathInputDescription" = betterproto.message_field(
+        1, group="available_input_description"
+    )
+    qr_code_input_description: "QrCodeInputDescription" = betterproto.message_field(
+        2, group="available_input_description"
+    )
+    web_ui_input_description: "WebUiInputDescription" = betterproto.message_field(
+        3, group="available_input_description"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsTogglePdbSignalAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsToggleVisualDebugAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsToggleBetaVersionsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsToggleGrpcRemoteAccessAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsToggleTcpLiteAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsToggleAssistantDebugAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsToggleStoreTracingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsDumpStoreTraceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsReportStoreTraceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    path: str = betterproto.string_field(2)
+    trace: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsSetServicesAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    services: "dict[str, ServiceState]" = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+    gap_duration: float = betterproto.float_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsServiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    service_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsStartServiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    service_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsStopServiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    service_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsServiceSetStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_active: bool = betterproto.bool_field(2)
+    service_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsServiceSetIsEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_enabled: bool = betterproto.bool_field(2)
+    service_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsServiceSetLogLevelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    log_level: int = betterproto.int64_field(2)
+    service_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsServiceSetShouldRestartAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    should_auto_restart: bool = betterproto.bool_field(2)
+    service_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsReportServiceErrorAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    error: "ErrorReport" = betterproto.message_field(2)
+    service_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsClearServiceErrorsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    service_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsServiceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    service_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsStartServiceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    delay: "float | None" = betterproto.float_field(2, optional=True)
+    service_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsStopServiceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    service_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsDumpStoreTraceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SettingsStoreTraceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    path: str = betterproto.string_field(2)
+    trace: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ErrorReport(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: float = betterproto.float_field(2)
+    message: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ServiceState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    is_active: bool = betterproto.bool_field(4)
+    is_enabled: bool = betterproto.bool_field(5)
+    log_level: int = betterproto.int64_field(6)
+    should_auto_restart: bool = betterproto.bool_field(7)
+    errors: "ServiceStateErrors | None" = betterproto.message_field(8, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ServiceStateErrors(betterproto.Message):
+    items: "list[ErrorReport]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_settings_dot_types: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    pdb_signal: "bool | None" = betterproto.bool_field(2, optional=True)
+    visual_debug: "bool | None" = betterproto.bool_field(3, optional=True)
+    beta_versions: "bool | None" = betterproto.bool_field(4, optional=True)
+    grpc_remote_access: "bool | None" = betterproto.bool_field(5, optional=True)
+    tcp_lite_enabled: "bool | None" = betterproto.bool_field(6, optional=True)
+    assistant_debug: "bool | None" = betterproto.bool_field(7, optional=True)
+    store_tracing: "bool | None" = betterproto.bool_field(8, optional=True)
+    services: "SettingsStateServicesDict | None" = betterproto.message_field(
+        9, optional=True
+    )
+    services_status: "ServicesStatus | None" = betterproto.enum_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SettingsStateServicesDict(betterproto.Message):
+    items: "dict[str, ServiceState]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class IconState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_status_icons_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    symbol: str = betterproto.string_field(2)
+    color: str = betterproto.string_field(3)
+    priority: int = betterproto.int64_field(4)
+    service_id: str = betterproto.string_field(5)
+    id: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StatusIconsState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_status_icons_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    icons: "list[IconState]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StatusIconsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_status_icons_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StatusIconsRegisterAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_status_icons_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    icon: str = betterproto.string_field(2)
+    color: "str | None" = betterproto.string_field(3, optional=True)
+    priority: "int | None" = betterproto.int64_field(4, optional=True)
+    id: "str | None" = betterproto.string_field(5, optional=True)
+    service: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_update_manager_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerSetVersionsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_update_manager_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    flash_notification: bool = betterproto.bool_field(2)
+    current_version: str = betterproto.string_field(3)
+    base_image_variant: str = betterproto.string_field(4)
+    latest_version: str = betterproto.string_field(5)
+    recent_versions: "UpdateManagerSetVersionsActionRecentVersions | None" = (
+        betterproto.message_field(6, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerSetVersionsActionRecentVersions(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerRequestCheckAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_update_manager_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerReportFailedCheckAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_update_manager_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerRequestUpdateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_update_manager_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    version: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_update_manager_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerCheckEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_update_manager_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerUpdateEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_update_manager_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    version: "str | None" = betterproto.string_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_update_manager_dot_types: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    current_version: "str | None" = betterproto.string_field(2, optional=True)
+    base_image_variant: "str | None" = betterproto.string_field(3, optional=True)
+    latest_version: "str | None" = betterproto.string_field(4, optional=True)
+    update_status: "UpdateStatus | None" = betterproto.enum_field(5, optional=True)
+    recent_versions: "UpdateManagerStateRecentVersions | None" = (
+        betterproto.message_field(6, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UpdateManagerStateRecentVersions(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SystemPrompt(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    content: str = betterproto.string_field(4)
+    is_enabled: "bool | None" = betterproto.bool_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class GenericLlmProvider(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    provider_id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class MoonshineDownloadedModels(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    items: "MoonshineDownloadedModelsItems | None" = betterproto.message_field(
+        2, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MoonshineDownloadedModelsItems(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ElevenLabsVoiceEntry(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class MistralVoiceEntry(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantTriggerSource(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WakePhraseTriggerSource(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    phrase: str = betterproto.string_field(2)
+    detector: "str | None" = betterproto.string_field(3, optional=True)
+    mode: "WakeMode | None" = betterproto.enum_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadTriggerSource(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    key: "Key" = betterproto.enum_field(2)
+    mode: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredTriggerSource(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    protocol: str = betterproto.string_field(2)
+    scancode: str = betterproto.string_field(3)
+    label: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class GrpcTriggerSource(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DesktopTriggerSource(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStopReason(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UserStopReason(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    source: "AssistantTriggerSourceUnion" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SilenceTimeoutStopReason(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    silence_seconds: float = betterproto.float_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class EndOfTurnPhraseStopReason(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    phrase: str = betterproto.string_field(2)
+    matched_text: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ExternalStopReason(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StopTalkingPhraseStopReason(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    phrase: "str | None" = betterproto.string_field(2, optional=True)
+    detector: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class BotStartedSpeakingStopReason(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantTriggerPolicyMatcher(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WakePhraseMatcher(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    phrase: "str | None" = betterproto.string_field(2, optional=True)
+    mode: "WakeMode | None" = betterproto.enum_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadMatcher(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    key: "Key | None" = betterproto.enum_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredMatcher(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    protocol: "str | None" = betterproto.string_field(2, optional=True)
+    scancode: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AnySourceMatcher(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantTriggerPolicy(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    silence_timeout_seconds: "float | None" = betterproto.float_field(2, optional=True)
+    end_of_turn_phrases: "AssistantTriggerPolicyEndOfTurnPhrases | None" = (
+        betterproto.message_field(3, optional=True)
+    )
+    completion_mode: "AssistantTurnCompletionMode | None" = betterproto.enum_field(
+        4, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AssistantTriggerPolicyEndOfTurnPhrases(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantTriggerPolicyEntry(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    matcher: "AssistantTriggerPolicyMatcherUnion" = betterproto.message_field(2)
+    policy: "AssistantTriggerPolicy" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetIsActiveAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_active: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetConversationEndPhrasesAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    phrases: "list[str]" = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedSttAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    stt_name: "AssistantSttName" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedLlmAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    llm_name: "AssistantLlmName" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedTtsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    tts_name: "AssistantTtsName" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedImageGeneratorAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    image_generator_name: "AssistantImageGeneratorName" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model: str = betterproto.string_field(2)
+    llm_name: "AssistantLlmName | None" = betterproto.enum_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedVoiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    tts_name: "AssistantTtsName" = betterproto.enum_field(2)
+    voice_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantAddElevenLabsVoiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+    name: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeleteElevenLabsVoiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetElevenLabsAvailableVoicesAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voices: "list[ElevenLabsVoiceEntry]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetMistralAvailableVoicesAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voices: "list[MistralVoiceEntry]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadOllamaModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetOllamaDownloadedModelsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    models: "list[str]" = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetOllamaModelCapabilitiesAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model: str = betterproto.string_field(2)
+    capabilities: "list[str]" = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetOllamaThinkingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model: str = betterproto.string_field(2)
+    enabled: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedPiperVoiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadPiperVoiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetPiperDownloadedVoicesAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voices: "list[str]" = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedKokoroVoiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadKokoroAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetKokoroDownloadedAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    downloaded: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedVoskModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadVoskModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetVoskDownloadedModelsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    models: "list[str]" = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetSelectedMoonshineModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadMoonshineModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeleteMoonshineModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantAddMoonshineDownloadedModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantRemoveMoonshineDownloadedModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSetMoonshineDownloadingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeleteOllamaModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeletePiperVoiceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeleteKokoroAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeleteVoskModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistanceFrame(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_last_frame: bool = betterproto.bool_field(2)
+    timestamp: float = betterproto.float_field(3)
+    id: str = betterproto.string_field(4)
+    index: int = betterproto.int64_field(5)
+    session_id: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistanceTextFrame(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    text: str = betterproto.string_field(2)
+    source: "AssistantPipelineStage | None" = betterproto.enum_field(3, optional=True)
+    is_last_frame: bool = betterproto.bool_field(4)
+    timestamp: float = betterproto.float_field(5)
+    id: str = betterproto.string_field(6)
+    index: int = betterproto.int64_field(7)
+    session_id: "str | None" = betterproto.string_field(8, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistanceAudioFrame(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    audio: "AudioSample | None" = betterproto.message_field(2, optional=True)
+    is_last_frame: bool = betterproto.bool_field(3)
+    timestamp: float = betterproto.float_field(4)
+    id: str = betterproto.string_field(5)
+    index: int = betterproto.int64_field(6)
+    session_id: "str | None" = betterproto.string_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistanceImageFrame(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    image: bytes = betterproto.bytes_field(2)
+    width: int = betterproto.int64_field(3)
+    height: int = betterproto.int64_field(4)
+    format: str = betterproto.string_field(5)
+    metadata: "dict[str, str]" = betterproto.map_field(
+        6, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+    is_last_frame: bool = betterproto.bool_field(7)
+    timestamp: float = betterproto.float_field(8)
+    id: str = betterproto.string_field(9)
+    index: int = betterproto.int64_field(10)
+    session_id: "str | None" = betterproto.string_field(11, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistanceErrorFrame(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    error: str = betterproto.string_field(2)
+    is_last_frame: bool = betterproto.bool_field(3)
+    timestamp: float = betterproto.float_field(4)
+    id: str = betterproto.string_field(5)
+    index: int = betterproto.int64_field(6)
+    session_id: "str | None" = betterproto.string_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantReportAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    source_id: str = betterproto.string_field(2)
+    data: "AcceptableAssistanceFrame" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStartListeningAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    source: "AssistantTriggerSourceUnion | None" = betterproto.message_field(
+        2, optional=True
+    )
+    audio_source: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStopListeningAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    reason: "AssistantStopReasonUnion | None" = betterproto.message_field(
+        2, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AssistantToggleListeningAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    source: "AssistantTriggerSourceUnion | None" = betterproto.message_field(
+        2, optional=True
+    )
+    audio_source: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantUpdateProvidersAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantAddGenericLlmProviderAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    provider_id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantRemoveGenericLlmProviderAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    provider_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantAddSystemPromptAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    prompt_id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    content: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantRemoveSystemPromptAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    prompt_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantToggleSystemPromptAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    prompt_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSelectGenericLlmProviderAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    provider_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStopTalkingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    phrase: "str | None" = betterproto.string_field(2, optional=True)
+    detector: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantTranscribeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    audio: bytes = betterproto.bytes_field(2)
+    session_id: str = betterproto.string_field(3)
+    sample_rate: "int | None" = betterproto.int64_field(4, optional=True)
+    num_channels: "int | None" = betterproto.int64_field(5, optional=True)
+    stt_provider: "AssistantSttName | None" = betterproto.enum_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantSynthesizeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    text: str = betterproto.string_field(2)
+    session_id: str = betterproto.string_field(3)
+    tts_provider: "AssistantTtsName | None" = betterproto.enum_field(4, optional=True)
+    play_locally: "bool | None" = betterproto.bool_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantCompleteAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    text: str = betterproto.string_field(2)
+    session_id: str = betterproto.string_field(3)
+    llm_provider: "AssistantLlmName | None" = betterproto.enum_field(4, optional=True)
+    system_prompt: "str | None" = betterproto.string_field(5, optional=True)
+    enable_tools: "bool | None" = betterproto.bool_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantRunPipelineAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    session_id: str = betterproto.string_field(2)
+    stages: "list[AssistantPipelineStage]" = betterproto.enum_field(3)
+    audio: "bytes | None" = betterproto.bytes_field(4, optional=True)
+    text: "str | None" = betterproto.string_field(5, optional=True)
+    sample_rate: "int | None" = betterproto.int64_field(6, optional=True)
+    num_channels: "int | None" = betterproto.int64_field(7, optional=True)
+    stt_provider: "AssistantSttName | None" = betterproto.enum_field(8, optional=True)
+    llm_provider: "AssistantLlmName | None" = betterproto.enum_field(9, optional=True)
+    tts_provider: "AssistantTtsName | None" = betterproto.enum_field(10, optional=True)
+    llm_model: "str | None" = betterproto.string_field(11, optional=True)
+    system_prompt: "str | None" = betterproto.string_field(12, optional=True)
+    enable_tools: "bool | None" = betterproto.bool_field(13, optional=True)
+    play_locally: "bool | None" = betterproto.bool_field(14, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantCancelRequestAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    session_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantRequestMicStreamEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    audio_source: str = betterproto.string_field(2)
+    is_active: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStopTalkingEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadOllamaModelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantHandleReportEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    source_id: str = betterproto.string_field(2)
+    data: "AcceptableAssistanceFrame" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantUpdateProvidersEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantModelChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    llm_name: "AssistantLlmName" = betterproto.enum_field(2)
+    model: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantVoiceChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    tts_name: "AssistantTtsName" = betterproto.enum_field(2)
+    voice_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantGenericLlmProviderChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    provider_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantGenericLlmProviderRemovedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    provider_id: str = betterproto.string_field(2)
+    was_selected: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantOllamaThinkingChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model: str = betterproto.string_field(2)
+    enabled: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantPiperVoiceChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadPiperVoiceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadKokoroEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadVoskModelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDownloadMoonshineModelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeleteMoonshineModelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeleteOllamaModelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeletePiperVoiceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    voice_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeleteKokoroEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantDeleteVoskModelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    model_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantRunPipelineEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    session_id: str = betterproto.string_field(2)
+    stages: "list[AssistantPipelineStage]" = betterproto.enum_field(3)
+    audio: bytes = betterproto.bytes_field(4)
+    text: str = betterproto.string_field(5)
+    sample_rate: int = betterproto.int64_field(6)
+    num_channels: int = betterproto.int64_field(7)
+    stt_provider: "AssistantSttName" = betterproto.enum_field(8)
+    llm_provider: "AssistantLlmName" = betterproto.enum_field(9)
+    tts_provider: "AssistantTtsName" = betterproto.enum_field(10)
+    llm_model: str = betterproto.string_field(11)
+    system_prompt: "str | None" = betterproto.string_field(12, optional=True)
+    enable_tools: bool = betterproto.bool_field(13)
+    vosk_model_id: "str | None" = betterproto.string_field(14, optional=True)
+    moonshine_model_id: "str | None" = betterproto.string_field(15, optional=True)
+    piper_voice_id: "str | None" = betterproto.string_field(16, optional=True)
+    kokoro_voice_id: "str | None" = betterproto.string_field(17, optional=True)
+    tts_voice_id: "str | None" = betterproto.string_field(18, optional=True)
+    play_locally: "bool | None" = betterproto.bool_field(19, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantCancelRequestEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    session_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_assistant: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_listening: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_microphone_mute: "bool | None" = betterproto.bool_field(3, optional=True)
+    is_active: "bool | None" = betterproto.bool_field(4, optional=True)
+    selected_stt: "AssistantSttName | None" = betterproto.enum_field(5, optional=True)
+    selected_llm: "AssistantLlmName | None" = betterproto.enum_field(6, optional=True)
+    selected_models: "AssistantStateSelectedModelsDict | None" = (
+        betterproto.message_field(7, optional=True)
+    )
+    generic_llm_providers: "AssistantStateGenericLlmProviders | None" = (
+        betterproto.message_field(8, optional=True)
+    )
+    selected_generic_llm_provider: "str | None" = betterproto.string_field(
+        9, optional=True
+    )
+    ollama_model_capabilities: "AssistantStateOllamaModelCapabilitiesDict | None" = (
+        betterproto.message_field(10, optional=True)
+    )
+    ollama_downloaded_models: "AssistantStateOllamaDownloadedModels | None" = (
+        betterproto.message_field(11, optional=True)
+    )
+    ollama_downloaded_models_refreshed: "bool | None" = betterproto.bool_field(
+        12, optional=True
+    )
+    ollama_thinking_enabled: "AssistantStateOllamaThinkingEnabledDict | None" = (
+        betterproto.message_field(13, optional=True)
+    )
+    selected_tts: "AssistantTtsName | None" = betterproto.enum_field(14, optional=True)
+    selected_voices: "AssistantStateSelectedVoicesDict | None" = (
+        betterproto.message_field(15, optional=True)
+    )
+    elevenlabs_voices: "AssistantStateElevenlabsVoices | None" = (
+        betterproto.message_field(16, optional=True)
+    )
+    elevenlabs_available_voices: "AssistantStateElevenlabsAvailableVoices | None" = (
+        betterproto.message_field(17, optional=True)
+    )
+    mistral_available_voices: "AssistantStateMistralAvailableVoices | None" = (
+        betterproto.message_field(18, optional=True)
+    )
+    selected_piper_voice: "str | None" = betterproto.string_field(19, optional=True)
+    piper_downloaded_voices: "AssistantStatePiperDownloadedVoices | None" = (
+        betterproto.message_field(20, optional=True)
+    )
+    selected_kokoro_voice: "str | None" = betterproto.string_field(21, optional=True)
+    kokoro_is_downloaded: "bool | None" = betterproto.bool_field(22, optional=True)
+    selected_vosk_model: "str | None" = betterproto.string_field(23, optional=True)
+    vosk_downloaded_models: "AssistantStateVoskDownloadedModels | None" = (
+        betterproto.message_field(24, optional=True)
+    )
+    selected_moonshine_model: "str | None" = betterproto.string_field(25, optional=True)
+    moonshine_downloaded_models: "AssistantStateMoonshineDownloadedModels | None" = (
+        betterproto.message_field(26, optional=True)
+    )
+    moonshine_downloaded_models_wrapper: (
+        "AssistantStateMoonshineDownloadedModels | None"
+    ) = betterproto.message_field(27, optional=True)
+    moonshine_downloading_model: "str | None" = betterproto.string_field(
+        28, optional=True
+    )
+    selected_image_generator: "AssistantImageGeneratorName | None" = (
+        betterproto.enum_field(29, optional=True)
+    )
+    provider_setup_status: "AssistantStateProviderSetupStatusDict | None" = (
+        betterproto.message_field(30, optional=True)
+    )
+    active_source: "AssistantTriggerSourceUnion | None" = betterproto.message_field(
+        31, optional=True
+    )
+    active_policy: "AssistantTriggerPolicy | None" = betterproto.message_field(
+        32, optional=True
+    )
+    active_audio_source: "str | None" = betterproto.string_field(33, optional=True)
+    last_stop_reason: "AssistantStopReasonUnion | None" = betterproto.message_field(
+        34, optional=True
+    )
+    policies: "AssistantStatePolicies | None" = betterproto.message_field(
+        35, optional=True
+    )
+    system_prompts: "AssistantStateSystemPrompts | None" = betterproto.message_field(
+        36, optional=True
+    )
+    is_default_system_prompt_enabled: "bool | None" = betterproto.bool_field(
+        37, optional=True
+    )
+    active_system_prompt: "str | None" = betterproto.string_field(38, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateSelectedModelsDict(betterproto.Message):
+    items: "dict[str, str]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateGenericLlmProviders(betterproto.Message):
+    items: "list[GenericLlmProvider]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateOllamaModelCapabilitiesValue(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateOllamaModelCapabilitiesDict(betterproto.Message):
+    items: "dict[str, AssistantStateOllamaModelCapabilitiesValue]" = (
+        betterproto.map_field(1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateOllamaDownloadedModels(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateOllamaThinkingEnabledDict(betterproto.Message):
+    items: "dict[str, bool]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_BOOL
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateSelectedVoicesDict(betterproto.Message):
+    items: "dict[str, str]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateElevenlabsVoices(betterproto.Message):
+    items: "list[ElevenLabsVoiceEntry]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateElevenlabsAvailableVoices(betterproto.Message):
+    items: "list[ElevenLabsVoiceEntry]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateMistralAvailableVoices(betterproto.Message):
+    items: "list[MistralVoiceEntry]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStatePiperDownloadedVoices(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateVoskDownloadedModels(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateMoonshineDownloadedModels(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateProviderSetupStatusDict(betterproto.Message):
+    items: "dict[str, bool]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_BOOL
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStatePolicies(betterproto.Message):
+    items: "list[AssistantTriggerPolicyEntry]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStateSystemPrompts(betterproto.Message):
+    items: "list[SystemPrompt]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AssistantTriggerSourceUnion(betterproto.Message):
+    desktop_trigger_source: "DesktopTriggerSource" = betterproto.message_field(
+        1, group="assistant_trigger_source_union"
+    )
+    grpc_trigger_source: "GrpcTriggerSource" = betterproto.message_field(
+        2, group="assistant_trigger_source_union"
+    )
+    infrared_trigger_source: "InfraredTriggerSource" = betterproto.message_field(
+        3, group="assistant_trigger_source_union"
+    )
+    keypad_trigger_source: "KeypadTriggerSource" = betterproto.message_field(
+        4, group="assistant_trigger_source_union"
+    )
+    wake_phrase_trigger_source: "WakePhraseTriggerSource" = betterproto.message_field(
+        5, group="assistant_trigger_source_union"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AssistantStopReasonUnion(betterproto.Message):
+    bot_started_speaking_stop_reason: "BotStartedSpeakingStopReason" = (
+        betterproto.message_field(1, group="assistant_stop_reason_union")
+    )
+    end_of_turn_phrase_stop_reason: "EndOfTurnPhraseStopReason" = (
+        betterproto.message_field(2, group="assistant_stop_reason_union")
+    )
+    external_stop_reason: "ExternalStopReason" = betterproto.message_field(
+        3, group="assistant_stop_reason_union"
+    )
+    silence_timeout_stop_reason: "SilenceTimeoutStopReason" = betterproto.message_field(
+        4, group="assistant_stop_reason_union"
+    )
+    stop_talking_phrase_stop_reason: "StopTalkingPhraseStopReason" = (
+        betterproto.message_field(5, group="assistant_stop_reason_union")
+    )
+    user_stop_reason: "UserStopReason" = betterproto.message_field(
+        6, group="assistant_stop_reason_union"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AssistantTriggerPolicyMatcherUnion(betterproto.Message):
+    any_source_matcher: "AnySourceMatcher" = betterproto.message_field(
+        1, group="assistant_trigger_policy_matcher_union"
+    )
+    infrared_matcher: "InfraredMatcher" = betterproto.message_field(
+        2, group="assistant_trigger_policy_matcher_union"
+    )
+    keypad_matcher: "KeypadMatcher" = betterproto.message_field(
+        3, group="assistant_trigger_policy_matcher_union"
+    )
+    wake_phrase_matcher: "WakePhraseMatcher" = betterproto.message_field(
+        4, group="assistant_trigger_policy_matcher_union"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AcceptableAssistanceFrame(betterproto.Message):
+    assistance_audio_frame: "AssistanceAudioFrame" = betterproto.message_field(
+        1, group="acceptable_assistance_frame"
+    )
+    assistance_error_frame: "AssistanceErrorFrame" = betterproto.message_field(
+        2, group="acceptable_assistance_frame"
+    )
+    assistance_image_frame: "AssistanceImageFrame" = betterproto.message_field(
+        3, group="acceptable_assistance_frame"
+    )
+    assistance_text_frame: "AssistanceTextFrame" = betterproto.message_field(
+        4, group="acceptable_assistance_frame"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioOutputVolume(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    output: "AudioOutput" = betterproto.enum_field(2)
+    volume: float = betterproto.float_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AudioAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioInstallDriverAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioSetVolumeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    volume: float = betterproto.float_field(2)
+    device: "AudioDevice" = betterproto.enum_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AudioChangeVolumeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    amount: float = betterproto.float_field(2)
+    device: "AudioDevice" = betterproto.enum_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AudioSetMuteStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_mute: bool = betterproto.bool_field(2)
+    device: "AudioDevice" = betterproto.enum_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AudioReportRemoteCaptureAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_active: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AudioToggleMuteStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    device: "AudioDevice" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AudioSelectOutputAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    output: "AudioOutput" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AudioSetLineoutAutoSwitchAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_enabled: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AudioReportLineoutJackAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_inserted: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AudioPlayChimeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    name: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AudioPlayAudioSampleAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    sample: "AudioSample" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AudioPlayAudioSequenceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    sample: "AudioSample | None" = betterproto.message_field(2, optional=True)
+    id: str = betterproto.string_field(3)
+    index: int = betterproto.int64_field(4)
+    source: "AudioSequenceSource | None" = betterproto.enum_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AudioSample(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    data: bytes = betterproto.bytes_field(2)
+    channels: int = betterproto.int64_field(3)
+    rate: int = betterproto.int64_field(4)
+    width: int = betterproto.int64_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class AudioReportSampleAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: float = betterproto.float_field(2)
+    sample_speech_recognition: bytes = betterproto.bytes_field(3)
+    sample: "AudioSample" = betterproto.message_field(4)
+    audio_source: "str | None" = betterproto.string_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AudioPlaybackDoneAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+    source: "AudioSequenceSource | None" = betterproto.enum_field(3, optional=True)
+    timestamp: "float | None" = betterproto.float_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AudioStartRecordingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioStopPlaybackAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioStopRecordingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioToggleRecordingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioPlayRecordingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioReportSampleEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: float = betterproto.float_field(2)
+    sample_speech_recognition: bytes = betterproto.bytes_field(3)
+    sample: "AudioSample" = betterproto.message_field(4)
+    audio_source: "str | None" = betterproto.string_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AudioInstallDriverEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioPlayChimeEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    name: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AudioPlayAudioSampleEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    volume: float = betterproto.float_field(2)
+    sample: "AudioSample" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AudioPlayAudioSequenceEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    volume: float = betterproto.float_field(2)
+    sample: "AudioSample | None" = betterproto.message_field(3, optional=True)
+    id: str = betterproto.string_field(4)
+    index: int = betterproto.int64_field(5)
+    source: "AudioSequenceSource | None" = betterproto.enum_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AudioStopPlaybackEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AudioPlaybackDoneEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AudioState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_audio: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    playback_volume: "float | None" = betterproto.float_field(2, optional=True)
+    is_playback_mute: "bool | None" = betterproto.bool_field(3, optional=True)
+    capture_volume: "float | None" = betterproto.float_field(4, optional=True)
+    is_capture_mute: "bool | None" = betterproto.bool_field(5, optional=True)
+    is_remote_capture_active: "bool | None" = betterproto.bool_field(6, optional=True)
+    selected_output: "AudioOutput | None" = betterproto.enum_field(7, optional=True)
+    output_volumes: "AudioStateOutputVolumes | None" = betterproto.message_field(
+        8, optional=True
+    )
+    is_lineout_auto_switch_enabled: "bool | None" = betterproto.bool_field(
+        9, optional=True
+    )
+    is_lineout_jack_inserted: "bool | None" = betterproto.bool_field(10, optional=True)
+    is_recording: "bool | None" = betterproto.bool_field(11, optional=True)
+    recording: "AudioSample | None" = betterproto.message_field(12, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class AudioStateOutputVolumes(betterproto.Message):
+    items: "list[AudioOutputVolume]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class CameraSource(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    kind: "CameraSourceKind" = betterproto.enum_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class CameraAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraStartViewfinderAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    pattern: "str | None" = betterproto.string_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class CameraReportBarcodeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    codes: "list[str]" = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class CameraReportImageAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: float = betterproto.float_field(2)
+    data: bytes = betterproto.bytes_field(3)
+    width: int = betterproto.int64_field(4)
+    height: int = betterproto.int64_field(5)
+    source_id: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class CameraInstallDriverAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    make: str = betterproto.string_field(2)
+    model: str = betterproto.string_field(3)
+    variant: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class CameraEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraInstallDriverEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    make: str = betterproto.string_field(2)
+    model: str = betterproto.string_field(3)
+    variant: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class CameraRestoreDefaultAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraRestoreDefaultEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraStartViewfinderEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    pattern: "str | None" = betterproto.string_field(2, optional=True)
+    source_id: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class CameraReportImageEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: float = betterproto.float_field(2)
+    data: bytes = betterproto.bytes_field(3)
+    width: int = betterproto.int64_field(4)
+    height: int = betterproto.int64_field(5)
+    source_id: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class CameraStopViewfinderEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraSetIndexAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    index: int = betterproto.int64_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class CameraSetSelectedSourceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    source_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class CameraDetectAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraDetectAdvertiseEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraRegisterRemoteAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    source_id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class CameraSetAvailableCamerasAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    available_cameras: "list[CameraSource]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class CameraDetectEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraDetectedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    available_cameras: "list[CameraSource]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class CameraReinitializeEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_camera: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    queue: "list[QrCodeInputDescription]" = betterproto.message_field(2)
+    selected_source_id: "str | None" = betterproto.string_field(3, optional=True)
+    available_cameras: "CameraStateAvailableCameras | None" = betterproto.message_field(
+        4, optional=True
+    )
+    pending_remote_registrations: "CameraStatePendingRemoteRegistrations | None" = (
+        betterproto.message_field(5, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class CameraStateAvailableCameras(betterproto.Message):
+    items: "list[CameraSource]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class CameraStatePendingRemoteRegistrations(betterproto.Message):
+    items: "list[CameraSource]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ChatMessage(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    role: "ChatRole" = betterproto.enum_field(2)
+    id: "str | None" = betterproto.string_field(3, optional=True)
+    kind: "ChatMessageKind | None" = betterproto.enum_field(4, optional=True)
+    text: "str | None" = betterproto.string_field(5, optional=True)
+    audio_id: "str | None" = betterproto.string_field(6, optional=True)
+    audio_data: "bytes | None" = betterproto.bytes_field(7, optional=True)
+    waveform: "ChatMessageWaveform | None" = betterproto.message_field(8, optional=True)
+    is_playing: "bool | None" = betterproto.bool_field(9, optional=True)
+    timestamp: "float | None" = betterproto.float_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ChatMessageWaveform(betterproto.Message):
+    items: "list[float]" = betterproto.float_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ChatState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    messages: "ChatStateMessages | None" = betterproto.message_field(2, optional=True)
+    session_id: "str | None" = betterproto.string_field(3, optional=True)
+    is_active: "bool | None" = betterproto.bool_field(4, optional=True)
+    last_activity_time: "float | None" = betterproto.float_field(5, optional=True)
+    is_audio_playing: "bool | None" = betterproto.bool_field(6, optional=True)
+    messages_revision: "int | None" = betterproto.int64_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ChatStateMessages(betterproto.Message):
+    items: "list[ChatMessage]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ChatAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ChatStartSessionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    session_id: "str | None" = betterproto.string_field(2, optional=True)
+    timestamp: "float | None" = betterproto.float_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ChatEndSessionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ChatAddMessageAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    message: "ChatMessage" = betterproto.message_field(2)
+    timestamp: "float | None" = betterproto.float_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ChatAppendToMessageAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    message_id: str = betterproto.string_field(2)
+    chunk: str = betterproto.string_field(3)
+    timestamp: "float | None" = betterproto.float_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ChatSetMessageTextAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    message_id: str = betterproto.string_field(2)
+    text: str = betterproto.string_field(3)
+    timestamp: "float | None" = betterproto.float_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ChatSendUserMessageAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    text: str = betterproto.string_field(2)
+    message_id: "str | None" = betterproto.string_field(3, optional=True)
+    timestamp: "float | None" = betterproto.float_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ChatToggleAudioPlaybackAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    message_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ChatClearAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ChatEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ChatSessionStartedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    session_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ChatSessionEndedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    session_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ChatAudioPlaybackToggledEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    message_id: str = betterproto.string_field(2)
+    is_playing: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ChatUserMessageSentEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_chat: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    text: str = betterproto.string_field(2)
+    message_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class DisplayAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DisplayEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DisplayPauseAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DisplayResumeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DisplayRedrawAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DisplayBlankAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DisplayUnblankAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: "float | None" = betterproto.float_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DisplayUpdateActivityAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: "float | None" = betterproto.float_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DisplaySetBlankTimeoutAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timeout: "DisplayBlankTimeout" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DisplayRedrawEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DisplayBlankEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DisplayUnblankEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DisplayRenderEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: float = betterproto.float_field(2)
+    data: bytes = betterproto.bytes_field(3)
+    rectangle: "list[int]" = betterproto.int64_field(4)
+    density: float = betterproto.float_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class DisplayCompressedRenderEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: float = betterproto.float_field(2)
+    compressed_data: bytes = betterproto.bytes_field(3)
+    rectangle: "list[int]" = betterproto.int64_field(4)
+    density: float = betterproto.float_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class DisplayState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_display: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_paused: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_blanked: "bool | None" = betterproto.bool_field(3, optional=True)
+    last_activity_time: "float | None" = betterproto.float_field(4, optional=True)
+    selected_blank_timeout: "DisplayBlankTimeout | None" = betterproto.enum_field(
+        5, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerAppStatus(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    icon: str = betterproto.string_field(4)
+    status: "DockerItemStatus | None" = betterproto.enum_field(5, optional=True)
+    health: "DockerItemHealth | None" = betterproto.enum_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DockerAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerInstallAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerStartAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerStopAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerSetStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    status: "DockerStatus" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerStoreUsernameAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    registry: str = betterproto.string_field(2)
+    username: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class DockerRemoveUsernameAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    registry: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageSetExposeToLanAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+    expose_to_lan: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class DockerSetZigbeeIntentAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    enabled: bool = betterproto.bool_field(2)
+    adapter_by_id: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DockerSetHostNetworkAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    enabled: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerSetAppStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    app: "DockerAppStatus" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageSetStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    status: "DockerItemStatus" = betterproto.enum_field(2)
+    ports: "DockerImageSetStatusActionPorts | None" = betterproto.message_field(
+        3, optional=True
+    )
+    ip: "str | None" = betterproto.string_field(4, optional=True)
+    image: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageSetStatusActionPorts(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageSetDockerIdAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    docker_id: str = betterproto.string_field(2)
+    image: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageReportExitAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    restart_count: int = betterproto.int64_field(2)
+    exit_code: "int | None" = betterproto.int64_field(3, optional=True)
+    exit_at: "float | None" = betterproto.float_field(4, optional=True)
+    error: "str | None" = betterproto.string_field(5, optional=True)
+    failing_services: "DockerImageReportExitActionFailingServices | None" = (
+        betterproto.message_field(6, optional=True)
+    )
+    image: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageReportExitActionFailingServices(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageUpdateMetadataAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    instructions: "str | None" = betterproto.string_field(2, optional=True)
+    image: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageFetchAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRemoveAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRunAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageStopAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageReleaseAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRemoveContainerAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerInstallEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerStartEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerStopEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerServiceState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    status: "DockerStatus | None" = betterproto.enum_field(2, optional=True)
+    usernames: "DockerServiceStateUsernamesDict | None" = betterproto.message_field(
+        3, optional=True
+    )
+    expose_to_lan: "DockerServiceStateExposeToLanDict | None" = (
+        betterproto.message_field(4, optional=True)
+    )
+    zigbee_enabled: "bool | None" = betterproto.bool_field(5, optional=True)
+    zigbee_adapter_by_id: "str | None" = betterproto.string_field(6, optional=True)
+    apps: "DockerServiceStateAppsDict | None" = betterproto.message_field(
+        7, optional=True
+    )
+    host_network_enabled: "bool | None" = betterproto.bool_field(8, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class DockerServiceStateUsernamesDict(betterproto.Message):
+    items: "dict[str, str]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerServiceStateExposeToLanDict(betterproto.Message):
+    items: "dict[str, bool]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_BOOL
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerServiceStateAppsDict(betterproto.Message):
+    items: "dict[str, DockerAppStatus]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRegisterAppEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageFetchCompositionEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageFetchEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRemoveCompositionEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRemoveEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRunCompositionEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRunContainerEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageStopCompositionEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageStopContainerEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageReleaseCompositionEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRemoveContainerEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class DockerImageRebindEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    image: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ImageState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    instructions: "str | None" = betterproto.string_field(4, optional=True)
+    status: "DockerItemStatus | None" = betterproto.enum_field(5, optional=True)
+    container_ip: "str | None" = betterproto.string_field(6, optional=True)
+    docker_id: "str | None" = betterproto.string_field(7, optional=True)
+    ports: "ImageStatePorts | None" = betterproto.message_field(8, optional=True)
+    restart_count: "int | None" = betterproto.int64_field(9, optional=True)
+    last_exit_code: "int | None" = betterproto.int64_field(10, optional=True)
+    last_exit_at: "float | None" = betterproto.float_field(11, optional=True)
+    last_error: "str | None" = betterproto.string_field(12, optional=True)
+    failing_services: "ImageStateFailingServices | None" = betterproto.message_field(
+        13, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ImageStatePorts(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ImageStateFailingServices(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class DockerState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_docker: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    service: "DockerServiceState" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FileDownloadAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_download: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileDownloadRequestAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_download: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    path: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FileDownloadReadyAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_download: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    download_token: str = betterproto.string_field(2)
+    filename: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class FileDownloadEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_download: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileDownloadRequestEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_download: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    path: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FileDownloadReadyEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_download: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    download_token: str = betterproto.string_field(2)
+    filename: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class PathSelectorConfig(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    initial_path: "str | None" = betterproto.string_field(2, optional=True)
+    show_hidden: "bool | None" = betterproto.bool_field(3, optional=True)
+    accepts_files: "bool | None" = betterproto.bool_field(4, optional=True)
+    accepts_directories: "bool | None" = betterproto.bool_field(5, optional=True)
+    acceptable_suffixes: "PathSelectorConfigAcceptableSuffixes | None" = (
+        betterproto.message_field(6, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class PathSelectorConfigAcceptableSuffixes(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemReportSelectionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    path: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemSelectorPushedAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemCopyAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    sources: "list[str]" = betterproto.string_field(2)
+    destination: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemMoveAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    sources: "list[str]" = betterproto.string_field(2)
+    destination: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemRemoveAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    paths: "list[str]" = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemSelectEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    description: "PathInputDescription" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemCopyEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    sources: "list[str]" = betterproto.string_field(2)
+    destination: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemMoveEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    sources: "list[str]" = betterproto.string_field(2)
+    destination: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemRemoveEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    paths: "list[str]" = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemVideoFrameEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    data: bytes = betterproto.bytes_field(2)
+    width: int = betterproto.int64_field(3)
+    height: int = betterproto.int64_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemSelectorCleanupEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileSystemState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_system: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    queue: "list[PathInputDescription]" = betterproto.message_field(2)
+    selector_depth: "int | None" = betterproto.int64_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileUploadAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_upload: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileUploadStartAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_upload: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    upload_id: str = betterproto.string_field(2)
+    target_directory: "str | None" = betterproto.string_field(3, optional=True)
+    filename: "str | None" = betterproto.string_field(4, optional=True)
+    total_size: "int | None" = betterproto.int64_field(5, optional=True)
+    total_chunks: "int | None" = betterproto.int64_field(6, optional=True)
+    chunk_size: "int | None" = betterproto.int64_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileUploadChunkAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_upload: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    upload_id: str = betterproto.string_field(2)
+    chunk_index: int = betterproto.int64_field(3)
+    data: bytes = betterproto.bytes_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class FileUploadCompleteAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_upload: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    upload_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FileUploadEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_upload: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileUploadStartEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_upload: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    upload_id: str = betterproto.string_field(2)
+    target_directory: "str | None" = betterproto.string_field(3, optional=True)
+    filename: "str | None" = betterproto.string_field(4, optional=True)
+    total_size: "int | None" = betterproto.int64_field(5, optional=True)
+    total_chunks: "int | None" = betterproto.int64_field(6, optional=True)
+    chunk_size: "int | None" = betterproto.int64_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class FileUploadChunkEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_upload: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    upload_id: str = betterproto.string_field(2)
+    chunk_index: int = betterproto.int64_field(3)
+    data: bytes = betterproto.bytes_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class FileUploadCompleteEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_upload: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    upload_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FileUploadErrorEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_file_upload: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    upload_id: str = betterproto.string_field(2)
+    error: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredHandleReceivedCodeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    protocol: str = betterproto.string_field(2)
+    scancode: str = betterproto.string_field(3)
+    repeat: "bool | None" = betterproto.bool_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredSendCodeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    protocol: str = betterproto.string_field(2)
+    scancode: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredSetShouldPropagateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    should_propagate: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredSetShouldReceiveAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    should_receive: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredRegisterDeviceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredSetIsRegisteringDeviceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_registering: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredAddDeviceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    name: str = betterproto.string_field(2)
+    protocol: str = betterproto.string_field(3)
+    scancode: str = betterproto.string_field(4)
+    description: "str | None" = betterproto.string_field(5, optional=True)
+    bound_action_key: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredRemoveDeviceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    protocol: str = betterproto.string_field(2)
+    scancode: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredSendCodeEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    protocol: str = betterproto.string_field(2)
+    scancode: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredDeviceRegistrationStartedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredDeviceRegistrationCompleteEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    protocol: str = betterproto.string_field(2)
+    scancode: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredBoundActionTriggeredEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    bound_action_key: str = betterproto.string_field(2)
+    protocol: str = betterproto.string_field(3)
+    scancode: str = betterproto.string_field(4)
+    device_name: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredDevice(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    name: str = betterproto.string_field(2)
+    protocol: str = betterproto.string_field(3)
+    scancode: str = betterproto.string_field(4)
+    description: "str | None" = betterproto.string_field(5, optional=True)
+    bound_action_key: "str | None" = betterproto.string_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class InfraredState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_infrared: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    should_propagate_keypad_actions: "bool | None" = betterproto.bool_field(
+        2, optional=True
+    )
+    should_receive_keypad_actions: "bool | None" = betterproto.bool_field(
+        3, optional=True
+    )
+    is_registering_device: "bool | None" = betterproto.bool_field(4, optional=True)
+    registration_signal_counts: "InfraredStateRegistrationSignalCountsDict | None" = (
+        betterproto.message_field(5, optional=True)
+    )
+    original_should_receive_keypad_actions: "bool | None" = betterproto.bool_field(
+        6, optional=True
+    )
+    registered_devices: "InfraredStateRegisteredDevices | None" = (
+        betterproto.message_field(7, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class InfraredStateRegistrationSignalCountsDict(betterproto.Message):
+    items: "dict[str, int]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_INT64
+    )
+
+
+@dataclass(eq=False, repr=False)
+class InfraredStateRegisteredDevices(betterproto.Message):
+    items: "list[InfraredDevice]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class IpAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ip: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class IpEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ip: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class IpUpdateInterfacesAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ip: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    interfaces: "list[IpNetworkInterface]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class IpSetIsConnectedAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ip: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_connected: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class IpNetworkInterface(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ip: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    name: str = betterproto.string_field(2)
+    ip_addresses: "list[str]" = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class IpState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ip: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    interfaces: "list[IpNetworkInterface]" = betterproto.message_field(2)
+    is_connected: "bool | None" = betterproto.bool_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_keypad: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    key: "Key" = betterproto.enum_field(2)
+    pressed_keys: "list[Key]" = betterproto.enum_field(3)
+    held_keys: "KeypadActionHeldKeys | None" = betterproto.message_field(
+        4, optional=True
+    )
+    time: "float | None" = betterproto.float_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadActionHeldKeys(betterproto.Message):
+    items: "list[Key]" = betterproto.enum_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadKeyPressAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_keypad: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    key: "Key" = betterproto.enum_field(2)
+    pressed_keys: "list[Key]" = betterproto.enum_field(3)
+    held_keys: "KeypadKeyPressActionHeldKeys | None" = betterproto.message_field(
+        4, optional=True
+    )
+    time: "float | None" = betterproto.float_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadKeyPressActionHeldKeys(betterproto.Message):
+    items: "list[Key]" = betterproto.enum_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadKeyHoldAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_keypad: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    key: "Key" = betterproto.enum_field(2)
+    pressed_keys: "list[Key]" = betterproto.enum_field(3)
+    held_keys: "KeypadKeyHoldActionHeldKeys | None" = betterproto.message_field(
+        4, optional=True
+    )
+    time: "float | None" = betterproto.float_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadKeyHoldActionHeldKeys(betterproto.Message):
+    items: "list[Key]" = betterproto.enum_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadKeyUnholdAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_keypad: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    key: "Key" = betterproto.enum_field(2)
+    pressed_keys: "list[Key]" = betterproto.enum_field(3)
+    held_keys: "KeypadKeyUnholdActionHeldKeys | None" = betterproto.message_field(
+        4, optional=True
+    )
+    time: "float | None" = betterproto.float_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadKeyUnholdActionHeldKeys(betterproto.Message):
+    items: "list[Key]" = betterproto.enum_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadKeyReleaseAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_keypad: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    key: "Key" = betterproto.enum_field(2)
+    pressed_keys: "list[Key]" = betterproto.enum_field(3)
+    held_keys: "KeypadKeyReleaseActionHeldKeys | None" = betterproto.message_field(
+        4, optional=True
+    )
+    time: "float | None" = betterproto.float_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadKeyReleaseActionHeldKeys(betterproto.Message):
+    items: "list[Key]" = betterproto.enum_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadReportContextAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_keypad: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    depth: int = betterproto.int64_field(2)
+    is_on_notification: bool = betterproto.bool_field(3)
+    is_on_chat: bool = betterproto.bool_field(4)
+    is_on_application: bool = betterproto.bool_field(5)
+    is_display_blanked: bool = betterproto.bool_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class KeypadState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_keypad: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_consumed: "bool | None" = betterproto.bool_field(2, optional=True)
+    depth: "int | None" = betterproto.int64_field(3, optional=True)
+    is_on_notification: "bool | None" = betterproto.bool_field(4, optional=True)
+    is_on_chat: "bool | None" = betterproto.bool_field(5, optional=True)
+    is_on_application: "bool | None" = betterproto.bool_field(6, optional=True)
+    is_display_blanked: "bool | None" = betterproto.bool_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KioskDashboard(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+    name: str = betterproto.string_field(3)
+    url: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class KioskPortSelection(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    role: "KioskPortRole | None" = betterproto.enum_field(2, optional=True)
+    dashboard_id: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KioskPortSelections(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    hdmi_a_1: "KioskPortSelection | None" = betterproto.message_field(2, optional=True)
+    hdmi_a_2: "KioskPortSelection | None" = betterproto.message_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KioskAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class KioskEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class KioskUpdateStateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_active: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_enabled: "bool | None" = betterproto.bool_field(3, optional=True)
+    is_installed: "bool | None" = betterproto.bool_field(4, optional=True)
+    is_installing: "bool | None" = betterproto.bool_field(5, optional=True)
+    connected_ports: "KioskUpdateStateActionConnectedPorts | None" = (
+        betterproto.message_field(6, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class KioskUpdateStateActionConnectedPorts(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class KioskClearEnabledStateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class KioskSetPortSelectionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    port: str = betterproto.string_field(2)
+    role: "KioskPortRole" = betterproto.enum_field(3)
+    dashboard_id: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class KioskAddDashboardAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+    name: str = betterproto.string_field(3)
+    url: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class KioskDeleteDashboardAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    dashboard_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class KioskRotatePortAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    port: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class KioskApplyConfigEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class KioskState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_kiosk: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_active: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_enabled: "bool | None" = betterproto.bool_field(3, optional=True)
+    is_installed: "bool | None" = betterproto.bool_field(4, optional=True)
+    is_installing: "bool | None" = betterproto.bool_field(5, optional=True)
+    port_selections: "KioskPortSelections | None" = betterproto.message_field(
+        6, optional=True
+    )
+    dashboards: "KioskStateDashboards | None" = betterproto.message_field(
+        7, optional=True
+    )
+    connected_ports: "KioskStateConnectedPorts | None" = betterproto.message_field(
+        8, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class KioskStateDashboards(betterproto.Message):
+    items: "list[KioskDashboard]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class KioskStateConnectedPorts(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class LightDmAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_lightdm: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class LightDmUpdateStateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_lightdm: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_active: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_enabled: "bool | None" = betterproto.bool_field(3, optional=True)
+    is_installed: "bool | None" = betterproto.bool_field(4, optional=True)
+    is_installing: "bool | None" = betterproto.bool_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LightDmClearEnabledStateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_lightdm: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class LightDmState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_lightdm: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_active: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_enabled: "bool | None" = betterproto.bool_field(3, optional=True)
+    is_installed: "bool | None" = betterproto.bool_field(4, optional=True)
+    is_installing: "bool | None" = betterproto.bool_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocationInfo(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    latitude: float = betterproto.float_field(2)
+    longitude: float = betterproto.float_field(3)
+    city: "str | None" = betterproto.string_field(4, optional=True)
+    country: "str | None" = betterproto.string_field(5, optional=True)
+    country_code: "str | None" = betterproto.string_field(6, optional=True)
+    timezone: "str | None" = betterproto.string_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WeatherCondition(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    symbol_code: str = betterproto.string_field(2)
+    temperature_celsius: float = betterproto.float_field(3)
+    wind_speed_mps: "float | None" = betterproto.float_field(4, optional=True)
+    fetched_at: "float | None" = betterproto.float_field(5, optional=True)
+    expires_at: "float | None" = betterproto.float_field(6, optional=True)
+    temperature_display_value: "float | None" = betterproto.float_field(
+        7, optional=True
+    )
+    temperature_display_unit: "str | None" = betterproto.string_field(8, optional=True)
+    wind_speed_display_value: "float | None" = betterproto.float_field(9, optional=True)
+    wind_speed_display_unit: "str | None" = betterproto.string_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationSetLanguageAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    language: "LanguageCode" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationSetUnitSystemAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    unit_system: "UnitSystem" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationSetLocationAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    location: "LocationInfo" = betterproto.message_field(2)
+    source: "LocationSource" = betterproto.enum_field(3)
+    public_ip: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationResetLocationAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationUpdateWeatherAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    weather: "WeatherCondition" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationRefreshWeatherAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationUpdateClockAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    clock: str = betterproto.string_field(2)
+    date: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationSpeakTimeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationSpeakDateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationSpeakWeatherAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationLanguageChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    language: "LanguageCode" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationUnitSystemChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    unit_system: "UnitSystem" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationLocationChangedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    location: "LocationInfo" = betterproto.message_field(2)
+    source: "LocationSource" = betterproto.enum_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationLocationResetEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationWeatherRefreshRequestedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    location: "LocationInfo" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationSpeakTimeEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    timezone: "str | None" = betterproto.string_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationSpeakDateEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    timezone: "str | None" = betterproto.string_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationSpeakWeatherEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    weather: "WeatherCondition | None" = betterproto.message_field(2, optional=True)
+    location: "LocationInfo | None" = betterproto.message_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LocalizationState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_localization: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    language: "LanguageCode | None" = betterproto.enum_field(2, optional=True)
+    location: "LocationInfo | None" = betterproto.message_field(3, optional=True)
+    location_source: "LocationSource | None" = betterproto.enum_field(4, optional=True)
+    public_ip: "str | None" = betterproto.string_field(5, optional=True)
+    unit_system: "UnitSystem | None" = betterproto.enum_field(6, optional=True)
+    weather: "WeatherCondition | None" = betterproto.message_field(7, optional=True)
+    clock: "str | None" = betterproto.string_field(8, optional=True)
+    date: "str | None" = betterproto.string_field(9, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class McpServerHealth(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    status: "McpServerStatus | None" = betterproto.enum_field(2, optional=True)
+    message: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StdioMcpConfig(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    command: str = betterproto.string_field(2)
+    args: "StdioMcpConfigArgs | None" = betterproto.message_field(3, optional=True)
+    env: "StdioMcpConfigEnvDict | None" = betterproto.message_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class StdioMcpConfigArgs(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class StdioMcpConfigEnvDict(betterproto.Message):
+    items: "dict[str, str]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SseMcpConfig(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    url: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class McpServerMetadata(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    server_id: str = betterproto.string_field(2)
+    name: str = betterproto.string_field(3)
+    type: "McpServerType" = betterproto.enum_field(4)
+    config: "McpServerMetadataConfig" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class McpServerMetadataConfig(betterproto.Message):
+    sse_mcp_config: "SseMcpConfig" = betterproto.message_field(1, group="config")
+    stdio_mcp_config: "StdioMcpConfig" = betterproto.message_field(2, group="config")
+
+
+@dataclass(eq=False, repr=False)
+class EnabledMcpServersWithMetadata(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    items: "EnabledMcpServersWithMetadataItems | None" = betterproto.message_field(
+        2, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class EnabledMcpServersWithMetadataItems(betterproto.Message):
+    items: "list[McpServerMetadata]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class McpAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class McpAddServerAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    name: str = betterproto.string_field(2)
+    type: "McpServerType" = betterproto.enum_field(3)
+    config: "McpAddServerActionConfig" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class McpAddServerActionConfig(betterproto.Message):
+    sse_mcp_config: "SseMcpConfig" = betterproto.message_field(1, group="config")
+    stdio_mcp_config: "StdioMcpConfig" = betterproto.message_field(2, group="config")
+
+
+@dataclass(eq=False, repr=False)
+class McpToggleServerAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    server_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class McpSetServerStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    server_id: str = betterproto.string_field(2)
+    status: "McpServerStatus" = betterproto.enum_field(3)
+    message: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class McpDeleteServerAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    server_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class McpSyncServersAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class McpSetServersAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    servers: "list[McpServerMetadata]" = betterproto.message_field(2)
+    enabled_servers: "list[str]" = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class McpEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class McpAddServerEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    name: str = betterproto.string_field(2)
+    type: "McpServerType" = betterproto.enum_field(3)
+    config: "McpAddServerEventConfig" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class McpAddServerEventConfig(betterproto.Message):
+    sse_mcp_config: "SseMcpConfig" = betterproto.message_field(1, group="config")
+    stdio_mcp_config: "StdioMcpConfig" = betterproto.message_field(2, group="config")
+
+
+@dataclass(eq=False, repr=False)
+class McpDeleteServerEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    server_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class McpToggleServerEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    server_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class McpSyncServersEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class McpState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mcp: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    mcp_servers: "McpStateMcpServersDict | None" = betterproto.message_field(
+        2, optional=True
+    )
+    enabled_mcp_servers: "McpStateEnabledMcpServers | None" = betterproto.message_field(
+        3, optional=True
+    )
+    enabled_mcp_servers_with_metadata: "EnabledMcpServersWithMetadata | None" = (
+        betterproto.message_field(4, optional=True)
+    )
+    server_statuses: "McpStateServerStatusesDict | None" = betterproto.message_field(
+        5, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class McpStateMcpServersDict(betterproto.Message):
+    items: "dict[str, McpServerMetadata]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class McpStateEnabledMcpServers(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class McpStateServerStatusesDict(betterproto.Message):
+    items: "dict[str, McpServerHealth]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MqttAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MqttEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MqttBrokerConfig(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    source: "MqttBrokerSource | None" = betterproto.enum_field(2, optional=True)
+    host: "str | None" = betterproto.string_field(3, optional=True)
+    port: "int | None" = betterproto.int64_field(4, optional=True)
+    username: "str | None" = betterproto.string_field(5, optional=True)
+    has_password: "bool | None" = betterproto.bool_field(6, optional=True)
+    use_tls: "bool | None" = betterproto.bool_field(7, optional=True)
+    ca_cert_path: "str | None" = betterproto.string_field(8, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MqttComponent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    component_id: str = betterproto.string_field(2)
+    platform: str = betterproto.string_field(3)
+    name: str = betterproto.string_field(4)
+    state_channel: "str | None" = betterproto.string_field(5, optional=True)
+    value_template: "str | None" = betterproto.string_field(6, optional=True)
+    command_channel: "str | None" = betterproto.string_field(7, optional=True)
+    payload_press: "str | None" = betterproto.string_field(8, optional=True)
+    device_class: "str | None" = betterproto.string_field(9, optional=True)
+    unit_of_measurement: "str | None" = betterproto.string_field(10, optional=True)
+    state_class: "str | None" = betterproto.string_field(11, optional=True)
+    suggested_display_precision: "int | None" = betterproto.int64_field(
+        12, optional=True
+    )
+    event_types: "MqttComponentEventTypes | None" = betterproto.message_field(
+        13, optional=True
+    )
+    options: "MqttComponentOptions | None" = betterproto.message_field(
+        14, optional=True
+    )
+    expire_after: "int | None" = betterproto.int64_field(15, optional=True)
+    command_template: "str | None" = betterproto.string_field(16, optional=True)
+    min_value: "float | None" = betterproto.float_field(17, optional=True)
+    max_value: "float | None" = betterproto.float_field(18, optional=True)
+    step: "float | None" = betterproto.float_field(19, optional=True)
+    mode: "str | None" = betterproto.string_field(20, optional=True)
+    retain: "bool | None" = betterproto.bool_field(21, optional=True)
+    qos: "int | None" = betterproto.int64_field(22, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MqttComponentEventTypes(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class MqttComponentOptions(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class MqttSetStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    status: "MqttConnectionStatus" = betterproto.enum_field(2)
+    error: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MqttSetBrokerAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    broker: "MqttBrokerConfig" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MqttSetEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_enabled: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MqttSetBundledExposeToLanAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    expose_to_lan: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MqttBundledCredentialsChangedAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MqttSetAllowRemoteControlAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    allow_remote_control: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MqttSetPublishedComponentsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    published_components: "dict[str, str]" = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MqttPublishAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    channel: str = betterproto.string_field(2)
+    payload: str = betterproto.string_field(3)
+    retain: "bool | None" = betterproto.bool_field(4, optional=True)
+    qos: "int | None" = betterproto.int64_field(5, optional=True)
+    coalesce: "bool | None" = betterproto.bool_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MqttPublishEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    channel: str = betterproto.string_field(2)
+    payload: str = betterproto.string_field(3)
+    retain: "bool | None" = betterproto.bool_field(4, optional=True)
+    qos: "int | None" = betterproto.int64_field(5, optional=True)
+    coalesce: "bool | None" = betterproto.bool_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class MqttRequestAnnounceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MqttAnnounceRequestedEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MqttState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_mqtt: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    status: "MqttConnectionStatus | None" = betterproto.enum_field(2, optional=True)
+    broker: "MqttBrokerConfig | None" = betterproto.message_field(3, optional=True)
+    is_enabled: "bool | None" = betterproto.bool_field(4, optional=True)
+    allow_remote_control: "bool | None" = betterproto.bool_field(5, optional=True)
+    bundled_expose_to_lan: "bool | None" = betterproto.bool_field(6, optional=True)
+    bundled_credentials_revision: "int | None" = betterproto.int64_field(
+        7, optional=True
+    )
+    last_error: "str | None" = betterproto.string_field(8, optional=True)
+    published_components: "MqttStatePublishedComponentsDict | None" = (
+        betterproto.message_field(9, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class MqttStatePublishedComponentsDict(betterproto.Message):
+    items: "dict[str, str]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_STRING
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotificationActionItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    key: "str | None" = betterproto.string_field(2, optional=True)
+    label: "str | None" = betterproto.string_field(3, optional=True)
+    icon: "str | None" = betterproto.string_field(4, optional=True)
+    color: "str | None" = betterproto.string_field(5, optional=True)
+    background_color: "str | None" = betterproto.string_field(6, optional=True)
+    is_short: "bool | None" = betterproto.bool_field(7, optional=True)
+    action_id: "str | None" = betterproto.string_field(8, optional=True)
+    dismiss_notification: "bool | None" = betterproto.bool_field(9, optional=True)
+    close_notification: "bool | None" = betterproto.bool_field(10, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationDispatchItem(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    store_action: "NotificationDispatchItemStoreAction | None" = (
+        betterproto.message_field(2, optional=True)
+    )
+    key: "str | None" = betterproto.string_field(3, optional=True)
+    label: "str | None" = betterproto.string_field(4, optional=True)
+    icon: "str | None" = betterproto.string_field(5, optional=True)
+    color: "str | None" = betterproto.string_field(6, optional=True)
+    background_color: "str | None" = betterproto.string_field(7, optional=True)
+    is_short: "bool | None" = betterproto.bool_field(8, optional=True)
+    action_id: "str | None" = betterproto.string_field(9, optional=True)
+    dismiss_notification: "bool | None" = betterproto.bool_field(10, optional=True)
+    close_notification: "bool | None" = betterproto.bool_field(11, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationDispatchItemStoreAction2(betterproto.Message):
+    items: "list[Action]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationDispatchItemStoreAction(betterproto.Message):
+    ubo_action: "Action" = betterproto.message_field(1, group="store_action")
+    list: "NotificationDispatchItemStoreAction2" = betterproto.message_field(
+        2, group="store_action"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class Notification(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: "str | None" = betterproto.string_field(2, optional=True)
+    title: str = betterproto.string_field(3)
+    content: str = betterproto.string_field(4)
+    extra_information: "ReadableInformation | None" = betterproto.message_field(
+        5, optional=True
+    )
+    importance: "Importance | None" = betterproto.enum_field(6, optional=True)
+    chime: "Chime | None" = betterproto.enum_field(7, optional=True)
+    timestamp: "float | None" = betterproto.float_field(8, optional=True)
+    is_read: "bool | None" = betterproto.bool_field(9, optional=True)
+    sender: "str | None" = betterproto.string_field(10, optional=True)
+    actions: "NotificationActions | None" = betterproto.message_field(11, optional=True)
+    icon: "str | None" = betterproto.string_field(12, optional=True)
+    color: "str | None" = betterproto.string_field(13, optional=True)
+    expiration_timestamp: "float | None" = betterproto.float_field(14, optional=True)
+    display_type: "NotificationDisplayType | None" = betterproto.enum_field(
+        15, optional=True
+    )
+    flash_time: "float | None" = betterproto.float_field(16, optional=True)
+    show_dismiss_action: "bool | None" = betterproto.bool_field(17, optional=True)
+    dismiss_on_close: "bool | None" = betterproto.bool_field(18, optional=True)
+    on_close_id: "str | None" = betterproto.string_field(19, optional=True)
+    blink: "bool | None" = betterproto.bool_field(20, optional=True)
+    progress: "float | None" = betterproto.float_field(21, optional=True)
+    progress_weight: "float | None" = betterproto.float_field(22, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationActionsItem(betterproto.Message):
+    notification_action_item: "NotificationActionItem" = betterproto.message_field(
+        1, group="actions_item"
+    )
+    notification_dispatch_item: "NotificationDispatchItem" = betterproto.message_field(
+        2, group="actions_item"
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotificationActions(betterproto.Message):
+    items: "list[NotificationActionsItem]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsAddAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    notification: "Notification" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsDisplayAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    notification: "Notification" = betterproto.message_field(2)
+    index: "int | None" = betterproto.int64_field(3, optional=True)
+    count: "int | None" = betterproto.int64_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsClearAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    notification: "Notification" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsClearByIdAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsClearAllAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsClearEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    notification: "Notification" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsDisplayEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    notification: "Notification" = betterproto.message_field(2)
+    index: "int | None" = betterproto.int64_field(3, optional=True)
+    count: "int | None" = betterproto.int64_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_notifications: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    notifications: "NotificationsStateNotificationsDict | None" = (
+        betterproto.message_field(2, optional=True)
+    )
+    unread_count: "int | None" = betterproto.int64_field(3, optional=True)
+    progress: "float | None" = betterproto.float_field(4, optional=True)
+    progress_ids: "NotificationsStateProgressIds | None" = betterproto.message_field(
+        5, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsStateNotificationsDict(betterproto.Message):
+    items: "dict[str, Notification]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotificationsStateProgressIds(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingSetIsBusyAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_busy: "bool | None" = betterproto.bool_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingCommandAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingWaitableCommandAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    wait: "int | None" = betterproto.int64_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingColorfulCommandAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    color: "RgbColor | None" = betterproto.message_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingSetEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    enabled: "bool | None" = betterproto.bool_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingSetAllAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    color: "RgbColor | None" = betterproto.message_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingSetBrightnessAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    brightness: "float | None" = betterproto.float_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingBlankAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingRainbowAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    wait: "int | None" = betterproto.int64_field(2, optional=True)
+    rounds: int = betterproto.int64_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingProgressWheelStepAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    color: "RgbColor | None" = betterproto.message_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingPulseAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    repetitions: "int | None" = betterproto.int64_field(2, optional=True)
+    wait: "int | None" = betterproto.int64_field(3, optional=True)
+    color: "RgbColor | None" = betterproto.message_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingBlinkAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    repetitions: "int | None" = betterproto.int64_field(2, optional=True)
+    wait: "int | None" = betterproto.int64_field(3, optional=True)
+    color: "RgbColor | None" = betterproto.message_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingSpinningWheelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    length: "int | None" = betterproto.int64_field(2, optional=True)
+    repetitions: "int | None" = betterproto.int64_field(3, optional=True)
+    wait: "int | None" = betterproto.int64_field(4, optional=True)
+    color: "RgbColor | None" = betterproto.message_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingProgressWheelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    percentage: "float | None" = betterproto.float_field(2, optional=True)
+    color: "RgbColor | None" = betterproto.message_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingFillUptoAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    percentage: "float | None" = betterproto.float_field(2, optional=True)
+    wait: "int | None" = betterproto.int64_field(3, optional=True)
+    color: "RgbColor | None" = betterproto.message_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingFillDownfromAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    percentage: "float | None" = betterproto.float_field(2, optional=True)
+    wait: "int | None" = betterproto.int64_field(3, optional=True)
+    color: "RgbColor | None" = betterproto.message_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingSequenceAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    sequence: "list[RgbRingCommandAction]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingCommandEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    command: "list[str]" = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RgbRingState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rgb_ring: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_busy: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RgbColorElement(betterproto.Message):
+    float: builtins.float = betterproto.float_field(1, group="rgb_color_element")
+    int64: int = betterproto.int64_field(2, group="rgb_color_element")
+
+
+@dataclass(eq=False, repr=False)
+class RgbColor(betterproto.Message):
+    items: "list[RgbColorElement]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectStartDownloadingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectDoneDownloadingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectSetPendingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectStatus(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    screen_sharing_sessions: "int | None" = betterproto.int64_field(2, optional=True)
+    remote_shell_sessions: "int | None" = betterproto.int64_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectSetStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_installed: bool = betterproto.bool_field(2)
+    is_signed_in: "bool | None" = betterproto.bool_field(3, optional=True)
+    status: "RPiConnectStatus | None" = betterproto.message_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectLoginEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectUpdateServiceStateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_active: "bool | None" = betterproto.bool_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class RPiConnectState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_rpi_connect: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_downloading: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_active: "bool | None" = betterproto.bool_field(3, optional=True)
+    is_installed: "bool | None" = betterproto.bool_field(4, optional=True)
+    is_signed_in: "bool | None" = betterproto.bool_field(5, optional=True)
+    status: "RPiConnectStatus | None" = betterproto.message_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SensorsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SensorsEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SensorsReportReadingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    sensor: "Sensor" = betterproto.enum_field(2)
+    reading: float = betterproto.float_field(3)
+    timestamp: float = betterproto.float_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class SensorEntityReading(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    key: str = betterproto.string_field(2)
+    value: "float | None" = betterproto.float_field(3, optional=True)
+    name: "str | None" = betterproto.string_field(4, optional=True)
+    unit: "str | None" = betterproto.string_field(5, optional=True)
+    device_class: "str | None" = betterproto.string_field(6, optional=True)
+    precision: "int | None" = betterproto.int64_field(7, optional=True)
+    display_value: "float | None" = betterproto.float_field(8, optional=True)
+    display_unit: "str | None" = betterproto.string_field(9, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SensorDeviceState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+    definition_id: str = betterproto.string_field(3)
+    label: str = betterproto.string_field(4)
+    address: int = betterproto.int64_field(5)
+    is_builtin: bool = betterproto.bool_field(6)
+    status: "SensorStatus" = betterproto.enum_field(7)
+    entities: "SensorDeviceStateEntities | None" = betterproto.message_field(
+        8, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SensorDeviceStateEntities(betterproto.Message):
+    items: "list[SensorEntityReading]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SensorsScanAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SensorsScanEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SensorsScanCompletedAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    devices: "SensorsScanCompletedActionDevices | None" = betterproto.message_field(
+        2, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SensorsScanCompletedActionDevices(betterproto.Message):
+    items: "list[SensorDeviceState]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SensorsReportDeviceReadingsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    device_id: str = betterproto.string_field(2)
+    entities: "list[SensorEntityReading]" = betterproto.message_field(3)
+    timestamp: float = betterproto.float_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class SensorDeviceReadings(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    device_id: str = betterproto.string_field(2)
+    entities: "list[SensorEntityReading]" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SensorsReportReadingsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    timestamp: float = betterproto.float_field(2)
+    devices: "SensorsReportReadingsActionDevices | None" = betterproto.message_field(
+        3, optional=True
+    )
+    temperature: "float | None" = betterproto.float_field(4, optional=True)
+    light: "float | None" = betterproto.float_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SensorsReportReadingsActionDevices(betterproto.Message):
+    items: "list[SensorDeviceReadings]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SensorState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    value: "float | None" = betterproto.float_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SensorsState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_sensors: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    temperature: "SensorState | None" = betterproto.message_field(2, optional=True)
+    light: "SensorState | None" = betterproto.message_field(3, optional=True)
+    devices: "SensorsStateDevicesDict | None" = betterproto.message_field(
+        4, optional=True
+    )
+    is_scanning: "bool | None" = betterproto.bool_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SensorsStateDevicesDict(betterproto.Message):
+    items: "dict[str, SensorDeviceState]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordModelStatusEntry(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    status: "WakeWordModelStatus" = betterproto.enum_field(3)
+    model_id: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class LoadedModelInfo(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    key: str = betterproto.string_field(2)
+    engine: str = betterproto.string_field(3)
+    load_seconds: float = betterproto.float_field(4)
+    resident_bytes: int = betterproto.int64_field(5)
+    users: int = betterproto.int64_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WakeEngineSetEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    enabled: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WakeTriggerAddAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    id: str = betterproto.string_field(3)
+    label: str = betterproto.string_field(4)
+    mode: "WakeMode" = betterproto.enum_field(5)
+    value: str = betterproto.string_field(6)
+    sensitivity: "float | None" = betterproto.float_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WakeTriggerRemoveAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionSetAssistantEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    enabled: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionSetWakeModeEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    mode: "WakeMode" = betterproto.enum_field(2)
+    enabled: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordDownloadModelsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine_name: "WakeWordEngineName" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordDownloadModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    model_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordDeleteModelAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    model_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordSetAvailableModelsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    models: "list[str]" = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordSetModelsStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine_name: "WakeWordEngineName" = betterproto.enum_field(2)
+    status: "WakeWordModelStatus" = betterproto.enum_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionSetLoadedModelsAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    models: "list[LoadedModelInfo]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionAddCommandAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    phrases: "list[str]" = betterproto.string_field(4)
+    action_keys: "list[str]" = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionUpdateCommandAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    phrases: "list[str]" = betterproto.string_field(4)
+    action_keys: "list[str]" = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionRemoveCommandAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionRunCommandAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    command_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionSetConversationEndPhrasesAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    phrases: "list[str]" = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionIntent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    phrases: "list[str]" = betterproto.string_field(4)
+    action_keys: "list[str]" = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionCommandDescriptor(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    sample_phrases: "list[str]" = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionCommandsCatalog(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    items: "SpeechRecognitionCommandsCatalogItems | None" = betterproto.message_field(
+        2, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionCommandsCatalogItems(betterproto.Message):
+    items: "list[SpeechRecognitionCommandDescriptor]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionReportWakeWordDetectionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine_name: str = betterproto.string_field(2)
+    trigger_id: str = betterproto.string_field(3)
+    phrase: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionTriggerModeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    mode: "WakeMode" = betterproto.enum_field(2)
+    phrase: "str | None" = betterproto.string_field(3, optional=True)
+    detector: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionSetAssistantListeningAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    active: bool = betterproto.bool_field(2)
+    audio_source: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionReportIntentDetectionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    intent: "SpeechRecognitionIntent" = betterproto.message_field(2)
+    text: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionReportIntentTimeoutAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionReportSpeechAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine_name: "SpeechRecognitionEngineName" = betterproto.enum_field(2)
+    text: str = betterproto.string_field(3)
+    audio: bytes = betterproto.bytes_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordDownloadModelsEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine_name: "WakeWordEngineName" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordDownloadModelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    model_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordDeleteModelEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    model_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionReportTextEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    timestamp: float = betterproto.float_field(2)
+    text: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionBoundActionTriggeredEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    action_keys: "list[str]" = betterproto.string_field(2)
+    phrase: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordTrigger(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    id: str = betterproto.string_field(2)
+    label: str = betterproto.string_field(3)
+    mode: "WakeMode" = betterproto.enum_field(4)
+    value: str = betterproto.string_field(5)
+    sensitivity: "float | None" = betterproto.float_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WakeWordEngineConfig(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    engine: "WakeWordEngineName" = betterproto.enum_field(2)
+    enabled: bool = betterproto.bool_field(3)
+    triggers: "list[WakeWordTrigger]" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_recognition: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    intents: "SpeechRecognitionStateIntents | None" = betterproto.message_field(
+        2, optional=True
+    )
+    wake_engines: "SpeechRecognitionStateWakeEngines | None" = (
+        betterproto.message_field(3, optional=True)
+    )
+    enabled_wake_modes: "SpeechRecognitionStateEnabledWakeModes | None" = (
+        betterproto.message_field(4, optional=True)
+    )
+    openwakeword_models: "SpeechRecognitionStateOpenwakewordModels | None" = (
+        betterproto.message_field(5, optional=True)
+    )
+    microwakeword_models: "SpeechRecognitionStateMicrowakewordModels | None" = (
+        betterproto.message_field(6, optional=True)
+    )
+    conversation_end_phrases: "SpeechRecognitionStateConversationEndPhrases | None" = (
+        betterproto.message_field(7, optional=True)
+    )
+    status: "SpeechRecognitionStatus | None" = betterproto.enum_field(8, optional=True)
+    assistant_session_audio_source: "str | None" = betterproto.string_field(
+        9, optional=True
+    )
+    commands_catalog: "SpeechRecognitionCommandsCatalog | None" = (
+        betterproto.message_field(10, optional=True)
+    )
+    wake_word_models_status: "SpeechRecognitionStateWakeWordModelsStatus | None" = (
+        betterproto.message_field(11, optional=True)
+    )
+    loaded_models: "SpeechRecognitionStateLoadedModels | None" = (
+        betterproto.message_field(12, optional=True)
+    )
+    seeded_default_ids: "SpeechRecognitionStateSeededDefaultIds | None" = (
+        betterproto.message_field(13, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionStateIntents(betterproto.Message):
+    items: "list[SpeechRecognitionIntent]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionStateWakeEngines(betterproto.Message):
+    items: "list[WakeWordEngineConfig]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionStateEnabledWakeModes(betterproto.Message):
+    items: "list[WakeMode]" = betterproto.enum_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionStateOpenwakewordModels(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionStateMicrowakewordModels(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionStateConversationEndPhrases(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionStateWakeWordModelsStatus(betterproto.Message):
+    items: "list[WakeWordModelStatusEntry]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionStateLoadedModels(betterproto.Message):
+    items: "list[LoadedModelInfo]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechRecognitionStateSeededDefaultIds(betterproto.Message):
+    items: "list[str]" = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechSynthesisAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_synthesis: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechSynthesisEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_synthesis: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class ReadableInformation(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_synthesis: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    text: str = betterproto.string_field(2)
+    piper_text: "str | None" = betterproto.string_field(3, optional=True)
+    picovoice_text: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechSynthesisReadTextAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_synthesis: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    information: "ReadableInformation" = betterproto.message_field(2)
+    speech_rate: "float | None" = betterproto.float_field(3, optional=True)
+    engine: "SpeechSynthesisEngineName | None" = betterproto.enum_field(
+        4, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SpeechSynthesisSetIsEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_synthesis: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_enabled: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechSynthesisSetPreferLocalAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_synthesis: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_enabled: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechSynthesisSynthesizeTextEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_synthesis: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    information: "ReadableInformation" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SpeechSynthesisState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_speech_synthesis: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_screen_reader_enabled: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_prefer_local_enabled: "bool | None" = betterproto.bool_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SshAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ssh: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SshUpdateStateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ssh: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_active: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_enabled: "bool | None" = betterproto.bool_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SshClearEnabledStateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ssh: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SshState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_ssh: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_active: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_enabled: "bool | None" = betterproto.bool_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SystemAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_system: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SystemMetricsUpdateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_system: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    cpu_percent: float = betterproto.float_field(2)
+    ram_percent: float = betterproto.float_field(3)
+    cpu_temperature_celsius: "float | None" = betterproto.float_field(4, optional=True)
+    cpu_temperature_display_value: "float | None" = betterproto.float_field(
+        5, optional=True
+    )
+    cpu_temperature_display_unit: "str | None" = betterproto.string_field(
+        6, optional=True
+    )
+    load_average_1: "float | None" = betterproto.float_field(7, optional=True)
+    load_average_5: "float | None" = betterproto.float_field(8, optional=True)
+    load_average_15: "float | None" = betterproto.float_field(9, optional=True)
+    boot_time: "float | None" = betterproto.float_field(10, optional=True)
+    network_upload_bps: "float | None" = betterproto.float_field(11, optional=True)
+    network_download_bps: "float | None" = betterproto.float_field(12, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SystemStorageUpdateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_system: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    disk_total_bytes: int = betterproto.int64_field(2)
+    disk_used_bytes: int = betterproto.int64_field(3)
+    disk_percent: float = betterproto.float_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ServiceUsage(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_system: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    cpu_percent: "float | None" = betterproto.float_field(2, optional=True)
+    cpu_seconds: "float | None" = betterproto.float_field(3, optional=True)
+    threads: "int | None" = betterproto.int64_field(4, optional=True)
+    allocated_bytes: "int | None" = betterproto.int64_field(5, optional=True)
+    allocated_blocks: "int | None" = betterproto.int64_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class SystemServiceUsageUpdateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_system: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    usage: "dict[str, ServiceUsage]" = betterproto.map_field(
+        2, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SystemEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_system: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SystemState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_system: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    cpu_percent: "float | None" = betterproto.float_field(2, optional=True)
+    ram_percent: "float | None" = betterproto.float_field(3, optional=True)
+    cpu_temperature_celsius: "float | None" = betterproto.float_field(4, optional=True)
+    cpu_temperature_display_value: "float | None" = betterproto.float_field(
+        5, optional=True
+    )
+    cpu_temperature_display_unit: "str | None" = betterproto.string_field(
+        6, optional=True
+    )
+    load_average_1: "float | None" = betterproto.float_field(7, optional=True)
+    load_average_5: "float | None" = betterproto.float_field(8, optional=True)
+    load_average_15: "float | None" = betterproto.float_field(9, optional=True)
+    boot_time: "float | None" = betterproto.float_field(10, optional=True)
+    disk_total_bytes: "int | None" = betterproto.int64_field(11, optional=True)
+    disk_used_bytes: "int | None" = betterproto.int64_field(12, optional=True)
+    disk_percent: "float | None" = betterproto.float_field(13, optional=True)
+    network_upload_bps: "float | None" = betterproto.float_field(14, optional=True)
+    network_download_bps: "float | None" = betterproto.float_field(15, optional=True)
+    service_usage: "SystemStateServiceUsageDict | None" = betterproto.message_field(
+        16, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SystemStateServiceUsageDict(betterproto.Message):
+    items: "dict[str, ServiceUsage]" = betterproto.map_field(
+        1, betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE
+    )
+
+
+@dataclass(eq=False, repr=False)
+class TailscaleAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_tailscale: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class TailscaleEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_tailscale: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class TailscaleStartDownloadingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_tailscale: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class TailscaleDoneDownloadingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_tailscale: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class TailscaleSetPendingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_tailscale: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class TailscaleSetStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_tailscale: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_installed: bool = betterproto.bool_field(2)
+    backend_state: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class TailscaleState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_tailscale: (
+        "str | None"
+    ) = betterproto.string_field(1000, optional=True)
+    is_downloading: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_installed: "bool | None" = betterproto.bool_field(3, optional=True)
+    is_active: "bool | None" = betterproto.bool_field(4, optional=True)
+    backend_state: "str | None" = betterproto.string_field(5, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UsersAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UsersSetUsersAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    users: "list[UserState]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UsersCreateUserAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UsersDeleteUserAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UsersResetPasswordAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UsersEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UsersCreateUserEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class UsersDeleteUserEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UsersResetPasswordEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UserState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    id: str = betterproto.string_field(2)
+    is_removable: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class UsersState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_users: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    users: "UsersStateUsers | None" = betterproto.message_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class UsersStateUsers(betterproto.Message):
+    items: "list[UserState]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeStartDownloadingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeDoneDownloadingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeSetPendingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeStatus(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_service_installed: bool = betterproto.bool_field(2)
+    is_running: bool = betterproto.bool_field(3)
+    name: "str | None" = betterproto.string_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeSetStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_binary_installed: bool = betterproto.bool_field(2)
+    is_logged_in: bool = betterproto.bool_field(3)
+    status: "VsCodeStatus | None" = betterproto.message_field(4, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeLoginEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeRestartEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class VsCodeState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_vscode: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_pending: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_downloading: "bool | None" = betterproto.bool_field(3, optional=True)
+    is_binary_installed: "bool | None" = betterproto.bool_field(4, optional=True)
+    is_logged_in: "bool | None" = betterproto.bool_field(5, optional=True)
+    status: "VsCodeStatus | None" = betterproto.message_field(6, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WebUiAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_web_ui: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebUiEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_web_ui: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WebUiInitializeEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_web_ui: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    description: "WebUiInputDescription" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebUiInputAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_web_ui: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    command: "WebUiInputCommand" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebUiInputEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_web_ui: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    command: "WebUiInputCommand" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WebUiState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_web_ui: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    active_inputs: "list[WebUiInputDescription]" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WiFiConnection(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    ssid: str = betterproto.string_field(2)
+    state: "ConnectionState | None" = betterproto.enum_field(3, optional=True)
+    signal_strength: "int | None" = betterproto.int64_field(4, optional=True)
+    password: "str | None" = betterproto.string_field(5, optional=True)
+    type: "WiFiType | None" = betterproto.enum_field(6, optional=True)
+    hidden: "bool | None" = betterproto.bool_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WiFiAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WiFiInputConnectionAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WiFiSetHasVisitedOnboardingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    has_visited_onboarding: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WiFiUpdateAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    connections: "list[WiFiConnection]" = betterproto.message_field(2)
+    state: "NetState" = betterproto.enum_field(3)
+    current_connection: "WiFiConnection | None" = betterproto.message_field(
+        4, optional=True
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WiFiUpdateRequestAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    reset: "bool | None" = betterproto.bool_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WiFiStartHotspotAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    mode: "str | None" = betterproto.string_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WiFiStopHotspotAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WiFiSetHotspotRunningAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_running: bool = betterproto.bool_field(2)
+    user_enabled: "bool | None" = betterproto.bool_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WiFiEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WiFiInputConnectionEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WiFiUpdateRequestEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WiFiStartHotspotEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    mode: "str | None" = betterproto.string_field(2, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WiFiStopHotspotEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WiFiState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wifi: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    connections: "WiFiStateConnections | None" = betterproto.message_field(
+        2, optional=True
+    )
+    state: "NetState" = betterproto.enum_field(3)
+    current_connection: "WiFiConnection | None" = betterproto.message_field(
+        4, optional=True
+    )
+    has_visited_onboarding: "bool | None" = betterproto.bool_field(5, optional=True)
+    is_hotspot_running: "bool | None" = betterproto.bool_field(6, optional=True)
+    hotspot_user_enabled: "bool | None" = betterproto.bool_field(7, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WiFiStateConnections(betterproto.Message):
+    items: "list[WiFiConnection]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingAccessPolicy(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    kind: "WyomingAccessPolicyKind" = betterproto.enum_field(2)
+    value: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingState(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    is_satellite_enabled: "bool | None" = betterproto.bool_field(2, optional=True)
+    is_engines_enabled: "bool | None" = betterproto.bool_field(3, optional=True)
+    access_policies: "WyomingStateAccessPolicies | None" = betterproto.message_field(
+        4, optional=True
+    )
+    is_zeroconf_enabled: "bool | None" = betterproto.bool_field(5, optional=True)
+    satellite_status: "WyomingSatelliteStatus | None" = betterproto.enum_field(
+        6, optional=True
+    )
+    satellite_client: "str | None" = betterproto.string_field(7, optional=True)
+    engines_status: "WyomingEnginesStatus | None" = betterproto.enum_field(
+        8, optional=True
+    )
+    active_engine_requests: "int | None" = betterproto.int64_field(9, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingStateAccessPolicies(betterproto.Message):
+    items: "list[WyomingAccessPolicy]" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WyomingSetSatelliteEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    enabled: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingSetEnginesEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    enabled: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingAddAccessPolicyAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    kind: "WyomingAccessPolicyKind" = betterproto.enum_field(2)
+    value: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingRemoveAccessPolicyAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    kind: "WyomingAccessPolicyKind" = betterproto.enum_field(2)
+    value: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingSetZeroconfEnabledAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    enabled: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingReportSatelliteStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    status: "WyomingSatelliteStatus" = betterproto.enum_field(2)
+    client: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingReportEnginesStatusAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    status: "WyomingEnginesStatus | None" = betterproto.enum_field(2, optional=True)
+    active_requests: "int | None" = betterproto.int64_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingSatelliteWakeAction(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    phrase: "str | None" = betterproto.string_field(2, optional=True)
+    detector: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class WyomingEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class WyomingSatelliteWakeEvent(betterproto.Message):
+    meta_field_package_name_ubo_app_dot_store_dot_services_dot_wyoming: "str | None" = (
+        betterproto.string_field(1000, optional=True)
+    )
+    phrase: "str | None" = betterproto.string_field(2, optional=True)
+    detector: "str | None" = betterproto.string_field(3, optional=True)
+
+
+@dataclass(eq=False, repr=False)
+class Action(betterproto.Message):
+    assistant_action: "AssistantAction" = betterproto.message_field(1, group="action")
+    assistant_add_eleven_labs_voice_action: "AssistantAddElevenLabsVoiceAction" = (
+        betterproto.message_field(2, group="action")
+    )
+    assistant_add_generic_llm_provider_action: (
+        "AssistantAddGenericLlmProviderAction"
+    ) = betterproto.message_field(3, group="action")
+    assistant_add_moonshine_downloaded_model_action: (
+        "AssistantAddMoonshineDownloadedModelAction"
+    ) = betterproto.message_field(4, group="action")
+    assistant_add_system_prompt_action: "AssistantAddSystemPromptAction" = (
+        betterproto.message_field(5, group="action")
+    )
+    assistant_cancel_request_action: "AssistantCancelRequestAction" = (
+        betterproto.message_field(6, group="action")
+    )
+    assistant_complete_action: "AssistantCompleteAction" = betterproto.message_field(
+        7, group="action"
+    )
+    assistant_delete_eleven_labs_voice_action: (
+        "AssistantDeleteElevenLabsVoiceAction"
+    ) = betterproto.message_field(8, group="action")
+    assistant_delete_kokoro_action: "AssistantDeleteKokoroAction" = (
+        betterproto.message_field(9, group="action")
+    )
+    assistant_delete_moonshine_model_action: "AssistantDeleteMoonshineModelAction" = (
+        betterproto.message_field(10, group="action")
+    )
+    assistant_delete_ollama_model_action: "AssistantDeleteOllamaModelAction" = (
+        betterproto.message_field(11, group="action")
+    )
+    assistant_delete_piper_voice_action: "AssistantDeletePiperVoiceAction" = (
+        betterproto.message_field(12, group="action")
+    )
+    assistant_delete_vosk_model_action: "AssistantDeleteVoskModelAction" = (
+        betterproto.message_field(13, group="action")
+    )
+    assistant_download_kokoro_action: "AssistantDownloadKokoroAction" = (
+        betterproto.message_field(14, group="action")
+    )
+    assistant_download_moonshine_model_action: (
+        "AssistantDownloadMoonshineModelAction"
+    ) = betterproto.message_field(15, group="action")
+    assistant_download_ollama_model_action: "AssistantDownloadOllamaModelAction" = (
+        betterproto.message_field(16, group="action")
+    )
+    assistant_download_piper_voice_action: "AssistantDownloadPiperVoiceAction" = (
+        betterproto.message_field(17, group="action")
+    )
+    assistant_download_vosk_model_action: "AssistantDownloadVoskModelAction" = (
+        betterproto.message_field(18, group="action")
+    )
+    assistant_remove_generic_llm_provider_action: (
+        "AssistantRemoveGenericLlmProviderAction"
+    ) = betterproto.message_field(19, group="action")
+    assistant_remove_moonshine_downloaded_model_action: (
+        "AssistantRemoveMoonshineDownloadedModelAction"
+    ) = betterproto.message_field(20, group="action")
+    assistant_remove_system_prompt_action: "AssistantRemoveSystemPromptAction" = (
+        betterproto.message_field(21, group="action")
+    )
+    assistant_report_action: "AssistantReportAction" = betterproto.message_field(
+        22, group="action"
+    )
+    assistant_run_pipeline_action: "AssistantRunPipelineAction" = (
+        betterproto.message_field(23, group="action")
+    )
+    assistant_select_generic_llm_provider_action: (
+        "AssistantSelectGenericLlmProviderAction"
+    ) = betterproto.message_field(24, group="action")
+    assistant_set_conversation_end_phrases_action: (
+        "AssistantSetConversationEndPhrasesAction"
+    ) = betterproto.message_field(25, group="action")
+    assistant_set_eleven_labs_available_voices_action: (
+        "AssistantSetElevenLabsAvailableVoicesAction"
+    ) = betterproto.message_field(26, group="action")
+    assistant_set_is_active_action: "AssistantSetIsActiveAction" = (
+        betterproto.message_field(27, group="action")
+    )
+    assistant_set_kokoro_downloaded_action: "AssistantSetKokoroDownloadedAction" = (
+        betterproto.message_field(28, group="action")
+    )
+    assistant_set_mistral_available_voices_action: (
+        "AssistantSetMistralAvailableVoicesAction"
+    ) = betterproto.message_field(29, group="action")
+    assistant_set_moonshine_downloading_action: (
+        "AssistantSetMoonshineDownloadingAction"
+    ) = betterproto.message_field(30, group="action")
+    assistant_set_ollama_downloaded_models_action: (
+        "AssistantSetOllamaDownloadedModelsAction"
+    ) = betterproto.message_field(31, group="action")
+    assistant_set_ollama_model_capabilities_action: (
+        "AssistantSetOllamaModelCapabilitiesAction"
+    ) = betterproto.message_field(32, group="action")
+    assistant_set_ollama_thinking_action: "AssistantSetOllamaThinkingAction" = (
+        betterproto.message_field(33, group="action")
+    )
+    assistant_set_piper_downloaded_voices_action: (
+        "AssistantSetPiperDownloadedVoicesAction"
+    ) = betterproto.message_field(34, group="action")
+    assistant_set_selected_image_generator_action: (
+        "AssistantSetSelectedImageGeneratorAction"
+    ) = betterproto.message_field(35, group="action")
+    assistant_set_selected_kokoro_voice_action: (
+        "AssistantSetSelectedKokoroVoiceAction"
+    ) = betterproto.message_field(36, group="action")
+    assistant_set_selected_llm_action: "AssistantSetSelectedLlmAction" = (
+        betterproto.message_field(37, group="action")
+    )
+    assistant_set_selected_model_action: "AssistantSetSelectedModelAction" = (
+        betterproto.message_field(38, group="action")
+    )
+    assistant_set_selected_moonshine_model_action: (
+        "AssistantSetSelectedMoonshineModelAction"
+    ) = betterproto.message_field(39, group="action")
+    assistant_set_selected_piper_voice_action: (
+        "AssistantSetSelectedPiperVoiceAction"
+    ) = betterproto.message_field(40, group="action")
+    assistant_set_selected_stt_action: "AssistantSetSelectedSttAction" = (
+        betterproto.message_field(41, group="action")
+    )
+    assistant_set_selected_tts_action: "AssistantSetSelectedTtsAction" = (
+        betterproto.message_field(42, group="action")
+    )
+    assistant_set_selected_voice_action: "AssistantSetSelectedVoiceAction" = (
+        betterproto.message_field(43, group="action")
+    )
+    assistant_set_selected_vosk_model_action: "AssistantSetSelectedVoskModelAction" = (
+        betterproto.message_field(44, group="action")
+    )
+    assistant_set_vosk_downloaded_models_action: (
+        "AssistantSetVoskDownloadedModelsAction"
+    ) = betterproto.message_field(45, group="action")
+    assistant_start_listening_action: "AssistantStartListeningAction" = (
+        betterproto.message_field(46, group="action")
+    )
+    assistant_stop_listening_action: "AssistantStopListeningAction" = (
+        betterproto.message_field(47, group="action")
+    )
+    assistant_stop_talking_action: "AssistantStopTalkingAction" = (
+        betterproto.message_field(48, group="action")
+    )
+    assistant_synthesize_action: "AssistantSynthesizeAction" = (
+        betterproto.message_field(49, group="action")
+    )
+    assistant_toggle_listening_action: "AssistantToggleListeningAction" = (
+        betterproto.message_field(50, group="action")
+    )
+    assistant_toggle_system_prompt_action: "AssistantToggleSystemPromptAction" = (
+        betterproto.message_field(51, group="action")
+    )
+    assistant_transcribe_action: "AssistantTranscribeAction" = (
+        betterproto.message_field(52, group="action")
+    )
+    assistant_update_providers_action: "AssistantUpdateProvidersAction" = (
+        betterproto.message_field(53, group="action")
+    )
+    audio_action: "AudioAction" = betterproto.message_field(54, group="action")
+    audio_change_volume_action: "AudioChangeVolumeAction" = betterproto.message_field(
+        55, group="action"
+    )
+    audio_install_driver_action: "AudioInstallDriverAction" = betterproto.message_field(
+        56, group="action"
+    )
+    audio_play_audio_sample_action: "AudioPlayAudioSampleAction" = (
+        betterproto.message_field(57, group="action")
+    )
+    audio_play_audio_sequence_action: "AudioPlayAudioSequenceAction" = (
+        betterproto.message_field(58, group="action")
+    )
+    audio_play_chime_action: "AudioPlayChimeAction" = betterproto.message_field(
+        59, group="action"
+    )
+    audio_play_recording_action: "AudioPlayRecordingAction" = betterproto.message_field(
+        60, group="action"
+    )
+    audio_playback_done_action: "AudioPlaybackDoneAction" = betterproto.message_field(
+        61, group="action"
+    )
+    audio_report_lineout_jack_action: "AudioReportLineoutJackAction" = (
+        betterproto.message_field(62, group="action")
+    )
+    audio_report_remote_capture_action: "AudioReportRemoteCaptureAction" = (
+        betterproto.message_field(63, group="action")
+    )
+    audio_report_sample_action: "AudioReportSampleAction" = betterproto.message_field(
+        64, group="action"
+    )
+    audio_select_output_action: "AudioSelectOutputAction" = betterproto.message_field(
+        65, group="action"
+    )
+    audio_set_lineout_auto_switch_action: "AudioSetLineoutAutoSwitchAction" = (
+        betterproto.message_field(66, group="action")
+    )
+    audio_set_mute_status_action: "AudioSetMuteStatusAction" = (
+        betterproto.message_field(67, group="action")
+    )
+    audio_set_volume_action: "AudioSetVolumeAction" = betterproto.message_field(
+        68, group="action"
+    )
+    audio_start_recording_action: "AudioStartRecordingAction" = (
+        betterproto.message_field(69, group="action")
+    )
+    audio_stop_playback_action: "AudioStopPlaybackAction" = betterproto.message_field(
+        70, group="action"
+    )
+    audio_stop_recording_action: "AudioStopRecordingAction" = betterproto.message_field(
+        71, group="action"
+    )
+    audio_toggle_mute_status_action: "AudioToggleMuteStatusAction" = (
+        betterproto.message_field(72, group="action")
+    )
+    audio_toggle_recording_action: "AudioToggleRecordingAction" = (
+        betterproto.message_field(73, group="action")
+    )
+    camera_action: "CameraAction" = betterproto.message_field(74, group="action")
+    camera_detect_action: "CameraDetectAction" = betterproto.message_field(
+        75, group="action"
+    )
+    camera_install_driver_action: "CameraInstallDriverAction" = (
+        betterproto.message_field(76, group="action")
+    )
+    camera_register_remote_action: "CameraRegisterRemoteAction" = (
+        betterproto.message_field(77, group="action")
+    )
+    camera_report_barcode_action: "CameraReportBarcodeAction" = (
+        betterproto.message_field(78, group="action")
+    )
+    camera_report_image_action: "CameraReportImageAction" = betterproto.message_field(
+        79, group="action"
+    )
+    camera_restore_default_action: "CameraRestoreDefaultAction" = (
+        betterproto.message_field(80, group="action")
+    )
+    camera_set_available_cameras_action: "CameraSetAvailableCamerasAction" = (
+        betterproto.message_field(81, group="action")
+    )
+    camera_set_index_action: "CameraSetIndexAction" = betterproto.message_field(
+        82, group="action"
+    )
+    camera_set_selected_source_action: "CameraSetSelectedSourceAction" = (
+        betterproto.message_field(83, group="action")
+    )
+    camera_start_viewfinder_action: "CameraStartViewfinderAction" = (
+        betterproto.message_field(84, group="action")
+    )
+    chat_action: "ChatAction" = betterproto.message_field(85, group="action")
+    chat_add_message_action: "ChatAddMessageAction" = betterproto.message_field(
+        86, group="action"
+    )
+    chat_append_to_message_action: "ChatAppendToMessageAction" = (
+        betterproto.message_field(87, group="action")
+    )
+    chat_clear_action: "ChatClearAction" = betterproto.message_field(88, group="action")
+    chat_end_session_action: "ChatEndSessionAction" = betterproto.message_field(
+        89, group="action"
+    )
+    chat_send_user_message_action: "ChatSendUserMessageAction" = (
+        betterproto.message_field(90, group="action")
+    )
+    chat_set_message_text_action: "ChatSetMessageTextAction" = (
+        betterproto.message_field(91, group="action")
+    )
+    chat_start_session_action: "ChatStartSessionAction" = betterproto.message_field(
+        92, group="action"
+    )
+    chat_toggle_audio_playback_action: "ChatToggleAudioPlaybackAction" = (
+        betterproto.message_field(93, group="action")
+    )
+    clear_dynamic_menu_action: "ClearDynamicMenuAction" = betterproto.message_field(
+        94, group="action"
+    )
+    close_application_action: "CloseApplicationAction" = betterproto.message_field(
+        95, group="action"
+    )
+    close_instruction_action: "CloseInstructionAction" = betterproto.message_field(
+        96, group="action"
+    )
+    deregister_regular_app_action: "DeregisterRegularAppAction" = (
+        betterproto.message_field(97, group="action")
+    )
+    display_action: "DisplayAction" = betterproto.message_field(98, group="action")
+    display_blank_action: "DisplayBlankAction" = betterproto.message_field(
+        99, group="action"
+    )
+    display_pause_action: "DisplayPauseAction" = betterproto.message_field(
+        100, group="action"
+    )
+    display_redraw_action: "DisplayRedrawAction" = betterproto.message_field(
+        101, group="action"
+    )
+    display_resume_action: "DisplayResumeAction" = betterproto.message_field(
+        102, group="action"
+    )
+    display_set_blank_timeout_action: "DisplaySetBlankTimeoutAction" = (
+        betterproto.message_field(103, group="action")
+    )
+    display_unblank_action: "DisplayUnblankAction" = betterproto.message_field(
+        104, group="action"
+    )
+    display_update_activity_action: "DisplayUpdateActivityAction" = (
+        betterproto.message_field(105, group="action")
+    )
+    docker_action: "DockerAction" = betterproto.message_field(106, group="action")
+    docker_image_action: "DockerImageAction" = betterproto.message_field(
+        107, group="action"
+    )
+    docker_image_fetch_action: "DockerImageFetchAction" = betterproto.message_field(
+        108, group="action"
+    )
+    docker_image_release_action: "DockerImageReleaseAction" = betterproto.message_field(
+        109, group="action"
+    )
+    docker_image_remove_action: "DockerImageRemoveAction" = betterproto.message_field(
+        110, group="action"
+    )
+    docker_image_remove_container_action: "DockerImageRemoveContainerAction" = (
+        betterproto.message_field(111, group="action")
+    )
+    docker_image_report_exit_action: "DockerImageReportExitAction" = (
+        betterproto.message_field(112, group="action")
+    )
+    docker_image_run_action: "DockerImageRunAction" = betterproto.message_field(
+        113, group="action"
+    )
+    docker_image_set_docker_id_action: "DockerImageSetDockerIdAction" = (
+        betterproto.message_field(114, group="action")
+    )
+    docker_image_set_expose_to_lan_action: "DockerImageSetExposeToLanAction" = (
+        betterproto.message_field(115, group="action")
+    )
+    docker_image_set_status_action: "DockerImageSetStatusAction" = (
+        betterproto.message_field(116, group="action")
+    )
+    docker_image_stop_action: "DockerImageStopAction" = betterproto.message_field(
+        117, group="action"
+    )
+    docker_image_update_metadata_action: "DockerImageUpdateMetadataAction" = (
+        betterproto.message_field(118, group="action")
+    )
+    docker_install_action: "DockerInstallAction" = betterproto.message_field(
+        119, group="action"
+    )
+    docker_remove_username_action: "DockerRemoveUsernameAction" = (
+        betterproto.message_field(120, group="action")
+    )
+    docker_set_app_status_action: "DockerSetAppStatusAction" = (
+        betterproto.message_field(121, group="action")
+    )
+    docker_set_host_network_action: "DockerSetHostNetworkAction" = (
+        betterproto.message_field(122, group="action")
+    )
+    docker_set_status_action: "DockerSetStatusAction" = betterproto.message_field(
+        123, group="action"
+    )
+    docker_set_zigbee_intent_action: "DockerSetZigbeeIntentAction" = (
+        betterproto.message_field(124, group="action")
+    )
+    docker_start_action: "DockerStartAction" = betterproto.message_field(
+        125, group="action"
+    )
+    docker_stop_action: "DockerStopAction" = betterproto.message_field(
+        126, group="action"
+    )
+    docker_store_username_action: "DockerStoreUsernameAction" = (
+        betterproto.message_field(127, group="action")
+    )
+    dynamic_menu_action: "DynamicMenuAction" = betterproto.message_field(
+        128, group="action"
+    )
+    execute_menu_action_action: "ExecuteMenuActionAction" = betterproto.message_field(
+        129, group="action"
+    )
+    file_download_action: "FileDownloadAction" = betterproto.message_field(
+        130, group="action"
+    )
+    file_download_ready_action: "FileDownloadReadyAction" = betterproto.message_field(
+        131, group="action"
+    )
+    file_download_request_action: "FileDownloadRequestAction" = (
+        betterproto.message_field(132, group="action")
+    )
+    file_system_action: "FileSystemAction" = betterproto.message_field(
+        133, group="action"
+    )
+    file_system_copy_action: "FileSystemCopyAction" = betterproto.message_field(
+        134, group="action"
+    )
+    file_system_move_action: "FileSystemMoveAction" = betterproto.message_field(
+        135, group="action"
+    )
+    file_system_remove_action: "FileSystemRemoveAction" = betterproto.message_field(
+        136, group="action"
+    )
+    file_system_report_selection_action: "FileSystemReportSelectionAction" = (
+        betterproto.message_field(137, group="action")
+    )
+    file_system_selector_pushed_action: "FileSystemSelectorPushedAction" = (
+        betterproto.message_field(138, group="action")
+    )
+    file_upload_action: "FileUploadAction" = betterproto.message_field(
+        139, group="action"
+    )
+    file_upload_chunk_action: "FileUploadChunkAction" = betterproto.message_field(
+        140, group="action"
+    )
+    file_upload_complete_action: "FileUploadCompleteAction" = betterproto.message_field(
+        141, group="action"
+    )
+    file_upload_start_action: "FileUploadStartAction" = betterproto.message_field(
+        142, group="action"
+    )
+    infrared_action: "InfraredAction" = betterproto.message_field(143, group="action")
+    infrared_add_device_action: "InfraredAddDeviceAction" = betterproto.message_field(
+        144, group="action"
+    )
+    infrared_handle_received_code_action: "InfraredHandleReceivedCodeAction" = (
+        betterproto.message_field(145, group="action")
+    )
+    infrared_register_device_action: "InfraredRegisterDeviceAction" = (
+        betterproto.message_field(146, group="action")
+    )
+    infrared_remove_device_action: "InfraredRemoveDeviceAction" = (
+        betterproto.message_field(147, group="action")
+    )
+    infrared_send_code_action: "InfraredSendCodeAction" = betterproto.message_field(
+        148, group="action"
+    )
+    infrared_set_is_registering_device_action: (
+        "InfraredSetIsRegisteringDeviceAction"
+    ) = betterproto.message_field(149, group="action")
+    infrared_set_should_propagate_action: "InfraredSetShouldPropagateAction" = (
+        betterproto.message_field(150, group="action")
+    )
+    infrared_set_should_receive_action: "InfraredSetShouldReceiveAction" = (
+        betterproto.message_field(151, group="action")
+    )
+    input_action: "InputAction" = betterproto.message_field(152, group="action")
+    input_cancel_action: "InputCancelAction" = betterproto.message_field(
+        153, group="action"
+    )
+    input_demand_action: "InputDemandAction" = betterproto.message_field(
+        154, group="action"
+    )
+    input_provide_action: "InputProvideAction" = betterproto.message_field(
+        155, group="action"
+    )
+    input_resolve_action: "InputResolveAction" = betterproto.message_field(
+        156, group="action"
+    )
+    ip_action: "IpAction" = betterproto.message_field(157, group="action")
+    ip_set_is_connected_action: "IpSetIsConnectedAction" = betterproto.message_field(
+        158, group="action"
+    )
+    ip_update_interfaces_action: "IpUpdateInterfacesAction" = betterproto.message_field(
+        159, group="action"
+    )
+    keypad_action: "KeypadAction" = betterproto.message_field(160, group="action")
+    keypad_key_hold_action: "KeypadKeyHoldAction" = betterproto.message_field(
+        161, group="action"
+    )
+    keypad_key_press_action: "KeypadKeyPressAction" = betterproto.message_field(
+        162, group="action"
+    )
+    keypad_key_release_action: "KeypadKeyReleaseAction" = betterproto.message_field(
+        163, group="action"
+    )
+    keypad_key_unhold_action: "KeypadKeyUnholdAction" = betterproto.message_field(
+        164, group="action"
+    )
+    keypad_report_context_action: "KeypadReportContextAction" = (
+        betterproto.message_field(165, group="action")
+    )
+    kiosk_action: "KioskAction" = betterproto.message_field(166, group="action")
+    kiosk_add_dashboard_action: "KioskAddDashboardAction" = betterproto.message_field(
+        167, group="action"
+    )
+    kiosk_clear_enabled_state_action: "KioskClearEnabledStateAction" = (
+        betterproto.message_field(168, group="action")
+    )
+    kiosk_delete_dashboard_action: "KioskDeleteDashboardAction" = (
+        betterproto.message_field(169, group="action")
+    )
+    kiosk_rotate_port_action: "KioskRotatePortAction" = betterproto.message_field(
+        170, group="action"
+    )
+    kiosk_set_port_selection_action: "KioskSetPortSelectionAction" = (
+        betterproto.message_field(171, group="action")
+    )
+    kiosk_update_state_action: "KioskUpdateStateAction" = betterproto.message_field(
+        172, group="action"
+    )
+    light_dm_action: "LightDmAction" = betterproto.message_field(173, group="action")
+    light_dm_clear_enabled_state_action: "LightDmClearEnabledStateAction" = (
+        betterproto.message_field(174, group="action")
+    )
+    light_dm_update_state_action: "LightDmUpdateStateAction" = (
+        betterproto.message_field(175, group="action")
+    )
+    localization_action: "LocalizationAction" = betterproto.message_field(
+        176, group="action"
+    )
+    localization_refresh_weather_action: "LocalizationRefreshWeatherAction" = (
+        betterproto.message_field(177, group="action")
+    )
+    localization_reset_location_action: "LocalizationResetLocationAction" = (
+        betterproto.message_field(178, group="action")
+    )
+    localization_set_language_action: "LocalizationSetLanguageAction" = (
+        betterproto.message_field(179, group="action")
+    )
+    localization_set_location_action: "LocalizationSetLocationAction" = (
+        betterproto.message_field(180, group="action")
+    )
+    localization_set_unit_system_action: "LocalizationSetUnitSystemAction" = (
+        betterproto.message_field(181, group="action")
+    )
+    localization_speak_date_action: "LocalizationSpeakDateAction" = (
+        betterproto.message_field(182, group="action")
+    )
+    localization_speak_time_action: "LocalizationSpeakTimeAction" = (
+        betterproto.message_field(183, group="action")
+    )
+    localization_speak_weather_action: "LocalizationSpeakWeatherAction" = (
+        betterproto.message_field(184, group="action")
+    )
+    localization_update_clock_action: "LocalizationUpdateClockAction" = (
+        betterproto.message_field(185, group="action")
+    )
+    localization_update_weather_action: "LocalizationUpdateWeatherAction" = (
+        betterproto.message_field(186, group="action")
+    )
+    main_action: "MainAction" = betterproto.message_field(187, group="action")
+    mcp_action: "McpAction" = betterproto.message_field(188, group="action")
+    mcp_add_server_action: "McpAddServerAction" = betterproto.message_field(
+        189, group="action"
+    )
+    mcp_delete_server_action: "McpDeleteServerAction" = betterproto.message_field(
+        190, group="action"
+    )
+    mcp_set_server_status_action: "McpSetServerStatusAction" = (
+        betterproto.message_field(191, group="action")
+    )
+    mcp_set_servers_action: "McpSetServersAction" = betterproto.message_field(
+        192, group="action"
+    )
+    mcp_sync_servers_action: "McpSyncServersAction" = betterproto.message_field(
+        193, group="action"
+    )
+    mcp_toggle_server_action: "McpToggleServerAction" = betterproto.message_field(
+        194, group="action"
+    )
+    menu_action: "MenuAction" = betterproto.message_field(195, group="action")
+    menu_choose_by_icon_action: "MenuChooseByIconAction" = betterproto.message_field(
+        196, group="action"
+    )
+    menu_choose_by_index_action: "MenuChooseByIndexAction" = betterproto.message_field(
+        197, group="action"
+    )
+    menu_choose_by_label_action: "MenuChooseByLabelAction" = betterproto.message_field(
+        198, group="action"
+    )
+    menu_go_back_action: "MenuGoBackAction" = betterproto.message_field(
+        199, group="action"
+    )
+    menu_go_home_action: "MenuGoHomeAction" = betterproto.message_field(
+        200, group="action"
+    )
+    menu_scroll_action: "MenuScrollAction" = betterproto.message_field(
+        201, group="action"
+    )
+    mqtt_action: "MqttAction" = betterproto.message_field(202, group="action")
+    mqtt_bundled_credentials_changed_action: "MqttBundledCredentialsChangedAction" = (
+        betterproto.message_field(203, group="action")
+    )
+    mqtt_publish_action: "MqttPublishAction" = betterproto.message_field(
+        204, group="action"
+    )
+    mqtt_request_announce_action: "MqttRequestAnnounceAction" = (
+        betterproto.message_field(205, group="action")
+    )
+    mqtt_set_allow_remote_control_action: "MqttSetAllowRemoteControlAction" = (
+        betterproto.message_field(206, group="action")
+    )
+    mqtt_set_broker_action: "MqttSetBrokerAction" = betterproto.message_field(
+        207, group="action"
+    )
+    mqtt_set_bundled_expose_to_lan_action: "MqttSetBundledExposeToLanAction" = (
+        betterproto.message_field(208, group="action")
+    )
+    mqtt_set_enabled_action: "MqttSetEnabledAction" = betterproto.message_field(
+        209, group="action"
+    )
+    mqtt_set_published_components_action: "MqttSetPublishedComponentsAction" = (
+        betterproto.message_field(210, group="action")
+    )
+    mqtt_set_status_action: "MqttSetStatusAction" = betterproto.message_field(
+        211, group="action"
+    )
+    notifications_action: "NotificationsAction" = betterproto.message_field(
+        212, group="action"
+    )
+    notifications_add_action: "NotificationsAddAction" = betterproto.message_field(
+        213, group="action"
+    )
+    notifications_clear_action: "NotificationsClearAction" = betterproto.message_field(
+        214, group="action"
+    )
+    notifications_clear_all_action: "NotificationsClearAllAction" = (
+        betterproto.message_field(215, group="action")
+    )
+    notifications_clear_by_id_action: "NotificationsClearByIdAction" = (
+        betterproto.message_field(216, group="action")
+    )
+    notifications_display_action: "NotificationsDisplayAction" = (
+        betterproto.message_field(217, group="action")
+    )
+    open_application_action: "OpenApplicationAction" = betterproto.message_field(
+        218, group="action"
+    )
+    open_render_action: "OpenRenderAction" = betterproto.message_field(
+        219, group="action"
+    )
+    power_action: "PowerAction" = betterproto.message_field(220, group="action")
+    power_off_action: "PowerOffAction" = betterproto.message_field(221, group="action")
+    r_pi_connect_action: "RPiConnectAction" = betterproto.message_field(
+        222, group="action"
+    )
+    r_pi_connect_done_downloading_action: "RPiConnectDoneDownloadingAction" = (
+        betterproto.message_field(223, group="action")
+    )
+    r_pi_connect_set_pending_action: "RPiConnectSetPendingAction" = (
+        betterproto.message_field(224, group="action")
+    )
+    r_pi_connect_set_status_action: "RPiConnectSetStatusAction" = (
+        betterproto.message_field(225, group="action")
+    )
+    r_pi_connect_start_downloading_action: "RPiConnectStartDownloadingAction" = (
+        betterproto.message_field(226, group="action")
+    )
+    r_pi_connect_update_service_state_action: "RPiConnectUpdateServiceStateAction" = (
+        betterproto.message_field(227, group="action")
+    )
+    reboot_action: "RebootAction" = betterproto.message_field(228, group="action")
+    register_app_action: "RegisterAppAction" = betterproto.message_field(
+        229, group="action"
+    )
+    register_regular_app_action: "RegisterRegularAppAction" = betterproto.message_field(
+        230, group="action"
+    )
+    register_setting_app_action: "RegisterSettingAppAction" = betterproto.message_field(
+        231, group="action"
+    )
+    replay_recorded_sequence_action: "ReplayRecordedSequenceAction" = (
+        betterproto.message_field(232, group="action")
+    )
+    report_replaying_done_action: "ReportReplayingDoneAction" = (
+        betterproto.message_field(233, group="action")
+    )
+    rgb_ring_action: "RgbRingAction" = betterproto.message_field(234, group="action")
+    rgb_ring_blank_action: "RgbRingBlankAction" = betterproto.message_field(
+        235, group="action"
+    )
+    rgb_ring_blink_action: "RgbRingBlinkAction" = betterproto.message_field(
+        236, group="action"
+    )
+    rgb_ring_colorful_command_action: "RgbRingColorfulCommandAction" = (
+        betterproto.message_field(237, group="action")
+    )
+    rgb_ring_command_action: "RgbRingCommandAction" = betterproto.message_field(
+        238, group="action"
+    )
+    rgb_ring_fill_downfrom_action: "RgbRingFillDownfromAction" = (
+        betterproto.message_field(239, group="action")
+    )
+    rgb_ring_fill_upto_action: "RgbRingFillUptoAction" = betterproto.message_field(
+        240, group="action"
+    )
+    rgb_ring_progress_wheel_action: "RgbRingProgressWheelAction" = (
+        betterproto.message_field(241, group="action")
+    )
+    rgb_ring_progress_wheel_step_action: "RgbRingProgressWheelStepAction" = (
+        betterproto.message_field(242, group="action")
+    )
+    rgb_ring_pulse_action: "RgbRingPulseAction" = betterproto.message_field(
+        243, group="action"
+    )
+    rgb_ring_rainbow_action: "RgbRingRainbowAction" = betterproto.message_field(
+        244, group="action"
+    )
+    rgb_ring_sequence_action: "RgbRingSequenceAction" = betterproto.message_field(
+        245, group="action"
+    )
+    rgb_ring_set_all_action: "RgbRingSetAllAction" = betterproto.message_field(
+        246, group="action"
+    )
+    rgb_ring_set_brightness_action: "RgbRingSetBrightnessAction" = (
+        betterproto.message_field(247, group="action")
+    )
+    rgb_ring_set_enabled_action: "RgbRingSetEnabledAction" = betterproto.message_field(
+        248, group="action"
+    )
+    rgb_ring_set_is_busy_action: "RgbRingSetIsBusyAction" = betterproto.message_field(
+        249, group="action"
+    )
+    rgb_ring_spinning_wheel_action: "RgbRingSpinningWheelAction" = (
+        betterproto.message_field(250, group="action")
+    )
+    rgb_ring_waitable_command_action: "RgbRingWaitableCommandAction" = (
+        betterproto.message_field(251, group="action")
+    )
+    ssh_action: "SshAction" = betterproto.message_field(252, group="action")
+    ssh_clear_enabled_state_action: "SshClearEnabledStateAction" = (
+        betterproto.message_field(253, group="action")
+    )
+    ssh_update_state_action: "SshUpdateStateAction" = betterproto.message_field(
+        254, group="action"
+    )
+    screenshot_data_action: "ScreenshotDataAction" = betterproto.message_field(
+        255, group="action"
+    )
+    sensors_action: "SensorsAction" = betterproto.message_field(256, group="action")
+    sensors_report_device_readings_action: "SensorsReportDeviceReadingsAction" = (
+        betterproto.message_field(257, group="action")
+    )
+    sensors_report_reading_action: "SensorsReportReadingAction" = (
+        betterproto.message_field(258, group="action")
+    )
+    sensors_report_readings_action: "SensorsReportReadingsAction" = (
+        betterproto.message_field(259, group="action")
+    )
+    sensors_scan_action: "SensorsScanAction" = betterproto.message_field(
+        260, group="action"
+    )
+    sensors_scan_completed_action: "SensorsScanCompletedAction" = (
+        betterproto.message_field(261, group="action")
+    )
+    set_are_enclosures_visible_action: "SetAreEnclosuresVisibleAction" = (
+        betterproto.message_field(262, group="action")
+    )
+    set_local_overlay_open_action: "SetLocalOverlayOpenAction" = (
+        betterproto.message_field(263, group="action")
+    )
+    settings_action: "SettingsAction" = betterproto.message_field(264, group="action")
+    settings_clear_service_errors_action: "SettingsClearServiceErrorsAction" = (
+        betterproto.message_field(265, group="action")
+    )
+    settings_dump_store_trace_action: "SettingsDumpStoreTraceAction" = (
+        betterproto.message_field(266, group="action")
+    )
+    settings_report_service_error_action: "SettingsReportServiceErrorAction" = (
+        betterproto.message_field(267, group="action")
+    )
+    settings_report_store_trace_action: "SettingsReportStoreTraceAction" = (
+        betterproto.message_field(268, group="action")
+    )
+    settings_service_action: "SettingsServiceAction" = betterproto.message_field(
+        269, group="action"
+    )
+    settings_service_set_is_enabled_action: "SettingsServiceSetIsEnabledAction" = (
+        betterproto.message_field(270, group="action")
+    )
+    settings_service_set_log_level_action: "SettingsServiceSetLogLevelAction" = (
+        betterproto.message_field(271, group="action")
+    )
+    settings_service_set_should_restart_action: (
+        "SettingsServiceSetShouldRestartAction"
+    ) = betterproto.message_field(272, group="action")
+    settings_service_set_status_action: "SettingsServiceSetStatusAction" = (
+        betterproto.message_field(273, group="action")
+    )
+    settings_set_services_action: "SettingsSetServicesAction" = (
+        betterproto.message_field(274, group="action")
+    )
+    settings_start_service_action: "SettingsStartServiceAction" = (
+        betterproto.message_field(275, group="action")
+    )
+    settings_stop_service_action: "SettingsStopServiceAction" = (
+        betterproto.message_field(276, group="action")
+    )
+    settings_toggle_assistant_debug_action: "SettingsToggleAssistantDebugAction" = (
+        betterproto.message_field(277, group="action")
+    )
+    settings_toggle_beta_versions_action: "SettingsToggleBetaVersionsAction" = (
+        betterproto.message_field(278, group="action")
+    )
+    settings_toggle_grpc_remote_access_action: (
+        "SettingsToggleGrpcRemoteAccessAction"
+    ) = betterproto.message_field(279, group="action")
+    settings_toggle_pdb_signal_action: "SettingsTogglePdbSignalAction" = (
+        betterproto.message_field(280, group="action")
+    )
+    settings_toggle_store_tracing_action: "SettingsToggleStoreTracingAction" = (
+        betterproto.message_field(281, group="action")
+    )
+    settings_toggle_tcp_lite_action: "SettingsToggleTcpLiteAction" = (
+        betterproto.message_field(282, group="action")
+    )
+    settings_toggle_visual_debug_action: "SettingsToggleVisualDebugAction" = (
+        betterproto.message_field(283, group="action")
+    )
+    speech_recognition_action: "SpeechRecognitionAction" = betterproto.message_field(
+        284, group="action"
+    )
+    speech_recognition_add_command_action: "SpeechRecognitionAddCommandAction" = (
+        betterproto.message_field(285, group="action")
+    )
+    speech_recognition_remove_command_action: "SpeechRecognitionRemoveCommandAction" = (
+        betterproto.message_field(286, group="action")
+    )
+    speech_recognition_report_intent_detection_action: (
+        "SpeechRecognitionReportIntentDetectionAction"
+    ) = betterproto.message_field(287, group="action")
+    speech_recognition_report_intent_timeout_action: (
+        "SpeechRecognitionReportIntentTimeoutAction"
+    ) = betterproto.message_field(288, group="action")
+    speech_recognition_report_speech_action: "SpeechRecognitionReportSpeechAction" = (
+        betterproto.message_field(289, group="action")
+    )
+    speech_recognition_report_wake_word_detection_action: (
+        "SpeechRecognitionReportWakeWordDetectionAction"
+    ) = betterproto.message_field(290, group="action")
+    speech_recognition_run_command_action: "SpeechRecognitionRunCommandAction" = (
+        betterproto.message_field(291, group="action")
+    )
+    speech_recognition_set_assistant_enabled_action: (
+        "SpeechRecognitionSetAssistantEnabledAction"
+    ) = betterproto.message_field(292, group="action")
+    speech_recognition_set_assistant_listening_action: (
+        "SpeechRecognitionSetAssistantListeningAction"
+    ) = betterproto.message_field(293, group="action")
+    speech_recognition_set_conversation_end_phrases_action: (
+        "SpeechRecognitionSetConversationEndPhrasesAction"
+    ) = betterproto.message_field(294, group="action")
+    speech_recognition_set_loaded_models_action: (
+        "SpeechRecognitionSetLoadedModelsAction"
+    ) = betterproto.message_field(295, group="action")
+    speech_recognition_set_wake_mode_enabled_action: (
+        "SpeechRecognitionSetWakeModeEnabledAction"
+    ) = betterproto.message_field(296, group="action")
+    speech_recognition_trigger_mode_action: "SpeechRecognitionTriggerModeAction" = (
+        betterproto.message_field(297, group="action")
+    )
+    speech_recognition_update_command_action: "SpeechRecognitionUpdateCommandAction" = (
+        betterproto.message_field(298, group="action")
+    )
+    speech_synthesis_action: "SpeechSynthesisAction" = betterproto.message_field(
+        299, group="action"
+    )
+    speech_synthesis_read_text_action: "SpeechSynthesisReadTextAction" = (
+        betterproto.message_field(300, group="action")
+    )
+    speech_synthesis_set_is_enabled_action: "SpeechSynthesisSetIsEnabledAction" = (
+        betterproto.message_field(301, group="action")
+    )
+    speech_synthesis_set_prefer_local_action: "SpeechSynthesisSetPreferLocalAction" = (
+        betterproto.message_field(302, group="action")
+    )
+    stack_action: "StackAction" = betterproto.message_field(303, group="action")
+    stack_pop_action: "StackPopAction" = betterproto.message_field(304, group="action")
+    stack_pop_chat_action: "StackPopChatAction" = betterproto.message_field(
+        305, group="action"
+    )
+    stack_pop_item_action: "StackPopItemAction" = betterproto.message_field(
+        306, group="action"
+    )
+    stack_pop_notification_action: "StackPopNotificationAction" = (
+        betterproto.message_field(307, group="action")
+    )
+    stack_pop_to_root_action: "StackPopToRootAction" = betterproto.message_field(
+        308, group="action"
+    )
+    stack_push_application_action: "StackPushApplicationAction" = (
+        betterproto.message_field(309, group="action")
+    )
+    stack_push_chat_action: "StackPushChatAction" = betterproto.message_field(
+        310, group="action"
+    )
+    stack_push_instruction_action: "StackPushInstructionAction" = (
+        betterproto.message_field(311, group="action")
+    )
+    stack_push_menu_action: "StackPushMenuAction" = betterproto.message_field(
+        312, group="action"
+    )
+    stack_push_notification_action: "StackPushNotificationAction" = (
+        betterproto.message_field(313, group="action")
+    )
+    stack_push_prompt_action: "StackPushPromptAction" = betterproto.message_field(
+        314, group="action"
+    )
+    stack_push_render_action: "StackPushRenderAction" = betterproto.message_field(
+        315, group="action"
+    )
+    stack_set_page_index_action: "StackSetPageIndexAction" = betterproto.message_field(
+        316, group="action"
+    )
+    status_icons_action: "StatusIconsAction" = betterproto.message_field(
+        317, group="action"
+    )
+    status_icons_register_action: "StatusIconsRegisterAction" = (
+        betterproto.message_field(318, group="action")
+    )
+    system_action: "SystemAction" = betterproto.message_field(319, group="action")
+    system_metrics_update_action: "SystemMetricsUpdateAction" = (
+        betterproto.message_field(320, group="action")
+    )
+    system_service_usage_update_action: "SystemServiceUsageUpdateAction" = (
+        betterproto.message_field(321, group="action")
+    )
+    system_storage_update_action: "SystemStorageUpdateAction" = (
+        betterproto.message_field(322, group="action")
+    )
+    tailscale_action: "TailscaleAction" = betterproto.message_field(323, group="action")
+    tailscale_done_downloading_action: "TailscaleDoneDownloadingAction" = (
+        betterproto.message_field(324, group="action")
+    )
+    tailscale_set_pending_action: "TailscaleSetPendingAction" = (
+        betterproto.message_field(325, group="action")
+    )
+    tailscale_set_status_action: "TailscaleSetStatusAction" = betterproto.message_field(
+        326, group="action"
+    )
+    tailscale_start_downloading_action: "TailscaleStartDownloadingAction" = (
+        betterproto.message_field(327, group="action")
+    )
+    take_screenshot_action: "TakeScreenshotAction" = betterproto.message_field(
+        328, group="action"
+    )
+    toggle_recording_action: "ToggleRecordingAction" = betterproto.message_field(
+        329, group="action"
+    )
+    update_application_kwargs_action: "UpdateApplicationKwargsAction" = (
+        betterproto.message_field(330, group="action")
+    )
+    update_current_view_action: "UpdateCurrentViewAction" = betterproto.message_field(
+        331, group="action"
+    )
+    update_dynamic_menu_action: "UpdateDynamicMenuAction" = betterproto.message_field(
+        332, group="action"
+    )
+    update_instruction_progress_action: "UpdateInstructionProgressAction" = (
+        betterproto.message_field(333, group="action")
+    )
+    update_manager_action: "UpdateManagerAction" = betterproto.message_field(
+        334, group="action"
+    )
+    update_manager_report_failed_check_action: (
+        "UpdateManagerReportFailedCheckAction"
+    ) = betterproto.message_field(335, group="action")
+    update_manager_request_check_action: "UpdateManagerRequestCheckAction" = (
+        betterproto.message_field(336, group="action")
+    )
+    update_manager_request_update_action: "UpdateManagerRequestUpdateAction" = (
+        betterproto.message_field(337, group="action")
+    )
+    update_manager_set_versions_action: "UpdateManagerSetVersionsAction" = (
+        betterproto.message_field(338, group="action")
+    )
+    update_prompt_action: "UpdatePromptAction" = betterproto.message_field(
+        339, group="action"
+    )
+    update_registered_app_action: "UpdateRegisteredAppAction" = (
+        betterproto.message_field(340, group="action")
+    )
+    update_render_props_action: "UpdateRenderPropsAction" = betterproto.message_field(
+        341, group="action"
+    )
+    users_action: "UsersAction" = betterproto.message_field(342, group="action")
+    users_create_user_action: "UsersCreateUserAction" = betterproto.message_field(
+        343, group="action"
+    )
+    users_delete_user_action: "UsersDeleteUserAction" = betterproto.message_field(
+        344, group="action"
+    )
+    users_reset_password_action: "UsersResetPasswordAction" = betterproto.message_field(
+        345, group="action"
+    )
+    users_set_users_action: "UsersSetUsersAction" = betterproto.message_field(
+        346, group="action"
+    )
+    vs_code_action: "VsCodeAction" = betterproto.message_field(347, group="action")
+    vs_code_done_downloading_action: "VsCodeDoneDownloadingAction" = (
+        betterproto.message_field(348, group="action")
+    )
+    vs_code_set_pending_action: "VsCodeSetPendingAction" = betterproto.message_field(
+        349, group="action"
+    )
+    vs_code_set_status_action: "VsCodeSetStatusAction" = betterproto.message_field(
+        350, group="action"
+    )
+    vs_code_start_downloading_action: "VsCodeStartDownloadingAction" = (
+        betterproto.message_field(351, group="action")
+    )
+    wake_engine_set_enabled_action: "WakeEngineSetEnabledAction" = (
+        betterproto.message_field(352, group="action")
+    )
+    wake_trigger_add_action: "WakeTriggerAddAction" = betterproto.message_field(
+        353, group="action"
+    )
+    wake_trigger_remove_action: "WakeTriggerRemoveAction" = betterproto.message_field(
+        354, group="action"
+    )
+    wake_word_delete_model_action: "WakeWordDeleteModelAction" = (
+        betterproto.message_field(355, group="action")
+    )
+    wake_word_download_model_action: "WakeWordDownloadModelAction" = (
+        betterproto.message_field(356, group="action")
+    )
+    wake_word_download_models_action: "WakeWordDownloadModelsAction" = (
+        betterproto.message_field(357, group="action")
+    )
+    wake_word_set_available_models_action: "WakeWordSetAvailableModelsAction" = (
+        betterproto.message_field(358, group="action")
+    )
+    wake_word_set_models_status_action: "WakeWordSetModelsStatusAction" = (
+        betterproto.message_field(359, group="action")
+    )
+    web_ui_action: "WebUiAction" = betterproto.message_field(360, group="action")
+    web_ui_input_action: "WebUiInputAction" = betterproto.message_field(
+        361, group="action"
+    )
+    wi_fi_action: "WiFiAction" = betterproto.message_field(362, group="action")
+    wi_fi_input_connection_action: "WiFiInputConnectionAction" = (
+        betterproto.message_field(363, group="action")
+    )
+    wi_fi_set_has_visited_onboarding_action: "WiFiSetHasVisitedOnboardingAction" = (
+        betterproto.message_field(364, group="action")
+    )
+    wi_fi_set_hotspot_running_action: "WiFiSetHotspotRunningAction" = (
+        betterproto.message_field(365, group="action")
+    )
+    wi_fi_start_hotspot_action: "WiFiStartHotspotAction" = betterproto.message_field(
+        366, group="action"
+    )
+    wi_fi_stop_hotspot_action: "WiFiStopHotspotAction" = betterproto.message_field(
+        367, group="action"
+    )
+    wi_fi_update_action: "WiFiUpdateAction" = betterproto.message_field(
+        368, group="action"
+    )
+    wi_fi_update_request_action: "WiFiUpdateRequestAction" = betterproto.message_field(
+        369, group="action"
+    )
+    wyoming_action: "WyomingAction" = betterproto.message_field(370, group="action")
+    wyoming_add_access_policy_action: "WyomingAddAccessPolicyAction" = (
+        betterproto.message_field(371, group="action")
+    )
+    wyoming_remove_access_policy_action: "WyomingRemoveAccessPolicyAction" = (
+        betterproto.message_field(372, group="action")
+    )
+    wyoming_report_engines_status_action: "WyomingReportEnginesStatusAction" = (
+        betterproto.message_field(373, group="action")
+    )
+    wyoming_report_satellite_status_action: "WyomingReportSatelliteStatusAction" = (
+        betterproto.message_field(374, group="action")
+    )
+    wyoming_satellite_wake_action: "WyomingSatelliteWakeAction" = (
+        betterproto.message_field(375, group="action")
+    )
+    wyoming_set_engines_enabled_action: "WyomingSetEnginesEnabledAction" = (
+        betterproto.message_field(376, group="action")
+    )
+    wyoming_set_satellite_enabled_action: "WyomingSetSatelliteEnabledAction" = (
+        betterproto.message_field(377, group="action")
+    )
+    wyoming_set_zeroconf_enabled_action: "WyomingSetZeroconfEnabledAction" = (
+        betterproto.message_field(378, group="action")
+    )
+
+
+@dataclass(eq=False, repr=False)
+class Event(betterproto.Message):
+    application_scroll_event: "ApplicationScrollEvent" = betterproto.message_field(
+        1, group="event"
+    )
+    assistant_cancel_request_event: "AssistantCancelRequestEvent" = (
+        betterproto.message_field(2, group="event")
+    )
+    assistant_delete_kokoro_event: "AssistantDeleteKokoroEvent" = (
+        betterproto.message_field(3, group="event")
+    )
+    assistant_delete_moonshine_model_event: "AssistantDeleteMoonshineModelEvent" = (
+        betterproto.message_field(4, group="event")
+    )
+    assistant_delete_ollama_model_event: "AssistantDeleteOllamaModelEvent" = (
+        betterproto.message_field(5, group="event")
+    )
+    assistant_delete_piper_voice_event: "AssistantDeletePiperVoiceEvent" = (
+        betterproto.message_field(6, group="event")
+    )
+    assistant_delete_vosk_model_event: "AssistantDeleteVoskModelEvent" = (
+        betterproto.message_field(7, group="event")
+    )
+    assistant_download_kokoro_event: "AssistantDownloadKokoroEvent" = (
+        betterproto.message_field(8, group="event")
+    )
+    assistant_download_moonshine_model_event: "AssistantDownloadMoonshineModelEvent" = (
+        betterproto.message_field(9, group="event")
+    )
+    assistant_download_ollama_model_event: "AssistantDownloadOllamaModelEvent" = (
+        betterproto.message_field(10, group="event")
+    )
+    assistant_download_piper_voice_event: "AssistantDownloadPiperVoiceEvent" = (
+        betterproto.message_field(11, group="event")
+    )
+    assistant_download_vosk_model_event: "AssistantDownloadVoskModelEvent" = (
+        betterproto.message_field(12, group="event")
+    )
+    assistant_event: "AssistantEvent" = betterproto.message_field(13, group="event")
+    assistant_generic_llm_provider_changed_event: (
+        "AssistantGenericLlmProviderChangedEvent"
+    ) = betterproto.message_field(14, group="event")
+    assistant_generic_llm_provider_removed_event: (
+        "AssistantGenericLlmProviderRemovedEvent"
+    ) = betterproto.message_field(15, group="event")
+    assistant_handle_report_event: "AssistantHandleReportEvent" = (
+        betterproto.message_field(16, group="event")
+    )
+    assistant_model_changed_event: "AssistantModelChangedEvent" = (
+        betterproto.message_field(17, group="event")
+    )
+    assistant_ollama_thinking_changed_event: "AssistantOllamaThinkingChangedEvent" = (
+        betterproto.message_field(18, group="event")
+    )
+    assistant_piper_voice_changed_event: "AssistantPiperVoiceChangedEvent" = (
+        betterproto.message_field(19, group="event")
+    )
+    assistant_request_mic_stream_event: "AssistantRequestMicStreamEvent" = (
+        betterproto.message_field(20, group="event")
+    )
+    assistant_run_pipeline_event: "AssistantRunPipelineEvent" = (
+        betterproto.message_field(21, group="event")
+    )
+    assistant_stop_talking_event: "AssistantStopTalkingEvent" = (
+        betterproto.message_field(22, group="event")
+    )
+    assistant_update_providers_event: "AssistantUpdateProvidersEvent" = (
+        betterproto.message_field(23, group="event")
+    )
+    assistant_voice_changed_event: "AssistantVoiceChangedEvent" = (
+        betterproto.message_field(24, group="event")
+    )
+    audio_event: "AudioEvent" = betterproto.message_field(25, group="event")
+    audio_install_driver_event: "AudioInstallDriverEvent" = betterproto.message_field(
+        26, group="event"
+    )
+    audio_play_audio_sample_event: "AudioPlayAudioSampleEvent" = (
+        betterproto.message_field(27, group="event")
+    )
+    audio_play_audio_sequence_event: "AudioPlayAudioSequenceEvent" = (
+        betterproto.message_field(28, group="event")
+    )
+    audio_play_chime_event: "AudioPlayChimeEvent" = betterproto.message_field(
+        29, group="event"
+    )
+    audio_playback_done_event: "AudioPlaybackDoneEvent" = betterproto.message_field(
+        30, group="event"
+    )
+    audio_report_sample_event: "AudioReportSampleEvent" = betterproto.message_field(
+        31, group="event"
+    )
+    audio_stop_playback_event: "AudioStopPlaybackEvent" = betterproto.message_field(
+        32, group="event"
+    )
+    camera_detect_advertise_event: "CameraDetectAdvertiseEvent" = (
+        betterproto.message_field(33, group="event")
+    )
+    camera_detect_event: "CameraDetectEvent" = betterproto.message_field(
+        34, group="event"
+    )
+    camera_detected_event: "CameraDetectedEvent" = betterproto.message_field(
+        35, group="event"
+    )
+    camera_event: "CameraEvent" = betterproto.message_field(36, group="event")
+    camera_install_driver_event: "CameraInstallDriverEvent" = betterproto.message_field(
+        37, group="event"
+    )
+    camera_reinitialize_event: "CameraReinitializeEvent" = betterproto.message_field(
+        38, group="event"
+    )
+    camera_report_image_event: "CameraReportImageEvent" = betterproto.message_field(
+        39, group="event"
+    )
+    camera_restore_default_event: "CameraRestoreDefaultEvent" = (
+        betterproto.message_field(40, group="event")
+    )
+    camera_start_viewfinder_event: "CameraStartViewfinderEvent" = (
+        betterproto.message_field(41, group="event")
+    )
+    camera_stop_viewfinder_event: "CameraStopViewfinderEvent" = (
+        betterproto.message_field(42, group="event")
+    )
+    chat_audio_playback_toggled_event: "ChatAudioPlaybackToggledEvent" = (
+        betterproto.message_field(43, group="event")
+    )
+    chat_event: "ChatEvent" = betterproto.message_field(44, group="event")
+    chat_session_ended_event: "ChatSessionEndedEvent" = betterproto.message_field(
+        45, group="event"
+    )
+    chat_session_started_event: "ChatSessionStartedEvent" = betterproto.message_field(
+        46, group="event"
+    )
+    chat_user_message_sent_event: "ChatUserMessageSentEvent" = (
+        betterproto.message_field(47, group="event")
+    )
+    display_blank_event: "DisplayBlankEvent" = betterproto.message_field(
+        48, group="event"
+    )
+    display_compressed_render_event: "DisplayCompressedRenderEvent" = (
+        betterproto.message_field(49, group="event")
+    )
+    display_event: "DisplayEvent" = betterproto.message_field(50, group="event")
+    display_redraw_event: "DisplayRedrawEvent" = betterproto.message_field(
+        51, group="event"
+    )
+    display_render_event: "DisplayRenderEvent" = betterproto.message_field(
+        52, group="event"
+    )
+    display_unblank_event: "DisplayUnblankEvent" = betterproto.message_field(
+        53, group="event"
+    )
+    docker_event: "DockerEvent" = betterproto.message_field(54, group="event")
+    docker_image_event: "DockerImageEvent" = betterproto.message_field(
+        55, group="event"
+    )
+    docker_image_fetch_composition_event: "DockerImageFetchCompositionEvent" = (
+        betterproto.message_field(56, group="event")
+    )
+    docker_image_fetch_event: "DockerImageFetchEvent" = betterproto.message_field(
+        57, group="event"
+    )
+    docker_image_rebind_event: "DockerImageRebindEvent" = betterproto.message_field(
+        58, group="event"
+    )
+    docker_image_register_app_event: "DockerImageRegisterAppEvent" = (
+        betterproto.message_field(59, group="event")
+    )
+    docker_image_release_composition_event: "DockerImageReleaseCompositionEvent" = (
+        betterproto.message_field(60, group="event")
+    )
+    docker_image_remove_composition_event: "DockerImageRemoveCompositionEvent" = (
+        betterproto.message_field(61, group="event")
+    )
+    docker_image_remove_container_event: "DockerImageRemoveContainerEvent" = (
+        betterproto.message_field(62, group="event")
+    )
+    docker_image_remove_event: "DockerImageRemoveEvent" = betterproto.message_field(
+        63, group="event"
+    )
+    docker_image_run_composition_event: "DockerImageRunCompositionEvent" = (
+        betterproto.message_field(64, group="event")
+    )
+    docker_image_run_container_event: "DockerImageRunContainerEvent" = (
+        betterproto.message_field(65, group="event")
+    )
+    docker_image_stop_composition_event: "DockerImageStopCompositionEvent" = (
+        betterproto.message_field(66, group="event")
+    )
+    docker_image_stop_container_event: "DockerImageStopContainerEvent" = (
+        betterproto.message_field(67, group="event")
+    )
+    docker_install_event: "DockerInstallEvent" = betterproto.message_field(
+        68, group="event"
+    )
+    docker_start_event: "DockerStartEvent" = betterproto.message_field(
+        69, group="event"
+    )
+    docker_stop_event: "DockerStopEvent" = betterproto.message_field(70, group="event")
+    dynamic_menu_changed_event: "DynamicMenuChangedEvent" = betterproto.message_field(
+        71, group="event"
+    )
+    execute_menu_action_event: "ExecuteMenuActionEvent" = betterproto.message_field(
+        72, group="event"
+    )
+    file_download_event: "FileDownloadEvent" = betterproto.message_field(
+        73, group="event"
+    )
+    file_download_ready_event: "FileDownloadReadyEvent" = betterproto.message_field(
+        74, group="event"
+    )
+    file_download_request_event: "FileDownloadRequestEvent" = betterproto.message_field(
+        75, group="event"
+    )
+    file_system_copy_event: "FileSystemCopyEvent" = betterproto.message_field(
+        76, group="event"
+    )
+    file_system_event: "FileSystemEvent" = betterproto.message_field(77, group="event")
+    file_system_move_event: "FileSystemMoveEvent" = betterproto.message_field(
+        78, group="event"
+    )
+    file_system_remove_event: "FileSystemRemoveEvent" = betterproto.message_field(
+        79, group="event"
+    )
+    file_system_select_event: "FileSystemSelectEvent" = betterproto.message_field(
+        80, group="event"
+    )
+    file_system_selector_cleanup_event: "FileSystemSelectorCleanupEvent" = (
+        betterproto.message_field(81, group="event")
+    )
+    file_system_video_frame_event: "FileSystemVideoFrameEvent" = (
+        betterproto.message_field(82, group="event")
+    )
+    file_upload_chunk_event: "FileUploadChunkEvent" = betterproto.message_field(
+        83, group="event"
+    )
+    file_upload_complete_event: "FileUploadCompleteEvent" = betterproto.message_field(
+        84, group="event"
+    )
+    file_upload_error_event: "FileUploadErrorEvent" = betterproto.message_field(
+        85, group="event"
+    )
+    file_upload_event: "FileUploadEvent" = betterproto.message_field(86, group="event")
+    file_upload_start_event: "FileUploadStartEvent" = betterproto.message_field(
+        87, group="event"
+    )
+    frame_stream_chunk_event: "FrameStreamChunkEvent" = betterproto.message_field(
+        88, group="event"
+    )
+    frame_stream_data_event: "FrameStreamDataEvent" = betterproto.message_field(
+        89, group="event"
+    )
+    infrared_bound_action_triggered_event: "InfraredBoundActionTriggeredEvent" = (
+        betterproto.message_field(90, group="event")
+    )
+    infrared_device_registration_complete_event: (
+        "InfraredDeviceRegistrationCompleteEvent"
+    ) = betterproto.message_field(91, group="event")
+    infrared_device_registration_started_event: (
+        "InfraredDeviceRegistrationStartedEvent"
+    ) = betterproto.message_field(92, group="event")
+    infrared_event: "InfraredEvent" = betterproto.message_field(93, group="event")
+    infrared_send_code_event: "InfraredSendCodeEvent" = betterproto.message_field(
+        94, group="event"
+    )
+    init_event: "InitEvent" = betterproto.message_field(95, group="event")
+    input_cancel_event: "InputCancelEvent" = betterproto.message_field(
+        96, group="event"
+    )
+    input_provide_event: "InputProvideEvent" = betterproto.message_field(
+        97, group="event"
+    )
+    input_resolve_event: "InputResolveEvent" = betterproto.message_field(
+        98, group="event"
+    )
+    ip_event: "IpEvent" = betterproto.message_field(99, group="event")
+    kiosk_apply_config_event: "KioskApplyConfigEvent" = betterproto.message_field(
+        100, group="event"
+    )
+    kiosk_event: "KioskEvent" = betterproto.message_field(101, group="event")
+    local_overlay_go_back_event: "LocalOverlayGoBackEvent" = betterproto.message_field(
+        102, group="event"
+    )
+    localization_event: "LocalizationEvent" = betterproto.message_field(
+        103, group="event"
+    )
+    localization_language_changed_event: "LocalizationLanguageChangedEvent" = (
+        betterproto.message_field(104, group="event")
+    )
+    localization_location_changed_event: "LocalizationLocationChangedEvent" = (
+        betterproto.message_field(105, group="event")
+    )
+    localization_location_reset_event: "LocalizationLocationResetEvent" = (
+        betterproto.message_field(106, group="event")
+    )
+    localization_speak_date_event: "LocalizationSpeakDateEvent" = (
+        betterproto.message_field(107, group="event")
+    )
+    localization_speak_time_event: "LocalizationSpeakTimeEvent" = (
+        betterproto.message_field(108, group="event")
+    )
+    localization_speak_weather_event: "LocalizationSpeakWeatherEvent" = (
+        betterproto.message_field(109, group="event")
+    )
+    localization_unit_system_changed_event: "LocalizationUnitSystemChangedEvent" = (
+        betterproto.message_field(110, group="event")
+    )
+    localization_weather_refresh_requested_event: (
+        "LocalizationWeatherRefreshRequestedEvent"
+    ) = betterproto.message_field(111, group="event")
+    main_event: "MainEvent" = betterproto.message_field(112, group="event")
+    mcp_add_server_event: "McpAddServerEvent" = betterproto.message_field(
+        113, group="event"
+    )
+    mcp_delete_server_event: "McpDeleteServerEvent" = betterproto.message_field(
+        114, group="event"
+    )
+    mcp_event: "McpEvent" = betterproto.message_field(115, group="event")
+    mcp_sync_servers_event: "McpSyncServersEvent" = betterproto.message_field(
+        116, group="event"
+    )
+    mcp_toggle_server_event: "McpToggleServerEvent" = betterproto.message_field(
+        117, group="event"
+    )
+    menu_choose_by_icon_event: "MenuChooseByIconEvent" = betterproto.message_field(
+        118, group="event"
+    )
+    menu_choose_by_index_event: "MenuChooseByIndexEvent" = betterproto.message_field(
+        119, group="event"
+    )
+    menu_choose_by_label_event: "MenuChooseByLabelEvent" = betterproto.message_field(
+        120, group="event"
+    )
+    menu_event: "MenuEvent" = betterproto.message_field(121, group="event")
+    mqtt_announce_requested_event: "MqttAnnounceRequestedEvent" = (
+        betterproto.message_field(122, group="event")
+    )
+    mqtt_event: "MqttEvent" = betterproto.message_field(123, group="event")
+    mqtt_publish_event: "MqttPublishEvent" = betterproto.message_field(
+        124, group="event"
+    )
+    notifications_clear_event: "NotificationsClearEvent" = betterproto.message_field(
+        125, group="event"
+    )
+    notifications_display_event: "NotificationsDisplayEvent" = (
+        betterproto.message_field(126, group="event")
+    )
+    notifications_event: "NotificationsEvent" = betterproto.message_field(
+        127, group="event"
+    )
+    power_event: "PowerEvent" = betterproto.message_field(128, group="event")
+    power_off_event: "PowerOffEvent" = betterproto.message_field(129, group="event")
+    r_pi_connect_event: "RPiConnectEvent" = betterproto.message_field(
+        130, group="event"
+    )
+    r_pi_connect_login_event: "RPiConnectLoginEvent" = betterproto.message_field(
+        131, group="event"
+    )
+    reboot_event: "RebootEvent" = betterproto.message_field(132, group="event")
+    replay_recorded_sequence_event: "ReplayRecordedSequenceEvent" = (
+        betterproto.message_field(133, group="event")
+    )
+    rgb_ring_command_event: "RgbRingCommandEvent" = betterproto.message_field(
+        134, group="event"
+    )
+    rgb_ring_event: "RgbRingEvent" = betterproto.message_field(135, group="event")
+    screenshot_data_event: "ScreenshotDataEvent" = betterproto.message_field(
+        136, group="event"
+    )
+    screenshot_event: "ScreenshotEvent" = betterproto.message_field(137, group="event")
+    sensors_event: "SensorsEvent" = betterproto.message_field(138, group="event")
+    sensors_scan_event: "SensorsScanEvent" = betterproto.message_field(
+        139, group="event"
+    )
+    settings_dump_store_trace_event: "SettingsDumpStoreTraceEvent" = (
+        betterproto.message_field(140, group="event")
+    )
+    settings_event: "SettingsEvent" = betterproto.message_field(141, group="event")
+    settings_service_event: "SettingsServiceEvent" = betterproto.message_field(
+        142, group="event"
+    )
+    settings_start_service_event: "SettingsStartServiceEvent" = (
+        betterproto.message_field(143, group="event")
+    )
+    settings_stop_service_event: "SettingsStopServiceEvent" = betterproto.message_field(
+        144, group="event"
+    )
+    settings_store_trace_event: "SettingsStoreTraceEvent" = betterproto.message_field(
+        145, group="event"
+    )
+    snapshot_event: "SnapshotEvent" = betterproto.message_field(146, group="event")
+    speech_recognition_bound_action_triggered_event: (
+        "SpeechRecognitionBoundActionTriggeredEvent"
+    ) = betterproto.message_field(147, group="event")
+    speech_recognition_event: "SpeechRecognitionEvent" = betterproto.message_field(
+        148, group="event"
+    )
+    speech_recognition_report_text_event: "SpeechRecognitionReportTextEvent" = (
+        betterproto.message_field(149, group="event")
+    )
+    speech_synthesis_event: "SpeechSynthesisEvent" = betterproto.message_field(
+        150, group="event"
+    )
+    speech_synthesis_synthesize_text_event: "SpeechSynthesisSynthesizeTextEvent" = (
+        betterproto.message_field(151, group="event")
+    )
+    stack_changed_event: "StackChangedEvent" = betterproto.message_field(
+        152, group="event"
+    )
+    stack_page_index_changed_event: "StackPageIndexChangedEvent" = (
+        betterproto.message_field(153, group="event")
+    )
+    store_recorded_sequence_event: "StoreRecordedSequenceEvent" = (
+        betterproto.message_field(154, group="event")
+    )
+    system_event: "SystemEvent" = betterproto.message_field(155, group="event")
+    tailscale_event: "TailscaleEvent" = betterproto.message_field(156, group="event")
+    update_manager_check_event: "UpdateManagerCheckEvent" = betterproto.message_field(
+        157, group="event"
+    )
+    update_manager_event: "UpdateManagerEvent" = betterproto.message_field(
+        158, group="event"
+    )
+    update_manager_update_event: "UpdateManagerUpdateEvent" = betterproto.message_field(
+        159, group="event"
+    )
+    users_create_user_event: "UsersCreateUserEvent" = betterproto.message_field(
+        160, group="event"
+    )
+    users_delete_user_event: "UsersDeleteUserEvent" = betterproto.message_field(
+        161, group="event"
+    )
+    users_event: "UsersEvent" = betterproto.message_field(162, group="event")
+    users_reset_password_event: "UsersResetPasswordEvent" = betterproto.message_field(
+        163, group="event"
+    )
+    vs_code_event: "VsCodeEvent" = betterproto.message_field(164, group="event")
+    vs_code_login_event: "VsCodeLoginEvent" = betterproto.message_field(
+        165, group="event"
+    )
+    vs_code_restart_event: "VsCodeRestartEvent" = betterproto.message_field(
+        166, group="event"
+    )
+    view_changed_event: "ViewChangedEvent" = betterproto.message_field(
+        167, group="event"
+    )
+    wake_word_delete_model_event: "WakeWordDeleteModelEvent" = (
+        betterproto.message_field(168, group="event")
+    )
+    wake_word_download_model_event: "WakeWordDownloadModelEvent" = (
+        betterproto.message_field(169, group="event")
+    )
+    wake_word_download_models_event: "WakeWordDownloadModelsEvent" = (
+        betterproto.message_field(170, group="event")
+    )
+    web_ui_event: "WebUiEvent" = betterproto.message_field(171, group="event")
+    web_ui_initialize_event: "WebUiInitializeEvent" = betterproto.message_field(
+        172, group="event"
+    )
+    web_ui_input_event: "WebUiInputEvent" = betterproto.message_field(
+        173, group="event"
+    )
+    wi_fi_event: "WiFiEvent" = betterproto.message_field(174, group="event")
+    wi_fi_input_connection_event: "WiFiInputConnectionEvent" = (
+        betterproto.message_field(175, group="event")
+    )
+    wi_fi_start_hotspot_event: "WiFiStartHotspotEvent" = betterproto.message_field(
+        176, group="event"
+    )
+    wi_fi_stop_hotspot_event: "WiFiStopHotspotEvent" = betterproto.message_field(
+        177, group="event"
+    )
+    wi_fi_update_request_event: "WiFiUpdateRequestEvent" = betterproto.message_field(
+        178, group="event"
+    )
+    wyoming_event: "WyomingEvent" = betterproto.message_field(179, group="event")
+    wyoming_satellite_wake_event: "WyomingSatelliteWakeEvent" = (
+        betterproto.message_field(180, group="event")
+    )
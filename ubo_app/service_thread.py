@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import contextvars
 import ctypes
 import functools
 import importlib
@@ -35,9 +36,11 @@ from ubo_app.constants import (
     ENABLED_SERVICES,
     GRPC_LISTEN_ADDRESS,
     GRPC_LISTEN_PORT,
+    LAZY_SERVICES_DELAY,
     PACKAGE_NAME,
     SERVICES_LOOP_GRACE_PERIOD,
     SERVICES_PATH,
+    STARTUP_SCHEDULER,
     SUBPROCESS_TERMINATE_GRACE_PERIOD,
 )
 from ubo_app.logger import ThreadLevelFilter, logger
@@ -48,8 +51,12 @@ from ubo_app.store.settings.types import (
     SettingsStartServiceEvent,
     SettingsStopServiceEvent,
 )
+from ubo_app.utils.boot_profile import boot_profiler
 from ubo_app.utils.error_handlers import STACKS, loop_exception_handler
+from ubo_app.utils.loop_pool import current_service, loop_pool
 from ubo_app.utils.service import ServiceUnavailableError, get_service
+from ubo_app.utils.startup_scheduler import StartupScheduler, StartupSpec
+from ubo_app.utils.state_snapshot import state_snapshot
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine, Sequence
@@ -63,11 +70,16 @@ if TYPE_CHECKING:
         SetupFunctionReturnType,
     )
 
+    from ubo_app.utils.loop_pool import SharedLoop
     from ubo_app.utils.types import Subscriptions
 
 SERVICES_BY_PATH: dict[Path, UboServiceThread] = {}
 SERVICE_PATHS_BY_ID: dict[str, Path] = OrderedDict()
 ROOT_PATH = Path(__file__).parent
+REDUCER_BARRIER_TIMEOUT = 30
+# The scheduler of the boot in progress, if `load_services` was asked for one.
+# Container pattern (list singleton) avoids ``global`` statements.
+_scheduler: list[StartupScheduler | None] = [None]
 
 
 class DisabledServiceError(Exception):
@@ -98,14 +110,60 @@ class UboModuleLoader(SourceFileLoader):
             return
         self.cache[self._cache_id] = module
         sys.modules[module.__name__] = module
-        super().exec_module(module)
+        with boot_profiler.importing(
+            Path(module.__name__.partition(':')[0]).name,
+            module.__name__,
+        ):
+            super().exec_module(module)
+
+
+class ProfiledLoader(importlib.abc.Loader):
+    """Time a third-party module a service imports, for the boot profile."""
+
+    def __init__(self, loader: importlib.abc.Loader, owner: str) -> None:
+        self.loader = loader
+        self.owner = owner
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # The module should only ever see its real loader.
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+        with boot_profiler.importing(self.owner, module.__name__):
+            self.loader.exec_module(module)
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.loader, name)
+
+
+def _find_profiled_spec(
+    fullname: str,
+    path: Sequence[str] | None,
+    target: ModuleType | None,
+    owner: str,
+) -> ModuleSpec | None:
+    for finder in sys.meta_path:
+        if isinstance(finder, UboServiceFinder):
+            continue
+        find_spec = getattr(finder, 'find_spec', None)
+        if find_spec is None:
+            continue
+        spec = find_spec(fullname, path, target)
+        if spec is not None:
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = ProfiledLoader(spec.loader, owner)
+            return spec
+    return None
 
 
 class UboServiceFinder(importlib.abc.MetaPathFinder):
     def find_spec(
         self,
         fullname: str,
-        _: Sequence[str] | None,
+        path: Sequence[str] | None,
         target: ModuleType | None = None,
     ) -> ModuleSpec | None:
         if fullname.startswith(PACKAGE_NAME):
@@ -144,6 +202,8 @@ class UboServiceFinder(importlib.abc.MetaPathFinder):
             if spec and spec.origin:
                 spec.name = module_name
                 spec.loader = UboModuleLoader(fullname, spec.origin)
+            elif spec is None and boot_profiler.enabled:
+                return _find_profiled_spec(fullname, path, target, service.name)
             return spec
 
         return None
@@ -167,6 +227,13 @@ class UboServiceThread(threading.Thread):
         self.label = '<NOT SET>'
         self.should_auto_restart = False
         self.is_enabled = False
+        self.depends_on: tuple[str, ...] = ()
+        self.is_lazy = False
+        self.shares_loop = False
+        # Set once started on a shared loop; `loop` is then that loop's.
+        self.shared_loop: SharedLoop | None = None
+        self._context: contextvars.Context | None = None
+        self._left_shared_loop = threading.Event()
 
         self.module = None
         self.is_started = False
@@ -177,9 +244,14 @@ class UboServiceThread(threading.Thread):
         self._release_once: threading.Event | None = None
         self.subscriptions: Subscriptions = []
 
+    @property
+    def runs_on_shared_loop(self) -> bool:
+        """Return whether the service will run, or runs, on a shared loop."""
+        return self.shared_loop is not None or (self.shares_loop and loop_pool.size > 0)
+
     def set_reducer_barrier(
         self,
-        reducer_barrier: threading.Barrier,
+        reducer_barrier: threading.Barrier | None,
         release_once: threading.Event,
     ) -> None:
         self._reducer_barrier = reducer_barrier
@@ -206,7 +278,7 @@ class UboServiceThread(threading.Thread):
             CombineReducerRegisterAction(
                 combine_reducers_id=root_reducer_id,
                 key=self.service_id,
-                reducer=reducer,
+                reducer=state_snapshot.wrap(self.service_id, reducer),
             ),
         )
 
@@ -215,18 +287,21 @@ class UboServiceThread(threading.Thread):
     def _wait_for_reducers(self) -> None:
         if self._reducer_barrier:
             try:
-                self._reducer_barrier.wait()
+                with boot_profiler.phase(self.name, 'barrier'):
+                    self._reducer_barrier.wait()
             except threading.BrokenBarrierError:
                 # Barrier timed out — ensure view autorun is released anyway.
                 # The Event guarantees this runs exactly once across all
                 # threads that hit the BrokenBarrierError.
                 if self._release_once and not self._release_once.is_set():
                     self._release_once.set()
-                    from ubo_app.store.core.view_computation import (
-                        release_view_autorun,
-                    )
+                    _release_first_view()
 
-                    release_view_autorun()
+    def _wait_for_first_view(self) -> None:
+        # What a service on a shared loop waits for instead of the barrier,
+        # in a worker thread: the loop must not block.
+        if self._release_once:
+            self._release_once.wait(timeout=REDUCER_BARRIER_TIMEOUT)
 
     def register(  # noqa: PLR0913
         self,
@@ -238,6 +313,9 @@ class UboServiceThread(threading.Thread):
         binary_env_provider: Callable[[], dict[str, str]] | None = None,
         is_enabled: bool = True,
         should_auto_restart: bool = False,
+        depends_on: Sequence[str] = (),
+        is_lazy: bool = False,
+        shares_loop: bool = False,
     ) -> None:
         if (
             service_id in DISABLED_SERVICES
@@ -264,6 +342,9 @@ class UboServiceThread(threading.Thread):
         self.binary_env_provider = binary_env_provider
         self.is_enabled = is_enabled
         self.should_auto_restart = should_auto_restart
+        self.depends_on = tuple(depends_on)
+        self.is_lazy = is_lazy
+        self.shares_loop = shares_loop
 
         logger.debug(
             'Ubo service registered!',
@@ -274,6 +355,10 @@ class UboServiceThread(threading.Thread):
         )
 
     def initiate(self) -> None:
+        with boot_profiler.phase(self.name, 'initiate'):
+            self._initiate()
+
+    def _initiate(self) -> None:
         try:
             if self.path.exists():
                 self.spec = PathFinder.find_spec(
@@ -322,7 +407,21 @@ class UboServiceThread(threading.Thread):
             return
         self._start_requested = True
 
-        super().start()
+        if self.runs_on_shared_loop:
+            self._start_on_shared_loop()
+        else:
+            super().start()
+
+    def is_alive(self) -> bool:
+        if self.shared_loop is not None:
+            return not self._left_shared_loop.is_set()
+        return super().is_alive()
+
+    def join(self, timeout: float | None = None) -> None:
+        if self.shared_loop is not None:
+            self._left_shared_loop.wait(timeout)
+            return
+        super().join(timeout)
 
     def stop(self) -> None:
         # `loop` is only bound once `run` reaches its first line on the new
@@ -331,9 +430,65 @@ class UboServiceThread(threading.Thread):
         # one loop, so raising here would strand all the ones after it.
         if not hasattr(self, 'loop'):
             return
-        self.loop.call_soon_threadsafe(self.loop.create_task, self.shutdown())
+        self._call_soon(self.loop.create_task, self.shutdown())
+
+    def _call_soon(
+        self,
+        callback: Callable[..., object],
+        *args: object,
+    ) -> asyncio.Handle:
+        if self._context is None:
+            return self.loop.call_soon_threadsafe(callback, *args)
+        # On a shared loop, run it as the service; each callback gets its own
+        # copy of the context so tasks do not share context variables.
+        return self.loop.call_soon_threadsafe(
+            callback,
+            *args,
+            context=self._context.copy(),
+        )
+
+    def _start_on_shared_loop(self) -> None:
+        self.shared_loop = loop_pool.assign(self.service_id)
+        self.loop = self.shared_loop.loop
+        self._context = contextvars.Context()
+        self._context.run(current_service.set, self)
+        logger.info(
+            'Starting service on a shared loop',
+            extra={
+                'loop': self.shared_loop.name,
+                'service_label': self.label,
+                'service_id': self.service_id,
+            },
+        )
+        self.setup_task = self._setup()
+        self._call_soon(self._create_setup_task)
+
+    def _create_setup_task(self) -> None:
+        self.loop.create_task(self.setup_task, name=f'Setup task for {self.label}')
+
+    def _leave_shared_loop(self) -> None:
+        from ubo_app.store.main import store
+
+        if self.shared_loop is None or self._left_shared_loop.is_set():
+            return
+        loop_pool.release(self.shared_loop, self.service_id)
+        logger.info(
+            'Ubo service left its shared loop',
+            extra={
+                'loop': self.shared_loop.name,
+                'service_label': self.label,
+                'service_id': self.service_id,
+            },
+        )
+        store.dispatch(
+            SettingsServiceSetStatusAction(
+                service_id=self.service_id,
+                is_active=False,
+            ),
+        )
+        self._left_shared_loop.set()
 
-    def run(self) -> None:  # noqa: C901, PLR0915
+    def run(self) -> None:
         from ubo_app.store.main import store
 
         self.loop = asyncio.new_event_loop()
@@ -359,103 +514,8 @@ class UboServiceThread(threading.Thread):
         )
         asyncio.set_event_loop(self.loop)
 
-        async def setup_wrapper() -> None:  # noqa: C901
-            try:
-                result = None
-                if len(inspect.signature(self.setup).parameters) == 0:
-                    logger.debug(
-                        'Waiting for reducer barrier',
-                        extra={'service_id': self.service_id},
-                    )
-                    self._wait_for_reducers()
-                    logger.debug(
-                        'Reducer barrier passed, calling setup',
-                        extra={'service_id': self.service_id},
-                    )
-                    result = cast(
-                        'Callable[[], SetupFunctionReturnType]',
-                        self.setup,
-                    )()
-                    logger.debug(
-                        'Setup function returned',
-                        extra={'service_id': self.service_id},
-                    )
-                elif len(inspect.signature(self.setup).parameters) == 1:
-                    result = cast(
-                        'Callable[[ReducerRegistrar], SetupFunctionReturnType]',
-                        self.setup,
-                    )(self.register_reducer)
-
-                if asyncio.iscoroutine(result):
-                    subscriptions = await result
-                else:
-                    subscriptions = result
-                subscriptions = [*subscriptions] if subscriptions else []
-
-                if self.binary_path is not None:
-                    process_path = self.path / 'ubo-service' / self.binary_path
-                    if process_path.exists():
-                        process = await asyncio.subprocess.create_subprocess_exec(
-                            process_path,
-                            # The cwd must not be an ancestor of the service venv's
-                            # site-packages: nltk>=3.10.1 (pulled in by the
-                            # assistant's pipeline) blocks imports of its
-                            # dependencies that resolve to paths under the cwd
-                            # (CWE-427 mitigation).
-                            cwd=DATA_PATH,
-                            env={
-                                'GRPC_ADDRESS': GRPC_LISTEN_ADDRESS,
-                                'GRPC_PORT': str(GRPC_LISTEN_PORT),
-                                'PATH': os.environ.get('PATH', ''),
-                                'UBO_DATA_PATH': DATA_PATH,
-                                **(
-                                    self.binary_env_provider()
-                                    if self.binary_env_provider
-                                    else {}
-                                ),
-                            },
-                            start_new_session=True,
-                        )
-
-                        async def process_terminate() -> None:
-                            if not process.returncode:
-                                os.killpg(process.pid, signal.SIGTERM)
-                                try:
-                                    await asyncio.wait_for(
-                                        process.wait(),
-                                        timeout=SUBPROCESS_TERMINATE_GRACE_PERIOD,
-                                    )
-                                except TimeoutError:
-                                    os.killpg(process.pid, signal.SIGKILL)
-
-                        subscriptions.append(process_terminate)
-
-            except Exception:
-                logger.exception(
-                    'Error during setup',
-                    extra={
-                        'service_id': self.service_id,
-                        'label': self.label,
-                    },
-                )
-                raise
-
-            self.is_started = True
-
-            if subscriptions:
-                self.subscriptions = subscriptions
-
-            store.dispatch(
-                SettingsServiceSetStatusAction(
-                    service_id=self.service_id,
-                    is_active=True,
-                ),
-            )
-
-            del self.setup_task
-
-        self.setup_task = setup_wrapper()
-        self.loop.create_task(self.setup_task, name=f'Setup task for {self.label}')
+        self.setup_task = self._setup()
+        self._create_setup_task()
 
         try:
             self.loop.run_forever()
@@ -488,6 +548,109 @@ class UboServiceThread(threading.Thread):
                 ),
             )
 
+    async def _setup(self) -> None:  # noqa: C901
+        from ubo_app.store.main import store
+
+        boot_profiler.begin(self.name, 'setup', service_id=self.service_id)
+        try:
+            result = None
+            if len(inspect.signature(self.setup).parameters) == 0:
+                logger.debug(
+                    'Waiting for reducer barrier',
+                    extra={'service_id': self.service_id},
+                )
+                if self.shared_loop is None:
+                    self._wait_for_reducers()
+                else:
+                    await asyncio.to_thread(self._wait_for_first_view)
+                logger.debug(
+                    'Reducer barrier passed, calling setup',
+                    extra={'service_id': self.service_id},
+                )
+                result = cast(
+                    'Callable[[], SetupFunctionReturnType]',
+                    self.setup,
+                )()
+                logger.debug(
+                    'Setup function returned',
+                    extra={'service_id': self.service_id},
+                )
+            elif len(inspect.signature(self.setup).parameters) == 1:
+                result = cast(
+                    'Callable[[ReducerRegistrar], SetupFunctionReturnType]',
+                    self.setup,
+                )(self.register_reducer)
+
+            if asyncio.iscoroutine(result):
+                subscriptions = await result
+            else:
+                subscriptions = result
+            subscriptions = [*subscriptions] if subscriptions else []
+
+            if self.binary_path is not None:
+                process_path = self.path / 'ubo-service' / self.binary_path
+                if process_path.exists():
+                    process = await asyncio.subprocess.create_subprocess_exec(
+                        process_path,
+                        # The cwd must not be an ancestor of the service venv's
+                        # site-packages: nltk>=3.10.1 (pulled in by the
+                        # assistant's pipeline) blocks imports of its
+                        # dependencies that resolve to paths under the cwd
+                        # (CWE-427 mitigation).
+                        cwd=DATA_PATH,
+                        env={
+                            'GRPC_ADDRESS': GRPC_LISTEN_ADDRESS,
+                            'GRPC_PORT': str(GRPC_LISTEN_PORT),
+                            'PATH': os.environ.get('PATH', ''),
+                            'UBO_DATA_PATH': DATA_PATH,
+                            **(
+                                self.binary_env_provider()
+                                if self.binary_env_provider
+                                else {}
+                            ),
+                        },
+                        start_new_session=True,
+                    )
+
+                    async def process_terminate() -> None:
+                        if not process.returncode:
+                            os.killpg(process.pid, signal.SIGTERM)
+                            try:
+                                await asyncio.wait_for(
+                                    process.wait(),
+                                    timeout=SUBPROCESS_TERMINATE_GRACE_PERIOD,
+                                )
+                            except TimeoutError:
+                                os.killpg(process.pid, signal.SIGKILL)
+
+                    subscriptions.append(process_terminate)
+
+        except Exception:
+            logger.exception(
+                'Error during setup',
+                extra={
+                    'service_id': self.service_id,
+                    'label': self.label,
+                },
+            )
+            _service_settled(self)
+            raise
+
+        self.is_started = True
+        _service_settled(self)
+
+        if subscriptions:
+            self.subscriptions = subscriptions
+
+        store.dispatch(
+            SettingsServiceSetStatusAction(
+                service_id=self.service_id,
+                is_active=True,
+            ),
+        )
+
+        del self.setup_task
+
     def __repr__(self) -> str:
         return (
             f'<UboServiceThread id={self.service_id} '
@@ -507,7 +670,7 @@ class UboServiceThread(threading.Thread):
             if callback:
                 callback(task)
 
-        return self.loop.call_soon_threadsafe(
+        return self._call_soon(
             task_wrapper,
             ''.join(traceback.format_stack()[:-3]) if DEBUG_TASKS else '',
         )
@@ -526,8 +689,12 @@ class UboServiceThread(threading.Thread):
 
         await self._clean_subscriptions()
         await self._clean_remaining_tasks()
+        if self._left_shared_loop.is_set():
+            # Killed while waiting for its tasks.
+            return
         self._unregister_reducer()
         self._cleanup()
+        self._leave_shared_loop()
 
     async def _clean_subscriptions(self) -> None:
         if not hasattr(self, 'subscriptions'):
@@ -567,7 +734,7 @@ class UboServiceThread(threading.Thread):
         while time.monotonic() < deadline:
             tasks = [
                 task
-                for task in asyncio.all_tasks(self.loop)
+                for task in self._own_tasks()
                 if task is not asyncio.current_task(self.loop)
                 and task.cancelling() == 0
                 and not task.done()
@@ -600,7 +767,22 @@ class UboServiceThread(threading.Thread):
                     'service_label': self.label,
                 },
             )
-        self.loop.stop()
+        if self.shared_loop is None:
+            self.loop.stop()
+
+    def _own_tasks(self) -> list[asyncio.Task]:
+        if self.shared_loop is None:
+            return list(asyncio.all_tasks(self.loop))
+        return self.shared_loop.tasks_of(self)
+
+    def _abandon_shared_loop(self) -> None:
+        if self._left_shared_loop.is_set():
+            return
+        for task in self._own_tasks():
+            task.cancel()
+        self._unregister_reducer()
+        self._cleanup()
+        self._leave_shared_loop()
 
     def _unregister_reducer(self) -> None:
         if self.has_reducer:
@@ -632,6 +814,11 @@ class UboServiceThread(threading.Thread):
         del self.module
 
     def kill(self) -> None:
+        if self.shared_loop is not None:
+            # The thread runs other services too, so there is nothing to
+            # interrupt: cancel whatever the service left and let go of it.
+            self._call_soon(self._abandon_shared_loop)
+            return
         if self.ident is None:
             return
         if self.loop.is_running():
@@ -660,9 +847,48 @@ async def start(event: SettingsStartServiceEvent) -> None:
         if SERVICE_PATHS_BY_ID[event.service_id] not in SERVICES_BY_PATH:
             service = UboServiceThread(SERVICE_PATHS_BY_ID[event.service_id])
             service.initiate()
+        scheduler = _scheduler[0]
+        if scheduler and not scheduler.request(event.service_id):
+            # The scheduler starts it once what it waits for is ready.
+            boot_profiler.begin(SERVICE_PATHS_BY_ID[event.service_id].name, 'wait')
+            return
         SERVICES_BY_PATH[SERVICE_PATHS_BY_ID[event.service_id]].start()
 
 
+def _start_held_back(service_id: str) -> None:
+    path = SERVICE_PATHS_BY_ID.get(service_id)
+    if path is None or path not in SERVICES_BY_PATH:
+        return
+    boot_profiler.end(path.name, 'wait')
+    SERVICES_BY_PATH[path].start()
+
+
+def _service_settled(service: UboServiceThread) -> None:
+    """Let boot move on past `service`, whether its setup worked or not."""
+    boot_profiler.end(service.name, 'setup')
+    scheduler = _scheduler[0]
+    if scheduler:
+        scheduler.service_ready(service.service_id)
+        if scheduler.is_done and _scheduler[0] is scheduler:
+            _scheduler[0] = None
+    if boot_profiler.settled(service.name):
+        _report_boot_profile()
+
+
+def _report_boot_profile() -> None:
+    import json
+
+    logger.info('Boot profile\n%s', boot_profiler.timeline())
+    counter = 0
+    while (path := Path(f'traces/ubo-boot-{counter:03d}.json')).exists():
+        counter += 1
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(boot_profiler.chrome_trace()))
+    except OSError:
+        logger.exception('Failed to write the boot profile', extra={'path': path})
+
+
 async def stop(event: SettingsStopServiceEvent) -> None:
     if (
         event.service_id in SERVICE_PATHS_BY_ID
@@ -689,15 +915,37 @@ async def stop(event: SettingsStopServiceEvent) -> None:
 
 
 def _report_successful_reducer_registration(services: list[UboServiceThread]) -> None:
-    from ubo_app.store.core.view_computation import release_view_autorun
-
     logger.info(
         'All reducers registered successfully',
         extra={
             'service_ids': [service.service_id for service in services],
         },
     )
+    _release_first_view()
+
+
+def _release_first_view() -> None:
+    """Compute the first view and, shortly after it is out, let lazy services go.
+
+    The core has no word from the display client when a frame is on screen, so
+    the first view leaving the core stands for it; `LAZY_SERVICES_DELAY` gives
+    the client time to draw it before the lazy services compete for the CPU.
+    """
+    from ubo_app.store.core.view_computation import release_view_autorun
+
     release_view_autorun()
+    boot_profiler.mark('reducers registered')
+    state_snapshot.view_released()
+    scheduler = _scheduler[0]
+    if scheduler:
+        timer = threading.Timer(LAZY_SERVICES_DELAY, _first_frame, (scheduler,))
+        timer.daemon = True
+        timer.start()
+
+
+def _first_frame(scheduler: StartupScheduler) -> None:
+    boot_profiler.mark('first frame')
+    scheduler.first_frame()
 
 
 def stop_services(
@@ -716,6 +964,10 @@ def _setup_reducer_barrier(to_run_services: list[UboServiceThread]) -> None:
     services have registered their reducers.  If the barrier times out
     (``BrokenBarrierError``), the first thread to catch it will release
     the autorun via a ``threading.Event`` guard in ``_wait_for_reducers``.
+
+    Services on a shared loop are left out of the barrier: waiting at it would
+    block every other service on their loop, including ones it waits for.
+    Their reducers register whenever their setup gets to it.
     """
     if not to_run_services:
         return
@@ -732,14 +984,26 @@ def _setup_reducer_barrier(to_run_services: list[UboServiceThread]) -> None:
             release_once.set()
             _report_successful_reducer_registration(to_run_services)
 
-    reducer_barrier = threading.Barrier(
-        len(to_run_services),
-        action=_on_barrier_done,
-        timeout=30,
+    on_own_thread = [
+        service for service in to_run_services if not service.runs_on_shared_loop
+    ]
+    reducer_barrier = (
+        threading.Barrier(
+            len(on_own_thread),
+            action=_on_barrier_done,
+            timeout=REDUCER_BARRIER_TIMEOUT,
+        )
+        if on_own_thread
+        else None
     )
 
     for service in to_run_services:
-        service.set_reducer_barrier(reducer_barrier, release_once)
+        service.set_reducer_barrier(
+            None if service.runs_on_shared_loop else reducer_barrier,
+            release_once,
+        )
+    if reducer_barrier is None:
+        _on_barrier_done()
 
 
 def is_loadable_service_dir(path: Path) -> bool:
@@ -755,13 +1019,53 @@ def is_loadable_service_dir(path: Path) -> bool:
     return path.is_dir() and not path.name.startswith(('~', '.'))
 
 
+def _schedule_boot(boot_services: list[UboServiceThread]) -> None:
+    scheduler = StartupScheduler(
+        [
+            StartupSpec(
+                service_id=service.service_id,
+                depends_on=service.depends_on,
+                is_lazy=service.is_lazy,
+            )
+            for service in boot_services
+        ],
+        _start_held_back,
+    )
+    _scheduler[0] = scheduler
+    # Only the first wave can meet at the barrier: everything else starts after
+    # some of it is ready, or after the first view, so the slices of lazy and
+    # dependent services are not in the state the first view is computed from.
+    # Whatever reads them has to take them as absent until then, as the view
+    # computation does.
+    first_wave = [
+        service
+        for service in boot_services
+        if service.service_id in scheduler.first_wave
+    ]
+    _setup_reducer_barrier(first_wave)
+    if not first_wave:
+        # Nothing to draw the first frame before them.
+        _first_frame(scheduler)
+
+
 def load_services(
     service_ids: Sequence[str] | None = None,
     gap_duration: float = 0,
+    *,
+    schedule: bool = STARTUP_SCHEDULER,
 ) -> None:
+    """Load the services and start the enabled ones.
+
+    With `schedule`, services start in dependency order and the lazy ones only
+    after the first frame; see `ubo_app.utils.startup_scheduler`.
+    """
     from ubo_app.store.main import store
     from ubo_app.utils.persistent_store import read_from_persistent_store
 
+    if boot_profiler.enabled:
+        boot_profiler.reset()
+    state_snapshot.load()
+
     for services_directory_path in [
         ROOT_PATH.joinpath('services').as_posix(),
         *SERVICES_PATH,
@@ -819,7 +1123,28 @@ def load_services(
         if service.is_enabled and (not service_ids or service.service_id in service_ids)
     ]
 
-    _setup_reducer_barrier(to_run_services)
+    if boot_profiler.enabled:
+        boot_profiler.expect(
+            service.name
+            for service in to_run_services
+            if services[service.service_id].is_enabled
+        )
+    state_snapshot.expect(
+        service.service_id
+        for service in to_run_services
+        if services[service.service_id].is_enabled
+    )
+
+    if schedule:
+        _schedule_boot(
+            [
+                service
+                for service in to_run_services
+                if services[service.service_id].is_enabled and not service.is_alive()
+            ],
+        )
+    else:
+        _setup_reducer_barrier(to_run_services)
 
     store.dispatch(
         SettingsSetServicesAction(services=services, gap_duration=gap_duration),
@@ -13,9 +13,8 @@ from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 import alsaaudio
-import numpy as np
 import simpleaudio
-import soxr
+from sample_conversion import to_speech_recognition_sample
 from simpleaudio import _simpleaudio  # pyright: ignore [reportAttributeAccessIssue]
 from tenacity import (
     AsyncRetrying,
@@ -24,7 +23,6 @@ from tenacity import (
     wait_fixed,
 )
 
-from ubo_app.constants import SPEECH_RECOGNITION_FRAME_RATE
 from ubo_app.logger import logger
 from ubo_app.store.main import store
 from ubo_app.store.services.audio import (
@@ -648,36 +646,14 @@ class AudioManager:
                 continue
             else:
                 if length > 0:
-                    data_speech_recognition = np.frombuffer(data, dtype=np.int16)
-                    data_speech_recognition = data_speech_recognition.reshape(
-                        -1,
-                        channels,
-                    )
-                    data_speech_recognition = data_speech_recognition.T
-                    data_speech_recognition = (
-                        data_speech_recognition.astype(np.float32) / 32768.0
-                    )
-
-                    data_speech_recognition = (
-                        data_speech_recognition.squeeze()
-                        if channels == 1
-                        else np.mean(data_speech_recognition, axis=0)
-                    )
-
-                    if INPUT_FRAME_RATE != SPEECH_RECOGNITION_FRAME_RATE:
-                        data_speech_recognition = soxr.resample(
-                            data_speech_recognition,
-                            in_rate=INPUT_FRAME_RATE,
-                            out_rate=SPEECH_RECOGNITION_FRAME_RATE,
-                        )
-
-                    data_speech_recognition = (
-                        (data_speech_recognition * 32768.0).astype(np.int16).tobytes()
-                    )
                     store.dispatch(
                         AudioReportSampleAction(
                             timestamp=event_loop.time(),
-                            sample_speech_recognition=data_speech_recognition,
+                            sample_speech_recognition=to_speech_recognition_sample(
+                                data,
+                                channels=channels,
+                                rate=INPUT_FRAME_RATE,
+                            ),
                             sample=AudioSample(
                                 data=data,
                                 channels=channels,
@@ -0,0 +1,24 @@
+"""Conversion of microphone chunks into what speech recognition takes."""
+
+from __future__ import annotations
+
+import numpy as np
+import soxr
+
+from ubo_app.constants import SPEECH_RECOGNITION_FRAME_RATE
+
+
+def to_speech_recognition_sample(data: bytes, *, channels: int, rate: int) -> bytes:
+    """Downmix interleaved 16-bit PCM to mono and resample it for recognition."""
+    samples = np.frombuffer(data, dtype=np.int16).reshape(-1, channels).T
+    samples = samples.astype(np.float32) / 32768.0
+    samples = samples.squeeze() if channels == 1 else np.mean(samples, axis=0)
+
+    if rate != SPEECH_RECOGNITION_FRAME_RATE:
+        samples = soxr.resample(
+            samples,
+            in_rate=rate,
+            out_rate=SPEECH_RECOGNITION_FRAME_RATE,
+        )
+
+    return (samples * 32768.0).astype(np.int16).tobytes()
@@ -0,0 +1,375 @@
+"""Turn AW9523 input-register changes into keypad actions, on one thread.
+
+The expander raises its interrupt line whenever any input changes. The
+interrupt callback only timestamps the edge and queues it; a single engine
+thread reads the register, decodes *every* bit that changed — so two keys
+pressed within the same interrupt are both seen — and drives each key's
+press → hold → unhold → release lifecycle from a timer wheel instead of a
+thread blocked on an event per press.
+
+Software debounce locks a bit for `debounce` after an accepted edge: the edge
+itself is reported at once, bounces inside the window are ignored, and when
+the window closes the bit is reconciled with the last register value read, so
+a bounce that ends the other way is still reported.
+
+Every action is timed from the edge (or, for a hold, from its deadline) to the
+return of its dispatch, into per-action `LatencyHistogram` s.
+
+`SimulatedAW9523` stands in for the expander in tests.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Protocol
+
+from ubo_app.constants import KEYPAD_DEBOUNCE_MS
+from ubo_app.logger import logger
+from ubo_app.store.services.audio import AudioDevice, AudioSetMuteStatusAction
+from ubo_app.store.services.keypad import (
+    Key,
+    KeypadKeyHoldAction,
+    KeypadKeyPressAction,
+    KeypadKeyReleaseAction,
+    KeypadKeyUnholdAction,
+)
+from ubo_app.store.tracing import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from redux import BaseAction
+
+KEY_INDEX = {
+    0: Key.L1,
+    1: Key.L2,
+    2: Key.L3,
+    3: Key.UP,
+    4: Key.DOWN,
+    5: Key.BACK,
+    6: Key.HOME,
+}
+MIC_INDEX = 7
+# Only the low byte is wired to the keypad; its interrupts are the only ones
+# enabled.
+INPUT_MASK = 0xFF
+
+HOLD_TIMEOUT = 0.5  # seconds
+TIMER_TICK = 10_000_000  # nanoseconds
+TIMER_SLOTS = 64
+LATENCY_LOG_INTERVAL = 60  # seconds
+
+
+class InputRegister(Protocol):
+    """What the engine reads: the expander's input port, as `AW9523` has it."""
+
+    @property
+    def inputs(self) -> int:
+        """Return the input port; a pressed key reads 0."""
+        ...
+
+
+class TimerWheel:
+    """A hashed timing wheel: constant-time schedule and cancel.
+
+    Timers are hashed into `slots` buckets of `tick` nanoseconds by their
+    deadline; advancing the wheel only visits the buckets whose ticks have
+    passed. A timer further out than one turn simply stays in its bucket until
+    a later turn reaches its deadline.
+    """
+
+    def __init__(self, *, tick: int = TIMER_TICK, slots: int = TIMER_SLOTS) -> None:
+        """Create an empty wheel."""
+        self._tick = tick
+        self._slots: list[dict[int, tuple[int, Callable[[int], None]]]] = [
+            {} for _ in range(slots)
+        ]
+        self._slot_of: dict[int, int] = {}
+        self._handles = itertools.count()
+        self._processed: int | None = None
+
+    def __len__(self) -> int:
+        """Return how many timers are pending."""
+        return len(self._slot_of)
+
+    def schedule(self, deadline: int, callback: Callable[[int], None]) -> int:
+        """Call `callback(deadline)` once `deadline` has passed; return a handle."""
+        handle = next(self._handles)
+        # A deadline already behind the wheel goes in the next bucket it visits.
+        tick = max(deadline // self._tick, self._processed or 0)
+        slot = tick % len(self._slots)
+        self._slots[slot][handle] = (deadline, callback)
+        self._slot_of[handle] = slot
+        return handle
+
+    def cancel(self, handle: int) -> None:
+        """Forget a timer, if it has not fired yet."""
+        slot = self._slot_of.pop(handle, None)
+        if slot is not None:
+            del self._slots[slot][handle]
+
+    def next_deadline(self) -> int | None:
+        """Return the earliest pending deadline."""
+        return min(
+            (self._slots[slot][handle][0] for handle, slot in self._slot_of.items()),
+            default=None,
+        )
+
+    def advance(self, now: int) -> None:
+        """Fire every timer whose deadline is at or before `now`, earliest first."""
+        current = now // self._tick
+        # The last bucket visited is visited again: the deadlines in it that
+        # were still ahead then may have passed since.
+        first = 0 if self._processed is None else self._processed
+        self._processed = current
+        if not self._slot_of:
+            return
+        ticks = range(first, current + 1)
+        if len(ticks) > len(self._slots):
+            ticks = range(current + 1 - len(self._slots), current + 1)
+        due: list[tuple[int, int, Callable[[int], None]]] = []
+        for tick in ticks:
+            slot = self._slots[tick % len(self._slots)]
+            for handle, (deadline, callback) in list(slot.items()):
+                if deadline <= now:
+                    del slot[handle]
+                    del self._slot_of[handle]
+                    due.append((deadline, handle, callback))
+        for deadline, _, callback in sorted(due, key=lambda item: item[:2]):
+            callback(deadline)
+
+
+def _bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class KeypadEngine:
+    """The keypad's state machine, fed by interrupts, run by one thread."""
+
+    def __init__(
+        self,
+        source: InputRegister,
+        dispatch: Callable[[BaseAction], object],
+        *,
+        debounce: float = KEYPAD_DEBOUNCE_MS / 1000,
+        hold_timeout: float = HOLD_TIMEOUT,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
+        """Read `source`, dispatch through `dispatch`; durations in seconds."""
+        self._source = source
+        self._dispatch = dispatch
+        self._debounce = int(debounce * 1e9)
+        self._hold_timeout = int(hold_timeout * 1e9)
+        self._clock = clock
+        self._timers = TimerWheel()
+        self._edges: queue.SimpleQueue[int | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        # The debounced register, and the last one actually read.
+        self._state = INPUT_MASK
+        self._raw = INPUT_MASK
+        self._locked: set[int] = set()
+        self._hold_timers: dict[int, int] = {}
+        self._held: set[int] = set()
+        self._logged_at = 0
+        self.latency: defaultdict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram,
+        )
+
+    def reset(self, inputs: int) -> None:
+        """Take `inputs` as the register's resting value, reporting nothing."""
+        self._state = self._raw = inputs & INPUT_MASK
+
+    def start(self, inputs: int) -> None:
+        """Start the engine thread from the register's current value."""
+        self.reset(inputs)
+        self._logged_at = self._clock()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='keypad',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the engine thread and wait for it."""
+        if self._thread is None:
+            return
+        self._edges.put(None)
+        self._thread.join()
+        self._thread = None
+        self._log_latency()
+
+    def notify_edge(self) -> None:
+        """Record an interrupt; safe from any thread, never blocks."""
+        self._edges.put(self._clock())
+
+    def poll(self, edge_at: int) -> None:
+        """Read the register and act on every bit that changed."""
+        self._raw = self._source.inputs & INPUT_MASK
+        self._apply(self._raw, edge_at)
+
+    def expire(self, now: int) -> None:
+        """Run the hold and debounce timers that are due at `now`."""
+        self._timers.advance(now)
+
+    def pressed_keys(self) -> tuple[Key, ...]:
+        """Return the keys currently down, in index order."""
+        return tuple(
+            key for index, key in KEY_INDEX.items() if not self._state & 1 << index
+        )
+
+    def latency_summary(self) -> dict[str, dict[str, float]]:
+        """Return each action type's latency summary, in microseconds."""
+        return {name: histogram.summary() for name, histogram in self.latency.items()}
+
+    def _run(self) -> None:
+        while True:
+            deadline = self._timers.next_deadline()
+            timeout = (
+                None if deadline is None else max(deadline - self._clock(), 0) / 1e9
+            )
+            try:
+                edge_at = self._edges.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if edge_at is None:
+                    return
+                try:
+                    self.poll(edge_at)
+                except OSError:
+                    logger.exception('Failed to read keypad inputs')
+            now = self._clock()
+            self.expire(now)
+            if now - self._logged_at >= LATENCY_LOG_INTERVAL * 1e9:
+                self._logged_at = now
+                self._log_latency()
+
+    def _log_latency(self) -> None:
+        if self.latency:
+            logger.info(
+                'Keypad key-to-action latency (µs)',
+                extra=self.latency_summary(),
+            )
+
+    def _apply(self, inputs: int, at: int) -> None:
+        accepted = (self._state ^ inputs) & ~self._lock_mask()
+        if not accepted:
+            return
+        self._state ^= accepted
+        for index in _bits(accepted):
+            if self._debounce:
+                self._locked.add(index)
+                self._timers.schedule(
+                    at + self._debounce,
+                    functools.partial(self._settle, index),
+                )
+        for index in _bits(accepted):
+            is_pressed = not self._state & 1 << index
+            if index == MIC_INDEX:
+                self._emit(
+                    AudioSetMuteStatusAction(
+                        device=AudioDevice.INPUT,
+                        is_mute=is_pressed,
+                    ),
+                    'mic',
+                    at,
+                )
+            elif index in KEY_INDEX:
+                if is_pressed:
+                    self._press(index, at)
+                else:
+                    self._release(index, at)
+
+    def _lock_mask(self) -> int:
+        return sum(1 << index for index in self._locked)
+
+    def _settle(self, index: int, deadline: int) -> None:
+        self._locked.discard(index)
+        if (self._state ^ self._raw) & 1 << index:
+            logger.debug('Keypad bounce settled', extra={'button_index': index})
+            self._apply(self._raw & 1 << index | self._state & ~(1 << index), deadline)
+
+    def _press(self, index: int, at: int) -> None:
+        logger.info(
+            'Button pressed',
+            extra={'button': str(index), 'pressed_keys': self.pressed_keys()},
+        )
+        self._emit(self._key_action(KeypadKeyPressAction, index), 'press', at)
+        self._hold_timers[index] = self._timers.schedule(
+            at + self._hold_timeout,
+            functools.partial(self._hold, index),
+        )
+
+    def _hold(self, index: int, deadline: int) -> None:
+        del self._hold_timers[index]
+        self._held.add(index)
+        self._emit(self._key_action(KeypadKeyHoldAction, index), 'hold', deadline)
+
+    def _release(self, index: int, at: int) -> None:
+        logger.info(
+            'Button released',
+            extra={'button': str(index), 'pressed_keys': self.pressed_keys()},
+        )
+        handle = self._hold_timers.pop(index, None)
+        if handle is not None:
+            self._timers.cancel(handle)
+        elif index in self._held:
+            self._held.discard(index)
+            self._emit(self._key_action(KeypadKeyUnholdAction, index), 'unhold', at)
+        self._emit(self._key_action(KeypadKeyReleaseAction, index), 'release', at)
+
+    def _key_action(
+        self,
+        action_type: type[
+            KeypadKeyPressAction
+            | KeypadKeyHoldAction
+            | KeypadKeyUnholdAction
+            | KeypadKeyReleaseAction
+        ],
+        index: int,
+    ) -> BaseAction:
+        return action_type(
+            key=KEY_INDEX[index],
+            held_keys=tuple(KEY_INDEX[held] for held in sorted(self._held)),
+            pressed_keys=self.pressed_keys(),
+        )
+
+    def _emit(self, action: BaseAction, kind: str, since: int) -> None:
+        self._dispatch(action)
+        self.latency[kind].record((self._clock() - since) // 1000)
+
+
+class SimulatedAW9523:
+    """A stand-in for the expander: a register to press keys on, and its INT line.
+
+    Keys read 1 when up and 0 when down, as on the hardware. Every change calls
+    `on_interrupt`, as the real chip pulls its interrupt line.
+    """
+
+    def __init__(self, inputs: int = INPUT_MASK) -> None:
+        """Start with every key up and the mic switch on, unless told otherwise."""
+        self.inputs = inputs
+        self.on_interrupt: Callable[[], None] | None = None
+
+    def press(self, *indices: int) -> None:
+        """Press keys, all in one interrupt."""
+        self.set_inputs(self.inputs & ~sum(1 << index for index in indices))
+
+    def release(self, *indices: int) -> None:
+        """Release keys, all in one interrupt."""
+        self.set_inputs(self.inputs | sum(1 << index for index in indices))
+
+    def set_inputs(self, inputs: int) -> None:
+        """Replace the whole register and raise the interrupt."""
+        self.inputs = inputs
+        if self.on_interrupt is not None:
+            self.on_interrupt()
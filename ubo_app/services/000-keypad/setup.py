@@ -2,12 +2,11 @@
 from __future__ import annotations
 
 import errno
-import math
-import threading
 import time
 from typing import TYPE_CHECKING, Literal, cast
 
 import board
+from engine import MIC_INDEX, KeypadEngine
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_fixed
 
 from ubo_app.logger import logger
@@ -20,14 +19,7 @@ from ubo_app.store.core.types import (
 )
 from ubo_app.store.main import store
 from ubo_app.store.services.audio import AudioDevice, AudioSetMuteStatusAction
-from ubo_app.store.services.keypad import (
-    Key,
-    KeypadKeyHoldAction,
-    KeypadKeyPressAction,
-    KeypadKeyReleaseAction,
-    KeypadKeyUnholdAction,
-    KeypadReportContextAction,
-)
+from ubo_app.store.services.keypad import KeypadReportContextAction
 from ubo_app.utils import IS_RPI
 from ubo_app.utils.eeprom import get_eeprom_data
 
@@ -48,16 +40,6 @@ ButtonStatus = Literal['pressed', 'released']
 class KeypadError(Exception): ...
 
 
-KEY_INDEX = {
-    0: Key.L1,
-    1: Key.L2,
-    2: Key.L3,
-    3: Key.UP,
-    4: Key.DOWN,
-    5: Key.BACK,
-    6: Key.HOME,
-}
-MIC_INDEX = 7
 BUS_ADDRESS = 0x58
 
 
@@ -128,9 +110,9 @@ def _sync_keypad_context(context: tuple[int, bool, bool, bool, bool]) -> None:
 class Keypad:
     """Class to handle keypad events."""
 
-    previous_inputs: int
     aw: AW9523 | None
     inputs: UnaryStruct
+    engine: KeypadEngine | None
 
     def __init__(self: Keypad) -> None:
         """Initialize a Keypad.
@@ -140,12 +122,8 @@ class Keypad:
         """
         self.logger = logger
         self.logger.info('Initialising keypad...')
-        self.previous_inputs = 0
         self.aw = None
-        self.held_buttons: set[int] = set()
-        self.button_release_events: dict[int, threading.Event] = {
-            index: threading.Event() for index in KEY_INDEX
-        }
+        self.engine = None
         self.init_i2c()
 
     @staticmethod
@@ -235,9 +213,10 @@ class Keypad:
             'Initializing inputs',
             extra={'inputs': f'{inputs:016b}'},
         )
-        self.previous_inputs = inputs
         time.sleep(0.3)
 
+        self.engine = KeypadEngine(self.aw, store.dispatch)
+        self.engine.start(inputs)
         # Interrupt callback when any button is pressed
         button.when_pressed = self.key_press_cb
 
@@ -249,127 +228,23 @@ class Keypad:
         # This should always be the last line of this method
         self.clear_interrupt_flags(new_i2c)
 
-    def start_button_press_lifecycle(self, index: int) -> None:
-        if index in KEY_INDEX:
-            from ubo_app.store.main import store
-
-            store.dispatch(
-                KeypadKeyPressAction(
-                    key=KEY_INDEX[index],
-                    held_keys=tuple(KEY_INDEX[i] for i in self.held_buttons),
-                    pressed_keys=tuple(KEY_INDEX[i] for i in self.pressed_buttons),
-                ),
-            )
-
-            if not self.button_release_events[index].wait(timeout=0.5):
-                self.held_buttons.add(index)
-                store.dispatch(
-                    KeypadKeyHoldAction(
-                        key=KEY_INDEX[index],
-                        held_keys=tuple(KEY_INDEX[i] for i in self.held_buttons),
-                        pressed_keys=tuple(KEY_INDEX[i] for i in self.pressed_buttons),
-                    ),
-                )
-                self.button_release_events[index].wait()
-                self.held_buttons.remove(index)
-                store.dispatch(
-                    KeypadKeyUnholdAction(
-                        key=KEY_INDEX[index],
-                        held_keys=tuple(KEY_INDEX[i] for i in self.held_buttons),
-                        pressed_keys=tuple(KEY_INDEX[i] for i in self.pressed_buttons),
-                    ),
-                )
-
-            store.dispatch(
-                KeypadKeyReleaseAction(
-                    key=KEY_INDEX[index],
-                    held_keys=tuple(KEY_INDEX[i] for i in self.held_buttons),
-                    pressed_keys=tuple(KEY_INDEX[i] for i in self.pressed_buttons),
-                ),
-            )
-
     def key_press_cb(self: Keypad, _: object) -> None:
-        """Handle key press dispatched by GPIO interrupt.
-
-            This is callback function that gets triggers
-         if any change is detected on keypad buttons
-         states.
-
-         In this callback, we look at the state
-         change to see which button was pressed or leased.
-
-        Parameters
-        ----------
-        _channel: int
-            GPIO channel that triggered the callback
-            NOT USED currently
+        """Handle the GPIO interrupt raised by the expander.
 
+        Runs on gpiozero's callback thread, so it only timestamps the edge and
+        hands it to the engine thread, which reads the inputs and decodes every
+        changed bit.
         """
-        if self.aw is None:
-            return
-        # read register values
-        inputs = cast('int', self.aw.inputs)
-        # append the event to the queue. The queue has a depth of 2 and
-        # keeps the current and last event.
-        self.logger.debug('Current Inputs', extra={'inputs': f'{inputs:016b}'})
-        self.logger.debug(
-            'Previous Inputs',
-            extra={'inputs': f'{self.previous_inputs:016b}'},
-        )
-        # XOR the last recorded input values with the current input values
-        # to see which bits have changed. Technically there can only be one
-        # bit change in every callback
-        change_mask = self.previous_inputs ^ inputs
-        self.logger.debug('Change', extra={'change_mask': f'{change_mask:016b}'})
-        if change_mask == 0:
-            return
-        # use the change mask to see if the button was the change was
-        # falling (1->0) indicating a pressed action
-        # or risign (0->1) indicating a release action
-        index = (int)(math.log2(change_mask))
-        self.logger.info('button index', extra={'button_index': index})
-
-        # Check for multiple button presses
-        self.pressed_buttons = {
-            i for i in range(8) if i in KEY_INDEX and inputs & 1 << i == 0
-        }
-
-        if index == MIC_INDEX:
-            is_mic_active = inputs & 1 << MIC_INDEX != 0
-            logger.info(
-                'Mic status:',
-                extra={'is_mic_active': is_mic_active},
-            )
-            self.mute_button_event(
-                status='released' if is_mic_active else 'pressed',
-            )
+        if self.engine is not None:
+            self.engine.notify_edge()
 
-        if index in KEY_INDEX:
-            # Check for rising edge or falling edge action (press or release)
-            if (self.previous_inputs & change_mask) == 0:
-                self.logger.info(
-                    'Button released',
-                    extra={
-                        'button': str(index),
-                        'pressed_buttons': self.pressed_buttons,
-                    },
-                )
-                self.button_release_events[index].set()
-            else:
-                self.logger.info(
-                    'Button pressed',
-                    extra={
-                        'button': str(index),
-                        'pressed_buttons': self.pressed_buttons,
-                    },
-                )
-                self.button_release_events[index].clear()
-                threading.Thread(
-                    target=self.start_button_press_lifecycle,
-                    args=(index,),
-                ).start()
-
-        self.previous_inputs = inputs
+    def close(self: Keypad) -> None:
+        """Release the interrupt line, then stop the engine thread."""
+        if hasattr(self, 'button'):
+            self.button.when_pressed = None
+            self.button.close()
+        if self.engine is not None:
+            self.engine.stop()
 
     @staticmethod
     def mute_button_event(
@@ -396,14 +271,12 @@ def init_service() -> Subscriptions:
         keypad_instance = Keypad()
 
         def cleanup() -> None:
-            if hasattr(keypad_instance, 'button'):
-                logger.info('Releasing keypad GPIO resources')
-                try:
-                    keypad_instance.button.when_pressed = None
-                    keypad_instance.button.close()
-                except Exception:
-                    logger.exception('Error closing keypad button')
-                logger.info('Keypad GPIO resources released')
+            logger.info('Releasing keypad GPIO resources')
+            try:
+                keypad_instance.close()
+            except Exception:
+                logger.exception('Error closing keypad button')
+            logger.info('Keypad GPIO resources released')
 
         return [cleanup]
 
@@ -8,6 +8,7 @@ from redux import BaseEvent, InitAction, InitializationActionError, ReducerResul
 from ubo_app.store.services.system import (
     SystemAction,
     SystemMetricsUpdateAction,
+    SystemServiceUsageUpdateAction,
     SystemState,
     SystemStorageUpdateAction,
 )
@@ -47,5 +48,7 @@ def reducer(
                 disk_used_bytes=action.disk_used_bytes,
                 disk_percent=action.disk_percent,
             )
+        case SystemServiceUsageUpdateAction():
+            return replace(state, service_usage=action.usage)
         case _:
             return state
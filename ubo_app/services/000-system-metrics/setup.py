@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 import psutil
 
+from ubo_app.constants import SERVICE_USAGE_INTERVAL
 from ubo_app.logger import logger
 from ubo_app.store.core.view_registry import (
     register_home_view_data_provider,
@@ -17,10 +18,13 @@ from ubo_app.store.core.view_registry import (
 from ubo_app.store.main import store
 from ubo_app.store.services.localization import UnitSystem
 from ubo_app.store.services.system import (
+    ServiceUsage,
     SystemMetricsUpdateAction,
+    SystemServiceUsageUpdateAction,
     SystemStorageUpdateAction,
 )
 from ubo_app.utils.async_ import create_task
+from ubo_app.utils.service_accounting import ServiceAccountant
 from ubo_app.utils.units import convert_temperature_c, resolve_unit_system
 
 if TYPE_CHECKING:
@@ -40,6 +44,11 @@ _NETWORK_RELATIVE_THRESHOLD = 0.1  # fraction of the previous rate
 # Disk usage moves over minutes, not seconds; polling it at 1 Hz is wasted work.
 _STORAGE_INTERVAL = 30
 
+# Per-service usage is only worth a dispatch when it moved by this much: CPU in
+# percentage points, allocations in bytes.
+_SERVICE_CPU_THRESHOLD = 0.5
+_SERVICE_MEMORY_THRESHOLD = 64 * 1024
+
 # Where the Raspberry Pi exposes CPU temperature when psutil finds no sensor.
 _THERMAL_ZONE = Path('/sys/class/thermal/thermal_zone0/temp')
 
@@ -220,6 +229,39 @@ def read_storage() -> None:
     )
 
 
+def _has_service_usage_change(
+    previous: dict[str, ServiceUsage] | None,
+    usage: dict[str, ServiceUsage],
+) -> bool:
+    if previous is None or previous.keys() != usage.keys():
+        return True
+    for owner, current in usage.items():
+        last = previous[owner]
+        if (
+            current.threads != last.threads
+            or abs(current.cpu_percent - last.cpu_percent) > _SERVICE_CPU_THRESHOLD
+            or (current.allocated_bytes is None) != (last.allocated_bytes is None)
+            or abs((current.allocated_bytes or 0) - (last.allocated_bytes or 0))
+            > _SERVICE_MEMORY_THRESHOLD
+        ):
+            return True
+    return False
+
+
+async def _monitor_service_usage(end_event: asyncio.Event) -> None:
+    """Periodically attribute the process's CPU and memory to its services."""
+    accountant = ServiceAccountant()
+    previous: dict[str, ServiceUsage] | None = None
+    while not end_event.is_set():
+        # Reading every thread's stat and, when on, the tracemalloc snapshot
+        # blocks, so it happens off the service's loop.
+        usage = await asyncio.to_thread(accountant.sample)
+        if _has_service_usage_change(previous, usage):
+            previous = usage
+            store.dispatch(SystemServiceUsageUpdateAction(usage=usage))
+        await asyncio.sleep(SERVICE_USAGE_INTERVAL)
+
+
 async def _monitor_metrics(end_event: asyncio.Event) -> None:
     """Periodically read system metrics."""
     while not end_event.is_set():
@@ -262,6 +304,7 @@ def init_service() -> Subscriptions:
     end_event = asyncio.Event()
     create_task(_monitor_metrics(end_event))
     create_task(_monitor_storage(end_event))
+    create_task(_monitor_service_usage(end_event))
 
     logger.info('[SystemMetrics] Service started')
     return [
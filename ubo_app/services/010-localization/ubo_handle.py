@@ -23,4 +23,5 @@ register(
     service_id='localization',
     label='Localization',
     setup=setup,
+    shares_loop=True,
 )
@@ -1,7 +1,9 @@
 # ruff: noqa: D100, D103
 from __future__ import annotations
 
+import math
 from dataclasses import replace
+from typing import TYPE_CHECKING
 
 from redux import (
     BaseEvent,
@@ -31,6 +33,12 @@ from ubo_app.store.services.notifications import (
 )
 from ubo_app.store.services.rgb_ring import RgbRingBlinkAction
 from ubo_app.utils.color import hex_to_rgb
+from ubo_app.utils.persistent_map import PersistentMap
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from ubo_app.store.services.notifications import Notification
 
 Action = InitAction | NotificationsAction
 # Stack push/pop is returned here — from the reducer, on the *ordered*
@@ -53,6 +61,85 @@ ResultAction = (
 )
 
 
+def _share(notification: Notification | None) -> float:
+    if notification is None or notification.progress is None:
+        return 0.0
+    return notification.progress * notification.progress_weight
+
+
+def _total_progress(
+    notifications: Mapping[str, Notification],
+    progress_ids: Sequence[str],
+) -> float | None:
+    shares = [_share(notifications[id]) for id in progress_ids]
+    return sum(shares) if shares else None
+
+
+def _notifications(state: NotificationsState) -> PersistentMap[str, Notification]:
+    # A state built elsewhere, by a test or from a message, may hold a plain
+    # mapping; it is converted once, on its first change.
+    if isinstance(state.notifications, PersistentMap):
+        return state.notifications
+    return PersistentMap(state.notifications)
+
+
+def _with_notifications(
+    state: NotificationsState,
+    notifications: PersistentMap[str, Notification],
+    *,
+    previous: Notification | None,
+    current: Notification | None,
+) -> NotificationsState:
+    """Return `state` holding `notifications`, where `previous` became `current`.
+
+    Either may be `None`, for an added or a removed notification. The
+    aggregates are adjusted by the two notifications' shares instead of being
+    re-summed over all of them, so adding, updating or clearing a notification
+    costs the same regardless of how many are pending.
+    """
+    unread_count = (
+        state.unread_count
+        + (current is not None and not current.is_read)
+        - (previous is not None and not previous.is_read)
+    )
+    progress_ids = state.progress_ids
+    if previous is not None and previous.progress is not None:
+        if current is None or current.progress is None:
+            index = progress_ids.index(previous.id)
+            progress_ids = progress_ids[:index] + progress_ids[index + 1 :]
+    elif current is not None and current.progress is not None:
+        progress_ids = (current.id, *progress_ids)
+
+    if not progress_ids:
+        progress = None
+    else:
+        progress = (state.progress or 0.0) - _share(previous) + _share(current)
+        if not math.isfinite(progress):
+            # An indeterminate (NaN) share can not be subtracted back out; fall
+            # back to the sum over the progress notifications.
+            progress = _total_progress(notifications, progress_ids)
+
+    return replace(
+        state,
+        notifications=notifications,
+        unread_count=unread_count,
+        progress=progress,
+        progress_ids=progress_ids,
+    )
+
+
+def _without_notification(
+    state: NotificationsState,
+    notification: Notification,
+) -> NotificationsState:
+    return _with_notifications(
+        state,
+        _notifications(state).delete(notification.id),
+        previous=notification,
+        current=None,
+    )
+
+
 def reducer(
     state: NotificationsState | None,
     action: Action,
@@ -60,57 +147,33 @@ def reducer(
     if state is None:
         if isinstance(action, InitAction):
             return NotificationsState(
-                notifications=[],
+                notifications=PersistentMap(),
                 unread_count=0,
             )
         raise InitializationActionError(action)
 
     match action:
         case NotificationsAddAction():
+            notification = action.notification
             events = []
-            events.append(NotificationsDisplayEvent(notification=action.notification))
+            events.append(NotificationsDisplayEvent(notification=notification))
             stack_action = StackPushNotificationAction(
-                notification_id=action.notification.id,
+                notification_id=notification.id,
             )
-            if action.notification in state.notifications:
+            previous = state.notifications.get(notification.id)
+            if previous == notification:
                 return CompleteReducerResult(
                     state=state,
                     actions=[stack_action],
                     events=events,
                 )
-            rgb_color = hex_to_rgb(action.notification.color)
-            new_notifications = (
-                [
-                    action.notification
-                    if notification.id == action.notification.id
-                    else notification
-                    for notification in state.notifications
-                ]
-                if any(
-                    notification.id == action.notification.id
-                    for notification in state.notifications
-                )
-                else [action.notification, *state.notifications]
-            )
+            rgb_color = hex_to_rgb(notification.color)
             return CompleteReducerResult(
-                state=replace(
+                state=_with_notifications(
                     state,
-                    notifications=new_notifications,
-                    unread_count=sum(
-                        1
-                        for notification in new_notifications
-                        if not notification.is_read
-                    ),
-                    progress=sum(
-                        notification.progress * notification.progress_weight
-                        for notification in new_notifications
-                        if notification.progress is not None
-                    )
-                    if any(
-                        notification.progress is not None
-                        for notification in new_notifications
-                    )
-                    else None,
+                    _notifications(state).set(notification.id, notification),
+                    previous=previous,
+                    current=notification,
                 ),
                 actions=[
                     stack_action,
@@ -123,16 +186,16 @@ def reducer(
                                     Importance.MEDIUM: 2,
                                     Importance.HIGH: 3,
                                     Importance.CRITICAL: 4,
-                                }[action.notification.importance],
+                                }[notification.importance],
                                 wait=400,
                             ),
                         ]
-                        if action.notification.blink
+                        if notification.blink
                         else []
                     ),
                     *(
-                        [AudioPlayChimeAction(name=action.notification.chime)]
-                        if action.notification.chime
+                        [AudioPlayChimeAction(name=notification.chime)]
+                        if notification.chime
                         else []
                     ),
                 ],
@@ -152,20 +215,12 @@ def reducer(
             )
 
         case NotificationsClearAction():
-            new_notifications = [
-                notification
-                for notification in state.notifications
-                if notification is not action.notification
-            ]
             return CompleteReducerResult(
-                state=replace(
-                    state,
-                    notifications=new_notifications,
-                    unread_count=sum(
-                        1
-                        for notification in new_notifications
-                        if not notification.is_read
-                    ),
+                state=(
+                    _without_notification(state, action.notification)
+                    if state.notifications.get(action.notification.id)
+                    is action.notification
+                    else state
                 ),
                 actions=[
                     StackPopNotificationAction(
@@ -176,43 +231,37 @@ def reducer(
             )
 
         case NotificationsClearByIdAction():
-            to_be_removed = [
-                notification
-                for notification in state.notifications
-                if notification.id == action.id
-            ]
-            new_notifications = [
-                notification
-                for notification in state.notifications
-                if notification.id != action.id
-            ]
+            previous = state.notifications.get(action.id)
             return CompleteReducerResult(
-                state=replace(
-                    state,
-                    notifications=new_notifications,
-                    unread_count=sum(
-                        1
-                        for notification in new_notifications
-                        if not notification.is_read
-                    ),
+                state=(
+                    state
+                    if previous is None
+                    else _without_notification(state, previous)
                 ),
                 actions=[StackPopNotificationAction(notification_id=action.id)],
-                events=[
-                    NotificationsClearEvent(notification=notification)
-                    for notification in to_be_removed
-                ],
+                events=(
+                    []
+                    if previous is None
+                    else [NotificationsClearEvent(notification=previous)]
+                ),
             )
 
         case NotificationsClearAllAction() | FinishAction():
             return CompleteReducerResult(
-                state=replace(state, notifications=[], unread_count=0),
+                state=replace(
+                    state,
+                    notifications=PersistentMap(),
+                    unread_count=0,
+                    progress=None,
+                    progress_ids=(),
+                ),
                 actions=[
-                    StackPopNotificationAction(notification_id=notification.id)
-                    for notification in state.notifications
+                    StackPopNotificationAction(notification_id=id)
+                    for id in state.notifications
                 ],
                 events=[
                     NotificationsClearEvent(notification=notification)
-                    for notification in state.notifications
+                    for notification in state.notifications.values()
                 ],
             )
 
@@ -5,7 +5,6 @@ import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
 
     from ubo_handle import ReducerRegistrar, register
 
@@ -61,14 +60,10 @@ def _create_dismiss_handler(notification: Notification) -> None:
         # id (its reducer returns StackPopNotificationAction). A blind
         # StackPopAction() here would pop whatever is on *top* of the stack,
         # dismissing a second notification when this one isn't the top.
-        @store.with_state(lambda state: state.notifications.notifications)
-        def clear_notification(
-            notifications: Sequence[Notification],
-        ) -> None:
-            notif = next(
-                (n for n in notifications if n.id == notification_id),
-                None,
-            )
+        @store.with_state(
+            lambda state: state.notifications.notifications.get(notification_id),
+        )
+        def clear_notification(notif: Notification | None) -> None:
             if notif:
                 store.dispatch(NotificationsClearAction(notification=notif))
 
@@ -125,14 +120,10 @@ def _handle_close_dismiss(
 
     if action.dismiss_notification:
 
-        @store.with_state(lambda state: state.notifications.notifications)
-        def clear_notification(
-            notifications: Sequence[Notification],
-        ) -> None:
-            notif = next(
-                (n for n in notifications if n.id == notification_id),
-                None,
-            )
+        @store.with_state(
+            lambda state: state.notifications.notifications.get(notification_id),
+        )
+        def clear_notification(notif: Notification | None) -> None:
             if notif:
                 store.dispatch(NotificationsClearAction(notification=notif))
 
@@ -0,0 +1,188 @@
+"""Persistent, size-bounded cache of synthesized screen-reader phrases.
+
+The screen reader speaks the same handful of strings over and over — menu
+labels, "Download complete", battery and connectivity notices — and every one
+of them used to cost a full Piper/Kokoro inference on a CPU-only Pi. This cache
+keeps the PCM the assistant sent back for a phrase, keyed by
+``(engine, voice, normalized text)``, so a repeat is replayed from disk instead.
+
+There is no speaking-rate knob anywhere in the TTS path (the assistant pipeline
+takes none per request), so the rate is not part of the key; a voice or engine
+switch yields new keys and the old entries age out through LRU eviction.
+
+Entry layout, one file per phrase::
+
+    [4s magic][H channels][I rate][H width][d synthesis seconds][PCM ...]
+
+The recorded synthesis time is what a hit is credited with in
+``saved_seconds``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ubo_app.logger import logger
+from ubo_app.store.services.audio import AudioSample
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_MAGIC = b'UBP1'
+_HEADER = struct.Struct('>4sHIHd')
+_SUFFIX = '.pcm'
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def normalize_text(text: str) -> str:
+    """Collapse the differences that do not change what a voice says."""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+def phrase_key(engine: str, voice: str, text: str) -> str:
+    """Return the cache key of a phrase spoken by ``engine`` in ``voice``."""
+    digest = hashlib.sha256()
+    for part in (engine, voice, normalize_text(text)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedPhrase:
+    """A phrase read back from the cache."""
+
+    sample: AudioSample
+    synthesis_seconds: float
+
+
+@dataclass
+class PhraseCacheStats:
+    """Running counters, logged with each read the screen reader makes."""
+
+    hits: int = 0
+    misses: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PhraseCache:
+    """LRU-evicted on-disk store of synthesized phrase audio."""
+
+    def __init__(self, path: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Bind to ``path``; the directory is indexed lazily on first use."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.stats = PhraseCacheStats()
+        self._lock = threading.Lock()
+        # key -> size in bytes, ordered least- to most-recently used.
+        self._index: dict[str, int] | None = None
+
+    def _ensure_index(self) -> dict[str, int]:
+        if self._index is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            entries = sorted(
+                (entry for entry in self.path.iterdir() if entry.suffix == _SUFFIX),
+                key=lambda entry: entry.stat().st_mtime,
+            )
+            self._index = {entry.stem: entry.stat().st_size for entry in entries}
+        return self._index
+
+    def _file(self, key: str) -> Path:
+        return self.path / f'{key}{_SUFFIX}'
+
+    @property
+    def size(self) -> int:
+        """Total bytes currently held on disk."""
+        with self._lock:
+            return sum(self._ensure_index().values())
+
+    def __contains__(self, key: str) -> bool:
+        """Return whether ``key`` is cached, without counting a lookup."""
+        with self._lock:
+            return key in self._ensure_index()
+
+    def get(self, key: str) -> CachedPhrase | None:
+        """Return the cached phrase for ``key`` and mark it recently used."""
+        with self._lock:
+            index = self._ensure_index()
+            if key not in index:
+                self.stats.misses += 1
+                return None
+            file = self._file(key)
+            try:
+                data = file.read_bytes()
+                magic, channels, rate, width, seconds = _HEADER.unpack_from(data)
+                if magic != _MAGIC:
+                    msg = f'Bad magic {magic!r}'
+                    raise ValueError(msg)  # noqa: TRY301
+            except (OSError, ValueError, struct.error):
+                logger.warning(
+                    'speech-synthesis: dropping unreadable phrase cache entry',
+                    extra={'key': key},
+                    exc_info=True,
+                )
+                file.unlink(missing_ok=True)
+                index.pop(key, None)
+                self.stats.misses += 1
+                return None
+            index[key] = index.pop(key)
+            os.utime(file)
+            self.stats.hits += 1
+            self.stats.saved_seconds += seconds
+            return CachedPhrase(
+                sample=AudioSample(
+                    data=data[_HEADER.size :],
+                    channels=channels,
+                    rate=rate,
+                    width=width,
+                ),
+                synthesis_seconds=seconds,
+            )
+
+    def put(self, key: str, sample: AudioSample, synthesis_seconds: float) -> None:
+        """Store ``sample`` under ``key``, evicting least-recently-used entries."""
+        header = _HEADER.pack(
+            _MAGIC,
+            sample.channels,
+            sample.rate,
+            sample.width,
+            synthesis_seconds,
+        )
+        size = len(header) + len(sample.data)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            index = self._ensure_index()
+            file = self._file(key)
+            temporary = file.with_suffix('.tmp')
+            try:
+                temporary.write_bytes(header + sample.data)
+                temporary.replace(file)
+            except OSError:
+                logger.warning(
+                    'speech-synthesis: failed to write phrase cache entry',
+                    extra={'key': key},
+                    exc_info=True,
+                )
+                temporary.unlink(missing_ok=True)
+                return
+            index.pop(key, None)
+            index[key] = size
+            total = sum(index.values())
+            while total > self.max_bytes and index:
+                victim = next(iter(index))
+                total -= index.pop(victim)
+                self._file(victim).unlink(missing_ok=True)
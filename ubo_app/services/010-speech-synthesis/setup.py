@@ -8,15 +8,21 @@ Accessibility settings.
 
 from __future__ import annotations
 
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
+from phrase_cache import PhraseCache, phrase_key
 from tts_selection import first_configured_local_tts, has_any_tts_configured
 
 from ubo_app.colors import WARNING_COLOR
+from ubo_app.constants import CACHE_PATH
 from ubo_app.logger import logger
 from ubo_app.store.core.types import (
     MenuItemData,
+    MenuViewData,
     RegisterSettingAppAction,
     SettingsCategory,
     StackPopToRootAction,
@@ -28,7 +34,13 @@ from ubo_app.store.core.view_registry import (
     register_path_menu_matcher,
 )
 from ubo_app.store.main import store
-from ubo_app.store.services.assistant import AssistantSynthesizeAction
+from ubo_app.store.services.assistant import (
+    AssistanceAudioFrame,
+    AssistantHandleReportEvent,
+    AssistantSynthesizeAction,
+    AssistantTTSName,
+)
+from ubo_app.store.services.audio import AudioPlayAudioSequenceAction, AudioSample
 from ubo_app.store.services.notifications import (
     Importance,
     Notification,
@@ -47,8 +59,8 @@ from ubo_app.store.services.speech_synthesis import (
 from ubo_app.utils.persistent_store import register_persistent_store
 
 if TYPE_CHECKING:
+    from ubo_app.store.core.types import ViewData
     from ubo_app.store.main import UboAction
-    from ubo_app.store.services.assistant import AssistantTTSName
     from ubo_app.store.services.speech_synthesis import ReadableInformation
     from ubo_app.utils.types import Subscriptions
 
@@ -70,6 +82,31 @@ ASSISTANT_TTS_MENU_KEY = 'assistant:tts'
 # global.
 _auto_read_cache: dict[str, ReadableInformation] = {}
 
+_phrase_cache = PhraseCache(CACHE_PATH / 'speech_synthesis' / 'phrases')
+
+# Syntheses in flight whose audio should land in the phrase cache, keyed by the
+# session id sent with `AssistantSynthesizeAction`. Bounded: a session whose
+# last frame never arrives (assistant restarted mid-read) is eventually pushed
+# out by newer ones; a pushed out pre-warm goes back to the head of the queue.
+_MAX_PENDING_SYNTHESES = 16
+# Half a second of audio per replayed chunk, the granularity the audio manager
+# buffers at anyway.
+_REPLAY_CHUNK_SECONDS = 0.5
+
+
+@dataclass
+class _PendingSynthesis:
+    text: str
+    key: str
+    started_at: float
+    is_prewarm: bool = False
+    chunks: list[AudioSample] = field(default_factory=list)
+
+
+_pending_syntheses: dict[str, _PendingSynthesis] = {}
+# Menu labels waiting to be synthesized into the cache, one at a time.
+_prewarm_queue: deque[tuple[str, str]] = deque()
+
 
 @store.with_state(
     lambda state: (
@@ -92,22 +129,159 @@ def _preferred_tts_provider(
     return first_configured_local_tts(provider_setup_status)
 
 
+@store.with_state(
+    lambda state: (
+        state.assistant.selected_tts,
+        state.assistant.selected_piper_voice,
+        state.assistant.selected_kokoro_voice,
+        state.assistant.selected_voices,
+    ),
+)
+def _tts_voice(
+    data: tuple[AssistantTTSName, str, str, dict[AssistantTTSName, str]],
+    provider: AssistantTTSName | None,
+) -> tuple[AssistantTTSName, str]:
+    """Return the engine and voice a read through ``provider`` would use."""
+    selected_tts, piper_voice, kokoro_voice, selected_voices = data
+    engine = provider or selected_tts
+    if engine is AssistantTTSName.PIPER:
+        return engine, piper_voice
+    if engine is AssistantTTSName.KOKORO:
+        return engine, kokoro_voice
+    return engine, selected_voices.get(engine, '')
+
+
+def _request_synthesis(
+    text: str,
+    key: str,
+    provider: AssistantTTSName | None,
+    *,
+    is_prewarm: bool = False,
+) -> None:
+    """Ask the assistant to synthesize ``text`` and collect its audio for ``key``."""
+    session_id = uuid4().hex
+    _pending_syntheses[session_id] = _PendingSynthesis(
+        text=text,
+        key=key,
+        started_at=time.monotonic(),
+        is_prewarm=is_prewarm,
+    )
+    evicted_prewarm = False
+    while len(_pending_syntheses) > _MAX_PENDING_SYNTHESES:
+        evicted = _pending_syntheses.pop(next(iter(_pending_syntheses)))
+        if evicted.is_prewarm:
+            # Pre-warming waits for its one synthesis in flight; requeue it
+            # so it goes on instead.
+            _prewarm_queue.appendleft((evicted.text, evicted.key))
+            evicted_prewarm = True
+    store.dispatch(
+        AssistantSynthesizeAction(
+            text=text,
+            session_id=session_id,
+            tts_provider=provider,
+            play_locally=not is_prewarm,
+        ),
+    )
+    if evicted_prewarm:
+        _prewarm_next()
+
+
+def _play_cached(key: str, sample: AudioSample) -> None:
+    """Replay a cached phrase through the audio service as one sequence."""
+    sequence_id = f'speech-synthesis:phrase:{key}:{uuid4().hex}'
+    frame_bytes = sample.channels * sample.width
+    step = max(int(sample.rate * _REPLAY_CHUNK_SECONDS), 1) * frame_bytes
+    index = 0
+    for offset in range(0, len(sample.data), step):
+        store.dispatch(
+            AudioPlayAudioSequenceAction(
+                sample=AudioSample(
+                    data=sample.data[offset : offset + step],
+                    channels=sample.channels,
+                    rate=sample.rate,
+                    width=sample.width,
+                ),
+                id=sequence_id,
+                index=index,
+            ),
+        )
+        index += 1
+    store.dispatch(
+        AudioPlayAudioSequenceAction(sample=None, id=sequence_id, index=index),
+    )
+
+
 def _synthesize(event: SpeechSynthesisSynthesizeTextEvent) -> None:
-    """Forward text to the assistant's TTS pipeline for synthesis and playback."""
+    """Play a read from the phrase cache, or forward it to the assistant's TTS."""
     preferred = _preferred_tts_provider()
+    text = event.information.text
+    engine, voice = _tts_voice(preferred)
+    key = phrase_key(engine, voice, text)
+    cached = _phrase_cache.get(key)
+    stats = _phrase_cache.stats
+    if cached is not None:
+        logger.info(
+            'screen-reader: phrase cache hit '
+            '(engine=%s, hit_ratio=%.2f, saved_seconds=%.1f)',
+            engine,
+            stats.hit_ratio,
+            stats.saved_seconds,
+        )
+        _play_cached(key, cached.sample)
+        return
     logger.info(
         'screen-reader: forwarding read to assistant tts '
-        '(preferred_local=%s, text_len=%s)',
+        '(preferred_local=%s, text_len=%s, hit_ratio=%.2f)',
         preferred.name if preferred else None,
-        len(event.information.text),
-    )
-    store.dispatch(
-        AssistantSynthesizeAction(
-            text=event.information.text,
-            session_id=uuid4().hex,
-            tts_provider=preferred,
-        ),
+        len(text),
+        stats.hit_ratio,
     )
+    _request_synthesis(text, key, preferred)
+
+
+def _prewarm_next() -> None:
+    """Synthesize the next queued menu label that is not cached yet."""
+    if any(pending.is_prewarm for pending in _pending_syntheses.values()):
+        return
+    preferred = _preferred_tts_provider()
+    while _prewarm_queue:
+        text, key = _prewarm_queue.popleft()
+        if key not in _phrase_cache:
+            _request_synthesis(text, key, preferred, is_prewarm=True)
+            return
+
+
+def _collect_synthesized_audio(event: AssistantHandleReportEvent) -> None:
+    """Gather the audio of a pending synthesis and cache it once complete."""
+    frame = event.data
+    if not isinstance(frame, AssistanceAudioFrame):
+        return
+    pending = _pending_syntheses.get(frame.session_id)
+    if pending is None:
+        return
+    if frame.audio is not None:
+        pending.chunks.append(frame.audio)
+    if not frame.is_last_frame:
+        return
+    del _pending_syntheses[frame.session_id]
+    chunks = pending.chunks
+    if chunks and all(
+        (chunk.channels, chunk.rate, chunk.width)
+        == (chunks[0].channels, chunks[0].rate, chunks[0].width)
+        for chunk in chunks
+    ):
+        _phrase_cache.put(
+            pending.key,
+            AudioSample(
+                data=b''.join(chunk.data for chunk in chunks),
+                channels=chunks[0].channels,
+                rate=chunks[0].rate,
+                width=chunks[0].width,
+            ),
+            time.monotonic() - pending.started_at,
+        )
+    if pending.is_prewarm:
+        _prewarm_next()
 
 
 @store.with_state(lambda state: state.speech_synthesis.is_screen_reader_enabled)
@@ -140,6 +314,28 @@ def _auto_read_notification(event: NotificationsDisplayEvent) -> None:
     store.dispatch(SpeechSynthesisReadTextAction(information=extra_information))
 
 
+def _prewarm_menu_labels(data: tuple[bool, ViewData | None]) -> None:
+    """Queue the visible menu's labels for background synthesis.
+
+    Only with the screen reader on and a local engine preferred: pre-warming
+    through a cloud engine would bill for phrases nobody asked to hear.
+    """
+    is_enabled, view = data
+    if not is_enabled or not isinstance(view, MenuViewData):
+        return
+    preferred = _preferred_tts_provider()
+    if preferred is None:
+        return
+    engine, voice = _tts_voice(preferred)
+    _prewarm_queue.clear()
+    for item in view.items:
+        if item is not None and item.label:
+            key = phrase_key(engine, voice, item.label)
+            if key not in _phrase_cache:
+                _prewarm_queue.append((item.label, key))
+    _prewarm_next()
+
+
 def _forget_notification(event: NotificationsClearEvent) -> None:
     """Drop dedup state on clear so a re-fired notification reads again."""
     notification_id = event.notification.id
@@ -326,8 +522,17 @@ def init_service() -> Subscriptions:
         ),
     )
 
+    prewarm_menu_labels = store.autorun(
+        lambda state: (
+            state.speech_synthesis.is_screen_reader_enabled,
+            state.main.current_view,
+        ),
+    )(_prewarm_menu_labels)
+
     return [
+        prewarm_menu_labels.unsubscribe,
         store.subscribe_event(SpeechSynthesisSynthesizeTextEvent, _synthesize),
+        store.subscribe_event(AssistantHandleReportEvent, _collect_synthesized_audio),
         store.subscribe_event(NotificationsDisplayEvent, _auto_read_notification),
         store.subscribe_event(NotificationsClearEvent, _forget_notification),
         unregister_path_matcher,
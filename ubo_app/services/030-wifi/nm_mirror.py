@@ -0,0 +1,417 @@
+# pyright: reportMissingModuleSource=false
+"""Local mirror of the NetworkManager objects the Wi-Fi service reads.
+
+Building the connection list used to cost one D-Bus round trip per saved
+connection and several per visible access point, on every ``PropertiesChanged``
+of the Wi-Fi device. :class:`NetworkManagerMirror` instead reads each object
+once with a single ``GetAll`` per interface (issued concurrently), then keeps
+its copy current from signals:
+
+- ``PropertiesChanged`` of the device, its access points and its active
+  connection, caught with one match rule for the whole NetworkManager service;
+- ``AccessPointAdded`` / ``AccessPointRemoved`` of the device;
+- ``NewConnection`` / ``ConnectionRemoved`` of the settings object and
+  ``Updated`` of each saved connection (the only objects still read with
+  ``GetSettings``, once each, as connection settings are not properties).
+
+While :attr:`NetworkManagerMirror.is_synced` is set, ``wifi_manager`` answers
+``get_connections`` and the device state from here.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any
+
+from sdbus_async.networkmanager.enums import DeviceType
+from sdbus_async.networkmanager.interfaces_devices import (
+    NetworkManagerDeviceInterfaceAsync,
+    NetworkManagerDeviceWirelessInterfaceAsync,
+)
+from sdbus_async.networkmanager.interfaces_other import (
+    NetworkManagerAccessPointInterfaceAsync,
+    NetworkManagerConnectionActiveInterfaceAsync,
+    NetworkManagerInterfaceAsync,
+    NetworkManagerSettingsConnectionInterfaceAsync,
+    NetworkManagerSettingsInterfaceAsync,
+)
+
+from ubo_app.logger import logger
+from ubo_app.utils.bus_provider import get_system_bus
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Awaitable, Callable
+
+    from sdbus import SdBus
+
+NETWORK_MANAGER_SERVICE = 'org.freedesktop.NetworkManager'
+NETWORK_MANAGER_PATH = '/org/freedesktop/NetworkManager'
+SETTINGS_PATH = '/org/freedesktop/NetworkManager/Settings'
+
+_DEVICE_INTERFACE = 'org.freedesktop.NetworkManager.Device'
+_WIRELESS_INTERFACE = 'org.freedesktop.NetworkManager.Device.Wireless'
+_ACCESS_POINT_INTERFACE = 'org.freedesktop.NetworkManager.AccessPoint'
+_ACTIVE_CONNECTION_INTERFACE = 'org.freedesktop.NetworkManager.Connection.Active'
+
+# D-Bus property name -> the python name ``properties_get_all_dict`` uses, for
+# the properties this mirror keeps.
+_DEVICE_PROPERTIES = {
+    'State': 'state',
+    'ActiveConnection': 'active_connection',
+}
+_WIRELESS_PROPERTIES = {
+    'AccessPoints': 'access_points',
+    'ActiveAccessPoint': 'active_access_point',
+}
+_ACCESS_POINT_PROPERTIES = {'Ssid': 'ssid', 'Strength': 'strength'}
+_ACTIVE_CONNECTION_PROPERTIES = {'State': 'state', 'Connection': 'connection'}
+
+
+def _changed(
+    changed: dict[str, tuple[str, Any]],
+    names: dict[str, str],
+) -> dict[str, Any]:
+    """Pick the tracked properties out of a ``PropertiesChanged`` payload."""
+    return {names[name]: value for name, (_, value) in changed.items() if name in names}
+
+
+def _ssid_of(settings: dict[str, dict[str, tuple[str, Any]]]) -> str | None:
+    if '802-11-wireless' not in settings:
+        return None
+    return settings['802-11-wireless']['ssid'][1].decode('utf-8')
+
+
+class NetworkManagerMirror:
+    """In-memory copy of the Wi-Fi device, its access points and saved networks."""
+
+    def __init__(self) -> None:
+        """Create an empty, unsynced mirror."""
+        self.is_synced = False
+        self.device_path: str | None = None
+        self.device: dict[str, Any] = {}
+        self.access_points: dict[str, dict[str, Any]] = {}
+        self.active_connection: dict[str, Any] = {}
+        # Saved connection path -> SSID, for Wi-Fi connections only.
+        self.saved: dict[str, str] = {}
+        self._bus: SdBus | None = None
+        self._on_change: Callable[[], object] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    # Queries -------------------------------------------------------------------
+
+    @property
+    def device_state(self) -> int | None:
+        """Return the Wi-Fi device's ``DeviceState`` value."""
+        return self.device.get('state')
+
+    @property
+    def active_connection_state(self) -> int | None:
+        """Return the active connection's ``ConnectionState`` value, if any."""
+        return self.active_connection.get('state')
+
+    @property
+    def active_connection_ssid(self) -> str | None:
+        """Return the SSID of the saved connection the device is using."""
+        return self.saved.get(self.active_connection.get('connection', '/'))
+
+    @property
+    def saved_ssids(self) -> list[str]:
+        """Return the SSIDs of the saved Wi-Fi connections."""
+        return list(self.saved.values())
+
+    def strength_by_ssid(self) -> dict[str, int]:
+        """Return the strongest visible signal of each SSID."""
+        result: dict[str, int] = {}
+        for access_point in self.access_points.values():
+            ssid = access_point.get('ssid', b'').decode('utf-8', 'replace')
+            strength = int(access_point.get('strength', 0))
+            if ssid and strength >= result.get(ssid, 0):
+                result[ssid] = strength
+        return result
+
+    # Lifecycle -----------------------------------------------------------------
+
+    async def start(
+        self,
+        *,
+        on_change: Callable[[], object] | None = None,
+        bus: SdBus | None = None,
+    ) -> bool:
+        """Populate the mirror and follow NetworkManager's signals.
+
+        Returns whether a Wi-Fi device was found; without one nothing is
+        mirrored and callers keep querying NetworkManager directly.
+        """
+        self._bus = bus or get_system_bus()
+        self._on_change = on_change
+
+        self.device_path = await self._find_wifi_device()
+        if self.device_path is None:
+            return False
+
+        self._watch(
+            NetworkManagerDeviceInterfaceAsync.properties_changed.catch_anywhere(
+                NETWORK_MANAGER_SERVICE,
+                self._bus,
+            ),
+            self._on_properties_changed,
+        )
+        self._watch(
+            NetworkManagerDeviceWirelessInterfaceAsync.access_point_added.catch_anywhere(
+                NETWORK_MANAGER_SERVICE,
+                self._bus,
+            ),
+            self._on_access_point_added,
+        )
+        self._watch(
+            NetworkManagerDeviceWirelessInterfaceAsync.access_point_removed.catch_anywhere(
+                NETWORK_MANAGER_SERVICE,
+                self._bus,
+            ),
+            self._on_access_point_removed,
+        )
+        self._watch(
+            NetworkManagerSettingsInterfaceAsync.new_connection.catch_anywhere(
+                NETWORK_MANAGER_SERVICE,
+                self._bus,
+            ),
+            self._on_connection_updated,
+        )
+        self._watch(
+            NetworkManagerSettingsInterfaceAsync.connection_removed.catch_anywhere(
+                NETWORK_MANAGER_SERVICE,
+                self._bus,
+            ),
+            self._on_connection_removed,
+        )
+        self._watch(
+            NetworkManagerSettingsConnectionInterfaceAsync.updated.catch_anywhere(
+                NETWORK_MANAGER_SERVICE,
+                self._bus,
+            ),
+            self._on_connection_updated,
+        )
+
+        await asyncio.gather(self._load_device(), self._load_saved_connections())
+        self.is_synced = True
+        logger.debug(
+            'wifi - NetworkManager mirror synced',
+            extra={
+                'access_points': len(self.access_points),
+                'saved_connections': len(self.saved),
+            },
+        )
+        self._notify()
+        return True
+
+    def stop(self) -> None:
+        """Stop following signals; queries fall back to NetworkManager."""
+        self.is_synced = False
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    # Loading -------------------------------------------------------------------
+
+    async def _find_wifi_device(self) -> str | None:
+        network_manager = NetworkManagerInterfaceAsync.new_proxy(
+            NETWORK_MANAGER_SERVICE,
+            NETWORK_MANAGER_PATH,
+            self._bus,
+        )
+        for path in await network_manager.get_devices():
+            device = NetworkManagerDeviceInterfaceAsync.new_proxy(
+                NETWORK_MANAGER_SERVICE,
+                path,
+                self._bus,
+            )
+            properties = await device.properties_get_all_dict(
+                on_unknown_member='ignore',
+            )
+            if properties.get('device_type') == DeviceType.WIFI:
+                self.device = {
+                    name: properties[name]
+                    for name in _DEVICE_PROPERTIES.values()
+                    if name in properties
+                }
+                return path
+        return None
+
+    async def _get_all(
+        self,
+        interface: type[Any],
+        path: str,
+    ) -> dict[str, Any]:
+        proxy = interface.new_proxy(NETWORK_MANAGER_SERVICE, path, self._bus)
+        return await proxy.properties_get_all_dict(on_unknown_member='ignore')
+
+    async def _load_device(self) -> None:
+        assert self.device_path is not None  # noqa: S101
+        wireless = await self._get_all(
+            NetworkManagerDeviceWirelessInterfaceAsync,
+            self.device_path,
+        )
+        self.device.update(
+            {
+                name: wireless[name]
+                for name in _WIRELESS_PROPERTIES.values()
+                if name in wireless
+            },
+        )
+        await asyncio.gather(
+            self._sync_access_points(self.device.get('access_points', [])),
+            self._load_active_connection(),
+        )
+
+    async def _load_access_point(self, path: str) -> None:
+        try:
+            properties = await self._get_all(
+                NetworkManagerAccessPointInterfaceAsync,
+                path,
+            )
+        except Exception:  # noqa: BLE001
+            # The access point vanished between being listed and being read.
+            logger.debug('wifi - access point went away', extra={'path': path})
+            return
+        self.access_points[path] = {
+            name: properties[name]
+            for name in _ACCESS_POINT_PROPERTIES.values()
+            if name in properties
+        }
+
+    async def _sync_access_points(self, paths: list[str]) -> None:
+        for path in set(self.access_points) - set(paths):
+            del self.access_points[path]
+        await asyncio.gather(
+            *(
+                self._load_access_point(path)
+                for path in paths
+                if path not in self.access_points
+            ),
+        )
+
+    async def _load_active_connection(self) -> None:
+        path = self.device.get('active_connection', '/')
+        self.active_connection = {}
+        if not path or path == '/':
+            return
+        with contextlib.suppress(Exception):
+            properties = await self._get_all(
+                NetworkManagerConnectionActiveInterfaceAsync,
+                path,
+            )
+            self.active_connection = {
+                name: properties[name]
+                for name in _ACTIVE_CONNECTION_PROPERTIES.values()
+                if name in properties
+            }
+
+    async def _load_saved_connection(self, path: str) -> None:
+        connection = NetworkManagerSettingsConnectionInterfaceAsync.new_proxy(
+            NETWORK_MANAGER_SERVICE,
+            path,
+            self._bus,
+        )
+        try:
+            ssid = _ssid_of(await connection.get_settings())
+        except Exception:  # noqa: BLE001
+            logger.debug('wifi - saved connection went away', extra={'path': path})
+            ssid = None
+        if ssid is None:
+            self.saved.pop(path, None)
+        else:
+            self.saved[path] = ssid
+
+    async def _load_saved_connections(self) -> None:
+        settings = NetworkManagerSettingsInterfaceAsync.new_proxy(
+            NETWORK_MANAGER_SERVICE,
+            SETTINGS_PATH,
+            self._bus,
+        )
+        paths = await settings.connections
+        await asyncio.gather(*(self._load_saved_connection(path) for path in paths))
+        # ``gather`` completes out of order; keep NetworkManager's ordering.
+        self.saved = {path: self.saved[path] for path in paths if path in self.saved}
+
+    # Signals -------------------------------------------------------------------
+
+    def _watch(
+        self,
+        signals: AsyncIterable[tuple[str, Any]],
+        handler: Callable[[str, Any], Awaitable[bool]],
+    ) -> None:
+        async def follow() -> None:
+            try:
+                async for path, payload in signals:
+                    if await handler(path, payload) and self.is_synced:
+                        self._notify()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # A lost subscription means the mirror can go stale; stop
+                # answering from it rather than serve outdated data.
+                logger.exception('wifi - NetworkManager mirror lost a signal')
+                self.stop()
+
+        self._tasks.append(asyncio.get_running_loop().create_task(follow()))
+
+    async def _on_properties_changed(
+        self,
+        path: str,
+        payload: tuple[str, dict[str, tuple[str, Any]], list[str]],
+    ) -> bool:
+        interface, changed, _ = payload
+        if interface == _ACCESS_POINT_INTERFACE and path in self.access_points:
+            self.access_points[path].update(
+                _changed(changed, _ACCESS_POINT_PROPERTIES),
+            )
+            return True
+        if path == self.device_path and interface == _DEVICE_INTERFACE:
+            updates = _changed(changed, _DEVICE_PROPERTIES)
+            self.device.update(updates)
+            if 'active_connection' in updates:
+                await self._load_active_connection()
+            return bool(updates)
+        if path == self.device_path and interface == _WIRELESS_INTERFACE:
+            updates = _changed(changed, _WIRELESS_PROPERTIES)
+            self.device.update(updates)
+            if 'access_points' in updates:
+                await self._sync_access_points(updates['access_points'])
+            return bool(updates)
+        if interface == _ACTIVE_CONNECTION_INTERFACE and path == self.device.get(
+            'active_connection',
+        ):
+            self.active_connection.update(
+                _changed(changed, _ACTIVE_CONNECTION_PROPERTIES),
+            )
+            return True
+        return False
+
+    async def _on_access_point_added(self, path: str, access_point: str) -> bool:
+        if path != self.device_path or access_point in self.access_points:
+            return False
+        await self._load_access_point(access_point)
+        return True
+
+    async def _on_access_point_removed(self, path: str, access_point: str) -> bool:
+        if path != self.device_path:
+            return False
+        return self.access_points.pop(access_point, None) is not None
+
+    async def _on_connection_updated(self, path: str, payload: object) -> bool:
+        # ``NewConnection`` is emitted by the settings object with the new
+        # connection's path as payload; ``Updated`` by the connection itself.
+        connection_path = payload if isinstance(payload, str) else path
+        await self._load_saved_connection(connection_path)
+        return True
+
+    async def _on_connection_removed(self, _: str, connection_path: str) -> bool:
+        return self.saved.pop(connection_path, None) is not None
+
+    def _notify(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+
+network_manager_mirror = NetworkManagerMirror()
@@ -5,10 +5,10 @@ import asyncio
 from typing import TYPE_CHECKING
 
 from debouncer import DebounceOptions, debounce
+from nm_mirror import network_manager_mirror
 from pages import create_wireless_connection
 from wifi_manager import (
     get_connections,
-    get_wifi_device,
     get_wifi_device_state,
     request_scan,
 )
@@ -61,7 +61,9 @@ if TYPE_CHECKING:
 
 @debounce(
     wait=0.5,
-    options=DebounceOptions(leading=True, trailing=False, time_window=0.5),
+    # Trailing too: with the mirror answering from memory a burst of signals is
+    # cheap to follow, and the last one carries the settled state.
+    options=DebounceOptions(leading=True, trailing=True, time_window=0.5),
 )
 async def update_wifi_list(_: WiFiUpdateRequestEvent | None = None) -> None:
     connections = await get_connections()
@@ -83,12 +85,9 @@ async def update_wifi_list(_: WiFiUpdateRequestEvent | None = None) -> None:
 
 
 async def setup_listeners() -> None:
-    wifi_device = await get_wifi_device()
-    if not wifi_device:
-        return
-
-    async for _ in wifi_device.properties_changed:
-        create_task(update_wifi_list())
+    await network_manager_mirror.start(
+        on_change=lambda: create_task(update_wifi_list()),
+    )
 
 
 async def _check_connection() -> None:
@@ -331,6 +330,7 @@ def init_service() -> Subscriptions:
         unregister_scan_matcher,
         unregister_connections_matcher,
         unregister_scan_handler,
+        network_manager_mirror.stop,
         store.subscribe_event(WiFiUpdateRequestEvent, request_scan),
         store.subscribe_event(
             WiFiInputConnectionEvent,
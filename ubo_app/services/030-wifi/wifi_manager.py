@@ -8,6 +8,7 @@ import uuid
 from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast
 
 from debouncer import DebounceOptions, debounce
+from nm_mirror import network_manager_mirror
 from tenacity import AsyncRetrying, stop_after_attempt, wait_fixed
 
 from ubo_app.colors import DANGER_COLOR
@@ -76,13 +77,8 @@ async def get_wifi_device() -> NetworkDeviceWireless | None:
     return None
 
 
-async def get_wifi_device_state() -> NetState:
-    wifi_device = await get_wifi_device()
-    if wifi_device is None:
-        return NetState.UNKNOWN
-
-    state = await wifi_device.state
-    if state is DeviceState.UNKNOWN:
+def _net_state(state: DeviceState | None) -> NetState:
+    if state is None or state is DeviceState.UNKNOWN:
         return NetState.UNKNOWN
     if state in (
         DeviceState.DISCONNECTED,
@@ -108,6 +104,18 @@ async def get_wifi_device_state() -> NetState:
     return NetState.UNKNOWN
 
 
+async def get_wifi_device_state() -> NetState:
+    if network_manager_mirror.is_synced:
+        device_state = network_manager_mirror.device_state
+        return _net_state(None if device_state is None else DeviceState(device_state))
+
+    wifi_device = await get_wifi_device()
+    if wifi_device is None:
+        return NetState.UNKNOWN
+
+    return _net_state(await wifi_device.state)
+
+
 @debounce(wait=0.5, options=DebounceOptions(trailing=True, time_window=2))
 async def request_scan() -> None:
     wifi_device = await get_wifi_device()
@@ -230,6 +238,16 @@ async def get_active_connection() -> ActiveConnection | None:
     return ActiveConnection(active_connection, get_system_bus())
 
 
+_CONNECTION_STATES = {
+    SdBusConnectionState.ACTIVATED: ConnectionState.CONNECTED,
+    SdBusConnectionState.ACTIVATING: ConnectionState.CONNECTING,
+    SdBusConnectionState.DEACTIVATED: ConnectionState.DISCONNECTED,
+    SdBusConnectionState.DEACTIVATING: ConnectionState.DISCONNECTED,
+    SdBusConnectionState.UNKNOWN: ConnectionState.UNKNOWN,
+    None: ConnectionState.UNKNOWN,
+}
+
+
 async def get_active_connection_state() -> ConnectionState:
     active_connection = await get_active_connection()
     if not active_connection:
@@ -241,14 +259,7 @@ async def get_active_connection_state() -> ConnectionState:
         else None
     )
 
-    return {
-        SdBusConnectionState.ACTIVATED: ConnectionState.CONNECTED,
-        SdBusConnectionState.ACTIVATING: ConnectionState.CONNECTING,
-        SdBusConnectionState.DEACTIVATED: ConnectionState.DISCONNECTED,
-        SdBusConnectionState.DEACTIVATING: ConnectionState.DISCONNECTED,
-        SdBusConnectionState.UNKNOWN: ConnectionState.UNKNOWN,
-        None: ConnectionState.UNKNOWN,
-    }[active_connection_state]
+    return _CONNECTION_STATES[active_connection_state]
 
 
 async def get_active_connection_ssid() -> str | None:
@@ -515,7 +526,32 @@ async def forget_wireless_connection(ssid: str) -> None:
             )
 
 
+def _get_mirrored_connections() -> list[WiFiConnection]:
+    mirror = network_manager_mirror
+    active_connection_state = _CONNECTION_STATES.get(
+        None
+        if mirror.active_connection_state is None
+        else SdBusConnectionState(mirror.active_connection_state),
+        ConnectionState.UNKNOWN,
+    )
+    active_connection_ssid = mirror.active_connection_ssid
+    strength_by_ssid = mirror.strength_by_ssid()
+    return [
+        WiFiConnection(
+            ssid=ssid,
+            signal_strength=strength_by_ssid.get(ssid, 0),
+            state=active_connection_state
+            if active_connection_ssid == ssid
+            else ConnectionState.DISCONNECTED,
+        )
+        for ssid in mirror.saved_ssids
+    ]
+
+
 async def get_connections() -> list[WiFiConnection]:
+    if network_manager_mirror.is_synced:
+        return _get_mirrored_connections()
+
     # It is need as this action is not atomic and the active_connection may not be
     # available when active_connection.state is queried
     for _ in range(RETRIES):
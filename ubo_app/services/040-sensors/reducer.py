@@ -17,6 +17,7 @@ from ubo_app.store.services.sensors import (
     SensorsAction,
     SensorsReportDeviceReadingsAction,
     SensorsReportReadingAction,
+    SensorsReportReadingsAction,
     SensorsScanAction,
     SensorsScanCompletedAction,
     SensorsScanEvent,
@@ -27,6 +28,32 @@ from ubo_app.store.services.sensors import (
 Action = InitAction | SensorsAction
 
 
+def _merge_readings(
+    state: SensorsState,
+    action: SensorsReportReadingsAction,
+) -> SensorsState:
+    """Fold a tick's changed entities into the devices that reported them.
+
+    An entity absent from the action has not moved, so its previous reading
+    stands; one seen for the first time is appended.
+    """
+    devices = dict(state.devices)
+    for readings in action.devices:
+        device = devices.get(readings.device_id)
+        if device is None:
+            # A reading racing a re-scan that dropped its device.
+            continue
+        entities = {entity.key: entity for entity in device.entities}
+        entities.update({entity.key: entity for entity in readings.entities})
+        devices[device.id] = replace(device, entities=tuple(entities.values()))
+
+    if action.temperature is not None:
+        state = replace(state, temperature=SensorState(value=action.temperature))
+    if action.light is not None:
+        state = replace(state, light=SensorState(value=action.light))
+    return replace(state, devices=devices)
+
+
 def reducer(
     state: SensorsState | None,
     action: Action,
@@ -77,5 +104,7 @@ def reducer(
                     device.id: replace(device, entities=action.entities),
                 },
             )
+        case SensorsReportReadingsAction():
+            return _merge_readings(state, action)
         case _:
             return state
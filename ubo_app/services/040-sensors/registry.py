@@ -32,6 +32,12 @@ MAX_I2C_ADDRESS = 0x77
 # A probe reads a chip-ID register: a couple of bytes, never more.
 MAX_PROBE_LENGTH = 4
 
+# The longest an entity may go without being reported, changed or not — both
+# the default and the ceiling for `max_report_interval`. It has
+# to stay below `ha.EXPIRE_AFTER`, or a sensor holding perfectly still would go
+# `unavailable` in Home Assistant between two of its own heartbeats.
+MAX_REPORT_INTERVAL = 60.0
+
 
 class ProbeSpec(Immutable):
     """A register read that confirms a candidate definition.
@@ -65,6 +71,16 @@ class EntityDefinition(Immutable):
     unit_of_measurement: str | None = None
     state_class: str | None = None
     suggested_display_precision: int | None = None
+    # How far a reading has to move from the last *reported* one to be reported
+    # again, in its own unit. `None` derives it from the display precision —
+    # half of the last displayed digit, a change nobody could see — and an
+    # entity with no precision reports every change. See `sampling.py`.
+    deadband: float | None = None
+    # Bounds on how often the entity is reported: no more often than the
+    # minimum however much it moves, and at least as often as the maximum
+    # however little.
+    min_report_interval: float = 0.0
+    max_report_interval: float = MAX_REPORT_INTERVAL
 
 
 class DriverSpec(Immutable):
@@ -215,6 +231,45 @@ def _parse_min_read_interval(raw: object) -> float:
     return float(raw)
 
 
+def _parse_optional_deadband(raw: object) -> float | None:
+    if raw is None:
+        return None
+    # A negative deadband would compare below every change, including none at
+    # all, and report an unmoving reading every tick.
+    if isinstance(raw, bool) or not isinstance(raw, (int, float)) or raw < 0:
+        msg = f'deadband must be a non-negative number, got {raw!r}'
+        raise RegistryError(msg)
+    return float(raw)
+
+
+def _parse_report_intervals(
+    raw_min: object,
+    raw_max: object,
+) -> tuple[float, float]:
+    intervals: list[float] = []
+    for name, raw, default in (
+        ('min_report_interval', raw_min, 0.0),
+        ('max_report_interval', raw_max, MAX_REPORT_INTERVAL),
+    ):
+        if raw is None:
+            intervals.append(default)
+            continue
+        if isinstance(raw, bool) or not isinstance(raw, (int, float)) or raw < 0:
+            msg = f'{name} must be a non-negative number, got {raw!r}'
+            raise RegistryError(msg)
+        intervals.append(float(raw))
+    minimum, maximum = intervals
+    # Past `ha.EXPIRE_AFTER` a reading that holds still would take its entity
+    # `unavailable`; below the minimum the heartbeat could never fire.
+    if not minimum <= maximum <= MAX_REPORT_INTERVAL:
+        msg = (
+            'report intervals must satisfy min <= max <= '
+            f'{MAX_REPORT_INTERVAL:g}, got {minimum:g} and {maximum:g}'
+        )
+        raise RegistryError(msg)
+    return minimum, maximum
+
+
 def _parse_probe_value(value: object, *, what: str) -> int:
     """Parse a probe register/expected/mask, written in hex like addresses.
 
@@ -297,6 +352,10 @@ def _parse_entity(raw: object) -> EntityDefinition:
     if not isinstance(key, str) or not key.isidentifier():
         msg = f'entity key must be an identifier, got {key!r}'
         raise RegistryError(msg)
+    min_report_interval, max_report_interval = _parse_report_intervals(
+        raw.get('min_report_interval'),
+        raw.get('max_report_interval'),
+    )
     try:
         return EntityDefinition(
             key=key,
@@ -322,6 +381,9 @@ def _parse_entity(raw: object) -> EntityDefinition:
             suggested_display_precision=_parse_optional_precision(
                 raw.get('suggested_display_precision'),
             ),
+            deadband=_parse_optional_deadband(raw.get('deadband')),
+            min_report_interval=min_report_interval,
+            max_report_interval=max_report_interval,
         )
     except KeyError as exception:
         msg = f'entity is missing {exception}'
@@ -0,0 +1,159 @@
+"""Decide which of a poll tick's readings are worth reporting.
+
+The poll loop reads every sensor once a second, but most of those readings are
+the same number as the second before — or differ from it by noise below the
+last digit anyone displays. Reporting them anyway costs a store dispatch, a
+JSON payload and a Home Assistant recorder row each, every second, forever.
+
+So each entity is reported only when it has moved past its *deadband* since it
+was last reported, no sooner than its minimum report interval, and — changed or
+not — at least once per maximum report interval, which is what keeps a sensor
+that holds still from expiring on the Home Assistant side. The comparison is
+against the last *reported* value, not the last sampled one, so a slow drift
+made of sub-deadband steps still gets reported once it adds up.
+
+Pure bookkeeping: nothing here touches the bus or the store, and every method
+is called from the sensors worker thread, except `force_report`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping, Sequence
+
+    from registry import EntityDefinition
+
+Slot = TypeVar('Slot')
+
+
+@dataclass
+class SamplingStats:
+    """Running counters, logged and reset once a minute by the poll loop."""
+
+    ticks: int = 0
+    # Store actions dispatched on the sampler's say-so: the batched readings
+    # action and the MQTT publishes it leads to.
+    actions: int = 0
+    # Wall time spent inside driver reads, which is time the I²C bus was busy.
+    bus_seconds: float = 0.0
+
+
+@dataclass
+class _Reported:
+    value: float | None
+    at: float
+
+
+def effective_deadband(entity: EntityDefinition) -> float:
+    """Return how far `entity` has to move before it is reported again.
+
+    Without an explicit deadband, half of the last displayed digit: a move
+    smaller than that would not change what the menu, the dashboard or Home
+    Assistant shows.
+    """
+    if entity.deadband is not None:
+        return entity.deadband
+    if entity.suggested_display_precision is None:
+        return 0.0
+    return 0.5 * 10**-entity.suggested_display_precision
+
+
+def _has_moved(
+    previous: float | None,
+    value: float | None,
+    deadband: float,
+) -> bool:
+    if previous is None or value is None:
+        # Gaining or losing a reading is always news — it is how a consumer
+        # learns an entity has stopped answering.
+        return (previous is None) != (value is None)
+    return abs(value - previous) > deadband
+
+
+class SensorSampler:
+    """Per-entity memory of what was last reported, and when."""
+
+    def __init__(self) -> None:
+        """Start with nothing reported, so the first tick reports everything."""
+        self.stats = SamplingStats()
+        self._reported: dict[str, dict[str, _Reported]] = {}
+        self._legacy: dict[object, float] = {}
+        self._is_forced = False
+
+    def force_report(self) -> None:
+        """Report every entity on the next tick, whether it moved or not.
+
+        For when the consumers' copy is gone or stale: a re-scan replaces the
+        store's devices with reading-less ones, Home Assistant forgets non-
+        retained state when it restarts, and a unit-system change re-renders
+        every display value. Only sets a flag, so it is safe from any thread.
+        """
+        self._is_forced = True
+
+    def start_tick(self, device_ids: Collection[str]) -> None:
+        """Forget devices that are no longer active, or everything if forced."""
+        self.stats.ticks += 1
+        if self._is_forced:
+            self._is_forced = False
+            self._reported.clear()
+            self._legacy.clear()
+            return
+        for device_id in self._reported.keys() - set(device_ids):
+            del self._reported[device_id]
+
+    def changes(
+        self,
+        device_id: str,
+        entities: Sequence[EntityDefinition],
+        readings: Mapping[str, float | None],
+        *,
+        now: float,
+    ) -> dict[str, float | None]:
+        """Return the subset of `readings` due to be reported, and record it.
+
+        `now` is the tick's monotonic timestamp, the same one the driver poll
+        was judged against.
+        """
+        reported = self._reported.setdefault(device_id, {})
+        definitions = {entity.key: entity for entity in entities}
+        due: dict[str, float | None] = {}
+        for key, value in readings.items():
+            previous = reported.get(key)
+            definition = definitions.get(key)
+            if previous is not None and definition is not None:
+                elapsed = now - previous.at
+                if elapsed < definition.max_report_interval and (
+                    elapsed < definition.min_report_interval
+                    or not _has_moved(
+                        previous.value,
+                        value,
+                        effective_deadband(definition),
+                    )
+                ):
+                    continue
+            reported[key] = _Reported(value=value, at=now)
+            due[key] = value
+        return due
+
+    def reported(self, device_id: str) -> dict[str, float | None]:
+        """Return the values last reported for a device, keyed by entity."""
+        return {
+            key: entry.value for key, entry in self._reported.get(device_id, {}).items()
+        }
+
+    def legacy_changes(self, values: Mapping[Slot, float]) -> dict[Slot, float]:
+        """Return the legacy status-bar slots whose value differs from last time.
+
+        Fed from `reported`, so the deadband already applies upstream; this
+        only stops an unchanged slot being re-dispatched every tick.
+        """
+        due = {
+            slot: value
+            for slot, value in values.items()
+            if self._legacy.get(slot) != value
+        }
+        self._legacy.update(due)
+        return due
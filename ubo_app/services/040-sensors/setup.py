@@ -25,6 +25,7 @@ from menu import (
     report_scan_result,
 )
 from registry import load_registry
+from sampling import SamplingStats, SensorSampler
 from scan import RESERVED_ADDRESSES, SensorMatch, builtin_matches, make_device_id
 from scan import scan_and_match as _scan_and_match
 
@@ -32,15 +33,16 @@ from ubo_app.logger import logger
 from ubo_app.store.core.view_registry import register_status_bar_dependency
 from ubo_app.store.main import store
 from ubo_app.store.services.mqtt import (
+    MqttAnnounceRequestedEvent,
     MqttPublishAction,
     MqttRequestAnnounceAction,
 )
 from ubo_app.store.services.sensors import (
     Sensor,
+    SensorDeviceReadings,
     SensorDeviceState,
     SensorEntityReading,
-    SensorsReportDeviceReadingsAction,
-    SensorsReportReadingAction,
+    SensorsReportReadingsAction,
     SensorsScanCompletedAction,
     SensorsScanEvent,
     SensorStatus,
@@ -95,6 +97,11 @@ I2C_CALL_TIMEOUT = 60
 # stops two of them driving I²C at once.
 WORKER = BlockingWorker('sensors-i2c', deadline=I2C_CALL_TIMEOUT)
 
+# What each entity last reported, and the counters behind the once-a-minute
+# stats line. Replaced in `init_service`, like `WORKER`.
+SAMPLER = SensorSampler()
+STATS_INTERVAL = 60.0
+
 
 def _bus() -> busio.I2C:
     """Return the shared I²C bus, which `init_service` opens."""
@@ -353,15 +360,17 @@ def _make_reading(
 
 
 def read_sensors() -> dict[str, dict[str, float | None]]:
-    """Read every active device and report its entities.
+    """Read every active device and report what changed.
 
-    Runs in a worker thread. Returns the readings so the caller — back on the
-    event loop — can hand them to the MQTT publisher; `asyncio.Queue` is not
-    thread-safe, so the enqueue must not happen here.
+    Runs in a worker thread. Returns the full readings of every device that had
+    something to report, so the caller — back on the event loop — can hand them
+    to the MQTT publisher; `asyncio.Queue` is not thread-safe, so the enqueue
+    must not happen here.
 
-    The two legacy `SensorsReportReadingAction`s go out alongside the
-    per-device ones. They are what the status bar reads, and — exactly as
-    before this became a device registry — they report 0.0 when the on-board
+    Everything the tick changed goes out as one `SensorsReportReadingsAction`,
+    and nothing goes out when nothing moved — `SAMPLER` decides what counts as
+    a change. The two legacy status-bar slots ride in the same action. Exactly
+    as before this became a device registry, they read 0.0 when the on-board
     sensor is absent, which is the case off-device.
     """
     legacy: dict[Sensor, float] = {Sensor.TEMPERATURE: 0.0, Sensor.LIGHT: 0.0}
@@ -370,48 +379,97 @@ def read_sensors() -> dict[str, dict[str, float | None]]:
     # "is it due yet" answer should come from one clock reading. Monotonic, not
     # `timestamp` — a poll deadline must survive a wall-clock step.
     now = time.monotonic()
-    all_readings: dict[str, dict[str, float | None]] = {}
+    reported_readings: dict[str, dict[str, float | None]] = {}
+    batch: list[SensorDeviceReadings] = []
     # Resolved once per poll tick rather than per-entity: it's the same
     # answer for every reading in this frame, and a mid-tick setting change
     # would otherwise mix two unit systems into one dispatch.
     unit_system = _effective_unit_system()
 
+    SAMPLER.start_tick(ACTIVE_SENSORS.keys())
     for device_id, sensor in list(ACTIVE_SENSORS.items()):
+        started_at = time.perf_counter()
         readings = poll_entities(sensor, now=now)
-        all_readings[device_id] = readings
-        definitions = {entity.key: entity for entity in sensor.definition.entities}
-        store.dispatch(
-            SensorsReportDeviceReadingsAction(
-                device_id=device_id,
-                entities=tuple(
-                    _make_reading(key, value, definitions.get(key), unit_system)
-                    for key, value in readings.items()
-                ),
-                timestamp=timestamp,
-            ),
+        SAMPLER.stats.bus_seconds += time.perf_counter() - started_at
+
+        changes = SAMPLER.changes(
+            device_id,
+            sensor.definition.entities,
+            readings,
+            now=now,
         )
+        if changes:
+            reported_readings[device_id] = readings
+            definitions = {entity.key: entity for entity in sensor.definition.entities}
+            batch.append(
+                SensorDeviceReadings(
+                    device_id=device_id,
+                    entities=tuple(
+                        _make_reading(key, value, definitions.get(key), unit_system)
+                        for key, value in changes.items()
+                    ),
+                ),
+            )
 
         legacy_slot = LEGACY_SENSORS.get(device_id)
         if legacy_slot is not None:
-            # An on-board sensor has exactly one entity.
-            value = next(iter(readings.values()), None)
+            # An on-board sensor has exactly one entity. The reported value
+            # rather than the raw one, so the status bar honors the deadband.
+            value = next(iter(SAMPLER.reported(device_id).values()), None)
             if value is not None:
                 legacy[legacy_slot] = value
 
-    store.dispatch(
-        SensorsReportReadingAction(
-            sensor=Sensor.TEMPERATURE,
-            reading=legacy[Sensor.TEMPERATURE],
-            timestamp=timestamp,
-        ),
-        SensorsReportReadingAction(
-            sensor=Sensor.LIGHT,
-            reading=legacy[Sensor.LIGHT],
-            timestamp=timestamp,
-        ),
-    )
+    legacy_changes = SAMPLER.legacy_changes(legacy)
+    if batch or legacy_changes:
+        store.dispatch(
+            SensorsReportReadingsAction(
+                timestamp=timestamp,
+                devices=tuple(batch),
+                temperature=legacy_changes.get(Sensor.TEMPERATURE),
+                light=legacy_changes.get(Sensor.LIGHT),
+            ),
+        )
+        SAMPLER.stats.actions += 1
 
-    return all_readings
+    return reported_readings
+
+
+def _publish(readings: dict[str, dict[str, float | None]]) -> None:
+    """Publish each reported device's full readings to Home Assistant.
+
+    The whole device, not just the entities that moved: every entity's value
+    template reads its own key out of the one payload.
+    """
+    for device_id, entities in readings.items():
+        # A device whose every entity failed to read has nothing to say.
+        # Publishing the all-null payload anyway would keep resetting
+        # `expire_after` on the Home Assistant side, so a sensor that has
+        # actually stopped working would report `unknown` forever instead of
+        # going *unavailable* — which is the state the user can act on.
+        if all(value is None for value in entities.values()):
+            continue
+        store.dispatch(
+            MqttPublishAction(
+                channel=ha.state_channel(device_id),
+                payload=json.dumps(entities),
+                coalesce=True,
+            ),
+        )
+        SAMPLER.stats.actions += 1
+
+
+def _log_stats(elapsed: float) -> None:
+    """Log what the last `elapsed` seconds of polling cost, then start over."""
+    stats = SAMPLER.stats
+    SAMPLER.stats = SamplingStats()
+    logger.debug(
+        'Sensors: sampling stats',
+        extra={
+            'ticks': stats.ticks,
+            'actions_per_minute': round(stats.actions * 60 / elapsed, 1),
+            'bus_seconds_per_minute': round(stats.bus_seconds * 60 / elapsed, 3),
+        },
+    )
 
 
 @store.with_state(lambda state: state.sensors)
@@ -428,6 +486,7 @@ def _mqtt_components(sensors_state: SensorsState) -> list[MqttComponent]:
 
 
 async def _monitor_sensors(end_event: asyncio.Event) -> None:
+    stats_since = time.monotonic()
     while not end_event.is_set():
         try:
             # The same lock the scan takes: a re-scan rebuilds `ACTIVE_SENSORS`
@@ -440,26 +499,16 @@ async def _monitor_sensors(end_event: asyncio.Event) -> None:
                 if end_event.is_set():
                     return
                 readings = await WORKER.run(read_sensors)
-            for device_id, entities in readings.items():
-                # A device whose every entity failed to read has nothing to
-                # say. Publishing the all-null payload anyway would keep
-                # resetting `expire_after` on the Home Assistant side, so a
-                # sensor that has actually stopped working would report
-                # `unknown` forever instead of going *unavailable* — which is
-                # the state the user can act on.
-                if all(value is None for value in entities.values()):
-                    continue
-                store.dispatch(
-                    MqttPublishAction(
-                        channel=ha.state_channel(device_id),
-                        payload=json.dumps(entities),
-                    ),
-                )
+            _publish(readings)
         except Exception:
             # One flaky poll — a blown deadline, a wedged worker — must not end
             # monitoring for the rest of the service's life.
             logger.exception('Sensors: poll failed')
             report_service_error()
+        elapsed = time.monotonic() - stats_since
+        if elapsed >= STATS_INTERVAL:
+            _log_stats(elapsed)
+            stats_since += elapsed
         await asyncio.sleep(1)
 
 
@@ -506,6 +555,9 @@ async def scan_sensors() -> None:
         report_service_error()
     else:
         _arm_persistence()
+        # The completion replaces every device with a reading-less one, so the
+        # next tick has to report everything afresh, moved or not.
+        SAMPLER.force_report()
     finally:
         store.dispatch(
             SensorsScanCompletedAction(devices=devices),
@@ -522,6 +574,12 @@ async def _handle_scan(_: SensorsScanEvent) -> None:
     await scan_sensors()
 
 
+def _handle_announce(_: MqttAnnounceRequestedEvent) -> None:
+    # Readings are not retained: a Home Assistant that has just come back knows
+    # the entities again but has no state for them until the next report.
+    SAMPLER.force_report()
+
+
 def _activate_persisted() -> tuple[SensorDeviceState, ...]:
     """Re-attach the sensors the last scan found. Blocking — call in a thread."""
     global _i2c  # noqa: PLW0603
@@ -555,7 +613,11 @@ async def _initialize() -> None:
                 SensorsScanCompletedAction(devices=devices),
                 MqttRequestAnnounceAction(),
             )
-            await WORKER.run(read_sensors)
+            SAMPLER.force_report()
+            readings = await WORKER.run(read_sensors)
+        # Published here too: these readings are now the sampler's "last
+        # reported", so the poll loop will not send them again until they move.
+        _publish(readings)
     except Exception:
         logger.exception('Sensors: start-up activation failed')
         report_service_error()
@@ -582,7 +644,7 @@ def init_service() -> Subscriptions:
         _status_bar_temperature,
     )
 
-    global _definitions, WORKER  # noqa: PLW0603
+    global _definitions, WORKER, SAMPLER  # noqa: PLW0603
 
     _definitions = load_registry()
     # A fresh instance, because the previous one's `aclose` latched it closed
@@ -590,6 +652,7 @@ def init_service() -> Subscriptions:
     # underlying thread is process-global per name either way — see
     # `BlockingWorker`.
     WORKER = BlockingWorker('sensors-i2c', deadline=I2C_CALL_TIMEOUT)
+    SAMPLER = SensorSampler()
 
     unregister_menu = init_menu(
         {definition.id: definition for definition in _definitions},
@@ -607,6 +670,12 @@ def init_service() -> Subscriptions:
 
     unregister_components = register_mqtt_components('sensors', _mqtt_components)
 
+    # Display values are converted when they are reported, so a unit-system
+    # change has to re-report readings that have not moved.
+    unit_system = store.autorun(_resolved_unit_system)(
+        lambda _: SAMPLER.force_report(),
+    )
+
     end_event = asyncio.Event()
     create_task(_monitor_sensors(end_event))
 
@@ -618,5 +687,7 @@ def init_service() -> Subscriptions:
         unregister_temp,
         unregister_components,
         *unregister_menu,
+        unit_system.unsubscribe,
         store.subscribe_event(SensorsScanEvent, _handle_scan),
+        store.subscribe_event(MqttAnnounceRequestedEvent, _handle_announce),
     ]
@@ -21,4 +21,5 @@ register(
     service_id='lightdm',
     label='LightDM',
     setup=setup,
+    shares_loop=True,
 )
@@ -16,7 +16,7 @@ import contextlib
 import json
 import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 import aiomqtt
 import commands
@@ -28,6 +28,7 @@ from constants import (
     MAX_OUTBOUND_PAYLOAD,
     MAX_TOPIC_BYTES,
     MQTT_PASSWORD_SECRET_ID,
+    OUTBOUND_MAX_IN_FLIGHT,
     OUTBOUND_OVERFLOW_LOG_INTERVAL,
     OUTBOUND_QUEUE_SIZE,
     PROBE_TIMEOUT,
@@ -35,6 +36,7 @@ from constants import (
     RECONNECT_MIN,
 )
 from discovery import build_discovery_payload, component_platforms
+from outbound import OutboundQueue
 from task_scope import TaskScope
 from topics import (
     availability_topic,
@@ -65,7 +67,7 @@ from ubo_app.utils.mqtt_registry import (
 from ubo_app.utils.secrets import read_secret
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Awaitable, Iterator, Sequence
 
     from ubo_app.store.services.mqtt import (
         MqttBrokerConfig,
@@ -74,7 +76,9 @@ if TYPE_CHECKING:
         MqttState,
     )
 
-_queue: asyncio.Queue[MqttPublishEvent] | None = None
+T = TypeVar('T')
+
+_queue: OutboundQueue | None = None
 _announce_event: asyncio.Event | None = None
 _settings_changed: asyncio.Event | None = None
 _last_overflow_log = 0.0
@@ -92,7 +96,7 @@ class BridgeState:
     """
 
     # Only accepts work while a session is live; see `_accept_publishes`.
-    queue: asyncio.Queue[MqttPublishEvent]
+    queue: OutboundQueue
     announce_event: asyncio.Event
     end_event: asyncio.Event
     # Set whenever the user changes a setting the live session was built from.
@@ -255,8 +259,10 @@ def _rejection(event: MqttPublishEvent) -> str | None:
 def enqueue(event: MqttPublishEvent) -> None:
     """Hand a publish request to the session. Dropped if nothing is connected.
 
-    Overflow is deliberate — these are live telemetry ticks that the next one
-    supersedes — but it is logged, at most once per interval, because a silently
+    A `coalesce` publish replaces any pending one for the same channel, so only
+    a backlog of events can overflow. Dropping them then is deliberate — the
+    alternative is an unbounded queue in front of a broker that is not keeping
+    up — but it is logged, at most once per interval, because a silently
     dropping queue is a debugging trap.
     """
     global _last_overflow_log  # noqa: PLW0603
@@ -472,7 +478,7 @@ async def _dispatch_messages(
                 report_service_error()
 
 
-def _drain(queue: asyncio.Queue[MqttPublishEvent]) -> None:
+def _drain(queue: OutboundQueue) -> None:
     """Throw away anything left in the outbound queue."""
     dropped = 0
     while True:
@@ -487,7 +493,7 @@ def _drain(queue: asyncio.Queue[MqttPublishEvent]) -> None:
 
 @contextlib.contextmanager
 def _accept_publishes(
-    queue: asyncio.Queue[MqttPublishEvent],
+    queue: OutboundQueue,
 ) -> Iterator[None]:
     """Let producers enqueue, but only while a session is actually live.
 
@@ -506,20 +512,72 @@ def _accept_publishes(
         _drain(queue)
 
 
+async def _unless_failed(awaitable: Awaitable[T], failed: asyncio.Future[None]) -> T:
+    """Await `awaitable`, raising instead if a publish fails in the meantime."""
+    task = asyncio.ensure_future(awaitable)
+    try:
+        await asyncio.wait((task, failed), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # Cancelled along with the pump, or beaten by a failure.
+        task.cancel()
+    if failed.done():
+        failed.result()
+    return task.result()
+
+
 async def _pump(
     client: aiomqtt.Client,
     serial: str,
-    queue: asyncio.Queue[MqttPublishEvent],
+    queue: OutboundQueue,
 ) -> None:
-    """Forward each queued publish request to the broker."""
-    while True:
-        event = await queue.get()
-        await client.publish(
-            channel_topic(serial, event.channel),
-            event.payload,
-            qos=event.qos,
-            retain=event.retain,
-        )
+    """Forward queued publishes to the broker, several in flight at once.
+
+    `client.publish` hands its message to paho synchronously and then waits for
+    the acknowledgement. Awaiting each in turn made every QoS 1 publish cost a
+    full round trip before the next could even be written. They are started in
+    queue order instead and settle on their own. Order on the wire is kept —
+    paho writes in call order, and the broker delivers a QoS ≥ 1 stream in
+    order — while the wait overlaps.
+
+    The window is bounded on purpose: while it is full nothing more leaves the
+    queue, so behind a slow broker telemetry waits where a newer value can
+    still replace it. The first failed publish ends the pump, as a failed
+    `await` did before, and with it the session.
+    """
+    window = asyncio.Semaphore(OUTBOUND_MAX_IN_FLIGHT)
+    failed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    in_flight: set[asyncio.Task[None]] = set()
+
+    def settled(task: asyncio.Task[None]) -> None:
+        in_flight.discard(task)
+        window.release()
+        if task.cancelled() or failed.done():
+            return
+        exception = task.exception()
+        if exception is not None:
+            failed.set_exception(exception)
+
+    try:
+        while True:
+            await _unless_failed(window.acquire(), failed)
+            event = await _unless_failed(queue.get(), failed)
+            task = asyncio.ensure_future(
+                client.publish(
+                    channel_topic(serial, event.channel),
+                    event.payload,
+                    qos=event.qos,
+                    retain=event.retain,
+                ),
+            )
+            in_flight.add(task)
+            task.add_done_callback(settled)
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        # Retrieved, so a failure nobody awaited is not logged as one.
+        if failed.done() and not failed.cancelled():
+            failed.exception()
 
 
 async def _session(
@@ -718,7 +776,7 @@ async def bridge_task(end_event: asyncio.Event) -> None:
     global _announce_event, _scope, _settings_changed  # noqa: PLW0603
 
     bridge = BridgeState(
-        queue=asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE),
+        queue=OutboundQueue(maxsize=OUTBOUND_QUEUE_SIZE),
         announce_event=asyncio.Event(),
         end_event=end_event,
         # Seeded from the persisted map so the first announce of this process
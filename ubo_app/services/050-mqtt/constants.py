@@ -55,10 +55,14 @@ RECONNECT_MIN = 5
 RECONNECT_MAX = 60
 
 # Several producers share the outbound queue now, so it is deeper than the
-# single-producer version it replaces. Overflow is still dropped — these are
-# live telemetry ticks that the next one supersedes — but it is logged.
+# single-producer version it replaces. State publishes coalesce per channel and
+# never need more than one slot each; overflow is still dropped, and logged.
 OUTBOUND_QUEUE_SIZE = 64
 OUTBOUND_OVERFLOW_LOG_INTERVAL = 10
+# Publishes awaiting their acknowledgement at once. Below paho's own default
+# in-flight limit of 20, so paho never has to hold messages back itself —
+# those would sit where no newer value can replace them.
+OUTBOUND_MAX_IN_FLIGHT = 16
 
 MQTT_SETTINGS_MENU_ID = 'mqtt:settings'
 MQTT_BROKER_MENU_ID = 'mqtt:broker'
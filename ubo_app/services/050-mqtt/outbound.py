@@ -0,0 +1,96 @@
+"""The bridge's outbound queue: newest value wins for state, FIFO for the rest.
+
+A plain FIFO gets a slow broker exactly backwards. It delivers the oldest
+readings first, and once full it drops the newest — so the broker receives
+stale telemetry while fresh state is thrown away.
+
+A publish marked `coalesce` is state: a newer one on the same channel makes it
+worthless. Such publishes share one pending slot per `(channel, retain)`, and a
+newer value replaces the queued one *in place*. It keeps its turn in line, so a
+channel that updates constantly cannot starve the others. Everything else —
+events like an infrared code, and any QoS ≥ 1 publish, whose sender asked for
+delivery — gets a slot of its own, and leaves in the order it arrived.
+
+Pure: nothing here knows about `aiomqtt`, so it can be tested without a broker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from ubo_app.store.services.mqtt import MqttPublishEvent
+
+
+class OutboundQueue:
+    """An `asyncio.Queue` look-alike that coalesces state publishes.
+
+    Same `put_nowait`/`get`/`get_nowait`/`qsize`/`empty` surface, raising the
+    same `QueueFull`/`QueueEmpty`, so the bridge drains and feeds it exactly as
+    it did the FIFO it replaces. A replacement never counts against `maxsize`.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Hold at most `maxsize` distinct pending publishes."""
+        self.maxsize = maxsize
+        # How many publishes a newer value superseded before they were sent.
+        self.coalesced = 0
+        self._pending: OrderedDict[Hashable, MqttPublishEvent] = OrderedDict()
+        self._sequence = itertools.count()
+        self._ready = asyncio.Event()
+
+    def _key(self, event: MqttPublishEvent) -> Hashable:
+        if event.coalesce and event.qos == 0:
+            return (event.channel, event.retain)
+        # Unique, so an ordered publish is never replaced.
+        return next(self._sequence)
+
+    def put_nowait(self, event: MqttPublishEvent) -> None:
+        """Queue a publish, replacing a pending one for the same state.
+
+        Raises:
+            asyncio.QueueFull: If it needs a slot of its own and none is left.
+
+        """
+        key = self._key(event)
+        if key in self._pending:
+            self._pending[key] = event
+            self.coalesced += 1
+            return
+        if len(self._pending) >= self.maxsize:
+            raise asyncio.QueueFull
+        self._pending[key] = event
+        self._ready.set()
+
+    def get_nowait(self) -> MqttPublishEvent:
+        """Take the publish at the head of the line.
+
+        Raises:
+            asyncio.QueueEmpty: If nothing is pending.
+
+        """
+        if not self._pending:
+            raise asyncio.QueueEmpty
+        _, event = self._pending.popitem(last=False)
+        if not self._pending:
+            self._ready.clear()
+        return event
+
+    async def get(self) -> MqttPublishEvent:
+        """Wait for a publish and take it."""
+        while not self._pending:
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def qsize(self) -> int:
+        """Return how many publishes are pending."""
+        return len(self._pending)
+
+    def empty(self) -> bool:
+        """Return whether nothing is pending."""
+        return not self._pending
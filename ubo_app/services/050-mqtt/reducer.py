@@ -80,6 +80,7 @@ def reducer(
                         payload=action.payload,
                         retain=action.retain,
                         qos=action.qos,
+                        coalesce=action.coalesce,
                     ),
                 ],
             )
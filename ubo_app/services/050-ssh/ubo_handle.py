@@ -21,4 +21,5 @@ register(
     service_id='ssh',
     label='SSH',
     setup=setup,
+    shares_loop=True,
 )
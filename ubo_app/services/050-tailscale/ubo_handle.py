@@ -21,4 +21,5 @@ register(
     service_id='tailscale',
     label='Tailscale',
     setup=setup,
+    shares_loop=True,
 )
@@ -23,4 +23,5 @@ register(
     service_id='users',
     label='Users',
     setup=setup,
+    shares_loop=True,
 )
@@ -23,4 +23,6 @@ register(
     service_id='vscode',
     label='VSCode',
     setup=setup,
+    is_lazy=True,
+    shares_loop=True,
 )
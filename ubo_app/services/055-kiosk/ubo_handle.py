@@ -21,4 +21,5 @@ register(
     service_id='kiosk',
     label='Browser Kiosk',
     setup=setup,
+    shares_loop=True,
 )
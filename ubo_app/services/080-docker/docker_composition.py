@@ -44,6 +44,7 @@ from ubo_app.store.services.notifications import (
 from ubo_app.utils import IS_RPI, secrets
 from ubo_app.utils.async_ import create_task
 from ubo_app.utils.log_process import log_async_process
+from ubo_app.utils.progress_notification import discard_progress, report_progress
 from ubo_app.utils.server import send_command
 
 if TYPE_CHECKING:
@@ -499,6 +500,7 @@ async def _handle_pull_success(
     base_notification: Notification,
 ) -> None:
     """Handle successful composition pull."""
+    discard_progress(base_notification.id)
     store.dispatch(
         NotificationsAddAction(
             notification=replace(
@@ -519,6 +521,7 @@ async def _handle_pull_error(
     process: asyncio.subprocess.Process | None = None,
 ) -> None:
     """Handle composition pull error."""
+    discard_progress(base_notification.id)
     notification_action = NotificationsAddAction(
         notification=replace(
             base_notification,
@@ -651,16 +654,14 @@ async def pull_composition(event: DockerImageFetchCompositionEvent) -> None:
                 )
                 # Count completed services
                 completed = len(completed_services)
-                store.dispatch(
-                    NotificationsAddAction(
-                        notification=replace(
-                            base_notification,
-                            content=(
-                                f'Pulling images... ({completed}/'
-                                f'{total_images if total_images > 0 else "?"}'
-                            ),
-                            progress=progress,
+                report_progress(
+                    replace(
+                        base_notification,
+                        content=(
+                            f'Pulling images... ({completed}/'
+                            f'{total_images if total_images > 0 else "?"}'
                         ),
+                        progress=progress,
                     ),
                 )
 
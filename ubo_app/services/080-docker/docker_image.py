@@ -27,6 +27,7 @@ from ubo_app.store.services.notifications import (
 )
 from ubo_app.utils import secrets
 from ubo_app.utils.async_ import to_thread
+from ubo_app.utils.progress_notification import discard_progress, report_progress
 
 # Notification IDs for progress tracking
 DOCKER_FETCH_PROGRESS_NOTIFICATION_ID = 'docker:fetch_progress:{}'
@@ -118,13 +119,11 @@ def fetch_image(  # noqa: C901
                     # Update UI periodically (debounced)
                     if progress_tracker.should_update_ui():
                         current_progress = progress_tracker.calculate_progress()
-                        store.dispatch(
-                            NotificationsAddAction(
-                                notification=replace(
-                                    base_notification,
-                                    content='Downloading image...',
-                                    progress=current_progress,
-                                ),
+                        report_progress(
+                            replace(
+                                base_notification,
+                                content='Downloading image...',
+                                progress=current_progress,
                             ),
                         )
 
@@ -158,6 +157,7 @@ def fetch_image(  # noqa: C901
             docker_client.close()
 
             # Dispatch success status and notification
+            discard_progress(base_notification.id)
             store.dispatch(
                 DockerImageSetStatusAction(
                     image=id,
@@ -180,6 +180,7 @@ def fetch_image(  # noqa: C901
                 'Failed to fetch image',
                 extra={'image': id, 'error': str(e)},
             )
+            discard_progress(base_notification.id)
             store.dispatch(
                 DockerImageSetStatusAction(
                     image=id,
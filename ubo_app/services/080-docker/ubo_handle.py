@@ -23,4 +23,5 @@ register(
     service_id='docker',
     label='Docker',
     setup=setup,
+    is_lazy=True,
 )
@@ -139,7 +139,6 @@ from ubo_app.store.core.types import (
     StackPushPromptAction,
     UpdateDynamicMenuAction,
 )
-from ubo_app.store.core.view_registry import register_menu_content_dependency
 from ubo_app.store.input.types import (
     InputFieldDescription,
     InputFieldType,
@@ -3404,157 +3403,11 @@ def _register_bindable_actions() -> None:
     )
 
 
-async def init_service() -> None:  # noqa: PLR0915
+async def init_service() -> None:
     """Initialize the assistant service."""
     _register_persistent_stores()
     _register_bindable_actions()
 
-    # Register view dependencies for menu content updates
-    register_menu_content_dependency(
-        'assistant:stt',
-        lambda s: s.assistant.selected_stt,
-    )
-    register_menu_content_dependency(
-        'assistant:llm',
-        lambda s: (
-            s.assistant.selected_llm,
-            s.assistant.generic_llm_providers,
-            s.assistant.selected_generic_llm_provider,
-        ),
-    )
-    # Model picker submenus depend on the user's per-provider selection
-    for _llm_name in LLM_ENGINES:
-        register_menu_content_dependency(
-            f'assistant:llm:models:{_llm_name.value}',
-            lambda s, ln=_llm_name: s.assistant.selected_models.get(ln, ''),
-        )
-    # Provider-detail menus depend on the provider's setup status (so the
-    # "Update" / "Delete" rows refresh) and the active model for the
-    # "Model: <current>" line when the provider is also an LLM. Changes to
-    # the secrets file are captured by the `provider_details` autorun (which
-    # keys on `secrets_monitor.value` and re-dispatches the dynamic menu),
-    # so we don't probe the filesystem here on every state tick.
-    _dedup_engines: dict[type, AIProviderMixin] = {
-        type(engine): engine
-        for engine in {
-            *STT_ENGINES.values(),
-            *LLM_ENGINES.values(),
-            *TTS_ENGINES.values(),
-            *IMAGE_GENERATOR_ENGINES.values(),
-        }
-        if engine is not None and isinstance(engine, NeedsSetupMixin)
-    }
-    for _engine in _dedup_engines.values():
-        register_menu_content_dependency(
-            f'assistant:provider:{_engine.name}',
-            lambda s, e=_engine: (
-                s.assistant.provider_setup_status.get(str(e.name), False),
-                tuple(sorted(s.assistant.selected_models.items())),
-                tuple(sorted(s.assistant.ollama_thinking_enabled.items())),
-                tuple(sorted(s.assistant.ollama_model_capabilities.items())),
-                s.assistant.selected_piper_voice,
-                s.assistant.selected_kokoro_voice,
-                s.assistant.selected_vosk_model,
-                # The "Delete Downloaded …" row appears/disappears as models
-                # are downloaded or removed.
-                tuple(s.assistant.piper_downloaded_voices),
-                tuple(s.assistant.vosk_downloaded_models),
-                tuple(s.assistant.ollama_downloaded_models),
-                s.assistant.kokoro_is_downloaded,
-            ),
-        )
-    # Ollama categorised picker depends on the current selection so the
-    # checkmark on the current category re-renders when the user picks a new
-    # model.
-    register_menu_content_dependency(
-        'assistant:ollama:categories',
-        lambda s: s.assistant.selected_models.get(
-            AssistantLLMName.OLLAMA,
-            '',
-        ),
-    )
-    for _category in OLLAMA_CATALOG:
-        register_menu_content_dependency(
-            f'assistant:ollama:models:{_category.id}',
-            lambda s: s.assistant.selected_models.get(
-                AssistantLLMName.OLLAMA,
-                '',
-            ),
-        )
-    # Delete-downloaded-model submenus list every downloaded model, so they
-    # depend only on the downloaded set (a row vanishes after deletion).
-    register_menu_content_dependency(
-        'assistant:ollama:delete-models',
-        lambda s: tuple(s.assistant.ollama_downloaded_models),
-    )
-    register_menu_content_dependency(
-        'assistant:piper:delete-voices',
-        lambda s: tuple(s.assistant.piper_downloaded_voices),
-    )
-    register_menu_content_dependency(
-        'assistant:vosk:delete-models',
-        lambda s: tuple(s.assistant.vosk_downloaded_models),
-    )
-    register_menu_content_dependency(
-        'assistant:tts',
-        lambda s: s.assistant.selected_tts,
-    )
-    # Piper picker depends on the current voice selection (for the
-    # checkmark) and on the system language (for which non-English
-    # languages are visible in the picker).
-    register_menu_content_dependency(
-        'assistant:piper:languages',
-        lambda s: (
-            s.assistant.selected_piper_voice,
-            s.localization.language,
-        ),
-    )
-    for _language in PIPER_LANGUAGES:
-        register_menu_content_dependency(
-            f'assistant:piper:voices:{_language.code.value}',
-            lambda s: (
-                s.assistant.selected_piper_voice,
-                tuple(s.assistant.piper_downloaded_voices),
-            ),
-        )
-    # Kokoro mirrors the Piper picker: language menu depends on the
-    # current voice (for the checkmark) and the system language (for
-    # which non-English languages are visible); each per-language voice
-    # menu depends on the current voice and the single
-    # ``kokoro_is_downloaded`` flag (the bundle is all-or-nothing).
-    register_menu_content_dependency(
-        'assistant:kokoro:languages',
-        lambda s: (
-            s.assistant.selected_kokoro_voice,
-            s.localization.language,
-        ),
-    )
-    for _kokoro_lang in KOKORO_LANGUAGES:
-        register_menu_content_dependency(
-            f'assistant:kokoro:voices:{_kokoro_lang.code.value}',
-            lambda s: (
-                s.assistant.selected_kokoro_voice,
-                s.assistant.kokoro_is_downloaded,
-            ),
-        )
-    register_menu_content_dependency(
-        'assistant:image_gen',
-        lambda s: s.assistant.selected_image_generator,
-    )
-    register_menu_content_dependency(
-        'assistant:provider_status',
-        lambda s: tuple(s.assistant.provider_setup_status.items()),
-    )
-    # Covers the list menu and every per-prompt detail page — both are rebuilt
-    # from these two slices.
-    register_menu_content_dependency(
-        SYSTEM_PROMPT_MENU_ID,
-        lambda s: (
-            s.assistant.system_prompts,
-            s.assistant.is_default_system_prompt_enabled,
-        ),
-    )
-
     (
         _secrets_monitor,
         _providers,
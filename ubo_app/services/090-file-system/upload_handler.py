@@ -19,6 +19,7 @@ from ubo_app.store.services.notifications import (
     NotificationDisplayType,
     NotificationsAddAction,
 )
+from ubo_app.utils.progress_notification import discard_progress, report_progress
 
 if TYPE_CHECKING:
     from ubo_app.store.services.file_upload import (
@@ -56,6 +57,7 @@ def _fail_upload(upload_id: str, content: str) -> None:
     from ubo_app.utils.file_upload import register_failed_upload
 
     register_failed_upload(upload_id, content)
+    discard_progress(_upload_notification_id(upload_id))
     store.dispatch(
         NotificationsAddAction(
             notification=Notification(
@@ -215,19 +217,19 @@ def handle_upload_chunk(event: FileUploadChunkEvent) -> None:
 
     progress = len(session.received_chunks) / session.total_chunks
 
-    store.dispatch(
-        NotificationsAddAction(
-            notification=Notification(
-                id=_upload_notification_id(event.upload_id),
-                title='Uploading',
-                content=f'Uploading {Path(session.filename).name}...'
-                f' ({len(session.received_chunks)}'
-                f'/{session.total_chunks})',
-                icon='󰅧',
-                display_type=NotificationDisplayType.STICKY,
-                progress=progress,
-                show_dismiss_action=False,
-            ),
+    # Chunks arrive far faster than the screen can show them; the channel
+    # coalesces them and always delivers the final, complete one.
+    report_progress(
+        Notification(
+            id=_upload_notification_id(event.upload_id),
+            title='Uploading',
+            content=f'Uploading {Path(session.filename).name}...'
+            f' ({len(session.received_chunks)}'
+            f'/{session.total_chunks})',
+            icon='󰅧',
+            display_type=NotificationDisplayType.STICKY,
+            progress=progress,
+            show_dismiss_action=False,
         ),
     )
 
@@ -244,6 +246,7 @@ def handle_upload_complete(event: FileUploadCompleteEvent) -> None:
 
     session.file_handle.close()
 
+    discard_progress(_upload_notification_id(event.upload_id))
     safe_filename = Path(session.filename).name or 'uploaded_file'
 
     expected_chunks = set(range(session.total_chunks))
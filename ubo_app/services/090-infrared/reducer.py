@@ -235,6 +235,12 @@ def reducer(
                 registered_devices=new_devices,
             )
 
+        case InfraredHandleReceivedCodeAction(repeat=True) if (
+            state.is_registering_device
+        ):
+            # Holding the button is one signal, not five.
+            return state
+
         case InfraredHandleReceivedCodeAction() if state.is_registering_device:
             ir_code_key = f'{action.protocol}:{action.scancode}'
             current_count = state.registration_signal_counts.get(ir_code_key, 0)
@@ -342,7 +348,8 @@ def reducer(
                 None,
             )
             if device is not None:
-                if device.bound_action_key is None:
+                # A held button fires its bound action once.
+                if device.bound_action_key is None or action.repeat:
                     return state
                 return CompleteReducerResult(
                     state=state,
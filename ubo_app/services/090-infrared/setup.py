@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+import time
 from typing import TYPE_CHECKING
 
 import ha
@@ -55,8 +56,10 @@ from ubo_app.store.services.mqtt import (
     MqttPublishAction,
     MqttRequestAnnounceAction,
 )
+from ubo_app.store.tracing import LatencyHistogram
 from ubo_app.utils.async_ import create_task
 from ubo_app.utils.bindable_action_input import prompt_for_parameters
+from ubo_app.utils.infrared import InfraredCode
 from ubo_app.utils.input import ubo_input
 from ubo_app.utils.menu_items import (
     SELECTED_ITEM_PARAMETERS,
@@ -80,29 +83,12 @@ def _should_receive_keypad_actions(value: bool) -> bool:  # noqa: FBT001
     return value
 
 
-MIN_ZERO_BITS_FOR_VALID_IMON = 6
-
 # Dropdown label for "no bound action" (replay-only key).
 NO_ACTION_LABEL = 'None'
 
 
-def _is_ir_noise(protocol: str, scancode: str) -> bool:
-    """Filter imon protocol noise: scancodes with fewer than 6 zero bits.
-
-    Noise patterns like 0x7fffffff, 0x7ff7ffff, 0x7fbfffff have very few
-    zero bits; real imon scancodes typically have more.
-    """
-    if protocol.lower() != 'imon':
-        return False
-    try:
-        value = int(scancode, 0) & 0xFFFFFFFF
-        ones = value.bit_count()
-        zero_bits = 32 - ones
-    except (ValueError, TypeError):
-        return False
-    else:
-        return zero_bits < MIN_ZERO_BITS_FOR_VALID_IMON
-
+# From the kernel decoding a code to its action being dispatched, in µs.
+RECEIVE_LATENCY = LatencyHistogram()
 
 ir_ctl_lock = asyncio.Lock()
 ir_commands_queue = asyncio.Queue()
@@ -165,20 +151,7 @@ async def _wait_for_ir_code() -> None:  # noqa: C901
                         break
                     if response == 'nocode':
                         break
-                    protocol, scancode = response.split(':')
-                    if _is_ir_noise(protocol, scancode):
-                        continue
-                    logger.info(
-                        'Received IR code from system manager',
-                        extra={'protocol': protocol, 'scancode': scancode},
-                    )
-                    store.dispatch(
-                        InfraredHandleReceivedCodeAction(
-                            protocol=protocol,
-                            scancode=scancode,
-                        ),
-                    )
-                    _publish_received(protocol, scancode)
+                    _handle_received(response)
             except asyncio.CancelledError:
                 if generator is not None:
                     with contextlib.suppress(
@@ -200,6 +173,35 @@ async def _wait_for_ir_code() -> None:  # noqa: C901
             logger.exception('Failed to send infrared receive command')
 
 
+def _handle_received(line: str) -> None:
+    try:
+        code = InfraredCode.from_line(line)
+    except ValueError:
+        logger.warning('Malformed IR code from system manager', extra={'line': line})
+        return
+    store.dispatch(
+        InfraredHandleReceivedCodeAction(
+            protocol=code.protocol,
+            scancode=code.scancode,
+            repeat=code.repeat,
+        ),
+    )
+    latency = (time.monotonic_ns() - code.timestamp) // 1000
+    RECEIVE_LATENCY.record(latency)
+    logger.info(
+        'Received IR code from system manager',
+        extra={
+            'protocol': code.protocol,
+            'scancode': code.scancode,
+            'repeat': code.repeat,
+            'latency_us': latency,
+            'latency_p90_us': RECEIVE_LATENCY.percentile(90),
+        },
+    )
+    if not code.repeat:
+        _publish_received(code.protocol, code.scancode)
+
+
 _instruction_id: str | None = None
 
 
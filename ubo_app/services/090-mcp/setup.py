@@ -37,10 +37,7 @@ from ubo_app.store.core.types import (
     StackPushMenuAction,
     UpdateDynamicMenuAction,
 )
-from ubo_app.store.core.view_registry import (
-    register_menu_content_dependency,
-    register_path_menu_matcher,
-)
+from ubo_app.store.core.view_registry import register_path_menu_matcher
 from ubo_app.store.input.types import (
     InputFieldDescription,
     InputFieldType,
@@ -352,17 +349,6 @@ async def init_service() -> Subscriptions:  # noqa: C901, PLR0915
     _ensure_gateway_token()
     _register_persistent_stores()
 
-    # Menu content dependencies so the visible MCP menus recompute when the
-    # enabled set or the configured-server set changes.
-    unregister_enabled_dependency = register_menu_content_dependency(
-        'mcp:enabled',
-        lambda s: tuple(s.mcp.enabled_mcp_servers),
-    )
-    unregister_servers_dependency = register_menu_content_dependency(
-        'mcp:servers',
-        lambda s: tuple(s.mcp.mcp_servers.keys()),
-    )
-
     _mcp_action_ids: list[str] = []
     _mcp_server_unsubscribers: dict[str, Callable] = {}
     # Stable notification ids we have raised for currently-failed servers, so we
@@ -703,8 +689,6 @@ async def init_service() -> Subscriptions:  # noqa: C901, PLR0915
 
     return [
         *subscriptions,
-        unregister_enabled_dependency,
-        unregister_servers_dependency,
         unregister_path_matcher,
         mcp_servers_menu.unsubscribe,
         mcp_status_notifier.unsubscribe,
@@ -57,4 +57,5 @@ register(
     setup=setup,
     binary_path='bin/ubo-mcp-gateway',
     binary_env_provider=binary_env_provider,
+    is_lazy=True,
 )
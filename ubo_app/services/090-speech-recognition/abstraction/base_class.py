@@ -22,6 +22,14 @@ _WAKE_ENGINE_NAMES = {member.value for member in WakeWordEngineName}
 class BaseSpeechRecognitionEngine(BackgroundRunningMixin):
     """Base class for speech recognition engines."""
 
+    pre_roll_seconds: float | None = None
+    """Lead-in audio the engine needs to catch speech from its start.
+
+    An engine that sets it is held back by the voice-activity gate during
+    silence and gets this much of the buffered mic audio when the gate opens;
+    None has it hear every chunk.
+    """
+
     @override
     def __init__(self, *, label: str | None = None) -> None:
         """Initialize speech recognition engine."""
@@ -32,6 +40,10 @@ class BaseSpeechRecognitionEngine(BackgroundRunningMixin):
         """Queue a chunk of audio data for processing."""
         await self.input_queue.put(chunk)
 
+    def hears_silence(self) -> bool:
+        """Whether the engine gets the mic audio the voice-activity gate holds back."""
+        return self.pre_roll_seconds is None
+
     @override
     def run(self) -> bool:
         if not super().run():
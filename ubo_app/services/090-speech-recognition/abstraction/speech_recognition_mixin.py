@@ -5,7 +5,9 @@ from __future__ import annotations
 import abc
 from typing import TYPE_CHECKING, cast, final, overload
 
+from constants import MAX_UTTERANCE_SECONDS
 from typing_extensions import override
+from utterance_buffer import UtteranceBuffer
 
 from abstraction.base_class import BaseSpeechRecognitionEngine
 from ubo_app.logger import logger
@@ -23,14 +25,14 @@ class Recognition:
 
     def __init__(self, engine_name: SpeechRecognitionEngineName) -> None:
         """Initialize a recognition instance."""
-        self.audio = b''
+        self.audio = UtteranceBuffer(max_seconds=MAX_UTTERANCE_SECONDS)
         self.text = ''
         self.engine_name = engine_name
 
     @final
     def append_voice(self, data: bytes) -> None:
         """Append a chunk of audio data to the ongoing voice recognition."""
-        self.audio += data
+        self.audio.append(data)
 
     @final
     def append_text(self, text: str) -> None:
@@ -92,6 +94,12 @@ class SpeechRecognitionMixin(BaseSpeechRecognitionEngine, abc.ABC):
         """Check if the speech recognition engine should be running."""
         return self.ongoing_recognition is not None or super().should_be_running()
 
+    @override
+    def hears_silence(self) -> bool:
+        # An armed grammar keeps hearing everything: the recognition's audio
+        # stays whole, and the pauses it waits through are where commands end.
+        return self.ongoing_recognition is not None or super().hears_silence()
+
     @overload
     async def activate_speech_recognition(
         self,
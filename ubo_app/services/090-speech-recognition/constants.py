@@ -3,3 +3,6 @@
 # Seconds to keep listening for a short voice command after the wake word
 # before giving up and returning to idle.
 INTENTS_LISTENING_TIMEOUT_SECONDS = 10
+
+# Seconds of a recognition's audio to keep; a longer dictation keeps its end.
+MAX_UTTERANCE_SECONDS = 120
@@ -11,6 +11,7 @@ from matching import expand_phrases, match_recognition, stop_talking_triggers
 from mic_buffer import MicBuffer
 from microwakeword_engine import MicroWakeWordEngine
 from openwakeword_engine import OpenWakeWordEngine
+from voice_activity import VoiceActivityGate
 from vosk_engine import VoskEngine
 
 from ubo_app.constants import DATA_PATH
@@ -87,6 +88,7 @@ class EnginesManager:
             duration_seconds=_MIC_BUFFER_DURATION_SECONDS,
             output_dir=_MIC_BUFFER_OUTPUT_DIR,
         )
+        self.voice_activity = VoiceActivityGate()
 
         sync_wake_engines = store.autorun(
             lambda state: (
@@ -147,17 +149,30 @@ class EnginesManager:
 
         On-device wake-word/speech recognition only consumes the system mic;
         audio streamed from remote clients (browser, mobile) carries a non-empty
-        ``audio_source`` and is ignored here.
+        ``audio_source`` and is ignored here. Engines with a ``pre_roll_seconds``
+        are held back while the voice-activity gate is closed, see
+        ``voice_activity``.
         """
         if event.audio_source:
             return
-        self.mic_buffer.add(event.timestamp, event.sample)
+        chunk = event.sample_speech_recognition
+        self.mic_buffer.add(event.timestamp, event.sample, chunk)
+        activity = self.voice_activity.update(chunk)
         targets = {
             self._speech_engine,
             *(self._wake_engines[name] for name in self._enabled_engines),
         }
         for engine in targets:
-            await engine.queue_audio_chunk(event.sample_speech_recognition)
+            pre_roll = engine.pre_roll_seconds
+            if pre_roll is None or engine.hears_silence():
+                await engine.queue_audio_chunk(chunk)
+            elif activity.opened:
+                # Speech starts after silence the engine didn't hear: hand it
+                # the lead-in it needs, this chunk included, as one chunk so
+                # the engine's evicting queue keeps all of it.
+                await engine.queue_audio_chunk(self.mic_buffer.lead_in(pre_roll))
+            elif activity.is_open:
+                await engine.queue_audio_chunk(chunk)
 
     async def _sync_wake_engines(
         self,
@@ -3,7 +3,9 @@
 Holds the most recent ``duration_seconds`` of raw mic audio in memory; on
 demand (e.g. when an assistant wake phrase or stop-talking phrase is heard)
 writes the buffer to a timestamped WAV file under ``output_dir`` so the
-phrase + immediate audio context can be reviewed offline.
+phrase + immediate audio context can be reviewed offline. It also keeps the
+speech-recognition copy of each sample, to replay as lead-in to engines the
+voice-activity gate held back.
 """
 
 from __future__ import annotations
@@ -43,13 +45,35 @@ class MicBuffer:
         self._duration = duration_seconds
         self._output_dir = output_dir
         self._buffer: deque[tuple[float, AudioSample]] = deque()
+        self._speech_recognition: deque[tuple[float, bytes]] = deque()
 
-    def add(self, timestamp: float, sample: AudioSample) -> None:
+    def add(
+        self,
+        timestamp: float,
+        sample: AudioSample,
+        speech_recognition_sample: bytes = b'',
+    ) -> None:
         """Append a new sample and prune entries older than the window."""
         self._buffer.append((timestamp, sample))
         cutoff = timestamp - self._duration
         while self._buffer and self._buffer[0][0] < cutoff:
             self._buffer.popleft()
+        if speech_recognition_sample:
+            self._speech_recognition.append((timestamp, speech_recognition_sample))
+        while self._speech_recognition and self._speech_recognition[0][0] < cutoff:
+            self._speech_recognition.popleft()
+
+    def lead_in(self, seconds: float) -> bytes:
+        """Speech-recognition audio of the last ``seconds``, latest sample included."""
+        if not self._speech_recognition:
+            return b''
+        cutoff = self._speech_recognition[-1][0] - seconds
+        chunks: list[bytes] = []
+        for timestamp, chunk in reversed(self._speech_recognition):
+            if timestamp < cutoff:
+                break
+            chunks.append(chunk)
+        return b''.join(reversed(chunks))
 
     def dump(self, phrase: str) -> Path | None:
         """Write the current buffer to a WAV file. Returns the written path."""
@@ -24,7 +24,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
 
 from abstraction.wake_word_recognition_mixin import WakeWordRecognitionMixin
+from model_manager import model_manager
 from typing_extensions import override
+from wake_features import MicroWakeWordFrontEnd
 
 from ubo_app.engines.microwakeword_catalog import MODELS_DIR
 from ubo_app.logger import logger
@@ -34,7 +36,7 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from abstraction.wake_word_recognition_mixin import WakeTrigger
-    from pymicro_wakeword import MicroWakeWord, MicroWakeWordFeatures
+    from pymicro_wakeword import MicroWakeWord
 
 __all__ = [
     'MODELS_DIR',
@@ -52,6 +54,9 @@ __all__ = [
 _REQUIRED_MANIFEST_KEYS = ('wake_word', 'micro')
 _REQUIRED_MICRO_KEYS = ('probability_cutoff', 'sliding_window_size')
 
+# ``model_manager`` key of the frontend every model shares.
+_FRONT_END_KEY = 'microwakeword:features'
+
 
 class StagingPaths(NamedTuple):
     """Where the two halves of an in-flight download live before install."""
@@ -282,9 +287,12 @@ def delete_model(model_id: str) -> None:
 class MicroWakeWordEngine(WakeWordRecognitionMixin):
     """microWakeWord wake-word detection engine."""
 
+    # Covers the streaming model's receptive field ahead of the wake word.
+    pre_roll_seconds = 1.5
+
     def __init__(self) -> None:
         """Initialize the microWakeWord engine."""
-        self._features: MicroWakeWordFeatures | None = None
+        self._front_end: MicroWakeWordFrontEnd | None = None
         self._models: dict[str, MicroWakeWord] = {}
         # Maps of enabled model id -> trigger id and -> sensitivity, plus the
         # signature of the currently-loaded model set (so we only rebuild on
@@ -352,13 +360,16 @@ class MicroWakeWordEngine(WakeWordRecognitionMixin):
         Each :class:`MicroWakeWord` owns a ``TfLiteInterpreter`` allocated
         outside Python's heap; dropping the reference without ``close()`` leaks
         it until the (non-deterministic) finalizer runs. Called on every reload,
-        so a user toggling triggers doesn't accumulate interpreters.
+        so a user toggling triggers doesn't accumulate interpreters. The front
+        end is only released: it stays cached, warm, for the next set.
         """
         for model in self._models.values():
             with contextlib.suppress(Exception):
                 model.close()
         self._models = {}
-        self._features = None
+        if self._front_end is not None:
+            model_manager.release(_FRONT_END_KEY)
+            self._front_end = None
 
     def _load_models(self) -> None:
         """Load the enabled models from :data:`MODELS_DIR`.
@@ -369,7 +380,11 @@ class MicroWakeWordEngine(WakeWordRecognitionMixin):
 
         """
         try:
-            from pymicro_wakeword import MicroWakeWordFeatures
+            front_end = model_manager.acquire(
+                _FRONT_END_KEY,
+                MicroWakeWordFrontEnd,
+                engine='microwakeword',
+            )
         except ImportError as error:
             msg = 'pymicro-wakeword package not installed'
             logger.exception(msg)
@@ -396,13 +411,14 @@ class MicroWakeWordEngine(WakeWordRecognitionMixin):
             models[model_id] = model
 
         if not models:
+            model_manager.release(_FRONT_END_KEY)
             msg = f'No enabled microWakeWord models could be loaded from {MODELS_DIR}'
             raise RuntimeError(msg)
 
-        # One frontend shared across every model — they all consume the same
+        # One front end shared across every model — they all consume the same
         # feature frames, so computing them once is the whole point of the
         # streaming design.
-        self._features = MicroWakeWordFeatures()
+        self._front_end = front_end
         self._models = models
         logger.info(
             'microWakeWord models loaded',
@@ -414,10 +430,12 @@ class MicroWakeWordEngine(WakeWordRecognitionMixin):
 
         Synchronous and CPU-bound — call it off the event loop.
         """
-        if self._features is None:
+        front_end = self._front_end
+        if front_end is None:
             return []
         fired: list[str] = []
-        for frame in self._features.process_streaming(chunk):
+        for index in front_end.push(chunk):
+            frame = front_end.frame(index)
             for model_id, model in self._models.items():
                 if not model.process_streaming(frame):
                     continue
@@ -444,7 +462,7 @@ class MicroWakeWordEngine(WakeWordRecognitionMixin):
         """Consume mic audio and push detected wake words onto the queue."""
         while self.should_be_running():
             chunk = await self.input_queue.get()
-            if self._features is None:
+            if self._front_end is None:
                 # No model yet (not downloaded / failed to load). Drop audio and
                 # keep the loop alive so a runtime download self-heals.
                 continue
@@ -0,0 +1,306 @@
+"""Shared, lazily-loaded store of speech-recognition models.
+
+Vosk and OpenWakeWord each used to load their models on their own and hold them
+for as long as the engine object lived, so a model the user switched away from
+stayed resident next to its replacement and nothing knew how much memory either
+took. Engines now go through :data:`model_manager`:
+
+- :meth:`ModelManager.acquire` loads a model on first use (or hands out the
+  already-loaded instance) and counts its users;
+- :meth:`ModelManager.release` drops a user; the model stays cached while idle,
+  so switching back or restarting an engine does not pay for a reload;
+- once the models together exceed the resident budget
+  (``SPEECH_RECOGNITION_MODEL_MEMORY_BUDGET``), idle ones are evicted least
+  recently used first. A model in use is never evicted.
+
+Each model's load time and the growth of the process's resident set while it
+loaded are published to ``state.speech_recognition.loaded_models``.
+
+Both loaders take file paths and hand them to native code (Kaldi, onnxruntime)
+that reads the files itself, so there is no buffer here to memory-map; the page
+cache is what a reload after eviction reuses.
+"""
+
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from ubo_app.constants import SPEECH_RECOGNITION_MODEL_MEMORY_BUDGET
+from ubo_app.logger import logger
+from ubo_app.store.main import store
+from ubo_app.store.services.speech_recognition import (
+    LoadedModelInfo,
+    SpeechRecognitionSetLoadedModelsAction,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar('T')
+
+_STATM = Path('/proc/self/statm')
+
+try:
+    import resource
+
+    _PAGE_SIZE = resource.getpagesize()
+except ImportError:  # pragma: no cover - non-POSIX
+    _PAGE_SIZE = 4096
+
+
+def _resident_bytes() -> int | None:
+    """Return the process's resident set size, or None where /proc is absent."""
+    try:
+        return int(_STATM.read_text().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+@dataclass
+class _Entry(Generic[T]):
+    model: T
+    engine: str
+    load_seconds: float
+    resident_bytes: int
+    close: Callable[[T], None] | None
+    users: int = 0
+    last_used: float = 0.0
+
+
+@dataclass
+class _Loading:
+    """A load in progress, for other acquirers of the same key to wait on."""
+
+    done: threading.Event
+    loaded: bool = False
+    failed: bool = False
+
+
+class ModelManager:
+    """Reference-counted LRU cache of loaded models under a memory budget."""
+
+    def __init__(
+        self,
+        *,
+        budget_bytes: int,
+        on_change: Callable[[tuple[LoadedModelInfo, ...]], None] | None = None,
+    ) -> None:
+        """Create a manager evicting idle models beyond ``budget_bytes``."""
+        self.budget_bytes = budget_bytes
+        self._on_change = on_change
+        self._lock = threading.RLock()
+        self._entries: dict[str, _Entry[Any]] = {}
+        self._loading: dict[str, _Loading] = {}
+        # Loads run outside `_lock`, one at a time: each is measured by how
+        # much the resident set grows meanwhile, and two models loading at
+        # once would also peak at both their sizes.
+        self._load_lock = threading.Lock()
+
+    def acquire(
+        self,
+        key: str,
+        loader: Callable[[], T | None],
+        *,
+        engine: str,
+        close: Callable[[T], None] | None = None,
+        path: Path | None = None,
+    ) -> T | None:
+        """Return the model for ``key``, loading it if needed, and count a user.
+
+        ``loader`` returns ``None`` when the model is not ready (not downloaded,
+        mid-extraction); nothing is cached then and ``None`` is returned.
+        Where resident memory can not be measured (no ``/proc``) the size of
+        the model files under ``path`` is recorded instead. The load runs
+        without holding the manager's lock; a concurrent acquire of the same
+        key waits for it and shares its result.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    return self._use(entry)
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = _Loading(done=threading.Event())
+                    break
+            loading.done.wait()
+            if not loading.loaded and not loading.failed:
+                return None
+            # Loaded, then possibly evicted already, or failed in the other
+            # acquirer: look again, and load it here if need be.
+
+        try:
+            entry = self._load(key, loader, engine=engine, close=close, path=path)
+        except BaseException:
+            with self._lock:
+                del self._loading[key]
+            loading.failed = True
+            loading.done.set()
+            raise
+        model = None
+        with self._lock:
+            del self._loading[key]
+            if entry is not None:
+                self._entries[key] = entry
+                loading.loaded = True
+                model = self._use(entry)
+        loading.done.set()
+        return model
+
+    def _load(
+        self,
+        key: str,
+        loader: Callable[[], T | None],
+        *,
+        engine: str,
+        close: Callable[[T], None] | None,
+        path: Path | None,
+    ) -> _Entry[T] | None:
+        with self._load_lock:
+            before = _resident_bytes()
+            started_at = time.monotonic()
+            model = loader()
+            if model is None:
+                return None
+            load_seconds = time.monotonic() - started_at
+            after = _resident_bytes()
+        resident = (
+            max(after - before, 0)
+            if before is not None and after is not None
+            else (directory_size(path) if path is not None else 0)
+        )
+        logger.info(
+            'speech-recognition: model loaded',
+            extra={
+                'key': key,
+                'load_seconds': round(load_seconds, 3),
+                'resident_mib': round(resident / 2**20, 1),
+            },
+        )
+        return _Entry(
+            model=model,
+            engine=engine,
+            load_seconds=load_seconds,
+            resident_bytes=resident,
+            close=close,
+        )
+
+    def _use(self, entry: _Entry[T]) -> T:
+        entry.users += 1
+        entry.last_used = time.monotonic()
+        self._enforce_budget()
+        self._publish()
+        return entry.model
+
+    def release(self, key: str) -> None:
+        """Drop one user of ``key``; the model stays cached until evicted."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.users == 0:
+                return
+            entry.users -= 1
+            entry.last_used = time.monotonic()
+            self._enforce_budget()
+            self._publish()
+
+    def peek(self, key: str) -> Any | None:  # noqa: ANN401
+        """Return the model for ``key`` if loaded, without counting a user."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry.model
+
+    @property
+    def resident_bytes(self) -> int:
+        """Total resident memory attributed to the loaded models."""
+        with self._lock:
+            return sum(entry.resident_bytes for entry in self._entries.values())
+
+    def snapshot(self) -> tuple[LoadedModelInfo, ...]:
+        """Return the loaded models, most recently used first."""
+        with self._lock:
+            return tuple(
+                LoadedModelInfo(
+                    key=key,
+                    engine=entry.engine,
+                    load_seconds=entry.load_seconds,
+                    resident_bytes=entry.resident_bytes,
+                    users=entry.users,
+                )
+                for key, entry in sorted(
+                    self._entries.items(),
+                    key=lambda item: item[1].last_used,
+                    reverse=True,
+                )
+            )
+
+    def _enforce_budget(self) -> None:
+        total = sum(entry.resident_bytes for entry in self._entries.values())
+        if total <= self.budget_bytes:
+            return
+        idle = sorted(
+            (
+                (entry.last_used, key)
+                for key, entry in self._entries.items()
+                if entry.users == 0
+            ),
+        )
+        evicted = False
+        for _, key in idle:
+            if total <= self.budget_bytes:
+                break
+            entry = self._entries.pop(key)
+            total -= entry.resident_bytes
+            if entry.close is not None:
+                try:
+                    entry.close(entry.model)
+                except Exception:
+                    logger.exception(
+                        'speech-recognition: failed to close evicted model',
+                        extra={'key': key},
+                    )
+            logger.info(
+                'speech-recognition: model evicted',
+                extra={
+                    'key': key,
+                    'resident_mib': round(entry.resident_bytes / 2**20, 1),
+                },
+            )
+            evicted = True
+        if evicted:
+            # Native models are freed from their Python finalizers; collect now
+            # so the memory is actually returned before the next load.
+            gc.collect()
+        if total > self.budget_bytes:
+            logger.warning(
+                'speech-recognition: models in use exceed the memory budget',
+                extra={
+                    'resident_mib': round(total / 2**20, 1),
+                    'budget_mib': round(self.budget_bytes / 2**20, 1),
+                },
+            )
+
+    def _publish(self) -> None:
+        if self._on_change is not None:
+            self._on_change(self.snapshot())
+
+
+def _dispatch_loaded_models(models: tuple[LoadedModelInfo, ...]) -> None:
+    store.dispatch(SpeechRecognitionSetLoadedModelsAction(models=models))
+
+
+model_manager = ModelManager(
+    budget_bytes=SPEECH_RECOGNITION_MODEL_MEMORY_BUDGET * 2**20,
+    on_change=_dispatch_loaded_models,
+)
+
+
+def directory_size(path: Path) -> int:
+    """Return the total size of the files under ``path`` (or of ``path``)."""
+    if path.is_file():
+        return path.stat().st_size
+    return sum(item.stat().st_size for item in path.rglob('*') if item.is_file())
@@ -9,12 +9,21 @@ and detections are pushed onto ``woke_word_recognitions_queue``.
 from __future__ import annotations
 
 import asyncio
+import functools
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 from abstraction.wake_word_recognition_mixin import WakeWordRecognitionMixin
+from model_manager import model_manager
 from typing_extensions import override
+from wake_features import (
+    OPENWAKEWORD_EMBEDDING_WIDTH,
+    OPENWAKEWORD_FRAME_SAMPLES,
+    FeatureRing,
+    OpenWakeWordFrontEnd,
+    OpenWakeWordHead,
+)
 
 from ubo_app.constants import DATA_PATH
 from ubo_app.logger import logger
@@ -24,11 +33,9 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from abstraction.wake_word_recognition_mixin import WakeTrigger
-    from openwakeword.model import Model
 
 # Audio parameters expected by OpenWakeWord: 16kHz, 16-bit PCM mono.
-_CHUNK_SIZE = 1280  # 80ms at 16kHz (openwakeword default)
-_BYTES_PER_CHUNK = _CHUNK_SIZE * 2  # 16-bit samples
+_BYTES_PER_CHUNK = OPENWAKEWORD_FRAME_SAMPLES * 2  # 16-bit samples
 # Fallback sensitivity (0.0-1.0) when a stem has no configured value; the engine
 # activates a model when its confidence is >= ``1 - sensitivity``.
 _DEFAULT_SENSITIVITY = 0.5
@@ -38,8 +45,8 @@ MODELS_DIR = DATA_PATH / 'openwakeword' / 'models'
 
 # Helper models that are part of the OpenWakeWord pipeline, not wake words.
 _HELPER_MODEL_STEMS = {'embedding_model', 'melspectrogram', 'silero_vad'}
-# Shared feature-extractor helpers, passed to ``Model`` directly so we never have
-# to copy them into openwakeword's (possibly read-only) package resources dir.
+# Shared feature-extractor helpers, loaded from here directly so we never have to
+# copy them into openwakeword's (possibly read-only) package resources dir.
 _MELSPEC_PATH = MODELS_DIR / 'melspectrogram.onnx'
 _EMBEDDING_PATH = MODELS_DIR / 'embedding_model.onnx'
 _SILERO_VAD_PATH = MODELS_DIR / 'silero_vad.onnx'
@@ -49,11 +56,19 @@ _SILERO_VAD_PATH = MODELS_DIR / 'silero_vad.onnx'
 # openWakeWord's bundled models were trained/recommended for.
 _VAD_THRESHOLD = 0.5
 
+# ``model_manager`` keys: one front end, whatever the triggers, and one head
+# per wake-word model.
+_FRONT_END_KEY = 'openwakeword:features'
+
+
+def _head_key(stem: str) -> str:
+    return f'openwakeword:{stem}'
+
 
 def scan_models() -> list[str]:
     """Return the loadable wake-word model stems on disk (helpers excluded), sorted.
 
-    Only ``.onnx`` files are listed because :meth:`_load_models` loads that format
+    Only ``.onnx`` files are listed because :func:`_load_head` loads that format
     exclusively — so every stem the UI shows is actually loadable.
     """
     if not MODELS_DIR.exists():
@@ -90,27 +105,20 @@ def is_loadable_onnx(data: bytes) -> bool:
 
 
 def helpers_available() -> bool:
-    """Whether the shared feature-extractor helpers are on disk (Model needs them)."""
+    """Whether the shared feature-extractor helpers every model needs are on disk."""
     return all(
         (MODELS_DIR / f'{stem}.onnx').exists()
         for stem in ('embedding_model', 'melspectrogram')
     )
 
 
-# NOTE: ``Model`` is handed the melspectrogram/embedding paths explicitly (via its
-# ``**kwargs`` → ``AudioFeatures``) so it loads our downloaded feature extractors
-# directly instead of reading — and us copying into — its package resources dir,
-# which is fragile under read-only / system installs.
-
+def _enable_vad(front_end: OpenWakeWordFrontEnd) -> None:
+    """Turn on Silero VAD for *front_end*, gated on our downloaded VAD file.
 
-def _enable_vad(model: Model) -> None:
-    """Turn on Silero VAD for *model*, gated on our downloaded VAD file.
-
-    ``Model`` builds its VAD from the package resources dir with no path override,
-    and we deliberately don't populate that dir — so we inject a VAD pointed at our
-    ``MODELS_DIR`` copy and set the threshold post-construction (``predict`` runs
-    the VAD whenever ``vad_threshold > 0``). Best-effort: a missing file or import
-    just leaves VAD off rather than failing the load.
+    openWakeWord's ``VAD`` defaults to the package resources dir, which we
+    deliberately don't populate — so it is pointed at our ``MODELS_DIR`` copy.
+    Best-effort: a missing file or import just leaves VAD off rather than failing
+    the load.
     """
     if not _SILERO_VAD_PATH.exists():
         logger.warning(
@@ -121,19 +129,19 @@ def _enable_vad(model: Model) -> None:
     try:
         import openwakeword
 
-        model.vad = openwakeword.VAD(model_path=str(_SILERO_VAD_PATH))
-        model.vad_threshold = _VAD_THRESHOLD
+        front_end.enable_vad(
+            openwakeword.VAD(model_path=str(_SILERO_VAD_PATH)),
+            _VAD_THRESHOLD,
+        )
     except Exception:
         logger.exception('Failed to enable Silero VAD')
 
 
-def _enable_noise_suppression(model: Model) -> None:
-    """Turn on Speex noise suppression for *model* if available.
+def _enable_noise_suppression(front_end: OpenWakeWordFrontEnd) -> None:
+    """Turn on Speex noise suppression for *front_end* if available.
 
     ``speexdsp_ns`` is a native, Linux (x86/arm64)-only dependency, so on platforms
-    without it (e.g. macOS dev) suppression simply stays off. Wired post-construction
-    so we don't have to pass ``enable_speex_noise_suppression`` to ``Model`` (which
-    would hard-import the package and fail the whole load when it's absent).
+    without it (e.g. macOS dev) suppression simply stays off.
     """
     try:
         # Optional native dependency (Linux x86/arm64 only); absent on e.g. macOS.
@@ -145,43 +153,89 @@ def _enable_noise_suppression(model: Model) -> None:
         return
     try:
         # 160 samples (10 ms) per frame at 16 kHz, matching openWakeWord's own setup.
-        model.speex_ns = NoiseSuppression.create(160, 16000)
+        front_end.enable_noise_suppression(NoiseSuppression.create(160, 16000))
     except Exception:
         logger.exception('Failed to enable Speex noise suppression')
 
 
-def validate_openwakeword_model(data: bytes) -> bool:
-    """Whether *data* loads and predicts as an OpenWakeWord model.
-
-    Runs the real ``Model(..., inference_framework='onnx')`` path on a temp copy
-    plus a one-frame silence prediction, so a structurally-valid ONNX with the
-    wrong I/O shape (which ``is_loadable_onnx`` would accept) is caught. Falls back
-    to the structural onnx check when openwakeword/numpy or the shared helper
-    models aren't available — so a custom upload made before the default models are
-    downloaded isn't falsely rejected.
+def _load_front_end() -> OpenWakeWordFrontEnd:
+    """Load the feature extractors every wake-word model shares.
+
+    Raises:
+        FileNotFoundError: If the helper models are not downloaded.
+        ImportError: If the ``openwakeword`` package is not installed.
+        RuntimeError: If loading fails.
+
     """
-    try:
-        import numpy as np
-        import openwakeword  # noqa: F401
-        from openwakeword.model import Model
-    except ImportError:
-        return is_loadable_onnx(data)
     if not helpers_available():
-        return is_loadable_onnx(data)
+        msg = f'OpenWakeWord feature models not found in {MODELS_DIR}'
+        raise FileNotFoundError(msg)
+    try:
+        front_end = OpenWakeWordFrontEnd(
+            melspec_model_path=_MELSPEC_PATH,
+            embedding_model_path=_EMBEDDING_PATH,
+        )
+    except ImportError as error:
+        msg = 'openwakeword package not installed'
+        logger.exception(msg)
+        raise ImportError(msg) from error
+    except Exception as error:
+        msg = f'Failed to load OpenWakeWord feature models from {MODELS_DIR}'
+        logger.exception(msg)
+        raise RuntimeError(msg) from error
+    _enable_vad(front_end)
+    _enable_noise_suppression(front_end)
+    return front_end
+
+
+def _load_head(stem: str) -> OpenWakeWordHead:
+    """Load the classifier of wake-word model *stem*.
+
+    Raises:
+        FileNotFoundError: If the model file is not on disk.
+        ImportError: If ``onnxruntime`` is not installed.
+        RuntimeError: If loading fails.
+
+    """
+    path = MODELS_DIR / f'{stem}.onnx'
+    if not path.exists():
+        msg = f'OpenWakeWord model {stem} not found in {MODELS_DIR}'
+        raise FileNotFoundError(msg)
+    try:
+        head = OpenWakeWordHead(path)
+    except ImportError as error:
+        msg = 'onnxruntime package not installed'
+        logger.exception(msg)
+        raise ImportError(msg) from error
+    except Exception as error:
+        msg = f'Failed to load OpenWakeWord model {stem}'
+        logger.exception(msg)
+        raise RuntimeError(msg) from error
+    logger.info('OpenWakeWord model loaded', extra={'model': stem})
+    return head
+
 
+def validate_openwakeword_model(data: bytes) -> bool:
+    """Whether *data* loads and scores as an OpenWakeWord model.
+
+    Loads it the way the engine does, as a classifier head, and scores a window
+    of silent embeddings, so a structurally-valid ONNX with the wrong I/O shape
+    (which ``is_loadable_onnx`` would accept) is caught. Falls back to the
+    structural onnx check when onnxruntime isn't available.
+    """
     import tempfile
 
     with tempfile.TemporaryDirectory() as tmp:
         candidate = Path(tmp) / 'candidate.onnx'
         candidate.write_bytes(data)
         try:
-            model = Model(
-                wakeword_models=[str(candidate)],
-                inference_framework='onnx',
-                melspec_model_path=str(_MELSPEC_PATH),
-                embedding_model_path=str(_EMBEDDING_PATH),
-            )
-            model.predict(np.zeros(_CHUNK_SIZE, dtype=np.int16))
+            head = OpenWakeWordHead(candidate)
+            embeddings = FeatureRing(head.frames, OPENWAKEWORD_EMBEDDING_WIDTH)
+            for _ in range(head.frames):
+                embeddings.append(np.zeros(OPENWAKEWORD_EMBEDDING_WIDTH))
+            head.score(embeddings, head.frames - 1)
+        except ImportError:
+            return is_loadable_onnx(data)
         except Exception:
             logger.exception('Uploaded file is not a valid OpenWakeWord model')
             return False
@@ -272,14 +326,24 @@ def download_model(name: str) -> None:
 
 
 class OpenWakeWordEngine(WakeWordRecognitionMixin):
-    """OpenWakeWord wake-word detection engine."""
+    """OpenWakeWord wake-word detection engine.
+
+    Every enabled model is a classifier head over one shared front end (see
+    ``wake_features``), so another wake phrase costs only its head, and adding or
+    removing one leaves the features the others read warm.
+    """
+
+    # The classifier reads 16 embeddings of 76 mel frames, about 2 s of audio
+    # ending at the wake word, and is trained with quiet before it.
+    pre_roll_seconds = 2.0
 
     def __init__(self) -> None:
         """Initialize the OpenWakeWord engine."""
-        self._model: Model | None = None
+        self._front_end: OpenWakeWordFrontEnd | None = None
+        self._heads: dict[str, OpenWakeWordHead] = {}
         self._audio_buffer = bytearray()
         # Maps of enabled model stem -> trigger id and -> sensitivity, plus the
-        # signature of the currently-loaded model set (so we only rebuild on change).
+        # signature of the currently-loaded heads (so we only reload on change).
         self._stem_to_id: dict[str, str] = {}
         self._stem_to_sensitivity: dict[str, float] = {}
         self._loaded_signature: tuple[str, ...] | None = None
@@ -297,7 +361,7 @@ class OpenWakeWordEngine(WakeWordRecognitionMixin):
 
     @override
     def set_triggers(self, triggers: Sequence[WakeTrigger] | None) -> None:
-        """Set the triggers and (re)load only the enabled models on change."""
+        """Set the triggers and load or release only the heads that changed."""
         super().set_triggers(triggers)
         self._stem_to_id = {trigger.value: trigger.id for trigger in self.triggers}
         self._stem_to_sensitivity = {
@@ -305,8 +369,8 @@ class OpenWakeWordEngine(WakeWordRecognitionMixin):
         }
         # Signature reflects the requested stems that actually exist on disk, not
         # just the requested set: a model whose file arrives later (e.g. finishes
-        # downloading) changes the signature and triggers a reload, instead of the
-        # signature committing to a set that ``_load_models`` only partially loaded.
+        # downloading) changes the signature and triggers a load, instead of the
+        # signature committing to a set that was only partially loaded.
         signature = tuple(
             sorted(
                 stem
@@ -316,14 +380,35 @@ class OpenWakeWordEngine(WakeWordRecognitionMixin):
         )
         if signature == self._loaded_signature:
             return
-        self._model = None
-        self._audio_buffer.clear()
+        # Dropped heads stay cached while idle, so toggling a trigger back on
+        # reuses its session instead of rebuilding it.
+        heads = {stem: head for stem, head in self._heads.items() if stem in signature}
+        for stem in self._heads.keys() - heads.keys():
+            model_manager.release(_head_key(stem))
+        self._heads = heads
         if not signature:
             # No enabled models — nothing to load, treat as a committed empty state.
+            self._release_front_end()
             self._loaded_signature = signature
             return
         try:
-            self._load_models()
+            if self._front_end is None:
+                self._front_end = model_manager.acquire(
+                    _FRONT_END_KEY,
+                    _load_front_end,
+                    engine='openwakeword',
+                )
+            for stem in signature:
+                if stem in self._heads:
+                    continue
+                head = model_manager.acquire(
+                    _head_key(stem),
+                    functools.partial(_load_head, stem),
+                    engine='openwakeword',
+                    path=MODELS_DIR / f'{stem}.onnx',
+                )
+                if head is not None:
+                    self._heads = {**self._heads, stem: head}
         except (FileNotFoundError, ImportError, RuntimeError):
             # Leave the signature uncommitted so a later sync (e.g. once the model
             # is downloaded) retries the load instead of short-circuiting.
@@ -334,57 +419,24 @@ class OpenWakeWordEngine(WakeWordRecognitionMixin):
             )
         else:
             self._loaded_signature = signature
-
-    def _load_models(self) -> None:
-        """Load the OpenWakeWord models from :data:`MODELS_DIR`.
-
-        Raises:
-            FileNotFoundError: If no wake-word model files are present.
-            ImportError: If the ``openwakeword`` package is not installed.
-            RuntimeError: If model loading fails.
-
-        """
-        # Load only the models referenced by the (enabled) triggers.
-        wake_word_models = [
-            str(path)
-            for path in MODELS_DIR.glob('*.onnx')
-            if path.stem in self._stem_to_id
-        ]
-        if not wake_word_models:
-            msg = f'No enabled OpenWakeWord models found in {MODELS_DIR}'
-            raise FileNotFoundError(msg)
-
-        try:
-            from openwakeword.model import Model
-
-            model = Model(
-                wakeword_models=wake_word_models,
-                inference_framework='onnx',
-                melspec_model_path=str(_MELSPEC_PATH),
-                embedding_model_path=str(_EMBEDDING_PATH),
-            )
-            _enable_vad(model)
-            _enable_noise_suppression(model)
-            self._model = model
             logger.info(
                 'OpenWakeWord models loaded',
-                extra={'models': list(model.models.keys())},
+                extra={'models': list(self._heads)},
             )
-        except ImportError as error:
-            msg = 'openwakeword package not installed'
-            logger.exception(msg)
-            raise ImportError(msg) from error
-        except Exception as error:
-            msg = f'Failed to load OpenWakeWord models from {MODELS_DIR}'
-            logger.exception(msg)
-            raise RuntimeError(msg) from error
+
+    def _release_front_end(self) -> None:
+        """Stop using the front end; it stays cached, warm, until evicted."""
+        if self._front_end is not None:
+            model_manager.release(_FRONT_END_KEY)
+            self._front_end = None
+            self._audio_buffer.clear()
 
     @override
     async def _run(self) -> None:
         """Consume mic audio and push detected wake words onto the queue."""
         while self.should_be_running():
             chunk = await self.input_queue.get()
-            if self._model is None:
+            if self._front_end is None or not self._heads:
                 # No model yet (not downloaded / failed to load). Drop audio and
                 # keep the loop alive so a runtime download self-heals.
                 self._audio_buffer.clear()
@@ -402,40 +454,52 @@ class OpenWakeWordEngine(WakeWordRecognitionMixin):
                     extra={'chunk_type': type(chunk).__name__},
                 )
                 continue
-            while len(self._audio_buffer) >= _BYTES_PER_CHUNK:
-                frame = bytes(self._audio_buffer[:_BYTES_PER_CHUNK])
-                del self._audio_buffer[:_BYTES_PER_CHUNK]
-                await self._process_frame(frame)
-
-    async def _process_frame(self, frame: bytes) -> None:
-        """Run inference on one frame and queue any matching wake word."""
-        if self._model is None:
-            return
-        audio = np.frombuffer(frame, dtype=np.int16)
-        result = await asyncio.to_thread(self._model.predict, audio)
-        predictions: dict[str, float] = (
-            result[0] if isinstance(result, tuple) else result
-        )
-        for model_name, confidence in predictions.items():
-            # Per-model activation: higher sensitivity → lower required confidence.
-            sensitivity = self._stem_to_sensitivity.get(
-                model_name,
-                _DEFAULT_SENSITIVITY,
-            )
-            if confidence < 1 - sensitivity:
+            # Every whole frame at once: a lead-in replayed after silence goes
+            # through the feature models in one call.
+            size = len(self._audio_buffer) // _BYTES_PER_CHUNK * _BYTES_PER_CHUNK
+            if not size:
                 continue
-            # The prediction key is the loaded model's file stem, which is exactly
-            # a trigger's ``value`` — route by id with no fuzzy matching.
-            trigger_id = self._stem_to_id.get(model_name)
-            if trigger_id is None:
+            audio = np.frombuffer(bytes(self._audio_buffer[:size]), dtype=np.int16)
+            del self._audio_buffer[:size]
+            for trigger_id in await asyncio.to_thread(self._detect, audio):
+                await self.woke_word_recognitions_queue.put(trigger_id)
+
+    def _detect(self, audio: np.ndarray) -> list[str]:
+        """Run the front end once and every head per frame; return fired trigger ids.
+
+        Synchronous and CPU-bound — call it off the event loop.
+        """
+        front_end = self._front_end
+        if front_end is None:
+            return []
+        heads = tuple(self._heads.items())
+        fired: list[str] = []
+        for index in front_end.push(audio):
+            if not front_end.is_warm(index) or not front_end.speech_likely(index):
                 continue
-            logger.info(
-                'OpenWakeWord detected wake word',
-                extra={
-                    'model': model_name,
-                    'confidence': float(confidence),
-                    'sensitivity': sensitivity,
-                },
-            )
-            await self.woke_word_recognitions_queue.put(trigger_id)
-            break
+            for stem, head in heads:
+                confidence = head.score(front_end.embeddings, index)
+                # Per-model activation: higher sensitivity → lower required
+                # confidence.
+                sensitivity = self._stem_to_sensitivity.get(
+                    stem,
+                    _DEFAULT_SENSITIVITY,
+                )
+                if confidence < 1 - sensitivity:
+                    continue
+                # Heads are keyed by the model's file stem, which is exactly a
+                # trigger's ``value`` — route by id with no fuzzy matching.
+                trigger_id = self._stem_to_id.get(stem)
+                if trigger_id is None:
+                    continue
+                logger.info(
+                    'OpenWakeWord detected wake word',
+                    extra={
+                        'model': stem,
+                        'confidence': confidence,
+                        'sensitivity': sensitivity,
+                    },
+                )
+                fired.append(trigger_id)
+                break
+        return fired
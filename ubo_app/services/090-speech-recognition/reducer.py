@@ -40,6 +40,7 @@ from ubo_app.store.services.speech_recognition import (
     SpeechRecognitionSetAssistantEnabledAction,
     SpeechRecognitionSetAssistantListeningAction,
     SpeechRecognitionSetConversationEndPhrasesAction,
+    SpeechRecognitionSetLoadedModelsAction,
     SpeechRecognitionSetWakeModeEnabledAction,
     SpeechRecognitionState,
     SpeechRecognitionStatus,
@@ -653,5 +654,8 @@ def reducer(
                 actions=[ACKNOWLEDGMENT_ACTION],
             )
 
+        case SpeechRecognitionSetLoadedModelsAction(models=models):
+            return replace(state, loaded_models=models)
+
         case _:
             return state
@@ -0,0 +1,120 @@
+"""Append-only buffer of an utterance's audio.
+
+A recognition's audio arrives as mic chunks for as long as the user speaks,
+tens of seconds for a dictation. ``UtteranceBuffer`` keeps the chunks as they
+came, so appending one costs the same however long the utterance already is,
+and joins them only when the audio is handed on: as a ``memoryview`` of one
+contiguous copy, made once and kept until the next chunk, or as a spool that
+moves to a file once it outgrows memory, without ever joining them.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from collections import deque
+from typing import TYPE_CHECKING
+
+from ubo_app.constants import (
+    SPEECH_RECOGNITION_FRAME_RATE,
+    SPEECH_RECOGNITION_SAMPLE_WIDTH,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Spools bigger than this, 30 s of recognition audio, are written to disk.
+_SPOOL_MEMORY_BYTES = (
+    30 * SPEECH_RECOGNITION_FRAME_RATE * SPEECH_RECOGNITION_SAMPLE_WIDTH
+)
+
+
+class UtteranceBuffer:
+    """Audio of one utterance, the oldest trimmed past ``max_seconds``."""
+
+    def __init__(
+        self,
+        *,
+        max_seconds: float | None = None,
+        rate: int = SPEECH_RECOGNITION_FRAME_RATE,
+        width: int = SPEECH_RECOGNITION_SAMPLE_WIDTH,
+    ) -> None:
+        """Start empty; with no ``max_seconds`` nothing is ever trimmed."""
+        self._bytes_per_second = rate * width
+        self._width = width
+        self._max_bytes = (
+            None if max_seconds is None else int(max_seconds * rate) * width
+        )
+        self._chunks: deque[memoryview] = deque()
+        self._size = 0
+        self._joined: memoryview | None = None
+
+    def __len__(self) -> int:
+        """Bytes of audio held."""
+        return self._size
+
+    def __bytes__(self) -> bytes:
+        """Copy the audio out as one ``bytes``."""
+        return self.view().tobytes()
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio held."""
+        return self._size / self._bytes_per_second
+
+    def append(self, data: bytes) -> None:
+        """Add a chunk, trimming the oldest audio past ``max_seconds``."""
+        if not data:
+            return
+        # A mutable chunk could change under the buffer; bytes are kept as is.
+        chunk = memoryview(data if isinstance(data, bytes) else bytes(data))
+        self._chunks.append(chunk)
+        self._size += chunk.nbytes
+        self._joined = None
+        if self._max_bytes is not None and self._size > self._max_bytes:
+            self._trim(self._size - self._max_bytes)
+
+    def _trim(self, excess: int) -> None:
+        # Whole samples only, so the audio never starts mid-sample.
+        excess = -(-excess // self._width) * self._width
+        while excess:
+            oldest = self._chunks[0]
+            if oldest.nbytes <= excess:
+                self._chunks.popleft()
+                self._size -= oldest.nbytes
+                excess -= oldest.nbytes
+            else:
+                self._chunks[0] = oldest[excess:]
+                self._size -= excess
+                excess = 0
+
+    def chunks(self) -> Iterator[memoryview]:
+        """Yield the audio as it was appended, without copying it."""
+        yield from tuple(self._chunks)
+
+    def view(self) -> memoryview:
+        """Return the audio as one read-only ``memoryview``.
+
+        The chunks are joined on the first call after an append and the joined
+        copy takes their place, so handing the same audio on again is free.
+        """
+        if self._joined is None:
+            if len(self._chunks) > 1:
+                self._chunks = deque((memoryview(b''.join(self._chunks)),))
+            self._joined = self._chunks[0] if self._chunks else memoryview(b'')
+        return self._joined
+
+    def spool(
+        self,
+        *,
+        max_memory_bytes: int = _SPOOL_MEMORY_BYTES,
+    ) -> tempfile.SpooledTemporaryFile[bytes]:
+        """Write the audio to a spool, on disk past ``max_memory_bytes``.
+
+        The spool is rewound for reading; its owner closes it, which removes
+        the file if there is one.
+        """
+        spool = tempfile.SpooledTemporaryFile(max_size=max_memory_bytes)  # noqa: SIM115
+        for chunk in self._chunks:
+            spool.write(chunk)
+        spool.seek(0)
+        return spool
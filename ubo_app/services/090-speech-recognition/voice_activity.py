@@ -0,0 +1,109 @@
+"""Cheap voice-activity gate in front of the recognition engines.
+
+Decides once per mic chunk, from the chunk's energy against a tracked noise
+floor, whether someone is likely speaking. Engines that declare a
+``pre_roll_seconds`` only get audio while the gate is open, plus that much
+lead-in replayed from ``MicBuffer`` when it opens, so a silent room costs them
+nothing. The decision is a mean of squares per chunk, shared by every engine.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from ubo_app.constants import SPEECH_RECOGNITION_FRAME_RATE
+
+# Chunks this far above the noise floor count as voiced.
+_MARGIN_DB = 9.0
+# Below this level nothing counts as voiced, however quiet the room is, so a
+# digitally silent input doesn't open the gate on dither.
+_MIN_LEVEL_DB = -60.0
+# The floor drops to a quieter chunk at once and creeps up otherwise, so it
+# follows a fan turning on within seconds without speech dragging it up.
+_FLOOR_RISE_DB_PER_SECOND = 1.0
+# Keep the gate open this long after the last voiced chunk: the gaps between
+# words stay in, and Vosk hears enough trailing silence to end the utterance
+# (Kaldi's endpoint rules want 0.5 s to 1 s of it).
+_HANGOVER_SECONDS = 1.5
+
+_FULL_SCALE = 32768.0
+_SILENCE_DB = -96.0
+
+
+class VoiceActivity(NamedTuple):
+    """The gate's decision for one chunk."""
+
+    is_open: bool
+    opened: bool
+    """This chunk opened the gate, so gated engines need their lead-in first."""
+
+
+def level_db(chunk: bytes) -> float:
+    """RMS level of 16-bit mono PCM, in dB relative to full scale."""
+    samples = np.frombuffer(chunk, dtype=np.int16).astype(np.float32)
+    if samples.size == 0:
+        return _SILENCE_DB
+    power = float(np.dot(samples, samples)) / samples.size
+    if power <= 0:
+        return _SILENCE_DB
+    return max(10 * math.log10(power / _FULL_SCALE**2), _SILENCE_DB)
+
+
+class VoiceActivityGate:
+    """Energy gate over the speech-recognition mic stream."""
+
+    def __init__(
+        self,
+        *,
+        margin_db: float = _MARGIN_DB,
+        min_level_db: float = _MIN_LEVEL_DB,
+        hangover_seconds: float = _HANGOVER_SECONDS,
+        rate: int = SPEECH_RECOGNITION_FRAME_RATE,
+    ) -> None:
+        """Configure the thresholds; the noise floor is learned from the stream."""
+        self._margin = margin_db
+        self._min_level = min_level_db
+        self._hangover = hangover_seconds
+        self._bytes_per_second = rate * 2
+        self._floor: float | None = None
+        self._hangover_left = 0.0
+        self.is_open = False
+        self.heard_seconds = 0.0
+        self.open_seconds = 0.0
+
+    @property
+    def duty_cycle(self) -> float:
+        """Fraction of the audio heard so far that the gate let through."""
+        return self.open_seconds / self.heard_seconds if self.heard_seconds else 0.0
+
+    def update(self, chunk: bytes) -> VoiceActivity:
+        """Take the next chunk of the stream and decide whether it passes."""
+        duration = len(chunk) / self._bytes_per_second
+        if not duration:
+            return VoiceActivity(is_open=self.is_open, opened=False)
+        level = level_db(chunk)
+
+        if self._floor is None or level < self._floor:
+            self._floor = level
+        else:
+            self._floor = min(
+                level,
+                self._floor + _FLOOR_RISE_DB_PER_SECOND * duration,
+            )
+        voiced = level >= max(self._floor + self._margin, self._min_level)
+
+        was_open = self.is_open
+        if voiced:
+            self._hangover_left = self._hangover
+            self.is_open = True
+        else:
+            self._hangover_left -= duration
+            self.is_open = self._hangover_left > 0
+
+        self.heard_seconds += duration
+        if self.is_open:
+            self.open_seconds += duration
+        return VoiceActivity(is_open=self.is_open, opened=self.is_open and not was_open)
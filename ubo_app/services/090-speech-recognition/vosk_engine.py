@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from asyncio import get_event_loop
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
@@ -15,20 +14,21 @@ from abstraction.speech_recognition_mixin import (
     SpeechRecognitionMixin,
 )
 from abstraction.wake_word_recognition_mixin import WakeWordRecognitionMixin
+from model_manager import model_manager
 from typing_extensions import override
 
-from ubo_app.constants import SPEECH_RECOGNITION_FRAME_RATE
+from ubo_app.constants import SPEECH_RECOGNITION_VOSK_WORKER_PROCESS
 from ubo_app.engines.vosk import VoskEngine as BaseVosk
 from ubo_app.engines.vosk_catalog import DEFAULT_VOSK_MODEL_ID, model_path_for
+from ubo_app.engines.vosk_recognizers import RecognizerPool, RecognizerWorker
 from ubo_app.logger import logger
 from ubo_app.store.main import store
 from ubo_app.store.services.speech_recognition import (
     SpeechRecognitionReportTextEvent,
 )
-from ubo_app.utils import IS_RPI
 
 if TYPE_CHECKING:
-    from vosk import KaldiRecognizer, Model
+    from vosk import Model
 
 
 @store.with_state(lambda state: state.assistant.selected_vosk_model)
@@ -43,13 +43,13 @@ _MODEL_RETRY_INTERVAL_SECONDS = 1.0
 
 
 class _RecognizerState(NamedTuple):
-    """The loaded Vosk model/recognizer and what they were built for."""
+    """The loaded Vosk model/recognizers and what they were built for."""
 
     model: Model | None
-    recognizer: KaldiRecognizer | None
-    # The model id actually loaded into ``recognizer``. Only advances on a
+    recognizers: RecognizerPool | RecognizerWorker | None
+    # The model id actually loaded into ``recognizers``. Only advances on a
     # successful load, so a selected-but-not-ready model keeps being retried
-    # instead of being abandoned while the previous recognizer lingers.
+    # instead of being abandoned while the previous recognizers linger.
     loaded_model_id: str | None
     phrases: tuple[str, ...] | None
     # Loop time before which a failed (re)load must not be re-attempted.
@@ -80,18 +80,30 @@ def _load_model(model_id: str) -> Model | None:
         return None
 
 
-def _make_recognizer(
+def _model_key(model_id: str) -> str:
+    return f'vosk:{model_id}'
+
+
+def _make_recognizers(
     model: Model,
+    model_id: str,
     phrases: tuple[str, ...] | None,
-) -> KaldiRecognizer:
-    """Build a recognizer for *model*, limited to *phrases* when provided."""
-    from vosk import KaldiRecognizer
+) -> RecognizerPool | RecognizerWorker:
+    """Prepare recognizers for *phrases* and for the free speech that follows.
+
+    A wake word switches the grammar to free speech or to a command's phrases;
+    having its recognizer built already is what keeps that switch cheap.
+    """
+    if SPEECH_RECOGNITION_VOSK_WORKER_PROCESS:
+        return RecognizerWorker(Path(str(model_path_for(model_id))), phrases, ())
+    recognizers = RecognizerPool(model)
+    recognizers.prepare(phrases, ())
+    return recognizers
+
 
-    return KaldiRecognizer(
-        model,
-        SPEECH_RECOGNITION_FRAME_RATE,
-        *([json.dumps(phrases)] if phrases else []),
-    )
+def _close_recognizers(recognizers: RecognizerPool | RecognizerWorker | None) -> None:
+    if isinstance(recognizers, RecognizerWorker):
+        recognizers.close()
 
 
 class VoskEngine(
@@ -101,14 +113,17 @@ class VoskEngine(
 ):
     """Vosk speech recognition engine."""
 
+    # Enough for the soft consonant before the first vowel clears the gate.
+    pre_roll_seconds = 0.5
+
     def __init__(self) -> None:
         """Initialize Vosk speech recognition engine."""
         self.grammar_lock = asyncio.Lock()
         self.process_executor = ThreadPoolExecutor(max_workers=1)
-        # The single loaded model instance, cached for vocabulary validation
-        # (wake-phrase editing). None until ``_reconcile`` first loads a model;
-        # never a second ``Model`` — this is the same instance the recognizer uses.
-        self._loaded_model: Model | None = None
+        # Key of the model the recognition loop holds in ``model_manager``, for
+        # vocabulary validation (wake-phrase editing). None until ``_reconcile``
+        # first loads a model; the same instance the recognizers use.
+        self._loaded_model_key: str | None = None
 
         super().__init__(label='Vosk')
 
@@ -119,7 +134,8 @@ class VoskEngine(
         vocabulary (``model.vosk_model_find_word``). Best-effort: a plain
         reference read of the one model the recognition loop already holds.
         """
-        return self._loaded_model
+        key = self._loaded_model_key
+        return None if key is None else model_manager.peek(key)
 
     @override
     def _checked_run(self) -> bool:
@@ -142,11 +158,11 @@ class VoskEngine(
         return self._original_run()
 
     async def _reconcile(self, state: _RecognizerState) -> _RecognizerState:
-        """Reconcile the recognizer with the selected model and phrases.
+        """Reconcile the recognizers with the selected model and phrases.
 
         The model is loaded lazily: while the selected model isn't on disk yet
         (first-time setup, download in progress) the returned state carries
-        ``recognizer=None`` and ``_run`` drops audio. The recognizer is built
+        ``recognizers=None`` and ``_run`` drops audio. The recognizers are built
         the moment the model appears on disk, so a model downloaded at runtime
         self-heals on the next chunk — no app restart, unlike an eager load that
         would crash the engine at boot when the model is still missing.
@@ -154,8 +170,7 @@ class VoskEngine(
         async with self.grammar_lock:
             requested_model_id = _read_selected_model()
             phrases = self._phrases
-            model = state.model
-            recognizer = state.recognizer
+            recognizers = state.recognizers
 
             if requested_model_id != state.loaded_model_id:
                 # The selection differs from what's loaded (changed, or never
@@ -165,27 +180,35 @@ class VoskEngine(
                 now = get_event_loop().time()
                 if now < state.retry_at:
                     return state
-                new_model = _load_model(requested_model_id)
+                new_model = model_manager.acquire(
+                    _model_key(requested_model_id),
+                    lambda: _load_model(requested_model_id),
+                    engine='vosk',
+                    path=Path(str(model_path_for(requested_model_id))),
+                )
                 if new_model is not None:
                     logger.debug(
                         'Vosk - Loaded model',
                         extra={'model_id': requested_model_id},
                     )
-                    # Cache the one model instance for wake-phrase validation
-                    # (under ``grammar_lock``); never a second ``Model``.
-                    self._loaded_model = new_model
+                    # The previous model stays cached in the manager while idle,
+                    # so switching back is free until memory pressure evicts it.
+                    if state.loaded_model_id is not None:
+                        model_manager.release(_model_key(state.loaded_model_id))
+                    _close_recognizers(recognizers)
+                    self._loaded_model_key = _model_key(requested_model_id)
                     # ``loaded_model_id`` advances only here, on success.
                     return _RecognizerState(
                         new_model,
-                        _make_recognizer(new_model, phrases),
+                        _make_recognizers(new_model, requested_model_id, phrases),
                         requested_model_id,
                         phrases,
                         0.0,
                     )
-                # Not ready yet. Keep the current recognizer (if any) and the
+                # Not ready yet. Keep the current recognizers (if any) and the
                 # current ``loaded_model_id`` so the requested model is retried;
                 # back off until the next interval.
-                if recognizer is not None:
+                if recognizers is not None:
                     logger.warning(
                         'Vosk - Requested model not ready; staying on previous '
                         'model',
@@ -200,20 +223,11 @@ class VoskEngine(
                     retry_at=now + _MODEL_RETRY_INTERVAL_SECONDS,
                 )
 
-            if (
-                phrases != state.phrases
-                and model is not None
-                and recognizer is not None
-            ):
+            if phrases != state.phrases and recognizers is not None:
+                # The pool switches to the recognizer of the new grammar, reset
+                # if it has one already, on the next chunk.
                 logger.debug('Vosk - Updating phrases', extra={'new_phrases': phrases})
-                if IS_RPI:
-                    recognizer.Reset()
-                    recognizer.SetGrammar(json.dumps(phrases))
-                    return state._replace(phrases=phrases)
-                return state._replace(
-                    recognizer=_make_recognizer(model, phrases),
-                    phrases=phrases,
-                )
+                return state._replace(phrases=phrases)
 
             return state
 
@@ -224,8 +238,8 @@ class VoskEngine(
         # yet (the core downloads it on demand). An eager load here would crash
         # the engine at boot, and nothing reliably restarts it once the download
         # finishes, leaving recognition dead until an app restart. Instead the
-        # loop stays alive with no recognizer, drops audio while the model is
-        # missing, and builds the recognizer the moment it appears — so a model
+        # loop stays alive with no recognizers, drops audio while the model is
+        # missing, and builds the recognizers the moment it appears — so a model
         # downloaded at runtime self-heals on the next audio chunk.
         logger.debug(
             'Vosk - Starting recognition loop',
@@ -233,59 +247,65 @@ class VoskEngine(
         )
         state = _RecognizerState(
             model=None,
-            recognizer=None,
+            recognizers=None,
             loaded_model_id=None,
             phrases=None,
             retry_at=0.0,
         )
 
-        while self.should_be_running():
-            data = await self.input_queue.get()
-
-            state = await self._reconcile(state)
-            recognizer = state.recognizer
-            if recognizer is None:
-                continue
+        try:
+            while self.should_be_running():
+                data = await self.input_queue.get()
+
+                state = await self._reconcile(state)
+                recognizers = state.recognizers
+                if recognizers is None:
+                    continue
+
+                try:
+                    step = await get_event_loop().run_in_executor(
+                        self.process_executor,
+                        recognizers.accept,
+                        state.phrases,
+                        data,
+                    )
+                except TypeError:
+                    # A malformed chunk must not kill this loop: nothing else
+                    # restarts it (``decide_running_state`` only re-fires on a
+                    # trigger-config change), so one bad chunk would otherwise
+                    # silently and permanently stop speech recognition.
+                    logger.warning(
+                        'Vosk - Dropping malformed audio chunk',
+                        extra={'chunk_type': type(data).__name__},
+                    )
+                    continue
 
-            try:
-                accepted = await get_event_loop().run_in_executor(
-                    self.process_executor,
-                    recognizer.AcceptWaveform,
-                    data,
-                )
-            except TypeError:
-                # A malformed chunk must not kill this loop: nothing else
-                # restarts it (``decide_running_state`` only re-fires on a
-                # trigger-config change), so one bad chunk would otherwise
-                # silently and permanently stop speech recognition.
-                logger.warning(
-                    'Vosk - Dropping malformed audio chunk',
-                    extra={'chunk_type': type(data).__name__},
-                )
-                continue
-
-            if accepted:
-                result = json.loads(recognizer.FinalResult())
-                if result.get('text'):
-                    await self.report(result=result['text'])
-            else:
-                result = json.loads(recognizer.PartialResult())
-                if result.get('partial'):
+                if step.final:
+                    await self.report(result=step.final)
+                elif step.partial:
+                    # Only reported when it changed since the previous chunk.
                     logger.verbose(
                         'Vosk - Partial result',
-                        extra={'result': result},
+                        extra={'result': step.partial},
                     )
                     store._dispatch(  # noqa: SLF001
                         [
                             SpeechRecognitionReportTextEvent(
                                 timestamp=get_event_loop().time(),
-                                text=result['partial'],
+                                text=step.partial,
                             ),
                         ],
                     )
 
-            if self.ongoing_recognition is not None:
-                self.ongoing_recognition.append_voice(data)
+                if self.ongoing_recognition is not None:
+                    self.ongoing_recognition.append_voice(data)
+        finally:
+            # Idle models stay cached in ``model_manager`` until evicted, so a
+            # restarted engine picks the same model up without a reload.
+            if state.loaded_model_id is not None:
+                model_manager.release(_model_key(state.loaded_model_id))
+            _close_recognizers(state.recognizers)
+            self._loaded_model_key = None
 
     @property
     def _phrases(self) -> tuple[str, ...] | None:
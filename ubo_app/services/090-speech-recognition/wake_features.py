@@ -0,0 +1,239 @@
+"""Shared audio feature front ends for the wake-word engines.
+
+Wake-word models are small classifier heads over features that cost far more
+to compute than the heads do: openWakeWord's melspectrogram and speech
+embeddings (and the Silero VAD score it gates on), microWakeWord's micro
+frontend. A front end computes each feature once per audio frame and keeps it
+in a :class:`FeatureRing` keyed by frame index, so any number of heads read
+the same frames and each active wake phrase costs only its own inference.
+
+Front ends are held in ``model_manager`` next to the heads, so they stay warm
+while triggers are added and removed instead of being rebuilt, cold, for every
+set of wake phrases.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import DTypeLike
+
+# openWakeWord consumes 80 ms frames and makes one 96-wide embedding of each.
+OPENWAKEWORD_FRAME_SAMPLES = 1280
+OPENWAKEWORD_EMBEDDING_WIDTH = 96
+# microWakeWord's frontend makes 40 features of every 10 ms.
+MICROWAKEWORD_FEATURE_WIDTH = 40
+
+# Kept frames, well over the longest window a head reads (openWakeWord's are
+# 16 embeddings, 1.28 s; microWakeWord's models consume frames as they come).
+_OPENWAKEWORD_RING_FRAMES = 64
+_MICROWAKEWORD_RING_FRAMES = 128
+# openWakeWord primes its embeddings with noise and discards the scores of the
+# first frames a model sees; so does the front end, once, for every head.
+_WARMUP_FRAMES = 5
+# Speex noise suppression takes 10 ms frames.
+_NOISE_SUPPRESSION_FRAME_SAMPLES = 160
+# Silero VAD scores each frame by the mean over 40 ms windows.
+_VAD_WINDOW_SAMPLES = 640
+
+
+class FeatureRing:
+    """The latest ``capacity`` feature frames, addressed by frame index."""
+
+    def __init__(
+        self,
+        capacity: int,
+        width: int,
+        *,
+        dtype: DTypeLike = np.float32,
+    ) -> None:
+        """Allocate room for ``capacity`` frames of ``width`` features."""
+        self._capacity = capacity
+        self._rows = np.zeros((capacity, width), dtype=dtype)
+        self.end = 0
+        """Index the next frame gets."""
+
+    @property
+    def start(self) -> int:
+        """Index of the oldest frame still kept."""
+        return max(self.end - self._capacity, 0)
+
+    def append(self, row: np.ndarray) -> int:
+        """Keep the next frame, evicting the oldest when full; return its index."""
+        index = self.end
+        self._rows[index % self._capacity] = row
+        self.end += 1
+        return index
+
+    def window(self, count: int, end: int) -> np.ndarray:
+        """Return the ``count`` frames before index ``end``, oldest first."""
+        if count > self._capacity or end > self.end or end - count < self.start:
+            msg = (
+                f'Frames {end - count} to {end} are not in the ring '
+                f'({self.start} to {self.end})'
+            )
+            raise IndexError(msg)
+        return self._rows[np.arange(end - count, end) % self._capacity]
+
+
+class OpenWakeWordFrontEnd:
+    """openWakeWord's features and voice activity, once per 80 ms frame."""
+
+    def __init__(
+        self,
+        *,
+        melspec_model_path: Path,
+        embedding_model_path: Path,
+    ) -> None:
+        """Load the melspectrogram and embedding models.
+
+        Raises:
+            ImportError: If the ``openwakeword`` package is not installed.
+
+        """
+        from openwakeword.utils import AudioFeatures
+
+        self._features = AudioFeatures(
+            melspec_model_path=str(melspec_model_path),
+            embedding_model_path=str(embedding_model_path),
+            inference_framework='onnx',
+        )
+        self._noise_suppression: object | None = None
+        self._vad: object | None = None
+        self.vad_threshold = 0.0
+        self.embeddings = FeatureRing(
+            _OPENWAKEWORD_RING_FRAMES,
+            OPENWAKEWORD_EMBEDDING_WIDTH,
+        )
+        self.speech = FeatureRing(_OPENWAKEWORD_RING_FRAMES, 1)
+
+    def enable_vad(self, vad: object, threshold: float) -> None:
+        """Score every frame with ``vad`` and gate detections on ``threshold``."""
+        self._vad = vad
+        self.vad_threshold = threshold
+
+    def enable_noise_suppression(self, noise_suppression: object) -> None:
+        """Run audio through a Speex ``NoiseSuppression`` before the features."""
+        self._noise_suppression = noise_suppression
+
+    def push(self, audio: np.ndarray) -> range:
+        """Compute the features of whole 80 ms frames; return their indices.
+
+        All frames go through the melspectrogram model in one call, which is
+        where a lead-in of many frames is cheaper than as many single frames.
+        """
+        frames = audio.size // OPENWAKEWORD_FRAME_SAMPLES
+        if not frames:
+            return range(self.embeddings.end, self.embeddings.end)
+        audio = audio[: frames * OPENWAKEWORD_FRAME_SAMPLES]
+        if self._noise_suppression is not None:
+            audio = self._suppress_noise(audio)
+        self._features(audio)
+        start = self.embeddings.end
+        for row in self._features.get_features(frames)[0]:
+            self.embeddings.append(row)
+        if self._vad is not None:
+            for frame in audio.reshape(frames, OPENWAKEWORD_FRAME_SAMPLES):
+                self.speech.append(
+                    self._vad.predict(  # pyright: ignore[reportAttributeAccessIssue]
+                        frame,
+                        frame_size=_VAD_WINDOW_SAMPLES,
+                    ),
+                )
+        return range(start, self.embeddings.end)
+
+    def _suppress_noise(self, audio: np.ndarray) -> np.ndarray:
+        process = self._noise_suppression.process  # pyright: ignore[reportOptionalMemberAccess, reportAttributeAccessIssue]
+        frames = audio.reshape(-1, _NOISE_SUPPRESSION_FRAME_SAMPLES)
+        return np.frombuffer(
+            b''.join(process(frame.tobytes()) for frame in frames),
+            dtype=np.int16,
+        )
+
+    def is_warm(self, index: int) -> bool:
+        """Whether frame ``index`` is past the noise the embeddings start with."""
+        return index >= _WARMUP_FRAMES
+
+    def speech_likely(self, index: int) -> bool:
+        """Whether the VAD heard speech leading up to frame ``index``.
+
+        Like openWakeWord, the frames from 0.32 s to 0.56 s before its end
+        count: a wake word is scored at its end, and its voiced middle is that
+        far back.
+        """
+        if self._vad is None:
+            return True
+        first = max(index - 6, self.speech.start)
+        last = index - 3
+        if last <= first:
+            return False
+        scores = self.speech.window(last - first, last)
+        return float(scores.max()) >= self.vad_threshold
+
+
+class OpenWakeWordHead:
+    """One openWakeWord classifier, scoring windows of shared embeddings."""
+
+    def __init__(self, model_path: Path) -> None:
+        """Load the classifier.
+
+        Raises:
+            ImportError: If ``onnxruntime`` is not installed.
+
+        """
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.inter_op_num_threads = 1
+        options.intra_op_num_threads = 1
+        self._session = onnxruntime.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=['CPUExecutionProvider'],
+        )
+        model_input = self._session.get_inputs()[0]
+        self._input_name = model_input.name
+        self.frames = int(model_input.shape[1])
+
+    def score(self, embeddings: FeatureRing, index: int) -> float:
+        """Return the wake-word confidence for the window ending at ``index``."""
+        window = embeddings.window(self.frames, index + 1)
+        outputs = self._session.run(None, {self._input_name: window[None]})
+        return float(outputs[0][0][0])
+
+
+class MicroWakeWordFrontEnd:
+    """microWakeWord's frontend features, once per 10 ms."""
+
+    def __init__(self) -> None:
+        """Create the frontend.
+
+        Raises:
+            ImportError: If the ``pymicro_wakeword`` package is not installed.
+
+        """
+        from pymicro_wakeword import MicroWakeWordFeatures
+
+        self._features = MicroWakeWordFeatures()
+        # The models quantize what the frontend made, so keep its precision.
+        self.frames = FeatureRing(
+            _MICROWAKEWORD_RING_FRAMES,
+            MICROWAKEWORD_FEATURE_WIDTH,
+            dtype=np.float64,
+        )
+
+    def push(self, chunk: bytes) -> range:
+        """Compute the features of 16 kHz mono PCM; return their indices."""
+        start = self.frames.end
+        for features in self._features.process_streaming(chunk):
+            self.frames.append(features.reshape(-1))
+        return range(start, self.frames.end)
+
+    def frame(self, index: int) -> np.ndarray:
+        """Return frame ``index`` shaped as the models take it."""
+        return self.frames.window(1, index + 1)[None]
@@ -14,6 +14,7 @@ from ubo_bindings.ubo.v1 import WebUiState as GRPCWebUIState
 
 from ubo_app.constants import (
     GRPC_ENVOY_LISTEN_PORT,
+    GRPC_WEB_NATIVE,
     WEB_UI_DEBUG_MODE,
     WEB_UI_HOTSPOT_PASSWORD,
     WEB_UI_LISTEN_ADDRESS,
@@ -145,6 +146,10 @@ async def _get_docker_status_uncached() -> str:
 
 
 async def _get_envoy_status() -> str:
+    if GRPC_WEB_NATIVE:
+        # gRPC-Web is served by this very process, so it is up whenever this
+        # route can answer — no need to ask docker about a container.
+        return 'running'
     cached = _status_cache.get('envoy')
     if cached and time.time() - cached[0] < _CACHE_TTL:
         return cached[1]
@@ -342,6 +347,11 @@ async def init_service() -> Subscriptions:  # noqa: C901, PLR0915
     app.debug = WEB_UI_DEBUG_MODE
     shutdown_event: asyncio.Event = asyncio.Event()
 
+    if GRPC_WEB_NATIVE:
+        from ubo_app.rpc.grpc_web import register_grpc_web_routes
+
+        register_grpc_web_routes(app)
+
     @store.with_state(lambda state: state.web_ui)
     def state(state: WebUIState) -> str:
         return (
@@ -408,6 +418,7 @@ async def init_service() -> Subscriptions:  # noqa: C901, PLR0915
             state=state(),
             re=re,
             GRPC_ENVOY_LISTEN_PORT=GRPC_ENVOY_LISTEN_PORT,
+            GRPC_WEB_NATIVE=GRPC_WEB_NATIVE,
             WEB_UI_LISTEN_PORT=WEB_UI_LISTEN_PORT,
             cache_bust=_cache_bust,
         )
@@ -425,6 +436,7 @@ async def init_service() -> Subscriptions:  # noqa: C901, PLR0915
             'status': 'ok',
             'docker': statuses[0],
             'envoy': statuses[1],
+            'grpc_web': 'native' if GRPC_WEB_NATIVE else 'envoy',
             'state': state(),
         }
         if pending_downloads:
@@ -82,8 +82,8 @@ export function Root({ state }: { state: string }) {
         inputs={inputDescriptions}
         isGrpcConnected={
           status?.status === "ok" &&
-          status?.docker === "running" &&
-          status?.envoy === "running"
+          (status?.grpc_web === "native" ||
+            (status?.docker === "running" && status?.envoy === "running"))
         }
         store={store}
       />
@@ -4,6 +4,7 @@ declare global {
   interface Window {
     WEB_UI_CONFIG: {
       grpcEnvoyListenPort: string;
+      grpcWebNative: boolean;
       webUiListenPort: string;
     };
   }
@@ -38,7 +38,11 @@ export function MainView({
     );
   }
   if (status.status === "ok") {
-    if (status.docker === "running") {
+    if (status.grpc_web === "native") {
+      // gRPC-web is served by the web-UI server itself; neither docker nor
+      // the Envoy container is involved.
+      return <AppShell store={store} />;
+    } else if (status.docker === "running") {
       if (status.envoy === "running") {
         return <AppShell store={store} />;
       } else if (status.envoy === "not downloaded") {
@@ -34,6 +34,7 @@ export interface StatusType {
   | "unknown"
   | "failed";
   envoy: "running" | "not downloaded" | "not running" | "unknown" | "failed";
+  grpc_web?: "native" | "envoy";
   state: string;
   pending_downloads?: { token: string; filename: string }[];
 }
@@ -25,4 +25,6 @@ register(
     service_id='wyoming',
     label='Home Assistant',
     setup=setup,
+    depends_on=('audio',),
+    is_lazy=True,
 )
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import atexit
 import functools
 import json
+import shutil
 import signal
 import subprocess
 import threading
@@ -25,7 +27,13 @@ from ubo_app.store.core.types import (
 )
 from ubo_app.store.main import store
 from ubo_app.store.services.audio import AudioPlayChimeAction
+from ubo_app.store.services.keypad import KeypadAction
 from ubo_app.store.services.notifications import Chime
+from ubo_app.store.settings.types import (
+    SettingsDumpStoreTraceEvent,
+    SettingsReportStoreTraceAction,
+)
+from ubo_app.store.tracing import store_tracer, write_trace
 from ubo_app.store.update_manager.types import (
     UpdateManagerCheckEvent,
     UpdateManagerRequestCheckAction,
@@ -36,6 +44,7 @@ from ubo_app.utils import bus_provider
 from ubo_app.utils.async_ import create_task
 from ubo_app.utils.hardware import IS_RPI
 from ubo_app.utils.persistent_store import register_persistent_store
+from ubo_app.utils.session_recording import SessionRecorder
 from ubo_app.utils.store import replay_actions
 
 if TYPE_CHECKING:
@@ -155,6 +164,12 @@ def _store_recorded_sequence(event: StoreRecordedSequenceEvent) -> None:
         file.write(json_dump)
 
 
+def _dump_store_trace() -> None:
+    """Write the collected store trace and report where to fetch it."""
+    path, token = write_trace()
+    store.dispatch(SettingsReportStoreTraceAction(path=path, download_token=token))
+
+
 def _save_screenshot_data(event: ScreenshotDataEvent) -> None:
     """Save screenshot data received from GUI client to disk.
 
@@ -173,9 +188,45 @@ def _save_screenshot_data(event: ScreenshotDataEvent) -> None:
         f.write(event.data)
 
 
+# Records the keypad actions of a recorded sequence with their timing, so it is
+# replayed at the pace it was recorded at.
+_keypad_recorder = SessionRecorder(store)
+# Starting and stopping touch the file system, so they run in a thread; this
+# keeps one from overtaking the other when recording is toggled quickly.
+_keypad_session_lock = asyncio.Lock()
+
+
+def _switch_keypad_session(is_recording: bool) -> None:  # noqa: FBT001
+    if is_recording:
+        counter = 0
+        while (
+            path := Path(f'recordings/ubo-recording-{counter:03d}.ubosession')
+        ).exists():
+            counter += 1
+        _keypad_recorder.start(
+            path,
+            include=lambda action: isinstance(action, KeypadAction),
+        )
+    elif (path := _keypad_recorder.path) is not None and _keypad_recorder.is_recording:
+        _keypad_recorder.stop()
+        shutil.copyfile(path, 'recordings/active.ubosession')
+
+
+async def _toggle_keypad_session(is_recording: bool) -> None:  # noqa: FBT001
+    """Record the keypad into a session log while a sequence is recorded."""
+    async with _keypad_session_lock:
+        await asyncio.to_thread(_switch_keypad_session, is_recording)
+
+
+def _active_recording() -> Path:
+    """Return the active recording, its session log if it was timed."""
+    path = Path('recordings/active.ubosession')
+    return path if path.exists() else Path('recordings/active.json')
+
+
 async def _replay_recorded_sequence() -> None:
     """Replay the recorded sequence."""
-    await replay_actions(store, Path('recordings/active.json'))
+    await replay_actions(store, _active_recording())
 
 
 def setup_side_effects() -> Subscriptions:
@@ -228,6 +279,7 @@ def setup_side_effects() -> Subscriptions:
         store.subscribe_event(SnapshotEvent, _take_snapshot),
         store.subscribe_event(StoreRecordedSequenceEvent, _store_recorded_sequence),
         store.subscribe_event(ReplayRecordedSequenceEvent, _replay_recorded_sequence),
+        store.subscribe_event(SettingsDumpStoreTraceEvent, _dump_store_trace),
         bus_provider.clean_up,
     ]
 
@@ -268,6 +320,13 @@ def setup_side_effects() -> Subscriptions:
             else mcu_server.close_server(),
         )
 
+    store.autorun(lambda state: state.main.is_recording)(_toggle_keypad_session)
+
+    @store.autorun(lambda state: state.settings.store_tracing)
+    def _store_tracing_toggle(enabled: bool) -> None:  # noqa: FBT001
+        """Start or stop store tracing to match the setting."""
+        store_tracer.set_enabled(enabled)
+
     store.dispatch(UpdateManagerRequestCheckAction())
 
     return subscriptions
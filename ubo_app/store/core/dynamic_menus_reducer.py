@@ -44,9 +44,15 @@ def reducer(
 
             # Update the menus dict
             new_menus = {**state.menus, action.menu_id: menu_data}
+            version = state.version + 1
 
             return CompleteReducerResult(
-                state=replace(state, menus=new_menus, version=state.version + 1),
+                state=replace(
+                    state,
+                    menus=new_menus,
+                    version=version,
+                    versions={**state.versions, action.menu_id: version},
+                ),
                 events=[DynamicMenuChangedEvent(menu_id=action.menu_id)],
             )
 
@@ -55,9 +61,15 @@ def reducer(
                 return state
 
             new_menus = {k: v for k, v in state.menus.items() if k != action.menu_id}
+            versions = {k: v for k, v in state.versions.items() if k != action.menu_id}
 
             return CompleteReducerResult(
-                state=replace(state, menus=new_menus, version=state.version + 1),
+                state=replace(
+                    state,
+                    menus=new_menus,
+                    version=state.version + 1,
+                    versions=versions,
+                ),
                 events=[DynamicMenuChangedEvent(menu_id=action.menu_id)],
             )
 
@@ -42,7 +42,6 @@ from ubo_app.store.services.notifications import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
 
     from ubo_app.store.core.types import (
         ApplicationStackItem,
@@ -71,10 +70,7 @@ def _dispatch_original_notification_action(
     ):
         return False
 
-    notification = next(
-        (n for n in state.notifications.notifications if n.id == notification_id),
-        None,
-    )
+    notification = state.notifications.notifications.get(notification_id)
     if not notification:
         return False
 
@@ -230,14 +226,10 @@ def _dismiss_notification(notification_id: str) -> None:
 
     store.dispatch(StackPopNotificationAction(notification_id=notification_id))
 
-    @store.with_state(lambda state: state.notifications.notifications)
-    def clear_notification(
-        notifications: Sequence[Notification],
-    ) -> None:
-        notif = next(
-            (n for n in notifications if n.id == notification_id),
-            None,
-        )
+    @store.with_state(
+        lambda state: state.notifications.notifications.get(notification_id),
+    )
+    def clear_notification(notif: Notification | None) -> None:
         if notif:
             store.dispatch(NotificationsClearAction(notification=notif))
 
@@ -249,14 +241,10 @@ def _show_extra_info(notification_id: str) -> None:
     from ubo_app.store.services.notifications import Notification
     from ubo_app.store.services.speech_synthesis import SpeechSynthesisReadTextAction
 
-    @store.with_state(lambda state: state.notifications.notifications)
-    def _dispatch_speech(
-        notifications: Sequence[Notification],
-    ) -> None:
-        notification = next(
-            (n for n in notifications if n.id == notification_id),
-            None,
-        )
+    @store.with_state(
+        lambda state: state.notifications.notifications.get(notification_id),
+    )
+    def _dispatch_speech(notification: Notification | None) -> None:
         if notification and notification.extra_information:
             store.dispatch(
                 SpeechSynthesisReadTextAction(
@@ -589,14 +577,10 @@ def _handle_notification_display(event: NotificationsDisplayEvent) -> None:
         # and multiple FLASH updates each schedule their own timer.
         # Without this guard a stale timer would close an active
         # notification.
-        @store.with_state(lambda state: state.notifications.notifications)
-        def _dismiss_if_still_flash(
-            notifications: Sequence[Notification],
-        ) -> None:
-            current = next(
-                (n for n in notifications if n.id == notification_id),
-                None,
-            )
+        @store.with_state(
+            lambda state: state.notifications.notifications.get(notification_id),
+        )
+        def _dismiss_if_still_flash(current: Notification | None) -> None:
             if (
                 current is not None
                 and current.display_type is NotificationDisplayType.FLASH
@@ -28,7 +28,7 @@ from ubo_app.store.core.view_registry import register_category_icon
 from ubo_app.store.main import store
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Mapping
 
     from ubo_app.store.services.notifications import Notification
 
@@ -98,7 +98,7 @@ def _app_category_icon(category: str) -> str:
     options=AutorunOptions(default_value=None),
 )
 def update_notifications_dynamic_menu(
-    notifications: Sequence[Notification] | None,
+    notifications: Mapping[str, Notification] | None,
 ) -> None:
     """Update the dynamic menu for notifications (dumb UI architecture)."""
     if notifications is None:
@@ -114,7 +114,7 @@ def update_notifications_dynamic_menu(
                 background_color=notification.color,
                 action_id=f'{NOTIFICATION_DISPLAY_PREFIX}{notification.id}',
             )
-            for notification in notifications
+            for notification in notifications.values()
             if notification.expiration_timestamp is None
             or notification.expiration_timestamp > now
         )
@@ -78,6 +78,7 @@ from ubo_app.store.core.types import (
     RenderViewData,
     ReplayRecordedSequenceAction,
     ReplayRecordedSequenceEvent,
+    ReportProvisionalSlicesAction,
     ReportReplayingDoneAction,
     ScreenshotDataAction,
     ScreenshotDataEvent,
@@ -505,6 +506,9 @@ def reducer(
         case ReportReplayingDoneAction():
             return replace(state, is_replaying=False)
 
+        case ReportProvisionalSlicesAction():
+            return replace(state, provisional_slices=action.slices)
+
         case RegisterSettingAppAction():
             return register_setting_app(state, action)
 
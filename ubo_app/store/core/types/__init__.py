@@ -31,6 +31,7 @@ from ubo_app.store.core.types.actions import (
     RegisterRegularAppAction,
     RegisterSettingAppAction,
     ReplayRecordedSequenceAction,
+    ReportProvisionalSlicesAction,
     ReportReplayingDoneAction,
     ScreenshotDataAction,
     SetAreEnclosuresVisibleAction,
@@ -201,6 +202,7 @@ __all__ = [
     'RenderViewData',
     'ReplayRecordedSequenceAction',
     'ReplayRecordedSequenceEvent',
+    'ReportProvisionalSlicesAction',
     'ReportReplayingDoneAction',
     'ScreenshotDataAction',
     'ScreenshotDataEvent',
@@ -474,6 +474,12 @@ class ReportReplayingDoneAction(MainAction):
     """Action for reporting that replaying is done."""
 
 
+class ReportProvisionalSlicesAction(MainAction):
+    """Action for reporting the slices still restored from the state snapshot."""
+
+    slices: tuple[str, ...]
+
+
 class TakeScreenshotAction(MainAction):
     """Action to request a screenshot from the GUI client."""
 
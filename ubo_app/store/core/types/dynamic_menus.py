@@ -41,10 +41,12 @@ class DynamicMenusState(Immutable):
 
     The ``version`` counter increments on every update or clear, enabling
     efficient change detection in autorun selectors (compare one integer
-    instead of rebuilding tuple representations of all menus).  Note that
-    multiple menu updates within the same reducer tick share one version
-    bump — the counter signals "something changed", not per-menu versions.
+    instead of rebuilding tuple representations of all menus).  ``versions``
+    holds, per menu, the ``version`` its content last changed at, so a
+    selector interested in one menu (e.g. the one on screen) is not woken by
+    updates to the others.  A cleared menu has no entry.
     """
 
     menus: dict[str, DynamicMenuData] = field(default_factory=dict)
     version: int = 0
+    versions: dict[str, int] = field(default_factory=dict)
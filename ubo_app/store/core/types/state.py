@@ -46,6 +46,9 @@ class MainState(Immutable):
     registered_apps: dict[str, RegisteredAppEntry] = field(default_factory=dict)
     is_recording: bool = False
     is_replaying: bool = False
+    # Slices restored from the state snapshot that their services have not
+    # confirmed yet; what is drawn from them may still change.
+    provisional_slices: tuple[str, ...] = ()
     recorded_sequence: tuple[KeypadAction, ...] = ()
     # New: Computed view data for dumb UI architecture
     current_view: ViewData | None = None
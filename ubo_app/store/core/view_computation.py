@@ -9,7 +9,9 @@ from __future__ import annotations
 
 import math
 import socket
-from typing import TYPE_CHECKING
+import threading
+import time
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from ubo_app.constants import DEBUG_MENU
 from ubo_app.logger import logger
@@ -44,7 +46,6 @@ from ubo_app.store.core.view_helpers import find_dynamic_menu_for_position
 from ubo_app.store.core.view_registry import (
     get_home_view_data,
     get_menu_id_for_path,
-    get_registered_dependencies,
     get_registered_status_bar_dependencies,
 )
 from ubo_app.store.services.notifications import NotificationDisplayType
@@ -55,13 +56,15 @@ if TYPE_CHECKING:
     from ubo_app.store.core.types import StackItemType, ViewData
     from ubo_app.store.main import RootState, UboStore
 
+T = TypeVar('T')
+
 
 def _is_background_notification(state: RootState, item: StackItemType) -> bool:
     """Return True iff *item* is a non-screen-owning notification overlay.
 
     A BACKGROUND notification lives only in the status-bar progress
     wheel; a notification whose backing entry has already been cleared
-    from the list is mid-dismissal. Neither should be rendered as the
+    from the store is mid-dismissal. Neither should be rendered as the
     current view, even while its ``NotificationStackItem`` is still on
     the navigation stack. Keeping the stack item in place (instead of
     popping it on every progress update) avoids push/pop churn that
@@ -69,12 +72,10 @@ def _is_background_notification(state: RootState, item: StackItemType) -> bool:
     """
     if not isinstance(item, NotificationStackItem):
         return False
-    notifications = (
-        state.notifications.notifications if hasattr(state, 'notifications') else ()
-    )
-    notification = next(
-        (n for n in notifications if n.id == item.notification_id),
-        None,
+    notification = (
+        state.notifications.notifications.get(item.notification_id)
+        if hasattr(state, 'notifications')
+        else None
     )
     return (
         notification is None
@@ -106,16 +107,34 @@ def _hostname_title() -> str:
     Read at call time — NOT cached in a module-level constant — so the test
     ``socket.gethostname`` mock always applies. Freezing it at import races the
     fixture and leaks the real hostname into snapshots non-deterministically.
-    ``gethostname(2)`` is a cheap syscall, so per-status-bar-update is fine.
+    The status bar's key, computed on every action, reads it through
+    `_cached_hostname_title` instead.
     """
     return f'󰋜{socket.gethostname()}.local'
 
+
+# How long the status bar's key goes on with the hostname it last read, in
+# seconds; a rename shows within that.
+HOSTNAME_TTL = 5.0
+_hostname_cache: list[tuple[float, str]] = [(-math.inf, '')]
+
+
+def _cached_hostname_title() -> str:
+    """Return `_hostname_title`, read again at most every `HOSTNAME_TTL`."""
+    read_at, title = _hostname_cache[0]
+    now = time.monotonic()
+    if now - read_at >= HOSTNAME_TTL:
+        title = _hostname_title()
+        _hostname_cache[0] = (now, title)
+    return title
+
 __all__ = [
     'PAGE_SIZE',
     'compute_status_bar_data',
     'compute_view_from_root_state',
     'get_chat_view_data',
     'get_notification_view_data',
+    'get_view_computation_stats',
     'release_view_autorun',
     'setup_dynamic_view_autorun',
     'suppress_view_autorun',
@@ -181,10 +200,7 @@ def get_notification_view_data(
 
     notification = None
     if hasattr(state, 'notifications'):
-        notification = next(
-            (n for n in state.notifications.notifications if n.id == notification_id),
-            None,
-        )
+        notification = state.notifications.notifications.get(notification_id)
 
     if notification:
         # Convert notification actions to MenuItemData
@@ -344,7 +360,8 @@ def compute_status_bar_data(state: RootState) -> StatusBarData:
     """
     # Compute progress notifications from notifications with progress
     progress_notifications: list[ProgressNotificationData] = []
-    if hasattr(state, 'notifications') and state.notifications.notifications:
+    if hasattr(state, 'notifications'):
+        notifications = state.notifications.notifications
         progress_notifications = [
             ProgressNotificationData(
                 id=notification.id,
@@ -353,7 +370,9 @@ def compute_status_bar_data(state: RootState) -> StatusBarData:
                 ),
                 color=notification.color,
             )
-            for notification in state.notifications.notifications
+            for notification in (
+                notifications[id] for id in state.notifications.progress_ids
+            )
             if notification.progress is not None
         ]
 
@@ -466,7 +485,48 @@ def _chat_view_dependency(state: RootState) -> tuple[object, ...]:
     )
 
 
-def compute_view_from_root_state(state: RootState) -> ViewData:  # noqa: C901, PLR0912
+def _menu_depth(stack: tuple[StackItemType, ...]) -> int:
+    return len([item for item in stack if isinstance(item, MenuStackItem)])
+
+
+def _resolve_menu_id(
+    state: RootState,
+    stack: tuple[StackItemType, ...],
+    top_item: MenuStackItem,
+) -> str | None:
+    """Return the id of the dynamic menu *top_item* shows, if there is one."""
+    menus = state.dynamic_menus.menus
+
+    # First, try direct lookup: the top stack item's menu_key may itself
+    # be a registered dynamic menu ID (e.g. filesystem directories use
+    # 'file-system:dir:/path' as both the menu_key and the dynamic menu ID).
+    if top_item.menu_key in menus:
+        return top_item.menu_key
+
+    # Fall back to path-based matching for services where menu_key
+    # differs from the dynamic menu ID.
+    dynamic_match = find_dynamic_menu_for_position(
+        state.main,
+        state.dynamic_menus,
+        stack,
+    )
+    if dynamic_match is not None:
+        return dynamic_match[0]
+
+    # Final fallback: resolve the top item's menu_key as a single-element
+    # path. A top-level menu (e.g. 'main', 'power', 'notifications') can be
+    # pushed onto a non-root stack by a racing client, yielding a full path
+    # like ('settings', 'main') that no path matcher recognises. Matching the
+    # top key alone still renders the real menu instead of a blank, stuck
+    # view. Only genuine top-level keys are registered as single-element
+    # paths, so this never resolves to the wrong menu.
+    fallback_id = get_menu_id_for_path((top_item.menu_key,))
+    if fallback_id is not None and fallback_id in menus:
+        return fallback_id
+    return None
+
+
+def compute_view_from_root_state(state: RootState) -> ViewData:  # noqa: C901
     """Compute ViewData from the full RootState, using dynamic menus.
 
     This is the dumb UI architecture's view computation function. It uses
@@ -565,8 +625,7 @@ def compute_view_from_root_state(state: RootState) -> ViewData:  # noqa: C901, P
         return HomeViewData()
 
     # Check if we're at home (depth 1)
-    depth = len([i for i in stack if isinstance(i, MenuStackItem)])
-    if depth <= 1:
+    if _menu_depth(stack) <= 1:
         # Home view - get items from the HOME_MENU_ID dynamic menu
         home_data = get_home_view_data(state)
         cpu_percent = home_data.get('cpu_percent', 50.0)
@@ -588,35 +647,9 @@ def compute_view_from_root_state(state: RootState) -> ViewData:  # noqa: C901, P
             volume_level=volume_level,
         )
 
-    # First, try direct lookup: the top stack item's menu_key may itself
-    # be a registered dynamic menu ID (e.g. filesystem directories use
-    # 'file-system:dir:/path' as both the menu_key and the dynamic menu ID).
-    direct_menu = dynamic_menus_state.menus.get(top_item.menu_key)
-    if direct_menu is None:
-        # Fall back to path-based matching for services where menu_key
-        # differs from the dynamic menu ID.
-        dynamic_match = find_dynamic_menu_for_position(
-            main_state,
-            dynamic_menus_state,
-            stack,
-        )
-        if dynamic_match is not None:
-            menu_id, _ = dynamic_match
-            direct_menu = dynamic_menus_state.menus.get(menu_id)
-
-    if direct_menu is None:
-        # Final fallback: resolve the top item's menu_key as a single-element
-        # path. A top-level menu (e.g. 'main', 'power', 'notifications') can be
-        # pushed onto a non-root stack by a racing client, yielding a full path
-        # like ('settings', 'main') that no path matcher recognises. Matching the
-        # top key alone still renders the real menu instead of a blank, stuck
-        # view. Only genuine top-level keys are registered as single-element
-        # paths, so this never resolves to the wrong menu.
-        fallback_id = get_menu_id_for_path((top_item.menu_key,))
-        if fallback_id is not None:
-            direct_menu = dynamic_menus_state.menus.get(fallback_id)
-
-    if direct_menu is not None:
+    menu_id = _resolve_menu_id(state, stack, top_item)
+    if menu_id is not None:
+        direct_menu = dynamic_menus_state.menus[menu_id]
         items = direct_menu.items
         total_pages = compute_total_pages(
             len(items),
@@ -649,6 +682,107 @@ def compute_view_from_root_state(state: RootState) -> ViewData:  # noqa: C901, P
     )
 
 
+def _view_key(state: RootState) -> tuple[object, ...]:
+    """Return the inputs the view of the visible stack item is computed from.
+
+    This is the view autorun's selector and the key its computation is
+    memoized on. Only what the item on screen reads is in it: the visible
+    stack, and, for a menu, its version in ``DynamicMenusState.versions``;
+    at home, the gauges too. Updates to menus, notifications or metrics
+    that are not on screen leave it unchanged.
+    """
+    from ubo_app.store.core.menus import HOME_MENU_ID
+
+    stack = visible_stack(state)
+    if not stack:
+        return ()
+    top_item = stack[-1]
+
+    if isinstance(top_item, NotificationStackItem):
+        notification = state.notifications.notifications.get(top_item.notification_id)
+        return (stack, _notification_view_dependency(notification))
+    if isinstance(top_item, ChatStackItem):
+        return (stack, _chat_view_dependency(state))
+    if not isinstance(top_item, MenuStackItem):
+        # Application, render, instruction and prompt views come from their
+        # stack item alone.
+        return (stack,)
+
+    versions = state.dynamic_menus.versions
+    if _menu_depth(stack) <= 1:
+        return (stack, versions.get(HOME_MENU_ID), get_home_view_data(state))
+    menu_id = _resolve_menu_id(state, stack, top_item)
+    return (stack, menu_id, versions.get(menu_id) if menu_id else None)
+
+
+def _status_bar_key(state: RootState) -> tuple[object, ...]:
+    """Return the inputs ``compute_status_bar_data`` reads.
+
+    It is computed on every action, so it reads nothing it has to walk: the
+    progress notifications are represented by the whole notifications slice,
+    which is replaced only when a notification changes, and compared by
+    identity until then.
+    """
+    sensors = getattr(state, 'sensors', None)
+    main = getattr(state, 'main', None)
+    return (
+        _cached_hostname_title(),
+        getattr(state, 'notifications', None),
+        getattr(getattr(state, 'status_icons', None), 'icons', None),
+        getattr(getattr(sensors, 'temperature', None), 'value', None),
+        getattr(getattr(sensors, 'light', None), 'value', None),
+        getattr(getattr(state, 'localization', None), 'clock', None),
+        getattr(main, 'is_recording', False),
+        getattr(main, 'is_replaying', False),
+        getattr(getattr(state, 'audio', None), 'is_recording', False),
+        get_registered_status_bar_dependencies(state),
+    )
+
+
+class _MemoizedStage(Generic[T]):
+    """A stage of the view computation, recomputed only when its key changes.
+
+    The autoruns' reactions may run concurrently, so the last key and value
+    are swapped under a lock; the computation itself runs outside it.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[RootState], object],
+        compute: Callable[[RootState], T],
+    ) -> None:
+        self._key = key
+        self._compute = compute
+        self._lock = threading.Lock()
+        self._last: tuple[object, T] | None = None
+        self.computed = 0
+        self.avoided = 0
+
+    def __call__(self, state: RootState) -> T:
+        key = self._key(state)
+        with self._lock:
+            if self._last is not None and self._last[0] == key:
+                self.avoided += 1
+                return self._last[1]
+        value = self._compute(state)
+        with self._lock:
+            self._last = (key, value)
+            self.computed += 1
+        return value
+
+
+_view_stage = _MemoizedStage(_view_key, compute_view_from_root_state)
+_status_bar_stage = _MemoizedStage(_status_bar_key, compute_status_bar_data)
+
+
+def get_view_computation_stats() -> dict[str, dict[str, int]]:
+    """Return how often the view and the status bar were computed or reused."""
+    return {
+        name: {'computed': stage.computed, 'avoided': stage.avoided}
+        for name, stage in (('view', _view_stage), ('status_bar', _status_bar_stage))
+    }
+
+
 def _dispatch_view_update(state: RootState, store: UboStore) -> None:
     """Compute view and status bar, then dispatch if changed.
 
@@ -668,8 +802,8 @@ def _dispatch_view_update(state: RootState, store: UboStore) -> None:
         UpdateCurrentViewAction,
     )
 
-    computed_view = compute_view_from_root_state(state)
-    computed_status_bar = compute_status_bar_data(state)
+    computed_view = _view_stage(state)
+    computed_status_bar = _status_bar_stage(state)
 
     view_changed = state.main.current_view != computed_view
     status_bar_changed = state.main.status_bar != computed_status_bar
@@ -705,23 +839,24 @@ def _dispatch_view_update(state: RootState, store: UboStore) -> None:
 def _dispatch_status_bar_update(state: RootState, store: UboStore) -> None:
     """Compute status bar and view freshly, dispatch if either changed.
 
-    The view is recomputed from scratch via ``compute_view_from_root_state``
-    rather than snapshotting ``state.main.current_view``. Snapshotting the
+    The view comes from ``_view_stage``, keyed on its inputs, rather than
+    from a snapshot of ``state.main.current_view``. Snapshotting the
     *output* (``current_view``) is unsafe: this autorun runs as a synchronous
     listener while the action queue is still draining, so the snapshot lags
     behind any pending view change. Re-dispatching that stale snapshot makes
     the reducer clobber the newer view back to the old one — the notification
     ⇄ menu flicker seen during Piper voice downloads (the status-bar autorun
     fires dozens of times a second on progress updates). Recomputing from the
-    *inputs* (stack, notifications, dynamic menus) is always correct, and the
+    *inputs* (stack, notifications, dynamic menus) is always correct; while
+    they are unchanged the memoized view is reused, and the
     ``UpdateCurrentViewAction`` reducer dedupes redundant dispatches.
     """
     if not hasattr(state, 'main'):
         return
     from ubo_app.store.core.types import UpdateCurrentViewAction
 
-    computed_status_bar = compute_status_bar_data(state)
-    computed_view = compute_view_from_root_state(state)
+    computed_status_bar = _status_bar_stage(state)
+    computed_view = _view_stage(state)
     status_bar_changed = state.main.status_bar != computed_status_bar
     view_changed = state.main.current_view != computed_view
 
@@ -746,13 +881,17 @@ def setup_dynamic_view_autorun() -> None:
     This should be called after the store is initialized.  Two autoruns are
     created to separate concerns:
 
-    1. **View autorun** - watches navigation stack, dynamic menus,
-       notifications, and registered apps.  Fires infrequently (on user
-       interaction / service registration).
+    1. **View autorun** - watches what the visible stack item's view reads
+       (see ``_view_key``): the stack, the menu on screen, the notification
+       or chat on screen, the gauges at home.  Fires infrequently (on user
+       interaction, or when the content on screen changes).
 
-    2. **Status-bar autorun** - watches home-view data (CPU, RAM, volume)
-       and status-bar dependencies (clock, temperature, icons).  Fires more
-       often but only recomputes status bar data (cheap).
+    2. **Status-bar autorun** - watches the status bar's inputs (clock,
+       temperature, icons, progress, recording flags).  Fires more often but
+       only recomputes status bar data (cheap).
+
+    Each reaction takes the other half of ``UpdateCurrentViewAction`` from
+    its memoized stage, which only recomputes if its own inputs changed.
     """
     from redux import AutorunOptions
 
@@ -772,26 +911,7 @@ def setup_dynamic_view_autorun() -> None:
 
     # -- View autorun (infrequent) ------------------------------------------
 
-    @store.autorun(
-        lambda state: (
-            state.main.stack,
-            state.dynamic_menus.version,
-            state.main.is_recording,
-            state.main.is_replaying,
-            tuple(state.main.registered_apps.keys()),
-            tuple(
-                _notification_view_dependency(n)
-                for n in (
-                    state.notifications.notifications
-                    if hasattr(state, 'notifications')
-                    else ()
-                )
-            ),
-            _chat_view_dependency(state),
-            get_registered_dependencies(state),
-        ),
-        options=AutorunOptions(default_value=None),
-    )
+    @store.autorun(_view_key, options=AutorunOptions(default_value=None))
     def _update_view_on_navigation_change(_: tuple | None) -> None:
         """Update current_view when stack, dynamic menus, etc. change."""
         if _suppressed[0]:
@@ -801,13 +921,7 @@ def setup_dynamic_view_autorun() -> None:
 
     # -- Status-bar autorun (frequent but cheap) ----------------------------
 
-    @store.autorun(
-        lambda state: (
-            get_home_view_data(state),
-            get_registered_status_bar_dependencies(state),
-        ),
-        options=AutorunOptions(default_value=None),
-    )
+    @store.autorun(_status_bar_key, options=AutorunOptions(default_value=None))
     def _update_status_bar_on_metrics_change(_: tuple | None) -> None:
         """Update status bar when metrics / clock / icons change."""
         if _suppressed[0]:
@@ -31,9 +31,6 @@ class ViewRegistry:
     home_view_selectors: dict[str, Callable[[RootState], Any]] = field(
         default_factory=dict,
     )
-    menu_content_selectors: dict[str, Callable[[RootState], Any]] = field(
-        default_factory=dict,
-    )
 
     # Path matchers: matcher_id -> (priority, matcher_func)
     path_menu_matchers: dict[
@@ -125,31 +122,6 @@ def register_home_view_dependency(
     return unregister
 
 
-def register_menu_content_dependency(
-    dependency_id: str,
-    selector: Callable[[RootState], Any],
-) -> Callable[[], None]:
-    """Register a selector that affects menu content.
-
-    Use for state like assistant engine selections that affect menu item rendering.
-
-    Args:
-        dependency_id: Unique identifier for this dependency (e.g., 'assistant:stt').
-        selector: Function that extracts relevant state for view updates.
-
-    Returns:
-        Unregister function that removes this dependency when called.
-
-    """
-    registry = _get_registry()
-    registry.menu_content_selectors[dependency_id] = selector
-
-    def unregister() -> None:
-        registry.menu_content_selectors.pop(dependency_id, None)
-
-    return unregister
-
-
 def get_registered_status_bar_dependencies(state: RootState) -> tuple[Any, ...]:
     """Get registered status bar dependency values.
 
@@ -170,37 +142,6 @@ def get_registered_status_bar_dependencies(state: RootState) -> tuple[Any, ...]:
     return tuple(results)
 
 
-def get_registered_dependencies(state: RootState) -> tuple[Any, ...]:
-    """Get registered dependency values for view computation.
-
-    This function is called by the view computation autorun to build a tuple
-    of dependency values that affect which view to show. When any value changes,
-    the autorun will re-run and recompute the view.
-
-    Note: The following are intentionally excluded:
-    - status_bar_selectors: contain frequently-changing values (clock) that
-      only affect status bar rendering, not view computation
-    - home_view_selectors: contain CPU/RAM metrics that change every second
-      but only affect home page gauge rendering, not view selection
-
-    Args:
-        state: The current RootState.
-
-    Returns:
-        Tuple of all registered view dependency values.
-
-    """
-    registry = _get_registry()
-    results: list[Any] = []
-    # Only menu_content_selectors affect view computation
-    for selector in registry.menu_content_selectors.values():
-        try:
-            results.append(selector(state))
-        except (AttributeError, KeyError):
-            results.append(None)
-    return tuple(results)
-
-
 # =============================================================================
 # Path Menu Matchers
 # =============================================================================
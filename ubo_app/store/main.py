@@ -8,6 +8,7 @@ import inspect
 import threading
 import weakref
 from asyncio import Handle, iscoroutine
+from collections.abc import Mapping
 from enum import Flag, IntEnum, StrEnum
 from types import GenericAlias
 from typing import (
@@ -21,11 +22,9 @@ from typing import (
     Union,
     cast,
     get_origin,
-    get_type_hints,
     overload,
 )
 
-import dill
 from fake import Fake
 from immutable import Immutable, is_immutable
 from redux import (
@@ -59,10 +58,12 @@ from ubo_app.store.input.reducer import reducer as input_reducer
 from ubo_app.store.scheduler import Scheduler
 from ubo_app.store.settings.reducer import reducer as settings_reducer
 from ubo_app.store.status_icons.reducer import reducer as status_icons_reducer
+from ubo_app.store.tracing import now as tracing_now
+from ubo_app.store.tracing import reaction, store_tracer
 from ubo_app.store.update_manager.reducer import reducer as update_manager_reducer
 from ubo_app.utils.async_ import ToThreadOptions
 from ubo_app.utils.error_handlers import report_service_error
-from ubo_app.utils.serializer import add_type_field
+from ubo_app.utils.serializer import add_type_field, field_types, resolve_type_tag
 from ubo_app.utils.service import get_coroutine_runner
 
 if TYPE_CHECKING:
@@ -315,8 +316,33 @@ class _UboEventHandler(Generic[StrictEvent]):
 
         self.coroutine_runner = get_coroutine_runner()
 
+    @property
+    def service_label(self: Self) -> str:
+        service = getattr(self.coroutine_runner, '__self__', None)
+        return getattr(service, 'service_id', None) or 'main'
+
     def __call__(self: Self, event: StrictEvent) -> None:
+        queued_at = tracing_now() if store_tracer.enabled else None
+
         async def wrapper() -> None:
+            # The wrapper runs as a task of its own, so this stays in its context.
+            reaction.set(self.handler_qualname)
+            if queued_at is None:
+                await run()
+                return
+            started_at = tracing_now()
+            try:
+                await run()
+            finally:
+                store_tracer.handler_finished(
+                    event=event,
+                    handler=self.handler_qualname,
+                    service=self.service_label,
+                    queued_at=queued_at,
+                    started_at=started_at,
+                )
+
+        async def run() -> None:
             if isinstance(self.handler_ref, weakref.ref):
                 handler = cast('EventHandler[StrictEvent]', self.handler_ref())
                 if not handler:
@@ -383,7 +409,7 @@ class UboStore(Store[RootState, UboAction, UboEvent]):
             return cls._serialize_dataclass_to_dict(obj)
         if callable(obj):
             return f'<function:{obj.__name__}>'
-        if isinstance(obj, dict):
+        if isinstance(obj, Mapping):
             return {k: cls.serialize_value(v) for k, v in obj.items()}
         if isinstance(obj, Handle | Fake) or _is_page_widget(obj):
             return f'<{type(obj).__name__}>'
@@ -446,25 +472,15 @@ class UboStore(Store[RootState, UboAction, UboEvent]):
             if type_ == 'bytes':
                 return base64.b64decode(data['value'].encode('utf-8'))
 
-            if isinstance(type_, type):
-                class_ = type_
-            elif isinstance(type_, str):
-                class_ = dill.loads(base64.b64decode(type_.encode('utf-8')))  # noqa: S301
-            else:
-                msg = f'Invalid type {type(type_)}'
-                raise TypeError(msg)
-
+            class_ = resolve_type_tag(type_)
             # Field types let a nested enum field (e.g. `AudioOutputVolume.output`)
             # round-trip correctly - without them every field is reloaded with
             # object_type=None and an enum field comes back as a bare str.
-            try:
-                field_types = get_type_hints(class_)
-            except (NameError, TypeError):
-                field_types = {}
+            types = field_types(class_)
             parameters = {
                 key: (
                     self.load_object(value, object_type=field_type)
-                    if isinstance(field_type := field_types.get(key), type)
+                    if (field_type := types.get(key)) is not None
                     else self.load_object(value)
                 )
                 for key, value in data.items()
@@ -526,6 +542,10 @@ class UboStore(Store[RootState, UboAction, UboEvent]):
     # Lower = more responsive events, higher = better action throughput
     ACTIONS_PER_EVENT_CHECK = 50
 
+    # Identifier of the thread running the store, while one is; what is
+    # dispatched from it came from a reducer or a synchronous listener.
+    running_thread: int | None = None
+
     def run(self: Self) -> None:
         """Override to interleave action and event processing.
 
@@ -534,40 +554,58 @@ class UboStore(Store[RootState, UboAction, UboEvent]):
         the action processing logic to process N actions, then ALL pending
         events, then repeat.
         """
+        with self._is_running:
+            self.running_thread = threading.get_ident()
+            try:
+                self._run_queues()
+            finally:
+                self.running_thread = None
+
+    def _run_queues(self: Self) -> None:
+        while len(self._actions) > 0 or len(self._events) > 0:
+            # Process a batch of actions (up to ACTIONS_PER_EVENT_CHECK)
+            actions_processed = 0
+            while (
+                len(self._actions) > 0
+                and actions_processed < self.ACTIONS_PER_EVENT_CHECK
+            ):
+                action = self._actions.pop(0)
+                if action is not None:
+                    self._run_action(action)
+
+                actions_processed += 1
+
+            # Process ALL pending events before continuing with actions
+            if len(self._events) > 0:
+                self._run_event_handlers()
+
+    def _run_action(self: Self, action: UboAction) -> None:
+        """Reduce ``action``, notify listeners and queue what it produced."""
         from redux import is_complete_reducer_result, is_state_reducer_result
         from redux.basic_types import FinishAction, FinishEvent
 
-        with self._is_running:
-            while len(self._actions) > 0 or len(self._events) > 0:
-                # Process a batch of actions (up to ACTIONS_PER_EVENT_CHECK)
-                actions_processed = 0
-                while (
-                    len(self._actions) > 0
-                    and actions_processed < self.ACTIONS_PER_EVENT_CHECK
-                ):
-                    action = self._actions.pop(0)
-                    if action is not None:
-                        result = self.reducer(self._state, action)
-                        if is_complete_reducer_result(result):
-                            self._state = result.state
-                            if self._state is not None:
-                                self._call_listeners(self._state)
-                            self._dispatch(
-                                [*(result.actions or []), *(result.events or [])],
-                            )
-                        elif is_state_reducer_result(result):
-                            self._state = result
-                            if self._state is not None:
-                                self._call_listeners(self._state)
-
-                        if isinstance(action, FinishAction):
-                            self._dispatch([FinishEvent()])
-
-                    actions_processed += 1
-
-                # Process ALL pending events before continuing with actions
-                if len(self._events) > 0:
-                    self._run_event_handlers()
+        tracing = store_tracer.enabled
+        if tracing:
+            dequeued_at = store_tracer.action_dequeued(action)
+        result = self.reducer(self._state, action)
+        if tracing:
+            reduced_at = store_tracer.action_reduced(action, dequeued_at)
+        if is_complete_reducer_result(result):
+            self._state = result.state
+            if self._state is not None:
+                self._call_listeners(self._state)
+            self._dispatch(
+                [*(result.actions or []), *(result.events or [])],
+            )
+        elif is_state_reducer_result(result):
+            self._state = result
+            if self._state is not None:
+                self._call_listeners(self._state)
+        if tracing:
+            store_tracer.action_listeners_done(action, reduced_at)
+
+        if isinstance(action, FinishAction):
+            self._dispatch([FinishEvent()])
 
 
 CALL_EVENT_KWARGS_KEY = '__ubo_autorun_call_event'
@@ -640,8 +678,12 @@ class _UboAutorun(
             'threading.Event',
             kwargs.pop(CALL_EVENT_KWARGS_KEY, None),
         )
+        tracing = store_tracer.enabled
+        woken_by = store_tracer.autorun_woken() if tracing else None
 
         def wrapper(super_: Autorun) -> None:
+            started_at = tracing_now() if tracing else 0
+            token = reaction.set(self.handler_qualname)
             try:
                 with self._reaction_lock:
                     super_.call(*args, **kwargs)
@@ -656,6 +698,13 @@ class _UboAutorun(
                 )
                 report_service_error()
             finally:
+                reaction.reset(token)
+                if tracing:
+                    store_tracer.autorun_finished(
+                        autorun=self.handler_qualname,
+                        woken_by=woken_by,
+                        started_at=started_at,
+                    )
                 if call_event:
                     call_event.set()
 
@@ -695,6 +744,8 @@ def ubo_create_task(
 
 
 def action_middleware(action: UboAction) -> UboAction:
+    if store_tracer.enabled:
+        store_tracer.action_dispatched(action)
     logger.verbose(
         'Action dispatched',
         extra={'action': action},
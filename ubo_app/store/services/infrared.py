@@ -23,6 +23,8 @@ class InfraredHandleReceivedCodeAction(InfraredAction):
 
     protocol: str
     scancode: str
+    # Sent again because the button is still held, not pressed anew.
+    repeat: bool = False
 
 
 class InfraredSendCodeAction(InfraredAction):
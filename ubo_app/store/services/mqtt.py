@@ -257,6 +257,10 @@ class MqttPublishAction(MqttAction):
     payload: str
     retain: bool = False
     qos: int = 0
+    # The payload is state that a newer one on the same channel supersedes — a
+    # sensor reading, not an event. While it waits to be sent, a newer publish
+    # replaces it instead of queueing behind it. Ignored above QoS 0.
+    coalesce: bool = False
 
 
 class MqttPublishEvent(MqttEvent):
@@ -264,6 +268,7 @@ class MqttPublishEvent(MqttEvent):
     payload: str
     retain: bool = False
     qos: int = 0
+    coalesce: bool = False
 
 
 class MqttRequestAnnounceAction(MqttAction):
@@ -360,8 +365,8 @@ def persist_broker(broker: MqttBrokerConfig) -> str:
     """Render the broker config as the string the persistent store holds.
 
     Lives next to `_parse_broker` deliberately: the two are one contract, and a
-    selector that handed the `Immutable` over directly would get a dill-pickled
-    `_type` marker written instead of the plain JSON the parser reads back.
+    selector that handed the `Immutable` over directly would get a type tag
+    (`_type`) written instead of the plain JSON the parser reads back.
     """
     return json.dumps(serialize_broker(broker))
 
@@ -14,11 +14,12 @@ from redux import BaseAction, BaseEvent
 from ubo_app.colors import SECONDARY_COLOR_LIGHT
 from ubo_app.constants import NOTIFICATIONS_FLASH_TIME
 from ubo_app.utils.dataclass import default_provider
+from ubo_app.utils.persistent_map import PersistentMap
 
 Color = tuple[float, ...] | str
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
 
     from ubo_app.store.main import UboAction
     from ubo_app.store.services.speech_synthesis import ReadableInformation
@@ -171,6 +172,13 @@ class NotificationsDisplayEvent(NotificationsEvent):
 
 
 class NotificationsState(Immutable):
-    notifications: Sequence[Notification]
-    unread_count: int
+    # Keyed by id, newest first; an update to a pending notification keeps its
+    # place. The reducer keeps them in a `PersistentMap`, so a change copies a
+    # few nodes of it rather than every pending notification.
+    notifications: Mapping[str, Notification] = field(default_factory=PersistentMap)
+    unread_count: int = 0
+    # The weighted sum of the progress notifications' progress, and their ids,
+    # newest first. Both are kept up to date by the reducer so nothing has to
+    # walk all the notifications to find them.
     progress: float | None = None
+    progress_ids: tuple[str, ...] = ()
@@ -87,6 +87,25 @@ class SensorsReportDeviceReadingsAction(SensorsAction):
     timestamp: float
 
 
+class SensorDeviceReadings(Immutable):
+    device_id: str
+    entities: tuple[SensorEntityReading, ...]
+
+
+class SensorsReportReadingsAction(SensorsAction):
+    """Everything one poll tick changed, in a single dispatch.
+
+    Only entities that moved past their deadband, or are due a heartbeat, are
+    carried; the reducer merges them into what each device already has. The
+    legacy status-bar fields are `None` when they did not change.
+    """
+
+    timestamp: float
+    devices: tuple[SensorDeviceReadings, ...] = ()
+    temperature: float | None = None
+    light: float | None = None
+
+
 class SensorState(Immutable):
     value: float | None = None
 
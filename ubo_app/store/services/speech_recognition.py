@@ -78,6 +78,19 @@ class WakeWordModelStatusEntry(Immutable):
     model_id: str = ''
 
 
+class LoadedModelInfo(Immutable):
+    """A model held by the speech-recognition model manager."""
+
+    key: str
+    engine: str
+    # Wall time the loader took, in seconds.
+    load_seconds: float
+    # Growth of the process's resident set while the model loaded, in bytes.
+    resident_bytes: int
+    # Number of engines currently using it; idle (0) models may be evicted.
+    users: int
+
+
 class SpeechRecognitionAction(BaseAction):
     """Base class for speech recognition actions."""
 
@@ -191,6 +204,12 @@ class WakeWordSetModelsStatusAction(SpeechRecognitionAction):
     status: WakeWordModelStatus
 
 
+class SpeechRecognitionSetLoadedModelsAction(SpeechRecognitionAction):
+    """Publish the models currently held by the model manager."""
+
+    models: tuple[LoadedModelInfo, ...]
+
+
 # --- Voice commands (intents) -----------------------------------------------
 
 
@@ -707,6 +726,9 @@ class SpeechRecognitionState(Immutable):
     wake_word_models_status: tuple[WakeWordModelStatusEntry, ...] = field(
         default_factory=tuple,
     )
+    # Models currently loaded in memory, with their load cost. Published by the
+    # service's model manager; not persisted.
+    loaded_models: tuple[LoadedModelInfo, ...] = field(default_factory=tuple)
     # Ids of the default commands that have already been offered to this device.
     # Lets a release add new defaults to an existing install without resurrecting
     # defaults the user deliberately deleted. See ``commands.load_or_seed_commands``.
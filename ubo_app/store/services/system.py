@@ -1,6 +1,8 @@
 # ruff: noqa: D100
 from __future__ import annotations
 
+from dataclasses import field
+
 from immutable import Immutable
 from redux import BaseAction, BaseEvent
 
@@ -41,6 +43,31 @@ class SystemStorageUpdateAction(SystemAction):
     disk_percent: float
 
 
+class ServiceUsage(Immutable):
+    """What one service costs the core process.
+
+    The core is one process with a thread (and event loop) per service, so
+    `top` shows a single figure; this is that figure split by service. Threads
+    and allocations no service owns are reported under the ``core`` key.
+    """
+
+    # Percent of one CPU core over the last sampling interval.
+    cpu_percent: float = 0.0
+    # CPU time of every thread the service ever ran, in seconds.
+    cpu_seconds: float = 0.0
+    threads: int = 0
+    # Live allocations made from the service's code; `None` unless memory
+    # accounting is on (``UBO_DEBUG_SERVICE_MEMORY``).
+    allocated_bytes: int | None = None
+    allocated_blocks: int | None = None
+
+
+class SystemServiceUsageUpdateAction(SystemAction):
+    """Replace the per-service usage with a new sample."""
+
+    usage: dict[str, ServiceUsage]
+
+
 class SystemEvent(BaseEvent):
     """Base event for system metrics."""
 
@@ -50,7 +77,8 @@ class SystemState(Immutable):
 
     The fields are deliberately flat scalars: the slice is streamed to remote
     clients as a whole, and nested types would each become a wrapper message on
-    the wire for no benefit.
+    the wire for no benefit. `service_usage` is the exception: it is a map by
+    nature.
     """
 
     cpu_percent: float = 0.0
@@ -74,3 +102,5 @@ class SystemState(Immutable):
     disk_percent: float = 0.0
     network_upload_bps: float = 0.0
     network_download_bps: float = 0.0
+    # Keyed by service id; sampled far less often than the metrics above.
+    service_usage: dict[str, ServiceUsage] = field(default_factory=dict)
@@ -36,14 +36,16 @@ THIRD_PARTY_MENU_ID = 'settings:system:third_party'
 # =============================================================================
 
 
-def _setup_general_settings() -> None:
+def _setup_general_settings() -> None:  # noqa: C901
     """Set up dynamic menu and action handlers for General settings."""
     from ubo_app.store.core.action_registry import register_action
     from ubo_app.store.settings.types import (
+        SettingsDumpStoreTraceAction,
         SettingsToggleAssistantDebugAction,
         SettingsToggleBetaVersionsAction,
         SettingsToggleGrpcRemoteAccessAction,
         SettingsTogglePdbSignalAction,
+        SettingsToggleStoreTracingAction,
         SettingsToggleTcpLiteAction,
         SettingsToggleVisualDebugAction,
     )
@@ -66,6 +68,12 @@ def _setup_general_settings() -> None:
     def _toggle_tcp_lite() -> None:
         store.dispatch(SettingsToggleTcpLiteAction())
 
+    def _toggle_store_tracing() -> None:
+        store.dispatch(SettingsToggleStoreTracingAction())
+
+    def _dump_store_trace() -> None:
+        store.dispatch(SettingsDumpStoreTraceAction())
+
     register_action('settings:general:toggle_pdb', _toggle_pdb)
     register_action('settings:general:toggle_visual_debug', _toggle_visual_debug)
     register_action('settings:general:toggle_beta', _toggle_beta)
@@ -75,6 +83,8 @@ def _setup_general_settings() -> None:
     )
     register_action('settings:general:toggle_assistant_debug', _toggle_assistant_debug)
     register_action('settings:general:toggle_tcp_lite', _toggle_tcp_lite)
+    register_action('settings:general:toggle_store_tracing', _toggle_store_tracing)
+    register_action('settings:general:dump_store_trace', _dump_store_trace)
 
     @store.autorun(
         lambda state: (
@@ -84,11 +94,12 @@ def _setup_general_settings() -> None:
             state.settings.grpc_remote_access,
             state.settings.assistant_debug,
             state.settings.tcp_lite_enabled,
+            state.settings.store_tracing,
         ),
         options=AutorunOptions(default_value=None),
     )
     def _sync_general_menu(
-        data: tuple[bool, bool, bool, bool, bool, bool] | None,
+        data: tuple[bool, bool, bool, bool, bool, bool, bool] | None,
     ) -> None:
         if data is None:
             return
@@ -99,6 +110,7 @@ def _setup_general_settings() -> None:
             grpc_remote_access,
             assistant_debug,
             tcp_lite_enabled,
+            store_tracing,
         ) = data
 
         store.dispatch(
@@ -142,6 +154,24 @@ def _setup_general_settings() -> None:
                         icon='󰱒' if tcp_lite_enabled else '󰄱',
                         action_id='settings:general:toggle_tcp_lite',
                     ),
+                    MenuItemData(
+                        key='store_tracing',
+                        label='Store Tracing',
+                        icon='󰱒' if store_tracing else '󰄱',
+                        action_id='settings:general:toggle_store_tracing',
+                    ),
+                    *(
+                        (
+                            MenuItemData(
+                                key='dump_store_trace',
+                                label='Dump Trace',
+                                icon='󰈔',
+                                action_id='settings:general:dump_store_trace',
+                            ),
+                        )
+                        if store_tracing
+                        else ()
+                    ),
                 ),
                 placeholder='',
             ),
@@ -23,8 +23,11 @@ from ubo_app.store.settings.types import (
     ServicesStatus,
     SettingsAction,
     SettingsClearServiceErrorsAction,
+    SettingsDumpStoreTraceAction,
+    SettingsDumpStoreTraceEvent,
     SettingsEvent,
     SettingsReportServiceErrorAction,
+    SettingsReportStoreTraceAction,
     SettingsServiceSetIsEnabledAction,
     SettingsServiceSetLogLevelAction,
     SettingsServiceSetShouldRestartAction,
@@ -35,10 +38,12 @@ from ubo_app.store.settings.types import (
     SettingsState,
     SettingsStopServiceAction,
     SettingsStopServiceEvent,
+    SettingsStoreTraceEvent,
     SettingsToggleAssistantDebugAction,
     SettingsToggleBetaVersionsAction,
     SettingsToggleGrpcRemoteAccessAction,
     SettingsTogglePdbSignalAction,
+    SettingsToggleStoreTracingAction,
     SettingsToggleTcpLiteAction,
     SettingsToggleVisualDebugAction,
 )
@@ -142,6 +147,29 @@ def reducer(
                 tcp_lite_enabled=not state.tcp_lite_enabled,
             )
 
+        case SettingsToggleStoreTracingAction():
+            return replace(
+                state,
+                store_tracing=not state.store_tracing,
+            )
+
+        case SettingsDumpStoreTraceAction():
+            return CompleteReducerResult(
+                state=state,
+                events=[SettingsDumpStoreTraceEvent()],
+            )
+
+        case SettingsReportStoreTraceAction():
+            return CompleteReducerResult(
+                state=state,
+                events=[
+                    SettingsStoreTraceEvent(
+                        path=action.path,
+                        download_token=action.download_token,
+                    ),
+                ],
+            )
+
         case SettingsSetServicesAction():
             enabled_services = [
                 service for service in action.services.values() if service.is_enabled
@@ -9,7 +9,12 @@ from pathlib import Path
 from immutable import Immutable
 from redux import BaseEvent
 
-from ubo_app.constants import DEBUG_BETA_VERSIONS, DEBUG_PDB_SIGNAL, DEBUG_VISUAL
+from ubo_app.constants import (
+    DEBUG_BETA_VERSIONS,
+    DEBUG_PDB_SIGNAL,
+    DEBUG_STORE_TRACING,
+    DEBUG_VISUAL,
+)
 from ubo_app.store.core.types import MainAction
 from ubo_app.utils.persistent_store import read_from_persistent_store
 
@@ -51,6 +56,21 @@ class SettingsToggleAssistantDebugAction(SettingsAction):
     """Toggle assistant debug session recording action."""
 
 
+class SettingsToggleStoreTracingAction(SettingsAction):
+    """Toggle store action/event tracing action."""
+
+
+class SettingsDumpStoreTraceAction(SettingsAction):
+    """Write the collected store trace to disk action."""
+
+
+class SettingsReportStoreTraceAction(SettingsAction):
+    """Report a written store trace action."""
+
+    path: str
+    download_token: str
+
+
 class SettingsSetServicesAction(SettingsAction):
     """Start service action."""
 
@@ -126,6 +146,17 @@ class SettingsStopServiceEvent(SettingsServiceEvent):
     """Stop service event."""
 
 
+class SettingsDumpStoreTraceEvent(SettingsEvent):
+    """Write the collected store trace to disk event."""
+
+
+class SettingsStoreTraceEvent(SettingsEvent):
+    """A store trace was written; its JSON is served at ``/download/<token>``."""
+
+    path: str
+    download_token: str
+
+
 class ErrorReport(Immutable):
     """Error report."""
 
@@ -195,5 +226,11 @@ class SettingsState(Immutable):
     default: sessions are written unconditionally while enabled, so this
     accumulates files.
     """
+    store_tracing: bool = DEBUG_STORE_TRACING
+    """Time every action, event handler and autorun (see ``store/tracing.py``).
+
+    Not persisted: tracing adds overhead to every dispatch, so it never
+    survives a restart unless ``UBO_DEBUG_STORE_TRACING`` is set.
+    """
     services: dict[str, ServiceState] = field(default_factory=dict)
     services_status: ServicesStatus = ServicesStatus.LOADING
@@ -0,0 +1,360 @@
+"""Opt-in tracing of store actions, event handlers and autoruns.
+
+When enabled (``UBO_DEBUG_STORE_TRACING`` or Settings → General → Store Tracing)
+the store timestamps every action at dispatch, when ``UboStore.run`` dequeues
+it, when its reducer returns and when its listeners (autorun checks) are done;
+every event handler when the store hands it to its service's loop, when it
+starts there and when it finishes; and every autorun reaction together with the
+action that woke it.
+
+Two views of that data are kept:
+
+- per-metric :class:`LatencyHistogram` s (queue wait, reduce and listener time
+  per action type; wait and run time per event handler; run time per autorun),
+- a bounded ring of spans exported as Chrome-trace JSON, which Perfetto and
+  ``chrome://tracing`` open directly; each service gets its own track.
+
+Disabled, the hooks cost one attribute check each.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from ubo_app.constants import DEBUG_STORE_TRACING
+from ubo_app.utils.file_download import register_download
+
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_SUB_BUCKET_HALF = _SUB_BUCKET_COUNT >> 1
+
+DEFAULT_CAPACITY = 10_000
+
+# The event handler or autorun running in this context, if any: what is
+# dispatched under it is the store reacting to itself, not input from outside.
+reaction: ContextVar[str | None] = ContextVar('reaction', default=None)
+
+
+def _bucket_index(value: int) -> int:
+    """Map ``value`` to its log-linear bucket (HDR layout, 7 significant bits)."""
+    if value < _SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS
+    return (shift << (_SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+
+def _bucket_value(index: int) -> int:
+    """Return the midpoint of the values that fall into bucket ``index``."""
+    if index < _SUB_BUCKET_COUNT:
+        return index
+    shift = index // _SUB_BUCKET_HALF - 1
+    mantissa = index - shift * _SUB_BUCKET_HALF
+    return (mantissa << shift) + (1 << (shift - 1))
+
+
+@dataclass
+class LatencyHistogram:
+    """HDR-style histogram of durations in microseconds.
+
+    Buckets are exact below 128 µs and keep 7 significant bits above, so any
+    percentile is within 1% of the recorded value at constant memory per decade.
+    """
+
+    counts: dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    total: int = 0
+    min: int = 0
+    max: int = 0
+
+    def record(self, microseconds: int) -> None:
+        """Add one duration."""
+        value = max(microseconds, 0)
+        index = _bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percentile: float) -> int:
+        """Return the duration at ``percentile`` (0-100), in microseconds."""
+        if self.count == 0:
+            return 0
+        threshold = max(1, round(self.count * percentile / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= threshold:
+                return min(max(_bucket_value(index), self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """Return count, mean and the usual percentiles, in microseconds."""
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0,
+            'min': self.min,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+def _now() -> int:
+    return time.perf_counter_ns() // 1000
+
+
+def _name(obj: object) -> str:
+    return type(obj).__name__
+
+
+class StoreTracer:
+    """Collects store timings while :attr:`enabled`."""
+
+    STORE_TRACK = 'store'
+    AUTORUN_TRACK = 'autoruns'
+
+    def __init__(self, *, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Create a disabled tracer keeping at most ``capacity`` spans."""
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._spans: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._tracks: dict[str, int] = {}
+        self._next_id = 0
+        # id(action) -> dispatch timestamp; popped when the store dequeues it.
+        self._dispatched_at: dict[int, int] = {}
+        # Name of the action whose listeners are running on ``_store_thread``,
+        # so autoruns scheduled from there can be attributed to it.
+        self.current_action: str | None = None
+        self._store_thread: int | None = None
+        self._woken: int = 0
+
+    def set_enabled(self, enabled: bool) -> None:  # noqa: FBT001
+        """Start or stop collecting; stopping keeps what was collected."""
+        with self._lock:
+            self.enabled = enabled
+            self._dispatched_at.clear()
+
+    def reset(self) -> None:
+        """Drop all collected spans and histograms."""
+        with self._lock:
+            self._spans.clear()
+            self._histograms.clear()
+            self._dispatched_at.clear()
+
+    def _record(  # noqa: PLR0913
+        self,
+        metric: str,
+        *,
+        name: str,
+        track: str,
+        start: int,
+        end: int,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        with self._lock:
+            histogram = self._histograms.get(metric)
+            if histogram is None:
+                histogram = self._histograms[metric] = LatencyHistogram()
+            histogram.record(end - start)
+            tid = self._tracks.setdefault(track, len(self._tracks) + 1)
+            span = {
+                'name': name,
+                'cat': metric.split(':', 1)[0],
+                'pid': os.getpid(),
+                'tid': tid,
+                **({'args': args} if args else {}),
+            }
+            if track == self.STORE_TRACK:
+                # The store thread reduces one action at a time, so its spans
+                # nest properly as complete events.
+                self._spans.append({**span, 'ph': 'X', 'ts': start, 'dur': end - start})
+            else:
+                # Queue waits, handlers and reactions overlap; async begin/end
+                # pairs keep the viewers from mis-nesting them.
+                self._next_id += 1
+                span['id'] = self._next_id
+                self._spans.append({**span, 'ph': 'b', 'ts': start})
+                self._spans.append({**span, 'ph': 'e', 'ts': end})
+
+    # Actions -----------------------------------------------------------------
+
+    def action_dispatched(self, action: object) -> None:
+        """Note the moment ``action`` entered the store's queue."""
+        self._dispatched_at[id(action)] = _now()
+
+    def action_dequeued(self, action: object) -> int:
+        """Record the queue wait of ``action`` and return the dequeue timestamp."""
+        now = _now()
+        dispatched_at = self._dispatched_at.pop(id(action), None)
+        if dispatched_at is not None:
+            name = _name(action)
+            self._record(
+                f'queue:{name}',
+                name=f'queued {name}',
+                track='store queue',
+                start=dispatched_at,
+                end=now,
+            )
+        return now
+
+    def action_reduced(self, action: object, dequeued_at: int) -> int:
+        """Record the reducer time of ``action``; start counting its wake-ups."""
+        now = _now()
+        name = _name(action)
+        self._record(
+            f'reduce:{name}',
+            name=name,
+            track=self.STORE_TRACK,
+            start=dequeued_at,
+            end=now,
+        )
+        self.current_action = name
+        self._store_thread = threading.get_ident()
+        self._woken = 0
+        return now
+
+    def action_listeners_done(self, action: object, reduced_at: int) -> None:
+        """Record the listener time of ``action`` and the autoruns it woke."""
+        name = _name(action)
+        self._record(
+            f'listeners:{name}',
+            name=f'listeners {name}',
+            track=self.STORE_TRACK,
+            start=reduced_at,
+            end=_now(),
+            args={'autoruns_woken': self._woken},
+        )
+        self.current_action = None
+
+    # Event handlers ------------------------------------------------------------
+
+    def handler_finished(
+        self,
+        *,
+        event: object,
+        handler: str,
+        service: str,
+        queued_at: int,
+        started_at: int,
+    ) -> None:
+        """Record how long a handler waited for its loop and how long it ran."""
+        now = _now()
+        key = f'{_name(event)}:{handler}'
+        self._record(
+            f'handler_wait:{key}',
+            name=f'wait {handler}',
+            track=f'{service} (waiting)',
+            start=queued_at,
+            end=started_at,
+        )
+        self._record(
+            f'handler:{key}',
+            name=handler,
+            track=service,
+            start=started_at,
+            end=now,
+            args={'event': _name(event)},
+        )
+
+    # Autoruns ------------------------------------------------------------------
+
+    def autorun_woken(self) -> str | None:
+        """Count a reaction scheduled by the running action; return that action.
+
+        Reactions triggered outside the store's listener pass (a direct call of
+        the autorun from another thread) are not attributed to any action.
+        """
+        if self.current_action is None or threading.get_ident() != self._store_thread:
+            return None
+        self._woken += 1
+        return self.current_action
+
+    def autorun_finished(
+        self,
+        *,
+        autorun: str,
+        woken_by: str | None,
+        started_at: int,
+    ) -> None:
+        """Record one autorun reaction."""
+        self._record(
+            f'autorun:{autorun}',
+            name=autorun,
+            track=self.AUTORUN_TRACK,
+            start=started_at,
+            end=_now(),
+            args={'woken_by': woken_by} if woken_by else None,
+        )
+
+    # Export --------------------------------------------------------------------
+
+    def histograms(self) -> dict[str, dict[str, float]]:
+        """Return a summary of every histogram, keyed by metric."""
+        with self._lock:
+            return {
+                metric: histogram.summary()
+                for metric, histogram in sorted(self._histograms.items())
+            }
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the spans as a Chrome-trace document, histograms attached."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self._spans)
+            tracks = dict(self._tracks)
+        metadata = [
+            {
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': tid,
+                'args': {'name': track},
+            }
+            for track, tid in tracks.items()
+        ]
+        return {
+            'traceEvents': [*metadata, *spans],
+            'displayTimeUnit': 'ms',
+            'otherData': {'histograms': self.histograms()},
+        }
+
+
+def now() -> int:
+    """Return the tracer clock, in microseconds."""
+    return _now()
+
+
+store_tracer = StoreTracer()
+store_tracer.enabled = DEBUG_STORE_TRACING
+
+
+def write_trace(tracer: StoreTracer = store_tracer) -> tuple[str, str]:
+    """Write the Chrome trace of `tracer` under ``traces/``; return its path and token.
+
+    A trace runs to megabytes, too much to carry in an action or event, so it
+    is registered with the web UI's ``/download/<token>`` endpoint instead,
+    unannounced to its browsers.
+    """
+    counter = 0
+    while (path := Path(f'traces/ubo-trace-{counter:03d}.json')).exists():
+        counter += 1
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('w') as file:
+        json.dump(tracer.chrome_trace(), file)
+    token = uuid4().hex
+    register_download(token, path.as_posix(), path.name, announce=False)
+    return path.as_posix(), token
@@ -2,24 +2,27 @@
 
 import asyncio
 import functools
+import os
 import queue
-import re
-import time
 from collections.abc import Iterator
 from pathlib import Path
 from threading import Thread
 
 from ubo_app.logger import get_logger
+from ubo_app.system.system_manager.rc_receiver import (
+    RepeatSuppressor,
+    find_lirc_device,
+    open_lirc_device,
+    receive_codes,
+)
+from ubo_app.utils.infrared import InfraredCode
 
 logger = get_logger('system-manager')
 
-# A single remote-button press often emits more than one NEC frame (the protocol
-# repeats every ~110ms while the button is physically down). ir-keytable flags
-# the protocol's own repeat frames as 'repeat' (dropped above), but some remotes
-# retransmit the full scancode as a fresh key-down instead. Collapse identical
-# codes seen within this window so one press yields one code; holding a button
-# still re-emits at roughly this cadence.
-IR_DEBOUNCE_SECONDS = 0.3
+# Codes waiting for the app to take them. The receiver never blocks on a full
+# queue: it drops the code, since a press nobody collected for this long is
+# stale anyway.
+IR_CODE_QUEUE_SIZE = 16
 
 
 class InfraredManager:
@@ -29,10 +32,10 @@ class InfraredManager:
         """Initialize the infrared manager."""
         self.loop = asyncio.new_event_loop()
         self.event_loop_thread: Thread | None = None
-        self.ir_code_queue = queue.Queue(1)
+        self.ir_code_queue: queue.Queue[InfraredCode] = queue.Queue(
+            IR_CODE_QUEUE_SIZE,
+        )
         self.stop_event = asyncio.Event()
-        # Last monotonic time each 'protocol:scancode' was emitted, for debounce.
-        self._last_seen: dict[str, float] = {}
 
     def handle_command(self, command: str) -> Iterator[str] | str | None:
         """Handle infrared commands."""
@@ -54,7 +57,11 @@ class InfraredManager:
             return 'started'
         if command == 'stop':
             if self.event_loop_thread:
-                self.stop_event.set()
+                # The monitor may have ended on its own, taking the loop down.
+                if self.loop.is_running():
+                    self.loop.call_soon_threadsafe(self.stop_event.set)
+                else:
+                    self.stop_event.set()
                 logger.info('Stopping IR monitoring process')
                 self.event_loop_thread.join()
                 self.event_loop_thread = None
@@ -70,7 +77,7 @@ class InfraredManager:
                     return 'nocode'
                 else:
                     logger.debug('Retrieved IR code from queue', extra={'code': code})
-                    yield code
+                    yield code.to_line()
         else:
             return None
 
@@ -84,79 +91,75 @@ class InfraredManager:
             logger.error('Failed to find IR receiver device index')
             return
 
-        logger.info('Starting ir-keytable process')
+        await self._enable_all_protocols(device_index)
+
+        device = find_lirc_device(device_index)
+        if device is None:
+            logger.error(
+                'IR receiver has no lirc device',
+                extra={'device_index': device_index},
+            )
+            return
+        try:
+            fd = open_lirc_device(device)
+        except OSError:
+            logger.exception('Failed to open lirc device', extra={'device': device})
+            return
+
+        logger.info('Reading IR scancodes', extra={'device': device})
+        try:
+            await receive_codes(
+                fd,
+                RepeatSuppressor(),
+                self._put_code,
+                self.stop_event,
+            )
+        except (EOFError, OSError):
+            logger.exception('IR receiver went away', extra={'device': device})
+        finally:
+            os.close(fd)
+        logger.info('Stopped IR monitoring')
+
+    async def _enable_all_protocols(self, device_index: str) -> None:
+        """Have the kernel decode every protocol it knows, with no keymap."""
         process = await asyncio.create_subprocess_exec(
-            'stdbuf',
-            '-i0',
-            '-o0',
-            '-e0',
             'ir-keytable',
             '-c',
             '-p',
             'all',
-            '-t',
             '-s',
             device_index,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.DEVNULL,
         )
-
-        if not process.stdout:
-            logger.error('Failed to start ir-keytable process - no stdout pipe')
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except TimeoutError:
+            process.kill()
+            logger.warning('ir-keytable timed out enabling protocols')
             return
-
-        logger.info('Started ir-keytable process with PID %d', process.pid)
-
-        while True:
-            result = await next(
-                asyncio.as_completed(
-                    (
-                        self.stop_event.wait(),
-                        process.stdout.readline(),
-                    ),
-                ),
-            )
-            if result is True:
-                logger.info('Stopping IR monitoring process')
-                process.kill()
-                break
-
-            line = result.decode().strip()
-            logger.debug('Raw IR output', extra={'line': line})
-
-            # Parse lirc protocol lines except repeat codes
-            if not line or 'lirc protocol' not in line or 'repeat' in line:
-                await asyncio.sleep(0.1)
-                continue
-
-            match = re.search(
-                r'lirc protocol\((\w+)\).*scancode = (0x[0-9a-fA-F]+)',
-                line,
+        if process.returncode != 0:
+            logger.warning(
+                'ir-keytable returned non-zero exit code',
+                extra={'returncode': process.returncode},
             )
-            if not match:
-                logger.warning('Failed to parse IR code', extra={'line': line})
-                continue
-
-            protocol, scancode = match.group(1), match.group(2)
-            code_str = f'{protocol}:{scancode}'
-
-            # Debounce duplicate frames from a single press (see IR_DEBOUNCE_SECONDS).
-            now = time.monotonic()
-            last_seen = self._last_seen.get(code_str)
-            if last_seen is not None and now - last_seen < IR_DEBOUNCE_SECONDS:
-                logger.debug(
-                    'Debounced duplicate IR code',
-                    extra={'protocol': protocol, 'scancode': scancode},
-                )
-                continue
-            self._last_seen[code_str] = now
 
-            logger.info(
-                'IR code received',
-                extra={'protocol': protocol, 'scancode': scancode},
+    def _put_code(self, code: InfraredCode) -> None:
+        logger.info(
+            'IR code received',
+            extra={
+                'protocol': code.protocol,
+                'scancode': code.scancode,
+                'repeat': code.repeat,
+            },
+        )
+        try:
+            self.ir_code_queue.put_nowait(code)
+        except queue.Full:
+            logger.warning(
+                'Dropped IR code, nobody is receiving',
+                extra={'protocol': code.protocol, 'scancode': code.scancode},
             )
-            # Put the code in the queue
-            self.ir_code_queue.put(code_str)
 
     def _get_ir_receiver_index(self) -> str | None:
         """Get the IR receiver device index by checking symlinks."""
@@ -0,0 +1,302 @@
+"""Read decoded infrared scancodes straight from the kernel's rc-core.
+
+The kernel already decodes every infrared frame it receives. Its lirc device
+(``/dev/lircN``, next to the receiver's input device) hands out each decode as
+a fixed-size ``struct lirc_scancode`` once switched to scancode mode: kernel
+timestamp, protocol, scancode and a flag for the protocol's own repeat frames.
+That is what ``ir-keytable -t`` reads before printing it as text; reading it
+here with non-blocking reads on the system manager's event loop skips the
+child process, its line buffering and the regular expression that parsed it.
+
+The protocol is why this reads the lirc device and not the input device's
+``EV_MSC/MSC_SCAN`` events: those carry the scancode alone, and a received code
+is only useful to the app with the protocol it needs to send it back.
+
+`ReplayDevice` stands in for the device in tests: it is a pipe the same frames
+can be written into, read by the same code.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ubo_app.utils.infrared import InfraredCode, is_ir_noise
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# <linux/lirc.h>
+LIRC_SET_REC_MODE = 0x40046912  # _IOW('i', 0x12, __u32)
+LIRC_MODE_SCANCODE = 0x08
+LIRC_SCANCODE_FLAG_REPEAT = 0x02
+# struct lirc_scancode: timestamp, flags, rc_proto, keycode, scancode.
+LIRC_SCANCODE = struct.Struct('=QHHIQ')
+# Frames taken per read(); the kernel buffers more until the next one.
+READ_BATCH = 64
+
+# `enum rc_proto`, spelled the way `ir-keytable` and `ir-ctl` spell it, so
+# devices registered from its output still match.
+RC_PROTOCOL_NAMES = (
+    'unknown',
+    'other',
+    'rc5',
+    'rc5x_20',
+    'rc5_sz',
+    'jvc',
+    'sony12',
+    'sony15',
+    'sony20',
+    'nec',
+    'necx',
+    'nec32',
+    'sanyo',
+    'mcir2_kbd',
+    'mcir2_mse',
+    'rc6_0',
+    'rc6_6a_20',
+    'rc6_6a_24',
+    'rc6_6a_32',
+    'rc6_mce',
+    'sharp',
+    'xmp',
+    'cec',
+    'imon',
+    'rc_mm_12',
+    'rc_mm_24',
+    'rc_mm_32',
+    'xbox_dvd',
+)
+
+# A single remote-button press often emits more than one frame: NEC sends a
+# repeat frame every ~110ms while the button is physically down, and some
+# remotes retransmit the full scancode as a fresh key-down instead. Frames of
+# the same code closer together than this belong to one press.
+IR_HOLD_GAP_SECONDS = 0.3
+# How often a held button is reported again, as a repeat.
+IR_REPEAT_INTERVAL_SECONDS = 0.3
+
+
+@dataclass(frozen=True)
+class ScancodeFrame:
+    """One ``struct lirc_scancode``, as the kernel delivers it."""
+
+    # Kernel CLOCK_MONOTONIC, in nanoseconds.
+    timestamp: int
+    protocol: int
+    scancode: int
+    # Set on the protocol's own repeat frames, never on retransmissions.
+    is_repeat: bool = False
+
+    @classmethod
+    def unpack(cls, data: bytes) -> ScancodeFrame:
+        """Decode one struct."""
+        timestamp, flags, protocol, _, scancode = LIRC_SCANCODE.unpack(data)
+        return cls(
+            timestamp=timestamp,
+            protocol=protocol,
+            scancode=scancode,
+            is_repeat=bool(flags & LIRC_SCANCODE_FLAG_REPEAT),
+        )
+
+    def pack(self) -> bytes:
+        """Encode as the kernel would."""
+        flags = LIRC_SCANCODE_FLAG_REPEAT if self.is_repeat else 0
+        return LIRC_SCANCODE.pack(
+            self.timestamp,
+            flags,
+            self.protocol,
+            0,
+            self.scancode,
+        )
+
+    @property
+    def protocol_name(self) -> str:
+        """Return the protocol as `ir-keytable` prints it."""
+        if self.protocol < len(RC_PROTOCOL_NAMES):
+            return RC_PROTOCOL_NAMES[self.protocol]
+        return 'unknown'
+
+
+class ScancodeReader:
+    """Drain the frames queued on a non-blocking lirc file descriptor."""
+
+    def __init__(self, fd: int) -> None:
+        """Read from `fd`, which must be non-blocking."""
+        self.fd = fd
+        self._partial = b''
+
+    def read(self) -> list[ScancodeFrame]:
+        """Return every frame available now, without waiting for more.
+
+        Raises:
+            EOFError: If the device is gone and nothing was left to read.
+
+        """
+        frames: list[ScancodeFrame] = []
+        while True:
+            try:
+                data = os.read(self.fd, LIRC_SCANCODE.size * READ_BATCH)
+            except BlockingIOError:
+                return frames
+            if not data:
+                if frames:
+                    return frames
+                raise EOFError
+            data = self._partial + data
+            whole = len(data) - len(data) % LIRC_SCANCODE.size
+            self._partial = data[whole:]
+            frames.extend(
+                ScancodeFrame.unpack(data[offset : offset + LIRC_SCANCODE.size])
+                for offset in range(0, whole, LIRC_SCANCODE.size)
+            )
+
+
+class RepeatSuppressor:
+    """Turn a receiver's frames into one code per press, plus hold repeats.
+
+    Drops imon noise, collapses the frames of a single press into one code,
+    and while a button stays held reports it again every
+    `IR_REPEAT_INTERVAL_SECONDS`, marked as a repeat. Judged on the kernel's
+    timestamps, so a burst read late is judged as it was received.
+    """
+
+    def __init__(
+        self,
+        *,
+        hold_gap: float = IR_HOLD_GAP_SECONDS,
+        repeat_interval: float = IR_REPEAT_INTERVAL_SECONDS,
+    ) -> None:
+        """Configure the press and repeat windows, in seconds."""
+        self._hold_gap = int(hold_gap * 1e9)
+        self._repeat_interval = int(repeat_interval * 1e9)
+        self._last: tuple[int, int] | None = None
+        self._last_frame_at = 0
+        self._reported_at = 0
+
+    def feed(self, frame: ScancodeFrame) -> InfraredCode | None:
+        """Return the code `frame` should be reported as, if any."""
+        protocol = frame.protocol_name
+        scancode = hex(frame.scancode)
+        if is_ir_noise(protocol, scancode):
+            return None
+        code = (frame.protocol, frame.scancode)
+        is_held = (
+            code == self._last
+            and frame.timestamp - self._last_frame_at < self._hold_gap
+        )
+        self._last, self._last_frame_at = code, frame.timestamp
+        if is_held and frame.timestamp - self._reported_at < self._repeat_interval:
+            return None
+        self._reported_at = frame.timestamp
+        return InfraredCode(
+            protocol=protocol,
+            scancode=scancode,
+            timestamp=frame.timestamp,
+            repeat=is_held,
+        )
+
+
+def find_lirc_device(rc_device: str) -> Path | None:
+    """Return the lirc character device of ``/sys/class/rc/<rc_device>``."""
+    lirc = next(Path('/sys/class/rc', rc_device).glob('lirc*'), None)
+    return None if lirc is None else Path('/dev', lirc.name)
+
+
+def open_lirc_device(path: Path) -> int:
+    """Open a lirc device non-blocking, in scancode mode.
+
+    Raises:
+        OSError: If the device cannot be opened or does not decode scancodes.
+
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+    try:
+        fcntl.ioctl(fd, LIRC_SET_REC_MODE, struct.pack('I', LIRC_MODE_SCANCODE))
+    except OSError:
+        os.close(fd)
+        raise
+    return fd
+
+
+async def receive_codes(
+    fd: int,
+    suppressor: RepeatSuppressor,
+    emit: Callable[[InfraredCode], object],
+    stop_event: asyncio.Event,
+) -> None:
+    """Feed the frames read from `fd` through `suppressor` into `emit`.
+
+    Runs until `stop_event` is set or the device goes away. Reads happen in the
+    event loop's reader callback, as soon as the kernel has a frame.
+
+    Raises:
+        EOFError: If the device went away.
+        OSError: If reading the device failed.
+
+    """
+    loop = asyncio.get_running_loop()
+    reader = ScancodeReader(fd)
+    closed = loop.create_future()
+
+    def on_readable() -> None:
+        try:
+            frames = reader.read()
+        except (EOFError, OSError) as exception:
+            loop.remove_reader(fd)
+            if not closed.done():
+                closed.set_exception(exception)
+            return
+        for frame in frames:
+            code = suppressor.feed(frame)
+            if code is not None:
+                emit(code)
+
+    loop.add_reader(fd, on_readable)
+    stop = asyncio.ensure_future(stop_event.wait())
+    try:
+        await asyncio.wait((stop, closed), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        loop.remove_reader(fd)
+        stop.cancel()
+    if closed.done():
+        exception = closed.exception()
+        if exception is not None and not stop_event.is_set():
+            raise exception
+
+
+class ReplayDevice:
+    """A stand-in for ``/dev/lircN``: frames sent here read back as its own.
+
+    Backed by a pipe, so `ScancodeReader` and `receive_codes` run unchanged
+    against it. Closing the sending side reads as the device going away.
+    """
+
+    def __init__(self) -> None:
+        """Open the pipe; `fd` is the device side, already non-blocking."""
+        self.fd, self._sender = os.pipe()
+        os.set_blocking(self.fd, False)
+
+    def send(self, *frames: ScancodeFrame) -> None:
+        """Queue frames as if the kernel had just decoded them."""
+        self.write(b''.join(frame.pack() for frame in frames))
+
+    def write(self, data: bytes) -> None:
+        """Queue raw bytes, such as part of a frame."""
+        os.write(self._sender, data)
+
+    def unplug(self) -> None:
+        """Close the sending side."""
+        if self._sender >= 0:
+            os.close(self._sender)
+            self._sender = -1
+
+    def close(self) -> None:
+        """Close both sides."""
+        self.unplug()
+        os.close(self.fd)
@@ -0,0 +1,345 @@
+"""Opt-in profile of where boot time goes, service by service.
+
+When enabled (``UBO_DEBUG_BOOT_PROFILE``) `load_services` and the service
+threads record, for every service:
+
+- ``initiate``: executing its ``ubo_handle.py``,
+- ``wait``: held back by the startup scheduler, for a dependency or the first
+  frame,
+- ``setup``: its setup function, from the thread starting to the service being
+  ready,
+- ``barrier``: the part of that spent waiting for every other service's reducer,
+- every module imported on its behalf, with its own time (children excluded) and
+  its total time, whether it is one of the service's modules or a third-party
+  one its setup pulled in.
+
+Boot-wide marks (reducers registered, first frame, boot complete, and the first
+correct screen when ``UBO_STATE_SNAPSHOT`` measures it) go next to them. Once
+every boot service is ready the profile is logged as a text timeline and written
+to ``traces/ubo-boot-NNN.json`` as Chrome-trace JSON, which Perfetto opens next
+to a store trace: both use the same clock.
+
+Disabled, the hooks cost one attribute check each.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ubo_app.constants import DEBUG_BOOT_PROFILE
+from ubo_app.store.tracing import now
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Characters the timeline draws each phase with; where phases share a column,
+# the one listed first wins.
+PHASE_GLYPHS = {'barrier': '=', 'initiate': 'i', 'wait': '.', 'setup': '#'}
+TIMELINE_WIDTH = 60
+SLOWEST_IMPORTS = 10
+
+
+@dataclass(frozen=True)
+class ModuleImport:
+    """One module executed on a service's behalf, in microseconds."""
+
+    name: str
+    start: int
+    own: int
+    total: int
+
+
+@dataclass
+class ServiceBootProfile:
+    """What one service spent its boot on; timestamps in microseconds."""
+
+    name: str
+    service_id: str | None = None
+    phases: dict[str, tuple[int, int | None]] = field(default_factory=dict)
+    imports: list[ModuleImport] = field(default_factory=list)
+
+    def duration(self, phase: str) -> int:
+        """Return how long `phase` took, 0 if it did not happen or is running."""
+        start, end = self.phases.get(phase, (0, None))
+        return 0 if end is None else end - start
+
+    @property
+    def import_time(self) -> int:
+        """Return the time spent executing modules for this service."""
+        return sum(module.own for module in self.imports)
+
+    @property
+    def ready_at(self) -> int | None:
+        """Return when setup finished."""
+        return self.phases.get('setup', (0, None))[1]
+
+
+class BootProfiler:
+    """Collects boot timings while :attr:`enabled`."""
+
+    def __init__(self) -> None:
+        """Create a disabled profiler."""
+        self.enabled = False
+        self.origin = now()
+        self._lock = threading.Lock()
+        self._services: dict[str, ServiceBootProfile] = {}
+        self._marks: dict[str, int] = {}
+        self._pending: set[str] = set()
+        # Per thread, the child time of each import in progress.
+        self._imports = threading.local()
+
+    def reset(self) -> None:
+        """Drop everything collected and restart the clock."""
+        with self._lock:
+            self.origin = now()
+            self._services.clear()
+            self._marks.clear()
+            self._pending.clear()
+
+    def _service(self, name: str) -> ServiceBootProfile:
+        service = self._services.get(name)
+        if service is None:
+            service = self._services[name] = ServiceBootProfile(name=name)
+        return service
+
+    # Recording ---------------------------------------------------------------
+
+    def begin(self, name: str, phase: str, *, service_id: str | None = None) -> None:
+        """Note that service `name` entered `phase`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            service = self._service(name)
+            service.phases[phase] = (now(), None)
+            if service_id is not None:
+                service.service_id = service_id
+
+    def end(self, name: str, phase: str) -> None:
+        """Note that service `name` left `phase`; ignored if it never entered."""
+        if not self.enabled:
+            return
+        with self._lock:
+            service = self._service(name)
+            if phase in service.phases:
+                service.phases[phase] = (service.phases[phase][0], now())
+
+    @contextlib.contextmanager
+    def phase(self, name: str, phase: str) -> Iterator[None]:
+        """Record the enclosed block as `phase` of service `name`."""
+        self.begin(name, phase)
+        try:
+            yield
+        finally:
+            self.end(name, phase)
+
+    @contextlib.contextmanager
+    def importing(self, name: str, module: str) -> Iterator[None]:
+        """Record the enclosed block as service `name` executing `module`."""
+        if not self.enabled:
+            yield
+            return
+        stack: list[list[int]] = self._imports.__dict__.setdefault('stack', [])
+        children = [0]
+        stack.append(children)
+        start = now()
+        try:
+            yield
+        finally:
+            total = now() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += total
+            with self._lock:
+                self._service(name).imports.append(
+                    ModuleImport(
+                        name=module,
+                        start=start,
+                        own=total - children[0],
+                        total=total,
+                    ),
+                )
+
+    def mark(self, mark: str, *, at: int | None = None) -> None:
+        """Record a boot-wide moment, once; `at` if it is known to be past."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._marks.setdefault(mark, now() if at is None else at)
+
+    def expect(self, names: Iterable[str]) -> None:
+        """Set the services boot is complete without."""
+        with self._lock:
+            self._pending = set(names)
+
+    def settled(self, name: str) -> bool:
+        """Note that service `name` is ready or failed; return whether it was last."""
+        with self._lock:
+            if name not in self._pending:
+                return False
+            self._pending.discard(name)
+            is_last = not self._pending
+        if is_last:
+            self.mark('boot complete')
+        return is_last
+
+    # Export ------------------------------------------------------------------
+
+    def services(self) -> list[ServiceBootProfile]:
+        """Return every service's profile, in the order they started booting."""
+        with self._lock:
+            services = list(self._services.values())
+        return sorted(
+            services,
+            key=lambda service: min(
+                (start for start, _ in service.phases.values()),
+                default=0,
+            ),
+        )
+
+    def marks(self) -> dict[str, int]:
+        """Return the boot-wide marks, relative to the origin."""
+        with self._lock:
+            return {mark: at - self.origin for mark, at in self._marks.items()}
+
+    def timeline(self, *, width: int = TIMELINE_WIDTH) -> str:
+        """Render the profile as a text table with one bar per service.
+
+        Durations are in milliseconds; each bar spans from the origin to the
+        last service being ready, drawn with `PHASE_GLYPHS`.
+        """
+        services = self.services()
+        marks = self.marks()
+        end = max(
+            [
+                *(
+                    stop - self.origin
+                    for service in services
+                    for _, stop in service.phases.values()
+                    if stop is not None
+                ),
+                *marks.values(),
+                1,
+            ],
+        )
+        name_width = max([len(service.name) for service in services] + [7])
+        header = (
+            f'{"service":<{name_width}} {"initiate":>8} {"imports":>8} {"wait":>8} '
+            f'{"barrier":>8} {"setup":>8} {"ready":>9}  timeline'
+        )
+        lines = [header]
+        for service in services:
+            ready = service.ready_at
+            lines.append(
+                f'{service.name:<{name_width}}'
+                f' {_ms(service.duration("initiate")):>8}'
+                f' {_ms(service.import_time):>8}'
+                f' {_ms(service.duration("wait")):>8}'
+                f' {_ms(service.duration("barrier")):>8}'
+                f' {_ms(service.duration("setup")):>8}'
+                f' {"-" if ready is None else _ms(ready - self.origin):>9}'
+                f'  |{self._bar(service, end, width)}|',
+            )
+        lines.extend(
+            f'{mark} at {_ms(at)} ms'
+            for mark, at in sorted(marks.items(), key=lambda item: item[1])
+        )
+        slowest = sorted(
+            (
+                (module, service.name)
+                for service in services
+                for module in service.imports
+            ),
+            key=lambda item: item[0].own,
+            reverse=True,
+        )[:SLOWEST_IMPORTS]
+        if slowest:
+            lines.append('slowest imports (own ms / total ms):')
+            lines.extend(
+                f'  {_ms(module.own):>8} {_ms(module.total):>8}  '
+                f'{module.name.rpartition(":")[2]} ({name})'
+                for module, name in slowest
+            )
+        return '\n'.join(lines)
+
+    def _bar(self, service: ServiceBootProfile, end: int, width: int) -> str:
+        columns = [' '] * width
+        for phase in reversed(PHASE_GLYPHS):
+            if phase not in service.phases:
+                continue
+            start, stop = service.phases[phase]
+            stop = now() if stop is None else stop
+            first = (start - self.origin) * width // end
+            last = max((stop - self.origin) * width // end, first + 1)
+            for column in range(first, min(last, width)):
+                columns[column] = PHASE_GLYPHS[phase]
+        return ''.join(columns)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the profile as a Chrome-trace document, one track per service."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        for tid, service in enumerate(self.services(), start=1):
+            events.append(
+                {
+                    'name': 'thread_name',
+                    'ph': 'M',
+                    'pid': pid,
+                    'tid': tid,
+                    'args': {'name': service.name},
+                },
+            )
+            events.extend(
+                {
+                    'name': phase,
+                    'cat': 'boot',
+                    'ph': 'X',
+                    'pid': pid,
+                    'tid': tid,
+                    'ts': start,
+                    'dur': stop - start,
+                }
+                for phase, (start, stop) in service.phases.items()
+                if stop is not None
+            )
+            events.extend(
+                {
+                    'name': module.name.rpartition(':')[2],
+                    'cat': 'import',
+                    'ph': 'X',
+                    'pid': pid,
+                    'tid': tid,
+                    'ts': module.start,
+                    'dur': module.total,
+                    'args': {'own_us': module.own},
+                }
+                for module in service.imports
+            )
+        events.extend(
+            {
+                'name': mark,
+                'cat': 'boot',
+                'ph': 'i',
+                's': 'g',
+                'pid': pid,
+                'tid': 0,
+                'ts': at + self.origin,
+            }
+            for mark, at in self.marks().items()
+        )
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'origin_us': self.origin},
+        }
+
+
+def _ms(microseconds: int) -> str:
+    return f'{microseconds / 1000:.1f}'
+
+
+boot_profiler = BootProfiler()
+boot_profiler.enabled = DEBUG_BOOT_PROFILE
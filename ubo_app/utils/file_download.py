@@ -30,8 +30,13 @@ def register_download(
     filename: str,
     *,
     is_temp: bool = False,
+    announce: bool = True,
 ) -> None:
-    """Register a download session for later retrieval by the HTTP endpoint."""
+    """Register a download session for later retrieval by the HTTP endpoint.
+
+    Announced downloads are handed to the web UI's browsers to start; the rest
+    wait for a client that was given the token.
+    """
     _cleanup_stale_sessions()
     _download_sessions[token] = DownloadSession(
         token=token,
@@ -39,7 +44,8 @@ def register_download(
         filename=filename,
         is_temp=is_temp,
     )
-    _pending_downloads.append({'token': token, 'filename': filename})
+    if announce:
+        _pending_downloads.append({'token': token, 'filename': filename})
 
 
 def get_pending_downloads() -> list[dict[str, str]]:
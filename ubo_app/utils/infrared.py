@@ -0,0 +1,72 @@
+"""Received infrared codes, as the system manager streams them to the app.
+
+Each code travels as one JSON line over the system manager socket, so the app
+gets the protocol, the scancode, the kernel's decode timestamp and whether it
+is a held button's repeat — instead of a ``protocol:scancode`` string it has to
+split, with no way to tell how old it is.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+
+MIN_ZERO_BITS_FOR_VALID_IMON = 6
+
+
+@dataclass(frozen=True)
+class InfraredCode:
+    """One decoded infrared code.
+
+    ``timestamp`` is the kernel's ``CLOCK_MONOTONIC`` time of the decode, in
+    nanoseconds — the clock behind ``time.monotonic_ns`` — so the app can
+    measure how long the code took to reach it. ``repeat`` marks a code sent
+    because the button is still held, as opposed to a fresh press.
+    """
+
+    protocol: str
+    scancode: str
+    timestamp: int
+    repeat: bool = False
+
+    def to_line(self) -> str:
+        """Serialize for the system manager socket."""
+        return json.dumps(asdict(self), separators=(',', ':'))
+
+    @classmethod
+    def from_line(cls, line: str) -> InfraredCode:
+        """Parse a line written by `to_line`.
+
+        Raises:
+            ValueError: If the line is not a serialized code.
+
+        """
+        try:
+            fields = json.loads(line)
+            return cls(
+                protocol=str(fields['protocol']),
+                scancode=str(fields['scancode']),
+                timestamp=int(fields['timestamp']),
+                repeat=bool(fields.get('repeat', False)),
+            )
+        except (TypeError, KeyError, json.JSONDecodeError) as exception:
+            msg = f'Not an infrared code: {line!r}'
+            raise ValueError(msg) from exception
+
+
+def is_ir_noise(protocol: str, scancode: str) -> bool:
+    """Filter imon protocol noise: scancodes with fewer than 6 zero bits.
+
+    Noise patterns like 0x7fffffff, 0x7ff7ffff, 0x7fbfffff have very few
+    zero bits; real imon scancodes typically have more.
+    """
+    if protocol.lower() != 'imon':
+        return False
+    try:
+        value = int(scancode, 0) & 0xFFFFFFFF
+        ones = value.bit_count()
+        zero_bits = 32 - ones
+    except (ValueError, TypeError):
+        return False
+    else:
+        return zero_bits < MIN_ZERO_BITS_FOR_VALID_IMON
@@ -0,0 +1,189 @@
+"""Event loops shared by services instead of a thread and a loop each.
+
+Most services sit idle nearly all the time, yet each one costs a thread, an
+event loop with its own selector, and the wakeups of both. A service registered
+with ``shares_loop=True`` runs on one of ``UBO_SERVICE_LOOP_POOL_SIZE`` shared
+loops instead, when that is above 0; every other service keeps its own thread.
+Sharing is opt-in because one service blocking a shared loop stalls the others
+on it: services that call blocking APIs, hold the loop for long, or need their
+own log level (levels are set per thread) should not opt in.
+
+On a shared loop, services are told apart by `current_service`. Every task and
+callback of a service runs in a context where it is set. `get_service` uses it
+to find the service, and the loop uses it to record which service each task
+belongs to. Stopping a service then cancels its tasks and nobody else's.
+
+Each loop also measures its lag: how late a callback due now actually runs.
+That is the cost to everyone else when a service on the loop holds it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import weakref
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from ubo_app.constants import SERVICE_LOOP_LAG_THRESHOLD, SERVICE_LOOP_POOL_SIZE
+from ubo_app.logger import logger
+from ubo_app.store.tracing import LatencyHistogram
+from ubo_app.utils.error_handlers import loop_exception_handler
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+    from contextvars import Context
+
+    from ubo_app.service_thread import UboServiceThread
+
+# How often each shared loop checks its own lag, in seconds. It is the one
+# wakeup an otherwise idle shared loop has.
+LAG_PROBE_INTERVAL = 1.0
+
+current_service: ContextVar[UboServiceThread | None] = ContextVar(
+    'current_service',
+    default=None,
+)
+
+
+class SharedLoop(threading.Thread):
+    """A thread running an event loop that several services share."""
+
+    def __init__(self, index: int) -> None:
+        """Create the loop; it runs once the thread is started."""
+        super().__init__(name=f'shared-loop-{index}', daemon=True)
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_task_factory(self._create_task)
+        self.loop.set_exception_handler(self._handle_exception)
+        # Ids of the services on this loop.
+        self.services: set[str] = set()
+        # Lag of the loop, in microseconds.
+        self.lag = LatencyHistogram()
+        self._owners: weakref.WeakKeyDictionary[asyncio.Task, UboServiceThread] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def run(self) -> None:
+        """Run the loop until `stop`."""
+        asyncio.set_event_loop(self.loop)
+        probe = self.loop.create_task(
+            self._probe_lag(),
+            name=f'Lag probe for {self.name}',
+        )
+        try:
+            self.loop.run_forever()
+        finally:
+            probe.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                self.loop.run_until_complete(probe)
+
+    def stop(self) -> None:
+        """Stop the loop; whatever still runs on it is abandoned."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def tasks_of(self, service: UboServiceThread) -> list[asyncio.Task]:
+        """Return the unfinished tasks `service` created on this loop."""
+        return [
+            task
+            for task, owner in list(self._owners.items())
+            if owner is service and not task.done()
+        ]
+
+    def _create_task(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        coroutine: Coroutine,
+        *,
+        context: Context | None = None,
+    ) -> asyncio.Task:
+        task = asyncio.Task(coroutine, loop=loop, context=context)
+        # A task runs in a copy of its creator's context unless given one.
+        service = (
+            current_service.get() if context is None else context.get(current_service)
+        )
+        if service is not None:
+            self._owners[task] = service
+        return task
+
+    def _handle_exception(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        context: dict[str, object],
+    ) -> None:
+        task = context.get('task') or context.get('future')
+        owner = self._owners.get(task) if isinstance(task, asyncio.Task) else None
+        loop_exception_handler(loop, context, owner=owner or self)
+
+    async def _probe_lag(self) -> None:
+        while True:
+            due = self.loop.time() + LAG_PROBE_INTERVAL
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            lag = self.loop.time() - due
+            self.lag.record(int(lag * 1_000_000))
+            if lag > SERVICE_LOOP_LAG_THRESHOLD:
+                logger.warning(
+                    'Shared service loop is lagging',
+                    extra={
+                        'loop': self.name,
+                        'lag_ms': round(lag * 1000, 1),
+                        'services': sorted(self.services),
+                    },
+                )
+
+
+class LoopPool:
+    """Hands out shared loops to services, starting them as needed."""
+
+    def __init__(self, size: int) -> None:
+        """Create a pool of at most `size` loops; 0 disables sharing."""
+        self.size = size
+        self._lock = threading.Lock()
+        self._loops: list[SharedLoop] = []
+
+    def assign(self, service_id: str) -> SharedLoop:
+        """Return the loop `service_id` should run on.
+
+        A new loop is started while the pool is not full. After that, the
+        service goes to the loop with the fewest services.
+        """
+        with self._lock:
+            if len(self._loops) < self.size:
+                shared_loop = SharedLoop(len(self._loops))
+                shared_loop.start()
+                self._loops.append(shared_loop)
+            else:
+                shared_loop = min(
+                    self._loops,
+                    key=lambda shared_loop: len(shared_loop.services),
+                )
+            shared_loop.services.add(service_id)
+        return shared_loop
+
+    def release(self, shared_loop: SharedLoop, service_id: str) -> None:
+        """Note that `service_id` no longer runs on `shared_loop`."""
+        with self._lock:
+            shared_loop.services.discard(service_id)
+
+    def lag_summary(self) -> dict[str, dict[str, float]]:
+        """Return the lag histogram summary of every loop, in microseconds."""
+        with self._lock:
+            return {
+                shared_loop.name: shared_loop.lag.summary()
+                for shared_loop in self._loops
+            }
+
+    def stop(self) -> None:
+        """Stop every loop and wait for their threads."""
+        lag = self.lag_summary()
+        with self._lock:
+            loops, self._loops = self._loops, []
+        if lag:
+            logger.info('Shared service loop lag', extra={'lag_us': lag})
+        for shared_loop in loops:
+            shared_loop.stop()
+        for shared_loop in loops:
+            shared_loop.join(timeout=1)
+
+
+loop_pool = LoopPool(SERVICE_LOOP_POOL_SIZE)
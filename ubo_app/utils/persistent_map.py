@@ -0,0 +1,304 @@
+"""An immutable mapping whose updates share structure with the original.
+
+Updating a ``dict`` kept in the store means copying all of it, so adding to a
+dict of a few hundred entries costs far more than adding to one of ten.
+`PersistentMap` is a hash array mapped trie instead: `set` and `delete` return a
+new map that copies only the nodes on the way to the key, a few tuples of 32
+slots, and shares the rest with the old one. Comparing two versions of a map
+skips the nodes they share, so an autorun selecting one does not walk it either.
+
+It iterates newest first, the way the notifications it holds are shown: a new
+key comes before the others, and setting a key again keeps its place.
+"""
+
+from __future__ import annotations
+
+from collections.abc import ItemsView, Mapping, ValuesView
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+_HASH_MASK = (1 << 64) - 1
+
+
+class _Entry:
+    __slots__ = ('hash', 'key', 'order', 'value')
+
+    def __init__(self, key: object, hash_: int, order: int, value: object) -> None:
+        self.key = key
+        self.hash = hash_
+        self.order = order
+        self.value = value
+
+
+class _Collision:
+    """Entries whose keys have the same hash."""
+
+    __slots__ = ('entries', 'hash')
+
+    def __init__(self, hash_: int, entries: tuple[_Entry, ...]) -> None:
+        self.hash = hash_
+        self.entries = entries
+
+
+# A node is a tuple of `_WIDTH` slots, each `None`, an entry, a collision or a
+# node. A node below the root holds at least two entries, so a set of keys is
+# always stored in the same trie and equal maps compare node by node.
+_Slot = Any
+_EMPTY: tuple[_Slot, ...] = (None,) * _WIDTH
+
+
+def _hash(key: object) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _pair(first: _Entry | _Collision, second: _Entry, shift: int) -> _Slot:
+    if first.hash == second.hash:
+        return _Collision(second.hash, (first, second))
+    first_index = (first.hash >> shift) & _MASK
+    second_index = (second.hash >> shift) & _MASK
+    slots = list(_EMPTY)
+    if first_index == second_index:
+        slots[first_index] = _pair(first, second, shift + _BITS)
+    else:
+        slots[first_index] = first
+        slots[second_index] = second
+    return tuple(slots)
+
+
+def _find(node: tuple[_Slot, ...], key: object, hash_: int) -> _Entry | None:
+    shift = 0
+    while True:
+        slot = node[(hash_ >> shift) & _MASK]
+        if slot is None:
+            return None
+        if type(slot) is _Entry:
+            return slot if slot.key is key or slot.key == key else None
+        if type(slot) is _Collision:
+            for entry in slot.entries:
+                if entry.key is key or entry.key == key:
+                    return entry
+            return None
+        node = slot
+        shift += _BITS
+
+
+def _assoc(node: tuple[_Slot, ...], shift: int, entry: _Entry) -> tuple[_Slot, ...]:
+    index = (entry.hash >> shift) & _MASK
+    slot = node[index]
+    if slot is None or (type(slot) is _Entry and slot.key == entry.key):
+        new = entry
+    elif type(slot) is _Entry:
+        new = _pair(slot, entry, shift + _BITS)
+    elif type(slot) is _Collision:
+        if slot.hash == entry.hash:
+            new = _Collision(
+                entry.hash,
+                (*(item for item in slot.entries if item.key != entry.key), entry),
+            )
+        else:
+            new = _pair(slot, entry, shift + _BITS)
+    else:
+        new = _assoc(slot, shift + _BITS, entry)
+    return (*node[:index], new, *node[index + 1 :])
+
+
+def _dissoc(node: tuple[_Slot, ...], shift: int, key: object, hash_: int) -> _Slot:
+    """Return `node` without `key`, which it holds, collapsed as far as it can be."""
+    index = (hash_ >> shift) & _MASK
+    slot = node[index]
+    if type(slot) is _Entry:
+        new = None
+    elif type(slot) is _Collision:
+        rest = tuple(entry for entry in slot.entries if entry.key != key)
+        new = rest[0] if len(rest) == 1 else _Collision(hash_, rest)
+    else:
+        new = _dissoc(slot, shift + _BITS, key, hash_)
+    node = (*node[:index], new, *node[index + 1 :])
+    if type(new) is tuple:
+        return node
+    empty = node.count(None)
+    if empty == _WIDTH:
+        return None
+    if empty == _WIDTH - 1:
+        (last,) = (slot for slot in node if slot is not None)
+        if type(last) is not tuple:
+            return last
+    return node
+
+
+def _entries(node: tuple[_Slot, ...]) -> Iterator[_Entry]:
+    for slot in node:
+        if slot is None:
+            continue
+        if type(slot) is _Entry:
+            yield slot
+        elif type(slot) is _Collision:
+            yield from slot.entries
+        else:
+            yield from _entries(slot)
+
+
+def _equal(first: _Slot, second: _Slot) -> bool:
+    if first is second:
+        return True
+    if type(first) is not type(second):
+        return False
+    if type(first) is _Entry:
+        return first.key == second.key and first.value == second.value
+    if type(first) is _Collision:
+        return {entry.key: entry.value for entry in first.entries} == {
+            entry.key: entry.value for entry in second.entries
+        }
+    return all(map(_equal, first, second))
+
+
+class _Values(ValuesView):
+    def __iter__(self) -> Iterator[Any]:
+        for entry in self._mapping._ordered():  # noqa: SLF001
+            yield entry.value
+
+
+class _Items(ItemsView):
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        for entry in self._mapping._ordered():  # noqa: SLF001
+            yield entry.key, entry.value
+
+
+class PersistentMap(Mapping[K, V], Generic[K, V]):
+    """An immutable mapping, updated by `set` and `delete` returning a new one."""
+
+    __slots__ = ('_length', '_next_order', '_order', '_root')
+
+    _root: tuple[_Slot, ...]
+    _length: int
+    _next_order: int
+    _order: tuple[_Entry, ...] | None
+
+    def __init__(self, items: Mapping[K, V] | Iterable[tuple[K, V]] = ()) -> None:
+        """Hold `items`, iterated in the order they are given."""
+        pairs = list(dict(items).items())
+        root = _EMPTY
+        length = 0
+        for key, value in reversed(pairs):
+            hash_ = _hash(key)
+            if _find(root, key, hash_) is None:
+                length += 1
+            root = _assoc(root, 0, _Entry(key, hash_, length, value))
+        self._root = root
+        self._length = length
+        self._next_order = length + 1
+        self._order = None
+
+    @classmethod
+    def _of(
+        cls,
+        root: tuple[_Slot, ...],
+        length: int,
+        next_order: int,
+    ) -> PersistentMap[K, V]:
+        result = cls.__new__(cls)
+        result._root = root  # noqa: SLF001
+        result._length = length  # noqa: SLF001
+        result._next_order = next_order  # noqa: SLF001
+        result._order = None  # noqa: SLF001
+        return result
+
+    def set(self, key: K, value: V) -> PersistentMap[K, V]:
+        """Return a map with `key` set to `value`, first if it is new."""
+        hash_ = _hash(key)
+        entry = _find(self._root, key, hash_)
+        if entry is not None and entry.value is value:
+            return self
+        root = _assoc(
+            self._root,
+            0,
+            _Entry(
+                key,
+                hash_,
+                self._next_order if entry is None else entry.order,
+                value,
+            ),
+        )
+        if entry is None:
+            return self._of(root, self._length + 1, self._next_order + 1)
+        return self._of(root, self._length, self._next_order)
+
+    def delete(self, key: K) -> PersistentMap[K, V]:
+        """Return a map without `key`; raise `KeyError` if it has none."""
+        hash_ = _hash(key)
+        if _find(self._root, key, hash_) is None:
+            raise KeyError(key)
+        root = _dissoc(self._root, 0, key, hash_)
+        if root is None:
+            root = _EMPTY
+        elif type(root) is not tuple:
+            # The root is a node even when one entry is left.
+            index = root.hash & _MASK
+            root = (*_EMPTY[:index], root, *_EMPTY[index + 1 :])
+        return self._of(root, self._length - 1, self._next_order)
+
+    def _ordered(self) -> tuple[_Entry, ...]:
+        if self._order is None:
+            self._order = tuple(
+                sorted(
+                    _entries(self._root),
+                    key=lambda entry: entry.order,
+                    reverse=True,
+                ),
+            )
+        return self._order
+
+    def __getitem__(self, key: K) -> V:
+        """Return the value of `key`."""
+        entry = _find(self._root, key, _hash(key))
+        if entry is None:
+            raise KeyError(key)
+        return entry.value
+
+    def get(self, key: K, default: Any = None) -> Any:  # noqa: ANN401
+        """Return the value of `key`, or `default` if it has none."""
+        entry = _find(self._root, key, _hash(key))
+        return default if entry is None else entry.value
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether the map has `key`."""
+        return _find(self._root, key, _hash(key)) is not None
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over the keys, newest first."""
+        for entry in self._ordered():
+            yield entry.key
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return self._length
+
+    def values(self) -> ValuesView[V]:
+        """Return the values, newest first."""
+        return _Values(self)
+
+    def items(self) -> ItemsView[K, V]:
+        """Return the keys and their values, newest first."""
+        return _Items(self)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare as a mapping; order does not matter, like a ``dict``'s."""
+        if isinstance(other, PersistentMap):
+            return self._length == other._length and _equal(self._root, other._root)
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the map's items, newest first."""
+        return f'{type(self).__name__}({dict(self.items())!r})'
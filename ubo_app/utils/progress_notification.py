@@ -0,0 +1,195 @@
+"""Coalescing channel for progress notifications.
+
+Long-running operations (voice downloads, image pulls, uploads) report progress
+by re-adding the same notification id with a new ``progress`` value, often many
+times a second. Every ``NotificationsAddAction`` runs the notifications reducer,
+emits a ``NotificationsDisplayEvent`` and fans out to view recomputation, the
+screen reader and gRPC subscribers, so the raw report rate is pure overhead on a
+Pi. :func:`report_progress` sits in front of ``store.dispatch`` and, per id:
+
+- dispatches at most once per ``min_interval`` seconds,
+- holds an update that arrives inside the interval, or moved less than
+  ``min_delta`` since the last dispatched one, and flushes it from the store's
+  scheduler once the interval is over, replacing it with any newer one
+  meanwhile (last value wins), so the latest value always goes out.
+
+The first report of an id, a completed (``progress >= 1``) or indeterminate
+(``progress is None``) report always goes out immediately. Call
+:func:`discard_progress` before clearing a progress notification, so a late
+flush can not resurrect it. Updates are dispatched in the order they go out but
+outside the channel's lock, so whatever a dispatch sets off may report progress
+itself.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ubo_app.store.main import scheduler, store
+from ubo_app.store.services.notifications import NotificationsAddAction
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ubo_app.store.services.notifications import Notification
+
+DEFAULT_MIN_INTERVAL = 0.25
+DEFAULT_MIN_DELTA = 0.01
+
+
+def _schedule(callback: Callable[[], None], delay: float) -> None:
+    scheduler.set(callback, interval=False, delay_duration=delay)
+
+
+@dataclass
+class _Channel:
+    sent_at: float
+    sent_progress: float | None
+    pending: Notification | None = None
+    # When `pending` is flushed, on the `time.monotonic` clock.
+    due: float = 0.0
+
+
+class ProgressNotificationChannel:
+    """Rate-limits and coalesces progress updates per notification id."""
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        min_delta: float = DEFAULT_MIN_DELTA,
+        schedule: Callable[[Callable[[], None], float], None] = _schedule,
+    ) -> None:
+        """Create a channel with the given per-id interval and delta thresholds.
+
+        `schedule` calls its callback after the given number of seconds; the
+        default runs it on the store's scheduler.
+        """
+        self.min_interval = min_interval
+        self.min_delta = min_delta
+        self.dispatched = 0
+        self.coalesced = 0
+        self._schedule = schedule
+        self._lock = threading.Lock()
+        self._channels: dict[str, _Channel] = {}
+        # When the earliest scheduled flush runs, if one is scheduled.
+        self._flush_at: float | None = None
+        # Updates that went out and are yet to be dispatched, and whether a
+        # thread is dispatching them.
+        self._outbox: deque[Notification] = deque()
+        self._dispatching = False
+
+    def _send(self, channel: _Channel, notification: Notification) -> None:
+        channel.sent_at = time.monotonic()
+        channel.sent_progress = notification.progress
+        channel.pending = None
+        self.dispatched += 1
+        self._outbox.append(notification)
+
+    def _hold(self, channel: _Channel, notification: Notification, due: float) -> None:
+        channel.pending = notification
+        channel.due = due
+        if self._flush_at is None or due < self._flush_at:
+            self._flush_at = due
+            self._schedule(self._flush, max(due - time.monotonic(), 0))
+
+    def report(self, notification: Notification) -> None:
+        """Dispatch ``notification`` now or fold it into the pending update."""
+        now = time.monotonic()
+        progress = notification.progress
+        with self._lock:
+            channel = self._channels.get(notification.id)
+            if channel is None:
+                channel = self._channels[notification.id] = _Channel(
+                    sent_at=now,
+                    sent_progress=progress,
+                )
+                self._send(channel, notification)
+            elif progress is None or progress >= 1:
+                # Terminal report: send it and forget the id, so the map only
+                # holds operations that are still running.
+                if channel.pending is not None:
+                    self.coalesced += 1
+                del self._channels[notification.id]
+                self._send(channel, notification)
+            elif channel.pending is not None:
+                # An update is already held; the latest value replaces it.
+                self.coalesced += 1
+                channel.pending = notification
+            elif (
+                channel.sent_progress is not None
+                and abs(progress - channel.sent_progress) < self.min_delta
+            ):
+                # A small move waits an interval, for a larger one to replace
+                # it or to go out as the latest value.
+                self._hold(channel, notification, now + self.min_interval)
+            elif channel.sent_at + self.min_interval <= now:
+                self._send(channel, notification)
+            else:
+                self._hold(channel, notification, channel.sent_at + self.min_interval)
+        self._dispatch()
+
+    def _flush(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._flush_at = None
+            for channel in self._channels.values():
+                if channel.pending is None:
+                    continue
+                if channel.due <= now:
+                    self._send(channel, channel.pending)
+                elif self._flush_at is None or channel.due < self._flush_at:
+                    self._flush_at = channel.due
+            if self._flush_at is not None:
+                self._schedule(self._flush, self._flush_at - now)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Dispatch the updates that went out, in order, outside `_lock`.
+
+        One thread dispatches at a time; a report made meanwhile, from another
+        thread or from inside a dispatch, leaves its update to that thread.
+        """
+        with self._lock:
+            if self._dispatching:
+                return
+            self._dispatching = True
+        while True:
+            with self._lock:
+                if not self._outbox:
+                    self._dispatching = False
+                    return
+                notification = self._outbox.popleft()
+            try:
+                store.dispatch(NotificationsAddAction(notification=notification))
+            except BaseException:
+                with self._lock:
+                    self._dispatching = False
+                raise
+
+    def discard(self, notification_id: str) -> None:
+        """Forget ``notification_id``, dropping any update not yet dispatched."""
+        with self._lock:
+            self._channels.pop(notification_id, None)
+            self._outbox = deque(
+                notification
+                for notification in self._outbox
+                if notification.id != notification_id
+            )
+
+
+progress_channel = ProgressNotificationChannel()
+
+
+def report_progress(notification: Notification) -> None:
+    """Report a progress notification through the shared channel."""
+    progress_channel.report(notification)
+
+
+def discard_progress(notification_id: str) -> None:
+    """Drop pending updates for ``notification_id``; call before clearing it."""
+    progress_channel.discard(notification_id)
@@ -1,10 +1,74 @@
-"""Contains the serialization functions for the immutable objects."""
+"""Contains the serialization functions for the immutable objects.
+
+A serialized object names its class in its ``_type`` field with a type tag:
+
+- the bare class name, for classes in `CLASS_REGISTRY`, the registry the proto
+  generator writes for every store type,
+- ``module:qualname`` for any other class.
+
+Files written before tags existed carry a base64 ``dill`` pickle of the class
+instead; those still load, and are rewritten with tags the next time they are
+saved. Base64 has no ``:`` and a pickle is far longer than any class name, so
+the two are never confused.
+"""
+
+from __future__ import annotations
 
 import base64
-from typing import Any
+import functools
+import importlib
+from typing import TYPE_CHECKING, Any, get_type_hints
 
 import dill
-from immutable import Immutable
+
+from ubo_app.rpc._class_registry import CLASS_REGISTRY
+
+if TYPE_CHECKING:
+    from immutable import Immutable
+
+
+@functools.cache
+def type_tag(class_: type) -> str:
+    """Return the name `class_` is stored under in serialized objects."""
+    if CLASS_REGISTRY.get(class_.__name__) == class_.__module__:
+        return class_.__name__
+    return f'{class_.__module__}:{class_.__qualname__}'
+
+
+def resolve_type_tag(tag: str) -> type:
+    """Return the class a type tag, or a legacy dill-pickled class, stands for.
+
+    Raises `ImportError` or `AttributeError` for a class that no longer exists.
+    """
+    if (module_name := CLASS_REGISTRY.get(tag)) is not None:
+        return getattr(importlib.import_module(module_name), tag)
+    if ':' in tag:
+        # Service modules are named `<service_uid>:<name>`; a qualname has no colon.
+        module_name, _, qualname = tag.rpartition(':')
+        class_: Any = importlib.import_module(module_name)
+        for name in qualname.split('.'):
+            class_ = getattr(class_, name)
+        return class_
+    return _unpickle_class(tag)
+
+
+@functools.cache
+def _unpickle_class(tag: str) -> type:
+    return dill.loads(base64.b64decode(tag.encode('utf-8')))  # noqa: S301
+
+
+@functools.cache
+def field_types(class_: type) -> dict[str, type]:
+    """Return the fields of `class_` annotated with a plain class, by name.
+
+    These are what a loader needs to restore values JSON does not keep the type
+    of, like enums stored as their bare value.
+    """
+    try:
+        hints = get_type_hints(class_)
+    except (NameError, TypeError):
+        return {}
+    return {name: hint for name, hint in hints.items() if isinstance(hint, type)}
 
 
 def add_type_field(
@@ -12,7 +76,25 @@ def add_type_field(
     serialized: dict[str, Any],
 ) -> dict[str, Any]:
     """Add the type field to the serialized object."""
-    return {
-        **serialized,
-        '_type': base64.b64encode(dill.dumps(obj.__class__)).decode('utf-8'),
-    }
+    return {**serialized, '_type': type_tag(obj.__class__)}
+
+
+def wrap_versioned(payload: dict[str, Any], *, version: int) -> dict[str, Any]:
+    """Put serialized objects in an envelope recording the encoding's version."""
+    return {'version': version, 'payload': payload}
+
+
+def unwrap_versioned(data: object, *, version: int) -> dict[str, Any]:
+    """Return the payload of an envelope, if it has the expected version.
+
+    Raises `ValueError` for anything else, so a file written by another version
+    of the encoding is never half-read.
+    """
+    if (
+        not isinstance(data, dict)
+        or data.get('version') != version
+        or not isinstance(data.get('payload'), dict)
+    ):
+        msg = f'Not a version {version} envelope'
+        raise ValueError(msg)
+    return data['payload']
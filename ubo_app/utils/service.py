@@ -22,12 +22,18 @@ def get_service() -> UboServiceThread:
     """Get the current service instance."""
     if 'ubo_app.service_thread' in sys.modules:
         from ubo_app.service_thread import SERVICES_BY_PATH, UboServiceThread
+        from ubo_app.utils.loop_pool import SharedLoop, current_service
 
         thread = threading.current_thread()
 
         if isinstance(thread, UboServiceThread):
             return thread
 
+        # Only trusted on a shared loop: elsewhere the variable may have come
+        # along with a callback a service scheduled on another thread.
+        if isinstance(thread, SharedLoop) and (service := current_service.get()):
+            return service
+
         if isinstance(thread, UboThread) and thread.ubo_service:
             return thread.ubo_service
 
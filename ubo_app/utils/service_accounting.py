@@ -0,0 +1,264 @@
+"""Attribute the core process's CPU time and memory to the services in it.
+
+Every service runs on its own thread in one process, so the kernel already
+keeps CPU time per service: it only has to be read per thread, from
+``/proc/self/task/<tid>/stat`` (psutil's thread list where there is no
+``/proc``), and summed by owner. A thread belongs to a service if it is the
+service's `UboServiceThread`, a `UboThread` the service started, or a worker of
+its event loop's default executor (``asyncio.to_thread``); anything else is the
+``core``'s. A shared service loop (see `ubo_app.utils.loop_pool`) and its
+workers are reported under the loop's name.
+
+Memory is attributed with `tracemalloc`, which is too costly to leave on, so it
+only runs with ``UBO_DEBUG_SERVICE_MEMORY``. Each live allocation is charged to
+the service whose code is nearest to it on the allocating stack: a frame
+belongs to a service if its file is under the service's directory, or is the
+file of a module loaded in the service's ``service_uid:`` namespace.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import psutil
+
+from ubo_app.constants import DEBUG_SERVICE_MEMORY
+from ubo_app.store.services.system import ServiceUsage
+from ubo_app.utils.thread import UboThread
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+CORE = 'core'
+# Deep enough to get from an allocation inside a library back to the service
+# that called it.
+TRACE_FRAMES = 32
+
+_PROC_TASKS = Path('/proc/self/task')
+_CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+
+def start_memory_tracing() -> None:
+    """Start tracing allocations if memory accounting is on."""
+    if DEBUG_SERVICE_MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start(TRACE_FRAMES)
+
+
+def read_thread_times() -> dict[int, float]:
+    """Return the user plus system CPU seconds of each thread of this process."""
+    if not _PROC_TASKS.is_dir():
+        return {
+            thread.id: thread.user_time + thread.system_time
+            for thread in psutil.Process().threads()
+        }
+    times: dict[int, float] = {}
+    for task in _PROC_TASKS.iterdir():
+        try:
+            stat = (task / 'stat').read_text()
+        except OSError:
+            # The thread ended since the directory was listed.
+            continue
+        # The command name can hold spaces and parentheses; the fields after
+        # it start at the state, field 3, so utime (14) and stime (15) are the
+        # 12th and 13th.
+        fields = stat.rpartition(')')[2].split()
+        times[int(task.name)] = (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS
+    return times
+
+
+def _executor_threads(loop: object) -> list[int]:
+    """Return the native ids of the workers of `loop`'s default executor."""
+    executor = getattr(loop, '_default_executor', None)
+    return [
+        thread.native_id
+        for thread in list(getattr(executor, '_threads', ()))
+        if thread.native_id is not None
+    ]
+
+
+def thread_owners() -> dict[int, str]:
+    """Map the native id of every service-owned thread to its service id."""
+    from ubo_app.service_thread import SERVICES_BY_PATH, UboServiceThread
+    from ubo_app.utils.loop_pool import SharedLoop
+
+    owners: dict[int, str] = {}
+    for service in list(SERVICES_BY_PATH.values()):
+        if service.shared_loop is not None:
+            continue
+        for worker in _executor_threads(getattr(service, 'loop', None)):
+            owners[worker] = service.service_id
+    for thread in threading.enumerate():
+        if thread.native_id is None:
+            continue
+        if isinstance(thread, SharedLoop):
+            # Its services take turns on it; it is accounted for as a whole.
+            owners[thread.native_id] = thread.name
+            for worker in _executor_threads(thread.loop):
+                owners[worker] = thread.name
+        elif isinstance(thread, UboServiceThread) and hasattr(thread, 'service_id'):
+            owners[thread.native_id] = thread.service_id
+        elif isinstance(thread, UboThread) and thread.ubo_service is not None:
+            owners[thread.native_id] = thread.ubo_service.service_id
+    return owners
+
+
+def service_code() -> dict[str, tuple[str, ...]]:
+    """Return, per service id, the path prefixes of the service's code."""
+    import sys
+
+    from ubo_app.service_thread import SERVICES_BY_PATH
+
+    code: dict[str, tuple[str, ...]] = {}
+    for service in list(SERVICES_BY_PATH.values()):
+        if not hasattr(service, 'service_id'):
+            continue
+        namespace = f'{service.service_uid}:'
+        code[service.service_id] = (
+            f'{service.path.as_posix()}/',
+            *(
+                module.__file__
+                for name, module in list(sys.modules.items())
+                if name.startswith(namespace)
+                and getattr(module, '__file__', None)
+                and not module.__file__.startswith(service.path.as_posix())
+            ),
+        )
+    return code
+
+
+def attribute_allocations(
+    snapshot: tracemalloc.Snapshot,
+    code: Mapping[str, tuple[str, ...]],
+) -> dict[str, tuple[int, int]]:
+    """Return the live (bytes, blocks) of `snapshot` charged to each owner."""
+    owners_by_file: dict[str, str] = {}
+
+    def owner_of(filename: str) -> str:
+        owner = owners_by_file.get(filename)
+        if owner is None:
+            owner = owners_by_file[filename] = next(
+                (
+                    service_id
+                    for service_id, prefixes in code.items()
+                    if filename.startswith(prefixes)
+                ),
+                CORE,
+            )
+        return owner
+
+    usage: dict[str, tuple[int, int]] = {}
+    # Grouping by traceback visits each distinct allocation site once.
+    for statistic in snapshot.statistics('traceback'):
+        owner = CORE
+        # Frames are stored oldest first; the nearest service frame wins.
+        for frame in reversed(statistic.traceback):
+            owner = owner_of(frame.filename)
+            if owner != CORE:
+                break
+        size, count = usage.get(owner, (0, 0))
+        usage[owner] = (size + statistic.size, count + statistic.count)
+    return usage
+
+
+class ServiceAccountant:
+    """Turn successive samples of the process into per-service usage."""
+
+    def __init__(
+        self,
+        *,
+        read_times: Callable[[], Mapping[int, float]] = read_thread_times,
+        owners: Callable[[], Mapping[int, str]] = thread_owners,
+        code: Callable[[], Mapping[str, tuple[str, ...]]] = service_code,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Sample through the given readers; the defaults read this process."""
+        self._read_times = read_times
+        self._owners = owners
+        self._code = code
+        self._clock = clock
+        self._sampled_at: float | None = None
+        # Last CPU time and owner of every thread seen alive, and how much of
+        # that time was charged to its earlier owners.
+        self._threads: dict[int, tuple[float, str, float]] = {}
+        # CPU time of the threads that have ended, by owner.
+        self._retired: dict[str, float] = {}
+
+    def sample(self) -> dict[str, ServiceUsage]:
+        """Return each owner's usage since the previous sample."""
+        now = self._clock()
+        times = self._read_times()
+        owners = self._owners()
+        elapsed = None if self._sampled_at is None else now - self._sampled_at
+        self._sampled_at = now
+
+        for tid in self._threads.keys() - times.keys():
+            cpu, owner, charged = self._threads.pop(tid)
+            self._retired[owner] = self._retired.get(owner, 0.0) + cpu - charged
+
+        cpu_seconds = dict(self._retired)
+        busy: dict[str, float] = {}
+        threads: dict[str, int] = {}
+        for tid, cpu in times.items():
+            owner = owners.get(tid, CORE)
+            # A thread born since the last sample spent all its time in it.
+            last_cpu, charged = 0.0, 0.0
+            if tid in self._threads:
+                last_cpu, last_owner, charged = self._threads[tid]
+                if cpu < last_cpu or owner != last_owner:
+                    # The previous owner keeps what the thread spent for it.
+                    spent = last_cpu - charged
+                    self._retired[last_owner] = (
+                        self._retired.get(last_owner, 0.0) + spent
+                    )
+                    cpu_seconds[last_owner] = cpu_seconds.get(last_owner, 0.0) + spent
+                    if cpu < last_cpu:
+                        # The id was reused by a new thread.
+                        last_cpu, charged = 0.0, 0.0
+                    else:
+                        # The thread changed hands, say a pool worker taken
+                        # over by another loop; the new owner gets the rest.
+                        charged = last_cpu
+            busy[owner] = busy.get(owner, 0.0) + cpu - last_cpu
+            cpu_seconds[owner] = cpu_seconds.get(owner, 0.0) + cpu - charged
+            threads[owner] = threads.get(owner, 0) + 1
+            self._threads[tid] = (cpu, owner, charged)
+
+        allocations = (
+            attribute_allocations(
+                tracemalloc.take_snapshot().filter_traces(
+                    [
+                        tracemalloc.Filter(
+                            inclusive=False,
+                            filename_pattern=tracemalloc.__file__,
+                        ),
+                    ],
+                ),
+                self._code(),
+            )
+            if tracemalloc.is_tracing()
+            else None
+        )
+
+        return {
+            owner: ServiceUsage(
+                cpu_percent=round(busy.get(owner, 0.0) / elapsed * 100, 1)
+                if elapsed
+                else 0.0,
+                cpu_seconds=round(cpu_seconds.get(owner, 0.0), 2),
+                threads=threads.get(owner, 0),
+                allocated_bytes=None
+                if allocations is None
+                else allocations.get(owner, (0, 0))[0],
+                allocated_blocks=None
+                if allocations is None
+                else allocations.get(owner, (0, 0))[1],
+            )
+            for owner in sorted(
+                {*cpu_seconds, *threads, *(allocations or ())},
+            )
+        }
@@ -0,0 +1,487 @@
+"""Time-faithful recording and replay of store sessions.
+
+A session log is a gzip stream: a header, then one record per action or event
+the store was handed, in dispatch order. Each record keeps the monotonic time
+since recording started, where it was dispatched from, the service it was
+dispatched from, and the action itself as the store serializes it; events keep
+only their type. An action or event comes from outside the store (a service,
+the keypad, the gRPC server), from within its run (a reducer's result, a
+synchronous listener) or from one of its reactions (an event handler, an
+autorun).
+
+High-rate streams, audio samples and sensor ticks, are left out unless asked
+for in `streams`, they would otherwise dwarf the rest of the log.
+
+`replay_session` dispatches the actions that came from outside the store again,
+at their recorded times, at a multiple of their pace or as fast as the store
+takes them, and reports how the store kept up: throughput, autorun runs and the
+latency from an action to the view update it leads to. Actions the store
+derived itself are left for the replayed ones to derive again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import queue
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from ubo_app.logger import logger
+from ubo_app.store.tracing import LatencyHistogram, now, reaction, store_tracer
+from ubo_app.utils.serializer import type_tag
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Iterator
+    from pathlib import Path
+
+    from ubo_app.store.main import UboStore
+
+MAGIC = b'UBOSESS\0'
+# Bump when the record layout changes; older logs are then refused.
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<8sHd')
+# Offset in ns, kind, origin, service id length, payload length.
+_RECORD = struct.Struct('<QBBHI')
+
+# Action types of the high-rate streams, by the name `streams` takes.
+STREAMS = {
+    'audio': frozenset({'AudioReportSampleAction'}),
+    'sensors': frozenset({'SensorsReportReadingAction'}),
+}
+# Actions the core dispatches in reaction to state changes; replaying them would
+# duplicate what the replayed actions make it dispatch again.
+DERIVED_ACTIONS = frozenset({'UpdateCurrentViewAction', 'StackSetPageIndexAction'})
+# Actions that set the store up or take it down; whoever replays a session sets
+# the store up the way the benchmark needs.
+LIFECYCLE_ACTIONS = frozenset(
+    {
+        'InitAction',
+        'FinishAction',
+        'CombineReducerRegisterAction',
+        'CombineReducerUnregisterAction',
+    },
+)
+VIEW_UPDATE_ACTION = 'UpdateCurrentViewAction'
+
+
+class EntryKind(IntEnum):
+    """What a record holds."""
+
+    ACTION = 0
+    EVENT = 1
+
+
+class Origin(IntEnum):
+    """Where a recorded action or event was dispatched from."""
+
+    # Outside the store's run: services, input, the RPC servers.
+    DISPATCH = 0
+    # From within the store's run: reducer results and synchronous listeners.
+    STORE = 1
+    # From an event handler or autorun, in reaction to what the store did.
+    REACTION = 2
+
+
+@dataclass(frozen=True)
+class SessionEntry:
+    """One record of a session log; `data` is the serialized action."""
+
+    offset: int
+    kind: EntryKind
+    origin: Origin
+    service: str | None
+    type: str
+    data: Any = None
+
+    @property
+    def type_name(self) -> str:
+        """Return the class name of the recorded action or event."""
+        return self.type.rpartition(':')[2].rpartition('.')[2]
+
+
+def _current_service_id() -> str | None:
+    # Only what the thread tells directly: `get_service` falls back to walking
+    # the stack, too slow to do for every dispatch of a session.
+    from ubo_app.utils.loop_pool import SharedLoop, current_service
+
+    thread = threading.current_thread()
+    if isinstance(thread, SharedLoop):
+        service = current_service.get()
+    else:
+        service = getattr(thread, 'ubo_service', None) or thread
+    return getattr(service, 'service_id', None)
+
+
+class SessionRecorder:
+    """Writes what is dispatched to a store into a session log while started."""
+
+    def __init__(self, store: UboStore) -> None:
+        """Record `store`."""
+        self.store = store
+        self.path: Path | None = None
+        self._excluded: frozenset[str] = frozenset()
+        self._include: Callable[[object], bool] | None = None
+        self._started_at = 0
+        self._queue: queue.SimpleQueue[tuple | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+
+    @property
+    def is_recording(self) -> bool:
+        """Return whether a session is being recorded."""
+        return self._writer is not None
+
+    def start(
+        self,
+        path: Path,
+        *,
+        streams: Iterable[str] = (),
+        include: Callable[[object], bool] | None = None,
+    ) -> None:
+        """Start recording into `path`, with the high-rate `streams` named.
+
+        Only actions and events `include` accepts are recorded, if given.
+        """
+        if self._writer is not None:
+            return
+        unknown = set(streams) - STREAMS.keys()
+        if unknown:
+            msg = f'Unknown session recording streams: {", ".join(sorted(unknown))}'
+            raise ValueError(msg)
+        self.path = path
+        self._excluded = frozenset().union(
+            *(types for name, types in STREAMS.items() if name not in streams),
+        )
+        self._include = include
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file = gzip.GzipFile(path, 'wb', compresslevel=6, mtime=0)
+        file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, time.time()))
+        self._started_at = time.monotonic_ns()
+        self._writer = threading.Thread(
+            target=self._write,
+            args=(file,),
+            name='Session Recorder',
+            daemon=True,
+        )
+        self._writer.start()
+        self.store.register_action_middleware(self._action_middleware)
+        self.store.register_event_middleware(self._event_middleware)
+        logger.info('Recording the session', extra={'path': path})
+
+    def stop(self) -> None:
+        """Stop recording and wait for the log to be written out."""
+        if self._writer is None:
+            return
+        self.store.unregister_action_middleware(self._action_middleware)
+        self.store.unregister_event_middleware(self._event_middleware)
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+        logger.info('Stopped recording the session', extra={'path': self.path})
+
+    def _record(self, kind: EntryKind, value: object) -> None:
+        if type(value).__name__ in self._excluded or (
+            self._include is not None and not self._include(value)
+        ):
+            return
+        if getattr(self.store, 'running_thread', None) == threading.get_ident():
+            origin = Origin.STORE
+        elif reaction.get() is not None:
+            origin = Origin.REACTION
+        else:
+            origin = Origin.DISPATCH
+        self._queue.put(
+            (
+                time.monotonic_ns() - self._started_at,
+                kind,
+                origin,
+                _current_service_id(),
+                value,
+            ),
+        )
+
+    def _action_middleware(self, action: Any) -> Any:  # noqa: ANN401
+        self._record(EntryKind.ACTION, action)
+        return action
+
+    def _event_middleware(self, event: Any) -> Any:  # noqa: ANN401
+        self._record(EntryKind.EVENT, event)
+        return event
+
+    def _write(self, file: gzip.GzipFile) -> None:
+        # Actions are immutable, so serializing them here instead of in the
+        # dispatching thread sees them as they were dispatched.
+        with file:
+            while (item := self._queue.get()) is not None:
+                offset, kind, origin, service, value = item
+                try:
+                    if kind is EntryKind.ACTION:
+                        payload = json.dumps(
+                            self.store.serialize_value(value),
+                            separators=(',', ':'),
+                        ).encode()
+                    else:
+                        payload = type_tag(type(value)).encode()
+                except Exception:
+                    logger.exception(
+                        'Failed to serialize a recorded action',
+                        extra={'type': type(value).__name__},
+                    )
+                    continue
+                service_id = (service or '').encode()
+                file.write(
+                    _RECORD.pack(offset, kind, origin, len(service_id), len(payload)),
+                )
+                file.write(service_id)
+                file.write(payload)
+                if self._queue.empty():
+                    # Keep what is written readable if the process dies.
+                    file.flush()
+
+
+def read_session(path: Path) -> Iterator[SessionEntry]:
+    """Yield the records of a session log; a truncated last record is dropped."""
+    with gzip.open(path, 'rb') as file:
+        try:
+            header = file.read(_HEADER.size)
+        except (EOFError, gzip.BadGzipFile):
+            header = b''
+        if len(header) < _HEADER.size or header[: len(MAGIC)] != MAGIC:
+            msg = f'{path} is not a session log'
+            raise ValueError(msg)
+        _, version, _ = _HEADER.unpack(header)
+        if version != FORMAT_VERSION:
+            msg = f'{path} is a version {version} session log, not {FORMAT_VERSION}'
+            raise ValueError(msg)
+        try:
+            while len(record := file.read(_RECORD.size)) == _RECORD.size:
+                offset, kind, origin, service_length, length = _RECORD.unpack(record)
+                service = file.read(service_length).decode()
+                payload = file.read(length)
+                if len(payload) < length:
+                    return
+                kind = EntryKind(kind)
+                if kind is EntryKind.ACTION:
+                    data = json.loads(payload)
+                    tag = data.get('_type', '') if isinstance(data, dict) else ''
+                else:
+                    data = None
+                    tag = payload.decode()
+                yield SessionEntry(
+                    offset=offset,
+                    kind=kind,
+                    origin=Origin(origin),
+                    service=service or None,
+                    type=tag,
+                    data=data,
+                )
+        except EOFError:
+            # The recording process died before closing the log.
+            return
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    """How the store kept up with a replayed session; latencies in µs."""
+
+    speed: float | None
+    recorded_duration: float
+    elapsed: float
+    actions_replayed: int
+    actions_unloadable: int
+    actions_reduced: int
+    autorun_runs: int
+    view_updates: int
+    # How far behind their recorded times replayed actions were dispatched, at
+    # most, in seconds; a store that cannot keep pace shows here first.
+    max_lag: float
+    view_latency: dict[str, float] = field(default_factory=dict)
+    # How often the view and the status bar were computed, and how often an
+    # autorun reused them as their inputs had not changed.
+    view_computations: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Return the actions the store reduced per second of the replay."""
+        return self.actions_reduced / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report, throughput included, ready for JSON."""
+        return {**asdict(self), 'throughput': self.throughput}
+
+
+def _traced_counts(prefix: str) -> int:
+    return sum(
+        int(summary['count'])
+        for metric, summary in store_tracer.histograms().items()
+        if metric.startswith(prefix)
+    )
+
+
+class _ReplayMonitor:
+    """Times replayed actions to the view updates they lead to."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.view_latency = LatencyHistogram()
+        self.view_updates = 0
+        self.last_dispatch_at = now()
+        self._pending_since: int | None = None
+
+    def replaying(self) -> None:
+        with self.lock:
+            if self._pending_since is None:
+                self._pending_since = now()
+
+    def middleware(self, action: Any) -> Any:  # noqa: ANN401
+        at = now()
+        with self.lock:
+            self.last_dispatch_at = at
+            if type(action).__name__ == VIEW_UPDATE_ACTION:
+                self.view_updates += 1
+                if self._pending_since is not None:
+                    self.view_latency.record(at - self._pending_since)
+                    self._pending_since = None
+        return action
+
+    async def drained(
+        self,
+        store: UboStore,
+        *,
+        settle: float,
+        drain_timeout: float,
+    ) -> int:
+        """Wait for `store` to settle; return when it went idle."""
+        started_at = now()
+        idle_since: int | None = None
+        while (at := now()) - started_at < drain_timeout * 1_000_000:
+            with self.lock:
+                last_dispatch_at = self.last_dispatch_at
+            if not _is_idle(store) or (
+                idle_since is not None and last_dispatch_at > idle_since
+            ):
+                idle_since = None
+            elif idle_since is None:
+                idle_since = at
+            elif at - idle_since >= settle * 1_000_000:
+                return idle_since
+            await asyncio.sleep(0.01)
+        return now()
+
+
+def _is_idle(store: UboStore) -> bool:
+    return (
+        not store._actions  # noqa: SLF001
+        and not store._events  # noqa: SLF001
+        and not store._is_running.locked()  # noqa: SLF001
+    )
+
+
+async def replay_session(  # noqa: PLR0913
+    store: UboStore,
+    path: Path,
+    *,
+    speed: float | None = 1.0,
+    origins: Iterable[Origin] = (Origin.DISPATCH,),
+    skip: Iterable[str] = DERIVED_ACTIONS | LIFECYCLE_ACTIONS,
+    settle: float = 0.5,
+    drain_timeout: float = 30,
+    sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+) -> ReplayReport:
+    """Dispatch the recorded actions of `path` to `store` again and report.
+
+    With `speed` 1 actions go out at their recorded times, with 2 at twice the
+    pace and with `None` as fast as they load. The run ends once the store saw
+    no dispatch for `settle` seconds with its queues empty, or `drain_timeout`
+    seconds after the last replayed action. Actions wait for their time by
+    awaiting `sleep` with the seconds left.
+
+    View latency runs from the first replayed action not yet followed by a
+    view update to the next one, so an action that leaves the view as it was
+    is timed along with the one after it.
+    """
+    from ubo_app.store.core.view_computation import get_view_computation_stats
+
+    origins = frozenset(origins)
+    skip = frozenset(skip)
+    monitor = _ReplayMonitor()
+    was_tracing = store_tracer.enabled
+    store_tracer.set_enabled(True)
+    reduced_before = _traced_counts('reduce:')
+    autoruns_before = _traced_counts('autorun:')
+    computations_before = get_view_computation_stats()
+    store.register_action_middleware(monitor.middleware)
+
+    replayed = 0
+    unloadable = 0
+    recorded_duration = 0
+    max_lag = 0
+    started_at = now()
+    try:
+        for entry in read_session(path):
+            recorded_duration = entry.offset
+            if (
+                entry.kind is not EntryKind.ACTION
+                or entry.origin not in origins
+                or entry.type_name in skip
+            ):
+                continue
+            if speed is None:
+                await sleep(0)
+            else:
+                due = started_at + entry.offset / 1000 / speed
+                if (delay := due - now()) > 0:
+                    await sleep(delay / 1_000_000)
+                max_lag = max(max_lag, now() - due)
+            try:
+                action = store.load_object(entry.data)
+            except (AttributeError, ImportError, TypeError, ValueError):
+                # Recorded with fields that do not survive serialization, like
+                # the callables of a menu.
+                logger.debug(
+                    'Skipping an action that does not load',
+                    extra={'type': entry.type},
+                    exc_info=True,
+                )
+                unloadable += 1
+                continue
+            monitor.replaying()
+            store.dispatch(action)
+            replayed += 1
+
+        idle_since = await monitor.drained(
+            store,
+            settle=settle,
+            drain_timeout=drain_timeout,
+        )
+    finally:
+        store.unregister_action_middleware(monitor.middleware)
+        reduced = _traced_counts('reduce:') - reduced_before
+        autoruns = _traced_counts('autorun:') - autoruns_before
+        computations = {
+            stage: {
+                count: value - computations_before[stage][count]
+                for count, value in counts.items()
+            }
+            for stage, counts in get_view_computation_stats().items()
+        }
+        store_tracer.set_enabled(was_tracing)
+
+    return ReplayReport(
+        speed=speed,
+        recorded_duration=recorded_duration / 1_000_000_000,
+        elapsed=(idle_since - started_at) / 1_000_000,
+        actions_replayed=replayed,
+        actions_unloadable=unloadable,
+        actions_reduced=reduced,
+        autorun_runs=autoruns,
+        view_updates=monitor.view_updates,
+        max_lag=max_lag / 1_000_000,
+        view_latency=monitor.view_latency.summary(),
+        view_computations=computations,
+    )
@@ -0,0 +1,178 @@
+"""Decide when each boot service may start.
+
+Services declare what they need with ``register(depends_on=..., is_lazy=...)``
+in their ``ubo_handle.py``. At boot:
+
+- services with no dependencies and not lazy — the first wave — start right
+  away, together, behind the reducer barrier as before;
+- a service with dependencies starts as soon as all of them are ready (their
+  setup returned, or failed: a broken dependency does not hold the rest back);
+- a lazy service additionally waits for the first frame, and so does anything
+  depending on one.
+
+Only the first wave registers its reducers before the first view is computed;
+the state has no slice for the other services until their setup registers it.
+
+Dependencies on services that are not part of this boot (disabled, filtered
+out, or unknown) are ignored, and so are dependency cycles, which are logged.
+
+The scheduler only decides; the caller asks it with `request` whether a service
+may start now, and it calls ``start`` later for every request it held back.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ubo_app.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+@dataclass(frozen=True)
+class StartupSpec:
+    """What a service declared about its startup."""
+
+    service_id: str
+    depends_on: tuple[str, ...] = ()
+    is_lazy: bool = False
+
+
+class StartupScheduler:
+    """Gate boot services on their dependencies and the first frame."""
+
+    def __init__(
+        self,
+        specs: Sequence[StartupSpec],
+        start: Callable[[str], object],
+    ) -> None:
+        """Schedule `specs`; `start` is called to start a held-back service."""
+        self._start = start
+        self._lock = threading.Lock()
+        self._order = [spec.service_id for spec in specs]
+        self._lazy = {spec.service_id for spec in specs if spec.is_lazy}
+        self._depends_on = {
+            spec.service_id: tuple(
+                dependency
+                for dependency in dict.fromkeys(spec.depends_on)
+                if dependency in self._order and dependency != spec.service_id
+            )
+            for spec in specs
+        }
+        self._break_cycles()
+        self._ready: set[str] = set()
+        self._requested: set[str] = set()
+        self._started: set[str] = set()
+        self.is_first_frame_shown = False
+
+    def _break_cycles(self) -> None:
+        # Kahn's algorithm: whatever cannot be ordered is on, or behind, a cycle.
+        waiting = {
+            service_id: set(dependencies)
+            for service_id, dependencies in self._depends_on.items()
+        }
+        while ordered := [
+            service_id for service_id, pending in waiting.items() if not pending
+        ]:
+            for service_id in ordered:
+                del waiting[service_id]
+            for pending in waiting.values():
+                pending.difference_update(ordered)
+        # What nothing left over depends on is only behind a cycle: it keeps its
+        # dependencies and starts once the cycle's members are ready.
+        while behind := [
+            service_id
+            for service_id in waiting
+            if not any(service_id in pending for pending in waiting.values())
+        ]:
+            for service_id in behind:
+                del waiting[service_id]
+        if waiting:
+            logger.error(
+                'Startup dependency cycle, ignoring these dependencies',
+                extra={
+                    'dependencies': {
+                        service_id: self._depends_on[service_id]
+                        for service_id in waiting
+                    },
+                },
+            )
+            for service_id in waiting:
+                self._depends_on[service_id] = ()
+
+    @property
+    def first_wave(self) -> tuple[str, ...]:
+        """Return the services that start without waiting for anything."""
+        return tuple(
+            service_id
+            for service_id in self._order
+            if service_id not in self._lazy and not self._depends_on[service_id]
+        )
+
+    @property
+    def is_done(self) -> bool:
+        """Return whether every scheduled service is ready."""
+        with self._lock:
+            return self._ready.issuperset(self._order)
+
+    def request(self, service_id: str) -> bool:
+        """Return whether `service_id` may start now; if not, start it later."""
+        with self._lock:
+            if service_id not in self._depends_on or service_id in self._started:
+                return True
+            self._requested.add(service_id)
+            if not self._may_start(service_id):
+                logger.debug(
+                    'Holding back service',
+                    extra={
+                        'service_id': service_id,
+                        'waiting_for': self._waiting_for(service_id),
+                    },
+                )
+                return False
+            self._started.add(service_id)
+            return True
+
+    def service_ready(self, service_id: str) -> None:
+        """Note that `service_id` finished, or failed, its setup."""
+        with self._lock:
+            self._ready.add(service_id)
+        self._start_unblocked()
+
+    def first_frame(self) -> None:
+        """Note that the first frame is on screen; let lazy services start."""
+        with self._lock:
+            if self.is_first_frame_shown:
+                return
+            self.is_first_frame_shown = True
+        self._start_unblocked()
+
+    def _may_start(self, service_id: str) -> bool:
+        return not self._waiting_for(service_id)
+
+    def _waiting_for(self, service_id: str) -> list[str]:
+        waiting_for = [
+            dependency
+            for dependency in self._depends_on[service_id]
+            if dependency not in self._ready
+        ]
+        if service_id in self._lazy and not self.is_first_frame_shown:
+            waiting_for.append('first frame')
+        return waiting_for
+
+    def _start_unblocked(self) -> None:
+        with self._lock:
+            unblocked = [
+                service_id
+                for service_id in self._order
+                if service_id in self._requested
+                and service_id not in self._started
+                and self._may_start(service_id)
+            ]
+            self._started.update(unblocked)
+        for service_id in unblocked:
+            logger.debug('Starting held-back service', extra={'service_id': service_id})
+            self._start(service_id)
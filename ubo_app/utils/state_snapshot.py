@@ -0,0 +1,401 @@
+"""Warm restore of the state services are slow to rebuild.
+
+On boot every service starts its slice from its reducer's initial state, then
+probes hardware, D-Bus, docker and disk before the slice, and the screens drawn
+from it, are right again. With ``UBO_STATE_SNAPSHOT``, the slices in
+`SNAPSHOT_SLICES` are saved every ``UBO_STATE_SNAPSHOT_INTERVAL`` seconds, and on
+the next boot each one is put back as soon as its service registers its
+reducer, which is before the first view is computed.
+
+A restored slice is provisional: it is `stale` until the service's reducer
+returns a new state for it, which confirms or replaces it. One still stale
+``UBO_STATE_SNAPSHOT_STALE_TIMEOUT`` seconds after registration is dropped for
+the reducer's own initial state, so a value the service never reports again does
+not outlive the checks that would have corrected it. The stale slices are kept in
+``MainState.provisional_slices``, so clients can tell what they draw from them
+may still change.
+
+Staleness is per slice, not per field: the first new state the reducer returns
+settles the whole slice, the fields that action left alone included. A service
+probes its slice as a whole on start, so its first report stands for the rest.
+
+Whether restoring pays off is measured the same way with it on or off
+(``UBO_STATE_SNAPSHOT_RESTORE``): once every expected slice has settled, the
+time to the first correct screen is logged and marked in the boot profile. A
+slice is correct from the first view if its restored value is what the service
+then reported, otherwise from when the service reported it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import pickle
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from redux import CompleteReducerResult, is_complete_reducer_result
+
+from ubo_app.constants import (
+    STATE_SNAPSHOT,
+    STATE_SNAPSHOT_INTERVAL,
+    STATE_SNAPSHOT_PATH,
+    STATE_SNAPSHOT_RESTORE,
+    STATE_SNAPSHOT_STALE_TIMEOUT,
+)
+from ubo_app.logger import logger
+from ubo_app.store.tracing import now
+from ubo_app.utils.boot_profile import boot_profiler
+from ubo_app.utils.serializer import unwrap_versioned, wrap_versioned
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from immutable import Immutable
+    from redux import ReducerType
+
+# Bump when the encoding of the payload changes; older files are then ignored.
+SNAPSHOT_VERSION = 2
+# Slices that are plain data and that their services take long to rebuild.
+# Slices holding callables (menus, pages) or what only makes sense while the
+# process runs (audio streams, recognition sessions) do not belong here.
+SNAPSHOT_SLICES = frozenset(
+    {
+        'ip',
+        'lightdm',
+        'rpi_connect',
+        'ssh',
+        'tailscale',
+        'users',
+        'vscode',
+        'wifi',
+    },
+)
+
+
+@dataclass
+class _Slice:
+    """How one slice fared since its reducer was registered; times in µs."""
+
+    registered_at: int
+    restored: Immutable | None
+    fresh: Immutable
+    settled_at: int | None = None
+    correct_at: int | None = None
+    matched: bool = False
+
+
+def _state_of(result: object) -> Any:  # noqa: ANN401
+    return result.state if is_complete_reducer_result(result) else result
+
+
+def _serialize(value: Immutable) -> Any:  # noqa: ANN401
+    from ubo_app.store.main import store
+
+    return store.serialize_value(value)
+
+
+def _load(data: Any) -> Any:  # noqa: ANN401
+    from ubo_app.store.main import store
+
+    return store.load_object(data)
+
+
+def _read_state() -> object:
+    from ubo_app.store.main import store
+
+    return store._state  # noqa: SLF001
+
+
+class StateSnapshot:
+    """Saves `slices` of the state and restores them as provisional state."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        path: Path = STATE_SNAPSHOT_PATH,
+        slices: Iterable[str] = SNAPSHOT_SLICES,
+        enabled: bool = STATE_SNAPSHOT,
+        restore: bool = STATE_SNAPSHOT_RESTORE,
+        stale_timeout: float = STATE_SNAPSHOT_STALE_TIMEOUT,
+        serialize: Callable[[Immutable], Any] = _serialize,
+        load: Callable[[Any], Any] = _load,
+        read_state: Callable[[], object] = _read_state,
+        clock: Callable[[], int] = now,
+    ) -> None:
+        """Save and restore through the given functions; the defaults use the store."""
+        self.path = path
+        self.slices = frozenset(slices)
+        self.enabled = enabled
+        self.restore = restore
+        self.stale_timeout = stale_timeout
+        self._serialize = serialize
+        self._load = load
+        self._read_state = read_state
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._origin = clock()
+        # The encoded slices as last read or written, and the states they
+        # encode, to skip slices that did not change since.
+        self._encoded: dict[str, Any] = {}
+        self._saved: dict[str, object] = {}
+        self._restored: dict[str, Immutable] = {}
+        self._records: dict[str, _Slice] = {}
+        self._pending: set[str] | None = None
+        self._first_view_at: int | None = None
+        # Milliseconds from `load` to the first correct screen, once known.
+        self.first_correct_screen: float | None = None
+
+    @property
+    def stale(self) -> set[str]:
+        """Return the slices still holding restored, unconfirmed state."""
+        with self._lock:
+            return {
+                key
+                for key, record in self._records.items()
+                if record.restored is not None and record.settled_at is None
+            }
+
+    def load(self) -> None:
+        """Read the snapshot, keeping what is restored once reducers register."""
+        self._origin = self._clock()
+        if not self.enabled:
+            return
+        try:
+            payload = unwrap_versioned(
+                json.loads(self.path.read_text()),
+                version=SNAPSHOT_VERSION,
+            )
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.warning(
+                'Ignoring an unreadable state snapshot',
+                extra={'path': self.path},
+                exc_info=True,
+            )
+            return
+        self._encoded = {
+            key: value for key, value in payload.items() if key in self.slices
+        }
+        if not self.restore:
+            return
+        for key, data in self._encoded.items():
+            try:
+                # Loading consumes the type tags; the encoded copy is kept for
+                # saving the slice again while it is stale.
+                self._restored[key] = self._load(copy.deepcopy(data))
+            except (
+                AttributeError,
+                ImportError,
+                TypeError,
+                ValueError,
+                pickle.UnpicklingError,
+            ):
+                logger.warning(
+                    'Dropping a slice the state snapshot can no longer load',
+                    extra={'slice': key},
+                    exc_info=True,
+                )
+
+    def expect(self, keys: Iterable[str]) -> None:
+        """Set the slices the first correct screen waits for."""
+        with self._lock:
+            self._pending = (
+                {key for key in keys if key in self.slices} if self.enabled else None
+            )
+
+    def view_released(self) -> None:
+        """Note that the first view was computed; later calls are ignored."""
+        with self._lock:
+            if self._first_view_at is None:
+                self._first_view_at = self._clock()
+        self._report_if_settled()
+
+    def wrap(self, key: str, reducer: ReducerType) -> ReducerType:
+        """Return `reducer`, restoring and tracking slice `key` if it is saved."""
+        if not self.enabled or key not in self.slices:
+            return reducer
+        restored = self._restored.pop(key, None)
+        record: _Slice | None = None
+
+        def snapshot_reducer(state: Immutable | None, action: object) -> object:
+            nonlocal record
+            result = reducer(state, action)
+            if state is None:
+                record = self._register(key, restored, _state_of(result))
+                if record.restored is None:
+                    return result
+                return self._reporting_stale(result, record.restored)
+            if record is None or record.settled_at is not None:
+                return result
+            new_state = _state_of(result)
+            if new_state is not state:
+                self._settle(key, record, new_state)
+            elif self._clock() >= record.registered_at + int(
+                self.stale_timeout * 1_000_000,
+            ):
+                if record.restored is not None and state is record.restored:
+                    result = reducer(record.fresh, action)
+                self._settle(key, record, _state_of(result), expired=True)
+            else:
+                return result
+            if record.restored is None:
+                return result
+            return self._reporting_stale(result, _state_of(result))
+
+        snapshot_reducer.__name__ = getattr(reducer, '__name__', 'reducer')
+        snapshot_reducer.__module__ = getattr(reducer, '__module__', __name__)
+        return snapshot_reducer
+
+    def _reporting_stale(
+        self,
+        result: object,
+        state: Immutable,
+    ) -> CompleteReducerResult:
+        """Return `result` with `state`, reporting the slices now stale."""
+        from ubo_app.store.core.types import ReportProvisionalSlicesAction
+
+        actions: list[Any] = []
+        events = None
+        if is_complete_reducer_result(result):
+            actions = [*(result.actions or [])]
+            events = result.events
+        actions.append(ReportProvisionalSlicesAction(slices=tuple(sorted(self.stale))))
+        return CompleteReducerResult(state=state, actions=actions, events=events)
+
+    def _register(
+        self,
+        key: str,
+        restored: Immutable | None,
+        fresh: Immutable,
+    ) -> _Slice:
+        if restored is not None and type(restored) is not type(fresh):
+            logger.warning(
+                'Dropping a restored slice of the wrong type',
+                extra={
+                    'slice': key,
+                    'restored': type(restored).__name__,
+                    'expected': type(fresh).__name__,
+                },
+            )
+            restored = None
+        record = _Slice(
+            registered_at=self._clock(),
+            restored=restored,
+            fresh=fresh,
+        )
+        with self._lock:
+            self._records[key] = record
+        if restored is not None:
+            logger.info('Restored a provisional slice', extra={'slice': key})
+        return record
+
+    def _settle(
+        self,
+        key: str,
+        record: _Slice,
+        value: Immutable,
+        *,
+        expired: bool = False,
+    ) -> None:
+        record.settled_at = self._clock()
+        record.matched = record.restored is not None and value == record.restored
+        if record.matched or (expired and record.restored is None):
+            # What was on screen from the start was right all along.
+            record.correct_at = record.registered_at
+        else:
+            record.correct_at = record.settled_at
+        if record.restored is not None:
+            logger.debug(
+                'Provisional slice settled',
+                extra={'slice': key, 'matched': record.matched, 'expired': expired},
+            )
+        with self._lock:
+            if self._pending is not None:
+                self._pending.discard(key)
+        self._report_if_settled()
+
+    def _report_if_settled(self) -> None:
+        with self._lock:
+            if (
+                self._pending is None
+                or self._pending
+                or self._first_view_at is None
+                or self.first_correct_screen is not None
+            ):
+                return
+            records = dict(self._records)
+            first_correct_at = max(
+                [
+                    self._first_view_at,
+                    *(
+                        record.correct_at
+                        for record in records.values()
+                        if record.correct_at is not None
+                    ),
+                ],
+            )
+            self.first_correct_screen = (first_correct_at - self._origin) / 1000
+        boot_profiler.mark('first correct screen', at=first_correct_at)
+        logger.info(
+            'First correct screen',
+            extra={
+                'restore': self.restore,
+                'first_correct_screen_ms': round(self.first_correct_screen, 1),
+                'first_view_ms': round((self._first_view_at - self._origin) / 1000, 1),
+                'slices': {
+                    key: {
+                        'restored': record.restored is not None,
+                        'matched': record.matched,
+                        'settled_ms': None
+                        if record.settled_at is None
+                        else round((record.settled_at - self._origin) / 1000, 1),
+                    }
+                    for key, record in sorted(records.items())
+                },
+            },
+        )
+
+    def save(self) -> None:
+        """Write the snapshot if a saved slice changed; stale ones keep their data."""
+        if not self.enabled:
+            return
+        state = self._read_state()
+        stale = self.stale
+        changed = False
+        for key in sorted(self.slices - stale):
+            value = getattr(state, key, None)
+            if value is None or self._saved.get(key) is value:
+                continue
+            encoded = self._serialize(value)
+            self._saved[key] = value
+            if self._encoded.get(key) != encoded:
+                self._encoded[key] = encoded
+                changed = True
+        if not changed:
+            return
+        temporary = self.path.with_suffix('.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(
+                json.dumps(wrap_versioned(self._encoded, version=SNAPSHOT_VERSION)),
+            )
+            temporary.replace(self.path)
+        except OSError:
+            logger.exception(
+                'Failed to write the state snapshot',
+                extra={'path': self.path},
+            )
+
+    async def run(self) -> None:
+        """Save the snapshot every ``UBO_STATE_SNAPSHOT_INTERVAL`` seconds."""
+        while True:
+            await asyncio.sleep(STATE_SNAPSHOT_INTERVAL)
+            await asyncio.to_thread(self.save)
+
+
+state_snapshot = StateSnapshot()
@@ -5,7 +5,9 @@ import asyncio
 import json
 from typing import TYPE_CHECKING, Any, cast
 
+from ubo_app.logger import logger
 from ubo_app.store.core.types import ReportReplayingDoneAction
+from ubo_app.utils.session_recording import replay_session
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -14,11 +16,17 @@ if TYPE_CHECKING:
 
 
 async def replay_actions(store: UboStore, path: Path) -> None:
-    with path.open('r') as file:
-        data = json.load(file)
+    # A session log keeps when each action was dispatched, so it is replayed
+    # at its recorded pace; a JSON list of actions at a fixed one.
+    if path.suffix == '.ubosession':
+        report = await replay_session(store, path)
+        logger.info('Replayed a recorded session', extra=report.as_dict())
+    else:
+        with path.open('r') as file:
+            data = json.load(file)
 
-    for item in data:
-        store.dispatch(cast('Any', store.load_object(item)))
-        await asyncio.sleep(0.5)
-    await asyncio.sleep(1.5)
+        for item in data:
+            store.dispatch(cast('Any', store.load_object(item)))
+            await asyncio.sleep(0.5)
+        await asyncio.sleep(1.5)
     store.dispatch(ReportReplayingDoneAction())
@@ -28,8 +28,25 @@
 #define UBO_TCP_LITE_MSG_SUBSCRIBE_STORE_RESPONSE 0x04u
 #define UBO_TCP_LITE_MSG_SUBSCRIBE_EVENT_REQUEST 0x05u
 #define UBO_TCP_LITE_MSG_SUBSCRIBE_EVENT_RESPONSE 0x06u
-#define UBO_TCP_LITE_MSG_ERROR 0x7Eu /* reserved */
-#define UBO_TCP_LITE_MSG_PING 0x7Fu  /* reserved, future keepalive */
+#define UBO_TCP_LITE_MSG_ERROR 0x7Eu
+#define UBO_TCP_LITE_MSG_PING 0x7Fu
+
+/* Session mode: a connection whose first frame is SESSION_OPEN stays open and
+ * its frames carry a stream id, [type][flags][varint stream][varint len]
+ * [payload]. This client does not speak it yet; the server's docstring in
+ * ubo_app/rpc/mcu_server.py describes it. */
+#define UBO_TCP_LITE_MSG_SESSION_OPEN 0x10u
+#define UBO_TCP_LITE_MSG_SESSION_ACCEPT 0x11u
+#define UBO_TCP_LITE_MSG_DISPATCH_BATCH_REQUEST 0x12u
+#define UBO_TCP_LITE_MSG_DISPATCH_BATCH_RESPONSE 0x13u
+#define UBO_TCP_LITE_MSG_CREDIT 0x14u
+#define UBO_TCP_LITE_MSG_STREAM_CLOSE 0x15u
+#define UBO_TCP_LITE_MSG_PONG 0x7Du
+
+#define UBO_TCP_LITE_SESSION_VERSION 1u
+#define UBO_TCP_LITE_SESSION_ZLIB 0x01u    /* SESSION_OPEN/_ACCEPT flag */
+#define UBO_TCP_LITE_SESSION_RESUMED 0x02u /* SESSION_ACCEPT flag */
+#define UBO_TCP_LITE_FRAME_COMPRESSED 0x01u /* session frame flag */
 
 /* Upper bound on a single frame's wire-declared payload length. Same cap and
  * rationale as UBO_GRPC_WEB_MAX_FRAME: the largest legitimate payload is a